@@ -1,11813 +0,0 @@
-from __future__ import annotations
-
-__all__ = ("US_CITY_DUMP",)
-
-# noinspection SpellCheckingInspection
-US_CITY_DUMP = {
-    "bay_minette": (30.88296, -87.77305),
-    "edna": (28.97859, -96.64609),
-    "bayou_la_batre": (30.40352, -88.24852),
-    "henderson": (32.15322, -94.79938),
-    "natalia": (29.18968, -98.86253),
-    "bear_creek": (34.27482, -87.70058),
-    "fort_hunt": (38.73289, -77.05803),
-    "yorktown": (37.23876, -76.50967),
-    "brighton": (33.43428, -86.94721),
-    "ocean_view": (38.54511, -75.08907),
-    "berry": (33.65983, -87.60001),
-    "trinity": (28.18085, -82.68177),
-    "villas": (26.55035, -81.8687),
-    "bessemer": (33.40178, -86.95444),
-    "aurora": (39.057, -84.90134),
-    "new_pekin": (38.50506, -86.01692),
-    "stockton": (39.43807, -99.2651),
-    "paducah": (37.08339, -88.60005),
-    "monticello": (32.59653, -91.394),
-    "red_chute": (32.55598, -93.61323),
-    "jessup": (39.14927, -76.77525),
-    "birmingham": (33.52066, -86.80249),
-    "delhi_hills": (39.09284, -84.61272),
-    "turpin_hills": (39.11006, -84.37994),
-    "lugoff": (34.22737, -80.68925),
-    "blountsville": (34.08149, -86.5911),
-    "blue_ridge": (32.49264, -86.19052),
-    "buda": (30.08521, -97.84028),
-    "boaz": (34.20065, -86.16637),
-    "brent": (32.93735, -87.16472),
-    "brewton": (31.10518, -87.07219),
-    "bridgeport": (34.94758, -85.71442),
-    "brook_highland": (33.43566, -86.67388),
-    "brookside": (33.63788, -86.91666),
-    "brookwood": (33.25567, -87.32083),
-    "brundidge": (31.72016, -85.81606),
-    "butler": (32.08959, -88.22197),
-    "bynum": (33.61316, -85.96108),
-    "cahaba_heights": (33.464, -86.73193),
-    "calera": (33.1029, -86.7536),
-    "camden": (31.99098, -87.29055),
-    "carbon_hill": (33.89177, -87.52612),
-    "carrollton": (33.26169, -88.09503),
-    "cedar_bluff": (34.22009, -85.60774),
-    "center_point": (33.64566, -86.6836),
-    "centre": (34.15204, -85.67885),
-    "centreville": (32.9462, -87.11669),
-    "chalkville": (33.65316, -86.64777),
-    "chatom": (31.46517, -88.25446),
-    "chelsea": (33.34011, -86.63026),
-    "cherokee": (34.75703, -87.97281),
-    "chickasaw": (30.7638, -88.07472),
-    "childersburg": (33.27817, -86.35498),
-    "choccolocco": (33.65927, -85.70357),
-    "citronelle": (31.09073, -88.22806),
-    "clanton": (32.83874, -86.62943),
-    "clay": (33.7026, -86.59971),
-    "clayton": (31.87822, -85.44966),
-    "cleveland": (33.99093, -86.57749),
-    "clio": (31.70878, -85.6105),
-    "coaling": (33.15901, -87.34083),
-    "collinsville": (34.26398, -85.86053),
-    "columbiana": (33.17817, -86.60721),
-    "concord": (33.46761, -87.03111),
-    "coosada": (32.49791, -86.33136),
-    "cordova": (33.75983, -87.18333),
-    "cottonwood": (31.04879, -85.30493),
-    "cowarts": (31.20018, -85.30465),
-    "creola": (30.89185, -88.03972),
-    "crossville": (34.28759, -85.99414),
-    "cullman": (34.17482, -86.84361),
-    "dadeville": (32.83124, -85.76357),
-    "daleville": (31.31017, -85.71299),
-    "danville": (34.41454, -87.08751),
-    "daphne": (30.60353, -87.9036),
-    "dauphin_island": (30.25548, -88.10972),
-    "deatsville": (32.60819, -86.39581),
-    "decatur": (34.60593, -86.98334),
-    "demopolis": (32.51764, -87.8364),
-    "dora": (33.72872, -87.09028),
-    "dothan": (31.22323, -85.39049),
-    "double_springs": (34.14637, -87.40247),
-    "east_brewton": (31.09323, -87.06275),
-    "east_florence": (34.80953, -87.64947),
-    "eclectic": (32.63541, -86.03441),
-    "elberta": (30.41436, -87.59776),
-    "enterprise": (31.31517, -85.85522),
-    "eufaula": (31.89127, -85.14549),
-    "eutaw": (32.84059, -87.88762),
-    "evergreen": (31.4335, -86.95692),
-    "fairfield": (33.48594, -86.91194),
-    "fairhope": (30.52297, -87.90333),
-    "falkville": (34.36843, -86.90862),
-    "fayette": (33.68455, -87.83085),
-    "fayetteville": (33.14567, -86.40581),
-    "flint_city": (34.52315, -86.97029),
-    "florala": (31.00518, -86.328),
-    "florence": (34.79981, -87.67725),
-    "flomaton": (31.00018, -87.26081),
-    "foley": (30.40659, -87.6836),
-    "forestdale": (33.57011, -86.89638),
-    "fort_deposit": (31.98459, -86.57859),
-    "fort_payne": (34.44425, -85.71969),
-    "frisco_city": (31.4335, -87.40138),
-    "fultondale": (33.60483, -86.79388),
-    "fyffe": (34.44676, -85.90414),
-    "gadsden": (34.01434, -86.00639),
-    "gardendale": (33.6601, -86.81277),
-    "geneva": (31.03296, -85.86382),
-    "georgiana": (31.6371, -86.74192),
-    "glencoe": (33.95704, -85.93247),
-    "good_hope": (34.11593, -86.86361),
-    "goodwater": (33.06567, -86.0533),
-    "gordo": (33.32012, -87.9028),
-    "grand_bay": (30.47631, -88.34223),
-    "grayson_valley": (33.64816, -86.63943),
-    "graysville": (33.62066, -86.97138),
-    "greensboro": (32.70415, -87.5955),
-    "greenville": (31.8296, -86.61775),
-    "grove_hill": (31.70877, -87.77722),
-    "guin": (33.96566, -87.91475),
-    "gulf_shores": (30.24604, -87.70082),
-    "guntersville": (34.35823, -86.29446),
-    "hackleburg": (34.27732, -87.82864),
-    "haleyville": (34.22649, -87.62141),
-    "hamilton": (34.14232, -87.98864),
-    "hanceville": (34.06065, -86.7675),
-    "harpersville": (33.344, -86.43804),
-    "hartford": (31.1024, -85.69688),
-    "hartselle": (34.44343, -86.93528),
-    "harvest": (34.85564, -86.75083),
-    "hayden": (33.8926, -86.75777),
-    "hayneville": (32.18403, -86.58025),
-    "hazel_green": (34.93231, -86.57194),
-    "headland": (31.35128, -85.34216),
-    "heflin": (33.64899, -85.58746),
-    "helena": (33.29622, -86.8436),
-    "henagar": (34.63508, -85.76719),
-    "hokes_bluff": (33.99815, -85.86636),
-    "holt": (33.23401, -87.48445),
-    "holtville": (32.63624, -86.32664),
-    "homewood": (33.47177, -86.80082),
-    "hoover": (33.40539, -86.81138),
-    "hueytown": (33.45122, -86.99666),
-    "huguley": (32.83457, -85.22966),
-    "huntsville": (34.7304, -86.58594),
-    "indian_springs_village": (33.35539, -86.75443),
-    "inverness": (32.01488, -85.74606),
-    "irondale": (33.53816, -86.70721),
-    "jackson": (31.50905, -87.89444),
-    "jacksonville": (33.81382, -85.7613),
-    "jasper": (33.83122, -87.27751),
-    "jemison": (32.95985, -86.74665),
-    "kimberly": (33.77344, -86.81388),
-    "kinsey": (31.29906, -85.34438),
-    "ladonia": (32.4682, -85.0791),
-    "lafayette": (32.89985, -85.40106),
-    "lake_purdy": (33.43011, -86.68054),
-    "lake_view": (33.28067, -87.1375),
-    "lanett": (32.86874, -85.1905),
-    "leeds": (33.54816, -86.54443),
-    "leesburg": (34.17982, -85.76136),
-    "level_plains": (31.29962, -85.77799),
-    "linden": (32.30625, -87.79807),
-    "lincoln": (33.61316, -86.11831),
-    "lineville": (33.31067, -85.75441),
-    "lipscomb": (33.42566, -86.92666),
-    "livingston": (32.5843, -88.18725),
-    "locust_fork": (33.9076, -86.61527),
-    "loxley": (30.61825, -87.75305),
-    "luverne": (31.71655, -86.26385),
-    "madison": (34.69926, -86.74833),
-    "malvern": (31.13934, -85.5191),
-    "marbury": (32.70124, -86.47109),
-    "margaret": (33.68621, -86.47498),
-    "marion": (32.63235, -87.31917),
-    "meadowbrook": (33.40205, -86.69665),
-    "meridianville": (34.85148, -86.57222),
-    "midfield": (33.4615, -86.90888),
-    "midland_city": (31.31906, -85.49382),
-    "mignon": (33.18345, -86.26109),
-    "millbrook": (32.47986, -86.36192),
-    "minor": (33.53733, -86.94055),
-    "mobile": (30.69436, -88.04305),
-    "monroeville": (31.52794, -87.32471),
-    "montevallo": (33.10067, -86.86416),
-    "montgomery": (32.36681, -86.29997),
-    "moody": (33.59094, -86.49082),
-    "moores_mill": (34.84398, -86.51832),
-    "morris": (33.74816, -86.8086),
-    "moulton": (34.48121, -87.29335),
-    "moundville": (32.99762, -87.63001),
-    "mount_olive": (33.67094, -86.8561),
-    "mount_vernon": (31.08518, -88.01333),
-    "mountain_brook": (33.50094, -86.75221),
-    "munford": (33.52983, -85.9508),
-    "muscle_shoals": (34.74481, -87.66753),
-    "new_brockton": (31.38572, -85.92939),
-    "new_hope": (34.53712, -86.39426),
-    "new_market": (34.91003, -86.42779),
-    "newton": (31.33517, -85.60521),
-    "north_bibb": (33.20401, -87.15305),
-    "northport": (33.22901, -87.57723),
-    "odenville": (33.67732, -86.39665),
-    "ohatchee": (33.78343, -86.00247),
-    "opelika": (32.64541, -85.37828),
-    "oneonta": (33.94815, -86.47276),
-    "opp": (31.28267, -86.25551),
-    "orange_beach": (30.29437, -87.57359),
-    "owens_cross_roads": (34.58815, -86.45888),
-    "oxford": (33.61427, -85.83496),
-    "ozark": (31.45906, -85.64049),
-    "pelham": (33.28567, -86.80999),
-    "pell_city": (33.58621, -86.28609),
-    "phenix_city": (32.47098, -85.00077),
-    "phil_campbell": (34.35093, -87.70642),
-    "piedmont": (33.92455, -85.61135),
-    "pike_road": (32.28431, -86.10302),
-    "pine_level": (32.58374, -86.46553),
-    "pinson": (33.68899, -86.68332),
-    "pleasant_grove": (33.49094, -86.97027),
-    "point_clear": (30.47408, -87.91916),
-    "prattville": (32.46402, -86.4597),
-    "priceville": (34.52509, -86.89473),
-    "prichard": (30.7388, -88.07889),
-    "ragland": (33.74454, -86.15581),
-    "rainbow_city": (33.95482, -86.04192),
-    "rainsville": (34.49425, -85.84775),
-    "red_bay": (34.43982, -88.14087),
-    "reform": (33.37845, -88.0153),
-    "rehobeth": (31.12296, -85.45271),
-    "riverside": (33.60621, -86.20442),
-    "roanoke": (33.15123, -85.37217),
-    "robertsdale": (30.5538, -87.71193),
-    "rock_creek": (33.47705, -87.08027),
-    "rockford": (32.88957, -86.21969),
-    "rogersville": (34.82578, -87.29676),
-    "russellville": (34.50787, -87.72864),
-    "saks": (33.69871, -85.83969),
-    "samson": (31.11295, -86.04605),
-    "saraland": (30.82074, -88.07056),
-    "sardis_city": (34.17426, -86.12275),
-    "satsuma": (30.85324, -88.05611),
-    "scottsboro": (34.67231, -86.03415),
-    "selma": (32.40736, -87.0211),
-    "semmes": (30.77824, -88.25917),
-    "sheffield": (34.76509, -87.69864),
-    "shelby": (33.1104, -86.58415),
-    "slocomb": (31.10823, -85.59438),
-    "smiths_station": (32.54014, -85.09855),
-    "smoke_rise": (33.89177, -86.82027),
-    "southside": (33.92454, -86.02247),
-    "spanish_fort": (30.67491, -87.91527),
-    "springville": (33.77505, -86.47191),
-    "steele": (33.93982, -86.20164),
-    "stevenson": (34.86869, -85.83942),
-    "stewartville": (33.07929, -86.24442),
-    "sulligent": (33.90177, -88.13448),
-    "sumiton": (33.75566, -87.05),
-    "summerdale": (30.4877, -87.69971),
-    "sylacauga": (33.17317, -86.25164),
-    "sylvan_springs": (33.51566, -87.01499),
-    "sylvania": (34.56231, -85.81247),
-    "talladega": (33.43594, -86.1058),
-    "tallassee": (32.53597, -85.89329),
-    "tarrant": (33.58344, -86.77277),
-    "taylor": (31.1649, -85.46827),
-    "theodore": (30.54769, -88.17528),
-    "thomasville": (31.91349, -87.73584),
-    "thorsby": (32.91568, -86.71582),
-    "tillmans_corner": (30.59019, -88.17084),
-    "town_creek": (34.6812, -87.40613),
-    "troy": (31.80877, -85.96995),
-    "trussville": (33.61983, -86.60888),
-    "tuscaloosa": (33.20984, -87.56917),
-    "tuscumbia": (34.7312, -87.70253),
-    "tuskegee": (32.42415, -85.69096),
-    "union_springs": (32.14432, -85.71495),
-    "uniontown": (32.44958, -87.51417),
-    "valley": (32.81874, -85.17939),
-    "valley_grande": (32.50902, -86.98749),
-    "vandiver": (33.47066, -86.51332),
-    "vance": (33.17428, -87.23361),
-    "vernon": (33.75705, -88.10892),
-    "vestavia_hills": (33.44872, -86.78777),
-    "vincent": (33.38455, -86.41192),
-    "warrior": (33.81427, -86.80944),
-    "weaver": (33.75205, -85.81135),
-    "webb": (31.26045, -85.27327),
-    "wedowee": (33.309, -85.48467),
-    "west_blocton": (33.11817, -87.125),
-    "westover": (33.34955, -86.53582),
-    "wetumpka": (32.54374, -86.21191),
-    "whitesboro": (34.16343, -86.06942),
-    "wilsonville": (33.23428, -86.48359),
-    "winfield": (33.92899, -87.81725),
-    "woodstock": (33.20678, -87.15),
-    "york": (32.48625, -88.29642),
-    "alexander": (34.62954, -92.44127),
-    "alma": (35.47787, -94.22188),
-    "arkadelphia": (34.12093, -93.05378),
-    "arkansas_city": (33.60872, -91.20678),
-    "ash_flat": (36.22396, -91.60848),
-    "ashdown": (33.67429, -94.13131),
-    "atkins": (35.24647, -92.93656),
-    "augusta": (35.28231, -91.36541),
-    "austin": (34.99842, -91.98376),
-    "bald_knob": (35.30981, -91.56791),
-    "barling": (35.32565, -94.3016),
-    "batesville": (35.7698, -91.64097),
-    "bay": (35.7423, -90.56233),
-    "beebe": (35.07064, -91.87959),
-    "bella_vista": (36.4807, -94.27134),
-    "benton": (34.56454, -92.58683),
-    "bentonville": (36.37285, -94.20882),
-    "berryville": (36.36479, -93.56797),
-    "bethel_heights": (36.21424, -94.12937),
-    "blytheville": (35.9273, -89.91898),
-    "bono": (35.90868, -90.80262),
-    "booneville": (35.14009, -93.92159),
-    "brinkley": (34.88787, -91.19457),
-    "brookland": (35.90007, -90.58205),
-    "bryant": (34.59593, -92.48905),
-    "bull_shoals": (36.38396, -92.58155),
-    "cabot": (34.97453, -92.01653),
-    "calico_rock": (36.11951, -92.13599),
-    "caraway": (35.75813, -90.32232),
-    "carlisle": (34.78315, -91.74652),
-    "cave_city": (35.94174, -91.54847),
-    "cave_springs": (36.26341, -94.23187),
-    "cedarville": (35.56981, -94.36688),
-    "centerton": (36.3598, -94.28521),
-    "charleston": (35.29704, -94.03632),
-    "cherokee_village": (36.29784, -91.51597),
-    "clarendon": (34.69315, -91.31374),
-    "clarksville": (35.47147, -93.46657),
-    "clinton": (35.59147, -92.46044),
-    "coal_hill": (35.43731, -93.67297),
-    "conway": (35.0887, -92.4421),
-    "corning": (36.40784, -90.57983),
-    "crossett": (33.12818, -91.96124),
-    "dardanelle": (35.22314, -93.15795),
-    "de_queen": (34.03789, -94.34132),
-    "de_witt": (34.29288, -91.3379),
-    "dermott": (33.52539, -91.43595),
-    "des_arc": (34.97704, -91.49513),
-    "diaz": (35.63841, -91.26513),
-    "dierks": (34.11928, -94.01658),
-    "dover": (35.40147, -93.11434),
-    "dumas": (33.88705, -91.49179),
-    "earle": (35.27509, -90.46677),
-    "east_end": (34.55065, -92.34099),
-    "el_dorado": (33.20763, -92.66627),
-    "elkins": (36.00147, -94.00825),
-    "elm_springs": (36.20619, -94.23437),
-    "england": (34.54426, -91.96903),
-    "eudora": (33.10957, -91.26206),
-    "eureka_springs": (36.40118, -93.73797),
-    "fairfield_bay": (35.59424, -92.27793),
-    "farmington": (36.04202, -94.24715),
-    "flippin": (36.27896, -92.59711),
-    "fordyce": (33.81372, -92.41293),
-    "forrest_city": (35.00815, -90.78983),
-    "fort_smith": (35.38592, -94.39855),
-    "gassville": (36.28312, -92.49405),
-    "gentry": (36.26758, -94.48466),
-    "gibson": (34.88426, -92.2357),
-    "glenwood": (34.32677, -93.55074),
-    "gosnell": (35.95979, -89.97203),
-    "goshen": (36.10119, -93.99131),
-    "gravel_ridge": (34.86842, -92.1907),
-    "gravette": (36.42202, -94.45355),
-    "green_forest": (36.33535, -93.43602),
-    "greenbrier": (35.23397, -92.38765),
-    "greenland": (35.99425, -94.1752),
-    "greenwood": (35.21565, -94.25577),
-    "gurdon": (33.92094, -93.15406),
-    "hamburg": (33.22818, -91.79763),
-    "hampton": (33.53789, -92.46988),
-    "harrisburg": (35.56425, -90.71678),
-    "harrison": (36.22979, -93.10768),
-    "haskell": (34.50148, -92.63655),
-    "hazen": (34.78093, -91.58097),
-    "heber_springs": (35.49147, -92.03126),
-    "highland": (36.2759, -91.52403),
-    "holiday_island": (36.48535, -93.73214),
-    "hope": (33.66706, -93.59157),
-    "horatio": (33.93845, -94.35715),
-    "horseshoe_bend": (36.22923, -91.76431),
-    "hot_springs": (34.5037, -93.05518),
-    "hot_springs_village": (34.67204, -92.99879),
-    "hoxie": (36.05035, -90.97512),
-    "hughes": (34.94926, -90.47149),
-    "johnson": (36.13286, -94.16548),
-    "jonesboro": (35.8423, -90.70428),
-    "judsonia": (35.27009, -91.63986),
-    "kensett": (35.23175, -91.66764),
-    "lake_city": (35.81619, -90.43427),
-    "lake_hamilton": (34.42453, -93.09518),
-    "lake_village": (33.32873, -91.28178),
-    "lamar": (35.44064, -93.38796),
-    "landmark": (34.6112, -92.3196),
-    "lavaca": (35.3362, -94.17326),
-    "leachville": (35.93591, -90.25788),
-    "lepanto": (35.61119, -90.32982),
-    "lewisville": (33.35846, -93.57768),
-    "little_flock": (36.38591, -94.1352),
-    "little_rock": (34.74648, -92.28959),
-    "london": (35.32897, -93.25296),
-    "lonoke": (34.78398, -91.89986),
-    "lowell": (36.25535, -94.13076),
-    "luxora": (35.75619, -89.92814),
-    "magnolia": (33.26707, -93.23933),
-    "manila": (35.88007, -90.16704),
-    "mansfield": (35.05954, -94.25271),
-    "marianna": (34.77371, -90.75761),
-    "marked_tree": (35.53286, -90.42066),
-    "marmaduke": (36.18701, -90.38316),
-    "marshall": (35.90896, -92.63127),
-    "marvell": (34.55566, -90.91289),
-    "maumelle": (34.86676, -92.40432),
-    "mayflower": (34.95703, -92.42738),
-    "mcalmont": (34.80842, -92.18181),
-    "mccrory": (35.2562, -91.20012),
-    "mcgehee": (33.629, -91.39956),
-    "melbourne": (36.05951, -91.90848),
-    "mena": (34.58622, -94.23966),
-    "midway": (36.38534, -92.46183),
-    "mineral_springs": (33.87512, -93.9138),
-    "monette": (35.89063, -90.34427),
-    "morrilton": (35.15092, -92.74405),
-    "mount_ida": (34.55676, -93.63408),
-    "mountain_view": (35.86841, -92.11765),
-    "mountain_home": (36.33534, -92.38516),
-    "mulberry": (35.50064, -94.05159),
-    "murfreesboro": (34.06233, -93.6899),
-    "nashville": (33.94567, -93.84713),
-    "newark": (35.70174, -91.44152),
-    "newport": (35.6048, -91.2818),
-    "north_crossett": (33.16568, -91.94152),
-    "north_little_rock": (34.76954, -92.26709),
-    "ola": (35.03231, -93.22323),
-    "osceola": (35.70508, -89.96953),
-    "paragould": (36.0584, -90.49733),
-    "paris": (35.29203, -93.72992),
-    "parkin": (35.26342, -90.57122),
-    "pea_ridge": (33.92066, -91.33679),
-    "perryville": (35.00481, -92.80267),
-    "piggott": (36.38284, -90.19065),
-    "pine_bluff": (34.22843, -92.0032),
-    "piney": (34.50314, -93.12602),
-    "pocahontas": (36.26146, -90.97123),
-    "pottsville": (35.24814, -93.04906),
-    "prairie_creek": (36.34202, -94.06187),
-    "prairie_grove": (35.97591, -94.31771),
-    "prescott": (33.80261, -93.38101),
-    "rector": (36.26312, -90.2926),
-    "redfield": (34.4451, -92.1832),
-    "rison": (33.95843, -92.19015),
-    "rockwell": (34.46426, -93.13379),
-    "rogers": (36.33202, -94.11854),
-    "salem": (36.37118, -91.82265),
-    "searcy": (35.25064, -91.73625),
-    "shannon_hills": (34.62009, -92.39543),
-    "sheridan": (34.30704, -92.40127),
-    "siloam_springs": (36.18814, -94.5405),
-    "smackover": (33.36485, -92.72488),
-    "springdale": (36.18674, -94.12881),
-    "stamps": (33.3654, -93.49518),
-    "star_city": (33.94288, -91.84347),
-    "stuttgart": (34.50037, -91.55263),
-    "sulphur_springs": (34.18065, -92.12348),
-    "texarkana": (33.44179, -94.03769),
-    "tontitown": (36.17786, -94.23354),
-    "trumann": (35.67369, -90.50733),
-    "tuckerman": (35.73063, -91.19846),
-    "van_buren": (35.43676, -94.34827),
-    "vilonia": (35.08398, -92.20793),
-    "waldo": (33.35151, -93.29573),
-    "waldron": (34.89843, -94.09076),
-    "walnut_ridge": (36.0684, -90.95595),
-    "ward": (35.03036, -91.95042),
-    "warren": (33.61261, -92.06458),
-    "west_crossett": (33.14096, -91.99402),
-    "west_fork": (35.92425, -94.18854),
-    "west_helena": (34.55066, -90.64177),
-    "west_memphis": (35.14648, -90.18454),
-    "white_hall": (34.27399, -92.09098),
-    "wrightsville": (34.60232, -92.21681),
-    "wynne": (35.22453, -90.78678),
-    "yellville": (36.22618, -92.68489),
-    "chevy_chase": (38.964, -77.06776),
-    "washington_d_c_": (38.89511, -77.03637),
-    "bear": (39.62928, -75.65826),
-    "bellefonte": (39.76622, -75.50936),
-    "bethany_beach": (38.53956, -75.05518),
-    "blades": (38.63567, -75.60993),
-    "bridgeville": (38.74261, -75.60437),
-    "cheswold": (39.21928, -75.58576),
-    "claymont": (39.80067, -75.45964),
-    "delaware_city": (39.57789, -75.58881),
-    "delmar": (38.45651, -75.57715),
-    "edgemoor": (39.75011, -75.49964),
-    "elsmere": (39.73928, -75.59798),
-    "felton": (39.00845, -75.57798),
-    "georgetown": (38.69011, -75.38547),
-    "glasgow": (39.60483, -75.74521),
-    "harrington": (38.92372, -75.5777),
-    "highland_acres": (39.12095, -75.52187),
-    "hockessin": (39.78761, -75.6966),
-    "kent_acres": (39.13178, -75.52492),
-    "laurel": (38.5565, -75.57131),
-    "lewes": (38.77456, -75.13935),
-    "long_neck": (38.62011, -75.15074),
-    "middletown": (39.44956, -75.71632),
-    "milford": (38.91261, -75.42797),
-    "millsboro": (38.5915, -75.2913),
-    "milton": (38.77761, -75.30991),
-    "new_castle": (39.66206, -75.56631),
-    "north_star": (39.76122, -75.7191),
-    "pike_creek": (39.73095, -75.7041),
-    "pike_creek_valley": (39.73622, -75.69827),
-    "rehoboth_beach": (38.72095, -75.07601),
-    "riverview": (39.0265, -75.51076),
-    "rodney_village": (39.13206, -75.53242),
-    "seaford": (38.64123, -75.61104),
-    "selbyville": (38.46039, -75.22074),
-    "smyrna": (39.29983, -75.60465),
-    "townsend": (39.39511, -75.6916),
-    "wilmington": (39.74595, -75.54659),
-    "wilmington_manor": (39.68678, -75.58437),
-    "wyoming": (39.11817, -75.55881),
-    "alachua": (29.75163, -82.42483),
-    "allapattah": (25.81454, -80.22394),
-    "altamonte_springs": (28.66111, -81.36562),
-    "alturas": (27.87169, -81.71508),
-    "alva": (26.71562, -81.61008),
-    "andover": (25.96843, -80.21283),
-    "anna_maria": (27.53115, -82.73343),
-    "apalachicola": (29.726, -84.9856),
-    "apollo_beach": (27.77308, -82.40759),
-    "apopka": (28.67617, -81.51186),
-    "arcadia": (27.21588, -81.85842),
-    "archer": (29.52997, -82.519),
-    "asbury_lake": (30.04913, -81.82149),
-    "astatula": (28.70972, -81.73285),
-    "astor": (29.16248, -81.52535),
-    "atlantic_beach": (30.33441, -81.3987),
-    "atlantis": (26.5909, -80.10088),
-    "auburndale": (28.0653, -81.78869),
-    "aventura": (25.95648, -80.13921),
-    "avon_park": (27.59587, -81.50619),
-    "azalea_park": (28.54111, -81.30062),
-    "babson_park": (27.83197, -81.5223),
-    "bagdad": (30.5988, -87.03223),
-    "bal_harbour": (25.89176, -80.12699),
-    "baldwin": (30.30274, -81.97539),
-    "balm": (27.75947, -82.2612),
-    "bartow": (27.89641, -81.84314),
-    "bay_harbor_islands": (25.88759, -80.13116),
-    "bay_hill": (28.46806, -81.51618),
-    "bay_pines": (27.81419, -82.77816),
-    "bayonet_point": (28.32667, -82.68343),
-    "bayshore_gardens": (27.42532, -82.59038),
-    "beacon_square": (28.20862, -82.75538),
-    "bee_ridge": (27.28394, -82.48065),
-    "belle_glade": (26.68451, -80.66756),
-    "belle_glade_camp": (26.65757, -80.68284),
-    "belle_isle": (28.45834, -81.35924),
-    "belleair": (27.93585, -82.80621),
-    "belleair_beach": (27.92308, -82.84316),
-    "belleair_bluffs": (27.92141, -82.81705),
-    "belleview": (29.05526, -82.06231),
-    "bellview": (30.46159, -87.31497),
-    "beverly_hills": (28.91692, -82.45815),
-    "big_coppitt_key": (24.59653, -81.66009),
-    "big_pine_key": (24.66987, -81.35397),
-    "biscayne_park": (25.8826, -80.1806),
-    "bithlo": (28.55472, -81.10645),
-    "black_diamond": (28.91248, -82.48593),
-    "bloomingdale": (27.89364, -82.24037),
-    "blountstown": (30.44379, -85.04744),
-    "boca_del_mar": (26.34508, -80.14671),
-    "boca_pointe": (26.33313, -80.15949),
-    "boca_raton": (26.35869, -80.0831),
-    "bokeelia": (26.70563, -82.15898),
-    "bonifay": (30.79186, -85.67965),
-    "bonita_springs": (26.33981, -81.7787),
-    "bowling_green": (27.63837, -81.82397),
-    "boyette": (27.81753, -82.22259),
-    "boynton_beach": (26.52535, -80.06643),
-    "bradenton": (27.49893, -82.57482),
-    "bradenton_beach": (27.46698, -82.70399),
-    "brandon": (27.9378, -82.28592),
-    "bristol": (30.43247, -84.97702),
-    "broadview_park": (26.09953, -80.20866),
-    "bronson": (29.44774, -82.64233),
-    "brookridge": (28.5511, -82.49204),
-    "brooksville": (28.55554, -82.38991),
-    "broward_estates": (26.12564, -80.19338),
-    "brownsville": (25.82176, -80.24116),
-    "buckhead_ridge": (27.13033, -80.89367),
-    "buckingham": (26.67507, -81.73203),
-    "buenaventura_lakes": (28.33584, -81.35313),
-    "bunche_park": (25.92065, -80.23699),
-    "bunnell": (29.46609, -81.25784),
-    "burnt_store_marina": (26.76507, -82.05092),
-    "bushnell": (28.66499, -82.11286),
-    "butler_beach": (29.7983, -81.26701),
-    "callahan": (30.56218, -81.83066),
-    "callaway": (30.15298, -85.56993),
-    "campbell": (28.2589, -81.45646),
-    "cantonment": (30.60853, -87.33998),
-    "cape_canaveral": (28.40584, -80.60477),
-    "cape_coral": (26.56285, -81.94953),
-    "carol_city": (25.94065, -80.2456),
-    "carrabelle": (29.85326, -84.66435),
-    "carrollwood": (28.05002, -82.49287),
-    "carrollwood_village": (28.06752, -82.52093),
-    "carver_ranches": (25.98842, -80.19227),
-    "casselberry": (28.67778, -81.32785),
-    "cedar_grove": (30.17103, -85.6252),
-    "celebration": (28.32529, -81.53313),
-    "center_hill": (28.64999, -81.99258),
-    "century": (30.97324, -87.26386),
-    "charlotte_harbor": (26.95839, -82.06703),
-    "charlotte_park": (26.91006, -82.05398),
-    "chattahoochee": (30.70546, -84.84574),
-    "cheval": (28.14862, -82.51454),
-    "chiefland": (29.47496, -82.85984),
-    "chipley": (30.78186, -85.53854),
-    "christmas": (28.53639, -81.01756),
-    "chuluota": (28.64194, -81.1234),
-    "citra": (29.41192, -82.10982),
-    "citrus_hills": (28.88831, -82.4326),
-    "citrus_park": (28.07835, -82.56982),
-    "citrus_ridge": (28.33385, -81.64232),
-    "citrus_springs": (28.99748, -82.47065),
-    "clarcona": (28.61278, -81.49868),
-    "clearwater": (27.96585, -82.8001),
-    "clermont": (28.54944, -81.77285),
-    "clewiston": (26.75423, -80.93368),
-    "cocoa": (28.38612, -80.742),
-    "cocoa_beach": (28.32055, -80.60922),
-    "coconut_creek": (26.25175, -80.17894),
-    "coconut_grove": (25.7126, -80.25699),
-    "combee_settlement": (28.05835, -81.90536),
-    "cooper_city": (26.05731, -80.27172),
-    "coral_gables": (25.72149, -80.26838),
-    "coral_springs": (26.27119, -80.2706),
-    "coral_terrace": (25.74593, -80.3045),
-    "cortez": (27.46921, -82.68621),
-    "country_walk": (25.63399, -80.43228),
-    "country_club": (25.94815, -80.317),
-    "crawfordville": (30.17604, -84.37518),
-    "crescent_city": (29.43025, -81.51063),
-    "crestview": (30.76213, -86.57051),
-    "crooked_lake_park": (27.82919, -81.58397),
-    "cross_city": (29.63465, -83.12694),
-    "crystal_lake": (28.03558, -81.90841),
-    "crystal_river": (28.90248, -82.5926),
-    "crystal_springs": (28.1814, -82.15758),
-    "cudjoe_key": (24.67153, -81.49842),
-    "cutler": (25.6151, -80.31061),
-    "cutler_ridge": (25.58066, -80.34672),
-    "cypress_gardens": (27.99391, -81.69008),
-    "cypress_lake": (26.53813, -81.89925),
-    "cypress_quarters": (27.25199, -80.81395),
-    "dade_city": (28.36472, -82.19592),
-    "dania_beach": (26.05231, -80.14393),
-    "davenport": (28.1614, -81.60174),
-    "davie": (26.06287, -80.2331),
-    "daytona_beach": (29.21081, -81.02283),
-    "daytona_beach_shores": (29.17609, -80.98283),
-    "defuniak_springs": (30.72102, -86.11522),
-    "deland": (29.02832, -81.30312),
-    "de_leon_springs": (29.11989, -81.35286),
-    "debary": (28.88305, -81.30868),
-    "deerfield_beach": (26.31841, -80.09977),
-    "delray_beach": (26.46146, -80.07282),
-    "deltona": (28.90054, -81.26367),
-    "desoto_lakes": (27.37143, -82.48982),
-    "destin": (30.39353, -86.49578),
-    "doctor_phillips": (28.44945, -81.49229),
-    "doral": (25.81954, -80.35533),
-    "dundee": (28.02252, -81.61924),
-    "dunedin": (28.0199, -82.77323),
-    "dunnellon": (29.04914, -82.46093),
-    "eagle_lake": (27.97836, -81.75647),
-    "east_lake": (28.11085, -82.69482),
-    "east_milton": (30.61519, -87.02163),
-    "east_palatka": (29.6583, -81.59841),
-    "east_pensacola_heights": (30.42881, -87.17997),
-    "east_perrine": (25.60872, -80.33894),
-    "eastpoint": (29.7366, -84.87852),
-    "eatonville": (28.61472, -81.38062),
-    "edgewater": (28.98888, -80.90228),
-    "edgewood": (28.48612, -81.37229),
-    "eglin_village": (30.46298, -86.5394),
-    "egypt_lake_leto": (28.01769, -82.50619),
-    "el_portal": (25.85537, -80.1931),
-    "elfers": (28.21668, -82.72232),
-    "ellenton": (27.52171, -82.5276),
-    "englewood": (26.96201, -82.3526),
-    "ensley": (30.51881, -87.27275),
-    "estero": (26.43814, -81.80675),
-    "eustis": (28.85277, -81.68535),
-    "fairview_shores": (28.59111, -81.39424),
-    "feather_sound": (27.90079, -82.67349),
-    "fellsmere": (27.76781, -80.60144),
-    "fern_park": (28.64916, -81.35118),
-    "fernandina_beach": (30.66968, -81.46259),
-    "ferry_pass": (30.5102, -87.21247),
-    "fish_hawk": (27.85058, -82.21092),
-    "five_points": (30.20912, -82.63735),
-    "flagami": (25.76232, -80.31616),
-    "flagler_beach": (29.47498, -81.127),
-    "fleming_island": (30.0933, -81.71898),
-    "floral_city": (28.74999, -82.29676),
-    "florida_city": (25.44789, -80.47922),
-    "florida_ridge": (27.58031, -80.38672),
-    "forest_city": (28.66678, -81.44334),
-    "fort_lauderdale": (26.12231, -80.14338),
-    "fort_meade": (27.75225, -81.80175),
-    "fort_myers": (26.62168, -81.84059),
-    "fort_myers_beach": (26.45271, -81.95011),
-    "fort_myers_shores": (26.70924, -81.74592),
-    "fort_pierce": (27.44671, -80.32561),
-    "fort_walton_beach": (30.42059, -86.61707),
-    "fountainebleau": (25.77288, -80.34783),
-    "freeport": (30.49825, -86.13605),
-    "frostproof": (27.74586, -81.53063),
-    "fruit_cove": (30.11107, -81.64176),
-    "fruitland_park": (28.86138, -81.90647),
-    "fruitville": (27.32977, -82.4576),
-    "fuller_heights": (27.90919, -81.99814),
-    "fussels_corner": (28.05419, -81.86064),
-    "gainesville": (29.65163, -82.32483),
-    "gandy": (27.8685, -82.61612),
-    "gateway": (26.57757, -81.75036),
-    "gibsonia": (28.11474, -81.97369),
-    "gibsonton": (27.85364, -82.38259),
-    "gifford": (27.67531, -80.40922),
-    "gladeview": (25.83926, -80.2356),
-    "glenvar_heights": (25.7076, -80.32561),
-    "golden_gate": (26.18787, -81.69509),
-    "golden_glades": (25.91176, -80.20033),
-    "goldenrod": (28.61028, -81.28868),
-    "gonzalez": (30.58158, -87.29136),
-    "gotha": (28.52778, -81.52313),
-    "goulding": (30.44298, -87.22247),
-    "goulds": (25.56261, -80.38228),
-    "graceville": (30.95685, -85.5166),
-    "green_cove_springs": (29.99191, -81.67815),
-    "greenacres_city": (26.62368, -80.12532),
-    "gretna": (30.61714, -84.65991),
-    "grove_city": (26.91423, -82.32704),
-    "groveland": (28.55805, -81.85119),
-    "gulf_breeze": (30.35714, -87.16386),
-    "gulf_gate_estates": (27.25173, -82.51471),
-    "gulfport": (27.74836, -82.70343),
-    "haines_city": (28.1145, -81.62009),
-    "hallandale_beach": (25.9812, -80.14838),
-    "harbor_bluffs": (27.90947, -82.8276),
-    "harbour_heights": (26.99089, -82.00231),
-    "harlem": (26.73757, -80.9509),
-    "harlem_heights": (26.51619, -81.92787),
-    "havana": (30.62381, -84.41463),
-    "haverhill": (26.69118, -80.12004),
-    "hawthorne": (29.59191, -82.08732),
-    "heathrow": (28.76333, -81.37225),
-    "hernando": (28.89998, -82.37454),
-    "hernando_beach": (28.46944, -82.65927),
-    "hialeah": (25.8576, -80.27811),
-    "hialeah_gardens": (25.8651, -80.3245),
-    "high_springs": (29.82691, -82.59678),
-    "highland_beach": (26.39952, -80.0656),
-    "highland_city": (27.9653, -81.87786),
-    "hiland_park": (30.20103, -85.62687),
-    "hill_n_dale": (28.51972, -82.29926),
-    "hilliard": (30.69107, -81.91733),
-    "hillsboro_beach": (26.29397, -80.07893),
-    "hobe_sound": (27.0595, -80.13643),
-    "holden_heights": (28.49667, -81.38785),
-    "holiday": (28.18779, -82.73955),
-    "holley": (30.44686, -86.90691),
-    "holly_hill": (29.24359, -81.03756),
-    "hollywood": (26.0112, -80.14949),
-    "holmes_beach": (27.49532, -82.71093),
-    "homestead": (25.46872, -80.47756),
-    "homosassa": (28.78137, -82.6151),
-    "homosassa_springs": (28.80359, -82.57593),
-    "howey_in_the_hills": (28.71694, -81.77341),
-    "hudson": (28.36445, -82.69343),
-    "hunters_creek": (28.36056, -81.42229),
-    "hypoluxo": (26.56646, -80.05337),
-    "immokalee": (26.41869, -81.4173),
-    "indialantic": (28.08946, -80.56561),
-    "indian_harbour_beach": (28.1489, -80.58839),
-    "indian_river_estates": (27.36449, -80.30977),
-    "indian_river_shores": (27.7167, -80.38422),
-    "indian_rocks_beach": (27.8753, -82.85122),
-    "indian_shores": (27.8628, -82.84844),
-    "indiantown": (27.02728, -80.48561),
-    "inglis": (29.03025, -82.66872),
-    "interlachen": (29.62421, -81.89256),
-    "inwood": (28.03697, -81.76508),
-    "iona": (26.52036, -81.96398),
-    "islamorada": (24.9243, -80.62784),
-    "ives_estates": (25.96231, -80.17671),
-    "jacksonville_beach": (30.29469, -81.39314),
-    "jan_phyl_village": (28.01474, -81.77175),
-    "jasmine_estates": (28.29306, -82.6901),
-    "jensen_beach": (27.25449, -80.22977),
-    "june_park": (28.07224, -80.68006),
-    "juno_beach": (26.87978, -80.05337),
-    "jupiter": (26.93422, -80.09421),
-    "kathleen": (28.12085, -82.02314),
-    "kendale_lakes": (25.70816, -80.407),
-    "kendall": (25.67927, -80.31727),
-    "kendall_green": (26.25397, -80.12393),
-    "kenneth_city": (27.81558, -82.7201),
-    "kensington_park": (27.35949, -82.49649),
-    "key_biscayne": (25.69371, -80.16282),
-    "key_largo": (25.08652, -80.44728),
-    "key_west": (24.55524, -81.78163),
-    "keystone": (28.15585, -82.62121),
-    "keystone_heights": (29.78608, -82.03149),
-    "kings_point": (26.44535, -80.13977),
-    "kissimmee": (28.30468, -81.41667),
-    "labelle": (26.76173, -81.43841),
-    "lacoochee": (28.46583, -82.17203),
-    "lady_lake": (28.91749, -81.92286),
-    "laguna_beach": (30.23965, -85.9241),
-    "lake_alfred": (28.09196, -81.72341),
-    "lake_belvedere_estates": (26.68923, -80.13338),
-    "lake_butler": (30.02274, -82.33956),
-    "lake_clarke_shores": (26.64534, -80.07588),
-    "lake_forest": (25.97759, -80.1831),
-    "lake_helen": (28.98082, -81.23339),
-    "lake_lorraine": (30.44159, -86.56523),
-    "lake_lucerne": (25.96509, -80.24144),
-    "lake_magdalene": (28.07418, -82.47176),
-    "lake_panasoffkee": (28.75582, -82.09481),
-    "lake_park": (26.80034, -80.06643),
-    "lake_placid": (27.35197, -81.32631),
-    "lake_sarasota": (27.29255, -82.4376),
-    "lake_mary": (28.75888, -81.31784),
-    "lake_wales": (27.90141, -81.58591),
-    "lake_worth": (26.61708, -80.07231),
-    "lake_worth_corridor": (26.61649, -80.10102),
-    "lakeland": (28.03947, -81.9498),
-    "lakeland_highlands": (27.95975, -81.95008),
-    "lakes_by_the_bay": (25.57233, -80.32533),
-    "lakeside": (30.12996, -81.76815),
-    "lakewood_park": (27.54309, -80.40227),
-    "land_o_lakes": (28.2189, -82.45759),
-    "lantana": (26.58674, -80.05199),
-    "largo": (27.90979, -82.78842),
-    "lauderdale_lakes": (26.16647, -80.20838),
-    "lauderdale_by_the_sea": (26.19203, -80.09643),
-    "lauderhill": (26.14036, -80.21338),
-    "lealman": (27.82114, -82.67927),
-    "lecanto": (28.85165, -82.4876),
-    "lehigh_acres": (26.62535, -81.6248),
-    "leisure_city": (25.49539, -80.42922),
-    "lely": (26.10065, -81.72842),
-    "lely_resort": (26.08093, -81.69786),
-    "lighthouse_point": (26.27564, -80.08727),
-    "limestone_creek": (26.94284, -80.14115),
-    "live_oak": (30.29495, -82.98402),
-    "lochmoor_waterway_estates": (26.64424, -81.90981),
-    "lockhart": (28.61944, -81.44257),
-    "longboat_key": (27.41254, -82.65899),
-    "longwood": (28.70305, -81.3384),
-    "loughman": (28.24196, -81.56674),
-    "lower_grand_lagoon": (30.14409, -85.75076),
-    "loxahatchee_groves": (26.68368, -80.27977),
-    "lutz": (28.15112, -82.46148),
-    "lynn_haven": (30.24548, -85.64826),
-    "macclenny": (30.28218, -82.12206),
-    "madeira_beach": (27.79808, -82.79732),
-    "maitland": (28.62778, -81.36312),
-    "malabar": (28.00363, -80.56561),
-    "malone": (30.95769, -85.16215),
-    "manasota_key": (26.92534, -82.35204),
-    "manatee_road": (29.51302, -82.91429),
-    "mango": (27.97974, -82.30648),
-    "mangonia_park": (26.76034, -80.07365),
-    "marathon": (24.71375, -81.09035),
-    "marco": (25.9726, -81.72898),
-    "marco_island": (25.94121, -81.71842),
-    "margate": (26.24453, -80.20644),
-    "mary_esther": (30.41015, -86.66509),
-    "masaryktown": (28.44167, -82.45704),
-    "mascotte": (28.57833, -81.88675),
-    "mayo": (30.053, -83.17486),
-    "mcgregor": (26.56091, -81.91453),
-    "meadow_woods": (28.38556, -81.36646),
-    "medulla": (27.9678, -81.97342),
-    "melbourne_beach": (28.06835, -80.56033),
-    "melrose_park": (26.11342, -80.19338),
-    "memphis": (27.53587, -82.56121),
-    "merritt_island": (28.53917, -80.672),
-    "mexico_beach": (29.94809, -85.41995),
-    "miami": (25.77427, -80.19366),
-    "miami_beach": (25.79065, -80.13005),
-    "miami_gardens": (25.97981, -80.20255),
-    "miami_lakes": (25.90871, -80.30866),
-    "miami_shores": (25.86315, -80.19283),
-    "miami_springs": (25.82232, -80.2895),
-    "micco": (27.88058, -80.50033),
-    "middleburg": (30.06885, -81.86038),
-    "mims": (28.66527, -80.84478),
-    "minneola": (28.57444, -81.74619),
-    "miramar": (25.98731, -80.23227),
-    "miramar_beach": (30.37437, -86.35856),
-    "molino": (30.72408, -87.31414),
-    "montverde": (28.60028, -81.67396),
-    "moore_haven": (26.83312, -81.09312),
-    "mount_dora": (28.80249, -81.64452),
-    "mount_plymouth": (28.80805, -81.53313),
-    "myrtle_grove": (30.42103, -87.30747),
-    "naples": (26.14234, -81.79596),
-    "naples_manor": (26.0887, -81.7262),
-    "naples_park": (26.26175, -81.80925),
-    "naranja": (25.51816, -80.42283),
-    "navarre": (30.40159, -86.86357),
-    "neptune_beach": (30.31191, -81.39647),
-    "new_port_richey": (28.24418, -82.71927),
-    "new_smyrna_beach": (29.02582, -80.927),
-    "newberry": (29.64635, -82.6065),
-    "niceville": (30.51686, -86.48217),
-    "nocatee": (27.16033, -81.88231),
-    "nokomis": (27.11922, -82.44426),
-    "norland": (25.94898, -80.21227),
-    "north_andrews_gardens": (26.19147, -80.14421),
-    "north_bay_village": (25.84621, -80.15394),
-    "north_brooksville": (28.57305, -82.40815),
-    "north_deland": (29.04943, -81.29812),
-    "north_fort_myers": (26.66729, -81.88009),
-    "north_key_largo": (25.26734, -80.32339),
-    "north_lauderdale": (26.2173, -80.22588),
-    "north_miami": (25.89009, -80.18671),
-    "north_miami_beach": (25.93315, -80.16255),
-    "north_palm_beach": (26.81756, -80.08199),
-    "north_port": (27.04422, -82.23593),
-    "north_redington_beach": (27.81614, -82.82066),
-    "north_river_shores": (27.21755, -80.26977),
-    "north_sarasota": (27.37393, -82.51843),
-    "oak_hill": (28.86443, -80.8545),
-    "oak_ridge": (28.47112, -81.42452),
-    "oakland": (28.555, -81.63313),
-    "oakland_park": (26.17231, -80.13199),
-    "ocala": (29.1872, -82.14009),
-    "ocean_city": (30.44103, -86.61356),
-    "ocean_ridge": (26.52702, -80.04837),
-    "ocoee": (28.56917, -81.54396),
-    "odessa": (28.1939, -82.59176),
-    "ojus": (25.94843, -80.1506),
-    "okeechobee": (27.24393, -80.82978),
-    "oldsmar": (28.03418, -82.6651),
-    "olga": (26.71896, -81.7123),
-    "olympia_heights": (25.72677, -80.35533),
-    "opa_locka": (25.90232, -80.25033),
-    "orange_city": (28.94888, -81.29867),
-    "orange_park": (30.16607, -81.70648),
-    "orangetree": (26.29286, -81.58842),
-    "oriole_beach": (30.37381, -87.09136),
-    "orlando": (28.53834, -81.37924),
-    "orlovista": (28.53834, -81.46035),
-    "ormond_beach": (29.28581, -81.05589),
-    "ormond_by_the_sea": (29.34914, -81.06645),
-    "osprey": (27.19616, -82.49037),
-    "oviedo": (28.67, -81.20812),
-    "pace": (30.59936, -87.16108),
-    "pahokee": (26.82006, -80.66534),
-    "palatka": (29.64858, -81.63758),
-    "palm_aire": (26.20619, -80.19171),
-    "palm_bay": (28.03446, -80.58866),
-    "palm_beach": (26.70562, -80.03643),
-    "palm_beach_gardens": (26.82339, -80.13865),
-    "palm_beach_shores": (26.77812, -80.0356),
-    "palm_city": (27.16783, -80.26616),
-    "palm_coast": (29.58497, -81.20784),
-    "palm_harbor": (28.07807, -82.76371),
-    "palm_springs": (26.6359, -80.09615),
-    "palm_springs_north": (25.9351, -80.33383),
-    "palm_valley": (30.17746, -81.38758),
-    "palmetto": (27.52143, -82.57232),
-    "palmetto_bay": (25.62177, -80.32477),
-    "palmetto_estates": (25.62149, -80.362),
-    "palmona_park": (26.68646, -81.89648),
-    "panama_city": (30.15946, -85.65983),
-    "panama_city_beach": (30.17659, -85.80549),
-    "paradise_heights": (28.62361, -81.54396),
-    "parker": (30.13104, -85.60326),
-    "parkland": (26.31008, -80.23727),
-    "pebble_creek": (28.14835, -82.34565),
-    "pelican_bay": (26.2312, -81.80564),
-    "pembroke_park": (25.98787, -80.17477),
-    "pembroke_pines": (26.00315, -80.22394),
-    "pensacola": (30.42131, -87.21691),
-    "perry": (30.11766, -83.58274),
-    "pierson": (29.23942, -81.46563),
-    "pine_castle": (28.47195, -81.36785),
-    "pine_hills": (28.55778, -81.4534),
-    "pine_island_center": (26.61369, -82.11815),
-    "pine_island_ridge": (26.09481, -80.27394),
-    "pine_manor": (26.57285, -81.87814),
-    "pine_ridge": (28.93831, -82.47343),
-    "pinecrest": (25.66705, -80.30811),
-    "pinellas_park": (27.8428, -82.69954),
-    "pinewood": (25.86898, -80.21699),
-    "placid_lakes": (27.24144, -81.40702),
-    "plant_city": (28.01888, -82.11469),
-    "plantation": (26.13421, -80.23184),
-    "plantation_mobile_home_park": (26.70312, -80.13227),
-    "poinciana": (28.14029, -81.45841),
-    "point_baker": (30.69019, -87.05358),
-    "polk_city": (28.18251, -81.82397),
-    "pompano_beach": (26.23786, -80.12477),
-    "pompano_beach_highlands": (26.28286, -80.10699),
-    "ponce_inlet": (29.09637, -80.937),
-    "ponte_vedra_beach": (30.23969, -81.38564),
-    "port_charlotte": (26.97617, -82.09064),
-    "port_labelle": (26.75645, -81.40508),
-    "port_orange": (29.13832, -80.99561),
-    "port_richey": (28.27168, -82.71955),
-    "port_saint_joe": (29.81188, -85.30297),
-    "port_saint_john": (28.47695, -80.78867),
-    "port_saint_lucie": (27.29393, -80.35033),
-    "port_salerno": (27.14422, -80.2006),
-    "pretty_bayou": (30.19659, -85.6966),
-    "princeton": (25.53844, -80.40894),
-    "progress_village": (27.9003, -82.36454),
-    "punta_gorda": (26.92978, -82.04537),
-    "punta_gorda_isles": (26.91756, -82.07842),
-    "punta_rassa": (26.48786, -82.01231),
-    "quincy": (30.58714, -84.58325),
-    "redington_beach": (27.80864, -82.81121),
-    "redington_shores": (27.82614, -82.82899),
-    "richmond_heights": (25.63149, -80.36894),
-    "richmond_west": (25.6105, -80.42971),
-    "ridge_manor": (28.5075, -82.17036),
-    "ridge_wood_heights": (27.28727, -82.51315),
-    "ridgecrest": (27.8975, -82.80529),
-    "river_park": (27.31421, -80.34727),
-    "riviera_beach": (26.77534, -80.0581),
-    "rock_island": (26.15509, -80.17699),
-    "rockledge": (28.35084, -80.72533),
-    "roseland": (27.83586, -80.49311),
-    "rotonda_west": (26.88368, -82.29009),
-    "royal_palm_beach": (26.7084, -80.2306),
-    "royal_palm_estates": (26.68173, -80.12504),
-    "ruskin": (27.72086, -82.43315),
-    "safety_harbor": (27.99085, -82.69316),
-    "saint_augustine": (29.89469, -81.31452),
-    "saint_augustine_beach": (29.85053, -81.26535),
-    "saint_augustine_shores": (29.8108, -81.31035),
-    "saint_cloud": (28.2489, -81.28118),
-    "saint_george": (28.05641, -82.72788),
-    "saint_james_city": (26.49758, -82.07843),
-    "saint_leo": (28.33723, -82.25842),
-    "saint_pete_beach": (27.72531, -82.74121),
-    "st_petersburg": (27.77086, -82.67927),
-    "samoset": (27.46948, -82.54149),
-    "san_antonio": (28.33611, -82.27453),
-    "san_carlos_park": (26.4673, -81.80147),
-    "sanibel": (26.44897, -82.02231),
-    "sanford": (28.80055, -81.27312),
-    "sarasota": (27.33643, -82.53065),
-    "sarasota_springs": (27.30894, -82.47954),
-    "satellite_beach": (28.17612, -80.59005),
-    "sawgrass": (30.19274, -81.37064),
-    "schall_circle": (26.71562, -80.11504),
-    "scott_lake": (25.94148, -80.23199),
-    "seaside": (30.32103, -86.14161),
-    "sebastian": (27.81641, -80.47061),
-    "sebring": (27.49559, -81.44091),
-    "seffner": (27.98363, -82.27565),
-    "seminole": (27.83975, -82.79121),
-    "seminole_manor": (26.58368, -80.10032),
-    "sewall_s_point": (27.19949, -80.20227),
-    "shady_hills": (28.41, -82.54288),
-    "sharpes": (28.43223, -80.76005),
-    "siesta_key": (27.26785, -82.54526),
-    "silver_lake": (28.84193, -81.79841),
-    "silver_springs_shores": (29.10442, -82.02064),
-    "sky_lake": (28.45723, -81.39146),
-    "sneads": (30.70801, -84.92552),
-    "south_bay": (26.66396, -80.71617),
-    "south_beach": (27.59115, -80.34422),
-    "south_bradenton": (27.4631, -82.58176),
-    "south_apopka": (28.66194, -81.50952),
-    "south_brooksville": (28.53582, -82.38403),
-    "south_daytona": (29.16582, -81.0045),
-    "south_gate_ridge": (27.28644, -82.49676),
-    "south_highpoint": (27.91697, -82.71288),
-    "south_miami": (25.7076, -80.29338),
-    "south_miami_heights": (25.59761, -80.38061),
-    "south_palm_beach": (26.58896, -80.03865),
-    "south_pasadena": (27.75503, -82.7376),
-    "south_patrick_shores": (28.20223, -80.6095),
-    "south_sarasota": (27.28616, -82.53288),
-    "south_venice": (27.05311, -82.42426),
-    "southchase": (28.39306, -81.3834),
-    "southgate": (27.3081, -82.50982),
-    "southwest_ranches": (26.0587, -80.33727),
-    "spring_hill": (28.47688, -82.52546),
-    "springfield": (30.15326, -85.61132),
-    "starke": (29.94413, -82.10983),
-    "steinhatchee": (29.67106, -83.38764),
-    "stock_island": (24.56709, -81.73842),
-    "stuart": (27.19755, -80.25283),
-    "sugarmill_woods": (28.73221, -82.50621),
-    "sun_city_center": (27.71809, -82.35176),
-    "suncoast_estates": (26.71174, -81.86897),
-    "sunny_isles_beach": (25.95065, -80.12282),
-    "sunrise": (26.13397, -80.1131),
-    "sunset": (25.70594, -80.35228),
-    "sunshine_ranches": (26.04592, -80.32894),
-    "surfside": (25.87843, -80.1256),
-    "sweetwater": (25.76343, -80.37311),
-    "taft": (28.42973, -81.36507),
-    "tallahassee": (30.43826, -84.28073),
-    "tamarac": (26.21286, -80.24977),
-    "tamiami": (25.75871, -80.39839),
-    "tampa": (27.94752, -82.45843),
-    "tangelo_park": (28.45584, -81.4459),
-    "tangerine": (28.76499, -81.63063),
-    "tarpon_springs": (28.14612, -82.75677),
-    "tavares": (28.80416, -81.72563),
-    "tavernier": (25.01152, -80.51506),
-    "taylor_creek": (27.21671, -80.7895),
-    "tedder": (26.28425, -80.12227),
-    "temple_terrace": (28.0353, -82.38926),
-    "tequesta": (26.96811, -80.12865),
-    "terra_mar": (26.21619, -80.09532),
-    "the_crossings": (25.67066, -80.40117),
-    "the_hammocks": (25.67149, -80.4445),
-    "the_meadows": (27.36171, -82.46898),
-    "the_villages": (28.93408, -81.95994),
-    "thonotosassa": (28.06141, -82.30231),
-    "three_lakes": (25.64205, -80.39839),
-    "three_oaks": (26.47008, -81.79397),
-    "tice": (26.67479, -81.81508),
-    "tierra_verde": (27.69197, -82.72343),
-    "tiger_point": (30.37853, -87.05552),
-    "timber_pines": (28.47028, -82.60316),
-    "titusville": (28.61222, -80.80755),
-    "town_n_country": (28.01057, -82.57732),
-    "treasure_island": (27.76919, -82.76899),
-    "trenton": (29.61329, -82.81762),
-    "twin_lakes": (26.18092, -80.16005),
-    "umatilla": (28.92943, -81.66563),
-    "union_park": (28.56806, -81.28618),
-    "university_park": (25.74649, -80.36755),
-    "upper_grand_lagoon": (30.16326, -85.74076),
-    "valparaiso": (30.50853, -86.50273),
-    "valrico": (27.93789, -82.23644),
-    "vamo": (27.222, -82.49787),
-    "venice": (27.09978, -82.45426),
-    "venice_gardens": (27.07311, -82.4076),
-    "vero_beach": (27.63864, -80.39727),
-    "villages_of_oriole": (26.4623, -80.15282),
-    "villano_beach": (29.93858, -81.30202),
-    "vineyards": (26.22373, -81.72798),
-    "virginia_gardens": (25.81038, -80.30227),
-    "wabasso_beach": (27.76475, -80.39894),
-    "wahneta": (27.9528, -81.72702),
-    "wallace": (30.67741, -87.17997),
-    "warm_mineral_springs": (27.05978, -82.26009),
-    "warrington": (30.38409, -87.27497),
-    "washington_park": (26.13259, -80.18116),
-    "watertown": (30.19245, -82.61457),
-    "wauchula": (27.54726, -81.81147),
-    "wedgefield": (28.48778, -81.07729),
-    "weeki_wachee_gardens": (28.53361, -82.62954),
-    "wekiwa_springs": (28.69861, -81.42563),
-    "wellborn": (30.23106, -82.81957),
-    "wellington": (26.65868, -80.24144),
-    "wesley_chapel": (28.23973, -82.32787),
-    "west_bradenton": (27.50254, -82.61399),
-    "westchase": (28.05502, -82.60982),
-    "west_deland": (29.01582, -81.33312),
-    "west_gate": (26.70257, -80.0981),
-    "west_hollywood": (26.02065, -80.18394),
-    "west_little_river": (25.85704, -80.23699),
-    "west_melbourne": (28.07168, -80.65339),
-    "west_miami": (25.76343, -80.29616),
-    "west_palm_beach": (26.71534, -80.05337),
-    "west_park": (25.98454, -80.19894),
-    "west_pensacola": (30.42659, -87.27969),
-    "west_perrine": (25.60594, -80.36283),
-    "west_samoset": (27.46948, -82.55676),
-    "west_vero_corridor": (27.63775, -80.48576),
-    "west_and_east_lealman": (27.81993, -82.68944),
-    "westchester": (25.75482, -80.32727),
-    "weston": (26.10037, -80.39977),
-    "westview": (25.88204, -80.24199),
-    "westwood_lake": (25.72927, -80.37283),
-    "wewahitchka": (30.1127, -85.20047),
-    "whiskey_creek": (26.57258, -81.89009),
-    "white_city": (27.37393, -80.33394),
-    "whitfield": (27.41171, -82.56593),
-    "wildwood": (28.86542, -82.04058),
-    "williamsburg": (28.41445, -81.44285),
-    "williston": (29.38747, -82.44677),
-    "williston_highlands": (29.34052, -82.5415),
-    "willow_oak": (27.91614, -82.01786),
-    "wilton_manors": (26.16036, -80.13893),
-    "wimauma": (27.71253, -82.29898),
-    "windermere": (28.49556, -81.5348),
-    "winston": (28.03169, -82.01481),
-    "winter_beach": (27.7192, -80.42061),
-    "winter_garden": (28.56528, -81.58618),
-    "winter_haven": (28.02224, -81.73286),
-    "winter_park": (28.6, -81.33924),
-    "winter_springs": (28.69889, -81.30812),
-    "woodlawn_beach": (30.38825, -86.9908),
-    "woodville": (30.31409, -84.2474),
-    "wright": (30.45575, -86.63829),
-    "yalaha": (28.7386, -81.80869),
-    "youngstown": (30.36436, -85.43826),
-    "yulee": (30.6319, -81.60649),
-    "zellwood": (28.73111, -81.60118),
-    "zephyrhills": (28.23362, -82.18119),
-    "zolfo_springs": (27.49337, -81.79592),
-    "abbeville": (31.99212, -83.30682),
-    "acworth": (34.06635, -84.67837),
-    "adairsville": (34.3687, -84.93411),
-    "adel": (31.13727, -83.42408),
-    "alamo": (32.14712, -82.77792),
-    "albany": (31.57851, -84.15574),
-    "alpharetta": (34.07538, -84.29409),
-    "alto": (34.46732, -83.57378),
-    "americus": (32.07239, -84.23269),
-    "appling": (33.54608, -82.3173),
-    "aragon": (34.04565, -85.05606),
-    "arcade": (34.07789, -83.56155),
-    "arlington": (31.4399, -84.72492),
-    "ashburn": (31.70601, -83.65322),
-    "athens": (33.96095, -83.37794),
-    "atlanta": (33.749, -84.38798),
-    "auburn": (34.01372, -83.82768),
-    "austell": (33.81261, -84.63438),
-    "avondale_estates": (33.77149, -84.26714),
-    "bainbridge": (30.9038, -84.57547),
-    "ball_ground": (34.33815, -84.37659),
-    "barnesville": (33.05457, -84.15575),
-    "baxley": (31.77825, -82.34846),
-    "belvedere_park": (33.75483, -84.26742),
-    "berkeley_lake": (33.98371, -84.18658),
-    "blackshear": (31.30605, -82.24207),
-    "blairsville": (34.8762, -83.95824),
-    "blakely": (31.37768, -84.93409),
-    "bogart": (33.94928, -83.53461),
-    "bonanza": (33.46567, -84.33659),
-    "boston": (30.79186, -83.78989),
-    "bowdon": (33.53789, -85.25328),
-    "braselton": (34.10927, -83.76267),
-    "bremen": (33.72122, -85.1455),
-    "brookhaven": (33.85844, -84.3402),
-    "brooklet": (32.37963, -81.66317),
-    "broxton": (31.62519, -82.88681),
-    "brunswick": (31.14995, -81.49149),
-    "buchanan": (33.8026, -85.18856),
-    "buena_vista": (32.31904, -84.51714),
-    "buford": (34.12066, -84.00435),
-    "byron": (32.65376, -83.75963),
-    "cairo": (30.87751, -84.20214),
-    "calhoun": (34.50259, -84.95105),
-    "camilla": (31.23129, -84.21046),
-    "canton": (34.23676, -84.49076),
-    "carnesville": (34.36983, -83.23516),
-    "cartersville": (34.16533, -84.80231),
-    "cave_spring": (34.1076, -85.33634),
-    "cedartown": (34.01123, -85.25593),
-    "centerville": (32.63014, -83.68963),
-    "chamblee": (33.89205, -84.29881),
-    "chatsworth": (34.76591, -84.76994),
-    "chattanooga_valley": (34.93285, -85.35551),
-    "chester": (32.39378, -83.15293),
-    "chickamauga": (34.87119, -85.29079),
-    "clarkesville": (34.6126, -83.52489),
-    "clarkston": (33.80955, -84.23964),
-    "claxton": (32.16158, -81.904),
-    "cochran": (32.38683, -83.35461),
-    "college_park": (33.65344, -84.44937),
-    "colquitt": (31.17129, -84.73325),
-    "columbus": (32.46098, -84.98771),
-    "comer": (34.06372, -83.12543),
-    "commerce": (34.204, -83.45711),
-    "conley": (33.64483, -84.32576),
-    "conyers": (33.66761, -84.01769),
-    "cordele": (31.96351, -83.78239),
-    "cornelia": (34.51149, -83.52712),
-    "country_club_estates": (33.98928, -83.4096),
-    "covington": (33.59678, -83.86018),
-    "cumming": (34.20732, -84.14019),
-    "cusseta": (32.30543, -84.7727),
-    "cuthbert": (31.77127, -84.78937),
-    "dacula": (33.98872, -83.89796),
-    "dahlonega": (34.53259, -83.98491),
-    "dalton": (34.7698, -84.97022),
-    "dallas": (33.92371, -84.84077),
-    "danielsville": (34.12428, -83.22126),
-    "darien": (31.37023, -81.43399),
-    "davisboro": (32.97904, -82.60791),
-    "dawson": (31.77382, -84.448),
-    "dawsonville": (34.42121, -84.11908),
-    "deenwood": (31.22201, -82.38725),
-    "demorest": (34.5651, -83.54517),
-    "dock_junction": (31.20245, -81.51677),
-    "donalsonville": (31.04046, -84.87909),
-    "doraville": (33.89816, -84.28326),
-    "douglas": (31.50881, -82.84987),
-    "douglasville": (33.7515, -84.74771),
-    "druid_hills": (33.78038, -84.33604),
-    "dublin": (32.54044, -82.90375),
-    "duluth": (34.00288, -84.14464),
-    "dunwoody": (33.94621, -84.33465),
-    "east_dublin": (32.54822, -82.87181),
-    "east_griffin": (33.24373, -84.22881),
-    "east_point": (33.67955, -84.43937),
-    "east_newnan": (33.35067, -84.7766),
-    "eastman": (32.19767, -83.17765),
-    "eatonton": (33.3268, -83.3885),
-    "edison": (31.55823, -84.73825),
-    "elberton": (34.11159, -82.86863),
-    "ellaville": (32.23821, -84.30908),
-    "ellijay": (34.69481, -84.48215),
-    "emerson": (34.12704, -84.75549),
-    "enigma": (31.41297, -83.32905),
-    "euharlee": (34.14482, -84.933),
-    "evans": (33.53375, -82.13067),
-    "experiment": (33.26539, -84.28159),
-    "fair_oaks": (33.91649, -84.54465),
-    "fairburn": (33.56706, -84.58104),
-    "fairview": (34.94563, -85.2844),
-    "fitzgerald": (31.71491, -83.25265),
-    "flowery_branch": (34.1851, -83.92518),
-    "folkston": (30.83095, -82.01131),
-    "forest_park": (33.62205, -84.36909),
-    "forsyth": (33.0343, -83.93824),
-    "fort_gaines": (31.60924, -85.04933),
-    "fort_oglethorpe": (34.94896, -85.2569),
-    "fort_valley": (32.55376, -83.88741),
-    "franklin": (33.27762, -85.098),
-    "franklin_springs": (34.28483, -83.14432),
-    "garden_city": (32.11437, -81.154),
-    "glennville": (31.93659, -81.92845),
-    "gordon": (32.88209, -83.33238),
-    "grantville": (33.23484, -84.83577),
-    "gray": (33.00958, -83.53378),
-    "grayson": (33.89427, -83.95574),
-    "gresham_park": (33.70344, -84.31437),
-    "griffin": (33.24678, -84.26409),
-    "grovetown": (33.45042, -82.19818),
-    "gumlog": (34.49177, -83.09654),
-    "guyton": (32.3363, -81.3915),
-    "hahira": (30.99131, -83.37266),
-    "hannahs_mill": (32.93291, -84.34936),
-    "hapeville": (33.66011, -84.4102),
-    "hardwick": (33.0682, -83.22349),
-    "hartwell": (34.35288, -82.93209),
-    "hawkinsville": (32.28377, -83.47212),
-    "hazlehurst": (31.86963, -82.5943),
-    "hephzibah": (33.31403, -82.09679),
-    "hiawassee": (34.94926, -83.75739),
-    "hinesville": (31.84688, -81.59595),
-    "hiram": (33.87566, -84.76216),
-    "hogansville": (33.17318, -84.91494),
-    "holly_springs": (34.17399, -84.50132),
-    "homer": (34.33372, -83.49905),
-    "homerville": (31.0366, -82.74708),
-    "hoschton": (34.0965, -83.76128),
-    "indian_springs": (33.24262, -83.92074),
-    "irwinton": (32.81126, -83.17265),
-    "isle_of_hope": (31.98188, -81.06094),
-    "jefferson": (34.11705, -83.57239),
-    "jeffersonville": (32.68765, -83.34656),
-    "jesup": (31.60785, -81.88634),
-    "kennesaw": (34.02343, -84.61549),
-    "kingsland": (30.79996, -81.68983),
-    "knoxville": (32.72431, -83.99769),
-    "lagrange": (33.03929, -85.03133),
-    "lakeview": (34.97924, -85.25884),
-    "lakeview_estates": (33.70678, -84.03158),
-    "lavonia": (34.43594, -83.10682),
-    "lawrenceville": (33.95621, -83.98796),
-    "lexington": (33.86984, -83.11182),
-    "lilburn": (33.8901, -84.14297),
-    "lincolnton": (33.79235, -82.47902),
-    "lindale": (34.18676, -85.17467),
-    "lithia_springs": (33.794, -84.66049),
-    "lithonia": (33.71233, -84.10519),
-    "locust_grove": (33.34595, -84.10908),
-    "loganville": (33.839, -83.90074),
-    "lookout_mountain": (34.97758, -85.35774),
-    "louisville": (33.00154, -82.41124),
-    "lovejoy": (33.43622, -84.31437),
-    "ludowici": (31.70799, -81.74234),
-    "lula": (34.3876, -83.66629),
-    "lumber_city": (31.92935, -82.67958),
-    "lumpkin": (32.05099, -84.79909),
-    "lyons": (32.20435, -82.32179),
-    "mableton": (33.81872, -84.58243),
-    "macon": (32.84069, -83.6324),
-    "manchester": (32.85985, -84.61993),
-    "marietta": (33.9526, -84.54993),
-    "marshallville": (32.45626, -83.94019),
-    "martinez": (33.51736, -82.07567),
-    "maysville": (34.25288, -83.56155),
-    "mccaysville": (34.98619, -84.37131),
-    "mcdonough": (33.44734, -84.14686),
-    "mcrae": (32.06795, -82.9007),
-    "meigs": (31.07241, -84.08907),
-    "metter": (32.39712, -82.06012),
-    "milledgeville": (33.08014, -83.2321),
-    "millen": (32.80405, -81.94928),
-    "monroe": (33.79484, -83.71323),
-    "montezuma": (32.30516, -84.02741),
-    "morgan": (31.53767, -84.59936),
-    "morrow": (33.58317, -84.33937),
-    "mount_airy": (34.51871, -83.50073),
-    "moultrie": (31.17991, -83.78906),
-    "mount_zion": (33.63428, -85.18717),
-    "mountain_city": (34.91815, -83.38544),
-    "mountain_park": (33.84427, -84.12936),
-    "nahunta": (31.20439, -81.98123),
-    "nelson": (34.38204, -84.37103),
-    "newnan": (33.38067, -84.79966),
-    "nicholls": (31.51742, -82.63486),
-    "nicholson": (34.114, -83.43155),
-    "norcross": (33.94121, -84.21353),
-    "north_atlanta": (33.8651, -84.33659),
-    "north_decatur": (33.79038, -84.30603),
-    "north_druid_hills": (33.81677, -84.31326),
-    "oakwood": (34.2276, -83.88435),
-    "ocilla": (31.59447, -83.2513),
-    "oglethorpe": (32.29377, -84.06102),
-    "omega": (31.34102, -83.5935),
-    "panthersville": (33.70733, -84.27187),
-    "peachtree_city": (33.39678, -84.59576),
-    "peachtree_corners": (33.9701, -84.22159),
-    "pearson": (31.2977, -82.85237),
-    "pembroke": (32.13634, -81.62348),
-    "pine_mountain": (33.67594, -84.11492),
-    "pooler": (32.11548, -81.24706),
-    "port_wentworth": (32.14909, -81.16317),
-    "porterdale": (33.57511, -83.8938),
-    "powder_springs": (33.85955, -84.68382),
-    "preston": (32.06599, -84.53742),
-    "putney": (31.47018, -84.11768),
-    "quitman": (30.78492, -83.55988),
-    "raoul": (34.44954, -83.59434),
-    "ray_city": (31.07464, -83.19932),
-    "redan": (33.74538, -84.13158),
-    "reed_creek": (34.44594, -82.92487),
-    "reidsville": (32.08686, -82.1179),
-    "remerton": (30.84409, -83.31043),
-    "reynolds": (32.55987, -84.0963),
-    "richland": (32.08793, -84.66742),
-    "richmond_hill": (31.93827, -81.30344),
-    "rincon": (32.29603, -81.23539),
-    "ringgold": (34.91591, -85.10912),
-    "riverdale": (33.57261, -84.41326),
-    "rochelle": (31.95101, -83.45627),
-    "rockmart": (34.0026, -85.04161),
-    "rome": (34.25704, -85.16467),
-    "roswell": (34.02316, -84.36159),
-    "rossville": (34.98313, -85.28607),
-    "royston": (34.28705, -83.11015),
-    "russell": (33.97872, -83.70017),
-    "rydal": (34.33537, -84.71549),
-    "st_marys": (30.73051, -81.54649),
-    "saint_simon_mills": (31.17079, -81.40732),
-    "saint_simons_island": (31.15051, -81.36954),
-    "sandersville": (32.98154, -82.81014),
-    "sandy_springs": (33.92427, -84.37854),
-    "sardis": (32.79652, -84.63881),
-    "savannah": (32.08354, -81.09983),
-    "scottdale": (33.78983, -84.26409),
-    "senoia": (33.30234, -84.55382),
-    "shannon": (34.33676, -85.07134),
-    "skidaway_island": (31.93494, -81.04705),
-    "snellville": (33.85733, -84.01991),
-    "social_circle": (33.65623, -83.71823),
-    "soperton": (32.37712, -82.59236),
-    "sparks": (31.16686, -83.43738),
-    "sparta": (33.2757, -82.97626),
-    "statenville": (30.70327, -83.02764),
-    "statesboro": (32.44879, -81.78317),
-    "statham": (33.96511, -83.59655),
-    "stockbridge": (33.54428, -84.23381),
-    "stone_mountain": (33.80816, -84.1702),
-    "sugar_hill": (34.10649, -84.03352),
-    "summerville": (34.48064, -85.34773),
-    "sunnyside": (31.23938, -82.34207),
-    "suwanee": (34.05149, -84.0713),
-    "swainsboro": (32.59739, -82.33374),
-    "sylvester": (31.53092, -83.83693),
-    "talbotton": (32.67764, -84.53937),
-    "tallapoosa": (33.74455, -85.28801),
-    "temple": (33.73705, -85.03244),
-    "tennille": (32.93599, -82.81153),
-    "thomaston": (32.88819, -84.32659),
-    "thomson": (33.47069, -82.50457),
-    "thunderbolt": (32.03354, -81.04983),
-    "tifton": (31.45046, -83.5085),
-    "toccoa": (34.57732, -83.33239),
-    "trion": (34.54397, -85.31051),
-    "tucker": (33.85455, -84.21714),
-    "twin_city": (32.58294, -82.15512),
-    "tybee_island": (32.00022, -80.84567),
-    "tyrone": (33.47123, -84.59715),
-    "unadilla": (32.26155, -83.73657),
-    "union_city": (33.58706, -84.54243),
-    "union_point": (33.61568, -83.0746),
-    "unionville": (31.43491, -83.50961),
-    "valdosta": (30.83334, -83.28032),
-    "varnell": (34.90119, -84.97383),
-    "vidalia": (32.21769, -82.41346),
-    "vienna": (32.09156, -83.79545),
-    "villa_rica": (33.73205, -84.91911),
-    "vinings": (33.86483, -84.46437),
-    "wadley": (32.86682, -82.40402),
-    "walnut_grove": (33.74261, -83.8524),
-    "walthourville": (31.7741, -81.63261),
-    "warner_robins": (32.61574, -83.62664),
-    "warrenton": (33.40708, -82.66208),
-    "washington": (33.73679, -82.73931),
-    "watkinsville": (33.8629, -83.40877),
-    "waycross": (31.21368, -82.3557),
-    "waynesboro": (33.08987, -82.01567),
-    "west_point": (32.87791, -85.18327),
-    "whitemarsh_island": (32.02882, -81.01678),
-    "willacoochee": (31.34076, -83.04598),
-    "wilmington_island": (32.00355, -80.97372),
-    "winder": (33.99261, -83.72017),
-    "winterville": (33.96706, -83.27821),
-    "woodbine": (30.96396, -81.72416),
-    "wrens": (33.20765, -82.39179),
-    "young_harris": (34.93315, -83.84712),
-    "zebulon": (33.10235, -84.3427),
-    "albers": (38.54338, -89.61231),
-    "albion": (38.37755, -88.05615),
-    "alorton": (38.58977, -90.12011),
-    "altamont": (39.06199, -88.74811),
-    "alton": (38.8906, -90.18428),
-    "anna": (37.46033, -89.24703),
-    "arcola": (39.68476, -88.30644),
-    "arthur": (39.71476, -88.47228),
-    "ashland": (39.88783, -90.00789),
-    "assumption": (39.52032, -89.04897),
-    "atwood": (39.79948, -88.46228),
-    "aviston": (38.60672, -89.60759),
-    "barry": (39.69421, -91.03902),
-    "beckemeyer": (38.6056, -89.43592),
-    "bement": (39.92198, -88.57201),
-    "benld": (39.09282, -89.80398),
-    "bethalto": (38.90921, -90.04066),
-    "bethany": (39.64559, -88.73813),
-    "belleville": (38.52005, -89.98399),
-    "blue_mound": (39.70115, -89.12314),
-    "breese": (38.6106, -89.52703),
-    "bunker_hill": (39.04282, -89.95177),
-    "cahokia": (38.57088, -90.19011),
-    "cambria": (37.78144, -89.11925),
-    "carbondale": (37.72727, -89.21675),
-    "carlinville": (39.27977, -89.88177),
-    "carlyle": (38.61033, -89.37258),
-    "carmi": (38.09088, -88.15865),
-    "carrier_mills": (37.68422, -88.63283),
-    "carterville": (37.76005, -89.0773),
-    "casey": (39.2992, -87.99253),
-    "caseyville": (38.63672, -90.02566),
-    "central_city": (38.54894, -89.12701),
-    "centralia": (38.52505, -89.1334),
-    "cerro_gordo": (39.89059, -88.72813),
-    "chatham": (39.67616, -89.70454),
-    "chrisman": (39.80365, -87.67364),
-    "christopher": (37.97255, -89.05341),
-    "cobden": (37.53144, -89.25342),
-    "columbia": (38.44366, -90.20122),
-    "crainville": (37.75199, -89.06785),
-    "de_soto": (37.81755, -89.22786),
-    "divernon": (39.56561, -89.65732),
-    "du_quoin": (38.01144, -89.23619),
-    "dupo": (38.51616, -90.21039),
-    "east_alton": (38.88033, -90.11122),
-    "east_saint_louis": (38.6245, -90.15094),
-    "edinburg": (39.65727, -89.38953),
-    "edwardsville": (38.81144, -89.95316),
-    "effingham": (39.12004, -88.54338),
-    "eldorado": (37.81366, -88.4381),
-    "elizabethtown": (37.44588, -88.30504),
-    "energy": (37.77394, -89.02646),
-    "fairmont_city": (38.64977, -90.09316),
-    "fairview_heights": (38.58894, -89.99038),
-    "flora": (38.66894, -88.4856),
-    "freeburg": (38.42755, -89.91371),
-    "germantown": (38.55366, -89.53842),
-    "gillespie": (39.12977, -89.81954),
-    "glen_carbon": (38.74838, -89.98316),
-    "girard": (39.44644, -89.78093),
-    "godfrey": (38.9556, -90.18678),
-    "golconda": (37.36727, -88.48643),
-    "goreville": (37.5545, -88.97229),
-    "grandview": (39.81644, -89.61871),
-    "granite_city": (38.70144, -90.14872),
-    "grayville": (38.25755, -87.99364),
-    "greenfield": (39.34366, -90.21261),
-    "greenup": (39.24782, -88.16337),
-    "griggsville": (39.70894, -90.72457),
-    "hardin": (39.15671, -90.6179),
-    "harristown": (39.85393, -89.08397),
-    "herrin": (37.80311, -89.02757),
-    "hillsboro": (39.16128, -89.4954),
-    "holiday_shores": (38.92199, -89.94066),
-    "ina": (38.15116, -88.90396),
-    "jerome": (39.76755, -89.68066),
-    "jerseyville": (39.12005, -90.32845),
-    "johnston_city": (37.82061, -88.92757),
-    "kincaid": (39.58866, -89.41454),
-    "lebanon": (38.60394, -89.80732),
-    "leland_grove": (39.777, -89.67927),
-    "litchfield": (39.17533, -89.65426),
-    "long_creek": (39.81198, -88.84757),
-    "lovington": (39.71559, -88.63256),
-    "marissa": (38.25005, -89.7501),
-    "martinsville": (39.33559, -87.88198),
-    "maryville": (38.72366, -89.95593),
-    "mascoutah": (38.49033, -89.79315),
-    "mattoon": (39.48309, -88.37283),
-    "mcleansboro": (38.09338, -88.53561),
-    "meredosia": (39.83116, -90.55957),
-    "metropolis": (37.15117, -88.732),
-    "millstadt": (38.46144, -90.09178),
-    "mitchell": (38.76199, -90.08538),
-    "morrisonville": (39.42005, -89.45565),
-    "mound_city": (37.08533, -89.16257),
-    "mount_carmel": (38.41088, -87.76142),
-    "mount_sterling": (39.98727, -90.76346),
-    "moweaqua": (39.62476, -89.01897),
-    "murphysboro": (37.7645, -89.33509),
-    "neoga": (39.31948, -88.45283),
-    "new_athens": (38.32644, -89.87705),
-    "new_baden": (38.53505, -89.70065),
-    "new_berlin": (39.72533, -89.91066),
-    "norris_city": (37.98116, -88.32921),
-    "o_fallon": (38.59227, -89.91121),
-    "oblong": (39.00199, -87.90892),
-    "odin": (38.61727, -89.05229),
-    "okawville": (38.43422, -89.55037),
-    "olney": (38.73088, -88.08532),
-    "palestine": (39.00365, -87.6128),
-    "pana": (39.38893, -89.08008),
-    "pawnee": (39.59172, -89.58037),
-    "payson": (39.81699, -91.24237),
-    "pinckneyville": (38.08033, -89.38203),
-    "pittsfield": (39.60783, -90.80513),
-    "pontoon_beach": (38.73172, -90.08038),
-    "ramsey": (39.14449, -89.10868),
-    "red_bud": (38.21172, -89.99427),
-    "riverton": (39.84422, -89.53954),
-    "robinson": (39.00532, -87.73919),
-    "rochester": (39.74949, -89.53176),
-    "roodhouse": (39.48394, -90.37151),
-    "rosewood_heights": (38.88783, -90.08483),
-    "rosiclare": (37.42366, -88.34615),
-    "roxana": (38.84838, -90.07622),
-    "royalton": (37.87699, -89.11452),
-    "saint_elmo": (39.02727, -88.84811),
-    "saint_jacob": (38.71394, -89.76815),
-    "sandoval": (38.6156, -89.11423),
-    "sesser": (38.09172, -89.05035),
-    "shawneetown": (37.7131, -88.1867),
-    "shelbyville": (39.40643, -88.79007),
-    "sherman": (39.89366, -89.60482),
-    "shiloh": (38.56144, -89.89732),
-    "smithton": (38.40866, -89.99205),
-    "south_jacksonville": (39.70866, -90.22818),
-    "south_roxana": (38.82949, -90.06288),
-    "southern_view": (39.75727, -89.65371),
-    "staunton": (39.01227, -89.79121),
-    "steeleville": (38.00727, -89.65843),
-    "sullivan": (39.59948, -88.60784),
-    "sumner": (38.71699, -87.86142),
-    "swansea": (38.53394, -89.98899),
-    "taylorville": (39.54894, -89.29453),
-    "teutopolis": (39.1331, -88.47199),
-    "toledo": (39.27365, -88.24365),
-    "tolono": (39.98614, -88.25894),
-    "tuscola": (39.7992, -88.2831),
-    "upper_alton": (38.91144, -90.15066),
-    "valmeyer": (38.30561, -90.27651),
-    "vandalia": (38.9606, -89.09368),
-    "villa_grove": (39.86281, -88.16227),
-    "virden": (39.50089, -89.76787),
-    "virginia": (39.95116, -90.21234),
-    "wamac": (38.50894, -89.14063),
-    "warrensburg": (39.93282, -89.06203),
-    "waterloo": (38.33589, -90.14983),
-    "wayne_city": (38.34533, -88.58783),
-    "waverly": (39.59172, -89.95288),
-    "west_frankfort": (37.89783, -88.93146),
-    "williamsville": (39.95422, -89.54871),
-    "winchester": (39.62977, -90.45624),
-    "windsor": (39.44087, -88.59478),
-    "wood_river": (38.86116, -90.09761),
-    "worden": (38.93144, -89.83899),
-    "zeigler": (37.89949, -89.05202),
-    "avon": (39.76282, -86.39972),
-    "bargersville": (39.52088, -86.16777),
-    "bedford": (38.86116, -86.48721),
-    "beech_grove": (39.72199, -86.08998),
-    "bicknell": (38.77421, -87.30779),
-    "bloomfield": (39.02699, -86.93751),
-    "bloomington": (39.16533, -86.52639),
-    "boonville": (38.04921, -87.27417),
-    "brazil": (39.52365, -87.12502),
-    "bright": (39.21839, -84.85606),
-    "broad_ripple": (39.86671, -86.14165),
-    "brooklyn": (39.53921, -86.36916),
-    "brookville": (39.42311, -85.01274),
-    "brownsburg": (39.84338, -86.39777),
-    "brownstown": (38.87894, -86.04192),
-    "cambridge_city": (39.81255, -85.17163),
-    "cannelton": (37.91144, -86.74443),
-    "carmel": (39.97837, -86.11804),
-    "cayuga": (39.94865, -87.45974),
-    "chandler": (38.04171, -87.36806),
-    "charlestown": (38.45312, -85.67024),
-    "cloverdale": (39.51477, -86.7939),
-    "connersville": (39.64116, -85.14107),
-    "corydon": (38.21201, -86.12192),
-    "country_squire_lakes": (39.03478, -85.69858),
-    "crothersville": (38.80061, -85.84164),
-    "cumberland": (39.77615, -85.9572),
-    "dale": (38.16894, -86.99),
-    "darmstadt": (38.09921, -87.57891),
-    "dillsboro": (39.01783, -85.05884),
-    "edinburgh": (39.35422, -85.96666),
-    "ellettsville": (39.23393, -86.625),
-    "english": (38.3345, -86.46415),
-    "evansville": (37.97476, -87.55585),
-    "fairview_park": (39.68031, -87.41752),
-    "farmersburg": (39.24865, -87.38196),
-    "ferdinand": (38.22394, -86.86222),
-    "fishers": (39.95559, -86.01387),
-    "fort_branch": (38.25116, -87.58113),
-    "fortville": (39.93226, -85.84804),
-    "french_lick": (38.54894, -86.61999),
-    "galena": (38.35173, -85.94164),
-    "greencastle": (39.64449, -86.86473),
-    "greendale": (39.11256, -84.86412),
-    "greensburg": (39.33727, -85.48358),
-    "hagerstown": (39.91116, -85.16163),
-    "hanover": (38.71423, -85.47357),
-    "haubstadt": (38.20504, -87.57419),
-    "henryville": (38.54173, -85.76774),
-    "hidden_valley": (39.16228, -84.84301),
-    "huntingburg": (38.29894, -86.955),
-    "indianapolis": (39.76838, -86.15804),
-    "ingalls": (39.95699, -85.80526),
-    "jasonville": (39.1631, -87.19918),
-    "knightstown": (39.7956, -85.52636),
-    "lawrence": (39.83865, -86.02526),
-    "lawrenceburg": (39.09089, -84.84995),
-    "liberty": (39.6356, -84.93107),
-    "linton": (39.03477, -87.16585),
-    "loogootee": (38.67699, -86.91417),
-    "mccordsville": (39.9081, -85.92276),
-    "melody_hill": (38.02615, -87.51585),
-    "meridian_hills": (39.89004, -86.15721),
-    "middlebury": (39.26421, -87.1189),
-    "milan": (39.12117, -85.13135),
-    "monrovia": (39.57894, -86.48222),
-    "mooresville": (39.61282, -86.37416),
-    "morristown": (39.67338, -85.69859),
-    "new_albany": (38.28562, -85.82413),
-    "new_palestine": (39.72199, -85.88915),
-    "new_whiteland": (39.5581, -86.09526),
-    "newburgh": (37.94449, -87.40529),
-    "north_madison": (38.76784, -85.39663),
-    "north_terre_haute": (39.52781, -87.3603),
-    "north_vernon": (39.00617, -85.62358),
-    "oak_park": (38.30562, -85.69635),
-    "oakland_city": (38.33866, -87.34501),
-    "odon": (38.84283, -86.9914),
-    "oolitic": (38.90088, -86.52527),
-    "orleans": (38.66172, -86.45166),
-    "osgood": (39.12922, -85.29163),
-    "owensville": (38.27199, -87.6878),
-    "paoli": (38.55617, -86.46832),
-    "pendleton": (39.99754, -85.74664),
-    "petersburg": (38.49199, -87.27862),
-    "pittsboro": (39.86393, -86.46694),
-    "plainfield": (39.70421, -86.39944),
-    "poseyville": (38.17004, -87.78308),
-    "princes_lakes": (39.35366, -86.09805),
-    "richmond": (39.82894, -84.89024),
-    "rising_sun": (38.9495, -84.85384),
-    "rockport": (39.88087, -87.2789),
-    "rockville": (39.76254, -87.22918),
-    "rushville": (39.60921, -85.44636),
-    "saint_paul": (39.4281, -85.62831),
-    "santa_claus": (38.12005, -86.91416),
-    "scottsburg": (38.68561, -85.77025),
-    "seelyville": (39.49198, -87.26724),
-    "sellersburg": (38.39812, -85.75496),
-    "seymour": (38.95922, -85.89025),
-    "shelburn": (39.17837, -87.39363),
-    "shoals": (38.66644, -86.79111),
-    "southport": (39.66505, -86.12776),
-    "speedway": (39.80227, -86.26721),
-    "spencer": (39.28671, -86.76251),
-    "sunman": (39.237, -85.09468),
-    "tell_city": (37.95144, -86.76777),
-    "terre_haute": (39.4667, -87.41391),
-    "trafalgar": (39.41616, -86.15082),
-    "versailles": (39.072, -85.2519),
-    "vevay": (38.74784, -85.06717),
-    "vincennes": (38.67727, -87.52863),
-    "warren_park": (39.78199, -86.05026),
-    "west_terre_haute": (39.46504, -87.45002),
-    "westport": (39.17589, -85.57303),
-    "whiteland": (39.55005, -86.07971),
-    "whitestown": (39.99726, -86.34583),
-    "worthington": (39.12504, -86.97945),
-    "zionsville": (39.95087, -86.26194),
-    "abilene": (38.91722, -97.21391),
-    "anthony": (37.15336, -98.03117),
-    "arma": (37.54394, -94.70024),
-    "atchison": (39.56305, -95.12164),
-    "baldwin_city": (38.77501, -95.18636),
-    "basehor": (39.14167, -94.93858),
-    "baxter_springs": (37.02368, -94.7355),
-    "bellaire": (37.76251, -97.26699),
-    "belle_plaine": (37.39391, -97.28115),
-    "beloit": (39.45612, -98.10616),
-    "bonner_springs": (39.05973, -94.88358),
-    "buhler": (38.13445, -97.77005),
-    "burlington": (38.19447, -95.74276),
-    "caldwell": (37.03225, -97.60699),
-    "caney": (37.01146, -95.93526),
-    "chanute": (37.67921, -95.4572),
-    "chapman": (38.97222, -97.02251),
-    "cheney": (37.63001, -97.78255),
-    "cherryvale": (37.27034, -95.55248),
-    "chetopa": (37.03729, -95.08996),
-    "clay_center": (37.51946, -96.77114),
-    "coffeyville": (37.0373, -95.61637),
-    "coldwater": (37.26891, -99.32678),
-    "colwich": (37.77918, -97.53644),
-    "concordia": (39.57084, -97.66254),
-    "conway_springs": (37.3903, -97.64227),
-    "cottonwood_falls": (38.37224, -96.54278),
-    "council_grove": (38.66112, -96.49195),
-    "derby": (37.54557, -97.26893),
-    "douglass": (37.51946, -97.01281),
-    "edgerton": (38.76473, -95.00802),
-    "ellinwood": (38.35557, -98.58091),
-    "ellis": (38.93807, -99.56067),
-    "ellsworth": (38.73056, -98.22811),
-    "elwood": (39.75555, -94.87247),
-    "emporia": (38.4039, -96.18166),
-    "erie": (37.56811, -95.24331),
-    "eureka": (37.82392, -96.28917),
-    "fairway": (39.02223, -94.6319),
-    "fort_scott": (37.83976, -94.7083),
-    "fredonia": (37.53394, -95.82665),
-    "frontenac": (37.4556, -94.68913),
-    "gardner": (38.81084, -94.92719),
-    "garnett": (38.28058, -95.24192),
-    "goddard": (37.65974, -97.57533),
-    "grandview_plaza": (39.02916, -96.78917),
-    "great_bend": (38.36446, -98.76481),
-    "halstead": (38.0014, -97.50865),
-    "harper": (37.28669, -98.02589),
-    "haven": (37.8989, -97.78283),
-    "hays": (38.87918, -99.32677),
-    "haysville": (37.56446, -97.35227),
-    "herington": (38.67112, -96.94251),
-    "hesston": (38.13834, -97.43143),
-    "hiawatha": (39.8525, -95.53582),
-    "hill_city": (39.36473, -99.84206),
-    "hoisington": (38.51807, -98.77814),
-    "holton": (39.46527, -95.73637),
-    "horton": (39.66056, -95.52637),
-    "howard": (37.47031, -96.26361),
-    "humboldt": (37.8106, -95.43693),
-    "hutchinson": (38.06084, -97.92977),
-    "independence": (37.22424, -95.70831),
-    "inman": (38.23195, -97.77338),
-    "iola": (37.92448, -95.39998),
-    "jetmore": (38.08446, -99.89346),
-    "junction_city": (39.02861, -96.8314),
-    "kansas_city": (39.11417, -94.62746),
-    "kechi": (37.79585, -97.27949),
-    "kingman": (37.64585, -98.11367),
-    "kinsley": (37.92307, -99.40984),
-    "kiowa": (37.01725, -98.48535),
-    "la_crosse": (38.5314, -99.30872),
-    "la_cygne": (38.35002, -94.76135),
-    "lansing": (39.24861, -94.90024),
-    "larned": (38.18057, -99.09871),
-    "leavenworth": (39.31111, -94.92246),
-    "leawood": (38.96667, -94.6169),
-    "lenexa": (38.95362, -94.73357),
-    "lindsborg": (38.57362, -97.67448),
-    "louisburg": (38.61946, -94.68079),
-    "lyndon": (38.61001, -95.68443),
-    "maize": (37.77918, -97.46727),
-    "manhattan": (39.18361, -96.57167),
-    "mankato": (39.78723, -98.21005),
-    "marysville": (39.84111, -96.64724),
-    "mcpherson": (38.37084, -97.66421),
-    "medicine_lodge": (37.28113, -98.58036),
-    "merriam": (39.02362, -94.69357),
-    "minneapolis": (39.12194, -97.7067),
-    "mission": (39.02778, -94.65579),
-    "mission_hills": (39.01778, -94.6169),
-    "moundridge": (38.20307, -97.51921),
-    "mulvane": (37.47446, -97.24393),
-    "neodesha": (37.41839, -95.68026),
-    "ness_city": (38.45279, -99.90651),
-    "nickerson": (38.14723, -98.08367),
-    "north_newton": (38.07223, -97.34559),
-    "norton": (39.83389, -99.89151),
-    "ogden": (39.11111, -96.70612),
-    "olathe": (38.8814, -94.81913),
-    "osage_city": (38.6339, -95.82582),
-    "osawatomie": (38.49724, -94.95052),
-    "osborne": (39.43914, -98.69624),
-    "oskaloosa": (39.21528, -95.31275),
-    "oswego": (37.16757, -95.10996),
-    "ottawa": (38.61557, -95.26775),
-    "overbrook": (38.78056, -95.5572),
-    "overland_park": (38.98223, -94.67079),
-    "paola": (38.57224, -94.87913),
-    "park_city": (37.80001, -97.31838),
-    "parsons": (37.34034, -95.26108),
-    "peabody": (38.16946, -97.1067),
-    "phillipsburg": (39.75612, -99.32399),
-    "pittsburg": (37.41088, -94.70496),
-    "plainville": (39.23473, -99.29816),
-    "pleasanton": (38.17781, -94.71135),
-    "prairie_village": (38.99167, -94.63357),
-    "pratt": (37.64391, -98.73759),
-    "roeland_park": (39.03751, -94.63218),
-    "rose_hill": (37.55835, -97.13504),
-    "sabetha": (39.90222, -95.80082),
-    "saint_john": (38.00224, -98.76009),
-    "saint_marys": (39.19416, -96.0711),
-    "salina": (38.84028, -97.61142),
-    "sedan": (37.12672, -96.18694),
-    "sedgwick": (37.91668, -97.42254),
-    "seneca": (39.83416, -96.06417),
-    "shawnee": (39.04167, -94.72024),
-    "smith_center": (39.77918, -98.78507),
-    "solomon": (38.91944, -97.37114),
-    "south_hutchinson": (38.02807, -97.94033),
-    "sterling": (38.21001, -98.20701),
-    "tonganoxie": (39.10972, -95.08775),
-    "towanda": (37.79752, -96.99976),
-    "topeka": (39.04833, -95.67804),
-    "valley_center": (37.83473, -97.37338),
-    "valley_falls": (39.34333, -95.46025),
-    "victoria": (38.85279, -99.1476),
-    "wakeeney": (39.02501, -99.87957),
-    "wamego": (39.20194, -96.305),
-    "wathena": (39.75916, -94.94969),
-    "wellsville": (38.71834, -95.08164),
-    "westmoreland": (39.39389, -96.41361),
-    "westwood": (39.04056, -94.6169),
-    "wichita": (37.69224, -97.33754),
-    "yates_center": (37.88115, -95.73332),
-    "alexandria": (38.95951, -84.38799),
-    "anchorage": (38.26674, -85.53302),
-    "annville": (37.31925, -83.97048),
-    "audubon_park": (38.20396, -85.72524),
-    "barbourmeade": (38.29729, -85.60329),
-    "barbourville": (36.86648, -83.88881),
-    "bardstown": (37.80923, -85.4669),
-    "bardwell": (36.87061, -89.00979),
-    "beattyville": (37.57175, -83.70686),
-    "beaver_dam": (37.40199, -86.87583),
-    "beechwood_village": (38.25479, -85.63135),
-    "bellevue": (39.10645, -84.47883),
-    "berea": (37.56869, -84.29632),
-    "brandenburg": (37.99896, -86.16941),
-    "breckinridge_center": (37.68282, -87.86308),
-    "brodhead": (37.40425, -84.41383),
-    "brooks": (38.06118, -85.70968),
-    "buckner": (38.38368, -85.43996),
-    "buechel": (38.19507, -85.6519),
-    "burkesville": (36.79034, -85.37052),
-    "cadiz": (36.86505, -87.8353),
-    "calvert_city": (37.03339, -88.35004),
-    "camargo": (37.99425, -83.8877),
-    "campbellsville": (37.3434, -85.34191),
-    "campton": (37.73425, -83.54741),
-    "catlettsburg": (38.4048, -82.60044),
-    "claryville": (38.91923, -84.39549),
-    "clay_city": (37.85925, -83.91853),
-    "cloverport": (37.83339, -86.63276),
-    "coal_run_village": (37.51316, -82.55849),
-    "cold_spring": (39.02173, -84.43994),
-    "coldstream": (38.31479, -85.52385),
-    "corbin": (36.9487, -84.09688),
-    "crescent_springs": (39.05145, -84.58161),
-    "crestview_hills": (39.02728, -84.58494),
-    "crestwood": (38.32424, -85.47246),
-    "crittenden": (38.78284, -84.60522),
-    "cynthiana": (38.39035, -84.2941),
-    "dawson_springs": (37.16727, -87.69251),
-    "dayton": (39.11284, -84.47272),
-    "dixon": (37.51782, -87.69029),
-    "douglass_hills": (38.23785, -85.55274),
-    "dry_ridge": (38.68201, -84.58994),
-    "earlington": (37.27421, -87.51194),
-    "eddyville": (37.0945, -88.0803),
-    "edmonton": (36.98006, -85.61219),
-    "elk_creek": (38.10034, -85.37107),
-    "elkfork": (37.96481, -83.13295),
-    "elkton": (36.81004, -87.15417),
-    "eminence": (38.37007, -85.18051),
-    "erlanger": (39.01673, -84.60078),
-    "fairdale": (38.10507, -85.75885),
-    "falmouth": (38.67674, -84.33021),
-    "fern_creek": (38.15979, -85.58774),
-    "flatwoods": (38.52258, -82.71711),
-    "flemingsburg": (38.4223, -83.73381),
-    "fort_mitchell": (39.0595, -84.54744),
-    "fort_thomas": (39.07506, -84.44716),
-    "fort_wright": (39.05173, -84.53411),
-    "francisville": (39.10506, -84.72439),
-    "frankfort": (38.20091, -84.87328),
-    "frenchburg": (37.95092, -83.62575),
-    "fulton": (36.50423, -88.87423),
-    "graymoor_devondale": (38.27313, -85.62302),
-    "guthrie": (36.64838, -87.16639),
-    "hardinsburg": (37.78006, -86.46053),
-    "harlan": (36.84314, -83.32185),
-    "harrodsburg": (37.7623, -84.84329),
-    "hawesville": (37.90006, -86.75499),
-    "hazard": (37.24954, -83.19323),
-    "hebron": (39.06589, -84.70106),
-    "hebron_estates": (38.04951, -85.66607),
-    "hendron": (37.0395, -88.62922),
-    "hickman": (36.57117, -89.18618),
-    "highland_heights": (39.03312, -84.45189),
-    "highview": (38.14285, -85.62413),
-    "hillview": (38.06979, -85.68551),
-    "hindman": (37.33593, -82.98044),
-    "hodgenville": (37.57395, -85.73996),
-    "hopkinsville": (36.86561, -87.49117),
-    "horse_cave": (37.1795, -85.90692),
-    "hurstbourne_acres": (38.22118, -85.58913),
-    "hurstbourne": (38.23813, -85.58829),
-    "hyden": (37.16093, -83.37324),
-    "indian_hills": (38.27257, -85.66274),
-    "indian_hills_cherokee_section": (38.27951, -85.64996),
-    "inez": (37.86648, -82.53876),
-    "ironville": (38.45647, -82.69238),
-    "irvine": (37.70064, -83.97381),
-    "irvington": (37.88034, -86.28386),
-    "jamestown": (36.98479, -85.06301),
-    "jeffersontown": (38.19424, -85.5644),
-    "jenkins": (37.17344, -82.63099),
-    "knottsville": (37.77172, -86.90416),
-    "la_center": (37.07672, -88.97368),
-    "la_grange": (38.40757, -85.37885),
-    "lakeside_park": (39.03562, -84.56911),
-    "lancaster": (37.61952, -84.578),
-    "lebanon_junction": (37.83451, -85.7319),
-    "ledbetter": (37.04756, -88.47699),
-    "leitchfield": (37.48005, -86.29386),
-    "lewisport": (37.937, -86.90221),
-    "lexington_fayette": (38.0498, -84.45855),
-    "livermore": (37.4931, -87.13194),
-    "louisa": (38.11425, -82.60321),
-    "ludlow": (39.09256, -84.54744),
-    "madisonville": (37.3281, -87.49889),
-    "masonville": (37.67505, -87.03472),
-    "massac": (37.01672, -88.73061),
-    "mayfield": (36.74172, -88.63672),
-    "mckee": (37.43036, -83.99798),
-    "meads": (38.41258, -82.70905),
-    "middlesboro": (36.60842, -83.71658),
-    "heritage_creek": (38.12368, -85.71968),
-    "morehead": (38.18397, -83.43268),
-    "morganfield": (37.68338, -87.91669),
-    "morgantown": (37.2256, -86.6836),
-    "mount_olivet": (38.53146, -84.03687),
-    "mount_washington": (38.05006, -85.54579),
-    "munfordville": (37.27228, -85.89108),
-    "murray": (36.61033, -88.31476),
-    "newburg": (38.16007, -85.65968),
-    "nicholasville": (37.88063, -84.573),
-    "north_corbin": (36.96064, -84.09326),
-    "northfield": (38.28701, -85.64107),
-    "nortonville": (37.19088, -87.45278),
-    "oak_grove": (36.66505, -87.44279),
-    "oakbrook": (38.99978, -84.68522),
-    "okolona": (38.14118, -85.68774),
-    "olive_hill": (38.30008, -83.17407),
-    "orchard_grass_hills": (38.32368, -85.52135),
-    "owensboro": (37.77422, -87.11333),
-    "owenton": (38.53672, -84.84338),
-    "owingsville": (38.1448, -83.76408),
-    "paintsville": (37.81454, -82.80711),
-    "park_hills": (39.07145, -84.53217),
-    "pewee_valley": (38.31062, -85.48746),
-    "pikeville": (37.47927, -82.51876),
-    "pine_knot": (36.65091, -84.43855),
-    "pineville": (36.76203, -83.69492),
-    "pioneer_village": (38.06062, -85.67774),
-    "plano": (36.88032, -86.41832),
-    "pleasure_ridge_park": (38.14535, -85.8583),
-    "prestonsburg": (37.66565, -82.77155),
-    "prospect": (38.34507, -85.61552),
-    "providence": (38.57451, -85.22107),
-    "raceland": (38.54008, -82.7285),
-    "radcliff": (37.84035, -85.94913),
-    "reidland": (37.01756, -88.53143),
-    "russell_springs": (37.05618, -85.08857),
-    "ryland_heights": (38.95756, -84.463),
-    "saint_matthews": (38.25285, -85.65579),
-    "saint_regis_park": (38.22674, -85.61663),
-    "salyersville": (37.75259, -83.06878),
-    "sandy_hook": (38.08647, -83.12628),
-    "scottsville": (36.75338, -86.19054),
-    "sebree": (37.60699, -87.52862),
-    "shepherdsville": (37.9884, -85.71579),
-    "shively": (38.20007, -85.82274),
-    "silver_grove": (39.03451, -84.39022),
-    "simpsonville": (38.22257, -85.35523),
-    "smithland": (37.13894, -88.40337),
-    "somerset": (37.09202, -84.60411),
-    "south_shore": (38.72091, -82.95823),
-    "saint_dennis": (38.1884, -85.8458),
-    "stanford": (37.53119, -84.66189),
-    "stanton": (37.84564, -83.85825),
-    "stearns": (36.69897, -84.47744),
-    "sturgis": (37.54671, -87.98391),
-    "taylor_mill": (38.99756, -84.49633),
-    "taylorsville": (38.03173, -85.34245),
-    "tompkinsville": (36.70228, -85.69164),
-    "union": (38.9459, -84.6805),
-    "van_lear": (37.77121, -82.75794),
-    "valley_station": (38.11118, -85.87024),
-    "vanceburg": (38.59924, -83.3188),
-    "verona": (38.8184, -84.66078),
-    "villa_hills": (39.06339, -84.593),
-    "vine_grove": (37.81007, -85.98135),
-    "walton": (38.87562, -84.61022),
-    "warsaw": (38.7834, -84.90162),
-    "watterson_park": (38.19229, -85.68329),
-    "west_buechel": (38.19701, -85.66329),
-    "west_liberty": (37.92148, -83.25962),
-    "whitesburg": (37.11843, -82.82683),
-    "whitley_city": (36.72341, -84.47049),
-    "wickliffe": (36.96478, -89.08923),
-    "wilder": (39.05645, -84.48689),
-    "williamstown": (38.63812, -84.5605),
-    "wilmore": (37.86202, -84.66161),
-    "windy_hills": (38.27396, -85.63441),
-    "worthington_hills": (38.30896, -85.5269),
-    "wurtland": (38.55036, -82.77794),
-    "abita_springs": (30.47864, -90.04008),
-    "addis": (30.3538, -91.26539),
-    "ama": (29.95215, -90.29647),
-    "amelia": (29.66632, -91.10204),
-    "amite": (30.72657, -90.50898),
-    "arabi": (29.95437, -90.00535),
-    "arnaudville": (30.3977, -91.93151),
-    "avondale": (29.91298, -90.20369),
-    "baker": (30.58824, -91.16816),
-    "ball": (31.41546, -92.4118),
-    "banks_springs": (32.0821, -92.09291),
-    "barataria": (29.72327, -90.12369),
-    "basile": (30.4852, -92.59597),
-    "bastrop": (32.77828, -91.91144),
-    "baton_rouge": (30.45075, -91.15455),
-    "bawcomville": (32.47042, -92.16736),
-    "bayou_cane": (29.6241, -90.7512),
-    "bayou_gauche": (29.78743, -90.41314),
-    "bayou_vista": (29.68965, -91.27094),
-    "belle_chasse": (29.85493, -89.99063),
-    "belle_rose": (30.05048, -91.04149),
-    "bernice": (32.82209, -92.65793),
-    "berwick": (29.69465, -91.21899),
-    "blanchard": (32.58098, -93.89268),
-    "bogalusa": (30.79102, -89.84869),
-    "bossier_city": (32.51599, -93.73212),
-    "bourg": (29.55355, -90.60231),
-    "boutte": (29.90243, -90.38814),
-    "breaux_bridge": (30.27353, -91.89928),
-    "bridge_city": (29.93326, -90.17007),
-    "broussard": (30.14715, -91.96123),
-    "brownsfield": (30.54658, -91.12066),
-    "brusly": (30.39436, -91.25372),
-    "bunkie": (30.95325, -92.18263),
-    "cade": (30.08742, -91.9054),
-    "cameron": (29.79772, -93.32515),
-    "campti": (31.8935, -93.11822),
-    "carencro": (30.31714, -92.04901),
-    "carlyss": (30.16882, -93.37599),
-    "carville": (30.21742, -91.09621),
-    "catahoula": (30.21464, -91.709),
-    "cecilia": (30.33714, -91.85317),
-    "central": (30.55435, -91.03677),
-    "chackbay": (29.88354, -90.79732),
-    "chalmette": (29.94296, -89.96537),
-    "charenton": (29.88159, -91.52511),
-    "chauvin": (29.43855, -90.59537),
-    "church_point": (30.40298, -92.21513),
-    "claiborne": (32.51598, -92.1918),
-    "clarks": (32.02655, -92.13903),
-    "colfax": (31.51906, -92.70682),
-    "convent": (30.02076, -90.82982),
-    "cottonport": (30.98408, -92.05346),
-    "coushatta": (32.01488, -93.34212),
-    "crowley": (30.21409, -92.37458),
-    "cullen": (32.96903, -93.45073),
-    "cut_off": (29.54272, -90.33814),
-    "dequincy": (30.45048, -93.43322),
-    "deridder": (30.84631, -93.28905),
-    "delcambre": (29.94826, -91.98873),
-    "delhi": (32.45764, -91.49317),
-    "denham_springs": (30.4874, -90.95753),
-    "des_allemands": (29.82382, -90.47508),
-    "destrehan": (29.94322, -90.35345),
-    "deville": (31.3574, -92.16541),
-    "donaldsonville": (30.10103, -90.99288),
-    "dulac": (29.38883, -90.71398),
-    "duson": (30.23576, -92.1854),
-    "eastwood": (32.55626, -93.56712),
-    "eden_isle": (30.22853, -89.79867),
-    "edgard": (30.04326, -90.56009),
-    "elmwood": (29.95659, -90.1898),
-    "elton": (30.48131, -92.6957),
-    "erath": (29.95826, -92.03596),
-    "erwinville": (30.53102, -91.40789),
-    "estelle": (29.84576, -90.10674),
-    "eunice": (30.49437, -92.41763),
-    "farmerville": (32.77347, -92.4057),
-    "ferriday": (31.63017, -91.55456),
-    "franklinton": (30.84731, -90.15527),
-    "french_settlement": (30.29599, -90.7963),
-    "galliano": (29.44216, -90.29925),
-    "gardere": (30.34575, -91.14011),
-    "garyville": (30.05604, -90.61926),
-    "glenmora": (30.97658, -92.58514),
-    "golden_meadow": (29.37911, -90.26008),
-    "gonzales": (30.23853, -90.9201),
-    "grambling": (32.52765, -92.71404),
-    "gramercy": (30.04742, -90.68981),
-    "grand_isle": (29.23662, -89.98729),
-    "grand_point": (30.06131, -90.75343),
-    "gueydan": (30.02604, -92.50847),
-    "hackberry": (29.99605, -93.3421),
-    "hahnville": (29.97659, -90.40897),
-    "hammond": (30.50463, -90.46293),
-    "harahan": (29.94048, -90.20313),
-    "harrisonburg": (31.77211, -91.82152),
-    "harvey": (29.90354, -90.07729),
-    "haughton": (32.53265, -93.50406),
-    "haynesville": (32.96208, -93.14016),
-    "houma": (29.59577, -90.71953),
-    "inniswold": (30.40491, -91.08344),
-    "iota": (30.33131, -92.49569),
-    "iowa": (30.23687, -93.01376),
-    "jean_lafitte": (29.73604, -90.12674),
-    "jeanerette": (29.91104, -91.66345),
-    "jena": (31.68323, -92.13374),
-    "jennings": (30.22243, -92.65708),
-    "jonesville": (31.62656, -91.81818),
-    "kaplan": (29.99798, -92.28485),
-    "kenner": (29.99409, -90.24174),
-    "kentwood": (30.93824, -90.50898),
-    "killian": (30.35881, -90.5862),
-    "kinder": (30.48548, -92.8507),
-    "krotz_springs": (30.53686, -91.75289),
-    "labadieville": (29.83743, -90.95621),
-    "lacombe": (30.31353, -89.94313),
-    "lake_arthur": (30.08076, -92.67153),
-    "lake_charles": (30.21309, -93.2044),
-    "lake_providence": (32.80499, -91.17098),
-    "lakeshore": (32.53514, -92.02958),
-    "laplace": (30.06698, -90.48147),
-    "larose": (29.57244, -90.38175),
-    "lawtell": (30.51853, -92.18485),
-    "lecompte": (31.09463, -92.40041),
-    "leesville": (31.14352, -93.261),
-    "leonville": (30.47047, -91.97845),
-    "livonia": (30.55908, -91.55594),
-    "lockport": (29.64605, -90.53925),
-    "lockport_heights": (29.65049, -90.54647),
-    "logansport": (31.97545, -93.99797),
-    "luling": (29.93215, -90.36647),
-    "lutcher": (30.04048, -90.69898),
-    "mamou": (30.63381, -92.4193),
-    "mandeville": (30.35825, -90.06563),
-    "mansura": (31.05797, -92.04901),
-    "many": (31.56878, -93.48406),
-    "maringouin": (30.4913, -91.51955),
-    "marksville": (31.12797, -92.06624),
-    "marrero": (29.89937, -90.10035),
-    "mathews": (29.68632, -90.54675),
-    "maurice": (30.10854, -92.12457),
-    "melville": (30.69297, -91.744),
-    "meraux": (29.93017, -89.91623),
-    "merrydale": (30.5013, -91.10844),
-    "merryville": (30.75437, -93.54045),
-    "metairie": (29.98409, -90.15285),
-    "metairie_terrace": (29.97854, -90.16396),
-    "minden": (32.61543, -93.28684),
-    "minorca": (31.57933, -91.48179),
-    "montegut": (30.07076, -90.50203),
-    "montz": (30.00687, -90.46869),
-    "morgan_city": (29.69937, -91.20677),
-    "moss_bluff": (30.3027, -93.19071),
-    "napoleonville": (29.94048, -91.02482),
-    "natalbany": (30.54622, -90.48619),
-    "natchitoches": (31.76072, -93.08627),
-    "new_iberia": (30.00354, -91.81873),
-    "new_llano": (31.11491, -93.27155),
-    "new_orleans": (29.95465, -90.07507),
-    "new_roads": (30.70157, -91.43622),
-    "new_sarpy": (29.97817, -90.38963),
-    "newellton": (32.07265, -91.24095),
-    "norco": (29.99909, -90.4123),
-    "north_vacherie": (29.99687, -90.70565),
-    "oak_hills_place": (30.35992, -91.0876),
-    "oakdale": (30.81603, -92.66042),
-    "oberlin": (30.6202, -92.76265),
-    "old_jefferson": (30.38269, -91.01705),
-    "olla": (31.90294, -92.24319),
-    "opelousas": (30.53353, -92.08151),
-    "ossun": (30.27603, -92.11235),
-    "paradis": (29.87965, -90.43397),
-    "patterson": (29.69326, -91.30205),
-    "paulina": (30.02631, -90.71315),
-    "pearl_river": (30.37603, -89.7484),
-    "pierre_part": (29.9652, -91.20316),
-    "pine_prairie": (30.78381, -92.42541),
-    "plaquemine": (30.28908, -91.23427),
-    "ponchatoula": (30.4388, -90.44148),
-    "port_allen": (30.45214, -91.21011),
-    "port_barre": (30.5602, -91.95401),
-    "port_sulphur": (29.48049, -89.69395),
-    "poydras": (29.86937, -89.88895),
-    "prairieville": (30.30297, -90.97205),
-    "presquille": (29.56383, -90.6462),
-    "prien": (30.18187, -93.27377),
-    "rayne": (30.23493, -92.26846),
-    "rayville": (32.47736, -91.75485),
-    "reserve": (30.05381, -90.55175),
-    "richwood": (32.44876, -92.08486),
-    "river_ridge": (29.9602, -90.21563),
-    "rosepine": (30.91991, -93.28239),
-    "ruston": (32.52321, -92.63793),
-    "saint_francisville": (30.7799, -91.3765),
-    "saint_gabriel": (30.2577, -91.09927),
-    "saint_joseph": (31.91849, -91.23345),
-    "saint_martinville": (30.1252, -91.83345),
-    "saint_rose": (29.94687, -90.32313),
-    "schriever": (29.74215, -90.81037),
-    "scott": (30.23576, -92.09457),
-    "shenandoah": (30.4013, -91.00094),
-    "shreveport": (32.52515, -93.75018),
-    "sibley": (32.53932, -93.29628),
-    "simmesport": (30.98352, -91.80012),
-    "slidell": (30.27519, -89.78117),
-    "sorrento": (30.18436, -90.85926),
-    "south_vacherie": (29.92743, -90.69981),
-    "springhill": (33.00597, -93.46684),
-    "sterlington": (32.69625, -92.08597),
-    "stonewall": (32.28183, -93.82407),
-    "sulphur": (30.23659, -93.37738),
-    "supreme": (29.85937, -90.98121),
-    "swartz": (32.56875, -91.98513),
-    "tallulah": (32.40848, -91.18678),
-    "terrytown": (29.91021, -90.03257),
-    "thibodaux": (29.79576, -90.82287),
-    "timberlane": (29.87743, -90.03202),
-    "urania": (31.86378, -92.29597),
-    "vienna_bend": (31.73239, -93.041),
-    "village_saint_george": (30.36214, -91.06733),
-    "ville_platte": (30.68797, -92.27152),
-    "vinton": (30.19076, -93.58127),
-    "violet": (29.89576, -89.89784),
-    "vivian": (32.87153, -93.9874),
-    "waggaman": (29.91854, -90.21091),
-    "walker": (30.48797, -90.86149),
-    "watson": (30.57574, -90.95316),
-    "welsh": (30.23604, -92.82265),
-    "west_ferriday": (31.64044, -91.57318),
-    "west_monroe": (32.51848, -92.14764),
-    "westlake": (30.24215, -93.25071),
-    "westwego": (29.90604, -90.1423),
-    "westminster": (30.4138, -91.0876),
-    "white_castle": (30.16992, -91.14705),
-    "winnfield": (31.92558, -92.64131),
-    "winnsboro": (32.16321, -91.72068),
-    "woodmere": (29.85798, -90.08035),
-    "woodworth": (31.14658, -92.49736),
-    "zachary": (30.64852, -91.1565),
-    "youngsville": (30.09965, -91.99012),
-    "zwolle": (31.63156, -93.64407),
-    "aberdeen": (39.50956, -76.16412),
-    "accokeek": (38.66762, -77.02831),
-    "adamstown": (39.31094, -77.47471),
-    "adelphi": (39.00317, -76.97192),
-    "algonquin": (38.5829, -76.10577),
-    "annapolis": (38.97845, -76.49218),
-    "arbutus": (39.25455, -76.69997),
-    "arden_on_the_severn": (39.06594, -76.57885),
-    "arnold": (39.03206, -76.50274),
-    "aspen_hill": (39.07955, -77.07303),
-    "baden": (38.65928, -76.77775),
-    "baltimore": (39.29038, -76.61219),
-    "baltimore_highlands": (39.23316, -76.63663),
-    "ballenger_creek": (39.3726, -77.43526),
-    "bartonsville": (39.3926, -77.35804),
-    "bel_air": (39.53594, -76.34829),
-    "beltsville": (39.03483, -76.90747),
-    "bennsville": (38.60929, -77.0122),
-    "berlin": (38.32262, -75.21769),
-    "berwyn_heights": (38.994, -76.91053),
-    "bethesda": (38.98067, -77.10026),
-    "bladensburg": (38.93928, -76.93386),
-    "boonsboro": (39.50621, -77.65249),
-    "bowie": (38.94278, -76.73028),
-    "bowleys_quarters": (39.33539, -76.39024),
-    "braddock_heights": (39.41871, -77.5036),
-    "brandywine": (38.69678, -76.84775),
-    "brentwood": (38.94317, -76.95664),
-    "brock_hall": (38.85011, -76.76108),
-    "brooklyn_park": (39.22844, -76.61636),
-    "brookmont": (38.94206, -77.12026),
-    "bryans_road": (38.62706, -77.07303),
-    "buckeystown": (39.33482, -77.43165),
-    "burtonsville": (39.11122, -76.93248),
-    "cabin_john": (38.97539, -77.15803),
-    "california": (38.3004, -76.50745),
-    "calverton": (39.05761, -76.93581),
-    "cambridge": (38.56317, -76.07883),
-    "camp_springs": (38.804, -76.90664),
-    "cape_saint_claire": (39.04317, -76.44496),
-    "capitol_heights": (38.88511, -76.91581),
-    "carney": (39.39427, -76.52358),
-    "catonsville": (39.27205, -76.73192),
-    "cavetown": (39.64426, -77.58582),
-    "charlotte_hall": (38.48096, -76.77802),
-    "chesapeake_beach": (38.68623, -76.53468),
-    "chesapeake_ranch_estates": (38.34624, -76.41773),
-    "chestertown": (39.209, -76.06661),
-    "cheverly": (38.92817, -76.91581),
-    "chevy_chase_village": (38.96928, -77.07887),
-    "chillum": (38.96372, -76.99081),
-    "clarksburg": (39.23872, -77.27943),
-    "clover_hill": (39.45621, -77.42887),
-    "cloverly": (39.10816, -76.99775),
-    "cockeysville": (39.48122, -76.64386),
-    "colesville": (39.07566, -77.00192),
-    "colmar_manor": (38.93317, -76.94581),
-    "coral_hills": (38.87039, -76.92108),
-    "cottage_city": (38.93817, -76.94831),
-    "cresaptown": (39.59287, -78.83335),
-    "crofton": (39.00178, -76.68747),
-    "crisfield": (37.98346, -75.85382),
-    "croom": (38.75262, -76.76386),
-    "crownsville": (39.02844, -76.60135),
-    "damascus": (39.28844, -77.20387),
-    "darnestown": (39.10344, -77.29082),
-    "davidsonville": (38.92289, -76.6283),
-    "deale": (38.77651, -76.55524),
-    "denton": (38.88456, -75.82716),
-    "derwood": (39.11733, -77.16109),
-    "district_heights": (38.85761, -76.88942),
-    "drum_point": (38.32679, -76.42606),
-    "dundalk": (39.25066, -76.52052),
-    "dunkirk": (38.72178, -76.66052),
-    "dunkirk_town_center": (38.72039, -76.65857),
-    "east_riverdale": (38.96206, -76.92192),
-    "easton": (38.77428, -76.07633),
-    "edgemere": (39.24205, -76.44802),
-    "edmonston": (38.94678, -76.93109),
-    "eldersburg": (39.40371, -76.95026),
-    "elkridge": (39.21261, -76.71358),
-    "ellicott_city": (39.26733, -76.79831),
-    "emmitsburg": (39.70454, -77.32693),
-    "essex": (39.30927, -76.47496),
-    "fairland": (39.07622, -76.95775),
-    "fairmount_heights": (38.90095, -76.91553),
-    "fallston": (39.51455, -76.41107),
-    "federalsburg": (38.69428, -75.77216),
-    "ferndale": (39.18316, -76.64024),
-    "forest_glen": (39.01455, -77.0547),
-    "forest_heights": (38.80956, -76.99803),
-    "forestville": (38.84511, -76.87497),
-    "fort_george_g_mead_junction": (39.12594, -76.78914),
-    "fort_washington": (38.70734, -77.02303),
-    "four_corners": (39.02039, -77.01275),
-    "frederick": (39.41427, -77.41054),
-    "friendly": (38.75178, -76.97859),
-    "friendship_village": (38.96289, -77.08887),
-    "frostburg": (39.65814, -78.92836),
-    "fruitland": (38.32206, -75.6202),
-    "gaithersburg": (39.14344, -77.20137),
-    "gambrills": (39.06705, -76.66524),
-    "garrett_park": (39.03816, -77.09303),
-    "garrison": (39.40594, -76.76053),
-    "glassmanor": (38.819, -76.99859),
-    "glen_burnie": (39.16261, -76.62469),
-    "glenarden": (38.92928, -76.86164),
-    "glenmont": (39.05789, -77.0497),
-    "glenn_dale": (38.98761, -76.82053),
-    "golden_beach": (38.48985, -76.68218),
-    "grasonville": (38.95817, -76.21023),
-    "green_haven": (39.13955, -76.54774),
-    "green_valley": (39.30927, -77.29721),
-    "greenbelt": (39.00455, -76.87553),
-    "halfway": (39.62065, -77.75888),
-    "hampstead": (39.60483, -76.84998),
-    "hancock": (39.69898, -78.17973),
-    "queen_anne": (38.89872, -76.6783),
-    "havre_de_grace": (39.54928, -76.09162),
-    "herald_harbor": (39.05372, -76.56913),
-    "highfield_cascade": (39.71616, -77.48282),
-    "hillandale": (39.0265, -76.97414),
-    "hillcrest_heights": (38.83289, -76.95942),
-    "hillsmere_shores": (38.94011, -76.49496),
-    "hughesville": (38.53262, -76.78386),
-    "hunt_valley": (39.49983, -76.64108),
-    "huntingtown": (38.61595, -76.61302),
-    "huntingtown_town_center": (38.62095, -76.61607),
-    "hurlock": (38.62428, -75.85438),
-    "hyattsville": (38.95594, -76.94553),
-    "ilchester": (39.25094, -76.76469),
-    "indian_head": (38.60012, -77.1622),
-    "jarrettsville": (39.60455, -76.47774),
-    "joppatowne": (39.45789, -76.35524),
-    "keedysville": (39.48621, -77.69971),
-    "kemp_mill": (39.039, -77.01914),
-    "kensington": (39.02567, -77.07637),
-    "kettering": (38.88456, -76.81469),
-    "kingstown": (39.20483, -76.05133),
-    "kingsville": (39.44872, -76.41774),
-    "la_plata": (38.52929, -76.97525),
-    "la_vale": (39.65564, -78.81058),
-    "lake_arbor": (38.90789, -76.82969),
-    "lake_shore": (39.10705, -76.48496),
-    "landover": (38.934, -76.89664),
-    "landover_hills": (38.94317, -76.8922),
-    "langley_park": (38.98872, -76.98136),
-    "lanham": (38.96875, -76.8634),
-    "lansdowne": (39.24511, -76.66052),
-    "layhill": (39.09233, -77.04442),
-    "leonardtown": (38.29124, -76.63579),
-    "lexington_park": (38.26679, -76.45384),
-    "linganore": (39.44038, -77.20804),
-    "linthicum": (39.20511, -76.65275),
-    "lochearn": (39.34066, -76.72219),
-    "lonaconing": (39.56592, -78.9803),
-    "londontowne": (38.93345, -76.54941),
-    "long_beach": (38.46096, -76.46884),
-    "lusby": (38.41068, -76.45523),
-    "lutherville": (39.42122, -76.62608),
-    "marlboro_meadows": (38.83622, -76.71497),
-    "marlow_heights": (38.83345, -76.95164),
-    "marlton": (38.77373, -76.78997),
-    "maryland_city": (39.09205, -76.81775),
-    "maugansville": (39.69287, -77.74472),
-    "mays_chapel": (39.43316, -76.64941),
-    "mechanicsville": (38.4429, -76.74385),
-    "mellwood": (38.81039, -76.82414),
-    "middle_river": (39.33427, -76.43941),
-    "milford_mill": (39.34788, -76.76997),
-    "mitchellville": (38.92511, -76.74275),
-    "montgomery_village": (39.17677, -77.19526),
-    "morningside": (38.83011, -76.89136),
-    "mount_rainier": (38.9415, -76.96498),
-    "mountain_lake_park": (39.39843, -79.38171),
-    "myersville": (39.5051, -77.56638),
-    "new_carrollton": (38.96983, -76.87997),
-    "new_windsor": (39.54205, -77.10804),
-    "north_beach": (38.70734, -76.53107),
-    "north_bel_air": (39.53983, -76.35496),
-    "north_bethesda": (39.04455, -77.11887),
-    "north_east": (39.60011, -75.94133),
-    "north_kensington": (39.03039, -77.07248),
-    "north_laurel": (39.139, -76.87053),
-    "north_potomac": (39.08289, -77.26498),
-    "ocean_pines": (38.39539, -75.15574),
-    "odenton": (39.084, -76.70025),
-    "overlea": (39.36344, -76.52052),
-    "owings": (38.71762, -76.60135),
-    "owings_mills": (39.41955, -76.78025),
-    "oxon_hill": (38.80345, -76.9897),
-    "parkville": (39.37733, -76.53969),
-    "parole": (38.97956, -76.53052),
-    "pasadena": (39.10733, -76.57108),
-    "perry_hall": (39.41261, -76.46357),
-    "perryman": (39.46955, -76.2044),
-    "pikesville": (39.37427, -76.72247),
-    "pittsville": (38.39539, -75.41297),
-    "pleasant_hills": (39.47955, -76.39413),
-    "pocomoke_city": (38.07568, -75.56798),
-    "point_of_rocks": (39.27594, -77.53915),
-    "poolesville": (39.14594, -77.41693),
-    "potomac": (39.01817, -77.20859),
-    "potomac_heights": (38.60873, -77.14053),
-    "potomac_park": (39.61176, -78.80585),
-    "prince_frederick": (38.5404, -76.5844),
-    "princess_anne": (38.2029, -75.69243),
-    "pumphrey": (39.21733, -76.63719),
-    "randallstown": (39.36733, -76.79525),
-    "redland": (39.14539, -77.14415),
-    "reisterstown": (39.46976, -76.8319),
-    "ridgely": (38.94789, -75.88438),
-    "riva": (38.95206, -76.57802),
-    "riverdale_park": (38.96344, -76.93164),
-    "robinwood": (38.95428, -76.51468),
-    "rock_hall": (39.13817, -76.23495),
-    "rosaryville": (38.75678, -76.80969),
-    "rosedale": (39.32011, -76.51552),
-    "rossmoor": (39.10372, -77.07109),
-    "saint_charles": (38.60317, -76.93858),
-    "saint_james": (39.5626, -77.75805),
-    "saint_michaels": (38.78512, -76.22439),
-    "salisbury": (38.36067, -75.59937),
-    "savage": (39.13789, -76.82386),
-    "scaggsville": (39.14511, -76.90025),
-    "seabrook": (38.96805, -76.84658),
-    "seat_pleasant": (38.89622, -76.90664),
-    "selby_on_the_bay": (38.91622, -76.52246),
-    "severn": (39.13705, -76.6983),
-    "severna_park": (39.07039, -76.54524),
-    "shady_side": (38.84178, -76.51218),
-    "silver_hill": (38.84178, -76.94581),
-    "silver_spring": (38.99067, -77.02609),
-    "smithsburg": (39.65482, -77.57277),
-    "snow_hill": (38.17706, -75.3927),
-    "solomons": (38.31846, -76.45412),
-    "south_bel_air": (39.53316, -76.33746),
-    "south_gate": (39.129, -76.6258),
-    "south_kensington": (39.019, -77.07998),
-    "south_laurel": (39.06983, -76.85025),
-    "spencerville": (39.11427, -76.97831),
-    "spring_ridge": (39.40149, -77.35248),
-    "stevensville": (38.98067, -76.3144),
-    "suitland": (38.84872, -76.92386),
-    "sykesville": (39.37371, -76.96776),
-    "takoma_park": (38.97789, -77.00748),
-    "taneytown": (39.65788, -77.17443),
-    "temple_hills": (38.814, -76.94553),
-    "thurmont": (39.62371, -77.41082),
-    "timonium": (39.43705, -76.61969),
-    "towson": (39.4015, -76.60191),
-    "trappe": (38.65845, -76.058),
-    "travilah": (39.069, -77.26304),
-    "upper_marlboro": (38.81595, -76.74969),
-    "urbana": (39.32594, -77.35137),
-    "waldorf": (38.62456, -76.93914),
-    "walker_mill": (38.87539, -76.88831),
-    "walkersville": (39.48621, -77.35193),
-    "west_elkridge": (39.20705, -76.72692),
-    "west_laurel": (39.10122, -76.8997),
-    "west_ocean_city": (38.3315, -75.10685),
-    "westernport": (39.48537, -79.04475),
-    "westphalia": (38.84539, -76.81108),
-    "wheaton": (39.03983, -77.05526),
-    "white_marsh": (39.38372, -76.43218),
-    "white_oak": (39.03983, -76.99303),
-    "williamsport": (39.60065, -77.82055),
-    "woodlawn": (39.32288, -76.72803),
-    "woodmore": (38.92122, -76.80303),
-    "woodsboro": (39.53316, -77.31471),
-    "adrian": (38.39752, -94.35162),
-    "advance": (37.10455, -89.90953),
-    "affton": (38.55061, -90.33317),
-    "anderson": (36.65063, -94.44355),
-    "appleton_city": (38.19058, -94.02939),
-    "archie": (38.48168, -94.35439),
-    "ash_grove": (37.31533, -93.5852),
-    "ava": (36.952, -92.66045),
-    "ballwin": (38.59505, -90.54623),
-    "barnhart": (38.34422, -90.39345),
-    "battlefield": (37.11561, -93.37019),
-    "bel_nor": (38.702, -90.31678),
-    "bel_ridge": (38.7095, -90.32539),
-    "belle": (38.28588, -91.72044),
-    "bellefontaine_neighbors": (38.74033, -90.2265),
-    "belton": (38.81195, -94.5319),
-    "berkeley": (38.7545, -90.33123),
-    "bernie": (36.66894, -89.9687),
-    "billings": (37.06755, -93.55214),
-    "bismarck": (37.76922, -90.62485),
-    "black_jack": (38.79338, -90.26733),
-    "blue_springs": (39.01695, -94.28161),
-    "bolivar": (37.61448, -93.41047),
-    "bonne_terre": (37.92311, -90.5554),
-    "bourbon": (38.15477, -91.24403),
-    "branson": (36.64367, -93.21851),
-    "breckenridge_hills": (38.7145, -90.36734),
-    "bridgeton": (38.767, -90.41151),
-    "brookfield": (39.78447, -93.07353),
-    "buffalo": (37.64393, -93.09241),
-    "byrnes_mill": (38.43783, -90.58179),
-    "cabool": (37.12394, -92.10127),
-    "calverton_park": (38.76477, -90.31373),
-    "camdenton": (38.00809, -92.74463),
-    "cape_girardeau": (37.30588, -89.51815),
-    "carl_junction": (37.17672, -94.56551),
-    "carthage": (37.17645, -94.31022),
-    "caruthersville": (36.19312, -89.65564),
-    "cassville": (36.67701, -93.86881),
-    "castle_point": (38.75811, -90.24817),
-    "cedar_hill": (38.35339, -90.64124),
-    "chaffee": (37.18005, -89.65509),
-    "charlack": (38.70255, -90.34345),
-    "chesterfield": (38.66311, -90.57707),
-    "chillicothe": (39.79529, -93.55244),
-    "clarkson_valley": (38.61839, -90.58929),
-    "clarkton": (36.45173, -89.96704),
-    "claycomo": (39.2025, -94.49245),
-    "clever": (37.03033, -93.47297),
-    "cole_camp": (38.46002, -93.2027),
-    "cool_valley": (38.72783, -90.31011),
-    "cottleville": (38.74616, -90.65401),
-    "country_club_hills": (38.72088, -90.27484),
-    "country_club_village": (39.83222, -94.82163),
-    "crane": (36.90534, -93.57158),
-    "creve_coeur": (38.66089, -90.42262),
-    "crocker": (37.94893, -92.26378),
-    "crystal_city": (38.22117, -90.37901),
-    "cuba": (38.06282, -91.40348),
-    "dardenne_prairie": (38.7695, -90.72902),
-    "dellwood": (38.7495, -90.28567),
-    "des_peres": (38.60089, -90.4329),
-    "desloge": (37.87088, -90.52735),
-    "dexter": (36.79589, -89.95787),
-    "doniphan": (36.62089, -90.82346),
-    "duenweg": (37.08367, -94.41356),
-    "duquesne": (37.07673, -94.45939),
-    "east_independence": (39.09556, -94.35523),
-    "east_prairie": (36.77978, -89.38563),
-    "el_dorado_springs": (37.87698, -94.02133),
-    "eldon": (38.34836, -92.58158),
-    "ellisville": (38.59255, -90.58707),
-    "elsberry": (39.16672, -90.78096),
-    "elvins": (37.83672, -90.5329),
-    "esther": (37.85033, -90.49874),
-    "excelsior_springs": (39.33917, -94.22606),
-    "fair_grove": (37.38393, -93.1513),
-    "fenton": (38.51311, -90.43595),
-    "ferguson": (38.74422, -90.30539),
-    "festus": (38.22061, -90.39595),
-    "flat_river": (37.85005, -90.51679),
-    "florissant": (38.78922, -90.32261),
-    "four_seasons": (38.19809, -92.71102),
-    "fredericktown": (37.55978, -90.29401),
-    "gallatin": (39.91445, -93.96217),
-    "gerald": (38.39977, -91.33071),
-    "gideon": (36.45201, -89.91926),
-    "gladstone": (39.20389, -94.55468),
-    "glasgow_village": (38.75366, -90.19844),
-    "glendale": (38.59589, -90.37706),
-    "goodman": (36.74174, -94.39911),
-    "gower": (39.61083, -94.5994),
-    "grain_valley": (39.01501, -94.19856),
-    "granby": (36.91923, -94.25522),
-    "gray_summit": (38.48978, -90.8168),
-    "green_park": (38.52366, -90.33845),
-    "hallsville": (39.11699, -92.22074),
-    "hanley_hills": (38.68588, -90.32373),
-    "hannibal": (39.70838, -91.35848),
-    "harrisonville": (38.65334, -94.34884),
-    "hartville": (37.25088, -92.51044),
-    "hayti": (36.23368, -89.74953),
-    "hazelwood": (38.77144, -90.37095),
-    "herculaneum": (38.26839, -90.38012),
-    "hermann": (38.70421, -91.43738),
-    "hermitage": (37.94142, -93.31631),
-    "higginsville": (39.07251, -93.71716),
-    "high_ridge": (38.45894, -90.53651),
-    "hillsdale": (38.68338, -90.284),
-    "holden": (38.71418, -93.99133),
-    "hollister": (36.62117, -93.21546),
-    "holts_summit": (38.64032, -92.12241),
-    "houston": (37.32616, -91.95599),
-    "humansville": (37.79448, -93.57798),
-    "imperial": (38.36978, -90.37845),
-    "ironton": (37.59727, -90.62734),
-    "jefferson_city": (38.5767, -92.17352),
-    "joplin": (37.08423, -94.51328),
-    "kearney": (39.36778, -94.36217),
-    "kennett": (36.23618, -90.05565),
-    "keytesville": (39.43447, -92.93825),
-    "kimberling_city": (36.6334, -93.41685),
-    "kingston": (39.64417, -94.03855),
-    "kirkwood": (38.58339, -90.40678),
-    "kissee_mills": (36.68367, -93.0499),
-    "knob_noster": (38.76668, -93.55855),
-    "la_monte": (38.77418, -93.42521),
-    "ladue": (38.64977, -90.38067),
-    "lake_lotawana": (38.92306, -94.24411),
-    "lake_ozark": (38.19864, -92.6388),
-    "lake_saint_louis": (38.79755, -90.78568),
-    "lake_winnebago": (38.8314, -94.35856),
-    "lakeshire": (38.53866, -90.33512),
-    "lathrop": (39.54834, -94.32995),
-    "lawson": (39.43834, -94.20411),
-    "leadwood": (37.86727, -90.59318),
-    "lee_s_summit": (38.91084, -94.38217),
-    "lemay": (38.53339, -90.27928),
-    "licking": (37.49949, -91.8571),
-    "lilbourn": (36.59228, -89.61536),
-    "linneus": (39.87863, -93.18882),
-    "lone_jack": (38.87084, -94.17383),
-    "louisiana": (39.44894, -91.05153),
-    "malden": (36.557, -89.96648),
-    "maplewood": (38.61255, -90.32456),
-    "marble_hill": (37.30589, -89.97038),
-    "marceline": (39.71197, -92.94825),
-    "marionville": (37.00311, -93.63742),
-    "marlborough": (38.57033, -90.33706),
-    "marshfield": (37.33866, -92.90712),
-    "marthasville": (38.62838, -91.05764),
-    "maryland_heights": (38.71311, -90.42984),
-    "mehlville": (38.50839, -90.32289),
-    "merriam_woods": (36.71395, -93.16185),
-    "mexico": (39.16976, -91.88295),
-    "moberly": (39.41837, -92.43824),
-    "moline_acres": (38.74699, -90.24011),
-    "monett": (36.92895, -93.92771),
-    "monroe_city": (39.65365, -91.73461),
-    "montgomery_city": (38.97754, -91.50488),
-    "moscow_mills": (38.94783, -90.91819),
-    "mountain_grove": (37.13061, -92.26349),
-    "murphy": (38.49033, -90.48707),
-    "neosho": (36.86896, -94.368),
-    "nevada": (37.83921, -94.35467),
-    "new_franklin": (39.01725, -92.73741),
-    "new_haven": (38.60838, -91.21904),
-    "new_london": (39.58532, -91.40098),
-    "new_madrid": (36.58645, -89.52785),
-    "nixa": (37.04339, -93.29435),
-    "noel": (36.54563, -94.48522),
-    "normandy": (38.72088, -90.29734),
-    "north_kansas_city": (39.13, -94.56218),
-    "northwoods": (38.70422, -90.28345),
-    "oakville": (38.47005, -90.30456),
-    "olivette": (38.66533, -90.37595),
-    "oran": (37.08505, -89.65536),
-    "oregon": (39.98694, -95.14498),
-    "oronogo": (37.18839, -94.47023),
-    "osage_beach": (38.12956, -92.65277),
-    "overland": (38.70116, -90.36234),
-    "pacific": (38.482, -90.74152),
-    "pagedale": (38.68338, -90.30761),
-    "palmyra": (39.79421, -91.52321),
-    "peculiar": (38.71918, -94.45856),
-    "pevely": (38.28339, -90.39512),
-    "pierce_city": (36.9459, -94.00021),
-    "pine_lawn": (38.69588, -90.27511),
-    "platte_city": (39.37028, -94.78246),
-    "plattsburg": (39.56555, -94.44801),
-    "pleasant_hill": (38.78751, -94.26939),
-    "pleasant_valley": (39.21639, -94.48412),
-    "poplar_bluff": (36.757, -90.39289),
-    "portageville": (36.42534, -89.69953),
-    "potosi": (37.93644, -90.78791),
-    "purdy": (36.81729, -93.92076),
-    "raymore": (38.80195, -94.45273),
-    "raytown": (39.00862, -94.46356),
-    "republic": (37.12005, -93.48019),
-    "rich_hill": (38.09642, -94.36106),
-    "rock_hill": (38.60755, -90.37845),
-    "rolla": (37.95143, -91.77127),
-    "saint_ann": (38.72727, -90.38317),
-    "saint_clair": (38.34533, -90.98097),
-    "saint_johns": (38.71338, -90.34317),
-    "st_louis": (38.62727, -90.19789),
-    "saint_martins": (38.5942, -92.33713),
-    "saint_peters": (38.80033, -90.62651),
-    "saint_robert": (37.8281, -92.17767),
-    "sainte_genevieve": (37.98144, -90.04178),
-    "sappington": (38.537, -90.37984),
-    "sarcoxie": (37.06923, -94.1166),
-    "scott_city": (37.21672, -89.52453),
-    "sedalia": (38.70446, -93.22826),
-    "senath": (36.13423, -90.15982),
-    "shelbina": (39.69393, -92.04295),
-    "shell_knob": (36.63229, -93.63436),
-    "shrewsbury": (38.59033, -90.33678),
-    "sikeston": (36.87672, -89.58786),
-    "slater": (39.21808, -93.06909),
-    "smithville": (39.38694, -94.58107),
-    "spanish_lake": (38.78783, -90.21594),
-    "steelville": (37.9681, -91.35487),
-    "stover": (38.44086, -92.99187),
-    "strafford": (37.26838, -93.11713),
-    "sugar_creek": (39.10973, -94.44467),
-    "sunset_hills": (38.53894, -90.40734),
-    "sweet_springs": (38.96363, -93.41493),
-    "taos": (38.50643, -92.07101),
-    "terre_du_lac": (37.91172, -90.62541),
-    "thayer": (36.52451, -91.5382),
-    "tipton": (38.65558, -92.77992),
-    "town_and_country": (38.61228, -90.46345),
-    "university_city": (38.65588, -90.30928),
-    "valley_park": (38.54922, -90.49262),
-    "velda_village": (38.69005, -90.29428),
-    "velda_village_hills": (38.69061, -90.28734),
-    "vinita_park": (38.69005, -90.34262),
-    "wardsville": (38.48892, -92.17435),
-    "warson_woods": (38.60727, -90.38345),
-    "waynesville": (37.82865, -92.20072),
-    "weatherby_lake": (39.23778, -94.69607),
-    "webb_city": (37.14645, -94.463),
-    "webster_groves": (38.59255, -90.35734),
-    "weldon_spring": (38.71339, -90.68929),
-    "wellston": (38.67283, -90.29928),
-    "wentzville": (38.81144, -90.85291),
-    "west_plains": (36.72812, -91.85237),
-    "willard": (37.30505, -93.42853),
-    "willow_springs": (36.99228, -91.96987),
-    "winona": (37.00977, -91.32347),
-    "woodson_terrace": (38.72505, -90.35845),
-    "wright_city": (38.82755, -91.02014),
-    "ackerman": (33.31012, -89.17284),
-    "amory": (33.98428, -88.4881),
-    "arnold_line": (31.33517, -89.3734),
-    "baldwyn": (34.50954, -88.63533),
-    "bay_saint_louis": (30.30881, -89.33005),
-    "bay_springs": (31.97904, -89.28728),
-    "beechwood": (32.32765, -90.82677),
-    "belmont": (31.56877, -88.48391),
-    "belzoni": (33.18429, -90.48926),
-    "biloxi": (30.39603, -88.88531),
-    "bruce": (33.99206, -89.34896),
-    "bude": (31.46295, -90.8501),
-    "byhalia": (34.87232, -89.69064),
-    "byram": (32.17932, -90.24537),
-    "caledonia": (33.68289, -88.32448),
-    "calhoun_city": (33.85539, -89.31146),
-    "carriere": (30.61686, -89.65256),
-    "clarksdale": (34.20011, -90.57093),
-    "cleary": (32.16543, -90.18064),
-    "collins": (31.64544, -89.55535),
-    "como": (34.51066, -89.93981),
-    "conehatta": (32.45125, -89.28534),
-    "corinth": (34.93425, -88.52227),
-    "d_iberville": (30.42631, -88.89086),
-    "de_kalb": (32.76763, -88.65088),
-    "de_lisle": (30.37936, -89.26449),
-    "derma": (33.85567, -89.28452),
-    "diamondhead": (30.39464, -89.36394),
-    "drew": (33.80956, -90.52648),
-    "duck_hill": (33.63318, -89.71119),
-    "durant": (33.07513, -89.85453),
-    "edwards": (32.33015, -90.60565),
-    "escatawpa": (30.44048, -88.54363),
-    "eupora": (33.54068, -89.26701),
-    "flowood": (32.30959, -90.13898),
-    "forest": (32.36459, -89.47423),
-    "friars_point": (34.36677, -90.6376),
-    "gautier": (30.38575, -88.61169),
-    "grenada": (33.769, -89.80842),
-    "gulf_hills": (30.43048, -88.84225),
-    "gulf_park_estates": (30.39187, -88.76114),
-    "guntown": (34.44316, -88.65978),
-    "hattiesburg": (31.32712, -89.29034),
-    "hickory_hills": (30.45687, -88.63919),
-    "hollandale": (33.16901, -90.85399),
-    "horn_lake": (34.95537, -90.03481),
-    "hurley": (30.66103, -88.49418),
-    "indianola": (33.45095, -90.65509),
-    "itta_bena": (33.49512, -90.31981),
-    "iuka": (34.81176, -88.19004),
-    "jonestown": (34.31955, -90.45565),
-    "kearney_park": (32.58903, -90.31537),
-    "kiln": (30.40908, -89.43505),
-    "kosciusko": (33.058, -89.58956),
-    "lambert": (34.20178, -90.28343),
-    "latimer": (30.53464, -88.8667),
-    "leakesville": (31.15574, -88.5578),
-    "leland": (33.40539, -90.8976),
-    "lucedale": (30.92519, -88.59002),
-    "lumberton": (31.00129, -89.45229),
-    "lyman": (30.49474, -89.12561),
-    "lynchburg": (34.96232, -90.09593),
-    "magee": (31.87377, -89.73369),
-    "mantachie": (34.32427, -88.49116),
-    "marks": (34.25683, -90.27298),
-    "mayersville": (32.90207, -91.05122),
-    "mccomb": (31.24379, -90.45315),
-    "meadville": (31.47239, -90.89677),
-    "mendenhall": (31.96182, -89.87008),
-    "meridian": (32.36431, -88.70366),
-    "metcalfe": (33.454, -91.00733),
-    "mikoma": (33.95039, -90.28398),
-    "moorhead": (33.45012, -90.50564),
-    "morton": (32.35376, -89.65452),
-    "moss_point": (30.41159, -88.53446),
-    "mound_bayou": (33.87817, -90.72732),
-    "natchez": (31.56044, -91.40317),
-    "nellieburg": (32.40681, -88.77727),
-    "nettleton": (34.089, -88.62227),
-    "new_augusta": (31.20263, -89.03668),
-    "north_tunica": (34.70093, -90.37815),
-    "ocean_springs": (30.41131, -88.82781),
-    "olive_branch": (34.96176, -89.82953),
-    "pascagoula": (30.36576, -88.55613),
-    "pass_christian": (30.31575, -89.24754),
-    "pearl": (32.27459, -90.13203),
-    "pearlington": (30.24658, -89.61117),
-    "pelahatchie": (32.31292, -89.79841),
-    "petal": (31.34656, -89.26006),
-    "philadelphia": (32.77152, -89.11673),
-    "picayune": (30.52556, -89.67788),
-    "pickens": (32.88374, -89.97147),
-    "plantersville": (34.21344, -88.6645),
-    "pontotoc": (34.24788, -88.99867),
-    "poplarville": (30.84019, -89.53423),
-    "port_gibson": (31.96099, -90.98399),
-    "prentiss": (31.5985, -89.86702),
-    "purvis": (31.14324, -89.40979),
-    "raleigh": (32.03349, -89.52229),
-    "rawls_springs": (31.38073, -89.37145),
-    "raymond": (32.25931, -90.4226),
-    "richton": (31.34934, -88.94005),
-    "ridgeland": (32.42848, -90.13231),
-    "ripley": (34.72982, -88.95062),
-    "rolling_fork": (32.90652, -90.87816),
-    "ruleville": (33.72595, -90.55148),
-    "saltillo": (34.37649, -88.68172),
-    "saucier": (30.63575, -89.13504),
-    "senatobia": (34.6176, -89.9687),
-    "sharon": (31.7896, -89.09867),
-    "southaven": (34.98898, -90.01259),
-    "saint_martin": (30.43798, -88.86809),
-    "starkville": (33.45049, -88.81961),
-    "summit": (31.28379, -90.46843),
-    "sumrall": (31.41739, -89.54229),
-    "sunflower": (33.5429, -90.53703),
-    "tchula": (33.1829, -90.22286),
-    "terry": (32.09626, -90.29426),
-    "tunica": (34.68455, -90.38288),
-    "tupelo": (34.25807, -88.70464),
-    "tutwiler": (34.01483, -90.43176),
-    "tylertown": (31.11601, -90.14203),
-    "university": (34.36594, -89.52536),
-    "vancleave": (30.54047, -88.68752),
-    "vardaman": (33.87567, -89.17729),
-    "vicksburg": (32.35265, -90.87788),
-    "wade": (30.64242, -88.56974),
-    "walls": (34.95824, -90.15256),
-    "walthall": (33.60734, -89.27729),
-    "water_valley": (34.1515, -89.63147),
-    "waveland": (30.28686, -89.37616),
-    "wesson": (31.70128, -90.39759),
-    "west_gulfport": (30.40409, -89.0942),
-    "west_hattiesburg": (31.31906, -89.37506),
-    "wiggins": (30.85824, -89.13533),
-    "yazoo_city": (32.85513, -90.40565),
-    "ahoskie": (36.28682, -76.98468),
-    "albemarle": (35.35014, -80.20006),
-    "andrews": (35.20175, -83.82407),
-    "angier": (35.5071, -78.73918),
-    "apex": (35.73265, -78.85029),
-    "archdale": (35.91458, -79.97198),
-    "archer_lodge": (35.69404, -78.37556),
-    "asheboro": (35.70791, -79.81364),
-    "asheville": (35.60095, -82.55402),
-    "avery_creek": (35.46345, -82.58262),
-    "ayden": (35.47266, -77.41552),
-    "badin": (35.40597, -80.11672),
-    "bakersville": (36.01567, -82.15874),
-    "balfour": (35.34651, -82.47206),
-    "banner_elk": (36.16318, -81.8715),
-    "barker_heights": (35.31123, -82.44401),
-    "bayboro": (35.14294, -76.77021),
-    "bayshore": (34.28961, -77.78748),
-    "beaufort": (34.71822, -76.66382),
-    "belhaven": (35.54017, -76.62299),
-    "belville": (34.23073, -77.96582),
-    "benson": (35.38211, -78.54862),
-    "bent_creek": (35.509, -82.6079),
-    "bermuda_run": (36.00375, -80.422),
-    "bessemer_city": (35.28486, -81.28397),
-    "bethel": (35.8071, -77.37886),
-    "bethlehem": (35.82569, -81.30703),
-    "beulaville": (34.92378, -77.77387),
-    "biltmore_forest": (35.53372, -82.52846),
-    "biscoe": (35.35986, -79.77976),
-    "black_mountain": (35.6179, -82.32123),
-    "bladenboro": (34.53878, -78.78752),
-    "blowing_rock": (36.13513, -81.67761),
-    "boiling_spring_lakes": (34.03045, -78.06721),
-    "boiling_springs": (35.25429, -81.66704),
-    "bolivia": (34.06767, -78.14833),
-    "boone": (36.21679, -81.67455),
-    "brevard": (35.23345, -82.73429),
-    "brices_creek": (35.05599, -77.08773),
-    "broad_creek": (34.72072, -76.93633),
-    "broadway": (35.45793, -79.05308),
-    "brogden": (35.29266, -78.03443),
-    "bryson_city": (35.43127, -83.44944),
-    "buies_creek": (35.41322, -78.73557),
-    "burgaw": (34.55211, -77.9261),
-    "burnsville": (35.11237, -80.24451),
-    "butner": (36.13209, -78.75667),
-    "buxton": (35.26768, -75.54237),
-    "cajahs_mountain": (35.83485, -81.54148),
-    "calabash": (33.89073, -78.56834),
-    "cape_carteret": (34.69155, -77.063),
-    "carolina_beach": (34.03517, -77.8936),
-    "carolina_shores": (33.90101, -78.58057),
-    "carrboro": (35.91014, -79.07529),
-    "cary": (35.79154, -78.78112),
-    "castle_hayne": (34.35572, -77.89999),
-    "cedar_point": (34.68766, -77.07245),
-    "chadbourn": (34.32211, -78.82697),
-    "chapel_hill": (35.9132, -79.05584),
-    "charlotte": (35.22709, -80.84313),
-    "cherryville": (35.37874, -81.37897),
-    "china_grove": (35.56931, -80.58173),
-    "claremont": (35.71458, -81.14619),
-    "clemmons": (36.02153, -80.382),
-    "clyde": (35.53344, -82.91069),
-    "coats": (35.40794, -78.67196),
-    "connelly_springs": (35.74291, -81.51343),
-    "conover": (35.70652, -81.21869),
-    "cornelius": (35.4868, -80.86007),
-    "cove_creek": (35.60649, -83.01125),
-    "cramerton": (35.23875, -81.07508),
-    "creedmoor": (36.12237, -78.68611),
-    "cricket": (36.17152, -81.19398),
-    "cullowhee": (35.31371, -83.17653),
-    "currituck": (36.44988, -76.01548),
-    "dana": (35.32928, -82.3754),
-    "danbury": (36.4093, -80.20588),
-    "davidson": (35.50233, -80.83912),
-    "denver": (35.53125, -81.0298),
-    "dobson": (36.39569, -80.72257),
-    "drexel": (35.75791, -81.60426),
-    "dunn": (35.30627, -78.6089),
-    "durham": (35.99403, -78.89862),
-    "east_flat_rock": (35.28012, -82.42206),
-    "east_rockingham": (34.91821, -79.76256),
-    "east_spencer": (35.68181, -80.43228),
-    "eastover": (35.1, -78.8),
-    "eden": (36.48847, -79.7667),
-    "edenton": (36.05794, -76.60772),
-    "edneyville": (35.39401, -82.34095),
-    "elizabeth_city": (36.2946, -76.25105),
-    "elkin": (36.2443, -80.8484),
-    "ellerbe": (35.07126, -79.76144),
-    "elm_city": (35.80655, -77.86332),
-    "elon": (36.10291, -79.50669),
-    "elroy": (35.34266, -77.90859),
-    "emerald_isle": (34.67794, -76.95078),
-    "enfield": (36.18099, -77.66664),
-    "enochville": (35.52986, -80.66812),
-    "erwin": (35.32683, -78.67613),
-    "etowah": (35.31762, -82.59429),
-    "fairfield_harbour": (35.07655, -76.96356),
-    "fairmont": (34.49683, -79.1142),
-    "fairplains": (36.19847, -81.15286),
-    "farmville": (35.57071, -79.22002),
-    "fearrington_village": (35.80376, -79.09029),
-    "flat_rock": (35.27123, -82.44151),
-    "fletcher": (35.43067, -82.50123),
-    "forest_oaks": (35.98819, -79.70614),
-    "foscoe": (36.16179, -81.76566),
-    "four_oaks": (35.44488, -78.42695),
-    "franklinville": (35.74375, -79.69225),
-    "fremont": (35.54544, -77.97471),
-    "fuquay_varina": (35.58432, -78.80001),
-    "gamewell": (35.8693, -81.59621),
-    "garner": (35.71126, -78.61417),
-    "gastonia": (35.26208, -81.1873),
-    "gatesville": (36.40349, -76.75301),
-    "gaston": (36.50043, -77.64498),
-    "gibsonville": (36.10569, -79.54225),
-    "glen_alpine": (35.72902, -81.77927),
-    "glen_raven": (36.11319, -79.47641),
-    "goldsboro": (35.38488, -77.99277),
-    "gorman": (36.03653, -78.82334),
-    "graham": (36.06903, -79.40058),
-    "granite_falls": (35.79652, -81.43065),
-    "granite_quarry": (35.61236, -80.44673),
-    "green_level": (36.12097, -79.34419),
-    "grifton": (35.37266, -77.43746),
-    "half_moon": (34.826, -77.45941),
-    "halifax": (36.32849, -77.58942),
-    "hamlet": (34.88488, -79.69422),
-    "harkers_island": (34.69516, -76.55937),
-    "havelock": (34.87905, -76.90133),
-    "haw_river": (36.09153, -79.36419),
-    "hayesville": (35.0462, -83.81795),
-    "hemby_bridge": (35.10371, -80.62798),
-    "hendersonville": (35.31873, -82.46095),
-    "hertford": (36.19016, -76.46605),
-    "hickory": (35.73319, -81.3412),
-    "high_point": (35.95569, -80.00532),
-    "hildebran": (35.71402, -81.42203),
-    "hillsborough": (36.07542, -79.09973),
-    "holly_ridge": (34.49544, -77.55497),
-    "hoopers_creek": (35.439, -82.46679),
-    "hope_mills": (34.97044, -78.94531),
-    "horse_shoe": (35.34317, -82.55651),
-    "huntersville": (35.41069, -80.84285),
-    "icard": (35.72735, -81.47065),
-    "indian_trail": (35.07681, -80.66924),
-    "james_city": (35.08877, -77.03495),
-    "kannapolis": (35.48736, -80.62173),
-    "kenansville": (34.96239, -77.96221),
-    "kenly": (35.59627, -78.12416),
-    "kernersville": (36.11986, -80.07365),
-    "kill_devil_hills": (36.03072, -75.67601),
-    "king": (36.28069, -80.35922),
-    "kings_grant": (34.26295, -77.8636),
-    "kings_mountain": (35.24513, -81.34119),
-    "kinston": (35.26266, -77.58164),
-    "kitty_hawk": (36.06461, -75.70573),
-    "knightdale": (35.78765, -78.48056),
-    "kure_beach": (33.99684, -77.90721),
-    "lake_junaluska": (35.52788, -82.95958),
-    "lake_lure": (35.4279, -82.20483),
-    "lake_norman_of_catawba": (35.5868, -80.95952),
-    "lake_waccamaw": (34.31906, -78.50001),
-    "landis": (35.54569, -80.6109),
-    "laurel_hill": (34.80905, -79.54783),
-    "laurel_park": (35.31373, -82.49345),
-    "laurinburg": (34.77405, -79.46282),
-    "lenoir": (35.91402, -81.53898),
-    "lillington": (35.39933, -78.81585),
-    "locust": (35.25987, -80.42534),
-    "longview": (35.7293, -81.38342),
-    "lowesville": (35.41708, -81.01119),
-    "lucama": (35.64544, -78.00971),
-    "maggie_valley": (35.51816, -83.09764),
-    "maiden": (35.57569, -81.21175),
-    "manteo": (35.90823, -75.67573),
-    "mar_mac": (35.33488, -78.05582),
-    "mars_hill": (35.8265, -82.5493),
-    "marshville": (34.98849, -80.36701),
-    "marvin": (34.99182, -80.81479),
-    "masonboro": (34.17934, -77.84748),
-    "matthews": (35.11681, -80.72368),
-    "maury": (35.48211, -77.58608),
-    "maxton": (34.73516, -79.34893),
-    "mayodan": (36.41236, -79.96699),
-    "mcleansville": (36.10736, -79.65864),
-    "mebane": (36.09597, -79.26696),
-    "midland": (35.22737, -80.50062),
-    "millers_creek": (36.1893, -81.23759),
-    "mills_river": (35.38845, -82.56679),
-    "mint_hill": (35.17959, -80.64729),
-    "mocksville": (35.89403, -80.56145),
-    "moravian_falls": (36.0968, -81.18231),
-    "morehead_city": (34.72294, -76.72604),
-    "morganton": (35.74541, -81.68482),
-    "morrisville": (35.82348, -78.82556),
-    "mount_gilead": (35.21487, -80.00228),
-    "mount_holly": (35.29819, -81.01591),
-    "mount_pleasant": (35.39931, -80.4359),
-    "moyock": (36.5246, -76.17827),
-    "murraysville": (34.29572, -77.84748),
-    "nags_head": (35.95739, -75.62406),
-    "navassa": (34.25545, -78.00749),
-    "neuse_forest": (34.96377, -76.94467),
-    "new_bern": (35.10849, -77.04411),
-    "newland": (36.08735, -81.92734),
-    "norlina": (36.4457, -78.19833),
-    "north_wilkesboro": (36.15847, -81.14758),
-    "northlakes": (35.7818, -81.37509),
-    "norwood": (35.21959, -80.11895),
-    "oak_island": (33.91656, -78.16111),
-    "oakboro": (35.2257, -80.32895),
-    "pilot_mountain": (36.38653, -80.4695),
-    "pine_knoll_shores": (34.69738, -76.81327),
-    "pinebluff": (35.10988, -79.47226),
-    "pinehurst": (35.19543, -79.46948),
-    "pinetops": (35.78849, -77.63775),
-    "piney_green": (34.716, -77.32024),
-    "plain_view": (35.2485, -78.55529),
-    "pleasant_garden": (35.96208, -79.76225),
-    "plymouth": (35.86683, -76.74856),
-    "polkton": (35.00765, -80.20089),
-    "princeville": (35.8896, -77.53219),
-    "pumpkin_center": (35.5193, -81.14119),
-    "raeford": (34.981, -79.2242),
-    "ramseur": (35.73347, -79.65253),
-    "randleman": (35.81791, -79.80309),
-    "ranlo": (35.28625, -81.13035),
-    "red_oak": (36.03849, -77.90637),
-    "red_springs": (34.81516, -79.18309),
-    "rhodhiss": (35.77402, -81.4312),
-    "richlands": (34.89933, -77.54663),
-    "river_bend": (35.06905, -77.1469),
-    "river_road": (35.50683, -76.99078),
-    "roanoke_rapids": (36.46154, -77.65415),
-    "robbins": (35.43403, -79.58697),
-    "robbinsville": (35.32287, -83.8074),
-    "robersonville": (35.82516, -77.24913),
-    "rockfish": (34.99266, -79.06614),
-    "rockingham": (34.93932, -79.77395),
-    "rocky_point": (34.43517, -77.88776),
-    "rocky_mount": (35.93821, -77.79053),
-    "rolesville": (35.92321, -78.4575),
-    "roseboro": (34.95295, -78.50862),
-    "rowland": (34.53655, -79.29143),
-    "roxboro": (36.39375, -78.98279),
-    "royal_pines": (35.47511, -82.51595),
-    "rural_hall": (36.24042, -80.29338),
-    "rutherford_college": (35.74846, -81.52259),
-    "rutherfordton": (35.36929, -81.95677),
-    "saint_pauls": (34.80655, -78.97114),
-    "sawmills": (35.82485, -81.47454),
-    "saxapahaw": (35.94736, -79.32196),
-    "scotland_neck": (36.1296, -77.42025),
-    "sea_breeze": (34.06323, -77.89137),
-    "seagate": (34.20934, -77.84359),
-    "seven_lakes": (35.27849, -79.56448),
-    "shallotte": (33.97323, -78.38584),
-    "sharpsburg": (35.8671, -77.82915),
-    "sherrills_ford": (35.62041, -80.98647),
-    "siler_city": (35.72347, -79.46224),
-    "skippers_corner": (34.346, -77.90249),
-    "smithfield": (35.50849, -78.33945),
-    "sneads_ferry": (34.55267, -77.39718),
-    "south_gastonia": (35.2193, -81.20563),
-    "south_henderson": (36.3082, -78.40666),
-    "south_rosemary": (36.45154, -77.6972),
-    "southern_pines": (35.17405, -79.39225),
-    "southern_shores": (36.13905, -75.73157),
-    "southmont": (35.66792, -80.267),
-    "spindale": (35.36012, -81.92927),
-    "spring_hope": (35.94515, -78.11193),
-    "spring_lake": (35.16794, -78.97281),
-    "spruce_pine": (35.9154, -82.06456),
-    "saint_stephens": (35.76458, -81.27314),
-    "stallings": (35.0907, -80.68618),
-    "stanfield": (35.23348, -80.42701),
-    "stanley": (35.35903, -81.09702),
-    "statesville": (35.78264, -80.8873),
-    "stedman": (35.0135, -78.69391),
-    "stokesdale": (36.23708, -79.97948),
-    "stoneville": (36.46653, -79.90698),
-    "stony_point": (35.86347, -81.0473),
-    "summerfield": (36.20875, -79.90476),
-    "sunset_beach": (33.88073, -78.51223),
-    "surf_city": (34.42711, -77.54608),
-    "swannanoa": (35.59789, -82.39984),
-    "swanquarter": (35.40628, -76.32909),
-    "swansboro": (34.68766, -77.11912),
-    "swepsonville": (36.02125, -79.36141),
-    "sylva": (35.37371, -83.22598),
-    "tabor_city": (34.14878, -78.87669),
-    "tarboro": (35.89682, -77.5358),
-    "thurmond": (36.36652, -80.92841),
-    "toast": (36.50041, -80.62645),
-    "tobaccoville": (36.23819, -80.37144),
-    "trent_woods": (35.0821, -77.08634),
-    "troutman": (35.70069, -80.88813),
-    "tryon": (35.20817, -82.23845),
-    "tyro": (35.80903, -80.37283),
-    "valdese": (35.74069, -81.56315),
-    "valley_hill": (35.29845, -82.48318),
-    "vander": (35.03211, -78.79474),
-    "wadesboro": (34.96821, -80.07673),
-    "wake_forest": (35.97987, -78.50972),
-    "walkertown": (36.17541, -80.1531),
-    "wallburg": (36.01014, -80.13921),
-    "walnut_cove": (36.29541, -80.14171),
-    "wanchese": (35.84267, -75.63851),
-    "waxhaw": (34.92459, -80.7434),
-    "weaverville": (35.69705, -82.56069),
-    "weddington": (35.02237, -80.7609),
-    "welcome": (35.90292, -80.25699),
-    "weldon": (36.4271, -77.59553),
-    "wentworth": (36.40014, -79.77448),
-    "wendell": (35.78099, -78.36972),
-    "west_canton": (35.53788, -82.85819),
-    "west_jefferson": (36.40374, -81.49288),
-    "west_marion": (35.6579, -82.02539),
-    "west_raleigh": (35.78682, -78.66389),
-    "whispering_pines": (35.25571, -79.37225),
-    "white_plains": (35.23402, -81.39814),
-    "whiteville": (34.33878, -78.70307),
-    "wilkesboro": (36.14596, -81.16064),
-    "williamston": (35.8546, -77.05551),
-    "wilson": (35.72127, -77.91554),
-    "wilsons_mills": (35.58405, -78.35583),
-    "wingate": (34.98432, -80.44923),
-    "winston_salem": (36.09986, -80.24422),
-    "winton": (36.39571, -76.9319),
-    "woodfin": (35.63344, -82.58207),
-    "wrightsboro": (34.2885, -77.9211),
-    "wrightsville_beach": (34.2085, -77.79637),
-    "yadkinville": (36.13458, -80.65951),
-    "yanceyville": (36.40403, -79.33613),
-    "absecon": (39.42845, -74.49571),
-    "alloway": (39.56095, -75.36242),
-    "atco": (39.76984, -74.88739),
-    "atlantic_city": (39.36428, -74.42293),
-    "audubon": (39.89095, -75.07295),
-    "avalon": (39.10122, -74.71766),
-    "barnegat": (39.75318, -74.22292),
-    "barrington": (39.86484, -75.05517),
-    "bayville": (39.90929, -74.15486),
-    "beach_haven": (39.55928, -74.2432),
-    "beach_haven_west": (39.66984, -74.23181),
-    "beachwood": (39.93901, -74.19292),
-    "beckett": (39.754, -75.35741),
-    "bellmawr": (39.86761, -75.09462),
-    "blackwood": (39.80234, -75.06406),
-    "brigantine": (39.41012, -74.36459),
-    "brooklawn": (39.87817, -75.12073),
-    "browns_mills": (39.97261, -74.58293),
-    "buena": (39.51373, -74.92462),
-    "cape_may_court_house": (39.08261, -74.82378),
-    "cape_may": (38.93511, -74.90601),
-    "carneys_point": (39.71122, -75.4702),
-    "cedar_glen_lakes": (39.95234, -74.39987),
-    "cherry_hill": (39.93484, -75.03073),
-    "cherry_hill_mall": (39.93595, -75.00906),
-    "chesilhurst": (39.73234, -74.881),
-    "cinnaminson": (39.99678, -74.99267),
-    "clementon": (39.8115, -74.98294),
-    "collings_lakes": (39.59567, -74.88156),
-    "collingswood": (39.91817, -75.07128),
-    "country_lake_estates": (39.94262, -74.54404),
-    "crestwood_village": (39.94817, -74.3607),
-    "dover_beaches_north": (39.99123, -74.06375),
-    "dover_beaches_south": (39.95567, -74.0743),
-    "echelon": (39.84845, -74.99572),
-    "egg_harbor_city": (39.52873, -74.64794),
-    "ellisburg": (39.91372, -75.01045),
-    "elmer": (39.59511, -75.17018),
-    "erma": (38.98776, -74.9017),
-    "estell_manor": (39.41206, -74.74239),
-    "fairton": (39.38178, -75.21991),
-    "folsom": (39.60206, -74.84267),
-    "forked_river": (39.83984, -74.19014),
-    "gibbsboro": (39.83817, -74.96489),
-    "gibbstown": (39.82511, -75.28352),
-    "glassboro": (39.70289, -75.11184),
-    "glendora": (39.83956, -75.07351),
-    "gloucester_city": (39.89178, -75.11629),
-    "golden_triangle": (39.92789, -75.03878),
-    "greentree": (39.89706, -74.95572),
-    "haddon_heights": (39.87734, -75.06462),
-    "haddonfield": (39.8915, -75.03767),
-    "hammonton": (39.63651, -74.80239),
-    "holiday_heights": (39.94595, -74.25403),
-    "island_heights": (39.94206, -74.14986),
-    "kingston_estates": (39.92372, -74.98795),
-    "laurel_lake": (39.33956, -75.0299),
-    "lavallette": (39.9704, -74.06875),
-    "lawnside": (39.8665, -75.02823),
-    "laurel_springs": (39.82011, -75.00628),
-    "leisuretowne": (39.89234, -74.7021),
-    "lindenwold": (39.82428, -74.99767),
-    "linwood": (39.33984, -74.57516),
-    "manahawkin": (39.6954, -74.25875),
-    "maple_shade": (39.95261, -74.99239),
-    "margate_city": (39.32789, -74.50349),
-    "mays_landing": (39.45234, -74.72766),
-    "medford_lakes": (39.85845, -74.80294),
-    "millville": (39.40206, -75.03934),
-    "mount_ephraim": (39.87845, -75.09267),
-    "mount_laurel": (39.934, -74.891),
-    "mullica_hill": (39.73928, -75.22407),
-    "mystic_island": (39.54428, -74.38237),
-    "national_park": (39.86595, -75.17879),
-    "newfield": (39.54688, -75.02636),
-    "north_beach_haven": (39.57317, -74.23153),
-    "north_cape_may": (38.98206, -74.95795),
-    "north_wildwood": (39.00067, -74.79933),
-    "oaklyn": (39.90095, -75.08462),
-    "ocean_acres": (39.74345, -74.28098),
-    "ocean_gate": (39.92679, -74.13375),
-    "olivet": (39.54817, -75.15463),
-    "paulsboro": (39.83039, -75.24046),
-    "pemberton": (39.97206, -74.68294),
-    "pemberton_heights": (39.96261, -74.67877),
-    "penns_grove": (39.72956, -75.46797),
-    "pennsauken": (39.95622, -75.05795),
-    "pennsville": (39.65345, -75.51659),
-    "pine_beach": (39.93595, -74.17097),
-    "pine_hill": (39.78428, -74.99211),
-    "pine_ridge_at_crestwood": (39.95456, -74.31515),
-    "pitman": (39.73289, -75.13157),
-    "pleasantville": (39.38984, -74.52404),
-    "pomona": (39.47845, -74.57516),
-    "port_norris": (39.24595, -75.03518),
-    "port_republic": (39.52067, -74.48571),
-    "presidential_lakes_estates": (39.91373, -74.5646),
-    "ramblewood": (39.92872, -74.94378),
-    "rio_grande": (39.01456, -74.88156),
-    "rosenhayn": (39.47817, -75.13129),
-    "runnemede": (39.85234, -75.06795),
-    "sea_isle_city": (39.15345, -74.69294),
-    "seabrook_farms": (39.50095, -75.21796),
-    "seaside_heights": (39.94429, -74.07291),
-    "seaside_park": (39.92679, -74.07708),
-    "ship_bottom": (39.6429, -74.18042),
-    "sicklerville": (39.71734, -74.96933),
-    "silver_ridge": (39.95928, -74.21848),
-    "somerdale": (39.844, -75.02267),
-    "somers_point": (39.31762, -74.5946),
-    "south_toms_river": (39.94206, -74.20431),
-    "south_vineland": (39.44595, -75.02879),
-    "stratford": (39.82678, -75.01545),
-    "swedesboro": (39.74761, -75.31047),
-    "toms_river": (39.95373, -74.19792),
-    "tuckerton": (39.60317, -74.34015),
-    "turnersville": (39.77317, -75.05128),
-    "ventnor_city": (39.34039, -74.47737),
-    "victory_lakes": (39.63317, -74.966),
-    "vincentown": (39.934, -74.74849),
-    "vineland": (39.48623, -75.02573),
-    "waretown": (39.79151, -74.19514),
-    "wenonah": (39.79456, -75.14879),
-    "west_cape_may": (38.93872, -74.94184),
-    "westville": (39.86789, -75.13156),
-    "wildwood_crest": (38.97484, -74.8335),
-    "wood_lynne": (39.91734, -75.09629),
-    "woodbury": (39.83817, -75.15268),
-    "woodbury_heights": (39.81706, -75.15518),
-    "woodstown": (39.6515, -75.32825),
-    "amberley": (39.20478, -84.428),
-    "arcanum": (39.99005, -84.55329),
-    "ashville": (39.71562, -82.95296),
-    "batavia": (39.07701, -84.17688),
-    "beavercreek": (39.70923, -84.06327),
-    "beckett_ridge": (39.347, -84.43522),
-    "bellbrook": (39.63562, -84.07077),
-    "belpre": (39.27396, -81.5729),
-    "beverly": (39.54785, -81.63957),
-    "bexley": (39.96895, -82.93768),
-    "blacklick_estates": (39.90506, -82.86434),
-    "blanchester": (39.29312, -83.98882),
-    "blue_ash": (39.232, -84.37827),
-    "bridgetown": (39.15311, -84.63717),
-    "buckeye_lake": (39.93368, -82.47238),
-    "byesville": (39.96979, -81.53651),
-    "canal_winchester": (39.84284, -82.80462),
-    "chauncey": (39.39785, -82.12931),
-    "cherry_grove": (39.07256, -84.32188),
-    "cheviot": (39.157, -84.61328),
-    "choctaw_lake": (39.96006, -83.48492),
-    "cincinnati": (39.12711, -84.51439),
-    "circleville": (39.60062, -82.94601),
-    "cleves": (39.16172, -84.74912),
-    "coal_grove": (38.50341, -82.64711),
-    "commercial_point": (39.7684, -83.05713),
-    "covedale": (39.12117, -84.60633),
-    "crooksville": (39.76896, -82.09209),
-    "crystal_lakes": (39.88923, -84.0266),
-    "day_heights": (39.17395, -84.22633),
-    "deer_park": (39.20534, -84.39466),
-    "dent": (39.18589, -84.65134),
-    "devola": (39.47369, -81.47901),
-    "dillonvale": (39.21811, -84.40216),
-    "dry_run": (39.10423, -84.33049),
-    "dunlap": (39.29228, -84.618),
-    "eaton": (39.74394, -84.63662),
-    "elmwood_place": (39.18728, -84.488),
-    "enon": (39.87812, -83.93688),
-    "etna": (39.95729, -82.68183),
-    "evendale": (39.25617, -84.418),
-    "fairborn": (39.82089, -84.01938),
-    "fairfax": (39.14534, -84.39327),
-    "fairfield_beach": (39.9159, -82.47516),
-    "farmersville": (39.6795, -84.42911),
-    "finneytown": (39.20034, -84.5205),
-    "fort_mckinley": (39.79756, -84.25355),
-    "franklin_furnace": (38.64508, -82.84878),
-    "fruit_hill": (39.07562, -84.36438),
-    "gallipolis": (38.8098, -82.20237),
-    "glouster": (39.50313, -82.08459),
-    "golf_manor": (39.18728, -84.44633),
-    "grandview_heights": (39.97979, -83.04074),
-    "green_meadows": (39.86895, -83.94438),
-    "greenhills": (39.26811, -84.523),
-    "groesbeck": (39.22311, -84.58689),
-    "groveport": (39.8784, -82.88379),
-    "harbor_hills": (39.93673, -82.43515),
-    "highpoint": (39.28839, -84.35022),
-    "holiday_valley": (39.85617, -83.96854),
-    "huber_heights": (39.84395, -84.12466),
-    "hunter": (39.49284, -84.28966),
-    "kenwood": (39.21061, -84.36716),
-    "kings_mills": (39.35561, -84.24855),
-    "lake_darby": (39.95728, -83.2288),
-    "landen": (39.312, -84.28299),
-    "lewisburg": (39.84616, -84.53967),
-    "lincoln_heights": (39.23895, -84.4555),
-    "lincoln_village": (39.95479, -83.13074),
-    "lisbon": (39.86089, -83.6352),
-    "lithopolis": (39.80284, -82.80628),
-    "lockland": (39.22922, -84.45772),
-    "logan": (39.54007, -82.4071),
-    "logan_elm_village": (39.56978, -82.95185),
-    "loveland": (39.26895, -84.26383),
-    "loveland_park": (39.29978, -84.26327),
-    "lucasville": (38.87952, -82.99684),
-    "mack": (39.15811, -84.64967),
-    "madeira": (39.19089, -84.36355),
-    "mariemont": (39.14506, -84.37438),
-    "mason": (39.36006, -84.30994),
-    "mcarthur": (39.24646, -82.47849),
-    "mcconnelsville": (39.64868, -81.85319),
-    "miami_heights": (39.16506, -84.7205),
-    "miamisburg": (39.64284, -84.28661),
-    "miamitown": (39.21589, -84.70411),
-    "middleport": (39.00175, -82.04875),
-    "millersport": (39.90006, -82.53405),
-    "monfort_heights": (39.18839, -84.59522),
-    "moraine": (39.70617, -84.21938),
-    "mount_healthy": (39.23367, -84.54578),
-    "mount_healthy_heights": (39.27033, -84.568),
-    "mount_orab": (39.02757, -83.91965),
-    "mount_repose": (39.20062, -84.22438),
-    "nelsonville": (39.45868, -82.23182),
-    "new_boston": (38.7523, -82.93684),
-    "new_burlington": (39.2595, -84.55717),
-    "new_carlisle": (39.93617, -84.02549),
-    "new_concord": (39.99368, -81.73402),
-    "new_lebanon": (39.74533, -84.38495),
-    "new_lexington": (39.71396, -82.20848),
-    "new_matamoras": (39.52452, -81.06705),
-    "new_miami": (39.43478, -84.53689),
-    "new_paris": (39.85699, -84.79329),
-    "new_richmond": (38.94868, -84.27994),
-    "new_vienna": (39.32367, -83.69103),
-    "newtown": (39.1245, -84.36161),
-    "north_college_hill": (39.21839, -84.55078),
-    "north_fork_village": (39.3359, -83.02907),
-    "north_zanesville": (39.97868, -82.00347),
-    "northbrook": (39.24645, -84.58356),
-    "northgate": (39.25283, -84.59245),
-    "northridge": (39.99173, -83.77854),
-    "obetz": (39.87895, -82.95074),
-    "park_layne": (39.88645, -84.03966),
-    "pataskala": (39.99562, -82.67433),
-    "peebles": (38.94896, -83.40575),
-    "pickerington": (39.88423, -82.7535),
-    "piketon": (39.06813, -83.01434),
-    "pleasant_run": (39.29978, -84.56356),
-    "pleasant_run_farm": (39.30311, -84.548),
-    "pomeroy": (39.02758, -82.03375),
-    "portsmouth": (38.73174, -82.99767),
-    "powhatan_point": (39.86008, -80.81537),
-    "reading": (39.22367, -84.44216),
-    "reno": (39.37285, -81.39567),
-    "reynoldsburg": (39.95479, -82.81212),
-    "rosemount": (38.78619, -82.97906),
-    "ross": (39.31228, -84.6505),
-    "roseville": (39.80729, -82.07125),
-    "rossmoyne": (39.21367, -84.38688),
-    "sabina": (39.48867, -83.63687),
-    "saint_bernard": (39.167, -84.49855),
-    "salem_heights": (39.07173, -84.37827),
-    "sciotodale": (38.7548, -82.86878),
-    "shadyside": (39.97091, -80.75064),
-    "sharonville": (39.26811, -84.41327),
-    "shawnee_hills": (39.65284, -83.78687),
-    "sherwood": (39.08478, -84.36077),
-    "silverton": (39.19284, -84.4005),
-    "sixteen_mile_stand": (39.27284, -84.32744),
-    "skyline_acres": (39.22867, -84.56689),
-    "south_bloomfield": (39.7184, -82.98685),
-    "south_charleston": (39.82534, -83.63437),
-    "south_lebanon": (39.37089, -84.21327),
-    "south_point": (38.41786, -82.58627),
-    "south_zanesville": (39.89923, -82.00625),
-    "springboro": (39.55228, -84.23327),
-    "summerside": (39.10478, -84.28827),
-    "terrace_park": (39.15923, -84.30716),
-    "the_plains": (39.36896, -82.13237),
-    "the_village_of_indian_hill": (39.17949, -84.33517),
-    "thornport": (39.91312, -82.41099),
-    "tipp_city": (39.95839, -84.17216),
-    "trotwood": (39.79728, -84.31133),
-    "upper_arlington": (39.99451, -83.06241),
-    "urbancrest": (39.89756, -83.08685),
-    "washington_court_house": (39.53645, -83.43908),
-    "west_alexandria": (39.7445, -84.53217),
-    "west_carrollton_city": (39.67228, -84.25216),
-    "west_milton": (39.96255, -84.328),
-    "west_portsmouth": (38.75841, -83.02906),
-    "west_union": (38.79452, -83.54519),
-    "wetherington": (39.36367, -84.37744),
-    "wheelersburg": (38.73035, -82.85545),
-    "whitehall": (39.96673, -82.88546),
-    "wilberforce": (39.71617, -83.87771),
-    "withamsville": (39.06228, -84.28827),
-    "woodsfield": (39.76257, -81.11538),
-    "xenia": (39.68478, -83.92965),
-    "yellow_springs": (39.80645, -83.88687),
-    "zanesville": (39.94035, -82.01319),
-    "ada": (34.77453, -96.67834),
-    "afton": (36.69369, -94.96302),
-    "altus": (34.63813, -99.33398),
-    "anadarko": (35.07256, -98.24366),
-    "antlers": (34.23121, -95.62025),
-    "apache": (34.89368, -98.36589),
-    "arapaho": (35.57783, -98.96453),
-    "ardmore": (34.17426, -97.14363),
-    "arkoma": (35.35454, -94.4341),
-    "arnett": (36.13504, -99.77484),
-    "atoka": (34.38593, -96.12833),
-    "barnsdall": (36.56202, -96.16167),
-    "bartlesville": (36.74731, -95.98082),
-    "beggs": (35.7426, -96.07027),
-    "bethel_acres": (35.30868, -97.02558),
-    "bixby": (35.94204, -95.88332),
-    "blackwell": (36.80448, -97.28282),
-    "boley": (35.49341, -96.48362),
-    "bray": (34.63786, -97.81753),
-    "bristow": (35.83063, -96.39112),
-    "broken_arrow": (36.0526, -95.79082),
-    "broken_bow": (34.02928, -94.7391),
-    "burns_flat": (35.34894, -99.17036),
-    "bushyhead": (36.46148, -95.49414),
-    "byng": (34.8612, -96.66557),
-    "cache": (34.62952, -98.62867),
-    "caddo": (34.12676, -96.26332),
-    "carnegie": (35.10367, -98.60367),
-    "catoosa": (36.18899, -95.74582),
-    "central_high": (34.62313, -98.08976),
-    "checotah": (35.4701, -95.52304),
-    "cheyenne": (35.61394, -99.67149),
-    "chickasha": (35.05257, -97.93643),
-    "choctaw": (35.49756, -97.26892),
-    "chouteau": (36.18593, -95.34302),
-    "claremore": (36.3126, -95.61609),
-    "cleora": (36.57897, -94.97107),
-    "colbert": (33.85316, -96.50249),
-    "comanche": (34.36897, -97.96392),
-    "copeland": (36.65591, -94.82829),
-    "cordell": (35.29061, -98.98841),
-    "coweta": (35.95177, -95.65081),
-    "crescent": (35.95254, -97.59477),
-    "cushing": (35.98506, -96.76697),
-    "cyril": (34.89646, -98.2006),
-    "davis": (34.50453, -97.11946),
-    "del_city": (35.44201, -97.44087),
-    "dewey": (36.79592, -95.93554),
-    "dickson": (34.18732, -96.98446),
-    "drumright": (35.9884, -96.60113),
-    "duncan": (34.5023, -97.95781),
-    "edmond": (35.65283, -97.4781),
-    "el_reno": (35.53227, -97.95505),
-    "elgin": (34.78035, -98.29227),
-    "elk_city": (35.41199, -99.40426),
-    "enid": (36.39559, -97.87839),
-    "erick": (35.21533, -99.86649),
-    "fort_gibson": (35.7976, -95.25052),
-    "geary": (35.63116, -98.31729),
-    "geronimo": (34.48119, -98.38311),
-    "glenpool": (35.95537, -96.00888),
-    "goldsby": (35.14118, -97.47698),
-    "granite": (34.96228, -99.38064),
-    "grove": (36.59369, -94.76912),
-    "hall_park": (35.23701, -97.40642),
-    "harrah": (35.48951, -97.16364),
-    "hartshorne": (34.8451, -95.55748),
-    "healdton": (34.23315, -97.4878),
-    "heavener": (34.88927, -94.60078),
-    "hennessey": (36.1092, -97.89867),
-    "henryetta": (35.43983, -95.98194),
-    "hinton": (35.47144, -98.35562),
-    "hobart": (35.0295, -99.09313),
-    "holdenville": (35.08036, -96.39918),
-    "hollis": (34.68839, -99.91205),
-    "hominy": (36.41424, -96.3953),
-    "hugo": (34.01066, -95.50968),
-    "idabel": (33.89566, -94.82633),
-    "inola": (36.15121, -95.50942),
-    "jay": (36.42119, -94.7969),
-    "jenks": (36.02287, -95.96833),
-    "jones": (35.56589, -97.28698),
-    "justice": (36.29287, -95.56664),
-    "kellyville": (35.9437, -96.21361),
-    "kiefer": (35.94482, -96.06528),
-    "kingfisher": (35.86143, -97.93172),
-    "konawa": (34.95953, -96.7528),
-    "krebs": (34.92787, -95.71582),
-    "langston": (35.94505, -97.25531),
-    "laverne": (36.70975, -99.89346),
-    "lawton": (34.60869, -98.39033),
-    "lindsay": (34.8348, -97.60253),
-    "lone_grove": (34.17537, -97.26279),
-    "longtown": (35.24538, -95.51276),
-    "luther": (35.66173, -97.19559),
-    "madill": (34.09038, -96.77167),
-    "mangum": (34.872, -99.50426),
-    "mannford": (36.13341, -96.35446),
-    "marlow": (34.64813, -97.95809),
-    "maud": (35.13036, -96.77585),
-    "mcalester": (34.93343, -95.76971),
-    "mccord": (36.67847, -97.04),
-    "mcloud": (35.4359, -97.09142),
-    "medford": (36.80697, -97.73366),
-    "meeker": (35.5034, -96.9028),
-    "midwest_city": (35.44951, -97.3967),
-    "minco": (35.31284, -97.94449),
-    "moore": (35.33951, -97.4867),
-    "mooreland": (36.4392, -99.20482),
-    "mounds": (35.87648, -96.06111),
-    "muldrow": (35.4062, -94.59883),
-    "muskogee": (35.74788, -95.36969),
-    "mustang": (35.38423, -97.72449),
-    "newcastle": (35.24729, -97.59976),
-    "newkirk": (36.88225, -97.05337),
-    "nichols_hills": (35.55089, -97.54893),
-    "nicoma_park": (35.49117, -97.32309),
-    "ninnekah": (34.94785, -97.92393),
-    "noble": (35.13924, -97.39475),
-    "norman": (35.22257, -97.43948),
-    "nowata": (36.70065, -95.63803),
-    "oakhurst": (36.07537, -96.06444),
-    "oilton": (36.08451, -96.58363),
-    "okarche": (35.72588, -97.97644),
-    "okeene": (36.11615, -98.31702),
-    "okemah": (35.43259, -96.30501),
-    "oklahoma_city": (35.46756, -97.51643),
-    "okmulgee": (35.62344, -95.96055),
-    "oologah": (36.44704, -95.70832),
-    "owasso": (36.26954, -95.85471),
-    "panama": (35.16732, -94.67245),
-    "park_hill": (35.8612, -94.95884),
-    "pawhuska": (36.66784, -96.33723),
-    "pauls_valley": (34.74008, -97.22225),
-    "perkins": (35.97394, -97.03364),
-    "pink": (35.26063, -97.11975),
-    "pocola": (35.23121, -94.478),
-    "ponca_city": (36.70698, -97.08559),
-    "poteau": (35.05371, -94.62356),
-    "prague": (35.48674, -96.68502),
-    "pryor": (36.30843, -95.31691),
-    "purcell": (35.01368, -97.36114),
-    "quinton": (35.12288, -95.37109),
-    "ringling": (34.17843, -97.59253),
-    "roland": (35.4212, -94.51466),
-    "rush_springs": (34.78257, -97.95698),
-    "sallisaw": (35.46037, -94.78745),
-    "sand_springs": (36.13981, -96.10889),
-    "sapulpa": (35.9987, -96.11417),
-    "sayre": (35.29116, -99.6401),
-    "shattuck": (36.27614, -99.88276),
-    "skiatook": (36.36842, -96.00138),
-    "slaughterville": (35.08729, -97.33503),
-    "snyder": (34.65896, -98.95174),
-    "sperry": (36.29731, -95.99139),
-    "spiro": (35.24121, -94.61994),
-    "stigler": (35.25371, -95.12302),
-    "stillwater": (36.11561, -97.05837),
-    "stilwell": (35.81453, -94.62856),
-    "stroud": (35.74868, -96.65807),
-    "tahlequah": (35.91537, -94.96996),
-    "talihina": (34.75149, -95.04802),
-    "taloga": (36.03865, -98.96371),
-    "tecumseh": (35.25785, -96.93669),
-    "texanna": (35.34732, -95.43692),
-    "the_village": (35.56089, -97.55143),
-    "thomas": (35.74422, -98.74758),
-    "tishomingo": (34.23621, -96.67861),
-    "tonkawa": (36.67837, -97.31004),
-    "tulsa": (36.15398, -95.99277),
-    "turley": (36.24204, -95.97583),
-    "tuttle": (35.29089, -97.81227),
-    "verdigris": (36.23482, -95.69109),
-    "vian": (35.49843, -94.96967),
-    "vinita": (36.63869, -95.15413),
-    "wagoner": (35.95954, -95.36941),
-    "walters": (34.35981, -98.30783),
-    "warr_acres": (35.52256, -97.61893),
-    "warner": (35.49426, -95.30552),
-    "watonga": (35.84477, -98.41313),
-    "waukomis": (36.28031, -97.89811),
-    "waurika": (34.16704, -97.99754),
-    "weatherford": (35.52616, -98.70757),
-    "wetumka": (35.23759, -96.24167),
-    "wewoka": (35.15869, -96.49335),
-    "wilburton": (34.91871, -95.30914),
-    "wister": (34.96732, -94.72467),
-    "woodward": (36.43365, -99.39039),
-    "wynnewood": (34.64342, -97.16447),
-    "yale": (36.11423, -96.69919),
-    "yukon": (35.50672, -97.76254),
-    "abbottstown": (39.88649, -76.9847),
-    "aldan": (39.9215, -75.28796),
-    "atglen": (39.94927, -75.97356),
-    "biglerville": (39.93037, -77.24804),
-    "bonneauville": (39.81204, -77.13721),
-    "boothwyn": (39.83011, -75.44158),
-    "broomall": (39.9815, -75.35658),
-    "caln": (39.99094, -75.78022),
-    "carroll_valley": (39.74926, -77.38304),
-    "chambersburg": (39.93759, -77.6611),
-    "chester_heights": (39.89011, -75.47548),
-    "christiana": (39.95483, -75.99689),
-    "clifton_heights": (39.92928, -75.2963),
-    "coatesville": (39.98316, -75.82384),
-    "collingdale": (39.91178, -75.27713),
-    "colwyn": (39.91234, -75.25379),
-    "conestoga": (39.94066, -76.34635),
-    "dallastown": (39.89954, -76.64025),
-    "darby": (39.91845, -75.25907),
-    "drexel_hill": (39.94706, -75.29213),
-    "dunbar": (39.97785, -79.61448),
-    "east_berlin": (39.9376, -76.97859),
-    "east_lansdowne": (39.94567, -75.26129),
-    "east_uniontown": (39.8998, -79.69782),
-    "east_york": (39.97371, -76.68636),
-    "eddystone": (39.86011, -75.34436),
-    "fairchance": (39.8248, -79.75449),
-    "folcroft": (39.89095, -75.2838),
-    "gap": (39.98732, -76.02051),
-    "gettysburg": (39.83093, -77.2311),
-    "glen_rock": (39.79316, -76.73025),
-    "glenolden": (39.90011, -75.28907),
-    "grantley": (39.94038, -76.72913),
-    "guilford_siding": (39.86537, -77.61249),
-    "hopwood": (39.87702, -79.70199),
-    "jacobus": (39.88316, -76.71052),
-    "kennett_square": (39.84678, -75.7116),
-    "lake_heritage": (39.80954, -77.18387),
-    "lake_meade": (39.9851, -77.0372),
-    "lampeter": (39.9901, -76.23968),
-    "lima": (39.91733, -75.44047),
-    "littlestown": (39.74454, -77.08804),
-    "luzerne": (39.99924, -79.96283),
-    "marcus_hook": (39.81928, -75.41853),
-    "masontown": (39.84674, -79.89978),
-    "mcconnellsburg": (39.93259, -77.99889),
-    "mcsherrystown": (39.80732, -77.01137),
-    "media": (39.91678, -75.38769),
-    "mercersburg": (39.82787, -77.90333),
-    "meyersdale": (39.81369, -79.02475),
-    "millbourne": (39.96345, -75.25018),
-    "millersville": (39.99788, -76.35413),
-    "mont_alto": (39.84426, -77.55832),
-    "new_freedom": (39.73788, -76.70136),
-    "new_oxford": (39.86371, -77.05581),
-    "north_york": (39.97815, -76.73302),
-    "oliver": (39.91869, -79.71782),
-    "parkesburg": (39.95872, -75.91939),
-    "parkside": (39.86428, -75.37853),
-    "penn_wynne": (39.98622, -75.27546),
-    "pennsport": (39.92761, -75.15045),
-    "pennville": (39.78954, -76.99804),
-    "point_marion": (39.73897, -79.89867),
-    "prospect_park": (39.88789, -75.30824),
-    "quarryville": (39.89705, -76.16357),
-    "red_lion": (39.90093, -76.6058),
-    "ridley_park": (39.88122, -75.3238),
-    "scotland": (39.9687, -77.58721),
-    "sharon_hill": (39.9065, -75.27157),
-    "south_connellsville": (39.99674, -79.58587),
-    "south_coatesville": (39.97427, -75.81995),
-    "south_uniontown": (39.89285, -79.74699),
-    "spring_grove": (39.87454, -76.86581),
-    "spry": (39.91843, -76.68497),
-    "state_line": (39.72482, -77.72444),
-    "stewartstown": (39.75371, -76.59136),
-    "stonybrook": (39.98704, -76.64413),
-    "strasburg": (39.98316, -76.18412),
-    "susquehanna_trails": (39.75872, -76.36802),
-    "swarthmore": (39.90206, -75.34991),
-    "thorndale": (39.99288, -75.74522),
-    "toughkenamon": (39.8315, -75.75744),
-    "trainer": (39.82761, -75.41436),
-    "upland": (39.8865, -75.77439),
-    "valley_view": (39.9501, -76.70108),
-    "wayne_heights": (39.74371, -77.55388),
-    "waynesburg": (39.89646, -80.17923),
-    "weigelstown": (39.98371, -76.82247),
-    "west_chester": (39.96097, -75.60804),
-    "west_grove": (39.82205, -75.82744),
-    "west_york": (39.9526, -76.75136),
-    "wharton": (39.92678, -75.15712),
-    "whitman": (39.91678, -75.15546),
-    "willow_street": (39.97927, -76.27635),
-    "woodlyn": (39.87233, -75.33713),
-    "yoe": (39.90899, -76.63691),
-    "yeadon": (39.939, -75.25546),
-    "yorklyn": (39.99232, -76.64635),
-    "aiken": (33.56042, -81.71955),
-    "allendale": (33.00793, -81.30844),
-    "arial": (34.84595, -82.64152),
-    "awendaw": (33.03767, -79.61313),
-    "bamberg": (33.2971, -81.03482),
-    "barnwell": (33.24487, -81.35872),
-    "batesburg": (33.90792, -81.54733),
-    "batesburg_leesville": (33.91014, -81.53733),
-    "belvedere": (33.53097, -81.94484),
-    "bennettsville": (34.61738, -79.68478),
-    "bishopville": (34.21821, -80.24841),
-    "blackville": (33.35793, -81.27066),
-    "blacksburg": (35.12124, -81.51592),
-    "bluffton": (32.23715, -80.86039),
-    "blythewood": (34.21432, -80.97398),
-    "bonneau_beach": (33.31989, -80.00036),
-    "brookdale": (33.50682, -80.82342),
-    "burnettown": (33.51541, -81.849),
-    "burton": (32.43575, -80.724),
-    "calhoun_falls": (34.09234, -82.59569),
-    "cane_savannah": (33.90182, -80.45036),
-    "catawba": (34.85292, -80.91119),
-    "cayce": (33.96571, -81.07398),
-    "chapin": (34.16598, -81.34982),
-    "cheraw": (34.69766, -79.8834),
-    "city_view": (34.86151, -82.43151),
-    "clemson": (34.68344, -82.83737),
-    "clover": (35.11125, -81.22646),
-    "cowpens": (35.01679, -81.80399),
-    "dalzell": (34.01682, -80.43008),
-    "darlington": (34.29988, -79.87617),
-    "denmark": (33.32265, -81.14232),
-    "dentsville": (34.06404, -80.95815),
-    "dillon": (34.41655, -79.37116),
-    "due_west": (34.33345, -82.3879),
-    "dunean": (34.82484, -82.41929),
-    "easley": (34.82984, -82.60152),
-    "east_gaffney": (35.08013, -81.63287),
-    "east_sumter": (33.92544, -80.29619),
-    "edgefield": (33.78958, -81.92956),
-    "edisto": (33.47654, -80.8987),
-    "estill": (32.75489, -81.24205),
-    "eureka_mill": (34.71764, -81.1937),
-    "fairforest": (34.95651, -82.01011),
-    "five_forks": (34.80484, -82.22956),
-    "folly_beach": (32.65518, -79.94037),
-    "forest_acres": (34.01932, -80.98981),
-    "forestbrook": (33.72239, -78.95809),
-    "fort_mill": (35.00737, -80.94508),
-    "fountain_inn": (34.68901, -82.19567),
-    "gaffney": (35.07179, -81.64982),
-    "gantt": (34.80012, -82.42429),
-    "gloverville": (33.52597, -81.83011),
-    "golden_grove": (34.73401, -82.44374),
-    "goose_creek": (32.98101, -80.03259),
-    "graniteville": (33.56375, -81.80789),
-    "great_falls": (34.57514, -80.90202),
-    "greer": (34.93873, -82.22706),
-    "hanahan": (32.91851, -80.02203),
-    "hardeeville": (32.28714, -81.08067),
-    "hartsville": (34.37404, -80.0734),
-    "hilton_head_island": (32.19382, -80.73816),
-    "hilton_head": (32.21632, -80.75261),
-    "honea_path": (34.4465, -82.39151),
-    "homeland_park": (34.47066, -82.67069),
-    "hopkins": (33.90432, -80.87703),
-    "india_hook": (35.00737, -81.02174),
-    "inman_mills": (35.04151, -82.10428),
-    "irmo": (34.08598, -81.18315),
-    "irwin": (34.69376, -80.82229),
-    "isle_of_palms": (32.78684, -79.7948),
-    "iva": (34.3065, -82.66374),
-    "joanna": (34.41491, -81.8124),
-    "johnsonville": (33.81794, -79.44922),
-    "johnston": (33.83208, -81.80094),
-    "judson": (34.83317, -82.42762),
-    "kershaw": (34.55182, -80.58368),
-    "kiawah_island": (32.60824, -80.08482),
-    "kingstree": (33.66766, -79.83063),
-    "ladson": (32.98573, -80.10981),
-    "lake_secession": (34.28455, -82.59457),
-    "lake_wylie": (35.10848, -81.04285),
-    "lakewood": (33.84683, -80.35008),
-    "lancaster_mill": (34.70931, -80.79479),
-    "landrum": (35.17511, -82.18928),
-    "langley": (33.51791, -81.844),
-    "latta": (34.3371, -79.43116),
-    "laurel_bay": (32.45019, -80.78483),
-    "laurens": (34.49901, -82.01426),
-    "lesslie": (34.8907, -80.95647),
-    "lincolnville": (33.00684, -80.15537),
-    "little_river": (33.87323, -78.61418),
-    "loris": (34.05628, -78.8903),
-    "manning": (33.69516, -80.21091),
-    "mauldin": (34.77873, -82.31012),
-    "mccoll": (34.66877, -79.54533),
-    "mccormick": (33.91346, -82.29346),
-    "meggett": (32.71796, -80.23899),
-    "moncks_corner": (33.19632, -80.01429),
-    "mullins": (34.20572, -79.25449),
-    "murphys_estates": (33.60125, -81.94428),
-    "murrells_inlet": (33.551, -79.04143),
-    "myrtle_beach": (33.68906, -78.88669),
-    "new_ellenton": (33.42153, -81.68567),
-    "ninety_six": (34.17513, -82.02401),
-    "north_augusta": (33.5018, -81.96512),
-    "north_charleston": (32.85462, -79.97481),
-    "north_hartsville": (34.39377, -80.06951),
-    "north_myrtle_beach": (33.81601, -78.68002),
-    "northlake": (34.56622, -82.68402),
-    "orangeburg": (33.49182, -80.85565),
-    "pacolet": (34.89902, -81.76177),
-    "pageland": (34.77321, -80.39173),
-    "pamplico": (33.996, -79.57006),
-    "pineridge": (33.91043, -81.10454),
-    "port_royal": (32.37908, -80.69261),
-    "powdersville": (34.79178, -82.49291),
-    "privateer": (33.83321, -80.41425),
-    "prosperity": (34.20931, -81.53316),
-    "ravenel": (32.76323, -80.2501),
-    "red_bank": (33.93209, -81.23843),
-    "red_hill": (33.99961, -79.2581),
-    "ridgeville": (33.09572, -80.31537),
-    "roebuck": (34.87957, -81.96621),
-    "saint_andrews": (34.04543, -81.12926),
-    "saint_stephen": (33.40433, -79.92174),
-    "saluda": (34.00152, -81.77205),
-    "sangaree": (33.03545, -80.12787),
-    "sans_souci": (34.8779, -82.42401),
-    "saxon": (34.96123, -81.96733),
-    "seabrook_island": (32.57713, -80.17065),
-    "seven_oaks": (34.04876, -81.14648),
-    "shell_point": (32.38353, -80.73594),
-    "socastee": (33.6835, -78.99837),
-    "south_congaree": (33.91099, -81.13565),
-    "south_sumter": (33.90571, -80.34619),
-    "southern_shops": (34.98595, -81.99455),
-    "spartanburg": (34.94957, -81.93205),
-    "stateburg": (33.95765, -80.53481),
-    "sullivans_island": (32.76323, -79.83675),
-    "sumter": (33.92044, -80.34147),
-    "surfside_beach": (33.606, -78.97309),
-    "taylors": (34.92039, -82.29623),
-    "tega_cay": (35.02431, -81.02785),
-    "tigerville": (35.06845, -82.36845),
-    "timmonsville": (34.13488, -79.93979),
-    "travelers_rest": (34.96762, -82.44345),
-    "utica": (34.67816, -82.93154),
-    "varnville": (32.85044, -81.07927),
-    "wade_hampton": (34.90373, -82.33317),
-    "walhalla": (34.76482, -83.06404),
-    "walterboro": (32.90517, -80.66677),
-    "ware_shoals": (34.39845, -82.24679),
-    "warrenville": (33.55097, -81.804),
-    "wedgewood": (33.88377, -80.51258),
-    "wellford": (34.95095, -82.10594),
-    "west_columbia": (33.99349, -81.07398),
-    "whitmire": (34.50291, -81.61149),
-    "wilkinson_heights": (33.5021, -80.83315),
-    "winnsboro_mills": (34.36181, -81.08537),
-    "woodfield": (34.05932, -80.93092),
-    "woodruff": (34.73957, -82.03705),
-    "adamsville": (35.23591, -88.3906),
-    "alcoa": (35.78953, -83.97379),
-    "algood": (36.19589, -85.44858),
-    "apison": (35.02396, -85.02384),
-    "ashland_city": (36.27422, -87.06417),
-    "banner_hill": (36.13066, -82.42458),
-    "bartlett": (35.20453, -89.87398),
-    "baxter": (36.15367, -85.64359),
-    "bean_station": (36.3437, -83.28406),
-    "belle_meade": (36.09589, -86.85694),
-    "bells": (35.71118, -89.08756),
-    "blaine": (36.15425, -83.70407),
-    "blountville": (36.53316, -82.32681),
-    "bluff_city": (36.47427, -82.26097),
-    "bon_aqua_junction": (35.92784, -87.31084),
-    "bradford": (36.07645, -88.81006),
-    "brentwood_estates": (36.02506, -86.77917),
-    "bruceton": (36.03812, -88.24449),
-    "burns": (36.05339, -87.31251),
-    "byrdstown": (36.57451, -85.12884),
-    "caryville": (36.29897, -84.22326),
-    "celina": (36.55006, -85.50525),
-    "chattanooga": (35.04563, -85.30968),
-    "church_hill": (36.52232, -82.71349),
-    "clifton": (35.38702, -87.99531),
-    "coalfield": (36.02897, -84.42076),
-    "collegedale": (35.05313, -85.05023),
-    "collierville": (35.04204, -89.66453),
-    "colonial_heights": (36.4851, -82.5032),
-    "condon": (36.18119, -83.7938),
-    "cookeville": (36.16284, -85.50164),
-    "coopertown": (36.43755, -86.96722),
-    "cornersville": (35.36146, -86.83972),
-    "cowan": (35.16453, -86.01054),
-    "cross_plains": (36.54866, -86.69611),
-    "crump": (35.22175, -88.31809),
-    "dandridge": (36.01537, -83.41489),
-    "decaturville": (35.58424, -88.11948),
-    "decherd": (35.2098, -86.07943),
-    "dodson_branch": (36.31256, -85.5322),
-    "dresden": (36.29145, -88.70811),
-    "dyer": (36.06673, -88.99395),
-    "dyersburg": (36.03452, -89.38563),
-    "eagleton_village": (35.79508, -83.93185),
-    "east_brainerd": (34.99591, -85.15023),
-    "east_chattanooga": (35.06535, -85.24912),
-    "east_cleveland": (35.16091, -84.85772),
-    "east_ridge": (35.01424, -85.2519),
-    "elizabethton": (36.34872, -82.21069),
-    "erin": (36.31839, -87.69474),
-    "estill_springs": (35.27064, -86.12804),
-    "fairfield_glade": (36.00035, -84.88634),
-    "fairmount": (35.18146, -85.32357),
-    "fall_branch": (36.41816, -82.62376),
-    "falling_water": (35.20312, -85.25357),
-    "farragut": (35.88452, -84.15353),
-    "fincastle": (36.4098, -84.0477),
-    "forest_hills": (36.06839, -86.84417),
-    "gainesboro": (36.35561, -85.65887),
-    "gatlinburg": (35.71453, -83.51189),
-    "gleason": (36.21367, -88.61255),
-    "goodlettsville": (36.32311, -86.71333),
-    "gordonsville": (36.17256, -85.92971),
-    "green_hill": (36.22283, -86.54944),
-    "greenback": (35.66119, -84.17214),
-    "greeneville": (36.16316, -82.83099),
-    "grimsley": (36.26701, -84.9844),
-    "gruetli_laager": (35.3723, -85.61803),
-    "halls": (35.87563, -89.39618),
-    "harriman": (35.93396, -84.55244),
-    "harrogate": (36.5823, -83.65686),
-    "hickory_withe": (35.24398, -89.58869),
-    "hohenwald": (35.54785, -87.55196),
-    "hopewell": (35.23479, -84.888),
-    "huntingdon": (36.00062, -88.42811),
-    "jacksboro": (36.33008, -84.18382),
-    "jellico": (36.58786, -84.12687),
-    "johnson_city": (36.31344, -82.35347),
-    "jonesborough": (36.29427, -82.47348),
-    "kenton": (36.20229, -89.01229),
-    "kimball": (35.04786, -85.67191),
-    "kingsport": (36.54843, -82.56182),
-    "kingston_springs": (36.102, -87.11501),
-    "la_vergne": (36.01562, -86.58194),
-    "lafollette": (36.38286, -84.11993),
-    "rocky_top": (36.21786, -84.15465),
-    "lake_tansi": (35.87285, -85.0544),
-    "lakesite": (35.20868, -85.1269),
-    "lenoir_city": (35.7973, -84.25603),
-    "lone_oak": (35.20063, -85.36413),
-    "loretto": (35.07786, -87.43974),
-    "loudon": (35.73285, -84.33381),
-    "luttrell": (36.19953, -83.74185),
-    "martin": (36.3434, -88.85034),
-    "mascot": (36.0612, -83.74573),
-    "maynardville": (36.25064, -83.79741),
-    "mcewen": (36.10784, -87.63307),
-    "mckenzie": (36.13256, -88.51866),
-    "mcminnville": (35.6834, -85.76998),
-    "medina": (35.80285, -88.77478),
-    "middle_valley": (35.1959, -85.18468),
-    "midtown": (35.87952, -84.5641),
-    "millington": (35.34147, -89.89731),
-    "monteagle": (35.24008, -85.8397),
-    "monterey": (36.14756, -85.2683),
-    "mosheim": (36.18954, -82.95849),
-    "mount_juliet": (36.20005, -86.51861),
-    "new_johnsonville": (36.02117, -87.96698),
-    "new_south_memphis": (35.08676, -90.05676),
-    "new_tazewell": (36.44258, -83.59963),
-    "new_union": (35.53258, -86.08082),
-    "newbern": (36.11285, -89.26174),
-    "nolensville": (35.95229, -86.66944),
-    "norris": (36.19563, -84.06797),
-    "obion": (36.25896, -89.19174),
-    "oliver_springs": (36.04452, -84.34437),
-    "oneida": (36.49813, -84.51272),
-    "pegram": (36.10061, -87.05112),
-    "pigeon_forge": (35.78842, -83.55433),
-    "pine_crest": (36.27619, -84.12881),
-    "piperton": (35.04509, -89.62175),
-    "pleasant_view": (36.39422, -87.03667),
-    "portland": (36.58171, -86.51638),
-    "powells_crossroads": (35.18952, -85.4858),
-    "pulaski": (35.1998, -87.03084),
-    "red_boiling_springs": (36.53339, -85.84998),
-    "ridgetop": (36.39505, -86.77944),
-    "roan_mountain": (36.19623, -82.0704),
-    "rockwood": (35.86563, -84.68494),
-    "rural_hill": (36.11673, -86.47916),
-    "rutherford": (36.12757, -88.9859),
-    "rutledge": (36.28092, -83.5149),
-    "sale_creek": (35.38229, -85.10884),
-    "selmer": (35.17008, -88.59227),
-    "sevierville": (35.86815, -83.56184),
-    "sewanee": (35.20314, -85.92109),
-    "shackle_island": (36.3706, -86.61666),
-    "signal_mountain": (35.12257, -85.34385),
-    "sneedville": (36.52981, -83.2174),
-    "soddy_daisy": (35.2359, -85.19079),
-    "somerville": (35.2437, -89.35007),
-    "south_carthage": (36.242, -85.95193),
-    "south_cleveland": (35.14119, -84.87217),
-    "south_fulton": (36.50089, -88.87534),
-    "south_pittsburg": (35.0123, -85.70441),
-    "spring_city": (35.69201, -84.86078),
-    "spurgeon": (36.43955, -82.4557),
-    "surgoinsville": (36.47093, -82.85183),
-    "tazewell": (36.45425, -83.56935),
-    "tennessee_ridge": (36.312, -87.77336),
-    "thompson_s_station": (35.80201, -86.91139),
-    "three_way": (35.7759, -88.8595),
-    "tiptonville": (36.3784, -89.47202),
-    "tracy_city": (35.26036, -85.73608),
-    "tullahoma": (35.36202, -86.20943),
-    "tusculum": (36.1751, -82.75876),
-    "unicoi": (36.19539, -82.34958),
-    "vonore": (35.59008, -84.24186),
-    "walden": (35.16479, -85.30135),
-    "walnut_hill": (36.56983, -82.2568),
-    "wartburg": (36.1048, -84.59716),
-    "white_bluff": (36.10756, -87.22084),
-    "white_house": (36.47032, -86.65138),
-    "white_pine": (36.10759, -83.28683),
-    "whitwell": (35.20146, -85.51913),
-    "wildwood_lake": (35.09202, -84.85439),
-    "asherton": (28.44193, -99.76033),
-    "abram": (26.1998, -98.41113),
-    "addison": (32.96179, -96.82917),
-    "alamo_heights": (29.48495, -98.46585),
-    "aldine": (29.93245, -95.38021),
-    "aledo": (32.69596, -97.60225),
-    "alice": (27.75225, -98.06972),
-    "alief": (29.71106, -95.59633),
-    "allen": (33.10317, -96.67055),
-    "alton_north_(historical)": (26.29535, -98.30446),
-    "alvarado": (32.40653, -97.21168),
-    "alvin": (29.42385, -95.2441),
-    "alvord": (33.35845, -97.69475),
-    "ames": (31.52099, -97.77947),
-    "anahuac": (29.773, -94.6827),
-    "anderson_mill": (30.45492, -97.80584),
-    "angleton": (29.16941, -95.43188),
-    "annetta": (32.7093, -97.67614),
-    "anson": (32.7565, -99.89621),
-    "aransas_pass": (27.90947, -97.14999),
-    "archer_city": (33.59566, -98.62561),
-    "argyle": (33.12123, -97.18335),
-    "atascocita": (29.99883, -95.1766),
-    "aubrey": (33.30428, -96.98612),
-    "azle": (32.89513, -97.54586),
-    "bacliff": (29.5069, -94.99243),
-    "baird": (32.39402, -99.39424),
-    "balch_springs": (32.72874, -96.62277),
-    "balcones_heights": (29.48801, -98.55169),
-    "ballinger": (31.73821, -99.94731),
-    "bandera": (29.72661, -99.07365),
-    "bangs": (31.7171, -99.13255),
-    "barrett": (29.87995, -95.06298),
-    "barton_creek": (30.28521, -97.86917),
-    "bartonville": (33.07318, -97.13168),
-    "baytown": (29.7355, -94.97743),
-    "beach_city": (29.66217, -94.88992),
-    "beaumont": (30.08605, -94.10185),
-    "bee_cave": (30.30854, -97.94501),
-    "beeville": (28.40095, -97.74974),
-    "bellmead": (31.59405, -97.10889),
-    "bellville": (29.95023, -96.25719),
-    "benavides": (27.59892, -98.40807),
-    "benbrook": (32.67319, -97.46058),
-    "benjamin": (33.58398, -99.79231),
-    "bertram": (30.7438, -98.05558),
-    "bevil_oaks": (30.15021, -94.26963),
-    "big_sandy": (32.58375, -95.10883),
-    "bishop": (27.58614, -97.79916),
-    "blanco": (30.09799, -98.42141),
-    "blossom": (33.6615, -95.38579),
-    "boerne": (29.79466, -98.73197),
-    "bogata": (33.47067, -95.21384),
-    "boling": (29.26441, -95.94384),
-    "bolivar_peninsula": (29.47829, -94.57991),
-    "bonham": (33.57733, -96.17831),
-    "boyd": (33.07873, -97.5653),
-    "brady": (31.13517, -99.33506),
-    "brazoria": (29.04441, -95.56911),
-    "breckenridge": (32.75568, -98.90229),
-    "brenham": (30.16688, -96.39774),
-    "briar": (32.99512, -97.5428),
-    "briarcliff": (30.40742, -98.04446),
-    "brookshire": (29.78606, -95.95107),
-    "brookside_village": (29.5869, -95.32522),
-    "brownsboro": (32.30237, -95.61357),
-    "bruceville_eddy": (31.30517, -97.25167),
-    "brownwood": (31.70932, -98.99116),
-    "brushy_creek": (30.51353, -97.73973),
-    "bryan": (30.67436, -96.36996),
-    "buchanan_dam": (30.7399, -98.43114),
-    "bullard": (32.13988, -95.32023),
-    "bulverde": (29.74383, -98.45307),
-    "buna": (30.43298, -93.9624),
-    "bunker_hill_village": (29.76745, -95.52994),
-    "burkburnett": (34.09787, -98.57061),
-    "burleson": (32.54208, -97.32085),
-    "burnet": (30.75824, -98.22836),
-    "cactus": (27.90695, -99.39392),
-    "caddo_mills": (33.06567, -96.22776),
-    "calvert": (30.97797, -96.67386),
-    "cameron_park": (25.96452, -97.47665),
-    "cameron_park_colonia": (25.97147, -97.47832),
-    "camp_swift": (30.19077, -97.29221),
-    "canyon_lake": (29.87522, -98.26251),
-    "carrizo_springs": (28.52193, -99.86061),
-    "castle_hills": (29.52329, -98.51641),
-    "castroville": (29.35579, -98.87864),
-    "cedar_park": (30.5052, -97.82029),
-    "center": (31.51073, -96.4247),
-    "central_gardens": (29.99549, -94.01406),
-    "césar_chávez": (26.3034, -98.11529),
-    "channelview": (29.77606, -95.11465),
-    "chico": (33.29595, -97.79892),
-    "china": (30.04799, -94.33574),
-    "cibolo": (29.56162, -98.22696),
-    "cinco_ranch": (29.73884, -95.758),
-    "cisco": (32.38819, -98.97923),
-    "citrus_city": (26.32646, -98.3853),
-    "clear_lake_shores": (29.54745, -95.03215),
-    "cleburne": (32.34764, -97.38668),
-    "cloverleaf": (29.77828, -95.17188),
-    "clute": (29.02469, -95.39883),
-    "cockrell_hill": (32.73624, -96.88695),
-    "coldspring": (30.59242, -95.12938),
-    "coleman": (31.82737, -99.42645),
-    "college_station": (30.62798, -96.33441),
-    "colleyville": (32.88096, -97.15501),
-    "combes": (26.24869, -97.73388),
-    "combine": (32.58847, -96.5086),
-    "comfort": (29.96771, -98.90503),
-    "conroe": (30.31188, -95.45605),
-    "converse": (29.51801, -98.31612),
-    "cooper": (33.37344, -95.68829),
-    "coppell": (32.95457, -97.01501),
-    "copper_canyon": (33.09595, -97.09668),
-    "copperas_cove": (31.12406, -97.90308),
-    "corpus_christi": (27.80058, -97.39638),
-    "corrigan": (30.99686, -94.82715),
-    "corsicana": (32.09543, -96.46887),
-    "cottonwood_shores": (30.55575, -98.32391),
-    "cotulla": (28.43693, -99.23503),
-    "crandall": (32.62791, -96.45582),
-    "crockett": (31.31824, -95.45661),
-    "crosby": (29.91189, -95.06215),
-    "cross_mountain": (29.6455, -98.65947),
-    "crowell": (33.98397, -99.72482),
-    "cuero": (29.09387, -97.28916),
-    "cut_and_shoot": (30.33327, -95.35799),
-    "cypress": (29.96911, -95.69717),
-    "daingerfield": (33.03179, -94.72187),
-    "dalworthington_gardens": (32.70291, -97.15529),
-    "de_leon": (32.11097, -98.53588),
-    "decordova": (32.42986, -97.69503),
-    "desoto": (32.58986, -96.85695),
-    "denison": (33.75566, -96.53666),
-    "deweyville": (30.29771, -93.7435),
-    "diboll": (31.18713, -94.78104),
-    "dickinson": (29.46079, -95.05132),
-    "doffing": (26.27452, -98.38585),
-    "donna": (26.17035, -98.05195),
-    "doolittle": (26.35337, -98.11666),
-    "double_oak": (33.06512, -97.11057),
-    "dripping_springs": (30.19021, -98.08668),
-    "duncanville": (32.6518, -96.90834),
-    "eagle_mountain": (32.89346, -97.44446),
-    "early": (31.7421, -98.94561),
-    "east_bernard": (29.53107, -96.07107),
-    "eastland": (32.40152, -98.81756),
-    "edcouch": (26.29396, -97.96056),
-    "edgecliff_village": (32.65763, -97.34279),
-    "el_campo": (29.19664, -96.26969),
-    "el_cenizo": (27.35224, -99.49254),
-    "el_lago": (29.56356, -95.04521),
-    "electra": (34.02926, -98.91896),
-    "elkhart": (31.62517, -95.5794),
-    "elmendorf": (29.25607, -98.33279),
-    "elsa": (26.2934, -97.99306),
-    "emory": (32.87457, -95.76552),
-    "encantada_ranchito_el_calaboz": (26.03344, -97.63307),
-    "ennis": (32.32931, -96.62527),
-    "escobares": (26.41062, -98.96253),
-    "euless": (32.83707, -97.08195),
-    "evadale": (30.35493, -94.07268),
-    "everman": (32.63097, -97.28918),
-    "fair_oaks_ranch": (29.74578, -98.64336),
-    "fairchilds": (29.43135, -95.78023),
-    "falcon_lake_estates": (26.87282, -99.25531),
-    "falfurrias": (27.22699, -98.14417),
-    "fannett": (29.92605, -94.25074),
-    "farmers_branch": (32.92651, -96.89612),
-    "fate": (32.94151, -96.38137),
-    "ferris": (32.53403, -96.66555),
-    "fifth_street": (29.59829, -95.55133),
-    "flatonia": (29.68773, -97.1086),
-    "floresville": (29.13358, -98.15612),
-    "flower_mound": (33.01457, -97.09696),
-    "forest_hill": (32.67208, -97.26918),
-    "forney": (32.74818, -96.47193),
-    "fort_worth": (32.72541, -97.32085),
-    "frankston": (32.05266, -95.50635),
-    "fredericksburg": (30.2752, -98.87198),
-    "freer": (27.8828, -98.61779),
-    "fresno": (29.53885, -95.44744),
-    "friendswood": (29.5294, -95.20104),
-    "frisco": (33.15067, -96.82361),
-    "fulshear": (29.68996, -95.89968),
-    "galena_park": (29.73356, -95.23021),
-    "galveston": (29.30135, -94.7977),
-    "ganado": (29.04054, -96.51358),
-    "garden_ridge": (29.63467, -98.30529),
-    "garfield": (30.18744, -97.55778),
-    "garland": (32.91262, -96.63888),
-    "george_west": (28.3325, -98.11751),
-    "gholson": (31.701, -97.2164),
-    "giddings": (30.18272, -96.93637),
-    "gilmer": (32.72875, -94.94244),
-    "gladewater": (32.53653, -94.94272),
-    "glen_rose": (32.23459, -97.75531),
-    "glenn_heights": (32.54875, -96.85667),
-    "godley": (32.44903, -97.52669),
-    "goldthwaite": (31.44989, -98.57088),
-    "goliad": (28.66833, -97.38833),
-    "granbury": (32.44208, -97.7942),
-    "grand_prairie": (32.74596, -96.99778),
-    "grand_saline": (32.67346, -95.70941),
-    "granger": (30.71769, -97.44278),
-    "granite_shoals": (30.58908, -98.38392),
-    "grapeland": (31.49185, -95.47856),
-    "grapevine": (32.93429, -97.07807),
-    "greatwood": (29.55413, -95.67578),
-    "green_valley_farms": (26.12202, -97.56054),
-    "gregory": (27.92224, -97.28999),
-    "groves": (29.94827, -93.91712),
-    "groveton": (31.05491, -95.12577),
-    "gun_barrel_city": (32.33459, -96.15136),
-    "gunter": (33.44789, -96.74749),
-    "hallettsville": (29.44385, -96.94109),
-    "haltom_city": (32.79957, -97.26918),
-    "harker_heights": (31.08351, -97.65974),
-    "harlingen": (26.19063, -97.6961),
-    "haslet": (32.97485, -97.3478),
-    "hawkins": (32.58847, -95.20411),
-    "hearne": (30.87852, -96.59303),
-    "heath": (32.83651, -96.47499),
-    "hebbronville": (27.30688, -98.68032),
-    "hedwig_village": (29.77745, -95.51716),
-    "heidelberg": (26.19702, -97.88028),
-    "helotes": (29.57801, -98.68975),
-    "hemphill": (31.34074, -93.84685),
-    "hempstead": (30.09744, -96.07829),
-    "henrietta": (33.81732, -98.19532),
-    "hewitt": (31.46239, -97.19584),
-    "hickory_creek": (31.37879, -95.32133),
-    "hico": (31.98293, -98.03365),
-    "hidalgo": (26.10035, -98.26307),
-    "hideaway": (32.49042, -95.45746),
-    "highland_park": (32.83346, -96.79195),
-    "highland_village": (33.09179, -97.04668),
-    "highlands": (29.81884, -95.05604),
-    "hill_country_village": (29.58245, -98.49085),
-    "hilltop_lakes": (31.07935, -96.20385),
-    "hitchcock": (29.34829, -95.01604),
-    "holiday_lakes": (29.20969, -95.51689),
-    "holland": (30.87824, -97.40167),
-    "holliday": (33.81621, -98.69506),
-    "hollywood_park": (29.6005, -98.48724),
-    "hondo": (29.34746, -99.14142),
-    "honey_grove": (33.58344, -95.90997),
-    "hooks": (33.46623, -94.28853),
-    "hornsby_bend": (30.24743, -97.58333),
-    "horseshoe_bay": (30.54429, -98.37394),
-    "howe": (33.50872, -96.61221),
-    "hubbard": (31.84849, -96.79721),
-    "hudson_bend": (30.41714, -97.92918),
-    "hudson_oaks": (32.75707, -97.7067),
-    "hughes_springs": (32.99846, -94.63076),
-    "humble": (29.99883, -95.26216),
-    "hunters_creek_village": (29.77051, -95.4955),
-    "huntington": (31.27769, -94.57659),
-    "hurst": (32.82346, -97.17057),
-    "hutchins": (32.6493, -96.71305),
-    "hutto": (30.5427, -97.54667),
-    "ingleside": (27.8778, -97.21166),
-    "ingram": (30.07743, -99.24032),
-    "iowa_colony": (29.48246, -95.4155),
-    "iowa_park": (33.95148, -98.66867),
-    "irving": (32.81402, -96.94889),
-    "italy": (32.18404, -96.88472),
-    "itasca": (32.15959, -97.15001),
-    "jacinto_city": (29.76745, -95.23382),
-    "jamaica_beach": (29.18968, -94.97965),
-    "jarrell": (30.82491, -97.60445),
-    "jersey_village": (29.88772, -95.563),
-    "jewett": (31.36157, -96.14413),
-    "jollyville": (30.4427, -97.77501),
-    "jones_creek": (28.96858, -95.45522),
-    "josephine": (33.06123, -96.3072),
-    "joshua": (32.46153, -97.38807),
-    "jourdanton": (28.91803, -98.54641),
-    "junction": (30.48936, -99.77201),
-    "justin": (33.08484, -97.29613),
-    "karnes_city": (28.88498, -97.90084),
-    "kaufman": (32.58902, -96.30887),
-    "katy": (29.78579, -95.8244),
-    "keene": (32.39681, -97.3239),
-    "keller": (32.93457, -97.25168),
-    "kemah": (29.54273, -95.02048),
-    "kemp": (32.44264, -96.22998),
-    "kenedy": (28.81915, -97.84861),
-    "kennedale": (32.6468, -97.22585),
-    "kempner": (31.08101, -98.00252),
-    "kerens": (32.13321, -96.22775),
-    "kerrville": (30.04743, -99.14032),
-    "kilgore": (32.38626, -94.87577),
-    "killeen": (31.11712, -97.7278),
-    "kingwood_area": (30.03355, -95.26104),
-    "kirby": (29.46329, -98.38557),
-    "kirbyville": (30.66048, -93.89268),
-    "knox_city": (33.41815, -99.81898),
-    "kountze": (30.3716, -94.31241),
-    "krugerville": (33.28151, -96.99056),
-    "krum": (33.26151, -97.23807),
-    "kyle": (29.98911, -97.87723),
-    "la_blanca": (26.29285, -98.03778),
-    "la_coste": (29.31079, -98.81003),
-    "la_feria": (26.15896, -97.82389),
-    "la_grulla": (26.26951, -98.64725),
-    "la_homa": (26.25007, -98.36363),
-    "la_joya": (26.24702, -98.48141),
-    "la_marque": (29.36857, -94.97131),
-    "la_paloma": (26.04591, -97.66749),
-    "la_porte": (29.66578, -95.01937),
-    "la_pryor": (28.94108, -99.84978),
-    "la_vernia": (29.35635, -98.11556),
-    "la_villa": (26.29868, -97.92861),
-    "lacy_lakeview": (31.62933, -97.10278),
-    "lago_vista": (30.4602, -97.98835),
-    "laguna_heights": (26.08008, -97.25386),
-    "laguna_park": (31.85932, -97.37974),
-    "laguna_vista": (26.10091, -97.29025),
-    "lake_brownwood": (31.8357, -99.00783),
-    "lake_dallas": (33.11929, -97.02556),
-    "lake_jackson": (29.03386, -95.43439),
-    "lake_kiowa": (33.57705, -97.01306),
-    "lake_dunlap": (29.67578, -98.07223),
-    "lakehills": (29.60467, -98.94309),
-    "lakeway": (30.36377, -97.97959),
-    "lampasas": (31.06378, -98.1817),
-    "laredo": (27.50641, -99.50754),
-    "las_lomas": (26.36479, -98.7753),
-    "lasara": (26.46479, -97.91111),
-    "laureles": (26.10924, -97.49415),
-    "lavon": (33.02762, -96.43415),
-    "league_city": (29.50745, -95.09493),
-    "leakey": (29.72884, -99.76145),
-    "leander": (30.57881, -97.85307),
-    "leon_valley": (29.49523, -98.61863),
-    "leonard": (33.37955, -96.24748),
-    "liberty_city": (32.44543, -94.94855),
-    "liberty_hill": (30.66491, -97.92252),
-    "little_elm": (33.16262, -96.93751),
-    "little_river_academy": (30.98629, -97.35861),
-    "llano": (30.75935, -98.67504),
-    "llano_grande": (26.1298, -97.96806),
-    "lone_star": (33.78566, -95.38773),
-    "lopezville": (26.23813, -98.15973),
-    "lorena": (31.38656, -97.21556),
-    "los_fresnos": (26.07174, -97.47637),
-    "los_indios": (26.04924, -97.74499),
-    "lost_creek": (30.29548, -97.84445),
-    "lowry_crossing": (33.15484, -96.54721),
-    "lucas": (33.08429, -96.57666),
-    "lufkin": (31.33824, -94.7291),
-    "lyford": (26.41229, -97.78972),
-    "lytle": (29.23329, -98.79641),
-    "mabank": (32.36653, -96.10081),
-    "malakoff": (32.1696, -96.01247),
-    "manchaca": (30.14077, -97.83306),
-    "manor": (30.34076, -97.55695),
-    "manvel": (29.46274, -95.35799),
-    "marble_falls": (30.57841, -98.27507),
-    "markham": (28.96026, -96.06524),
-    "marlin": (31.30629, -96.89804),
-    "mart": (31.54239, -96.8336),
-    "martindale": (29.8455, -97.84084),
-    "mathis": (28.09446, -97.82805),
-    "mauriceville": (30.20354, -93.86628),
-    "mcallen": (26.20341, -98.23001),
-    "mckinney": (33.19762, -96.61527),
-    "mclendon_chisholm": (32.84235, -96.38054),
-    "mcqueeney": (29.59217, -98.03334),
-    "meadowlakes": (30.56245, -98.29867),
-    "meadows_place": (29.65134, -95.588),
-    "melissa": (33.28595, -96.57277),
-    "menard": (30.91767, -99.78646),
-    "mercedes": (26.1498, -97.91361),
-    "mesquite": (32.7668, -96.59916),
-    "mexia": (31.67989, -96.4822),
-    "midlothian": (32.48236, -96.99445),
-    "midway_north": (26.18776, -98.01708),
-    "midway_south": (26.15694, -98.02011),
-    "mila_doce": (26.22618, -97.95889),
-    "milam": (31.4324, -93.84574),
-    "mineola": (32.66319, -95.48829),
-    "mineral_wells": (32.80846, -98.11282),
-    "mission_bend": (29.69384, -95.66495),
-    "missouri_city": (29.61857, -95.53772),
-    "mont_belvieu": (29.84772, -94.89076),
-    "montague": (33.66483, -97.72059),
-    "monte_alto": (26.37312, -97.97167),
-    "morgans_point_resort": (31.14823, -97.46334),
-    "muenster": (33.65177, -97.37641),
-    "munday": (33.44926, -99.62286),
-    "muniz": (26.25646, -98.08945),
-    "murillo_colonia": (26.25646, -98.11334),
-    "nacogdoches": (31.60351, -94.65549),
-    "nash": (33.44235, -94.13075),
-    "nassau_bay": (29.54468, -95.09104),
-    "navasota": (30.38798, -96.08773),
-    "nederland": (29.97438, -93.9924),
-    "needville": (29.39941, -95.83773),
-    "new_braunfels": (29.703, -98.12445),
-    "new_summerfield": (31.98072, -95.09383),
-    "new_territory": (29.59412, -95.68078),
-    "new_waverly": (30.5377, -95.48328),
-    "nixon": (29.26746, -97.76444),
-    "nocona": (33.78677, -97.72586),
-    "nolanville": (31.07879, -97.60557),
-    "north_alamo": (26.2173, -98.1289),
-    "north_richland_hills": (32.8343, -97.2289),
-    "northcliff": (29.62106, -98.22473),
-    "northcrest": (31.63655, -97.09972),
-    "nurillo": (26.26702, -98.1214),
-    "oak_leaf": (32.52042, -96.85472),
-    "oak_point": (33.19012, -96.99167),
-    "oak_ridge_north": (30.16022, -95.44438),
-    "oak_trail_shores": (32.48875, -97.8342),
-    "odem": (27.95057, -97.58222),
-    "old_river_winfree": (29.86828, -94.8327),
-    "olivarez": (26.22841, -97.99223),
-    "olmito": (26.02174, -97.53415),
-    "olmos_park": (29.47884, -98.48752),
-    "onalaska": (30.80575, -95.11633),
-    "onion_creek": (30.1366, -97.78417),
-    "orange": (30.09299, -93.73655),
-    "orange_grove": (27.95668, -97.93694),
-    "ore_city": (32.80014, -94.72076),
-    "overton": (32.2746, -94.97855),
-    "ovilla": (32.52653, -96.88639),
-    "oyster_creek": (29.00302, -95.33188),
-    "paint_rock": (31.50849, -99.92008),
-    "palacios": (28.70805, -96.21747),
-    "palmer": (32.43125, -96.66777),
-    "palmhurst": (26.25841, -98.31807),
-    "palmview": (26.23341, -98.37085),
-    "palmview_south": (26.21563, -98.37863),
-    "palo_pinto": (32.76735, -98.29866),
-    "panorama_village": (30.38104, -95.49355),
-    "pantego": (32.7143, -97.1564),
-    "patton_village": (30.19299, -95.16882),
-    "pearland": (29.56357, -95.28605),
-    "pearsall": (28.89219, -99.09503),
-    "pecan_acres": (32.97013, -97.47474),
-    "pecan_grove": (29.62607, -95.73162),
-    "pecan_plantation": (32.36042, -97.67558),
-    "penitas": (26.23063, -98.44474),
-    "perezville": (26.22452, -98.40057),
-    "pflugerville": (30.43937, -97.62),
-    "pharr": (26.1948, -98.18362),
-    "pilot_point": (33.3965, -96.96056),
-    "pine_island": (30.058, -96.03746),
-    "pinewood_estates": (30.16438, -94.32158),
-    "piney_point_village": (29.75995, -95.51716),
-    "pleak": (29.48913, -95.80773),
-    "plum_grove": (32.1957, -96.98945),
-    "ponder": (33.1829, -97.28724),
-    "port_aransas": (27.83392, -97.0611),
-    "port_arthur": (29.88519, -93.94233),
-    "port_isabel": (26.07341, -97.20858),
-    "port_lavaca": (28.615, -96.62609),
-    "port_neches": (29.99132, -93.95851),
-    "port_o_connor": (28.44834, -96.40581),
-    "porter_heights": (30.15188, -95.32188),
-    "poteet": (29.04052, -98.56807),
-    "poth": (29.06969, -98.08195),
-    "pottsboro": (33.75927, -96.66944),
-    "powderly": (33.81122, -95.5244),
-    "prairie_view": (30.09327, -95.98773),
-    "premont": (27.36059, -98.12362),
-    "primera": (26.22591, -97.75805),
-    "progreso": (26.0923, -97.95722),
-    "prosper": (33.23623, -96.80111),
-    "quanah": (34.29785, -99.74037),
-    "queen_city": (33.14874, -94.15019),
-    "quinlan": (32.9104, -96.13553),
-    "rancho_alegre": (27.74169, -98.09473),
-    "rancho_viejo": (26.03952, -97.55638),
-    "ranger": (32.46985, -98.67895),
-    "raymondville": (26.48146, -97.78305),
-    "red_lick": (33.46485, -94.17103),
-    "redwater": (33.35818, -94.25436),
-    "redwood": (29.81022, -97.91139),
-    "refugio": (28.30528, -97.27527),
-    "rendon": (32.57625, -97.2414),
-    "rhome": (33.05346, -97.47197),
-    "ricardo": (27.42143, -97.85111),
-    "richardson": (32.94818, -96.72972),
-    "richland_hills": (32.81596, -97.22807),
-    "riesel": (31.47489, -96.92333),
-    "rio_bravo": (27.36419, -99.48004),
-    "rio_grande_city": (26.37979, -98.8203),
-    "rio_hondo": (26.23535, -97.58193),
-    "river_oaks": (32.77707, -97.39446),
-    "robstown": (27.7903, -97.66888),
-    "rockdale": (30.65548, -97.00137),
-    "rockwall": (32.93123, -96.45971),
-    "rollingwood": (30.27687, -97.79112),
-    "roman_forest": (30.1791, -95.16243),
-    "roma_los_saenz": (26.40506, -99.01586),
-    "rosebud": (31.07296, -96.9786),
-    "rosenberg": (29.55718, -95.80856),
-    "rosharon": (29.35218, -95.46022),
-    "round_rock": (30.50826, -97.6789),
-    "rowlett": (32.9029, -96.56388),
-    "royse_city": (32.97512, -96.33248),
-    "runaway_bay": (33.16789, -97.87837),
-    "runge": (28.88331, -97.71305),
-    "rusk": (31.79601, -95.15022),
-    "sabinal": (29.31746, -99.46644),
-    "sachse": (32.97623, -96.59527),
-    "saginaw": (32.86013, -97.36391),
-    "saint_hedwig": (29.4144, -98.20001),
-    "saint_jo": (33.69483, -97.52252),
-    "salado": (30.94713, -97.53862),
-    "sam_rayburn": (31.06408, -94.03575),
-    "san_augustine": (31.5299, -94.10603),
-    "san_benito": (26.13258, -97.6311),
-    "san_carlos": (26.29563, -98.07195),
-    "san_diego": (27.76391, -98.2389),
-    "san_juan": (26.18924, -98.15529),
-    "san_leon": (29.48329, -94.92215),
-    "san_marcos": (29.88327, -97.94139),
-    "san_saba": (31.19572, -98.7181),
-    "sanger": (33.36317, -97.1739),
-    "sansom_park": (32.80596, -97.40307),
-    "santa_anna": (31.74209, -99.32173),
-    "santa_fe": (29.37801, -95.10576),
-    "santa_rosa": (26.25674, -97.825),
-    "sarita": (27.22171, -97.78916),
-    "scenic_oaks": (29.71078, -98.67586),
-    "schertz": (29.55217, -98.26973),
-    "schulenburg": (29.6819, -96.90304),
-    "scissors": (26.1398, -98.05389),
-    "seadrift": (28.41528, -96.71359),
-    "seagoville": (32.63958, -96.53832),
-    "sealy": (29.78079, -96.15718),
-    "seguin": (29.56884, -97.96473),
-    "serenada": (30.69936, -97.69195),
-    "seven_points": (32.32042, -96.21303),
-    "shady_hollow": (30.16493, -97.86223),
-    "shady_shores": (33.16512, -97.02945),
-    "shamrock": (32.5993, -96.8875),
-    "shavano_park": (29.58495, -98.55252),
-    "sheldon": (29.868, -95.12826),
-    "shepherd": (30.49798, -94.9966),
-    "sherwood_shores": (33.85232, -96.81778),
-    "shiner": (29.42913, -97.17054),
-    "shoreacres": (29.62023, -95.00993),
-    "sienna_plantation": (29.48607, -95.508),
-    "siesta_shores": (26.8581, -99.25365),
-    "silsbee": (30.3491, -94.17796),
-    "sinton": (28.03668, -97.50916),
-    "sour_lake": (30.14021, -94.41102),
-    "south_alamo": (26.15702, -98.10862),
-    "south_houston": (29.66301, -95.23549),
-    "south_padre_island": (26.10369, -97.16469),
-    "southlake": (32.94124, -97.13418),
-    "southmayd": (33.63038, -96.76916),
-    "southside_place": (29.70606, -95.43688),
-    "splendora": (30.23299, -95.16104),
-    "spring": (30.07994, -95.41716),
-    "spring_valley": (29.78967, -95.50355),
-    "springtown": (32.96596, -97.68364),
-    "stafford": (29.61607, -95.55772),
-    "stamford": (32.94539, -99.80287),
-    "stephenville": (32.2207, -98.20226),
-    "stockdale": (29.23691, -97.96),
-    "stowell": (29.78994, -94.38324),
-    "sugar_land": (29.61968, -95.63495),
-    "sullivan_city": (26.27757, -98.56363),
-    "sunnyvale": (32.79652, -96.56082),
-    "sweeny": (29.03886, -95.69856),
-    "taft_southwest_(historical)": (27.97391, -97.40305),
-    "talty": (32.68319, -96.38554),
-    "tatum": (32.31599, -94.51659),
-    "taylor_lake_village": (29.57523, -95.05021),
-    "teague": (31.62711, -96.28386),
-    "tenaha": (31.94378, -94.24409),
-    "terrell": (32.73596, -96.27526),
-    "terrell_hills": (29.47495, -98.45085),
-    "texas_city": (29.38385, -94.9027),
-    "the_colony": (33.08901, -96.88639),
-    "the_hills": (30.34798, -97.98501),
-    "the_woodlands": (30.15799, -95.48938),
-    "three_rivers": (28.46027, -98.18251),
-    "throckmorton": (33.17872, -99.17758),
-    "tilden": (28.46194, -98.54918),
-    "timberwood_park": (29.70578, -98.47835),
-    "timpson": (31.90378, -94.3952),
-    "tom_bean": (33.52011, -96.48387),
-    "tomball": (30.09716, -95.61605),
-    "tool": (32.26792, -96.17025),
-    "trophy_club": (32.9979, -97.18362),
-    "troup": (32.1446, -95.1205),
-    "tye": (32.45762, -99.87148),
-    "tyler": (32.35126, -95.30106),
-    "uhland": (29.95772, -97.78611),
-    "universal_city": (29.54801, -98.29112),
-    "uvalde": (29.20968, -99.78617),
-    "uvalde_estates": (29.16524, -99.83228),
-    "valley_mills": (31.65933, -97.47224),
-    "van": (32.52486, -95.63718),
-    "van_alstyne": (33.4215, -96.57721),
-    "van_vleck": (29.01775, -95.8894),
-    "venus": (32.43347, -97.10251),
-    "vidor": (30.1316, -94.01545),
-    "von_ormy": (29.28913, -98.64446),
-    "waco": (31.54933, -97.14667),
-    "wake_village": (33.42679, -94.1063),
-    "waller": (30.05661, -95.9269),
-    "waskom": (32.47876, -94.05963),
-    "watauga": (32.85791, -97.25474),
-    "waxahachie": (32.38653, -96.84833),
-    "webster": (29.53773, -95.11826),
-    "weimar": (29.70301, -96.78053),
-    "wells_branch": (30.44604, -97.67945),
-    "weslaco": (26.15952, -97.99084),
-    "west": (31.80238, -97.09167),
-    "west_lake_hills": (30.29798, -97.80195),
-    "west_livingston": (30.69825, -95.00188),
-    "west_orange": (30.08215, -93.75822),
-    "west_sharyland": (26.27257, -98.32863),
-    "west_tawakoni": (32.89373, -96.02941),
-    "west_university_place": (29.71801, -95.43383),
-    "westworth": (32.75735, -97.41085),
-    "white_settlement": (32.75957, -97.45835),
-    "whitehouse": (32.22682, -95.2255),
-    "whitewright": (33.51289, -96.39248),
-    "whitney": (31.95182, -97.3214),
-    "wichita_falls": (33.91371, -98.49339),
-    "wild_peach_village": (29.08358, -95.63384),
-    "willis": (30.42493, -95.47994),
-    "willow_park": (32.76263, -97.65058),
-    "wills_point": (32.7093, -96.0083),
-    "wilmer": (32.58902, -96.68527),
-    "wimberley": (29.99744, -98.09862),
-    "windemere": (30.45909, -97.64917),
-    "windcrest": (29.51551, -98.38029),
-    "winnie": (29.82022, -94.38408),
-    "winters": (31.95653, -99.96231),
-    "wolfe_city": (33.37067, -96.06886),
-    "woodbranch": (30.18105, -95.18882),
-    "woodcreek": (30.02827, -98.11112),
-    "woodway": (31.506, -97.20501),
-    "wortham": (31.78794, -96.46248),
-    "wyldwood": (30.12938, -97.47277),
-    "wylie": (33.01512, -96.53888),
-    "yoakum": (29.28775, -97.15193),
-    "zapata": (26.90726, -99.27143),
-    "abingdon": (36.70983, -81.97735),
-    "accomac": (37.71957, -75.66548),
-    "adwolf": (36.78928, -81.58206),
-    "altavista": (37.11181, -79.28558),
-    "amelia_court_house": (37.34293, -77.98056),
-    "amherst": (37.58514, -79.05141),
-    "annandale": (38.83039, -77.19637),
-    "appalachia": (36.90676, -82.78183),
-    "apple_mountain_lake": (38.92428, -78.10139),
-    "appomattox": (37.35709, -78.82529),
-    "aquia_harbour": (38.46262, -77.38887),
-    "baileys_crossroads": (38.85039, -77.1297),
-    "bassett": (36.7593, -79.99032),
-    "basye": (38.80706, -78.79224),
-    "bealeton": (38.57179, -77.76388),
-    "belle_haven": (38.78539, -77.06303),
-    "bellwood": (37.42181, -77.43748),
-    "bensley": (37.44681, -77.44332),
-    "big_stone_gap": (36.88176, -82.7471),
-    "blackstone": (37.08043, -77.99723),
-    "bland": (37.10206, -81.1162),
-    "bluefield": (37.25262, -81.27121),
-    "bon_air": (37.52487, -77.55777),
-    "boydton": (36.66764, -78.3875),
-    "bracey": (36.59959, -78.14305),
-    "brambleton": (38.98205, -77.5386),
-    "brandermill": (37.43209, -77.64971),
-    "bridgewater": (38.38207, -78.9767),
-    "brightwood": (38.42152, -78.19361),
-    "broadlands": (39.01816, -77.52027),
-    "brookneal": (37.05014, -78.94418),
-    "buckhall": (38.73178, -77.4311),
-    "bull_run": (38.78373, -77.52055),
-    "bull_run_mountain_estates": (38.90372, -77.66166),
-    "burke": (38.79345, -77.27165),
-    "cana": (36.58958, -80.67173),
-    "cape_charles": (37.26792, -76.01743),
-    "castlewood": (36.8901, -82.27959),
-    "central_garage": (37.74403, -77.13164),
-    "chamberlayne": (37.62653, -77.42859),
-    "chantilly": (38.89428, -77.4311),
-    "charles_city": (37.34348, -77.07303),
-    "charlotte_court_house": (37.05654, -78.63833),
-    "charlottesville": (38.02931, -78.47668),
-    "chase_city": (36.79931, -78.45833),
-    "chatmoss": (36.6568, -79.81226),
-    "chesapeake": (36.81904, -76.27494),
-    "chesterfield_court_house": (37.37709, -77.50499),
-    "chilhowie": (36.79845, -81.68234),
-    "chincoteague": (37.93318, -75.37881),
-    "christiansburg": (37.12985, -80.40894),
-    "claypool_hill": (37.06261, -81.75178),
-    "clifton_forge": (37.81624, -79.82449),
-    "clintwood": (37.15011, -82.45598),
-    "coeburn": (36.94399, -82.46404),
-    "colonial_beach": (38.25457, -76.96358),
-    "countryside": (39.04094, -77.4136),
-    "courtland": (36.71626, -77.06802),
-    "crewe": (37.17321, -78.12333),
-    "crimora": (38.15402, -78.8503),
-    "crozet": (38.06958, -78.70058),
-    "culpeper": (38.47318, -77.99666),
-    "dahlgren": (38.33124, -77.05109),
-    "dale_city": (38.63706, -77.31109),
-    "deltaville": (37.55486, -76.33689),
-    "dinwiddie": (37.07793, -77.58665),
-    "dooms": (38.10902, -78.85752),
-    "dranesville": (39.00067, -77.34582),
-    "dryden": (36.77759, -82.94155),
-    "dulles_town_center": (39.03761, -77.41582),
-    "dumfries": (38.56762, -77.32804),
-    "dumbarton": (37.60376, -77.49137),
-    "dunn_loring": (38.89344, -77.22165),
-    "east_hampton": (37.03737, -76.33161),
-    "east_lexington": (37.79291, -79.42532),
-    "east_highland_park": (37.58098, -77.40693),
-    "eastville": (37.35264, -75.94576),
-    "ettrick": (37.24015, -77.42998),
-    "exmore": (37.5318, -75.82299),
-    "fairfax_station": (38.80095, -77.32554),
-    "fairlawn": (37.77624, -79.982),
-    "falls_church": (38.88233, -77.17109),
-    "ferrum": (36.92292, -80.01337),
-    "fishersville": (38.09902, -78.96919),
-    "floris": (38.93706, -77.41277),
-    "floyd": (36.91124, -80.32005),
-    "fort_lee": (37.4957, -77.33526),
-    "franconia": (38.78206, -77.14637),
-    "front_royal": (38.91817, -78.19444),
-    "galax": (36.66124, -80.92397),
-    "gate_city": (36.63788, -82.58099),
-    "glade_spring": (36.79122, -81.77123),
-    "glen_allen": (37.66598, -77.50637),
-    "gloucester_courthouse": (37.40986, -76.52662),
-    "gloucester_point": (37.25403, -76.49689),
-    "goochland": (37.68431, -77.88527),
-    "greenbriar": (38.87345, -77.40082),
-    "grottoes": (38.26735, -78.82586),
-    "grundy": (37.27789, -82.09902),
-    "hampden_sydney": (37.24237, -78.45972),
-    "hayfield": (38.75178, -77.13581),
-    "haymarket": (38.81206, -77.63638),
-    "heathsville": (37.91763, -76.47217),
-    "henry_fork": (36.96625, -79.87031),
-    "herndon": (38.96955, -77.3861),
-    "highland_springs": (37.54598, -77.32776),
-    "hillsville": (36.76263, -80.73479),
-    "hollins": (37.34125, -79.9431),
-    "hollymead": (38.11708, -78.44168),
-    "honaker": (37.01622, -81.97429),
-    "horse_pasture": (36.62847, -79.95087),
-    "hurt": (37.09264, -79.29641),
-    "hybla_valley": (38.74761, -77.08303),
-    "idylwood": (38.89511, -77.21165),
-    "independent_hill": (38.63595, -77.43776),
-    "isle_of_wight": (36.90765, -76.70773),
-    "jolivue": (38.10985, -79.07308),
-    "kenbridge": (36.96209, -78.125),
-    "kilmarnock": (37.71041, -76.37967),
-    "king_george": (38.26818, -77.18442),
-    "king_william": (37.68736, -77.01358),
-    "king_and_queen_court_house": (37.66986, -76.87746),
-    "kings_park": (38.80622, -77.24332),
-    "lake_barcroft": (38.84789, -77.15581),
-    "lake_monticello": (37.9232, -78.33473),
-    "lake_ridge": (38.68789, -77.29776),
-    "laymantown": (37.36569, -79.85754),
-    "lincolnia": (38.81845, -77.14331),
-    "linton_hall": (38.75984, -77.57499),
-    "loch_lomond": (38.78623, -77.47804),
-    "lorton": (38.70428, -77.22776),
-    "lovettsville": (39.2726, -77.63666),
-    "lovingston": (37.75986, -78.87086),
-    "lowes_island": (39.05983, -77.35221),
-    "lunenburg": (36.96098, -78.26555),
-    "luray": (38.6654, -78.45945),
-    "lyndhurst": (38.0293, -78.94502),
-    "madison_heights": (37.43098, -79.12308),
-    "manassas": (38.75095, -77.47527),
-    "manassas_park": (38.784, -77.46971),
-    "mantua": (38.85372, -77.25943),
-    "massanetta_springs": (38.4004, -78.83419),
-    "massanutten": (38.40957, -78.7378),
-    "matoaca": (37.23043, -77.47749),
-    "mclean": (38.93428, -77.17748),
-    "merrifield": (38.87428, -77.22693),
-    "merrimac": (38.45263, -78.07861),
-    "montclair": (38.61095, -77.33971),
-    "montrose": (37.5207, -77.37831),
-    "montross": (38.09513, -76.82746),
-    "motley": (37.06959, -79.34114),
-    "mount_hermon": (36.67847, -79.42225),
-    "mount_jackson": (38.74595, -78.64224),
-    "mountain_road": (36.75958, -78.98696),
-    "narrows": (37.33151, -80.81119),
-    "nellysford": (37.89042, -78.87224),
-    "new_baltimore": (38.76734, -77.72833),
-    "newington": (38.73845, -77.18498),
-    "newport_news": (37.08339, -76.46965),
-    "nokesville": (38.69873, -77.57971),
-    "norfolk": (36.84681, -76.28522),
-    "north_shore": (37.08209, -79.65836),
-    "north_springfield": (38.80428, -77.2047),
-    "oakton": (38.88095, -77.30082),
-    "occoquan": (38.68373, -77.26026),
-    "onancock": (37.7118, -75.7491),
-    "pannill_fork": (36.70903, -80.0131),
-    "passapatanzy": (38.29735, -77.31415),
-    "patrick_springs": (36.6418, -80.19505),
-    "pearisburg": (37.32673, -80.73702),
-    "pennington_gap": (36.75842, -83.02711),
-    "pimmit_hills": (38.91289, -77.20081),
-    "poquoson": (37.12237, -76.34578),
-    "portsmouth_heights": (36.82098, -76.36883),
-    "potomac_mills": (38.64595, -77.29415),
-    "powhatan": (37.54209, -77.91889),
-    "prices_fork": (37.20985, -80.49005),
-    "prince_george": (37.22043, -77.28803),
-    "purcellville": (39.13677, -77.71472),
-    "radford": (37.13179, -80.57645),
-    "raven": (37.08706, -81.85512),
-    "ravensworth": (38.804, -77.22054),
-    "reston": (38.96872, -77.3411),
-    "ruckersville": (38.23319, -78.36917),
-    "rural_retreat": (36.89373, -81.27593),
-    "rushmere": (37.06681, -76.67635),
-    "rustburg": (37.27681, -79.10085),
-    "saltville": (36.8815, -81.76206),
-    "sandston": (37.52348, -77.31581),
-    "seven_corners": (38.87206, -77.15526),
-    "shawnee_land": (39.19149, -78.34556),
-    "shawsville": (37.16847, -80.25532),
-    "shenandoah_farms": (38.98178, -78.07555),
-    "short_pump": (37.65042, -77.61249),
-    "south_boston": (36.69875, -78.9014),
-    "south_hill": (36.72653, -78.12889),
-    "south_riding": (38.92094, -77.50388),
-    "south_suffolk": (36.71709, -76.59023),
-    "spotsylvania": (38.20096, -77.58915),
-    "spotsylvania_courthouse": (38.19791, -77.58777),
-    "stanardsville": (38.29735, -78.44001),
-    "stanleytown": (36.7443, -79.96282),
-    "stephens_city": (39.08344, -78.21806),
-    "stuarts_draft": (38.03014, -79.03364),
-    "sudley": (38.79289, -77.49749),
-    "suffolk": (36.72836, -76.58496),
-    "sugarland_run": (39.03761, -77.37526),
-    "surry": (37.13793, -76.83524),
-    "sussex": (36.91515, -77.27914),
-    "tappahannock": (37.92541, -76.85913),
-    "timberlake": (37.3207, -79.25753),
-    "timberville": (38.63901, -78.77391),
-    "triangle": (38.54679, -77.33665),
-    "tuckahoe": (37.59015, -77.55638),
-    "tysons_corner": (38.91872, -77.23109),
-    "union_hall": (37.01875, -79.68642),
-    "university_center": (39.05705, -77.44415),
-    "virginia_beach": (36.85293, -75.97799),
-    "warm_springs": (38.04624, -79.79061),
-    "wattsville": (37.93401, -75.49965),
-    "weber_city": (37.75514, -78.28389),
-    "west_falls_church": (38.89094, -77.18443),
-    "west_lynchburg": (37.4032, -79.17808),
-    "west_springfield": (38.77261, -77.22109),
-    "weyers_cave": (38.28846, -78.91308),
-    "wolf_trap": (38.93983, -77.28609),
-    "woodbridge": (38.65817, -77.2497),
-    "wyndham": (37.69848, -77.61249),
-    "wytheville": (36.94845, -81.08481),
-    "yorkshire": (38.79317, -77.44777),
-    "alderson": (37.72595, -80.64202),
-    "alum_creek": (38.28676, -81.80513),
-    "ansted": (38.13622, -81.09955),
-    "barboursville": (38.40953, -82.29459),
-    "barrackville": (39.5037, -80.16675),
-    "beaver": (37.74781, -81.14352),
-    "beckley": (37.77817, -81.18816),
-    "belington": (39.0251, -79.93563),
-    "berkeley_springs": (39.6248, -78.22472),
-    "blennerhassett": (39.26369, -81.62929),
-    "bluewell": (37.31262, -81.25982),
-    "bradley": (37.86539, -81.19399),
-    "brush_fork": (37.28095, -81.25593),
-    "buckhannon": (38.99399, -80.23203),
-    "ceredo": (38.39647, -82.55877),
-    "chapmanville": (37.97371, -82.01735),
-    "charles_town": (39.28899, -77.85972),
-    "cheat_lake": (39.67202, -79.85339),
-    "clendenin": (38.48871, -81.34817),
-    "coal_city": (37.679, -81.21038),
-    "coal_fork": (38.3176, -81.52095),
-    "crab_orchard": (37.74067, -81.23066),
-    "craigsville": (38.33067, -80.65315),
-    "cross_lanes": (38.42037, -81.79068),
-    "culloden": (38.42009, -82.05542),
-    "daniels": (37.74327, -81.12408),
-    "despard": (39.2887, -80.30592),
-    "eleanor": (38.53759, -81.93236),
-    "elizabeth": (39.06341, -81.39512),
-    "elkview": (38.44288, -81.4804),
-    "fairlea": (37.78068, -80.45702),
-    "fort_ashby": (39.50315, -78.76863),
-    "gilbert_creek": (37.57594, -81.89484),
-    "glenville": (38.93426, -80.8376),
-    "grafton": (39.34092, -80.01897),
-    "granville": (39.64591, -79.98729),
-    "grantsville": (38.92342, -81.09595),
-    "hamlin": (38.2787, -82.10292),
-    "harrisville": (39.20952, -81.05178),
-    "hurricane": (38.43259, -82.02014),
-    "kenova": (38.39897, -82.57821),
-    "keyser": (39.44093, -78.97392),
-    "kingwood": (39.47176, -79.68339),
-    "lavalette": (38.32286, -82.44682),
-    "lesage": (38.50647, -82.29848),
-    "lubeck": (39.23535, -81.63124),
-    "mabscott": (37.77095, -81.20843),
-    "macarthur": (37.75845, -81.2126),
-    "mallory": (37.73066, -81.8379),
-    "mannington": (39.53092, -80.34342),
-    "marlinton": (38.22345, -80.09451),
-    "marmet": (38.24538, -81.56706),
-    "martinsburg": (39.45621, -77.96389),
-    "mcmechen": (39.98813, -80.73147),
-    "middlebourne": (39.4923, -80.90372),
-    "monongah": (39.46258, -80.21814),
-    "moorefield": (39.06233, -78.96947),
-    "moundsville": (39.92035, -80.74314),
-    "mount_hope": (37.89539, -81.16427),
-    "mullens": (37.58317, -81.38038),
-    "new_martinsville": (39.64452, -80.8576),
-    "nitro": (38.41481, -81.84402),
-    "nutter_fort": (39.26342, -80.31981),
-    "oceana": (37.69206, -81.624),
-    "paden_city": (39.60285, -80.93677),
-    "parkersburg": (39.26674, -81.56151),
-    "pennsboro": (39.28508, -80.96844),
-    "philippi": (39.15232, -80.04036),
-    "pinch": (38.40871, -81.48179),
-    "point_pleasant": (38.84453, -82.13709),
-    "rainelle": (37.96873, -80.76703),
-    "rand": (38.2826, -81.56234),
-    "ranson": (39.2951, -77.86055),
-    "ravenswood": (38.94814, -81.76096),
-    "romney": (39.34204, -78.75668),
-    "ronceverte": (37.74984, -80.46285),
-    "saint_albans": (38.38565, -81.83624),
-    "shady_spring": (37.70567, -81.09843),
-    "shannondale": (39.21705, -77.80749),
-    "shepherdstown": (39.4301, -77.80416),
-    "shinnston": (39.39564, -80.30009),
-    "sissonville": (38.52815, -81.63096),
-    "sistersville": (39.56424, -80.99594),
-    "sophia": (37.70761, -81.25066),
-    "stanaford": (37.81595, -81.15232),
-    "stonewood": (39.25092, -80.31231),
-    "summersville": (38.28122, -80.8526),
-    "sutton": (38.66454, -80.70982),
-    "teays_valley": (38.45009, -81.9293),
-    "terra_alta": (39.44565, -79.54644),
-    "tornado": (38.34287, -81.8443),
-    "wayne": (38.22147, -82.44237),
-    "webster_springs": (38.47927, -80.41342),
-    "welch": (37.43289, -81.58455),
-    "white_sulphur_springs": (37.79651, -80.29757),
-    "wiley_ford": (39.61453, -78.77502),
-    "williamson": (37.67427, -82.27736),
-    "elba": (31.41461, -86.06772),
-    "elmore": (32.53874, -86.31497),
-    "linn": (38.48587, -91.85045),
-    "villa_ridge": (38.47255, -90.8868),
-    "shaw": (33.60211, -90.77458),
-    "merchantville": (39.94734, -75.06656),
-    "oak_valley": (39.80122, -75.1624),
-    "coalgate": (34.53815, -96.21861),
-    "dilley": (28.66748, -99.17059),
-    "devine": (29.13996, -98.90531),
-    "wallis": (29.63135, -96.06524),
-    "new_kent": (37.51765, -76.97886),
-    "bay_city": (28.98276, -95.9694),
-    "wise": (36.97593, -82.57571),
-    "alabaster": (33.24428, -86.81638),
-    "albertville": (34.26783, -86.20878),
-    "alexander_city": (32.94401, -85.95385),
-    "aliceville": (33.12957, -88.15142),
-    "andalusia": (31.30808, -86.48243),
-    "anniston": (33.65983, -85.83163),
-    "arab": (34.31815, -86.49582),
-    "argo": (33.68778, -86.50051),
-    "ashford": (31.18296, -85.23632),
-    "atmore": (31.02379, -87.49387),
-    "attalla": (34.02176, -86.08859),
-    "ballplay": (34.05871, -85.80802),
-    "south_coventry": (41.7701, -72.30508),
-    "tariffville": (41.90871, -72.7601),
-    "cos_cob": (41.03343, -73.59957),
-    "coventry_lake": (41.77232, -72.33258),
-    "glendale_heights": (41.9146, -88.06486),
-    "lena": (42.37946, -89.82234),
-    "cromwell": (41.5951, -72.64537),
-    "east_falmouth": (41.57844, -70.55864),
-    "north_andover": (42.6987, -71.13506),
-    "revere": (42.40843, -71.01199),
-    "west_barnstable": (41.70566, -70.37447),
-    "alfred": (43.47647, -70.71839),
-    "danielson": (41.8026, -71.88591),
-    "rockland": (44.10369, -69.10893),
-    "inkster": (42.2942, -83.30993),
-    "edina": (40.16754, -92.17268),
-    "yardville": (40.18122, -74.66432),
-    "camillus": (43.03923, -76.3041),
-    "wayland": (42.56784, -77.58971),
-    "watervliet": (42.73008, -73.70123),
-    "east_brooklyn": (41.79677, -71.89729),
-    "cleveland_heights": (41.52005, -81.55624),
-    "genoa": (41.51811, -83.35909),
-    "east_haddam": (41.45315, -72.4612),
-    "east_hartford": (41.78232, -72.61203),
-    "east_haven": (41.27621, -72.86843),
-    "east_norwalk": (41.10565, -73.39845),
-    "brussels": (44.73611, -87.62093),
-    "ellington": (41.90399, -72.46981),
-    "gales_ferry": (41.42982, -72.08202),
-    "glastonbury": (41.71232, -72.60815),
-    "glastonbury_center": (41.70093, -72.59953),
-    "greenwich": (41.02649, -73.62846),
-    "groton": (41.3501, -72.07841),
-    "guilford": (41.28899, -72.68176),
-    "hamden": (41.39593, -72.89677),
-    "hazardville": (41.98732, -72.54481),
-    "heritage_village": (41.48565, -73.23789),
-    "higganum": (41.49704, -72.55703),
-    "jewett_city": (41.60677, -71.98091),
-    "kent": (41.72482, -73.47707),
-    "killingly_center": (41.83871, -71.86924),
-    "lake_pocotopaug": (41.59843, -72.51037),
-    "ledyard": (41.43982, -72.01424),
-    "long_hill": (41.35399, -72.0523),
-    "mansfield_city": (41.76593, -72.23369),
-    "meriden": (41.53815, -72.80704),
-    "montville_center": (41.47899, -72.15119),
-    "moodus": (41.50288, -72.45009),
-    "moosup": (41.71288, -71.88091),
-    "mystic": (41.35427, -71.96646),
-    "naugatuck": (41.48593, -73.05066),
-    "new_britain": (41.66121, -72.77954),
-    "new_canaan": (41.14676, -73.49484),
-    "new_fairfield": (41.46648, -73.48568),
-    "new_milford": (41.57704, -73.40845),
-    "new_preston": (41.6751, -73.35179),
-    "niantic": (41.32538, -72.19313),
-    "noank": (41.32788, -71.99063),
-    "north_branford": (41.3276, -72.76732),
-    "north_granby": (41.99593, -72.82954),
-    "north_grosvenor_dale": (41.98565, -71.89868),
-    "north_haven": (41.39093, -72.85954),
-    "north_stamford": (41.13815, -73.54346),
-    "norwalk": (41.1176, -73.4079),
-    "norwich": (41.52426, -72.07591),
-    "old_greenwich": (41.02287, -73.56485),
-    "old_mystic": (41.39149, -71.96174),
-    "old_saybrook": (41.29177, -72.3762),
-    "pawcatuck": (41.37732, -71.83368),
-    "pemberwick": (41.02565, -73.66068),
-    "poquonock_bridge": (41.3451, -72.0248),
-    "preston_city": (41.52899, -71.97396),
-    "putnam": (41.9151, -71.90896),
-    "quinebaug": (42.02371, -71.9498),
-    "ridgefield": (41.28148, -73.49818),
-    "salmon_brook": (41.95649, -72.79537),
-    "saybrook_manor": (41.28538, -72.39897),
-    "shelton": (41.31649, -73.09316),
-    "sherwood_manor": (42.01343, -72.56425),
-    "somers": (41.98537, -72.4462),
-    "south_windham": (41.67954, -72.17036),
-    "south_windsor": (41.82371, -72.6212),
-    "south_woodstock": (41.93899, -71.95952),
-    "southbury": (41.48148, -73.21317),
-    "southwood_acres": (41.9626, -72.57148),
-    "stafford_springs": (41.95426, -72.3023),
-    "storrs": (41.80843, -72.24952),
-    "suffield_depot": (41.98121, -72.64981),
-    "terramuggus": (41.6351, -72.47036),
-    "terryville": (41.67815, -73.01094),
-    "thompson": (41.95871, -71.86257),
-    "thompsonville": (41.99704, -72.59898),
-    "tolland": (41.87149, -72.36869),
-    "torrington": (41.80065, -73.12122),
-    "trumbull": (41.24287, -73.20067),
-    "uncasville": (41.43454, -72.1098),
-    "wallingford": (41.45704, -72.82316),
-    "waterbury": (41.55815, -73.0515),
-    "wauregan": (41.74427, -71.90924),
-    "weatogue": (41.84371, -72.82843),
-    "west_hartford": (41.76204, -72.74204),
-    "west_haven": (41.27065, -72.94705),
-    "west_simsbury": (41.87315, -72.85815),
-    "west_torrington": (41.81843, -73.14372),
-    "wethersfield": (41.71427, -72.65259),
-    "willimantic": (41.71065, -72.20813),
-    "wilton": (41.19537, -73.4379),
-    "winchester_center": (41.9001, -73.13483),
-    "windham": (41.69982, -72.15702),
-    "windsor_locks": (41.92926, -72.62731),
-    "winsted": (41.92121, -73.06011),
-    "wolcott": (41.60232, -72.98677),
-    "woodmont": (41.22815, -72.99149),
-    "ackley": (42.55415, -93.05326),
-    "akron": (42.82888, -96.55948),
-    "albia": (41.02667, -92.80575),
-    "algona": (43.06997, -94.23302),
-    "allison": (42.75275, -92.79519),
-    "alta": (42.67359, -95.29055),
-    "altoona": (41.64416, -93.46466),
-    "anamosa": (42.10834, -91.28516),
-    "ankeny": (41.72971, -93.60577),
-    "aplington": (42.58415, -92.88436),
-    "arnolds_park": (43.37274, -95.12388),
-    "asbury": (42.51445, -90.75152),
-    "atlantic": (41.4036, -95.01388),
-    "avoca": (41.47666, -95.33805),
-    "belmond": (42.84608, -93.6141),
-    "bettendorf": (41.52448, -90.51569),
-    "blue_grass": (41.50892, -90.76598),
-    "bondurant": (41.70054, -93.46216),
-    "britt": (43.09774, -93.80189),
-    "buffalo_(historical)": (41.3111, -94.00356),
-    "camanche": (41.78809, -90.25624),
-    "carroll": (42.06582, -94.86693),
-    "carter_lake": (41.29055, -95.91807),
-    "cascade": (42.29862, -91.01486),
-    "cedar_falls": (42.52776, -92.44547),
-    "cedar_rapids": (42.00833, -91.64407),
-    "chariton": (41.01389, -93.3066),
-    "clarinda": (40.73981, -95.038),
-    "clarion": (42.73164, -93.73299),
-    "clear_lake": (43.13802, -93.37937),
-    "clive": (41.60304, -93.72411),
-    "columbus_junction": (41.28003, -91.36071),
-    "conrad": (42.22471, -92.87465),
-    "coon_rapids": (41.87082, -94.67748),
-    "coralville": (41.6764, -91.58045),
-    "council_bluffs": (41.26194, -95.86083),
-    "cresco": (43.38136, -92.11405),
-    "creston": (41.0586, -94.36135),
-    "dakota_city": (42.72219, -94.19718),
-    "dallas_center": (41.68443, -93.96106),
-    "decorah": (43.30331, -91.78571),
-    "des_moines": (41.60054, -93.60911),
-    "dike": (42.46415, -92.62825),
-    "dubuque": (42.50056, -90.66457),
-    "dyersville": (42.48444, -91.12291),
-    "dysart": (42.17166, -92.3063),
-    "eagle_grove": (42.66414, -93.90439),
-    "earlham": (41.49193, -94.12412),
-    "eldora": (42.36082, -93.09965),
-    "eldridge": (41.65809, -90.58458),
-    "elk_run_heights": (42.46693, -92.25657),
-    "elkader": (42.85387, -91.40542),
-    "ely": (41.87362, -91.58518),
-    "emmetsburg": (43.11274, -94.68304),
-    "epworth": (42.445, -90.93208),
-    "estherville": (43.40163, -94.83276),
-    "evansdale": (42.46915, -92.28102),
-    "fairbank": (42.63915, -92.04712),
-    "farley": (42.44278, -91.00625),
-    "fort_dodge": (42.49747, -94.16802),
-    "fort_madison": (40.62976, -91.31515),
-    "george": (43.34386, -96.00224),
-    "gilbert": (42.10693, -93.64966),
-    "glidden": (42.05693, -94.72887),
-    "greene": (42.89581, -92.80242),
-    "grimes": (41.68832, -93.79106),
-    "grinnell": (41.74305, -92.72241),
-    "grundy_center": (42.36165, -92.76853),
-    "guthrie_center": (41.67721, -94.5033),
-    "guttenberg": (42.78582, -91.09957),
-    "hartley": (43.17997, -95.47695),
-    "hawarden": (42.99582, -96.48531),
-    "holstein": (42.48915, -95.545),
-    "hull": (43.18859, -96.13363),
-    "huxley": (41.89527, -93.60077),
-    "ida_grove": (42.34499, -95.47167),
-    "iowa_city": (41.66113, -91.53017),
-    "iowa_falls": (42.52248, -93.25131),
-    "jewell": (42.30693, -93.64022),
-    "kalona": (41.48307, -91.706),
-    "keokuk": (40.39727, -91.38487),
-    "keosauqua": (40.73031, -91.96239),
-    "kingsley": (42.58832, -95.96752),
-    "la_porte_city": (42.31499, -92.19213),
-    "lake_mills": (43.4194, -93.53327),
-    "lamoni": (40.62278, -93.93412),
-    "le_claire": (41.59864, -90.34346),
-    "le_mars": (42.79416, -96.16558),
-    "lenox": (40.88165, -94.56191),
-    "leon": (40.73972, -93.74772),
-    "lone_tree": (41.48808, -91.42599),
-    "madrid": (41.87665, -93.82328),
-    "maharishi_vedic_city": (41.05252, -91.9949),
-    "manly": (43.28718, -93.20215),
-    "manson": (42.52914, -94.53414),
-    "mapleton": (42.16582, -95.79306),
-    "maquoketa": (42.06891, -90.66569),
-    "marcus": (42.82582, -95.80751),
-    "marengo": (41.79806, -92.07074),
-    "marshalltown": (42.04943, -92.90798),
-    "mason_city": (43.15357, -93.20104),
-    "mediapolis": (41.00809, -91.16404),
-    "melcher_dallas": (41.225, -93.24132),
-    "missouri_valley": (41.55638, -95.88779),
-    "monona": (43.05165, -91.3893),
-    "mount_ayr": (40.71471, -94.23523),
-    "moville": (42.48888, -96.07252),
-    "muscatine": (41.42447, -91.04321),
-    "nashua": (42.95275, -92.5363),
-    "new_hampton": (43.05914, -92.31768),
-    "new_sharon": (41.47, -92.6513),
-    "nora_springs": (43.14275, -93.00437),
-    "north_english": (41.5139, -92.07629),
-    "north_liberty": (41.74918, -91.59795),
-    "northwood": (43.44412, -93.22104),
-    "oelwein": (42.67332, -91.9135),
-    "onawa": (42.02665, -96.09724),
-    "osage": (43.28414, -92.81103),
-    "ottumwa": (41.02001, -92.4113),
-    "palo": (42.06611, -91.79546),
-    "panora": (41.69165, -94.36302),
-    "park_view": (41.6942, -90.54569),
-    "paullina": (42.97915, -95.68807),
-    "pella": (41.40805, -92.91631),
-    "peosta": (42.45056, -90.85041),
-    "postville": (43.0847, -91.5682),
-    "prairie_city": (41.59943, -93.23521),
-    "primghar": (43.08692, -95.62723),
-    "reinbeck": (42.3236, -92.59936),
-    "remsen": (42.81471, -95.97335),
-    "robins": (42.07111, -91.66684),
-    "rock_rapids": (43.42719, -96.17586),
-    "rock_valley": (43.20526, -96.29503),
-    "rockwell_city": (42.39526, -94.63387),
-    "sac_city": (42.4222, -94.98971),
-    "saint_ansgar": (43.3783, -92.91881),
-    "sanborn": (43.18164, -95.65557),
-    "saylorville": (41.6786, -93.62966),
-    "sergeant_bluff": (42.40388, -96.35864),
-    "shell_rock": (42.71026, -92.58297),
-    "sidney": (40.74833, -95.6475),
-    "sigourney": (41.33334, -92.20463),
-    "sioux_center": (43.07971, -96.17558),
-    "sioux_city": (42.49999, -96.40031),
-    "solon": (41.80723, -91.49406),
-    "spirit_lake": (43.42218, -95.10222),
-    "state_center": (42.01665, -93.16354),
-    "storm_lake": (42.64109, -95.20972),
-    "story_city": (42.18721, -93.59577),
-    "strawberry_point": (42.6836, -91.53403),
-    "tama": (41.96666, -92.57686),
-    "tiffin": (41.70585, -91.66295),
-    "traer": (42.1936, -92.46547),
-    "tripoli": (42.80804, -92.25823),
-    "university_heights": (41.65502, -91.55684),
-    "urbandale": (41.62666, -93.71217),
-    "van_meter": (41.53193, -93.95412),
-    "villisca": (40.92971, -94.97609),
-    "walcott": (41.58475, -90.77209),
-    "walford": (41.87834, -91.83462),
-    "wapello": (41.18142, -91.18543),
-    "waukee": (41.61166, -93.88523),
-    "waukon": (43.26942, -91.4757),
-    "webster_city": (42.46942, -93.81605),
-    "wellman": (41.46418, -91.83823),
-    "west_branch": (41.67141, -91.34655),
-    "west_burlington": (40.82504, -91.15654),
-    "west_des_moines": (41.57721, -93.71133),
-    "windsor_heights": (41.59777, -93.70828),
-    "winterset": (41.33082, -94.01384),
-    "albany_park": (41.96836, -87.72339),
-    "alsip": (41.66892, -87.73866),
-    "amboy": (41.7142, -89.32871),
-    "antioch": (42.47724, -88.09564),
-    "arlington_heights": (42.08836, -87.98063),
-    "astoria": (40.22754, -90.35957),
-    "bannockburn": (42.19336, -87.86646),
-    "barrington_hills": (42.14475, -88.15563),
-    "beach_park": (42.42224, -87.8573),
-    "beardstown": (40.01755, -90.42429),
-    "beecher": (41.34059, -87.62143),
-    "belmont_cragin": (41.9317, -87.76867),
-    "belvidere": (42.26391, -88.84427),
-    "bensenville": (41.95503, -87.94007),
-    "berwyn": (41.85059, -87.79367),
-    "big_rock": (41.76392, -88.54702),
-    "blue_island": (41.65726, -87.68005),
-    "bolingbrook": (41.69864, -88.0684),
-    "boulder_hill": (41.71253, -88.33618),
-    "bourbonnais": (41.15376, -87.88754),
-    "braidwood": (41.26503, -88.21228),
-    "bridgeview": (41.75003, -87.80422),
-    "brighton_park": (41.81892, -87.69894),
-    "broadview": (41.86392, -87.85339),
-    "buffalo_grove": (42.15141, -87.95979),
-    "bull_valley": (42.32058, -88.35509),
-    "burbank": (41.73392, -87.7795),
-    "burnham": (41.63892, -87.55671),
-    "burr_ridge": (41.74892, -87.91839),
-    "calumet_city": (41.61559, -87.52949),
-    "calumet_park": (41.66281, -87.6606),
-    "camp_point": (40.03921, -91.0693),
-    "capron": (42.39974, -88.74038),
-    "carbon_cliff": (41.49476, -90.39068),
-    "carol_stream": (41.91253, -88.13479),
-    "carpentersville": (42.12114, -88.25786),
-    "catlin": (40.06504, -87.70197),
-    "champaign": (40.11642, -88.24338),
-    "channahon": (41.42948, -88.22867),
-    "channel_lake": (42.47863, -88.13759),
-    "chebanse": (41.00309, -87.9081),
-    "chenoa": (40.7417, -88.71979),
-    "cherry_valley": (42.23474, -88.94899),
-    "chicago": (41.85003, -87.65005),
-    "chicago_heights": (41.50615, -87.6356),
-    "chicago_lawn": (41.77503, -87.69644),
-    "chicago_ridge": (41.70142, -87.77922),
-    "cicero": (41.84559, -87.75394),
-    "clarendon_hills": (41.79753, -87.95478),
-    "coal_valley": (41.42865, -90.46096),
-    "colchester": (40.42643, -90.79263),
-    "colona": (41.48392, -90.35318),
-    "cortland": (41.92003, -88.6887),
-    "crest_hill": (41.55475, -88.09867),
-    "crete": (41.44448, -87.63143),
-    "crystal_lawns": (41.57031, -88.15812),
-    "danvers": (40.52948, -89.17731),
-    "davis_junction": (42.10169, -89.09316),
-    "dekalb": (41.92947, -88.75036),
-    "deerfield": (42.17114, -87.84451),
-    "delavan": (40.37254, -89.54732),
-    "depue": (41.3242, -89.30675),
-    "des_plaines": (42.03336, -87.8834),
-    "diamond": (41.28864, -88.25173),
-    "dixmoor": (41.6317, -87.66088),
-    "dolton": (41.63892, -87.60727),
-    "downers_grove": (41.80892, -88.01117),
-    "durand": (42.4364, -89.33206),
-    "dwight": (41.09448, -88.42506),
-    "earlville": (41.58948, -88.92203),
-    "east_dundee": (42.09891, -88.27147),
-    "east_dubuque": (42.49223, -90.64291),
-    "east_garfield_park": (41.88087, -87.70283),
-    "east_hazel_crest": (41.57365, -87.64643),
-    "east_moline": (41.50087, -90.4443),
-    "east_peoria": (40.66615, -89.5801),
-    "el_paso": (40.7392, -89.01646),
-    "elburn": (41.89225, -88.4723),
-    "elk_grove_village": (42.00392, -87.97035),
-    "elmhurst": (41.89947, -87.94034),
-    "elmwood_park": (41.92114, -87.80923),
-    "evanston": (42.04114, -87.69006),
-    "evergreen_park": (41.72059, -87.70172),
-    "fairbury": (40.74726, -88.51478),
-    "farmer_city": (40.24337, -88.64257),
-    "fisher": (40.31476, -88.35005),
-    "flanagan": (40.87809, -88.86118),
-    "flossmoor": (41.54281, -87.68477),
-    "ford_heights": (41.50642, -87.59171),
-    "forest_lake": (42.20752, -88.05563),
-    "forrest": (40.75198, -88.41116),
-    "forreston": (42.12614, -89.57928),
-    "fox_lake": (42.39669, -88.1837),
-    "fox_lake_hills": (42.40808, -88.13175),
-    "fox_river_grove": (42.20086, -88.21453),
-    "frankfort_square": (41.51892, -87.8031),
-    "franklin_park": (41.93531, -87.86562),
-    "gage_park": (41.79503, -87.69616),
-    "gages_lake": (42.35169, -87.98258),
-    "galesburg": (40.94782, -90.37124),
-    "galva": (41.16754, -90.04261),
-    "geneseo": (41.44809, -90.15428),
-    "germantown_hills": (40.76643, -89.46787),
-    "gibson_city": (40.45843, -88.3846),
-    "gilberts": (42.10336, -88.37286),
-    "gilman": (40.7667, -87.99226),
-    "glasford": (40.57254, -89.81344),
-    "glen_ellyn": (41.87753, -88.06701),
-    "glenview": (42.06975, -87.78784),
-    "goodings_grove": (41.6292, -87.93089),
-    "grand_boulevard": (41.81392, -87.61727),
-    "grandwood_park": (42.39308, -87.98674),
-    "grant_park": (41.24114, -87.64615),
-    "grayslake": (42.34447, -88.04175),
-    "green_oaks": (42.29002, -87.90341),
-    "green_rock": (41.47309, -90.35763),
-    "gridley": (40.74337, -88.88146),
-    "gurnee": (42.3703, -87.90202),
-    "hainesville": (42.34502, -88.06786),
-    "hampshire": (42.0978, -88.53036),
-    "hanna_city": (40.6917, -89.79511),
-    "hanover_park": (41.99947, -88.14507),
-    "harvard": (42.42224, -88.61371),
-    "harwood_heights": (41.96725, -87.80756),
-    "hawthorn_woods": (42.21697, -88.04952),
-    "hazel_crest": (41.5717, -87.69449),
-    "hennepin": (41.2542, -89.34231),
-    "henry": (41.11142, -89.35648),
-    "herscher": (41.0492, -88.09783),
-    "heyworth": (40.31337, -88.97369),
-    "highwood": (42.19975, -87.80923),
-    "hillcrest": (41.95114, -89.06454),
-    "hillside": (41.87781, -87.90284),
-    "hinckley": (41.76892, -88.64091),
-    "hinsdale": (41.80086, -87.93701),
-    "hodgkins": (41.76892, -87.85783),
-    "hoffman_estates": (42.04281, -88.0798),
-    "homer_glen": (41.60003, -87.93811),
-    "hometown": (41.73448, -87.73144),
-    "hoopeston": (40.46726, -87.66836),
-    "huntley": (42.16808, -88.42814),
-    "hyde_park": (41.7942, -87.59394),
-    "indian_head_park": (41.77031, -87.90228),
-    "ingalls_park": (41.52253, -88.04283),
-    "irving_park": (41.95336, -87.73645),
-    "island_lake": (42.27613, -88.19203),
-    "johnsburg": (42.38002, -88.24203),
-    "joliet": (41.52519, -88.0834),
-    "kankakee": (41.12003, -87.86115),
-    "kenilworth": (42.08586, -87.71756),
-    "kewanee": (41.24559, -89.92483),
-    "kildeer": (42.17058, -88.04785),
-    "kirkland": (42.09253, -88.85121),
-    "knollwood": (42.28613, -87.88563),
-    "la_grange_park": (41.83475, -87.86173),
-    "la_harpe": (40.58337, -90.96931),
-    "la_salle": (41.33337, -89.09175),
-    "lacon": (41.02476, -89.4112),
-    "ladd": (41.38253, -89.21897),
-    "lake_barrington": (42.21252, -88.15258),
-    "lake_bluff": (42.27891, -87.83424),
-    "lake_catherine": (42.47919, -88.13342),
-    "lake_summerset": (42.45446, -89.38956),
-    "lake_villa": (42.41697, -88.07397),
-    "lake_zurich": (42.19697, -88.09341),
-    "lake_in_the_hills": (42.18169, -88.33036),
-    "lake_of_the_woods": (40.20642, -88.36867),
-    "lakemoor": (42.32863, -88.19897),
-    "lakewood_shores": (41.2817, -88.14478),
-    "lanark": (42.10225, -89.83345),
-    "le_roy": (40.35198, -88.76424),
-    "lemont": (41.67364, -88.00173),
-    "lewistown": (40.3931, -90.15484),
-    "libertyville": (42.28308, -87.95313),
-    "lily_lake": (41.94892, -88.47786),
-    "lincoln_park": (41.9217, -87.64783),
-    "lincoln_square": (41.97587, -87.68922),
-    "lincolnshire": (42.19002, -87.9084),
-    "lincolnwood": (42.00448, -87.73006),
-    "lindenhurst": (42.41058, -88.02619),
-    "lisle": (41.80114, -88.07479),
-    "logan_square": (41.92337, -87.69922),
-    "lombard": (41.88003, -88.00784),
-    "long_grove": (42.17836, -87.99785),
-    "long_lake": (42.37085, -88.12758),
-    "loves_park": (42.32002, -89.05816),
-    "lower_west_side": (41.8542, -87.66561),
-    "lynwood": (41.52642, -87.53865),
-    "machesney_park": (42.34724, -89.039),
-    "mackinaw": (40.53698, -89.35759),
-    "macomb": (40.45921, -90.6718),
-    "mahomet": (40.19531, -88.40422),
-    "malta": (41.92975, -88.86092),
-    "manito": (40.42587, -89.77928),
-    "manteno": (41.25059, -87.83143),
-    "maple_park": (41.90753, -88.59925),
-    "maroa": (40.03643, -88.95703),
-    "marquette_heights": (40.61754, -89.60038),
-    "marseilles": (41.33087, -88.70813),
-    "matteson": (41.50392, -87.7131),
-    "maywood": (41.8792, -87.84312),
-    "mccullom_lake": (42.36835, -88.29259),
-    "mchenry": (42.33335, -88.26675),
-    "mckinley_park": (41.8317, -87.67366),
-    "mendota": (41.54725, -89.11759),
-    "merrionette_park": (41.6842, -87.70033),
-    "metamora": (40.79059, -89.36064),
-    "minier": (40.43365, -89.31315),
-    "minonk": (40.90448, -89.03452),
-    "minooka": (41.45531, -88.26173),
-    "mokena": (41.52614, -87.88922),
-    "moline": (41.5067, -90.51513),
-    "momence": (41.1667, -87.66281),
-    "monee": (41.42003, -87.74171),
-    "monmouth": (40.91143, -90.64736),
-    "morgan_park": (41.69031, -87.66672),
-    "morrison": (41.80975, -89.96512),
-    "morton_grove": (42.04059, -87.78256),
-    "mount_carroll": (42.09502, -89.97818),
-    "mount_greenwood": (41.69809, -87.70866),
-    "mount_morris": (42.05031, -89.43122),
-    "mount_prospect": (42.06642, -87.93729),
-    "mount_pulaski": (40.01088, -89.28231),
-    "mundelein": (42.26308, -88.00397),
-    "naperville": (41.78586, -88.14729),
-    "nauvoo": (40.55004, -91.38487),
-    "near_north_side": (41.90003, -87.6345),
-    "near_south_side": (41.8567, -87.62477),
-    "new_city": (41.80753, -87.65644),
-    "new_lenox": (41.51198, -87.96561),
-    "niles": (42.01892, -87.80284),
-    "normal": (40.5142, -88.99063),
-    "norridge": (41.96336, -87.82728),
-    "north_aurora": (41.80614, -88.3273),
-    "north_barrington": (42.2078, -88.14063),
-    "north_center": (41.95392, -87.67895),
-    "north_chicago": (42.32558, -87.84118),
-    "north_lawndale": (41.86003, -87.71839),
-    "north_pekin": (40.61504, -89.62232),
-    "north_peoria": (40.71754, -89.58426),
-    "north_riverside": (41.84281, -87.82311),
-    "oak_brook": (41.83281, -87.92895),
-    "oak_forest": (41.60281, -87.74394),
-    "oak_lawn": (41.71087, -87.75811),
-    "oakbrook_terrace": (41.85003, -87.96451),
-    "oakwood_hills": (42.24641, -88.24286),
-    "oglesby": (41.29531, -89.05953),
-    "olympia_fields": (41.51337, -87.67421),
-    "onarga": (40.71504, -88.00615),
-    "oquawka": (40.93198, -90.94709),
-    "orion": (41.35476, -90.38152),
-    "orland_hills": (41.58531, -87.84311),
-    "orland_park": (41.63031, -87.85394),
-    "palatine": (42.1103, -88.03424),
-    "palos_heights": (41.66809, -87.79644),
-    "palos_hills": (41.6967, -87.817),
-    "palos_park": (41.66725, -87.83033),
-    "park_forest": (41.49142, -87.67449),
-    "park_ridge": (42.01114, -87.84062),
-    "paxton": (40.46031, -88.09532),
-    "pecatonica": (42.31391, -89.35928),
-    "pekin": (40.56754, -89.64066),
-    "peoria": (40.69365, -89.58899),
-    "peoria_heights": (40.74726, -89.57398),
-    "peotone": (41.33226, -87.78532),
-    "peru": (41.32753, -89.12897),
-    "philo": (40.00698, -88.1581),
-    "phoenix": (41.61115, -87.63477),
-    "pingree_grove": (42.06864, -88.41342),
-    "pistakee_highlands": (42.40863, -88.20648),
-    "polo": (41.98614, -89.57928),
-    "pontiac": (40.88087, -88.62978),
-    "poplar_grove": (42.36835, -88.82205),
-    "port_barrington": (42.24252, -88.20203),
-    "port_byron": (41.60642, -90.33541),
-    "portage_park": (41.95781, -87.76506),
-    "posen": (41.6317, -87.68144),
-    "preston_heights": (41.4917, -88.08172),
-    "prophetstown": (41.67142, -89.93622),
-    "prospect_heights": (42.0953, -87.93757),
-    "rantoul": (40.30837, -88.15588),
-    "richton_park": (41.48448, -87.70338),
-    "river_forest": (41.89781, -87.81395),
-    "river_grove": (41.92586, -87.83589),
-    "riverwoods": (42.16753, -87.89701),
-    "rock_falls": (41.77975, -89.689),
-    "rockton": (42.45252, -89.07233),
-    "rogers_park": (42.00864, -87.66672),
-    "rolling_meadows": (42.08419, -88.01313),
-    "romeoville": (41.64753, -88.08951),
-    "roscoe": (42.41335, -89.00927),
-    "roselle": (41.98475, -88.07979),
-    "rosemont": (41.99531, -87.88451),
-    "round_lake": (42.35336, -88.09341),
-    "round_lake_beach": (42.37169, -88.09008),
-    "round_lake_heights": (42.38002, -88.10425),
-    "round_lake_park": (42.35697, -88.07675),
-    "saint_anne": (41.02503, -87.71392),
-    "sandwich": (41.64586, -88.62174),
-    "sauk_village": (41.48837, -87.56754),
-    "savanna": (42.09447, -90.15679),
-    "savoy": (40.05475, -88.25172),
-    "schaumburg": (42.03336, -88.08341),
-    "schiller_park": (41.95586, -87.8709),
-    "shorewood": (41.52003, -88.20173),
-    "silvis": (41.51226, -90.41513),
-    "skokie": (42.03336, -87.73339),
-    "sleepy_hollow": (42.09419, -88.30258),
-    "somonauk": (41.63364, -88.68119),
-    "south_barrington": (42.09142, -88.12174),
-    "south_beloit": (42.49307, -89.03678),
-    "south_chicago": (41.73977, -87.55425),
-    "south_chicago_heights": (41.48087, -87.63782),
-    "south_elgin": (41.99419, -88.2923),
-    "south_holland": (41.60087, -87.60699),
-    "south_lawndale": (41.84364, -87.71255),
-    "south_pekin": (40.49448, -89.65177),
-    "steger": (41.47003, -87.63643),
-    "stickney": (41.82142, -87.78283),
-    "stillman_valley": (42.10725, -89.17927),
-    "stone_park": (41.90559, -87.88367),
-    "streamwood": (42.02558, -88.17841),
-    "streator": (41.12087, -88.83535),
-    "sugar_grove": (41.76142, -88.44369),
-    "sycamore": (41.98892, -88.68675),
-    "third_lake": (42.37391, -88.01091),
-    "thomasboro": (40.2417, -88.18421),
-    "thornton": (41.56809, -87.6081),
-    "tilton": (40.09531, -87.64752),
-    "tinley_park": (41.57337, -87.78449),
-    "toluca": (41.00226, -89.13342),
-    "toulon": (41.09365, -89.86483),
-    "tower_lake": (42.23197, -88.15202),
-    "tremont": (40.52754, -89.4926),
-    "twin_grove": (40.49337, -89.0798),
-    "uptown": (41.9659, -87.65262),
-    "venetian_village": (42.39863, -88.05258),
-    "vernon_hills": (42.21947, -87.97952),
-    "villa_park": (41.88975, -87.98895),
-    "volo": (42.32613, -88.16786),
-    "wadsworth": (42.42863, -87.92397),
-    "walnut": (41.5567, -89.59343),
-    "wasco": (41.93808, -88.40452),
-    "washburn": (40.9192, -89.2912),
-    "waterman": (41.7717, -88.77369),
-    "watseka": (40.77615, -87.73642),
-    "wauconda": (42.25891, -88.13925),
-    "waukegan": (42.36363, -87.84479),
-    "west_chicago": (41.88475, -88.20396),
-    "west_dundee": (42.09808, -88.28286),
-    "west_elsdon": (41.79392, -87.7245),
-    "west_englewood": (41.77809, -87.66672),
-    "west_garfield_park": (41.88059, -87.72922),
-    "west_lawn": (41.77281, -87.72227),
-    "west_peoria": (40.69254, -89.62788),
-    "west_ridge": (41.99975, -87.69284),
-    "west_town": (41.89381, -87.67493),
-    "western_springs": (41.80975, -87.90062),
-    "westmont": (41.79586, -87.97562),
-    "wheeling": (42.13919, -87.92896),
-    "willowbrook": (41.76975, -87.93589),
-    "wilmette": (42.07225, -87.72284),
-    "winnebago": (42.26613, -89.24122),
-    "winnetka": (42.10808, -87.7359),
-    "winthrop_harbor": (42.47891, -87.82368),
-    "wonder_lake": (42.3853, -88.34731),
-    "wood_dale": (41.96336, -87.97896),
-    "woodridge": (41.74697, -88.05034),
-    "worth": (41.68975, -87.79728),
-    "yorkville": (41.64114, -88.44729),
-    "zion": (42.44613, -87.83285),
-    "angola": (41.63477, -84.99941),
-    "argos": (41.2378, -86.21465),
-    "attica": (40.2942, -87.2489),
-    "avilla": (41.36588, -85.23886),
-    "bass_lake": (41.20726, -86.60196),
-    "battle_ground": (40.50837, -86.84168),
-    "berne": (40.65782, -84.95191),
-    "brookston": (40.60281, -86.86723),
-    "burns_harbor": (41.62587, -87.13337),
-    "cedar_lake": (41.36476, -87.44115),
-    "chesterton": (41.61059, -87.0642),
-    "churubusco": (41.2306, -85.31942),
-    "columbia_city": (41.15727, -85.48831),
-    "crawfordsville": (40.04115, -86.87445),
-    "crown_point": (41.41698, -87.36531),
-    "culver": (41.21893, -86.42306),
-    "demotte": (41.19504, -87.19864),
-    "delphi": (40.58754, -86.67501),
-    "east_chicago": (41.6392, -87.45476),
-    "farmland": (40.18782, -85.12747),
-    "fish_lake": (41.56671, -86.55196),
-    "fort_wayne": (41.1306, -85.12886),
-    "fowler": (40.6167, -87.32085),
-    "frankton": (40.22282, -85.77887),
-    "garrett": (41.34949, -85.13553),
-    "gary": (41.59337, -87.34643),
-    "gas_city": (40.48726, -85.61303),
-    "goodland": (40.76337, -87.29363),
-    "grabill": (41.21088, -84.96691),
-    "greentown": (40.47809, -85.96665),
-    "griffith": (41.52837, -87.42365),
-    "gulivoire_park": (41.61338, -86.24528),
-    "hartford_city": (40.45115, -85.36997),
-    "hudson_lake": (41.71032, -86.53419),
-    "huntertown": (41.22838, -85.17247),
-    "indian_heights": (40.42726, -86.12555),
-    "kendallville": (41.44144, -85.26498),
-    "kentland": (40.77032, -87.4453),
-    "kingsford_heights": (41.4806, -86.69169),
-    "kokomo": (40.48643, -86.1336),
-    "koontz_lake": (41.4181, -86.48585),
-    "kouts": (41.31671, -87.02586),
-    "knox": (41.29588, -86.62501),
-    "laporte": (41.6106, -86.72252),
-    "lake_dalecarlia": (41.33087, -87.39476),
-    "lake_station": (41.57504, -87.23892),
-    "lakes_of_the_four_seasons": (41.41032, -87.21309),
-    "lapel": (40.06837, -85.84831),
-    "leo_cedarville": (41.21255, -85.01664),
-    "ligonier": (41.46588, -85.58748),
-    "lynn": (40.04977, -84.93969),
-    "markle": (40.82462, -85.33884),
-    "merrillville": (41.48281, -87.33281),
-    "michigan_city": (41.70754, -86.89503),
-    "mishawaka": (41.66199, -86.15862),
-    "monon": (40.86782, -86.8789),
-    "montpelier": (40.55393, -85.27747),
-    "morocco": (40.94615, -87.45336),
-    "muncie": (40.19338, -85.38636),
-    "munster": (41.56448, -87.51254),
-    "nappanee": (41.44283, -86.00139),
-    "new_chicago": (41.55837, -87.27448),
-    "noblesville": (40.04559, -86.0086),
-    "north_judson": (41.21504, -86.77585),
-    "north_manchester": (41.0006, -85.7686),
-    "north_webster": (41.3256, -85.69776),
-    "ogden_dunes": (41.62281, -87.1917),
-    "ossian": (40.8806, -85.16636),
-    "otterbein": (40.49059, -87.0964),
-    "parker_city": (40.18893, -85.20413),
-    "pierceton": (41.20032, -85.70554),
-    "portage": (41.57587, -87.17615),
-    "porter": (41.61559, -87.0742),
-    "redkey": (40.34893, -85.14997),
-    "remington": (40.76087, -87.15085),
-    "rensselaer": (40.9367, -87.15086),
-    "rome_city": (41.49616, -85.37665),
-    "roselawn": (41.1417, -87.31475),
-    "russiaville": (40.41754, -86.27138),
-    "schererville": (41.47892, -87.45476),
-    "shadeland": (40.37365, -86.9489),
-    "simonton_lake": (41.75422, -85.975),
-    "south_bend": (41.68338, -86.25001),
-    "south_haven": (41.54198, -87.13726),
-    "south_whitley": (41.08477, -85.62804),
-    "sweetser": (40.57198, -85.76915),
-    "syracuse": (41.42783, -85.75249),
-    "thorntown": (40.12948, -86.60667),
-    "trail_creek": (41.69837, -86.8592),
-    "tri_lakes": (41.24588, -85.44192),
-    "veedersburg": (40.11309, -87.26251),
-    "wabash": (40.79782, -85.82054),
-    "wakarusa": (41.53616, -86.02083),
-    "walkerton": (41.46671, -86.48307),
-    "wanatah": (41.4306, -86.89836),
-    "west_lafayette": (40.42587, -86.90807),
-    "westfield": (40.04282, -86.12749),
-    "whiting": (41.67976, -87.49449),
-    "winamac": (41.05143, -86.60306),
-    "winona_lake": (41.22727, -85.82193),
-    "wolcottville": (41.52588, -85.36665),
-    "woodburn": (41.12533, -84.8533),
-    "abington": (42.10482, -70.94532),
-    "acton": (42.48509, -71.43284),
-    "acushnet": (41.68066, -70.90782),
-    "adams": (42.62425, -73.1176),
-    "agawam": (42.06954, -72.61481),
-    "amesbury": (42.85842, -70.93005),
-    "amherst_center": (42.37537, -72.51925),
-    "ashburnham": (42.6362, -71.90785),
-    "ashby": (42.67787, -71.82035),
-    "ashfield": (42.52647, -72.78843),
-    "assonet": (41.79594, -71.06782),
-    "athol": (42.59592, -72.22675),
-    "attleboro": (41.94454, -71.28561),
-    "ayer": (42.5612, -71.58979),
-    "baldwinville": (42.60842, -72.07591),
-    "barnstable": (41.70011, -70.29947),
-    "barre": (42.42287, -72.10508),
-    "becket": (42.33203, -73.08288),
-    "belchertown": (42.27704, -72.40092),
-    "bellingham": (42.08676, -71.47451),
-    "berkley": (41.84593, -71.08282),
-    "bernardston": (42.67092, -72.54953),
-    "beverly_cove": (42.55343, -70.85366),
-    "billerica": (42.55843, -71.26895),
-    "bliss_corner": (41.61177, -70.93837),
-    "bolton": (42.43343, -71.60784),
-    "bondsville": (42.21259, -72.34536),
-    "bourne": (41.74122, -70.59892),
-    "boxborough": (42.49084, -71.52851),
-    "boxford": (42.6612, -70.99672),
-    "boylston": (42.39176, -71.70368),
-    "braintree": (42.22232, -70.99949),
-    "brewster": (41.76011, -70.0828),
-    "brimfield": (42.12287, -72.20091),
-    "brockton": (42.08343, -71.01838),
-    "brookline": (42.33176, -71.12116),
-    "buckland": (42.59231, -72.79176),
-    "buzzards_bay": (41.74538, -70.61809),
-    "carver": (41.88344, -70.76254),
-    "charlemont": (42.62786, -72.86982),
-    "charlton": (42.13565, -71.97007),
-    "chelmsford": (42.59981, -71.36728),
-    "chicopee": (42.1487, -72.60787),
-    "cochituate": (42.32093, -71.36423),
-    "cohasset": (42.24177, -70.80365),
-    "colrain": (42.67314, -72.69676),
-    "cordaville": (42.26898, -71.52395),
-    "cotuit": (41.61678, -70.43697),
-    "dedham": (42.24177, -71.16616),
-    "dennis": (41.73539, -70.19391),
-    "dennis_port": (41.65845, -70.12863),
-    "dighton": (41.81399, -71.12032),
-    "dracut": (42.67037, -71.30201),
-    "dudley": (42.0451, -71.93007),
-    "dunstable": (42.67509, -71.48284),
-    "duxbury": (42.04177, -70.67226),
-    "east_bridgewater": (42.03343, -70.95921),
-    "east_brookfield": (42.22787, -72.04674),
-    "east_dennis": (41.74261, -70.16196),
-    "east_douglas": (42.07232, -71.7134),
-    "east_harwich": (41.70011, -70.02724),
-    "east_longmeadow": (42.06454, -72.51259),
-    "east_pepperell": (42.66537, -71.57312),
-    "east_sandwich": (41.74177, -70.45169),
-    "eastham": (41.83011, -69.97391),
-    "easthampton": (42.26676, -72.66898),
-    "edgartown": (41.38901, -70.51336),
-    "erving": (42.60009, -72.39814),
-    "everett": (42.40843, -71.05366),
-    "fairhaven": (41.6376, -70.90365),
-    "fall_river": (41.70149, -71.15505),
-    "fiskdale": (42.11621, -72.11341),
-    "fitchburg": (42.58342, -71.8023),
-    "foxborough": (42.06538, -71.24783),
-    "framingham": (42.27926, -71.41617),
-    "framingham_center": (42.29732, -71.43701),
-    "freetown": (41.76677, -71.03282),
-    "gill": (42.64036, -72.49953),
-    "gloucester": (42.61593, -70.66199),
-    "great_barrington": (42.19592, -73.36206),
-    "hadley": (42.34176, -72.58842),
-    "hampden": (42.06398, -72.41342),
-    "hanson": (42.0751, -70.88004),
-    "harwich": (41.68622, -70.07585),
-    "harwich_port": (41.66678, -70.07863),
-    "hatfield": (42.37092, -72.59814),
-    "head_of_westport": (41.62094, -71.06199),
-    "hingham": (42.24177, -70.88977),
-    "holbrook": (42.1551, -71.00866),
-    "holliston": (42.2001, -71.4245),
-    "holyoke": (42.20426, -72.6162),
-    "hopedale": (42.13065, -71.54117),
-    "hopkinton": (42.22871, -71.52256),
-    "housatonic": (42.25425, -73.36622),
-    "hubbardston": (42.4737, -72.00619),
-    "hyannis": (41.65289, -70.2828),
-    "ipswich": (42.67926, -70.84116),
-    "jamaica_plain": (42.30982, -71.12033),
-    "lanesborough": (42.51731, -73.22816),
-    "lee": (42.30425, -73.24816),
-    "leicester": (42.24593, -71.90868),
-    "leominster": (42.52509, -71.75979),
-    "leverett": (42.45203, -72.50148),
-    "littleton_common": (42.54593, -71.47451),
-    "longmeadow": (42.0501, -72.58287),
-    "lynnfield": (42.53898, -71.04811),
-    "manchester_by_the_sea": (42.57787, -70.76894),
-    "marblehead": (42.5001, -70.85783),
-    "marshfield_hills": (42.14594, -70.73976),
-    "marstons_mills": (41.65622, -70.41614),
-    "mashpee": (41.64844, -70.48114),
-    "mattapoisett": (41.65844, -70.81615),
-    "maynard": (42.43343, -71.44951),
-    "medfield": (42.1876, -71.30645),
-    "medway": (42.14176, -71.39673),
-    "melrose": (42.45843, -71.06616),
-    "mendon": (42.10565, -71.55229),
-    "methuen": (42.7262, -71.19089),
-    "middleborough": (41.89316, -70.91115),
-    "middleton": (42.59509, -71.01616),
-    "millbury": (42.19398, -71.76007),
-    "millers_falls": (42.58203, -72.49259),
-    "millis": (42.1676, -71.35784),
-    "monson": (42.10426, -72.31897),
-    "monument_beach": (41.71955, -70.61198),
-    "nahant": (42.42649, -70.91894),
-    "nantucket": (41.28346, -70.09946),
-    "natick": (42.28343, -71.3495),
-    "needham": (42.28343, -71.23283),
-    "new_bedford": (41.63622, -70.93421),
-    "new_marlborough": (42.12287, -73.22872),
-    "newburyport": (42.81259, -70.87728),
-    "north_adams": (42.70092, -73.10871),
-    "north_amherst": (42.41037, -72.53092),
-    "north_brookfield": (42.26676, -72.08285),
-    "north_chicopee": (42.18343, -72.59953),
-    "north_eastham": (41.86511, -69.99113),
-    "north_falmouth": (41.64594, -70.61836),
-    "north_lakeville": (41.8576, -70.94226),
-    "north_pembroke": (42.09316, -70.79254),
-    "north_plymouth": (41.97094, -70.68281),
-    "north_reading": (42.57509, -71.07867),
-    "north_scituate": (42.21899, -70.7856),
-    "north_seekonk": (41.88927, -71.33005),
-    "north_westport": (41.66038, -71.08838),
-    "northampton": (42.32509, -72.6412),
-    "northborough": (42.31954, -71.64118),
-    "northbridge": (42.15148, -71.64951),
-    "norwell": (42.16177, -70.79393),
-    "oak_bluffs": (41.45428, -70.56197),
-    "oakham": (42.35287, -72.04535),
-    "ocean_grove": (41.72927, -71.20921),
-    "onset": (41.74177, -70.65781),
-    "osterville": (41.62844, -70.38697),
-    "otis": (42.19315, -73.09177),
-    "pepperell": (42.66592, -71.5884),
-    "phillipston": (42.5487, -72.13286),
-    "plympton": (41.95288, -70.81448),
-    "pocasset": (41.68622, -70.61614),
-    "provincetown": (42.05295, -70.1864),
-    "randolph": (42.1626, -71.04116),
-    "raynham": (41.94871, -71.0731),
-    "raynham_center": (41.92371, -71.05227),
-    "rehoboth": (41.84038, -71.24949),
-    "rowley": (42.71676, -70.87866),
-    "royalston": (42.67759, -72.18786),
-    "rutland": (42.36954, -71.94813),
-    "sagamore": (41.77011, -70.52836),
-    "saugus": (42.46482, -71.01005),
-    "scituate": (42.19593, -70.72587),
-    "seekonk": (41.80843, -71.337),
-    "shelburne": (42.58981, -72.68842),
-    "shelburne_falls": (42.60425, -72.73926),
-    "sherborn": (42.23899, -71.36978),
-    "shirley": (42.5437, -71.64951),
-    "shutesbury": (42.45648, -72.40981),
-    "smith_mills": (41.63899, -70.99115),
-    "south_amherst": (42.34037, -72.50509),
-    "south_ashburnham": (42.61037, -71.93897),
-    "south_deerfield": (42.47731, -72.60787),
-    "south_dennis": (41.68956, -70.15641),
-    "south_hadley": (42.25842, -72.57453),
-    "south_lancaster": (42.44454, -71.68701),
-    "south_peabody": (42.50982, -70.94949),
-    "south_yarmouth": (41.66678, -70.18474),
-    "southampton": (42.22926, -72.73009),
-    "southborough": (42.30565, -71.52451),
-    "southbridge": (42.0751, -72.03341),
-    "southwick": (42.05482, -72.77037),
-    "stoneham": (42.4801, -71.0995),
-    "stoughton": (42.1251, -71.10227),
-    "stow": (42.43704, -71.50562),
-    "sturbridge": (42.10843, -72.07869),
-    "sudbury": (42.38343, -71.41617),
-    "sunderland": (42.24454, -71.77174),
-    "swampscott": (42.47093, -70.91755),
-    "taunton": (41.9001, -71.08977),
-    "teaticket": (41.56455, -70.59586),
-    "templeton": (42.55564, -72.06758),
-    "tewksbury": (42.61065, -71.23422),
-    "topsfield": (42.63759, -70.9495),
-    "truro": (41.99344, -70.04975),
-    "turners_falls": (42.60425, -72.55648),
-    "tyngsboro": (42.67676, -71.42451),
-    "upton": (42.17454, -71.60229),
-    "uxbridge": (42.07732, -71.62951),
-    "vineyard_haven": (41.45428, -70.60364),
-    "wakefield": (42.50648, -71.07283),
-    "wales": (42.06954, -72.2223),
-    "walpole": (42.14177, -71.2495),
-    "waltham": (42.37649, -71.23561),
-    "ware": (42.25981, -72.2398),
-    "wareham_center": (41.76677, -70.72615),
-    "wellesley": (42.29649, -71.29256),
-    "wellfleet": (41.93761, -70.0328),
-    "wenham": (42.60426, -70.89116),
-    "west_boylston": (42.36676, -71.78563),
-    "west_bridgewater": (42.01899, -71.00782),
-    "west_chatham": (41.68122, -69.99113),
-    "west_concord": (42.45843, -71.39534),
-    "west_brookfield": (42.23537, -72.14119),
-    "west_dennis": (41.66456, -70.1728),
-    "west_falmouth": (41.60427, -70.63447),
-    "west_newbury": (42.80148, -70.98978),
-    "west_stockbridge": (42.34592, -73.36622),
-    "west_tisbury": (41.38122, -70.67447),
-    "west_wareham": (41.78983, -70.76031),
-    "west_yarmouth": (41.65011, -70.24113),
-    "westborough": (42.26954, -71.61618),
-    "westford": (42.57926, -71.43784),
-    "westhampton": (42.30287, -72.77454),
-    "weweantic": (41.73538, -70.73198),
-    "weymouth": (42.22093, -70.93977),
-    "whately": (42.43981, -72.63481),
-    "white_island_shores": (41.8001, -70.63475),
-    "whitinsville": (42.11121, -71.66618),
-    "wilbraham": (42.12371, -72.43147),
-    "winchendon": (42.6862, -72.04397),
-    "winthrop": (42.3751, -70.98283),
-    "woburn": (42.47926, -71.15228),
-    "worcester": (42.26259, -71.80229),
-    "wrentham": (42.06677, -71.32811),
-    "yarmouth": (41.70567, -70.22863),
-    "yarmouth_port": (41.70205, -70.24947),
-    "appleton": (44.28924, -69.25088),
-    "arundel": (43.38259, -70.47783),
-    "bangor": (44.80118, -68.77781),
-    "bar_harbor": (44.38758, -68.2039),
-    "bath": (43.91064, -69.8206),
-    "belfast": (44.42591, -69.00642),
-    "belgrade": (44.44729, -69.83255),
-    "biddeford": (43.49258, -70.45338),
-    "boothbay": (43.87647, -69.63366),
-    "boothbay_harbor": (43.8523, -69.6281),
-    "brewer": (44.79674, -68.76142),
-    "bridgton": (44.05479, -70.71284),
-    "brownfield": (43.93813, -70.90868),
-    "brownville": (45.307, -69.03337),
-    "buckfield": (44.28951, -70.36534),
-    "bucksport": (44.57369, -68.79559),
-    "calais": (45.18896, -67.2786),
-    "canaan": (44.76173, -69.56144),
-    "cape_neddick": (43.1937, -70.62089),
-    "caribou": (46.8606, -68.01197),
-    "castine": (44.38785, -68.79975),
-    "cherryfield": (44.6073, -67.92584),
-    "chesterville": (44.55117, -70.08617),
-    "chisholm": (44.48145, -70.1995),
-    "corinna": (44.92117, -69.26171),
-    "cornish": (43.8048, -70.80117),
-    "cornville": (44.83673, -69.67311),
-    "cumberland_center": (43.79647, -70.25894),
-    "damariscotta": (44.03286, -69.51866),
-    "deer_isle": (44.22397, -68.67753),
-    "dixfield": (44.53395, -70.4559),
-    "dixmont": (44.68035, -69.16282),
-    "dover_foxcroft": (45.18339, -69.22699),
-    "east_machias": (44.73924, -67.38999),
-    "east_millinocket": (45.62755, -68.57448),
-    "eastport": (44.90619, -66.98998),
-    "eddington": (44.82618, -68.69337),
-    "edgecomb": (43.95841, -69.6306),
-    "eliot": (43.15314, -70.80006),
-    "falmouth_foreside": (43.7348, -70.20783),
-    "farmingdale": (44.24451, -69.77143),
-    "fort_fairfield": (46.77227, -67.83391),
-    "fort_kent": (47.25865, -68.58949),
-    "frenchville": (47.28087, -68.37976),
-    "friendship": (43.98369, -69.33394),
-    "fryeburg": (44.01646, -70.98062),
-    "gardiner": (44.23007, -69.77532),
-    "gorham": (43.67952, -70.44422),
-    "gouldsboro": (44.47841, -68.03834),
-    "greenbush": (45.08034, -68.65086),
-    "hallowell": (44.2859, -69.79088),
-    "harpswell_center": (43.80175, -69.98421),
-    "hermon": (44.81007, -68.91337),
-    "hodgdon": (46.05394, -67.86668),
-    "hollis_center": (43.60508, -70.59311),
-    "houlton": (46.12616, -67.8403),
-    "howland": (45.23867, -68.66364),
-    "jonesport": (44.53286, -67.59833),
-    "kenduskeag": (44.91951, -68.9317),
-    "kennebunk": (43.38397, -70.54478),
-    "kennebunkport": (43.36175, -70.47672),
-    "kingfield": (44.95922, -70.15395),
-    "kittery_point": (43.08342, -70.70783),
-    "kittery": (43.08814, -70.73616),
-    "lake_arrowhead": (43.66369, -70.73478),
-    "levant": (44.86924, -68.93476),
-    "lewiston": (44.10035, -70.21478),
-    "limerick": (43.68841, -70.79367),
-    "limestone": (46.90866, -67.82585),
-    "limington": (43.73174, -70.71089),
-    "lisbon_falls": (43.99619, -70.06061),
-    "livermore_falls": (44.47534, -70.18811),
-    "lovell": (44.12674, -70.89173),
-    "machias": (44.71508, -67.46138),
-    "machiasport": (44.69869, -67.39471),
-    "madawaska": (47.35532, -68.32171),
-    "mechanic_falls": (44.11174, -70.39172),
-    "milbridge": (44.53536, -67.88083),
-    "millinocket": (45.65727, -68.70976),
-    "milo": (45.25366, -68.98587),
-    "minot": (44.08563, -70.32006),
-    "new_gloucester": (43.96285, -70.28255),
-    "nobleboro": (44.07952, -69.48505),
-    "norridgewock": (44.71312, -69.79061),
-    "north_bath": (43.9348, -69.81588),
-    "north_berwick": (43.3037, -70.73339),
-    "north_windham": (43.83424, -70.43839),
-    "norway": (44.21396, -70.54478),
-    "ogunquit": (43.24898, -70.59922),
-    "old_orchard_beach": (43.51731, -70.37755),
-    "old_town": (44.93423, -68.64531),
-    "orland": (44.57035, -68.73586),
-    "orono": (44.88312, -68.67198),
-    "orrington": (44.73118, -68.82643),
-    "owls_head": (44.0823, -69.05726),
-    "palermo": (44.40785, -69.47393),
-    "parsonsfield": (43.72702, -70.92868),
-    "patten": (45.99644, -68.44614),
-    "penobscot": (44.46452, -68.71114),
-    "phippsburg": (43.82064, -69.81477),
-    "pittston": (44.22174, -69.7556),
-    "poland": (44.06063, -70.39367),
-    "presque_isle": (46.68115, -68.01586),
-    "readfield": (44.38785, -69.96672),
-    "rumford": (44.55367, -70.5509),
-    "sabattus": (44.1198, -70.10755),
-    "saco": (43.50092, -70.44283),
-    "sangerville": (45.16478, -69.35644),
-    "scarborough": (43.57814, -70.32172),
-    "searsmont": (44.36174, -69.19504),
-    "shapleigh": (43.54064, -70.84812),
-    "skowhegan": (44.76506, -69.71922),
-    "south_berwick": (43.23453, -70.8095),
-    "south_eliot": (43.10814, -70.77755),
-    "south_paris": (44.22368, -70.51339),
-    "south_portland": (43.64147, -70.24088),
-    "south_portland_gardens": (43.63897, -70.31533),
-    "south_sanford": (43.41119, -70.74256),
-    "south_thomaston": (44.05147, -69.12782),
-    "springvale": (43.46675, -70.79367),
-    "steep_falls": (43.79397, -70.65256),
-    "stetson": (44.89173, -69.14282),
-    "steuben": (44.51098, -67.96662),
-    "stockton_springs": (44.48952, -68.85698),
-    "stonington": (44.15619, -68.66669),
-    "strong": (44.80756, -70.2209),
-    "swanville": (44.52119, -68.99781),
-    "topsham": (43.92758, -69.97588),
-    "turner": (44.25646, -70.25617),
-    "vassalboro": (44.45923, -69.67755),
-    "veazie": (44.83868, -68.70531),
-    "vinalhaven": (44.04814, -68.8317),
-    "waldoboro": (44.09536, -69.3756),
-    "waterboro": (43.53564, -70.71506),
-    "waterville": (44.55201, -69.63171),
-    "wells_beach_station": (43.32397, -70.59144),
-    "west_paris": (44.32423, -70.57395),
-    "west_scarborough": (43.57036, -70.38783),
-    "westbrook": (43.67703, -70.37116),
-    "whitefield": (44.17007, -69.62532),
-    "winslow": (44.54701, -69.62116),
-    "winterport": (44.63785, -68.84504),
-    "wiscasset": (44.00286, -69.6656),
-    "woolwich": (43.91869, -69.80116),
-    "york_beach": (43.17148, -70.60894),
-    "york_harbor": (43.13676, -70.64561),
-    "algonac": (42.61858, -82.5323),
-    "allegan": (42.5292, -85.8553),
-    "allen_park": (42.25754, -83.21104),
-    "almont": (42.92058, -83.04493),
-    "alpena": (45.06168, -83.43275),
-    "ann_arbor": (42.27756, -83.74088),
-    "argentine": (42.79142, -83.84634),
-    "armada": (42.8442, -82.88437),
-    "au_sable": (44.41085, -83.33219),
-    "auburn_hills": (42.68753, -83.2341),
-    "bad_axe": (43.80196, -83.00078),
-    "baraga": (46.77854, -88.48902),
-    "battle_creek": (42.3173, -85.17816),
-    "beaverton": (43.88225, -84.48473),
-    "belding": (43.09781, -85.22891),
-    "benton_harbor": (42.11671, -86.45419),
-    "benton_heights": (42.13115, -86.40724),
-    "berrien_springs": (41.94643, -86.3389),
-    "beulah": (44.63194, -86.09092),
-    "big_rapids": (43.69808, -85.48366),
-    "bingham_farms": (42.51587, -83.27326),
-    "birch_run": (43.25086, -83.79413),
-    "blissfield": (41.83255, -83.86244),
-    "bloomfield_hills": (42.58364, -83.24549),
-    "boyne_city": (45.21668, -85.01394),
-    "bridgman": (41.9431, -86.55697),
-    "brown_city": (43.21225, -82.98966),
-    "brownlee_park": (42.31893, -85.14249),
-    "burt": (43.23669, -83.90636),
-    "byron_center": (42.81225, -85.72281),
-    "cadillac": (44.25195, -85.40116),
-    "canadian_lakes": (43.57919, -85.3017),
-    "capac": (43.01253, -82.92799),
-    "carleton": (42.05921, -83.39077),
-    "caro": (43.49073, -83.39885),
-    "carson_city": (43.17698, -84.84639),
-    "cass_city": (43.60085, -83.17467),
-    "cassopolis": (41.91171, -86.01001),
-    "cedar_springs": (43.22336, -85.55142),
-    "center_line": (42.48504, -83.0277),
-    "charlevoix": (45.31806, -85.2584),
-    "cheboygan": (45.64696, -84.47448),
-    "chesaning": (43.18475, -84.11497),
-    "clare": (43.81947, -84.76863),
-    "clawson": (42.53337, -83.14632),
-    "clinton_township": (42.58698, -82.91992),
-    "coloma": (42.18615, -86.30836),
-    "colon": (41.95838, -85.32498),
-    "comstock_park": (43.03864, -85.67003),
-    "constantine": (41.84116, -85.6686),
-    "coopersville": (43.06391, -85.93477),
-    "corunna": (42.98197, -84.11775),
-    "croswell": (43.27558, -82.62104),
-    "crystal_falls": (46.09801, -88.33402),
-    "cutlerville": (42.84086, -85.66364),
-    "davison": (43.03475, -83.51801),
-    "dewitt": (42.84226, -84.56915),
-    "dearborn": (42.32226, -83.17631),
-    "dearborn_heights": (42.33698, -83.27326),
-    "detroit": (42.33143, -83.04575),
-    "detroit_beach": (41.93116, -83.32688),
-    "dimondale": (42.64559, -84.64887),
-    "dollar_bay": (47.11965, -88.51151),
-    "dowagiac": (41.98421, -86.10862),
-    "eagle_river": (47.41381, -88.29566),
-    "east_grand_rapids": (42.94114, -85.61003),
-    "east_jordan": (45.15806, -85.12423),
-    "east_lansing": (42.73698, -84.48387),
-    "east_tawas": (44.27946, -83.49025),
-    "eastpointe": (42.46837, -82.95547),
-    "eaton_rapids": (42.5092, -84.65581),
-    "ecorse": (42.24448, -83.14576),
-    "edgemont_park": (42.7467, -84.59359),
-    "edmore": (43.40809, -85.03863),
-    "edwardsburg": (41.7956, -86.08084),
-    "elk_rapids": (44.89556, -85.41646),
-    "escanaba": (45.74525, -87.06458),
-    "essexville": (43.6153, -83.84192),
-    "evart": (43.90058, -85.2581),
-    "fair_plain": (42.08699, -86.45586),
-    "farmington_hills": (42.48531, -83.37716),
-    "fennville": (42.59392, -86.1017),
-    "ferrysburg": (43.08446, -86.22033),
-    "flint": (43.01253, -83.68746),
-    "flushing": (43.06308, -83.85107),
-    "fowlerville": (42.66059, -84.07301),
-    "frankenmuth": (43.33169, -83.73802),
-    "fraser": (42.5392, -82.94937),
-    "freeland": (43.52503, -84.12276),
-    "fruitport": (43.13196, -86.15478),
-    "gaylord": (45.02751, -84.67475),
-    "gibraltar": (42.09504, -83.18965),
-    "gladwin": (43.98085, -84.4864),
-    "goodrich": (42.91697, -83.50634),
-    "grand_blanc": (42.92753, -83.62995),
-    "grand_haven": (43.06307, -86.22839),
-    "grand_ledge": (42.75337, -84.74638),
-    "grand_rapids": (42.96336, -85.66809),
-    "grandville": (42.90975, -85.76309),
-    "grass_lake": (42.25087, -84.21301),
-    "grayling": (44.6614, -84.71475),
-    "greilickville": (44.78306, -85.63869),
-    "grosse_ile": (42.12921, -83.14437),
-    "grosse_pointe": (42.38615, -82.91186),
-    "grosse_pointe_farms": (42.4092, -82.89186),
-    "grosse_pointe_park": (42.37587, -82.93742),
-    "grosse_pointe_shores": (42.4367, -82.87686),
-    "grosse_pointe_woods": (42.44365, -82.90686),
-    "gwinn": (46.28106, -87.44097),
-    "hamtramck": (42.39282, -83.04964),
-    "harbor_beach": (43.84474, -82.65132),
-    "harbor_springs": (45.43168, -84.992),
-    "harper_woods": (42.43309, -82.92408),
-    "hart": (43.69834, -86.36397),
-    "haslett": (42.74698, -84.40108),
-    "hastings": (42.64587, -85.29084),
-    "hazel_park": (42.46254, -83.10409),
-    "hemlock": (43.41475, -84.23054),
-    "holly": (42.79197, -83.62773),
-    "houghton": (47.12187, -88.56901),
-    "houghton_lake": (44.31474, -84.76475),
-    "howard_city": (43.39558, -85.46782),
-    "howell": (42.60726, -83.9294),
-    "hubbard_lake": (44.75973, -83.54442),
-    "hudsonville": (42.87086, -85.86504),
-    "huntington_woods": (42.48059, -83.16687),
-    "imlay_city": (43.02475, -83.07772),
-    "indian_river": (45.41251, -84.61254),
-    "ionia": (42.98725, -85.07112),
-    "iron_mountain": (45.82023, -88.06596),
-    "iron_river": (46.09273, -88.64235),
-    "ironwood": (46.45467, -90.17101),
-    "ishpeming": (46.48855, -87.66764),
-    "ithaca": (43.2917, -84.6075),
-    "jenison": (42.90725, -85.79198),
-    "kalamazoo": (42.29171, -85.58723),
-    "kalkaska": (44.73417, -85.17589),
-    "keego_harbor": (42.60809, -83.34382),
-    "kent_city": (43.22002, -85.75115),
-    "kilmanagh": (43.75613, -83.3569),
-    "kingsford": (45.79496, -88.07207),
-    "l_anse": (46.7566, -88.45291),
-    "laingsburg": (42.89031, -84.35136),
-    "lake_fenton": (42.84614, -83.70773),
-    "lake_michigan_beach": (42.22087, -86.36947),
-    "lake_odessa": (42.78476, -85.13834),
-    "lake_orion": (42.78448, -83.23966),
-    "lakewood_club": (43.37112, -86.26034),
-    "lambertville": (41.76588, -83.62799),
-    "lapeer": (43.05142, -83.31883),
-    "lathrup_village": (42.49642, -83.22271),
-    "laurium": (47.23743, -88.44317),
-    "leslie": (42.45143, -84.43247),
-    "ludington": (43.95528, -86.45258),
-    "luna_pier": (41.80699, -83.44243),
-    "manistee": (44.24445, -86.32425),
-    "mancelona": (44.90223, -85.06088),
-    "manistique": (45.95775, -86.24625),
-    "manton": (44.41084, -85.39894),
-    "marcellus": (42.02588, -85.81556),
-    "marine_city": (42.71948, -82.49213),
-    "marlette": (43.32697, -83.08022),
-    "marquette": (46.54354, -87.39542),
-    "mattawan": (42.20948, -85.78445),
-    "melvindale": (42.28254, -83.1752),
-    "menominee": (45.10776, -87.61427),
-    "michigan_center": (42.23309, -84.32718),
-    "middleville": (42.71309, -85.46196),
-    "mio": (44.65224, -84.12973),
-    "morenci": (41.71949, -84.218),
-    "mount_clemens": (42.59726, -82.87798),
-    "munising": (46.4112, -86.64926),
-    "muskegon": (43.23418, -86.24839),
-    "muskegon_heights": (43.20113, -86.23895),
-    "napoleon": (42.16059, -84.24606),
-    "negaunee": (46.4991, -87.6118),
-    "new_buffalo": (41.79393, -86.74392),
-    "newaygo": (43.41974, -85.80005),
-    "north_branch": (43.22947, -83.19661),
-    "north_muskegon": (43.25613, -86.26756),
-    "northview": (43.04558, -85.60059),
-    "northville": (42.43115, -83.48327),
-    "norton_shores": (43.1689, -86.26395),
-    "novi": (42.48059, -83.47549),
-    "okemos": (42.72226, -84.42747),
-    "ontonagon": (46.87105, -89.31403),
-    "orchard_lake": (42.58309, -83.35938),
-    "ortonville": (42.85225, -83.443),
-    "otsego": (42.46059, -85.69641),
-    "ovid": (43.00586, -84.37164),
-    "owosso": (42.9978, -84.17664),
-    "parchment": (42.3281, -85.56973),
-    "paw_paw": (42.21782, -85.89112),
-    "paw_paw_lake": (42.21226, -86.27197),
-    "pearl_beach": (42.6267, -82.59769),
-    "petoskey": (45.37334, -84.95533),
-    "pigeon": (43.83002, -83.26996),
-    "pinckney": (42.457, -83.94791),
-    "pinconning": (43.85363, -83.96499),
-    "plainwell": (42.44004, -85.6489),
-    "pleasant_ridge": (42.47115, -83.14215),
-    "port_huron": (42.97086, -82.42491),
-    "potterville": (42.6292, -84.73887),
-    "prudenville": (44.29835, -84.65197),
-    "quinnesec": (45.80635, -87.98846),
-    "rapid_city": (44.83445, -85.28256),
-    "ravenna": (43.18947, -85.93699),
-    "redford": (42.38337, -83.2966),
-    "reed_city": (43.87502, -85.51005),
-    "reese": (43.45058, -83.69635),
-    "river_rouge": (42.27337, -83.13437),
-    "rochester_hills": (42.65837, -83.14993),
-    "rogers_city": (45.4214, -83.81833),
-    "romeo": (42.80281, -83.01299),
-    "romulus": (42.22226, -83.3966),
-    "roosevelt_park": (43.1964, -86.27228),
-    "roscommon": (44.49835, -84.59197),
-    "royal_oak": (42.48948, -83.14465),
-    "saint_helen": (44.36363, -84.41029),
-    "saint_ignace": (45.86614, -84.72751),
-    "saint_louis": (43.40836, -84.60667),
-    "saline": (42.16671, -83.78161),
-    "sand_lake": (44.31918, -83.6847),
-    "sandusky": (43.4203, -82.82966),
-    "saranac": (42.92948, -85.21307),
-    "sault_ste_marie": (46.4953, -84.34532),
-    "schoolcraft": (42.11421, -85.63778),
-    "scottville": (43.95473, -86.28008),
-    "sebewaing": (43.73224, -83.45107),
-    "shields": (43.4153, -84.05637),
-    "skidway_lake": (44.18335, -84.03527),
-    "south_gull_lake": (42.38754, -85.39667),
-    "south_lyon": (42.46059, -83.65161),
-    "south_monroe": (41.89588, -83.41771),
-    "south_rockwood": (42.06393, -83.26104),
-    "southfield": (42.47337, -83.22187),
-    "spring_arbor": (42.20504, -84.55274),
-    "saint_clair_shores": (42.49698, -82.88881),
-    "stambaugh_iron_river": (46.08107, -88.62708),
-    "standish": (43.98308, -83.95888),
-    "sterling_heights": (42.58031, -83.0302),
-    "swartz_creek": (42.95725, -83.83051),
-    "sylvan_lake": (42.61142, -83.32855),
-    "tawas_city": (44.26946, -83.5147),
-    "temperance": (41.77921, -83.56882),
-    "traverse_city": (44.76306, -85.62063),
-    "trowbridge_park": (46.5566, -87.43736),
-    "twin_lake": (43.36279, -86.16478),
-    "vandercook_lake": (42.19337, -84.39107),
-    "vassar": (43.37197, -83.58329),
-    "lake_isabella": (43.64364, -84.99725),
-    "wacousta": (42.82781, -84.70082),
-    "walled_lake": (42.53781, -83.48105),
-    "waterford": (42.69303, -83.41181),
-    "webberville": (42.66698, -84.17413),
-    "west_ishpeming": (46.48355, -87.70097),
-    "westland": (42.3242, -83.40021),
-    "white_cloud": (43.5503, -85.772),
-    "white_pigeon": (41.79811, -85.64332),
-    "whitmore_lake": (42.4397, -83.7453),
-    "wixom": (42.52476, -83.53633),
-    "wolf_lake": (43.25474, -86.10978),
-    "wolverine_lake": (42.5567, -83.47383),
-    "woodhaven": (42.13893, -83.2416),
-    "woodland_beach": (41.94005, -83.31326),
-    "wyandotte": (42.21421, -83.14992),
-    "ypsilanti": (42.24115, -83.61299),
-    "zeeland": (42.81252, -86.01865),
-    "zilwaukee": (43.47641, -83.92053),
-    "aitkin": (46.53301, -93.71025),
-    "albert_lea": (43.64801, -93.36827),
-    "anoka": (45.19774, -93.38718),
-    "apple_valley": (44.73191, -93.21772),
-    "arden_hills": (45.05024, -93.15661),
-    "atwater": (45.13885, -94.77806),
-    "babbitt": (47.70853, -91.9446),
-    "bagley": (47.52162, -95.39835),
-    "baudette": (48.71247, -94.59993),
-    "bayport": (45.02136, -92.78104),
-    "becker": (45.3933, -93.87692),
-    "bemidji": (47.47356, -94.88028),
-    "big_lake": (45.33246, -93.74608),
-    "birchwood": (45.06108, -92.97605),
-    "blooming_prairie": (43.86663, -93.05103),
-    "blue_earth": (43.63746, -94.10218),
-    "braham": (45.72274, -93.17078),
-    "brainerd": (46.35802, -94.20083),
-    "branch": (45.48524, -92.96188),
-    "breezy_point": (46.59001, -94.21982),
-    "brooklyn_center": (45.07608, -93.33273),
-    "canby": (44.70885, -96.27643),
-    "cannon_falls": (44.50691, -92.90548),
-    "carlton": (46.66383, -92.42491),
-    "center_city": (45.39385, -92.8166),
-    "champlin": (45.18885, -93.39745),
-    "chanhassen": (44.86219, -93.53079),
-    "chaska": (44.78941, -93.60218),
-    "chatfield": (43.84552, -92.18905),
-    "chisago_city": (45.37358, -92.88994),
-    "circle_pines": (45.14858, -93.15161),
-    "clara_city": (44.95496, -95.3664),
-    "cloquet": (46.72161, -92.45936),
-    "cokato": (45.0758, -94.18998),
-    "coleraine": (47.28883, -93.42771),
-    "collegeville": (45.59441, -94.36305),
-    "cologne": (44.77163, -93.78135),
-    "columbia_heights": (45.0408, -93.263),
-    "corcoran": (45.09524, -93.54746),
-    "cottage_grove": (44.82774, -92.94382),
-    "crookston": (47.77414, -96.60812),
-    "cross_lake": (46.65941, -94.11387),
-    "crystal": (45.03274, -93.36023),
-    "dassel": (45.08163, -94.30693),
-    "deephaven": (44.92969, -93.52246),
-    "delano": (45.04191, -93.78913),
-    "detroit_lakes": (46.81718, -95.84533),
-    "dilworth": (46.87663, -96.70341),
-    "dodge_center": (44.02802, -92.85464),
-    "dundas": (44.42941, -93.20188),
-    "eagan": (44.80413, -93.16689),
-    "east_bethel": (45.31941, -93.20245),
-    "east_grand_forks": (47.92998, -97.02452),
-    "east_gull_lake": (46.40802, -94.35584),
-    "eden_prairie": (44.85469, -93.47079),
-    "eden_valley": (45.32607, -94.54611),
-    "elbow_lake": (45.99413, -95.97672),
-    "elk_river": (45.30385, -93.56718),
-    "esko": (46.70578, -92.36325),
-    "eveleth": (47.46243, -92.53991),
-    "excelsior": (44.9033, -93.56635),
-    "eyota": (43.9883, -92.2285),
-    "falcon_heights": (44.99163, -93.16633),
-    "faribault": (44.29496, -93.26883),
-    "fergus_falls": (46.28302, -96.07756),
-    "fosston": (47.57635, -95.75141),
-    "frazee": (46.72801, -95.70088),
-    "fridley": (45.08608, -93.26328),
-    "fulda": (43.87052, -95.60029),
-    "glyndon": (46.87524, -96.57896),
-    "golden_valley": (45.00969, -93.34912),
-    "goodhue": (44.40052, -92.6238),
-    "goodview": (44.06246, -91.69571),
-    "grand_marais": (47.75045, -90.33427),
-    "grand_meadow": (43.7058, -92.57212),
-    "grant": (45.08441, -92.91049),
-    "hallock": (48.77443, -96.94645),
-    "ham_lake": (45.25024, -93.24995),
-    "harris": (45.58635, -92.97466),
-    "hawley": (46.88079, -96.31673),
-    "hector": (44.74385, -94.71555),
-    "hermantown": (46.80689, -92.23825),
-    "hibbing": (47.42715, -92.93769),
-    "howard_lake": (45.0608, -94.07331),
-    "hoyt_lakes": (47.51965, -92.13851),
-    "international_falls": (48.60105, -93.41098),
-    "inver_grove_heights": (44.84802, -93.04272),
-    "isanti": (45.49024, -93.24773),
-    "ivanhoe": (44.4633, -96.24726),
-    "janesville": (44.11608, -93.708),
-    "jordan": (44.66691, -93.6269),
-    "kasson": (44.02996, -92.75074),
-    "keewatin": (47.39966, -93.07242),
-    "kenyon": (44.27219, -92.98548),
-    "la_crescent": (43.82802, -91.30403),
-    "lake_crystal": (44.1058, -94.21885),
-    "lake_elmo": (44.9958, -92.87938),
-    "zimmerman": (45.4433, -93.58996),
-    "lake_saint_croix_beach": (44.9208, -92.76687),
-    "lakefield": (43.67746, -95.17166),
-    "lakeville": (44.64969, -93.24272),
-    "lauderdale": (44.99858, -93.20578),
-    "le_center": (44.38941, -93.73023),
-    "le_sueur": (44.46135, -93.91524),
-    "lester_prairie": (44.88385, -94.04164),
-    "lindstrom": (45.38941, -92.84799),
-    "lino_lakes": (45.16024, -93.08883),
-    "little_canada": (45.02691, -93.08772),
-    "little_falls": (45.97635, -94.3625),
-    "long_prairie": (45.97469, -94.86558),
-    "lonsdale": (44.48024, -93.42856),
-    "madelia": (44.05079, -94.4183),
-    "madison_lake": (44.20441, -93.81551),
-    "mahnomen": (47.31524, -95.96865),
-    "mahtomedi": (45.06969, -92.9516),
-    "mantorville": (44.06913, -92.75575),
-    "maple_grove": (45.07246, -93.45579),
-    "maple_lake": (45.22913, -94.00192),
-    "maple_plain": (45.00719, -93.65579),
-    "mayer": (44.88496, -93.88775),
-    "menahga": (46.75385, -95.09808),
-    "mendota_heights": (44.88358, -93.13827),
-    "milaca": (45.7558, -93.65441),
-    "minneota": (44.55885, -95.98559),
-    "minnetonka": (44.9133, -93.50329),
-    "minnetonka_mills": (44.94107, -93.4419),
-    "minnetrista": (44.9383, -93.71774),
-    "montevideo": (44.94803, -95.71701),
-    "moose_lake": (46.45411, -92.76187),
-    "mora": (45.8769, -93.29384),
-    "mound": (44.93663, -93.66607),
-    "mounds_view": (45.10497, -93.20856),
-    "mountain_iron": (47.53243, -92.62351),
-    "mountain_lake": (43.93885, -94.92971),
-    "new_brighton": (45.06552, -93.20189),
-    "new_prague": (44.5433, -93.57607),
-    "new_richland": (43.89385, -93.49383),
-    "new_ulm": (44.31246, -94.46053),
-    "new_york_mills": (46.51802, -95.37615),
-    "nicollet": (44.27608, -94.18746),
-    "nisswa": (46.52052, -94.28861),
-    "north_mankato": (44.1733, -94.03385),
-    "north_oaks": (45.10274, -93.07911),
-    "north_saint_paul": (45.01247, -92.99188),
-    "norwood_(historical)": (44.76802, -93.92747),
-    "norwood_young_america": (44.77357, -93.92163),
-    "oak_park_heights": (45.03136, -92.79298),
-    "oakport": (46.93191, -96.77897),
-    "olivia": (44.77635, -94.98972),
-    "oronoco": (44.16608, -92.53491),
-    "osakis": (45.86691, -95.15225),
-    "osseo": (45.11941, -93.40245),
-    "owatonna": (44.08385, -93.22604),
-    "park_rapids": (46.92218, -95.05863),
-    "parkers_prairie": (46.15302, -95.32892),
-    "paynesville": (45.38052, -94.71195),
-    "pelican_rapids": (46.57079, -96.08311),
-    "pequot_lakes": (46.60302, -94.30944),
-    "perham": (46.5944, -95.57254),
-    "pierz": (45.98163, -94.10471),
-    "pine_city": (45.82607, -92.96854),
-    "pipestone": (44.00053, -96.31753),
-    "plainview": (44.16497, -92.17156),
-    "prior_lake": (44.7133, -93.42273),
-    "proctor": (46.74716, -92.22547),
-    "red_lake": (47.87635, -95.01694),
-    "red_lake_falls": (47.88219, -96.27421),
-    "red_wing": (44.56247, -92.5338),
-    "redby": (47.87857, -94.91305),
-    "redwood_falls": (44.5394, -95.11694),
-    "renville": (44.78913, -95.21167),
-    "rice": (45.75191, -94.22027),
-    "richfield": (44.8833, -93.283),
-    "robbinsdale": (45.03219, -93.33856),
-    "roseau": (48.84609, -95.76277),
-    "rush_city": (45.68551, -92.96549),
-    "rushford": (43.8083, -91.75293),
-    "saint_anthony": (45.02052, -93.218),
-    "saint_augusta": (45.47858, -94.15415),
-    "saint_bonifacius": (44.90552, -93.74746),
-    "saint_francis": (45.38691, -93.3594),
-    "saint_louis_park": (44.9483, -93.34801),
-    "saint_michael": (45.20996, -93.66496),
-    "saint_paul_park": (44.84219, -92.99132),
-    "saint_peter": (44.32358, -93.95801),
-    "sandstone": (46.13106, -92.86742),
-    "sartell": (45.62163, -94.20694),
-    "sauk_centre": (45.73747, -94.95252),
-    "sauk_rapids": (45.59191, -94.1661),
-    "scandia": (45.25358, -92.80577),
-    "shafer": (45.38691, -92.74771),
-    "shakopee": (44.79802, -93.5269),
-    "sherburn": (43.65218, -94.72692),
-    "shoreview": (45.07913, -93.14717),
-    "silver_bay": (47.29436, -91.25739),
-    "slayton": (43.98774, -95.75585),
-    "sleepy_eye": (44.29718, -94.72415),
-    "south_saint_paul": (44.89274, -93.03494),
-    "spicer": (45.23302, -94.94001),
-    "spring_lake_park": (45.10774, -93.238),
-    "spring_park": (44.93524, -93.63218),
-    "stacy": (45.39802, -92.98744),
-    "staples": (46.35552, -94.79224),
-    "starbuck": (45.6144, -95.53115),
-    "taylors_falls": (45.40191, -92.65243),
-    "thief_river_falls": (48.11914, -96.18115),
-    "tonka_bay": (44.90857, -93.59301),
-    "tracy": (44.23329, -95.61918),
-    "truman": (43.82773, -94.43719),
-    "two_harbors": (47.02271, -91.67073),
-    "vadnais_heights": (45.05747, -93.07383),
-    "wabasha": (44.38386, -92.03294),
-    "waconia": (44.8508, -93.78691),
-    "wadena": (46.44246, -95.13614),
-    "waite_park": (45.55719, -94.22416),
-    "wanamingo": (44.30441, -92.79047),
-    "warroad": (48.90527, -95.3144),
-    "waseca": (44.07774, -93.50744),
-    "wayzata": (44.97413, -93.50662),
-    "wells": (43.74607, -93.72884),
-    "west_coon_rapids": (45.15969, -93.34967),
-    "west_saint_paul": (44.91608, -93.10161),
-    "white_bear_lake": (45.08469, -93.00994),
-    "willmar": (45.12191, -95.04334),
-    "windom": (43.86635, -95.11694),
-    "young_america_(historical)": (44.78274, -93.91358),
-    "zumbrota": (44.29413, -92.66908),
-    "grant_city": (40.48749, -94.41107),
-    "kahoka": (40.42032, -91.71961),
-    "king_city": (40.05138, -94.52412),
-    "kirksville": (40.19475, -92.58325),
-    "rock_port": (40.41111, -95.51693),
-    "stanberry": (40.21777, -94.53829),
-    "tarkio": (40.44028, -95.37776),
-    "ashley": (46.03414, -99.3715),
-    "belcourt": (48.83917, -99.74487),
-    "cando": (48.48667, -99.20986),
-    "carrington": (47.44972, -99.12622),
-    "casselton": (46.90053, -97.2112),
-    "cavalier": (48.79388, -97.62231),
-    "cooperstown": (47.44444, -98.12398),
-    "devils_lake": (48.11278, -98.86512),
-    "ellendale": (46.00275, -98.52705),
-    "fargo": (46.87719, -96.7898),
-    "fessenden": (47.64917, -99.62929),
-    "finley": (47.51416, -97.83593),
-    "forman": (46.10774, -97.63649),
-    "fort_totten": (47.98, -98.9929),
-    "grand_forks": (47.92526, -97.03285),
-    "horace": (46.75886, -96.9037),
-    "lakota": (48.04278, -98.33621),
-    "langdon": (48.76, -98.36817),
-    "larimore": (47.90666, -97.62675),
-    "mayville": (47.49804, -97.32454),
-    "minnewaukan": (48.07139, -99.25236),
-    "new_rockford": (47.68, -99.1379),
-    "oakes": (46.13858, -98.09038),
-    "park_river": (48.3986, -97.7412),
-    "rugby": (48.36889, -99.99625),
-    "shell_valley": (48.79806, -99.86486),
-    "valley_city": (46.92331, -98.00315),
-    "wahpeton": (46.26524, -96.60591),
-    "west_fargo": (46.87497, -96.90036),
-    "ainsworth": (42.55, -99.86262),
-    "arapahoe": (40.30417, -99.9004),
-    "atkinson": (42.53139, -98.97815),
-    "beatrice": (40.26806, -96.74697),
-    "beaver_city": (40.13751, -99.82956),
-    "bennington": (41.36472, -96.1578),
-    "blair": (41.54444, -96.12502),
-    "burwell": (41.78167, -99.13315),
-    "butte": (42.91139, -98.84926),
-    "chalco": (41.18389, -96.1503),
-    "cozad": (40.85973, -99.98734),
-    "creighton": (42.46667, -97.90618),
-    "david_city": (41.25279, -97.13004),
-    "eagle": (40.81667, -96.43029),
-    "elkhorn": (41.28639, -96.23447),
-    "falls_city": (40.06084, -95.60193),
-    "friend": (40.65362, -97.28616),
-    "fullerton": (41.36335, -97.96923),
-    "gibbon": (40.74835, -98.8448),
-    "grand_island": (40.92501, -98.34201),
-    "greeley": (41.54862, -98.53118),
-    "hartington": (42.6225, -97.2645),
-    "holdrege": (40.44029, -99.36982),
-    "la_vista": (41.18389, -96.03113),
-    "loup_city": (41.27557, -98.96675),
-    "macy": (42.11305, -96.35642),
-    "nebraska_city": (40.67667, -95.85917),
-    "neligh": (42.12862, -98.02979),
-    "north_bend": (41.46195, -96.77975),
-    "o_neill": (42.45778, -98.64759),
-    "omaha": (41.25626, -95.94043),
-    "ord": (41.60334, -98.9262),
-    "papillion": (41.15444, -96.04224),
-    "pawnee_city": (40.10833, -96.15445),
-    "pender": (42.11416, -96.70726),
-    "pierce": (42.19917, -97.52672),
-    "plattsmouth": (41.01139, -95.88223),
-    "ponca": (42.5625, -96.70559),
-    "ralston": (41.20528, -96.04252),
-    "red_cloud": (40.0889, -98.5195),
-    "schuyler": (41.44723, -97.05948),
-    "seward": (40.90695, -97.09892),
-    "south_sioux_city": (42.47388, -96.41364),
-    "springview": (42.82444, -99.74901),
-    "stromsburg": (41.11418, -97.59894),
-    "superior": (40.02085, -98.07004),
-    "tekamah": (41.77832, -96.22113),
-    "wahoo": (41.21139, -96.6203),
-    "weeping_water": (40.87, -96.14057),
-    "wilber": (40.48139, -96.96058),
-    "wisner": (41.98722, -96.91421),
-    "wymore": (40.12222, -96.66252),
-    "yutan": (41.245, -96.39725),
-    "alstead": (43.14897, -72.36064),
-    "antrim": (43.03091, -71.93897),
-    "barnstead": (43.33397, -71.29284),
-    "boscawen": (43.31508, -71.62091),
-    "bow_bog": (43.12064, -71.51146),
-    "candia": (43.07786, -71.27673),
-    "canterbury": (43.33702, -71.56535),
-    "center_harbor": (43.7098, -71.46035),
-    "chichester": (43.24925, -71.39979),
-    "colebrook": (44.89449, -71.49592),
-    "contoocook": (43.22202, -71.71397),
-    "deering": (43.07314, -71.84452),
-    "derry": (42.88064, -71.32729),
-    "derry_village": (42.89175, -71.31201),
-    "east_concord": (43.24202, -71.53813),
-    "east_kingston": (42.92564, -71.01672),
-    "east_merrimack": (42.86814, -71.4834),
-    "epping": (43.03342, -71.07423),
-    "epsom": (43.22286, -71.33201),
-    "exeter": (42.98148, -70.94783),
-    "fitzwilliam": (42.78064, -72.14175),
-    "francestown": (42.98758, -71.81258),
-    "freedom": (43.8123, -71.03562),
-    "gilford": (43.54758, -71.40674),
-    "gilmanton": (43.42425, -71.41452),
-    "goffstown": (43.02036, -71.60035),
-    "grantham": (43.48952, -72.13759),
-    "hampton_beach": (42.90731, -70.812),
-    "hampton_falls": (42.9162, -70.86366),
-    "henniker": (43.1798, -71.8223),
-    "hill": (43.52424, -71.70091),
-    "holderness": (43.73202, -71.58841),
-    "hooksett": (43.09675, -71.46507),
-    "jaffrey": (42.81397, -72.02314),
-    "laconia": (43.52785, -71.47035),
-    "lempster": (43.23841, -72.21064),
-    "littleton": (44.30617, -71.77009),
-    "londonderry": (42.86509, -71.37395),
-    "lyme": (43.80951, -72.15592),
-    "lyndeborough": (42.90758, -71.76646),
-    "madbury": (43.16925, -70.92395),
-    "meredith": (43.65757, -71.50035),
-    "merrimack": (42.86509, -71.4934),
-    "mont_vernon": (42.89453, -71.67424),
-    "moultonborough": (43.7548, -71.39674),
-    "new_durham": (43.43675, -71.17229),
-    "new_ipswich": (42.74814, -71.85424),
-    "newbury": (43.32146, -72.03592),
-    "newmarket": (43.08286, -70.93506),
-    "north_conway": (44.05368, -71.1284),
-    "north_haverhill": (44.09034, -72.02648),
-    "north_hampton": (42.97259, -70.82978),
-    "northumberland": (44.56339, -71.5587),
-    "nottingham": (43.11453, -71.09978),
-    "orford": (43.90535, -72.14009),
-    "ossipee": (43.68536, -71.11673),
-    "peterborough": (42.87064, -71.95175),
-    "pinardville": (42.99425, -71.50729),
-    "plaistow": (42.83648, -71.09478),
-    "rindge": (42.7512, -72.0098),
-    "rollinsford": (43.2362, -70.82034),
-    "rumney": (43.80535, -71.81258),
-    "rye": (43.01342, -70.77089),
-    "sanbornton": (43.48924, -71.5823),
-    "sanbornville": (43.55425, -71.0309),
-    "sandown": (42.9287, -71.18701),
-    "somersworth": (43.26175, -70.86534),
-    "south_hooksett": (43.02647, -71.43534),
-    "stratham_station": (43.05287, -70.89533),
-    "sunapee": (43.38757, -72.08786),
-    "suncook": (43.13064, -71.45312),
-    "swanzey": (42.8698, -72.28175),
-    "tamworth": (43.8598, -71.26313),
-    "tuftonboro": (43.69647, -71.22201),
-    "unity": (43.29396, -72.26037),
-    "weare": (43.0948, -71.73063),
-    "west_swanzey": (42.87008, -72.32175),
-    "wilmot": (43.45174, -71.91369),
-    "wolfeboro": (43.58397, -71.20729),
-    "woodsville": (44.15229, -72.03731),
-    "allentown": (40.17789, -74.58349),
-    "alpine": (40.95593, -73.93125),
-    "alpha": (40.66704, -75.1574),
-    "asbury_park": (40.22039, -74.01208),
-    "atlantic_highlands": (40.40789, -74.03431),
-    "avenel": (40.58038, -74.28515),
-    "avon_by_the_sea": (40.19234, -74.01597),
-    "bayonne": (40.66871, -74.11431),
-    "beattystown": (40.81315, -74.84294),
-    "bedminster": (40.68066, -74.64544),
-    "belford": (40.42594, -74.08681),
-    "belmar": (40.17845, -74.0218),
-    "bergenfield": (40.9276, -73.99736),
-    "berkeley_heights": (40.68343, -74.44265),
-    "bernardsville": (40.71871, -74.56932),
-    "bogota": (40.87621, -74.02986),
-    "boonton": (40.9026, -74.4071),
-    "bordentown": (40.14622, -74.71183),
-    "bound_brook": (40.56844, -74.53849),
-    "bradley_beach": (40.20234, -74.01208),
-    "bradley_gardens": (40.56288, -74.6546),
-    "brass_castle": (40.76482, -75.01101),
-    "brielle": (40.10789, -74.05653),
-    "budd_lake": (40.87121, -74.73405),
-    "califon": (40.71954, -74.83572),
-    "carlstadt": (40.84038, -74.0907),
-    "carteret": (40.57733, -74.2282),
-    "cedar_glen_west": (40.04206, -74.29265),
-    "clark": (40.64094, -74.3107),
-    "clearbrook_park": (40.30983, -74.4646),
-    "cliffside_park": (40.82149, -73.98764),
-    "cliffwood_beach": (40.44205, -74.21681),
-    "closter": (40.97315, -73.96153),
-    "colonia": (40.57455, -74.30209),
-    "cranbury": (40.31622, -74.51376),
-    "crandon_lakes": (41.12426, -74.83989),
-    "cranford": (40.65844, -74.29959),
-    "cresskill": (40.94149, -73.9593),
-    "delanco": (40.05067, -74.9535),
-    "demarest": (40.95732, -73.96347),
-    "dunellen": (40.58927, -74.47182),
-    "dumont": (40.94065, -73.99681),
-    "east_brunswick": (40.42788, -74.41598),
-    "east_freehold": (40.28094, -74.25126),
-    "east_hanover": (40.8201, -74.36487),
-    "east_newark": (40.74843, -74.16181),
-    "east_orange": (40.76732, -74.20487),
-    "east_rutherford": (40.83399, -74.09709),
-    "eatontown": (40.29622, -74.05097),
-    "edgewater_park": (40.06817, -74.90072),
-    "englewood_cliffs": (40.88538, -73.95236),
-    "englishtown": (40.29733, -74.3582),
-    "essex_fells": (40.82454, -74.28459),
-    "ewing": (40.26983, -74.79988),
-    "fair_haven": (40.36067, -74.03819),
-    "fair_lawn": (40.94038, -74.13181),
-    "fanwood": (40.64094, -74.38348),
-    "finderne": (40.56316, -74.57766),
-    "florham_park": (40.78788, -74.38821),
-    "fords": (40.52927, -74.31598),
-    "flemington": (40.51233, -74.85933),
-    "fort_dix": (40.02984, -74.61849),
-    "franklin_lakes": (41.01676, -74.2057),
-    "freehold": (40.26011, -74.27376),
-    "frenchtown": (40.52621, -75.06156),
-    "garwood": (40.65177, -74.32293),
-    "glen_gardner": (40.69677, -74.94072),
-    "glen_ridge": (40.80538, -74.20376),
-    "green_knoll": (40.6001, -74.6121),
-    "groveville": (40.16983, -74.67155),
-    "hackensack": (40.88593, -74.04347),
-    "hackettstown": (40.85399, -74.82906),
-    "hamilton_square": (40.22733, -74.65321),
-    "haledon": (40.93565, -74.18626),
-    "harrington_park": (40.98371, -73.97986),
-    "hasbrouck_heights": (40.85816, -74.0807),
-    "haworth": (40.96093, -73.99014),
-    "heathcote": (40.38872, -74.57571),
-    "helmetta": (40.37677, -74.4246),
-    "high_bridge": (40.66705, -74.89572),
-    "highland_lake": (41.17676, -74.45655),
-    "hightstown": (40.26955, -74.52321),
-    "ho_ho_kus": (40.99649, -74.10125),
-    "hoboken": (40.74399, -74.03236),
-    "hopatcong": (40.93288, -74.65933),
-    "hopatcong_hills": (40.94399, -74.67072),
-    "iselin": (40.57538, -74.32237),
-    "jamesburg": (40.35261, -74.44015),
-    "jersey_city": (40.72816, -74.07764),
-    "keansburg": (40.44177, -74.12986),
-    "kearny": (40.76843, -74.14542),
-    "kendall_park": (40.42094, -74.56071),
-    "kenvil": (40.87982, -74.61849),
-    "keyport": (40.43316, -74.19959),
-    "kinnelon": (41.00176, -74.3671),
-    "lake_como": (40.15984, -74.02819),
-    "lake_mohawk": (41.01843, -74.66016),
-    "lake_telemark": (40.95677, -74.49793),
-    "lakehurst": (40.01456, -74.31126),
-    "laurence_harbor": (40.45677, -74.24653),
-    "leisure_knoll": (40.01901, -74.29209),
-    "leisure_village": (40.04262, -74.18486),
-    "leisure_village_east": (40.03012, -74.16431),
-    "leonardo": (40.41733, -74.06208),
-    "leonia": (40.86149, -73.98819),
-    "lincroft": (40.33067, -74.12097),
-    "little_ferry": (40.85288, -74.04208),
-    "little_silver": (40.33678, -74.04708),
-    "lodi": (40.88232, -74.0832),
-    "long_branch": (40.30428, -73.99236),
-    "long_valley": (40.78593, -74.78016),
-    "madison_park": (40.4515, -74.30792),
-    "mahwah": (41.08871, -74.14376),
-    "manasquan": (40.12623, -74.0493),
-    "manville": (40.54094, -74.58766),
-    "marlboro": (40.31539, -74.24626),
-    "matawan": (40.41483, -74.22959),
-    "mendham": (40.77593, -74.60071),
-    "mercerville": (40.23705, -74.68655),
-    "metuchen": (40.54316, -74.3632),
-    "middlebush": (40.4976, -74.52932),
-    "middlesex": (40.5726, -74.49265),
-    "midland_park": (40.98926, -74.1407),
-    "milltown": (40.45622, -74.44321),
-    "monmouth_beach": (40.33039, -73.98153),
-    "monmouth_junction": (40.379, -74.54654),
-    "montvale": (41.04676, -74.02292),
-    "moonachie": (40.84121, -74.04514),
-    "morganville": (40.3765, -74.24431),
-    "morris_plains": (40.82177, -74.48099),
-    "mount_arlington": (40.92593, -74.63488),
-    "mountain_lakes": (40.89482, -74.43293),
-    "mountainside": (40.67232, -74.35737),
-    "navesink": (40.39955, -74.03542),
-    "neptune_city": (40.20011, -74.02792),
-    "netcong": (40.89899, -74.70655),
-    "new_brunswick": (40.48622, -74.45182),
-    "new_egypt": (40.06761, -74.53071),
-    "new_providence": (40.69843, -74.40154),
-    "north_arlington": (40.78843, -74.1332),
-    "north_bergen": (40.80427, -74.01208),
-    "north_caldwell": (40.86482, -74.2582),
-    "north_haledon": (40.9551, -74.18598),
-    "north_middletown": (40.43955, -74.11903),
-    "north_plainfield": (40.6301, -74.42737),
-    "northvale": (41.00649, -73.94903),
-    "nutley": (40.82232, -74.15987),
-    "oceanport": (40.31817, -74.01514),
-    "ogdensburg": (41.08176, -74.59238),
-    "old_bridge": (40.41483, -74.36543),
-    "old_tappan": (41.01065, -73.99125),
-    "oradell": (40.95871, -74.03681),
-    "palisades_park": (40.84816, -73.99764),
-    "paramus": (40.94454, -74.07542),
-    "parsippany": (40.85788, -74.42599),
-    "passaic": (40.85677, -74.12848),
-    "paterson": (40.91677, -74.17181),
-    "peapack": (40.71677, -74.65655),
-    "pennington": (40.32844, -74.79072),
-    "perth_amboy": (40.50677, -74.26542),
-    "pine_lake_park": (40.00317, -74.25653),
-    "piscataway": (40.49927, -74.39904),
-    "plainsboro_center": (40.33177, -74.5946),
-    "point_pleasant_beach": (40.09123, -74.04791),
-    "pompton_lakes": (41.00538, -74.2907),
-    "port_monmouth": (40.43011, -74.09847),
-    "port_reading": (40.56538, -74.26042),
-    "princeton_junction": (40.31733, -74.61988),
-    "princeton_meadows": (40.33177, -74.56377),
-    "rahway": (40.60816, -74.27765),
-    "ramtown": (40.12095, -74.14375),
-    "raritan": (40.56955, -74.63294),
-    "ridgefield_park": (40.85704, -74.02153),
-    "ridgewood": (40.97926, -74.11653),
-    "ringwood": (41.11343, -74.24543),
-    "river_edge": (40.92871, -74.03986),
-    "river_vale": (40.99538, -74.01208),
-    "robertsville": (40.34622, -74.28792),
-    "rochelle_park": (40.90732, -74.07514),
-    "rockaway": (40.90121, -74.51432),
-    "roebling": (40.11594, -74.78627),
-    "roselle_park": (40.66455, -74.26431),
-    "rumson": (40.37205, -73.99903),
-    "saddle_river": (41.03176, -74.10209),
-    "saddle_brook": (40.89899, -74.09264),
-    "sayreville": (40.45927, -74.36098),
-    "sayreville_junction": (40.46538, -74.33043),
-    "scotch_plains": (40.65538, -74.38987),
-    "sea_bright": (40.3615, -73.97403),
-    "sea_girt": (40.13206, -74.03458),
-    "secaucus": (40.78955, -74.05653),
-    "sewaren": (40.55205, -74.25876),
-    "shark_river_hills": (40.194, -74.04875),
-    "short_hills": (40.74788, -74.32543),
-    "singac": (40.88677, -74.24098),
-    "sixmile_run": (40.45761, -74.51154),
-    "society_hill": (40.53399, -74.45793),
-    "south_amboy": (40.47788, -74.2907),
-    "south_belmar": (40.17095, -74.02736),
-    "south_bound_brook": (40.55344, -74.53154),
-    "south_old_bridge": (40.40816, -74.35432),
-    "south_orange": (40.74899, -74.26126),
-    "south_plainfield": (40.57927, -74.41154),
-    "south_river": (40.44649, -74.38598),
-    "spotswood": (40.39177, -74.39848),
-    "spring_lake_heights": (40.15039, -74.03097),
-    "stanhope": (40.90288, -74.70905),
-    "strathmore": (40.39594, -74.21348),
-    "succasunna": (40.86843, -74.64044),
-    "teaneck": (40.8976, -74.01597),
-    "ten_mile_run": (40.41301, -74.60223),
-    "tenafly": (40.92538, -73.96292),
-    "tinton_falls": (40.30428, -74.10042),
-    "totowa": (40.9051, -74.20987),
-    "twin_rivers": (40.264, -74.49126),
-    "union_beach": (40.4465, -74.1782),
-    "upper_montclair": (40.84621, -74.20126),
-    "upper_saddle_river": (41.05843, -74.09848),
-    "victory_gardens": (40.87593, -74.54238),
-    "vista_center": (40.15928, -74.31792),
-    "voorhees": (40.48122, -74.48321),
-    "vernon_valley": (41.23676, -74.4871),
-    "waldwick": (41.01065, -74.11792),
-    "wallington": (40.85316, -74.11375),
-    "wanaque": (41.03815, -74.29404),
-    "wanamassa": (40.23178, -74.02542),
-    "watchung": (40.63788, -74.45099),
-    "weehawken": (40.76955, -74.02042),
-    "west_belmar": (40.16928, -74.03542),
-    "west_caldwell": (40.84093, -74.30182),
-    "west_freehold": (40.24206, -74.30126),
-    "west_long_branch": (40.29039, -74.01764),
-    "west_milford": (41.13121, -74.36737),
-    "west_new_york": (40.78788, -74.01431),
-    "woodland_park": (40.88982, -74.19487),
-    "white_horse": (40.19067, -74.70238),
-    "white_meadow_lake": (40.92371, -74.51071),
-    "whitehouse_station": (40.61538, -74.77044),
-    "willingboro": (40.02789, -74.86905),
-    "wood_ridge": (40.84566, -74.08792),
-    "woodcliff_lake": (41.02343, -74.06653),
-    "wyckoff": (41.00954, -74.17292),
-    "yorketown": (40.30789, -74.33765),
-    "adams_center": (43.86006, -76.00548),
-    "airmont": (41.10093, -74.11625),
-    "albertson": (40.77343, -73.64318),
-    "alabama": (43.09645, -78.39086),
-    "alden": (42.90006, -78.49197),
-    "alexandria_bay": (44.33588, -75.91773),
-    "allegany": (42.09006, -78.49419),
-    "amagansett": (40.97371, -72.14369),
-    "amityville": (40.67899, -73.41707),
-    "amsterdam": (42.93869, -74.18819),
-    "angola_on_the_lake": (42.65478, -79.04893),
-    "apalachin": (42.06952, -76.15465),
-    "aquebogue": (40.94454, -72.62704),
-    "ardsley": (41.01065, -73.84375),
-    "armonk": (41.12648, -73.71402),
-    "arrochar": (40.59844, -74.07264),
-    "arverne": (40.59122, -73.79597),
-    "averill_park": (42.63397, -73.55373),
-    "babylon": (40.69566, -73.32568),
-    "baiting_hollow": (40.95621, -72.74427),
-    "baldwin_harbor": (40.63955, -73.60846),
-    "baldwinsville": (43.15868, -76.33271),
-    "ballston_spa": (43.00091, -73.84901),
-    "balmville": (41.53482, -74.01486),
-    "bardonia": (41.10954, -73.99625),
-    "barnum_island": (40.60455, -73.64402),
-    "bath_beach": (40.60455, -74.00431),
-    "bay_park": (40.63316, -73.67041),
-    "bay_shore": (40.7251, -73.24539),
-    "baxter_estates": (40.83482, -73.69541),
-    "bay_wood": (40.7501, -73.29123),
-    "baychester": (40.86928, -73.83645),
-    "bayside": (40.76844, -73.77708),
-    "beacon": (41.50482, -73.96958),
-    "bedford_hills": (41.23676, -73.69458),
-    "belle_harbor": (40.57594, -73.84819),
-    "bellerose": (40.72427, -73.71513),
-    "bellerose_terrace": (40.72066, -73.72596),
-    "bellmore": (40.66871, -73.52707),
-    "bellport": (40.75704, -72.93927),
-    "bensonhurst": (40.60177, -73.99403),
-    "bergen": (43.08534, -77.94223),
-    "bergen_beach": (40.62038, -73.9068),
-    "bethpage": (40.74427, -73.48207),
-    "big_flats": (42.1373, -76.93691),
-    "billington_heights": (42.78423, -78.62642),
-    "binghamton": (42.09869, -75.91797),
-    "black_river": (44.01256, -75.79437),
-    "blasdell": (42.79728, -78.82337),
-    "blauvelt": (41.06343, -73.95764),
-    "blue_point": (40.74399, -73.03455),
-    "bohemia": (40.76926, -73.11511),
-    "borough_park": (40.63399, -73.99681),
-    "brewerton": (43.23812, -76.14076),
-    "brewster_hill": (41.42398, -73.60429),
-    "briarcliff_manor": (41.14565, -73.82375),
-    "bridgehampton": (40.93788, -72.30092),
-    "brighton_beach": (40.57788, -73.95958),
-    "brightwaters": (40.72093, -73.26734),
-    "brinckerhoff": (41.54398, -73.86819),
-    "broad_channel": (40.60316, -73.82041),
-    "broadalbin": (43.05868, -74.19652),
-    "brockport": (43.21367, -77.93918),
-    "brocton": (42.38867, -79.44116),
-    "the_bronx": (40.84985, -73.86641),
-    "bronxville": (40.93815, -73.83208),
-    "brooklyn_heights": (40.69538, -73.99375),
-    "bushwick": (40.69427, -73.91875),
-    "calcium": (44.02173, -75.84604),
-    "cambria_heights": (40.69455, -73.73847),
-    "canajoharie": (42.90563, -74.57181),
-    "canandaigua": (42.87423, -77.28804),
-    "canarsie": (40.64372, -73.90069),
-    "canastota": (43.07951, -75.75074),
-    "canisteo": (42.27035, -77.60582),
-    "carle_place": (40.7526, -73.61041),
-    "castleton_on_hudson": (42.51841, -73.75123),
-    "catskill": (42.21731, -73.86457),
-    "cayuga_heights": (42.4601, -76.48776),
-    "cazenovia": (42.93007, -75.85269),
-    "cedarhurst": (40.62288, -73.7243),
-    "celoron": (42.1095, -79.2831),
-    "center_moriches": (40.80038, -72.78982),
-    "centereach": (40.85843, -73.09955),
-    "centerport": (43.0409, -76.59272),
-    "central_islip": (40.79065, -73.20178),
-    "central_square": (43.28674, -76.14604),
-    "central_valley": (41.33176, -74.12098),
-    "chadwicks": (43.02785, -75.27155),
-    "champlain": (44.98643, -73.44653),
-    "chappaqua": (41.15954, -73.76485),
-    "cheektowaga": (42.90339, -78.75475),
-    "chenango_bridge": (42.16674, -75.86242),
-    "chestnut_ridge": (41.08426, -74.0557),
-    "chittenango": (43.04507, -75.86658),
-    "churchville": (43.10423, -77.88445),
-    "city_island": (40.84732, -73.78652),
-    "clarence": (42.97673, -78.59197),
-    "clarence_center": (43.01061, -78.63753),
-    "clark_mills": (43.09229, -75.37962),
-    "clarkson": (43.23312, -77.92751),
-    "clifton_springs": (42.96173, -77.13998),
-    "clintondale": (41.69482, -74.05125),
-    "clymer": (42.02089, -79.63005),
-    "cobleskill": (42.67785, -74.48542),
-    "cohoes": (42.77424, -73.70012),
-    "cold_spring_harbor": (40.87149, -73.45679),
-    "college_point": (40.7876, -73.84597),
-    "colonie": (42.71786, -73.83346),
-    "commack": (40.84288, -73.29289),
-    "coney_island": (40.57788, -73.99403),
-    "congers": (41.15065, -73.94542),
-    "constantia": (43.24785, -76.0002),
-    "copiague": (40.68149, -73.39984),
-    "coram": (40.86871, -73.00149),
-    "cornwall": (41.44482, -74.0157),
-    "corona": (40.74705, -73.86014),
-    "country_knolls": (42.91508, -73.80512),
-    "coxsackie": (42.35092, -73.8029),
-    "crompond": (41.29509, -73.86541),
-    "croton_on_hudson": (41.20843, -73.89125),
-    "crown_heights": (41.63732, -73.93792),
-    "crugers": (41.23343, -73.92264),
-    "cumberland_head": (44.71643, -73.40263),
-    "cutchogue": (41.01066, -72.48509),
-    "cypress_hills": (40.67705, -73.89125),
-    "dannemora": (44.72143, -73.72375),
-    "dansville": (42.5609, -77.69611),
-    "delevan": (42.48923, -78.48085),
-    "depew": (42.90395, -78.69225),
-    "deposit": (42.06008, -75.42768),
-    "dix_hills": (40.80482, -73.33623),
-    "dobbs_ferry": (41.01454, -73.87264),
-    "dolgeville": (43.1009, -74.77293),
-    "dongan_hills": (40.58844, -74.09625),
-    "douglaston": (40.76871, -73.74708),
-    "dover_plains": (41.74121, -73.57652),
-    "dyker_heights": (40.62149, -74.00958),
-    "east_atlantic_beach": (40.78982, -73.74708),
-    "east_aurora": (42.76784, -78.61336),
-    "east_farmingdale": (40.72927, -73.41679),
-    "east_flatbush": (40.65371, -73.93042),
-    "east_garden_city": (40.73083, -73.59806),
-    "east_glenville": (42.89452, -73.9279),
-    "east_greenbush": (42.59091, -73.70179),
-    "east_hills": (40.79371, -73.62707),
-    "east_islip": (40.73204, -73.18567),
-    "east_ithaca": (42.43952, -76.47855),
-    "east_meadow": (40.71399, -73.55902),
-    "east_massapequa": (40.67343, -73.43651),
-    "east_moriches": (40.8051, -72.76093),
-    "east_new_york": (40.66677, -73.88236),
-    "east_northport": (40.87676, -73.32456),
-    "east_norwich": (40.84677, -73.53512),
-    "east_patchogue": (40.76704, -72.99622),
-    "east_quogue": (40.84066, -72.58148),
-    "east_rochester": (43.10867, -77.4875),
-    "east_rockaway": (40.64205, -73.66957),
-    "east_setauket": (40.94149, -73.10594),
-    "east_shoreham": (40.94482, -72.87955),
-    "east_syracuse": (43.06534, -76.07853),
-    "east_tremont": (40.84538, -73.89097),
-    "east_village": (40.72927, -73.98736),
-    "east_williston": (40.75843, -73.63485),
-    "eastchester": (40.95833, -73.80861),
-    "eatons_neck": (40.93065, -73.40151),
-    "eggertsville": (42.96339, -78.80392),
-    "elbridge": (43.03451, -76.44799),
-    "ellenville": (41.71704, -74.39571),
-    "elma_center": (42.82978, -78.63614),
-    "elmira": (42.0898, -76.80773),
-    "elmira_heights": (42.1298, -76.82079),
-    "elmont": (40.70094, -73.71291),
-    "elmsford": (41.0551, -73.82013),
-    "eltingville": (40.54538, -74.1657),
-    "emerson_hill": (40.60872, -74.09598),
-    "endicott": (42.09841, -76.04937),
-    "endwell": (42.11285, -76.02103),
-    "fairport": (43.09867, -77.44194),
-    "falconer": (42.11867, -79.19838),
-    "fallsburg": (41.73204, -74.60127),
-    "far_rockaway": (40.60538, -73.75513),
-    "farmingville": (40.83121, -73.02955),
-    "firthcliffe": (41.43926, -74.04514),
-    "fishkill": (41.53565, -73.89903),
-    "flanders": (40.90343, -72.61759),
-    "flatbush": (40.65205, -73.95903),
-    "flatlands": (40.62122, -73.93486),
-    "floral_park": (40.72371, -73.70485),
-    "florida": (41.33176, -74.35682),
-    "flower_hill": (40.80732, -73.68124),
-    "fonda": (42.95452, -74.37652),
-    "fordham": (40.85927, -73.89847),
-    "fort_edward": (43.26702, -73.58456),
-    "fort_hamilton": (40.61872, -74.0332),
-    "fort_montgomery": (41.33148, -73.98681),
-    "fort_plain": (42.93146, -74.62264),
-    "fort_salonga": (40.9126, -73.30095),
-    "fort_wadsworth": (40.60113, -74.05738),
-    "franklin_square": (40.70732, -73.67596),
-    "fresh_meadows": (40.73482, -73.79347),
-    "frewsburg": (42.0545, -79.1581),
-    "galeville": (43.09007, -76.17298),
-    "garden_city_park": (40.74093, -73.66263),
-    "garden_city_south": (40.71232, -73.66096),
-    "gang_mills": (42.14619, -77.11164),
-    "gardnertown": (41.53509, -74.07014),
-    "gasport": (43.19922, -78.57614),
-    "glasco": (42.0437, -73.94736),
-    "glen_cove": (40.86232, -73.63374),
-    "glen_head": (40.83538, -73.62374),
-    "glen_oaks": (40.74705, -73.71152),
-    "glens_falls": (43.30952, -73.64401),
-    "glenwood_landing": (40.83066, -73.63874),
-    "gloversville": (43.05285, -74.34375),
-    "goldens_bridge": (41.29343, -73.6768),
-    "gordon_heights": (40.85871, -72.97066),
-    "gouverneur": (44.33673, -75.46299),
-    "gowanda": (42.46312, -78.93587),
-    "grandyle_village": (42.99645, -78.95504),
-    "gravesend": (40.5976, -73.96514),
-    "great_kills": (40.55427, -74.15153),
-    "great_neck": (40.80066, -73.72846),
-    "great_neck_gardens": (40.79722, -73.72389),
-    "great_neck_plaza": (40.78677, -73.72652),
-    "great_river": (40.72121, -73.15761),
-    "great_neck_estates": (40.78705, -73.7368),
-    "greece": (43.20978, -77.69306),
-    "green_island": (42.74424, -73.69151),
-    "greenburgh": (41.03287, -73.84291),
-    "greenlawn": (40.86899, -73.36512),
-    "greenpoint": (40.72371, -73.95097),
-    "greenport": (41.10343, -72.35925),
-    "greenvale": (40.81066, -73.62846),
-    "greenwood_lake": (41.22259, -74.29432),
-    "grymes_hill": (40.61872, -74.09348),
-    "hagaman": (42.97452, -74.15096),
-    "halesite": (40.88843, -73.4154),
-    "hampton_bays": (40.86899, -72.51759),
-    "hampton_manor": (42.62091, -73.72845),
-    "hannawa_falls": (44.61228, -74.97103),
-    "harbor_isle": (40.60344, -73.66457),
-    "harris_hill": (42.96478, -78.67753),
-    "hartsdale": (41.01899, -73.79819),
-    "hastings_on_hudson": (40.99454, -73.87875),
-    "hauppauge": (40.82565, -73.20261),
-    "haverstraw": (41.19759, -73.96458),
-    "haviland": (41.76676, -73.90152),
-    "head_of_the_harbor": (40.90343, -73.15789),
-    "hell_s_kitchen": (40.76496, -73.9909),
-    "new_hempstead": (41.14982, -74.03375),
-    "herkimer": (43.02563, -74.98599),
-    "heritage_hills": (41.33954, -73.69735),
-    "herricks": (40.75538, -73.6668),
-    "hewlett": (40.64316, -73.69569),
-    "hewlett_harbor": (40.63621, -73.68152),
-    "hicksville": (40.76843, -73.52513),
-    "highland_falls": (41.36926, -73.96625),
-    "highland_mills": (41.34704, -74.12626),
-    "hillside_lake": (41.61482, -73.79819),
-    "hilton": (43.28812, -77.79334),
-    "holcomb": (42.90229, -77.41971),
-    "holtsville": (40.81538, -73.04511),
-    "honeoye_falls": (42.95229, -77.59028),
-    "hoosick_falls": (42.90119, -73.3515),
-    "hornell": (42.32785, -77.6611),
-    "horseheads": (42.16702, -76.82051),
-    "howard_beach": (40.65788, -73.83625),
-    "hudson_falls": (43.30063, -73.58595),
-    "huguenot": (40.53733, -74.19459),
-    "huntington_bay": (40.89982, -73.41484),
-    "huntington_station": (40.85343, -73.41151),
-    "ilion": (43.01507, -75.03543),
-    "irondequoit": (43.2134, -77.57972),
-    "island_park": (40.60427, -73.65541),
-    "islandia": (40.80426, -73.169),
-    "islip": (40.72982, -73.21039),
-    "islip_terrace": (40.74315, -73.19262),
-    "jackson_heights": (40.75566, -73.88541),
-    "jamaica": (40.69149, -73.80569),
-    "jamesport": (40.94954, -72.58148),
-    "jefferson_heights": (42.23398, -73.88235),
-    "jericho": (40.79204, -73.53985),
-    "johnstown": (43.00674, -74.36764),
-    "kaser": (41.12121, -74.06709),
-    "katonah": (41.25898, -73.68541),
-    "keeseville": (44.50505, -73.48013),
-    "kenmore": (42.96589, -78.87004),
-    "kerhonkson": (41.77482, -74.29821),
-    "kew_gardens": (40.71427, -73.83097),
-    "keuka_park": (42.61535, -77.09219),
-    "kiantone": (42.022, -79.1981),
-    "kinderhook": (42.39536, -73.6979),
-    "kings_bridge": (40.87871, -73.90514),
-    "kiryas_joel": (41.34204, -74.16792),
-    "lackawanna": (42.82561, -78.82337),
-    "lake_carmel": (41.46148, -73.67096),
-    "lake_erie_beach": (42.62423, -79.06698),
-    "lake_grove": (40.85288, -73.11511),
-    "lake_katrine": (41.98565, -73.98819),
-    "lake_luzerne": (43.31285, -73.83484),
-    "lake_mohegan": (41.31787, -73.84625),
-    "lake_pleasant": (43.4709, -74.41265),
-    "lake_ronkonkoma": (40.8351, -73.13122),
-    "lake_success": (40.77066, -73.71763),
-    "larchmont": (40.92788, -73.7518),
-    "latham": (42.74702, -73.75901),
-    "lattingtown": (40.89538, -73.60096),
-    "laurel_hollow": (40.85677, -73.46957),
-    "laurelton": (40.67019, -73.74659),
-    "levittown": (40.72593, -73.51429),
-    "lido_beach": (40.58899, -73.62541),
-    "lincolndale": (41.32287, -73.71819),
-    "lindley": (42.02841, -77.13969),
-    "little_neck": (40.76289, -73.73225),
-    "little_valley": (42.25256, -78.80559),
-    "liverpool": (43.10646, -76.2177),
-    "livingston_manor": (41.90037, -74.82822),
-    "lloyd_harbor": (40.90343, -73.45984),
-    "locust_valley": (40.87593, -73.59707),
-    "long_island_city": (40.74482, -73.94875),
-    "lorenz_park": (42.2637, -73.76846),
-    "lowville": (43.78674, -75.49185),
-    "lynbrook": (40.65483, -73.6718),
-    "lyncourt": (43.08146, -76.12576),
-    "macedon": (43.06923, -77.29887),
-    "mahopac": (41.37232, -73.73346),
-    "malverne": (40.67899, -73.67402),
-    "mamaroneck": (40.94871, -73.73263),
-    "manhasset": (40.79788, -73.69957),
-    "manhasset_hills": (40.75927, -73.67985),
-    "manlius": (43.00201, -75.97686),
-    "manorhaven": (40.84316, -73.71485),
-    "manorville": (40.87371, -72.80788),
-    "marbletown": (41.88343, -74.1132),
-    "mariners_harbor": (40.63677, -74.15875),
-    "maspeth": (40.72316, -73.91264),
-    "massapequa": (40.68066, -73.47429),
-    "massapequa_park": (40.68038, -73.45512),
-    "massena": (44.9281, -74.89186),
-    "mastic": (40.80204, -72.84094),
-    "mastic_beach": (40.76677, -72.85205),
-    "mattituck": (40.99121, -72.53425),
-    "mattydale": (43.09784, -76.1452),
-    "maybrook": (41.48398, -74.21765),
-    "mcgraw": (42.59618, -76.09326),
-    "mckownville": (42.68397, -73.84762),
-    "mechanicstown": (41.44287, -74.38849),
-    "mechanicville": (42.90285, -73.68734),
-    "menands": (42.69202, -73.72456),
-    "merrick": (40.66288, -73.55152),
-    "middle_island": (40.88427, -72.93733),
-    "middle_village": (40.71649, -73.88125),
-    "middleburgh": (42.59869, -74.33292),
-    "midland_beach": (40.57316, -74.09459),
-    "mill_neck": (40.88704, -73.55512),
-    "miller_place": (40.95982, -72.99621),
-    "minetto": (43.39812, -76.47744),
-    "mineville": (44.09283, -73.51818),
-    "minoa": (43.07618, -76.00075),
-    "mohawk": (43.01146, -75.00404),
-    "monsey": (41.11121, -74.06848),
-    "montauk": (41.03594, -71.95451),
-    "montebello": (41.13593, -74.11848),
-    "montour_falls": (42.3473, -76.84524),
-    "moravia": (42.71257, -76.4216),
-    "moriches": (40.80732, -72.82121),
-    "morris_heights": (40.84982, -73.91986),
-    "morrisania": (40.82927, -73.90653),
-    "mott_haven": (40.80899, -73.92291),
-    "mount_ivy": (41.18676, -74.03486),
-    "mount_kisco": (41.20426, -73.72708),
-    "mount_sinai": (40.94704, -73.02955),
-    "mountain_lodge_park": (41.38843, -74.14181),
-    "munsey_park": (40.79871, -73.67985),
-    "munsons_corners": (42.58229, -76.2091),
-    "myers_corner": (41.6062, -73.87291),
-    "muttontown": (40.82399, -73.54763),
-    "nanuet": (41.08871, -74.01347),
-    "napanoch": (41.74398, -74.37154),
-    "nassau": (42.51591, -73.61012),
-    "nedrow": (42.97507, -76.14131),
-    "neponsit": (40.57177, -73.86152),
-    "nesconset": (40.85204, -73.154),
-    "new_cassel": (40.75899, -73.56957),
-    "new_dorp": (40.57399, -74.11598),
-    "new_dorp_beach": (40.56538, -74.10292),
-    "new_hartford": (43.0734, -75.28767),
-    "new_hyde_park": (40.7351, -73.68791),
-    "new_paltz": (41.74759, -74.08681),
-    "new_rochelle": (40.91149, -73.78235),
-    "new_springville": (40.59344, -74.1632),
-    "new_square": (41.13956, -74.02942),
-    "new_york_city": (40.71427, -74.00597),
-    "newfane": (43.28672, -78.71031),
-    "niagara_falls": (43.0945, -79.05671),
-    "niskayuna": (42.7798, -73.84568),
-    "nissequogue": (40.90399, -73.19789),
-    "niverville": (42.44092, -73.66095),
-    "north_amityville": (40.6976, -73.42512),
-    "north_babylon": (40.71649, -73.32179),
-    "north_bay_shore": (40.73621, -73.26262),
-    "north_bellmore": (40.69149, -73.53346),
-    "north_bellport": (40.77427, -72.94288),
-    "north_boston": (42.68562, -78.7767),
-    "north_collins": (42.59534, -78.94115),
-    "north_elba": (44.24338, -73.95431),
-    "north_gates": (43.17645, -77.70139),
-    "north_great_river": (40.74732, -73.16984),
-    "north_hills": (40.78093, -73.67652),
-    "north_lindenhurst": (40.71427, -73.38151),
-    "north_massapequa": (40.70093, -73.46207),
-    "north_merrick": (40.69121, -73.56318),
-    "north_new_hyde_park": (40.74316, -73.69319),
-    "north_patchogue": (40.78704, -73.009),
-    "north_sea": (40.93288, -72.41425),
-    "north_syracuse": (43.13479, -76.12992),
-    "north_tonawanda": (43.03867, -78.8642),
-    "north_valley_stream": (40.6851, -73.7018),
-    "north_wantagh": (40.69343, -73.50763),
-    "northwest_harbor": (41.00982, -72.22119),
-    "noyack": (40.99566, -72.34119),
-    "nunda": (42.57951, -77.9425),
-    "nyack": (41.09065, -73.91791),
-    "oakfield": (43.06589, -78.26974),
-    "oceanside": (40.63871, -73.64013),
-    "olcott": (43.33783, -78.71476),
-    "old_bethpage": (40.7626, -73.45318),
-    "old_brookville": (40.83204, -73.60485),
-    "old_westbury": (40.78871, -73.59957),
-    "olean": (42.07756, -78.42974),
-    "ontario": (43.2209, -77.28304),
-    "orange_lake": (41.53982, -74.0982),
-    "orchard_park": (42.76756, -78.74392),
-    "oriskany": (43.15729, -75.33267),
-    "ossining": (41.16287, -73.86152),
-    "otisville": (41.47343, -74.53849),
-    "owego": (42.10341, -76.26215),
-    "oyster_bay": (40.86565, -73.53207),
-    "oyster_bay_cove": (40.87093, -73.51096),
-    "ozone_park": (40.67677, -73.84375),
-    "painted_post": (42.16202, -77.09414),
-    "palenville": (42.17453, -74.02014),
-    "park_slope": (40.6701, -73.98597),
-    "parkchester": (40.83899, -73.86041),
-    "patchogue": (40.76565, -73.01511),
-    "pawling": (41.56204, -73.60263),
-    "peach_lake": (41.36759, -73.5779),
-    "peekskill": (41.29009, -73.92042),
-    "pelham_manor": (40.89538, -73.80708),
-    "penn_yan": (42.6609, -77.05386),
-    "perth": (43.01757, -74.19402),
-    "phelps": (42.95756, -77.05747),
-    "philmont": (42.24842, -73.65318),
-    "piermont": (41.04204, -73.91819),
-    "pine_bush": (41.60815, -74.29904),
-    "pine_plains": (41.97981, -73.65596),
-    "pittsford": (43.09062, -77.515),
-    "plainedge": (40.71732, -73.48374),
-    "plandome": (40.80677, -73.70346),
-    "plandome_heights": (40.8026, -73.7043),
-    "plattekill": (41.61759, -74.07598),
-    "plattsburgh": (44.69949, -73.45291),
-    "poestenkill": (42.69036, -73.56456),
-    "point_lookout": (40.59233, -73.58068),
-    "port_chester": (41.00176, -73.66568),
-    "port_dickinson": (42.13341, -75.89631),
-    "port_ewen": (41.90537, -73.97625),
-    "port_henry": (44.04839, -73.45985),
-    "port_jefferson": (40.94649, -73.06927),
-    "port_jefferson_station": (40.92538, -73.04733),
-    "port_jervis": (41.37509, -74.69266),
-    "port_morris": (40.80149, -73.90958),
-    "port_richmond": (40.63316, -74.13653),
-    "port_washington": (40.82566, -73.69819),
-    "port_washington_north": (40.84482, -73.7018),
-    "potsdam": (44.66978, -74.98131),
-    "poughkeepsie": (41.70037, -73.92097),
-    "pound_ridge": (41.20871, -73.57485),
-    "purchase": (41.04093, -73.71457),
-    "putnam_lake": (41.46204, -73.54624),
-    "queens_village": (40.72677, -73.74152),
-    "queens": (40.68149, -73.83652),
-    "queensbury": (43.37729, -73.61317),
-    "ransomville": (43.23867, -78.90976),
-    "rapids": (43.09839, -78.64086),
-    "ravena": (42.46841, -73.81624),
-    "red_hook": (41.99509, -73.87541),
-    "red_oaks_mill": (41.65565, -73.87486),
-    "rego_park": (40.72649, -73.85264),
-    "rhinebeck": (41.92676, -73.91264),
-    "richfield_springs": (42.85341, -74.98543),
-    "ridge": (40.89399, -72.89594),
-    "riverhead": (40.91704, -72.66204),
-    "rockaway_point": (40.56066, -73.91514),
-    "rockville_centre": (40.65871, -73.64124),
-    "roessleville": (42.69508, -73.80707),
-    "ronkonkoma": (40.81538, -73.11233),
-    "roosevelt": (40.67871, -73.58902),
-    "rosebank": (40.61399, -74.06625),
-    "roslyn": (40.79982, -73.65096),
-    "roslyn_estates": (40.79427, -73.66041),
-    "roslyn_harbor": (40.81649, -73.63707),
-    "roslyn_heights": (40.78871, -73.64735),
-    "rotterdam": (42.78702, -73.97096),
-    "rouses_point": (44.99393, -73.36486),
-    "rye_brook": (41.01926, -73.68346),
-    "sackets_harbor": (43.94617, -76.11909),
-    "sag_harbor": (40.99788, -72.29258),
-    "saint_johnsville": (42.99813, -74.68292),
-    "salamanca": (42.15784, -78.71503),
-    "sands_point": (40.85177, -73.71874),
-    "saranac_lake": (44.3295, -74.13127),
-    "saratoga_springs": (43.08313, -73.78457),
-    "saugerties": (42.07759, -73.95291),
-    "sayville": (40.73593, -73.08206),
-    "scarsdale": (41.0051, -73.78458),
-    "schenectady": (42.81424, -73.93957),
-    "schoharie": (42.66591, -74.30958),
-    "schuylerville": (43.10008, -73.58178),
-    "scotchtown": (41.48148, -74.36015),
-    "scotia": (42.82647, -73.96429),
-    "sea_cliff": (40.84899, -73.64485),
-    "searingtown": (40.77482, -73.65568),
-    "selden": (40.86649, -73.03566),
-    "seneca_falls": (42.91062, -76.79662),
-    "seneca_knolls": (43.12007, -76.28632),
-    "sheepshead_bay": (40.59122, -73.94458),
-    "shelter_island": (41.06815, -72.33869),
-    "shelter_island_heights": (41.08399, -72.35592),
-    "shenorock": (41.33176, -73.73819),
-    "sherburne": (42.67813, -75.49851),
-    "sherrill": (43.07368, -75.59824),
-    "shinnecock_hills": (40.89093, -72.4637),
-    "shokan": (41.97343, -74.21209),
-    "shortsville": (42.9559, -77.22081),
-    "shrub_oak": (41.32759, -73.81958),
-    "silver_creek": (42.54423, -79.16671),
-    "skaneateles": (42.94701, -76.4291),
-    "sloan": (42.89339, -78.79392),
-    "sloatsburg": (41.15454, -74.19292),
-    "smithtown": (40.85593, -73.20067),
-    "sodus": (43.23784, -77.06136),
-    "solvay": (43.05812, -76.20743),
-    "sound_beach": (40.95621, -72.96788),
-    "south_corning": (42.12174, -77.03719),
-    "south_fallsburg": (41.72065, -74.63433),
-    "south_farmingdale": (40.72066, -73.44012),
-    "south_floral_park": (40.71427, -73.70013),
-    "south_glens_falls": (43.29924, -73.63512),
-    "south_hempstead": (40.68094, -73.61541),
-    "south_huntington": (40.82371, -73.39873),
-    "south_lockport": (43.15006, -78.6967),
-    "south_nyack": (41.08315, -73.92014),
-    "south_valley_stream": (40.65594, -73.71763),
-    "southold": (41.06482, -72.4262),
-    "spackenkill": (41.65593, -73.91347),
-    "sparkill": (41.03121, -73.92708),
-    "spencerport": (43.18645, -77.8039),
-    "springfield_gardens": (40.66312, -73.76221),
-    "springs": (41.01621, -72.15924),
-    "spuyten_duyvil": (40.88121, -73.91736),
-    "saint_bonaventure": (42.08034, -78.47502),
-    "stapleton": (40.62649, -74.07764),
-    "staten_island": (40.56233, -74.13986),
-    "steinway": (40.77455, -73.90375),
-    "stewart_manor": (40.71927, -73.68846),
-    "stone_ridge": (41.85315, -74.13903),
-    "stony_brook": (40.92565, -73.14094),
-    "stottville": (42.2862, -73.73873),
-    "suffern": (41.11482, -74.14959),
-    "sylvan_beach": (42.46479, -77.1083),
-    "syosset": (40.82621, -73.50207),
-    "tappan": (41.02204, -73.94736),
-    "tarrytown": (41.07621, -73.85875),
-    "terrace_heights": (40.72149, -73.7693),
-    "thiells": (41.21065, -74.01764),
-    "thornwood": (41.12343, -73.77902),
-    "throgs_neck": (40.8226, -73.81958),
-    "ticonderoga": (43.84867, -73.42345),
-    "tillson": (41.82898, -74.06848),
-    "tivoli": (42.05842, -73.9093),
-    "tonawanda": (43.02033, -78.88031),
-    "town_line": (42.89061, -78.5778),
-    "tribes_hill": (42.95535, -74.28513),
-    "trumansburg": (42.54229, -76.66606),
-    "tupper_lake": (44.22395, -74.46406),
-    "uniondale": (40.70038, -73.59291),
-    "unionport": (40.82732, -73.85013),
-    "university_gardens": (40.77732, -73.72263),
-    "upper_brookville": (40.83871, -73.56513),
-    "upper_nyack": (41.10704, -73.92014),
-    "vails_gate": (41.45426, -74.05764),
-    "valatie": (42.41342, -73.67317),
-    "valhalla": (41.07482, -73.77513),
-    "valley_cottage": (41.11815, -73.95542),
-    "valley_stream": (40.66427, -73.70846),
-    "van_nest": (40.84843, -73.86375),
-    "verplanck": (41.25287, -73.95986),
-    "victor": (42.98256, -77.40888),
-    "village_green": (43.1334, -76.31299),
-    "village_of_the_branch": (40.85621, -73.18733),
-    "viola": (41.13648, -74.08236),
-    "volney": (43.34285, -76.35771),
-    "voorheesville": (42.65397, -73.92874),
-    "wading_river": (40.95038, -72.8426),
-    "wallkill": (41.60565, -74.18404),
-    "walton_park": (41.30982, -74.22904),
-    "wampsville": (43.07535, -75.70685),
-    "wantagh": (40.68371, -73.51013),
-    "wanakah": (42.74617, -78.90309),
-    "wappingers_falls": (41.59648, -73.91097),
-    "warwick": (41.25648, -74.35988),
-    "washington_heights": (40.8501, -73.93541),
-    "washington_mills": (43.05007, -75.27294),
-    "washingtonville": (41.42787, -74.16598),
-    "water_mill": (40.90593, -72.36203),
-    "watkins_glen": (42.38063, -76.87329),
-    "wawarsing": (41.75898, -74.35738),
-    "weedsport": (43.04868, -76.56272),
-    "wesley_hills": (41.15926, -74.06986),
-    "west_albany": (42.68313, -73.77845),
-    "west_babylon": (40.71816, -73.35429),
-    "west_bay_shore": (40.70871, -73.28123),
-    "west_carthage": (43.97423, -75.61519),
-    "west_elmira": (42.07813, -76.84524),
-    "west_end": (42.46869, -75.09378),
-    "west_glens_falls": (43.30007, -73.68401),
-    "west_haverstraw": (41.20954, -73.98542),
-    "west_hempstead": (40.70482, -73.65013),
-    "west_hills": (40.81621, -73.43234),
-    "west_hurley": (41.99731, -74.10486),
-    "west_islip": (40.70621, -73.30623),
-    "west_nyack": (41.09649, -73.97292),
-    "west_sand_lake": (42.64341, -73.60873),
-    "west_sayville": (40.72788, -73.09761),
-    "west_seneca": (42.85006, -78.79975),
-    "westbury": (40.75566, -73.58763),
-    "westerleigh": (40.62121, -74.13181),
-    "westhampton_beach": (40.80316, -72.61454),
-    "westmere": (42.69119, -73.86873),
-    "weston_mills": (42.0759, -78.37252),
-    "westons_mills": (42.06229, -78.37724),
-    "westvale": (43.04757, -76.22048),
-    "wheatley_heights": (40.76371, -73.36984),
-    "whitestone": (40.79455, -73.81847),
-    "williston_park": (40.75649, -73.64485),
-    "woodrow": (40.54344, -74.19764),
-    "woodside": (40.74538, -73.90541),
-    "wurtsboro": (41.57676, -74.4871),
-    "wyandanch": (40.75399, -73.3604),
-    "wykagyl": (40.94149, -73.79902),
-    "wynantskill": (42.69675, -73.64428),
-    "yaphank": (40.83677, -72.91705),
-    "yonkers": (40.93121, -73.89875),
-    "yorktown_heights": (41.27093, -73.77763),
-    "zena": (42.01676, -74.07625),
-    "alliance": (40.91534, -81.10593),
-    "ansonia": (40.21449, -84.6369),
-    "antwerp": (41.18144, -84.74051),
-    "apple_creek": (40.75172, -81.8393),
-    "archbold": (41.52144, -84.30717),
-    "ashtabula": (41.86505, -80.78981),
-    "austintown": (41.10172, -80.76452),
-    "avon_center": (41.45976, -82.01959),
-    "avon_lake": (41.50532, -82.0282),
-    "ballville": (41.32783, -83.13214),
-    "barberton": (41.01283, -81.60512),
-    "bay_village": (41.48477, -81.92208),
-    "bedford_heights": (41.417, -81.52734),
-    "beechwood_trails": (40.02367, -82.65072),
-    "bellefontaine": (40.36116, -83.75966),
-    "boardman": (41.02423, -80.66285),
-    "bolindale": (41.20728, -80.77758),
-    "boston_heights": (41.26478, -81.51317),
-    "botkins": (40.46783, -84.1805),
-    "bradner": (41.32422, -83.43854),
-    "bratenahl": (41.54255, -81.62624),
-    "brecksville": (41.31978, -81.62679),
-    "brilliant": (40.26479, -80.62619),
-    "broadview_heights": (41.31394, -81.68513),
-    "brook_park": (41.39838, -81.80458),
-    "brookfield_center": (41.24061, -80.55785),
-    "bucyrus": (40.80839, -82.97546),
-    "calcutta": (40.6734, -80.57646),
-    "canal_fulton": (40.88978, -81.59762),
-    "canfield": (41.02506, -80.76091),
-    "cardington": (40.50062, -82.89351),
-    "carey": (40.95256, -83.38242),
-    "centerburg": (40.30451, -82.69628),
-    "chagrin_falls": (41.43616, -81.3865),
-    "chardon": (41.61422, -81.14899),
-    "chesterland": (41.52227, -81.33789),
-    "churchill": (41.162, -80.6648),
-    "collinwood": (41.55838, -81.56929),
-    "columbus_grove": (40.9195, -84.05689),
-    "conneaut": (41.94756, -80.55424),
-    "continental": (41.10033, -84.26634),
-    "convoy": (40.91672, -84.70274),
-    "copley": (41.09894, -81.64457),
-    "coshocton": (40.27202, -81.85958),
-    "craig_beach": (41.117, -80.98342),
-    "crestline": (40.78756, -82.73657),
-    "cridersville": (40.65422, -84.15078),
-    "curtice": (41.61838, -83.36771),
-    "cuyahoga_falls": (41.13394, -81.48456),
-    "de_graff": (40.312, -83.91577),
-    "defiance": (41.28449, -84.35578),
-    "delaware": (40.29867, -83.06797),
-    "delphos": (40.84338, -84.34162),
-    "delta": (41.57366, -84.00522),
-    "dennison": (40.3934, -81.33372),
-    "deshler": (41.20755, -83.89911),
-    "doylestown": (40.97005, -81.69652),
-    "east_canton": (40.78728, -81.28261),
-    "east_liverpool": (40.61868, -80.57729),
-    "east_palestine": (40.83395, -80.54035),
-    "eastlake": (41.65394, -81.45039),
-    "eaton_estates": (41.30894, -82.0057),
-    "elida": (40.78866, -84.20384),
-    "elyria": (41.36838, -82.10765),
-    "euclid": (41.5931, -81.52679),
-    "fairport_harbor": (41.75004, -81.27399),
-    "findlay": (41.04422, -83.64993),
-    "fort_loramie": (40.35144, -84.37384),
-    "fort_recovery": (40.41282, -84.77635),
-    "fort_shawnee": (40.68672, -84.13773),
-    "fostoria": (41.157, -83.41687),
-    "frazeysburg": (40.11729, -82.11931),
-    "gahanna": (40.01923, -82.87934),
-    "galion": (40.73367, -82.7899),
-    "gambier": (40.37562, -82.3971),
-    "garfield_heights": (41.417, -81.60596),
-    "garrettsville": (41.28422, -81.09649),
-    "gates_mills": (41.51755, -81.40345),
-    "geneva_on_the_lake": (41.8595, -80.95398),
-    "gibsonburg": (41.3845, -83.32048),
-    "glandorf": (41.02894, -84.07911),
-    "glenmoor": (40.66617, -80.62313),
-    "gnadenhutten": (40.3584, -81.43428),
-    "green": (40.94589, -81.48317),
-    "green_springs": (41.25616, -83.05158),
-    "haskins": (41.46477, -83.70605),
-    "holgate": (41.24894, -84.133),
-    "hough": (41.512, -81.63652),
-    "howland_center": (41.25117, -80.74536),
-    "huber_ridge": (40.08867, -82.91657),
-    "huron": (41.39505, -82.55517),
-    "jackson_center": (40.43949, -84.04022),
-    "kalida": (40.98283, -84.19939),
-    "kirtland": (41.62894, -81.3615),
-    "la_croft": (40.6459, -80.59785),
-    "lakemore": (41.02089, -81.43595),
-    "leavittsburg": (41.24783, -80.87703),
-    "leetonia": (40.87728, -80.75536),
-    "leipsic": (41.09838, -83.98467),
-    "lewis_center": (40.1984, -83.01018),
-    "liberty_center": (41.44338, -84.00883),
-    "lorain": (41.45282, -82.18237),
-    "lordstown": (41.16561, -80.85758),
-    "loudonville": (40.63534, -82.23321),
-    "lowellville": (41.03534, -80.53646),
-    "luckey": (41.45061, -83.48743),
-    "macedonia": (41.31367, -81.50845),
-    "maple_heights": (41.41533, -81.56596),
-    "martins_ferry": (40.09591, -80.72453),
-    "massillon": (40.79672, -81.52151),
-    "masury": (41.21117, -80.53785),
-    "maumee": (41.56283, -83.65382),
-    "mayfield_heights": (41.51922, -81.4579),
-    "mcdonald": (41.16367, -80.72424),
-    "mckinley_heights": (41.18367, -80.7173),
-    "mechanicsburg": (40.072, -83.55631),
-    "mentor": (41.66616, -81.33955),
-    "mentor_on_the_lake": (41.70504, -81.36039),
-    "middleburg_heights": (41.36144, -81.81291),
-    "middlefield": (41.462, -81.07371),
-    "millersburg": (40.55451, -81.91792),
-    "mineral_ridge": (41.14006, -80.76897),
-    "minerva": (40.72978, -81.10538),
-    "minerva_park": (40.07645, -82.94379),
-    "mingo_junction": (40.32174, -80.6098),
-    "minster": (40.3931, -84.37606),
-    "mogadore": (41.04645, -81.39789),
-    "moreland_hills": (41.44783, -81.42762),
-    "morgandale": (41.26561, -80.78286),
-    "munroe_falls": (41.1445, -81.43983),
-    "new_bremen": (40.43699, -84.37967),
-    "new_california": (40.15617, -83.23658),
-    "new_middletown": (40.96117, -80.55757),
-    "new_philadelphia": (40.48979, -81.44567),
-    "new_waterford": (40.84506, -80.61452),
-    "newburgh_heights": (41.45005, -81.66346),
-    "newcomerstown": (40.27229, -81.60595),
-    "newton_falls": (41.18839, -80.97815),
-    "north_baltimore": (41.18283, -83.67827),
-    "north_canton": (40.87589, -81.40234),
-    "north_kingsville": (41.90589, -80.69036),
-    "north_lewisburg": (40.22311, -83.55743),
-    "north_olmsted": (41.4156, -81.92347),
-    "north_randall": (41.43478, -81.52568),
-    "north_ridgeville": (41.38949, -82.01903),
-    "north_royalton": (41.31366, -81.72457),
-    "oak_harbor": (41.50672, -83.14659),
-    "olmsted_falls": (41.37505, -81.90819),
-    "orrville": (40.84367, -81.76402),
-    "orwell": (41.53506, -80.86814),
-    "ottawa_hills": (41.66422, -83.64327),
-    "painesville": (41.72449, -81.24566),
-    "pandora": (40.94811, -83.96105),
-    "parma": (41.40477, -81.72291),
-    "parma_heights": (41.39005, -81.75958),
-    "paulding": (41.13811, -84.58051),
-    "payne": (41.07755, -84.72718),
-    "pemberville": (41.41089, -83.46104),
-    "pepper_pike": (41.47839, -81.46373),
-    "perry_heights": (40.79534, -81.47345),
-    "perrysburg": (41.557, -83.62716),
-    "pioneer": (41.68005, -84.55301),
-    "piqua": (40.14477, -84.24244),
-    "plain_city": (40.10756, -83.26742),
-    "port_clinton": (41.512, -82.93769),
-    "portage_lakes": (41.00728, -81.52706),
-    "powell": (40.15784, -83.07519),
-    "reminderville": (41.34589, -81.39511),
-    "richville": (40.75117, -81.4779),
-    "rittman": (40.97811, -81.78208),
-    "roaming_shores": (41.64311, -80.82342),
-    "rocky_river": (41.4756, -81.8393),
-    "rossford": (41.60977, -83.56438),
-    "russells_point": (40.47116, -83.89272),
-    "saint_clairsville": (40.08063, -80.90009),
-    "saint_henry": (40.41755, -84.63968),
-    "saint_paris": (40.12839, -83.95966),
-    "salineville": (40.62256, -80.83786),
-    "sawyerwood": (41.03783, -81.44095),
-    "seven_hills": (41.39533, -81.67624),
-    "seville": (41.01006, -81.86236),
-    "shaker_heights": (41.47394, -81.53707),
-    "sheffield_lake": (41.48754, -82.10154),
-    "shreve": (40.68145, -82.02181),
-    "south_canal": (41.17728, -80.98676),
-    "south_euclid": (41.52311, -81.51846),
-    "south_russell": (41.43144, -81.36539),
-    "steubenville": (40.36979, -80.63396),
-    "stony_prairie": (41.35144, -83.1552),
-    "streetsboro": (41.23922, -81.34594),
-    "strongsville": (41.3145, -81.83569),
-    "struthers": (41.05256, -80.60785),
-    "stryker": (41.50366, -84.41412),
-    "sugarcreek": (40.50312, -81.64096),
-    "sunbury": (40.24256, -82.85907),
-    "swanton": (41.58866, -83.89105),
-    "tallmadge": (41.10145, -81.44178),
-    "tiltonsville": (40.16674, -80.6998),
-    "toronto": (40.46423, -80.60091),
-    "tuscarawas": (40.39479, -81.40706),
-    "twinsburg": (41.31256, -81.44011),
-    "uhrichsville": (40.39312, -81.3465),
-    "upper_sandusky": (40.82728, -83.28131),
-    "vermilion": (41.42199, -82.36461),
-    "van_wert": (40.86949, -84.58412),
-    "vermilion_on_the_lake": (41.42838, -82.32377),
-    "wakeman": (41.2545, -82.39961),
-    "walbridge": (41.58783, -83.49327),
-    "walton_hills": (41.36561, -81.56123),
-    "wapakoneta": (40.56783, -84.19356),
-    "warrensville_heights": (41.43505, -81.53623),
-    "wauseon": (41.54922, -84.14161),
-    "west_hill": (41.23283, -80.51924),
-    "west_salem": (40.97144, -82.10987),
-    "west_unity": (41.58616, -84.43495),
-    "westerville": (40.12617, -82.92907),
-    "westfield_center": (41.02644, -81.9332),
-    "willoughby": (41.63977, -81.4065),
-    "willoughby_hills": (41.59838, -81.41845),
-    "willowick": (41.6331, -81.46873),
-    "wintersville": (40.37535, -80.70369),
-    "wolfhurst": (40.06924, -80.7837),
-    "wooster": (40.80517, -81.93646),
-    "alburtis": (40.51093, -75.60297),
-    "aliquippa": (40.63673, -80.24006),
-    "alleghenyville": (40.23426, -75.98855),
-    "allison_park": (40.55951, -79.95867),
-    "almedia": (41.01453, -76.38105),
-    "ambler": (40.15455, -75.22157),
-    "ambridge": (40.58923, -80.22506),
-    "amity_gardens": (40.27426, -75.73519),
-    "ancient_oaks": (40.54732, -75.58935),
-    "apollo": (40.58145, -79.56643),
-    "archbald": (41.4948, -75.53685),
-    "aspinwall": (40.49146, -79.90477),
-    "avis": (41.18479, -77.31386),
-    "avonia": (42.04561, -80.26979),
-    "back_mountain": (41.33591, -75.99631),
-    "baidland": (40.19479, -79.97088),
-    "bakerstown": (40.6509, -79.93644),
-    "bala_cynwyd": (40.00761, -75.23407),
-    "bally": (40.40232, -75.58713),
-    "barnesboro": (40.66257, -78.78003),
-    "bear_rocks": (40.12285, -79.4617),
-    "beaver_falls": (40.75201, -80.31923),
-    "beaverdale": (40.32202, -78.69696),
-    "bell_acres": (40.59007, -80.16645),
-    "belle_vernon": (40.12507, -79.86644),
-    "ben_avon": (40.50812, -80.08311),
-    "bentleyville": (40.11674, -80.00839),
-    "bethel_park": (40.32757, -80.0395),
-    "big_beaver": (40.82451, -80.36284),
-    "birchwood_lakes": (41.25454, -74.9185),
-    "birdsboro": (40.26454, -75.80409),
-    "black_lick": (40.4725, -79.18688),
-    "blandon": (40.4412, -75.88687),
-    "blawnox": (40.4934, -79.86061),
-    "bloomsburg": (41.0037, -76.45495),
-    "blossburg": (41.67952, -77.06386),
-    "blue_ball": (40.11871, -76.04717),
-    "blue_bell": (40.15233, -75.26629),
-    "boalsburg": (40.77562, -77.7925),
-    "boswell": (40.16147, -79.02892),
-    "bowmansville": (40.19676, -76.01744),
-    "boyertown": (40.33371, -75.63741),
-    "brackenridge": (40.60812, -79.74116),
-    "braddock": (40.4034, -79.86838),
-    "braddock_hills": (40.41729, -79.86505),
-    "bradford_woods": (40.63757, -80.08172),
-    "bressler": (40.22953, -76.81997),
-    "breinigsville": (40.53676, -75.6313),
-    "brickerville": (40.22593, -76.30246),
-    "brockway": (41.24923, -78.79947),
-    "brodheadsville": (40.92454, -75.39379),
-    "browntown": (41.3098, -75.78742),
-    "bryn_athyn": (40.1315, -75.06739),
-    "bryn_mawr": (40.30396, -80.08672),
-    "burgettstown": (40.38201, -80.39284),
-    "calumet": (40.2109, -79.48532),
-    "cambridge_springs": (41.80367, -80.05644),
-    "camp_hill": (40.23981, -76.91997),
-    "campbelltown": (40.27759, -76.58525),
-    "canonsburg": (40.26257, -80.18728),
-    "castanea": (41.12479, -77.4297),
-    "castle_shannon": (40.36479, -80.02228),
-    "catasauqua": (40.65482, -75.47463),
-    "catawissa": (40.95203, -76.45967),
-    "cementon": (40.68926, -75.50768),
-    "centre_hall": (40.84756, -77.68611),
-    "cetronia": (40.58676, -75.52963),
-    "chalfont": (40.28844, -75.20906),
-    "charleroi": (40.13785, -79.8981),
-    "chester_springs": (40.0951, -75.61687),
-    "chesterbrook": (40.07566, -75.45908),
-    "cheswick": (40.54173, -79.79922),
-    "chevy_chase_heights": (40.63673, -79.1442),
-    "chicora": (40.94812, -79.74283),
-    "chinchilla": (41.47508, -75.67713),
-    "clairton": (40.29229, -79.88171),
-    "clarks_green": (41.49286, -75.69964),
-    "clarks_summit": (41.48869, -75.70852),
-    "claysburg": (40.29674, -78.44974),
-    "clearfield": (41.02728, -78.43919),
-    "cleona": (40.33731, -76.47552),
-    "coaldale": (40.82287, -75.90687),
-    "cochranton": (41.52005, -80.04839),
-    "collinsburg": (40.22424, -79.76838),
-    "colonial_park": (40.30064, -76.80969),
-    "conemaugh": (40.32674, -78.90808),
-    "conashaugh_lakes": (41.30593, -74.98962),
-    "connellsville": (40.01785, -79.58948),
-    "conshohocken": (40.07928, -75.30157),
-    "conyngham": (40.99203, -76.05659),
-    "coopersburg": (40.51149, -75.39046),
-    "coplay": (40.6701, -75.49546),
-    "coraopolis": (40.5184, -80.16672),
-    "cornwells_heights": (40.07678, -74.94878),
-    "corry": (41.92033, -79.64033),
-    "coudersport": (41.77479, -78.02056),
-    "crafton": (40.43507, -80.06617),
-    "cresson": (40.45979, -78.59168),
-    "cressona": (40.62676, -76.19272),
-    "croydon": (40.08733, -74.9035),
-    "curtisville": (40.64229, -79.85089),
-    "curwensville": (40.97561, -78.52502),
-    "davidsville": (40.22702, -78.93641),
-    "delmont": (40.41312, -79.57032),
-    "devon": (40.04928, -75.42908),
-    "dewart": (41.10925, -76.87663),
-    "dickson_city": (41.47147, -75.60769),
-    "dillsburg": (40.11093, -77.03498),
-    "donora": (40.1734, -79.85755),
-    "dormont": (40.3959, -80.03311),
-    "dorneyville": (40.5751, -75.51963),
-    "downingtown": (40.0065, -75.70327),
-    "dravosburg": (40.35063, -79.88616),
-    "dresher": (40.14094, -75.16684),
-    "dubois": (41.11923, -78.76003),
-    "duboistown": (41.22258, -77.03691),
-    "duncannon": (40.39814, -77.02303),
-    "duncansville": (40.42341, -78.4339),
-    "dunmore": (41.4198, -75.63241),
-    "dunnstown": (41.1459, -77.42137),
-    "dupont": (41.32508, -75.74547),
-    "duryea": (41.34397, -75.73853),
-    "eagleville": (40.15955, -75.40824),
-    "earlston": (40.00619, -78.37001),
-    "east_bangor": (40.87954, -75.18379),
-    "east_berwick": (41.06203, -76.22243),
-    "east_conemaugh": (40.34868, -78.88364),
-    "east_earl": (40.1101, -76.03272),
-    "east_greenville": (40.40649, -75.50185),
-    "east_mckeesport": (40.38312, -79.80644),
-    "east_petersburg": (40.1001, -76.35413),
-    "east_pittsburgh": (40.39562, -79.83866),
-    "east_stroudsburg": (40.99954, -75.18129),
-    "east_washington": (40.17368, -80.23756),
-    "eastlawn_gardens": (40.75065, -75.29573),
-    "ebensburg": (40.48507, -78.72474),
-    "economy": (40.60007, -80.22478),
-    "edgeworth": (40.55118, -80.19284),
-    "edinboro": (41.87422, -80.13172),
-    "effort": (40.93926, -75.43491),
-    "egypt": (40.6801, -75.52991),
-    "elim": (40.29785, -78.94253),
-    "elizabethville": (40.54897, -76.81192),
-    "elkland": (41.98618, -77.31081),
-    "ellport": (40.86395, -80.25895),
-    "ellwood_city": (40.86173, -80.28645),
-    "elverson": (40.15676, -75.83271),
-    "elysburg": (40.86453, -76.55246),
-    "emerald_lakes": (41.08842, -75.41963),
-    "emigsville": (40.02176, -76.72802),
-    "emmaus": (40.53954, -75.49685),
-    "emporium": (41.51145, -78.23529),
-    "emsworth": (40.51007, -80.0945),
-    "enhaut": (40.23176, -76.82692),
-    "enlow": (40.45423, -80.23311),
-    "enola": (40.29009, -76.93386),
-    "ephrata": (40.17982, -76.17884),
-    "espy": (41.0062, -76.40994),
-    "evans_city": (40.76923, -80.06284),
-    "evansburg": (40.18094, -75.42907),
-    "exton": (40.029, -75.62077),
-    "factoryville": (40.82482, -75.20962),
-    "fairless_hills": (40.17955, -74.85516),
-    "falls_creek": (41.14506, -78.80447),
-    "farrell": (41.21228, -80.49674),
-    "faxon": (41.24841, -76.97719),
-    "feasterville": (40.144, -75.00517),
-    "fellsburg": (40.18313, -79.82421),
-    "fernway": (40.69479, -80.13089),
-    "fivepointville": (40.18287, -76.05106),
-    "fleetwood": (40.45398, -75.81798),
-    "flourtown": (40.10344, -75.2124),
-    "flying_hills": (40.27676, -75.9141),
-    "ford_city": (40.77229, -79.52977),
-    "forty_fort": (41.27897, -75.87825),
-    "foster_brook": (41.97506, -78.61725),
-    "fountain_hill": (40.60149, -75.39518),
-    "fox_chapel": (40.5134, -79.87977),
-    "fox_run": (40.70229, -80.08284),
-    "frackville": (40.78398, -76.23022),
-    "freemansburg": (40.62649, -75.34574),
-    "friedens": (40.05008, -78.99836),
-    "galeton": (41.73312, -77.64193),
-    "gallitzin": (40.48229, -78.55168),
-    "garden_view": (41.25424, -77.04608),
-    "gastonville": (40.25729, -79.99588),
-    "geistown": (40.29091, -78.86891),
-    "gilbertsville": (40.3201, -75.61018),
-    "girardville": (40.79148, -76.28356),
-    "glassport": (40.32479, -79.89227),
-    "glen_lyon": (41.17508, -76.07465),
-    "glenside": (40.10233, -75.15212),
-    "glenshaw": (40.53285, -79.96755),
-    "gold_key_lake": (41.30593, -74.9385),
-    "green_tree": (40.41174, -80.04561),
-    "greenock": (40.31229, -79.80671),
-    "grill": (40.2987, -75.94049),
-    "halfway_house": (40.28204, -75.64324),
-    "hallam": (40.00482, -76.60413),
-    "hallstead": (41.96119, -75.74324),
-    "harleigh": (40.98064, -75.97131),
-    "harleysville": (40.27955, -75.38712),
-    "harveys_lake": (41.38341, -76.02465),
-    "hasson_heights": (41.44895, -79.677),
-    "hatboro": (40.17428, -75.10684),
-    "hazleton": (40.95842, -75.97465),
-    "hellertown": (40.57954, -75.34073),
-    "hemlock_farms": (41.32676, -75.03656),
-    "hershey": (40.28592, -76.65025),
-    "highspire": (40.21092, -76.79108),
-    "hilldale": (41.28925, -75.83631),
-    "hiller": (40.01035, -79.90088),
-    "hokendauqua": (40.66204, -75.49102),
-    "hollidaysburg": (40.42729, -78.3889),
-    "homer_city": (40.5434, -79.16226),
-    "honesdale": (41.57676, -75.25879),
-    "honey_brook": (40.09427, -75.91133),
-    "horsham": (40.17844, -75.12851),
-    "houserville": (40.82395, -77.82889),
-    "hughestown": (41.32702, -75.77325),
-    "hummels_wharf": (40.83175, -76.8358),
-    "hummelstown": (40.26537, -76.7083),
-    "hyde": (41.00256, -78.46252),
-    "indian_mountain_lake": (41.00314, -75.50824),
-    "indiana": (40.62146, -79.15253),
-    "industry": (40.64451, -80.41618),
-    "inkerman": (41.29897, -75.81269),
-    "intercourse": (40.0376, -76.10495),
-    "ivyland": (40.20789, -75.07267),
-    "jacksonwald": (40.32454, -75.84965),
-    "jeannette": (40.32812, -79.61532),
-    "jefferson_hills": (40.29118, -79.93199),
-    "jenkintown": (40.09594, -75.12517),
-    "jermyn": (41.53091, -75.54546),
-    "jersey_shore": (41.20202, -77.26442),
-    "jim_thorpe": (40.87592, -75.73241),
-    "johnsonburg": (41.49062, -78.67503),
-    "kane": (41.66284, -78.81114),
-    "kenhorst": (40.31065, -75.93938),
-    "kenmar": (41.25341, -76.95941),
-    "king_of_prussia": (40.08927, -75.39602),
-    "kittanning": (40.81645, -79.52199),
-    "kulpmont": (40.79342, -76.47245),
-    "kulpsville": (40.24288, -75.33656),
-    "kutztown": (40.51732, -75.77742),
-    "laflin": (41.28897, -75.80547),
-    "lake_wynonah": (40.59926, -76.16383),
-    "lakemont": (40.47285, -78.38835),
-    "landisville": (40.09537, -76.40996),
-    "langhorne": (40.17455, -74.92267),
-    "langhorne_manor": (40.16705, -74.91767),
-    "lansdale": (40.2415, -75.28379),
-    "lansford": (40.83176, -75.88242),
-    "larksville": (41.24508, -75.93075),
-    "latrobe": (40.32118, -79.37948),
-    "laureldale": (40.38815, -75.91798),
-    "laurys_station": (40.72315, -75.53018),
-    "lawnton": (40.25842, -76.80386),
-    "lawrence_park": (40.34564, -76.8008),
-    "lawson_heights": (40.29174, -79.3892),
-    "leechburg": (40.62701, -79.6056),
-    "leesport": (40.44704, -75.96632),
-    "leetsdale": (40.56312, -80.20839),
-    "lehighton": (40.8337, -75.7138),
-    "lemoyne": (40.2412, -76.89414),
-    "lenape_heights": (40.76423, -79.5206),
-    "leola": (40.08787, -76.18495),
-    "level_green": (40.3934, -79.72032),
-    "light_street": (41.0362, -76.42356),
-    "linglestown": (40.33398, -76.78914),
-    "linntown": (40.95897, -76.89913),
-    "lionville": (40.05372, -75.65993),
-    "lititz": (40.15732, -76.3069),
-    "lock_haven": (41.13701, -77.44693),
-    "lorane": (40.28843, -75.85465),
-    "lower_allen": (40.22648, -76.90053),
-    "lower_burrell": (40.55312, -79.75727),
-    "loyalhanna": (40.32257, -79.36226),
-    "lykens": (40.56675, -76.70052),
-    "macungie": (40.51593, -75.55519),
-    "mahanoy_city": (40.81259, -76.1416),
-    "manheim": (40.16343, -76.39496),
-    "maple_glen": (40.01563, -79.97672),
-    "marianne": (41.24645, -79.42893),
-    "marienville": (41.46895, -79.1231),
-    "mars": (40.6959, -80.01173),
-    "marshallton": (40.78675, -76.5394),
-    "matamoras": (40.44009, -76.93331),
-    "maytown": (40.07537, -76.58219),
-    "mcadoo": (40.90127, -75.99106),
-    "mcconnellstown": (40.45257, -78.08167),
-    "mcgovern": (40.22896, -80.21645),
-    "mckees_rocks": (40.46562, -80.06561),
-    "mckeesport": (40.34785, -79.86422),
-    "mcmurray": (40.27785, -80.08394),
-    "meadowood": (40.84201, -79.89394),
-    "mercer": (41.227, -80.23979),
-    "mifflinburg": (40.91758, -77.04775),
-    "mifflintown": (40.5698, -77.39693),
-    "mifflinville": (41.03231, -76.30799),
-    "milesburg": (40.94173, -77.785),
-    "mill_hall": (41.10729, -77.48443),
-    "millvale": (40.48007, -79.97839),
-    "milroy": (40.71396, -77.59055),
-    "minersville": (40.69065, -76.26217),
-    "mohnton": (40.28593, -75.98438),
-    "monaca": (40.68729, -80.27145),
-    "monessen": (40.14841, -79.88783),
-    "monongahela": (40.20313, -79.92616),
-    "montgomeryville": (40.24733, -75.24379),
-    "montoursville": (41.25425, -76.92052),
-    "moosic": (41.35341, -75.73825),
-    "moscow": (41.33675, -75.51852),
-    "mount_cobb": (41.41342, -75.49324),
-    "mount_holly_springs": (40.11842, -77.18998),
-    "mount_joy": (40.10982, -76.5033),
-    "mount_lebanon": (40.35535, -80.0495),
-    "mount_oliver": (40.41424, -79.98783),
-    "mount_penn": (40.32815, -75.89076),
-    "mount_pocono": (41.12203, -75.36463),
-    "mount_union": (40.38452, -77.88222),
-    "mount_wolf": (40.06315, -76.70386),
-    "mountain_top": (41.16953, -75.87742),
-    "mountainhome": (41.1737, -75.27102),
-    "mountville": (40.03926, -76.4308),
-    "muhlenberg_park": (40.38482, -75.94132),
-    "muncy": (41.20564, -76.78552),
-    "munhall": (40.39229, -79.90005),
-    "mundys_corner": (40.44479, -78.84113),
-    "murrysville": (40.4284, -79.69755),
-    "muse": (40.29285, -80.20034),
-    "myerstown": (40.37454, -76.30273),
-    "nanticoke": (41.20536, -76.00492),
-    "nanty_glo": (40.47229, -78.83336),
-    "narberth": (40.00845, -75.26046),
-    "nazareth": (40.74038, -75.30962),
-    "nescopeck": (41.05203, -76.22077),
-    "nesquehoning": (40.86453, -75.81103),
-    "new_beaver": (40.87645, -80.37062),
-    "new_berlinville": (40.34537, -75.63296),
-    "new_bloomfield": (40.41981, -77.18637),
-    "new_columbia": (41.04092, -76.86691),
-    "new_eagle": (40.20785, -79.94699),
-    "new_cumberland": (40.23231, -76.8847),
-    "new_kensington": (40.56979, -79.76477),
-    "new_holland": (40.10176, -76.08523),
-    "new_stanton": (40.21924, -79.60948),
-    "new_wilmington": (41.12228, -80.33284),
-    "newmanstown": (40.34954, -76.21328),
-    "newtown_grant": (40.26011, -74.95489),
-    "newville": (40.17314, -77.3986),
-    "norristown": (40.1215, -75.3399),
-    "north_apollo": (40.59618, -79.5556),
-    "north_belle_vernon": (40.12924, -79.8681),
-    "north_braddock": (40.39896, -79.84088),
-    "north_charleroi": (40.15118, -79.90755),
-    "north_catasauqua": (40.65982, -75.47685),
-    "north_versailles": (40.37979, -79.80949),
-    "north_wales": (40.21094, -75.27823),
-    "north_warren": (41.87423, -79.15227),
-    "northern_cambria": (40.65923, -78.78169),
-    "oak_hills": (40.82479, -79.91311),
-    "oakmont": (40.52173, -79.84227),
-    "ohioville": (40.67923, -80.49479),
-    "oil_city": (41.43395, -79.70644),
-    "old_forge": (41.37119, -75.73491),
-    "old_orchard": (40.65788, -75.26212),
-    "oley": (40.38759, -75.78964),
-    "olyphant": (41.46841, -75.60297),
-    "orchard_hills": (40.58618, -79.53143),
-    "oreland": (40.11844, -75.17768),
-    "orwigsburg": (40.65481, -76.10077),
-    "osceola_mills": (40.85006, -78.27057),
-    "palmdale": (40.29787, -76.61858),
-    "palmer_heights": (40.68732, -75.2624),
-    "palmerton": (40.8014, -75.6119),
-    "palo_alto": (40.68731, -76.17216),
-    "paradise": (40.00982, -76.12857),
-    "park_forest_village": (40.80673, -77.91695),
-    "patton": (40.63396, -78.6503),
-    "paxtang": (40.25898, -76.83192),
-    "paxtonia": (40.31731, -76.79442),
-    "pen_argyl": (40.86871, -75.2549),
-    "penbrook": (40.27537, -76.84803),
-    "penn_hills": (40.50118, -79.83922),
-    "penndel": (40.15205, -74.91656),
-    "pennsburg": (40.39093, -75.49212),
-    "pennside": (40.33732, -75.87854),
-    "penryn": (40.20509, -76.36829),
-    "perkasie": (40.37205, -75.29268),
-    "perryopolis": (40.08702, -79.7506),
-    "philipsburg": (40.89645, -78.22057),
-    "phoenixville": (40.13038, -75.51491),
-    "pine_grove": (40.54842, -76.38468),
-    "pine_grove_mills": (40.73367, -77.88556),
-    "pitcairn": (40.40312, -79.7781),
-    "pittsburgh": (40.44062, -79.99589),
-    "plains": (41.27536, -75.8502),
-    "pleasant_gap": (40.86812, -77.74667),
-    "plum": (40.50035, -79.74949),
-    "plumsteadville": (40.38733, -75.14656),
-    "plymouth_meeting": (40.10233, -75.27435),
-    "pocono_pines": (41.10675, -75.45435),
-    "port_carbon": (40.69648, -76.16883),
-    "port_allegany": (41.8109, -78.27974),
-    "port_vue": (40.3359, -79.86977),
-    "pottsgrove": (40.26482, -75.61185),
-    "pottstown": (40.24537, -75.64963),
-    "progress": (40.28509, -76.83136),
-    "punxsutawney": (40.94368, -78.97087),
-    "quakertown": (40.44177, -75.34157),
-    "radnor": (40.04622, -75.35991),
-    "pocono_ranch_lands": (41.16454, -74.95212),
-    "rankin": (40.41257, -79.87922),
-    "raubsville": (40.63566, -75.19295),
-    "reamstown": (40.21148, -76.12328),
-    "reiffton": (40.31981, -75.87354),
-    "reinholds": (40.26676, -76.1155),
-    "rennerdale": (40.3984, -80.14145),
-    "renovo": (41.32646, -77.75082),
-    "reynolds_heights": (41.34506, -80.39423),
-    "reynoldsville": (41.09701, -78.88864),
-    "rheems": (40.13009, -76.57052),
-    "richboro": (40.21511, -75.01072),
-    "richlandtown": (40.4701, -75.32046),
-    "ridgway": (41.42034, -78.72864),
-    "river_view_park": (40.39259, -75.95882),
-    "roaring_spring": (40.33591, -78.39085),
-    "robesonia": (40.35176, -76.13439),
-    "roseto": (40.88065, -75.21462),
-    "rothsville": (40.15121, -76.25107),
-    "royersford": (40.18427, -75.53796),
-    "russellton": (40.61146, -79.837),
-    "saint_lawrence": (40.32704, -75.87187),
-    "salix": (40.30008, -78.7653),
-    "salunga": (40.10093, -76.42469),
-    "sanatoga": (40.2451, -75.59518),
-    "sand_hill": (40.35954, -76.43163),
-    "sandy": (41.10784, -78.77114),
-    "saw_creek": (41.11259, -75.05073),
-    "saxonburg": (40.75395, -79.81005),
-    "saylorsburg": (40.89565, -75.32352),
-    "schlusser": (40.24175, -77.17693),
-    "schnecksville": (40.67514, -75.62044),
-    "schoeneck": (40.24148, -76.17411),
-    "schuylkill_haven": (40.63065, -76.17105),
-    "schwenksville": (40.25621, -75.46379),
-    "scranton": (41.40916, -75.6649),
-    "selinsgrove": (40.79897, -76.86219),
-    "sellersville": (40.35399, -75.3049),
-    "seven_fields": (40.69173, -80.06256),
-    "sewickley": (40.53646, -80.1845),
-    "shamokin": (40.78897, -76.55885),
-    "shamokin_dam": (40.8487, -76.81969),
-    "sharpsville": (41.25922, -80.47201),
-    "shavertown": (41.3198, -75.93798),
-    "shenandoah_heights": (40.82759, -76.20688),
-    "shillington": (40.30787, -75.96549),
-    "shinglehouse": (41.96368, -78.19084),
-    "shiremanstown": (40.22342, -76.95359),
-    "shippensburg": (40.05065, -77.52026),
-    "shoemakersville": (40.50093, -75.96993),
-    "simpson": (41.59175, -75.48518),
-    "sinking_spring": (40.32731, -76.01105),
-    "skippack": (40.22288, -75.39879),
-    "skyline_view": (40.33926, -76.72553),
-    "slatington": (40.74843, -75.61185),
-    "slippery_rock": (41.06395, -80.05645),
-    "smethport": (41.81117, -78.44474),
-    "souderton": (40.31177, -75.32518),
-    "south_greensburg": (40.2784, -79.54476),
-    "south_pottstown": (40.23954, -75.65102),
-    "south_temple": (40.4, -75.9),
-    "south_waverly": (41.99757, -76.53717),
-    "south_williamsport": (41.23202, -76.99913),
-    "southwest_greensburg": (40.29118, -79.54698),
-    "spangler": (40.64285, -78.7728),
-    "speers": (40.12452, -79.87977),
-    "spinnerstown": (40.43899, -75.43712),
-    "spring_house": (40.18539, -75.22768),
-    "spring_mount": (40.27566, -75.45657),
-    "state_college": (40.79339, -77.86),
-    "steelton": (40.23537, -76.84136),
-    "stiles": (40.66537, -75.50824),
-    "stoneboro": (41.33922, -80.10506),
-    "stony_creek_mills": (40.34565, -75.86993),
-    "stormstown": (40.79339, -78.01667),
-    "stowe": (40.2526, -75.67741),
-    "stroudsburg": (40.98676, -75.19462),
-    "sturgeon": (40.38479, -80.21089),
-    "summit_hill": (40.82481, -75.87103),
-    "sun_valley": (40.98203, -75.46602),
-    "sunrise_lake": (41.30981, -74.96656),
-    "susquehanna": (41.94341, -75.59963),
-    "swartzville": (40.23315, -76.07828),
-    "swissvale": (40.42368, -79.88283),
-    "swoyersville": (41.29175, -75.87464),
-    "tacony": (40.03122, -75.04434),
-    "tamaqua": (40.79731, -75.96937),
-    "tannersville": (41.04009, -75.30574),
-    "tarentum": (40.60146, -79.75977),
-    "tatamy": (40.74093, -75.25712),
-    "telford": (40.32205, -75.32795),
-    "terre_hill": (40.15732, -76.0505),
-    "throop": (41.45147, -75.61185),
-    "tinicum": (40.44844, -75.10767),
-    "tionesta": (41.49534, -79.45588),
-    "topton": (40.50343, -75.7013),
-    "towamensing_trails": (41.00787, -75.58463),
-    "tower_city": (40.58925, -76.55246),
-    "trafford": (40.38562, -79.75893),
-    "treasure_lake": (41.17339, -78.71586),
-    "trevorton": (40.7812, -76.67302),
-    "trevose": (40.13928, -74.981),
-    "trexlertown": (40.54815, -75.60574),
-    "trooper": (40.14983, -75.40185),
-    "trucksville": (41.30397, -75.93214),
-    "tullytown": (40.13928, -74.81461),
-    "tunkhannock": (41.53869, -75.94659),
-    "turtle_creek": (40.4059, -79.82505),
-    "upper_saint_clair": (40.3359, -80.08339),
-    "valley_green": (40.15731, -76.79275),
-    "vandergrift": (40.60284, -79.56477),
-    "village_shires": (40.20316, -74.97045),
-    "vinco": (40.40507, -78.85558),
-    "walnutport": (40.75426, -75.5988),
-    "warminster_heights": (40.18705, -75.08156),
-    "watsontown": (41.08453, -76.86385),
-    "waymart": (41.58036, -75.40824),
-    "weatherly": (40.94175, -75.82964),
-    "wellsboro": (41.74868, -77.30053),
-    "wernersville": (40.33009, -76.0805),
-    "wescosville": (40.56676, -75.55296),
-    "wesleyville": (42.14033, -80.01506),
-    "west_conshohocken": (40.06983, -75.3163),
-    "west_easton": (40.67871, -75.23684),
-    "west_fairview": (40.27509, -76.91553),
-    "west_hamburg": (40.54759, -76.00216),
-    "west_hazleton": (40.9587, -75.99604),
-    "west_homestead": (40.39396, -79.91199),
-    "west_kittanning": (40.81034, -79.52949),
-    "west_leechburg": (40.62229, -79.61282),
-    "west_mayfield": (40.78006, -80.3384),
-    "west_mifflin": (40.3634, -79.86644),
-    "west_newton": (40.20979, -79.76699),
-    "west_norriton": (40.12955, -75.37852),
-    "west_pittston": (41.32758, -75.79297),
-    "west_reading": (40.3337, -75.94743),
-    "west_view": (40.52229, -80.03422),
-    "west_wyoming": (41.3198, -75.84603),
-    "west_wyomissing": (40.32454, -75.99077),
-    "whitaker": (40.3984, -79.88977),
-    "white_haven": (41.06064, -75.77408),
-    "whitehall_township": (40.66676, -75.49991),
-    "wilkes_barre": (41.24591, -75.88131),
-    "wilkinsburg": (40.44174, -79.88199),
-    "willow_grove": (40.144, -75.11573),
-    "wilmerding": (40.3909, -79.81005),
-    "wind_gap": (40.84815, -75.29157),
-    "windber": (40.2398, -78.83502),
-    "wolfdale": (40.19285, -80.28784),
-    "womelsdorf": (40.36176, -76.18411),
-    "woodbourne": (40.19233, -74.88878),
-    "woodland_heights": (41.40978, -79.71172),
-    "wormleysburg": (40.26287, -76.91386),
-    "woxall": (40.31066, -75.44879),
-    "wyncote": (40.09455, -75.14879),
-    "wyndmoor": (40.08122, -75.18934),
-    "wyomissing": (40.32954, -75.96521),
-    "wyomissing_hills": (40.33759, -75.97966),
-    "yardley": (40.24566, -74.846),
-    "yeagertown": (40.64313, -77.58055),
-    "youngwood": (40.24035, -79.57671),
-    "zelienople": (40.79451, -80.13673),
-    "ashaway": (41.42343, -71.78562),
-    "central_falls": (41.89066, -71.39228),
-    "chepachet": (41.9151, -71.67146),
-    "coventry": (41.7001, -71.68284),
-    "cranston": (41.77982, -71.43728),
-    "cumberland_hill": (41.97454, -71.467),
-    "east_greenwich": (41.66038, -71.45589),
-    "east_providence": (41.81371, -71.37005),
-    "foster": (41.85371, -71.75812),
-    "hope_valley": (41.5076, -71.71618),
-    "narragansett": (41.4501, -71.4495),
-    "narragansett_pier": (41.43232, -71.45644),
-    "new_shoreham": (41.17233, -71.55783),
-    "north_kingstown": (41.5501, -71.46617),
-    "north_providence": (41.8501, -71.46617),
-    "north_smithfield": (41.96677, -71.54951),
-    "pascoag": (41.95565, -71.70229),
-    "pawtucket": (41.87871, -71.38256),
-    "tiverton": (41.62594, -71.21338),
-    "west_warwick": (41.69689, -71.52194),
-    "westerly": (41.3776, -71.82729),
-    "woonsocket": (42.00288, -71.51478),
-    "armour": (43.3186, -98.34675),
-    "baltic": (43.76136, -96.74033),
-    "beresford": (43.08054, -96.77366),
-    "britton": (45.79162, -97.75094),
-    "brookings": (44.31136, -96.79839),
-    "chamberlain": (43.81083, -99.33066),
-    "crooks": (43.6647, -96.81089),
-    "dakota_dunes": (42.48749, -96.48642),
-    "de_smet": (44.38747, -97.55035),
-    "dell_rapids": (43.82608, -96.70616),
-    "elk_point": (42.68333, -96.68365),
-    "faulkton": (45.03497, -99.124),
-    "flandreau": (44.04942, -96.59532),
-    "fort_thompson": (44.0686, -99.43788),
-    "freeman": (43.35249, -97.43729),
-    "garretson": (43.71747, -96.50282),
-    "highmore": (44.52137, -99.4415),
-    "kennebec": (43.9036, -99.86178),
-    "lake_andes": (43.15638, -98.54147),
-    "lennox": (43.35415, -96.892),
-    "milbank": (45.21913, -96.63562),
-    "miller": (44.51831, -98.98843),
-    "north_sioux_city": (42.52722, -96.48309),
-    "parkston": (43.39888, -97.98368),
-    "plankinton": (43.71555, -98.48509),
-    "platte": (43.38694, -98.84453),
-    "sioux_falls": (43.54997, -96.70033),
-    "sisseton": (45.66468, -97.0498),
-    "tea": (43.44637, -96.83588),
-    "tyndall": (42.99333, -97.86285),
-    "vermillion": (42.77944, -96.92921),
-    "volga": (44.32358, -96.92645),
-    "wagner": (43.07972, -98.29313),
-    "wessington_springs": (44.07916, -98.56954),
-    "winner": (43.37667, -99.85901),
-    "yankton": (42.87111, -97.39728),
-    "bellows_falls": (43.13341, -72.44398),
-    "bridport": (43.98506, -73.31262),
-    "brattleboro": (42.85092, -72.55787),
-    "chittenden": (43.70784, -72.94816),
-    "danby": (43.34618, -72.99538),
-    "enosburg_falls": (44.90699, -72.80652),
-    "essex_junction": (44.49061, -73.11096),
-    "ferrisburgh": (44.20561, -73.24623),
-    "guildhall": (44.56506, -71.55981),
-    "hinesburg": (44.32922, -73.11068),
-    "lyndonville": (44.53367, -72.00315),
-    "manchester_center": (43.17702, -73.05705),
-    "middlebury_(village)": (44.01553, -73.16937),
-    "moretown": (44.25089, -72.76095),
-    "north_bennington": (42.93036, -73.24261),
-    "north_hero": (44.83125, -73.27323),
-    "pawlet": (43.34674, -73.17622),
-    "poultney": (43.51701, -73.23622),
-    "pownal": (42.76564, -73.23594),
-    "richford": (44.99699, -72.67124),
-    "saint_johnsbury": (44.41922, -72.01509),
-    "south_barre": (44.17701, -72.50566),
-    "south_burlington": (44.46699, -73.17096),
-    "starksboro": (44.22728, -73.05734),
-    "townshend": (43.0473, -72.66759),
-    "vergennes": (44.16728, -73.25401),
-    "west_brattleboro": (42.85592, -72.60315),
-    "west_rutland": (43.59312, -73.04511),
-    "white_river_junction": (43.64896, -72.31926),
-    "winooski": (44.49144, -73.18568),
-    "abbotsford": (44.94636, -90.31597),
-    "algoma": (44.60889, -87.43259),
-    "allouez": (44.47749, -88.01621),
-    "amery": (45.30691, -92.36214),
-    "antigo": (45.14025, -89.15234),
-    "ashwaubenon": (44.48221, -88.0701),
-    "aztalan": (43.07278, -88.86233),
-    "balsam_lake": (45.45218, -92.45464),
-    "baraboo": (43.47109, -89.74429),
-    "barneveld": (43.01555, -89.8954),
-    "barron": (45.40135, -91.84906),
-    "barton": (43.44361, -88.18065),
-    "belgium": (43.49972, -87.85037),
-    "bevent": (44.77053, -89.38956),
-    "big_bend": (42.8814, -88.20676),
-    "black_creek": (44.47749, -88.45066),
-    "black_earth": (43.13722, -89.74679),
-    "black_river_falls": (44.29468, -90.85153),
-    "bloomer": (45.10024, -91.48877),
-    "bohners_lake": (42.62307, -88.28037),
-    "bonduel": (44.74027, -88.44482),
-    "boscobel": (43.13443, -90.7054),
-    "boyceville": (45.04357, -92.04101),
-    "brice_prairie": (43.93857, -91.29986),
-    "brillion": (44.17721, -88.06427),
-    "brothertown": (43.96805, -88.30899),
-    "brown_deer": (43.16334, -87.96453),
-    "browns_lake": (42.69252, -88.2312),
-    "cadott": (44.94802, -91.1507),
-    "camp_lake": (42.53474, -88.1437),
-    "campbellsport": (43.59777, -88.27899),
-    "cashton": (43.74191, -90.7793),
-    "cato": (44.14277, -87.8612),
-    "cedarburg": (43.29667, -87.98759),
-    "chetek": (45.31413, -91.651),
-    "chilton": (44.02888, -88.16288),
-    "chippewa_falls": (44.93691, -91.39293),
-    "clintonville": (44.62053, -88.76232),
-    "colby": (44.90997, -90.31569),
-    "combined_locks": (44.26582, -88.31427),
-    "cornell": (45.16719, -91.14931),
-    "crandon": (45.57191, -88.90289),
-    "cuba_city": (42.60555, -90.42985),
-    "cudahy": (42.95974, -87.86147),
-    "dakota": (43.99025, -89.35651),
-    "dane": (43.25055, -89.50151),
-    "de_forest": (43.24777, -89.34373),
-    "de_pere": (44.44888, -88.06038),
-    "delafield": (43.06084, -88.40371),
-    "delavan_lake": (42.58418, -88.6326),
-    "dickeyville": (42.62722, -90.59207),
-    "dodgeville": (42.96027, -90.13012),
-    "dousman": (43.01418, -88.4726),
-    "east_troy": (42.78529, -88.4051),
-    "eau_claire": (44.81135, -91.49849),
-    "edgar": (44.92719, -89.96346),
-    "elm_grove": (43.04307, -88.07898),
-    "fall_creek": (44.76357, -91.2771),
-    "fennimore": (42.9836, -90.6554),
-    "fond_du_lac": (43.775, -88.43883),
-    "fontana": (42.55141, -88.5751),
-    "fort_atkinson": (42.92889, -88.83705),
-    "fox_point": (43.15751, -87.90175),
-    "franksville": (42.76002, -87.91341),
-    "frederic": (45.65912, -92.46714),
-    "french_island": (43.8583, -91.26042),
-    "galesville": (44.08163, -91.34904),
-    "genoa_city": (42.49835, -88.32815),
-    "gillett": (44.88999, -88.30732),
-    "glenmore": (44.38583, -87.92732),
-    "glenwood_city": (45.05857, -92.17241),
-    "grantsburg": (45.77634, -92.6827),
-    "green_bay": (44.51916, -88.01983),
-    "green_lake": (43.84415, -88.96011),
-    "hales_corners": (42.93751, -88.0487),
-    "hartland": (43.10501, -88.34204),
-    "hayward": (46.01301, -91.48462),
-    "hilbert": (44.14027, -88.16399),
-    "holmen": (43.9633, -91.25625),
-    "horicon": (43.45138, -88.63121),
-    "hortonville": (44.3347, -88.63816),
-    "howards_grove": (43.83388, -87.82009),
-    "hustisford": (43.34611, -88.60066),
-    "ixonia": (43.14389, -88.59732),
-    "johnson_creek": (43.07611, -88.77427),
-    "juneau": (43.40555, -88.7051),
-    "kaukauna": (44.27804, -88.27205),
-    "kenosha": (42.58474, -87.82119),
-    "keshena": (44.88387, -88.63372),
-    "kewaskum": (43.52083, -88.22899),
-    "kewaunee": (44.45833, -87.50314),
-    "kiel": (43.91249, -88.03565),
-    "kohler": (43.49639, -88.02343),
-    "kronenwetter": (44.82219, -89.5904),
-    "lac_du_flambeau": (45.96967, -89.8921),
-    "ladysmith": (45.46302, -91.10404),
-    "lake_delton": (43.60109, -89.79374),
-    "lake_geneva": (42.59168, -88.43343),
-    "lake_hallie": (44.87579, -91.44071),
-    "lake_koshkonong": (42.90973, -88.91955),
-    "lake_nebagamon": (46.51494, -91.69991),
-    "lake_ripley": (43.00583, -88.98622),
-    "lake_wazeecha": (44.37108, -89.75651),
-    "lake_wisconsin": (43.3736, -89.57568),
-    "lake_wissota": (44.92635, -91.30099),
-    "lamartine": (43.73332, -88.56872),
-    "lannon": (43.14612, -88.1662),
-    "little_chute": (44.27999, -88.31844),
-    "little_round_lake": (45.96495, -91.36795),
-    "lomira": (43.59138, -88.44371),
-    "loyal": (44.73691, -90.49597),
-    "luck": (45.57607, -92.4827),
-    "luxemburg": (44.53861, -87.70398),
-    "manawa": (44.46443, -88.91983),
-    "manitowoc": (44.08861, -87.65758),
-    "maple_bluff": (43.11833, -89.37956),
-    "marinette": (45.09998, -87.63066),
-    "markesan": (43.7072, -88.99011),
-    "mauston": (43.79719, -90.07735),
-    "mazomanie": (43.17666, -89.79485),
-    "mcfarland": (43.0125, -89.28984),
-    "menasha": (44.20221, -88.4465),
-    "menomonee_falls": (43.1789, -88.11731),
-    "menomonie": (44.87552, -91.91934),
-    "mequon": (43.21555, -88.03001),
-    "merrill": (45.18052, -89.68346),
-    "merton": (43.14667, -88.30676),
-    "milwaukee": (43.0389, -87.90647),
-    "mineral_point": (42.86, -90.17985),
-    "mishicot": (44.23916, -87.64119),
-    "mondovi": (44.56774, -91.67099),
-    "montello": (43.79137, -89.31984),
-    "mosinee": (44.79302, -89.70318),
-    "mount_horeb": (43.00861, -89.73846),
-    "mukwonago": (42.86668, -88.33343),
-    "muscoda": (43.18499, -90.44318),
-    "muskego": (42.90585, -88.13898),
-    "nashotah": (43.09779, -88.40232),
-    "neenah": (44.18582, -88.46261),
-    "neillsville": (44.55996, -90.59625),
-    "nekoosa": (44.31246, -89.90429),
-    "new_glarus": (42.81445, -89.63512),
-    "new_holstein": (43.94999, -88.08426),
-    "new_lisbon": (43.87914, -90.16541),
-    "niagara": (45.77135, -87.99485),
-    "north_fond_du_lac": (43.81138, -88.48344),
-    "north_hudson": (44.99302, -92.75687),
-    "north_la_crosse": (43.84635, -91.24819),
-    "north_prairie": (42.93446, -88.40537),
-    "oak_creek": (42.88585, -87.86314),
-    "oconomowoc": (43.11167, -88.49927),
-    "oconto": (44.88721, -87.86455),
-    "oconto_falls": (44.87388, -88.14288),
-    "okauchee_lake": (43.12334, -88.44065),
-    "omro": (44.03943, -88.74428),
-    "oostburg": (43.62277, -87.79453),
-    "orfordville": (42.62751, -89.25317),
-    "oshkosh": (44.02471, -88.54261),
-    "paddock_lake": (42.57752, -88.10509),
-    "pardeeville": (43.53776, -89.30012),
-    "park_falls": (45.9344, -90.44155),
-    "pell_lake": (42.53807, -88.35093),
-    "peshtigo": (45.05443, -87.74927),
-    "pewaukee": (43.08057, -88.2612),
-    "phillips": (45.69663, -90.40043),
-    "platteville": (42.73416, -90.47846),
-    "pleasant_prairie": (42.55308, -87.93341),
-    "plover": (44.45636, -89.54401),
-    "port_edwards": (44.3508, -89.8654),
-    "potter_lake": (42.82168, -88.34898),
-    "powers_lake": (42.55363, -88.29454),
-    "poynette": (43.39026, -89.4029),
-    "prairie_du_chien": (43.05165, -91.14124),
-    "prairie_du_sac": (43.28693, -89.72401),
-    "racine": (42.72613, -87.78285),
-    "random_lake": (43.55222, -87.96176),
-    "redgranite": (44.04192, -89.09845),
-    "reedsburg": (43.53248, -90.00263),
-    "reedsville": (44.1536, -87.95676),
-    "rhinelander": (45.63662, -89.41208),
-    "rib_mountain": (44.91275, -89.6754),
-    "rice_lake": (45.50607, -91.73823),
-    "richland_center": (43.33471, -90.38679),
-    "ripon": (43.8422, -88.83594),
-    "rio": (43.44776, -89.23984),
-    "river_falls": (44.86136, -92.62381),
-    "river_hills": (43.17418, -87.92425),
-    "roberts": (44.98386, -92.55603),
-    "rosendale": (43.80776, -88.67483),
-    "rothschild": (44.88719, -89.62012),
-    "roxbury": (43.24943, -89.6754),
-    "saint_croix_falls": (45.40996, -92.63965),
-    "sauk_city": (43.27082, -89.72207),
-    "saukville": (43.38167, -87.94065),
-    "schofield": (44.90969, -89.60457),
-    "shawano": (44.78221, -88.60899),
-    "sheboygan": (43.75083, -87.71453),
-    "sheboygan_falls": (43.73197, -87.82213),
-    "shell_lake": (45.73939, -91.92545),
-    "shorewood_hills": (43.0775, -89.44568),
-    "shullsburg": (42.57334, -90.23096),
-    "siren": (45.78578, -92.38103),
-    "slinger": (43.33361, -88.28621),
-    "south_milwaukee": (42.91057, -87.86064),
-    "spooner": (45.82245, -91.88934),
-    "spring_green": (43.17527, -90.0679),
-    "stevens_point": (44.52358, -89.57456),
-    "strum": (44.54969, -91.39266),
-    "sturgeon_bay": (44.83416, -87.37704),
-    "sturtevant": (42.69807, -87.89452),
-    "suamico": (44.63194, -88.03927),
-    "sun_prairie": (43.1836, -89.21373),
-    "tainter_lake": (44.98913, -91.84767),
-    "theresa": (43.51722, -88.45121),
-    "thiensville": (43.23751, -87.9787),
-    "thorp": (44.96108, -90.79986),
-    "tichigan": (42.8289, -88.19759),
-    "tomah": (43.97858, -90.50402),
-    "tomahawk": (45.47108, -89.72986),
-    "trempealeau": (44.00552, -91.44209),
-    "turtle_lake": (45.3944, -92.14241),
-    "two_rivers": (44.15388, -87.56925),
-    "union_grove": (42.68807, -88.05147),
-    "viroqua": (43.55692, -90.88874),
-    "walworth": (42.53113, -88.59955),
-    "waukesha": (43.01168, -88.23148),
-    "waunakee": (43.19194, -89.45567),
-    "waupaca": (44.35803, -89.08595),
-    "waupun": (43.63332, -88.72955),
-    "wausau": (44.95914, -89.63012),
-    "wautoma": (44.0747, -89.2879),
-    "wauwatosa": (43.04946, -88.00759),
-    "west_baraboo": (43.47443, -89.7704),
-    "west_allis": (43.01668, -88.00703),
-    "west_bend": (43.42528, -88.18343),
-    "west_milwaukee": (43.01251, -87.97259),
-    "westby": (43.65692, -90.8543),
-    "weyauwega": (44.32137, -88.93372),
-    "whitefish_bay": (43.11334, -87.90009),
-    "whitewater": (42.83362, -88.73233),
-    "williams_bay": (42.57807, -88.54093),
-    "wind_lake": (42.82946, -88.1587),
-    "wind_point": (42.78446, -87.76619),
-    "winneconne": (44.11082, -88.71261),
-    "wisconsin_dells": (43.62748, -89.77096),
-    "wisconsin_rapids": (44.38358, -89.81735),
-    "wittenberg": (44.8272, -89.16956),
-    "wrightstown": (44.32582, -88.16288),
-    "benwood": (40.01813, -80.73425),
-    "follansbee": (40.32757, -80.59591),
-    "hooverson_heights": (40.32479, -80.57757),
-    "newell": (40.6184, -80.60424),
-    "weirton": (40.41896, -80.58952),
-    "weirton_heights": (40.4084, -80.53924),
-    "wellsburg": (40.27201, -80.60952),
-    "south_duxbury": (42.02316, -70.68281),
-    "west_kennebunk": (43.4087, -70.58144),
-    "nowthen": (45.32802, -93.47023),
-    "castleton": (43.61062, -73.17983),
-    "blue_hills": (41.81288, -72.69759),
-    "east_windsor": (41.91232, -72.54509),
-    "branford": (41.27954, -72.8151),
-    "canton_valley": (41.83426, -72.89177),
-    "cheshire": (41.49899, -72.90066),
-    "fillmore": (34.39916, -118.91815),
-    "cool": (38.88722, -121.01472),
-    "bisbee": (31.44815, -109.92841),
-    "black_canyon_city": (34.07087, -112.15071),
-    "south_taft": (35.13469, -119.45623),
-    "vine_hill": (38.00853, -122.09608),
-    "blackwater": (33.03117, -111.58263),
-    "mona": (39.81607, -111.85549),
-    "buckeye": (33.37032, -112.58378),
-    "bullhead_city": (35.14778, -114.5683),
-    "bylas": (33.13428, -110.12004),
-    "cactus_flat": (32.7584, -109.71619),
-    "camp_verde": (34.56364, -111.85432),
-    "canyon_day": (33.78477, -110.02649),
-    "carefree": (33.82226, -111.9182),
-    "casa_blanca": (33.12033, -111.88819),
-    "casa_grande": (32.8795, -111.75735),
-    "casas_adobes": (32.32341, -110.9951),
-    "catalina": (32.50556, -110.92111),
-    "catalina_foothills": (32.29785, -110.9187),
-    "cave_creek": (33.83333, -111.95083),
-    "chinle": (36.15445, -109.55261),
-    "chino_valley": (34.75752, -112.45378),
-    "cibecue": (34.04477, -110.48539),
-    "cienega_springs": (34.18863, -114.22467),
-    "clarkdale": (34.77113, -112.05794),
-    "claypool": (33.41117, -110.84261),
-    "colorado_city": (36.99026, -112.97577),
-    "congress": (34.16253, -112.85074),
-    "coolidge": (32.97784, -111.51762),
-    "cordes_lakes": (34.30781, -112.10349),
-    "corona_de_tucson": (31.96536, -110.77564),
-    "desert_hills": (34.5539, -114.37246),
-    "dilkon": (35.38529, -110.32068),
-    "dolan_springs": (35.59194, -114.27329),
-    "drexel_heights": (32.14119, -111.02843),
-    "eagar": (34.11124, -109.29238),
-    "east_sahuarita": (31.94286, -110.92842),
-    "ehrenberg": (33.60419, -114.52523),
-    "el_mirage": (33.61309, -112.3246),
-    "eloy": (32.7559, -111.55484),
-    "first_mesa": (35.83667, -110.38152),
-    "flagstaff": (35.19807, -111.65127),
-    "flowing_wells": (32.29396, -111.00982),
-    "fort_defiance": (35.74446, -109.07648),
-    "fortuna_foothills": (32.65783, -114.41189),
-    "fountain_hills": (33.61171, -111.71736),
-    "gila_bend": (32.94782, -112.71683),
-    "globe": (33.39422, -110.7865),
-    "gold_camp": (33.29367, -111.30429),
-    "goodyear": (33.43532, -112.35821),
-    "grand_canyon": (36.05443, -112.13934),
-    "grand_canyon_village": (36.04637, -112.15406),
-    "guadalupe": (33.37088, -111.96292),
-    "houck": (35.28308, -109.20704),
-    "huachuca_city": (31.62787, -110.33397),
-    "joseph_city": (34.95586, -110.33401),
-    "kachina_village": (35.09696, -111.69266),
-    "kaibito": (36.59722, -111.07431),
-    "kayenta": (36.72778, -110.25458),
-    "lake_havasu_city": (34.4839, -114.32245),
-    "lake_montezuma": (34.63224, -111.77793),
-    "laveen": (33.36282, -112.16932),
-    "lechee": (35.03224, -110.75291),
-    "litchfield_park": (33.49337, -112.35794),
-    "lukachukai": (36.41695, -109.22871),
-    "mammoth": (32.72257, -110.64065),
-    "many_farms": (36.35278, -109.61789),
-    "marana": (32.43674, -111.22538),
-    "maricopa": (33.05811, -112.04764),
-    "meadview": (36.00221, -114.06829),
-    "mesa": (33.42227, -111.82264),
-    "mescal": (31.99008, -110.43535),
-    "mohave_valley": (34.93306, -114.58885),
-    "mountainaire": (35.08529, -111.66599),
-    "naco": (31.33538, -109.94813),
-    "new_river": (33.91587, -112.13599),
-    "nogales": (31.34038, -110.93425),
-    "oracle": (32.61091, -110.77093),
-    "oro_valley": (32.39091, -110.96649),
-    "page": (36.91472, -111.45583),
-    "paradise_valley": (33.53115, -111.94265),
-    "parks": (35.26057, -111.94877),
-    "paulden": (34.88558, -112.46823),
-    "peach_springs": (35.52916, -113.42549),
-    "peridot": (33.31034, -110.45538),
-    "picture_rocks": (32.34591, -111.24621),
-    "pima": (32.89656, -109.82835),
-    "pine": (34.38447, -111.45514),
-    "pinetop_lakeside": (34.14254, -109.96038),
-    "pirtleville": (31.35716, -109.56352),
-    "prescott_valley": (34.61002, -112.31572),
-    "quartzsite": (33.66391, -114.22995),
-    "queen_creek": (33.24866, -111.6343),
-    "rio_verde": (33.72254, -111.67569),
-    "rio_rico": (31.47148, -110.97648),
-    "sacaton": (33.07672, -111.7393),
-    "safford": (32.83395, -109.70758),
-    "sahuarita": (31.95758, -110.95565),
-    "saint_david": (31.90425, -110.21424),
-    "salome": (33.78114, -113.61465),
-    "san_luis": (32.487, -114.78218),
-    "san_manuel": (32.59979, -110.63093),
-    "scottsdale": (33.50921, -111.89903),
-    "sedona": (34.86974, -111.76099),
-    "sells": (31.91202, -111.88123),
-    "show_low": (34.25421, -110.02983),
-    "sierra_vista": (31.55454, -110.30369),
-    "snowflake": (34.51337, -110.07845),
-    "somerton": (32.59644, -114.70968),
-    "south_tucson": (32.19952, -110.96842),
-    "springerville": (34.13355, -109.28834),
-    "star_valley": (34.25504, -111.25847),
-    "sun_city": (33.59754, -112.27182),
-    "sun_city_west": (33.66198, -112.34127),
-    "sun_lakes": (33.21116, -111.87542),
-    "surprise": (33.63059, -112.33322),
-    "swift_trail_junction": (32.72979, -109.71397),
-    "tanque_verde": (32.25174, -110.73731),
-    "tempe": (33.41477, -111.90931),
-    "tempe_junction": (33.41421, -111.94348),
-    "thatcher": (32.84923, -109.75925),
-    "three_points": (32.07675, -111.31371),
-    "tolleson": (33.45004, -112.25932),
-    "tombstone": (31.71287, -110.06758),
-    "tonto_basin": (33.83171, -111.29457),
-    "tortolita": (32.41035, -111.01732),
-    "tuba_city": (36.13499, -111.23986),
-    "tubac": (31.61259, -111.04592),
-    "tucson": (32.22174, -110.92648),
-    "tucson_estates": (32.18758, -111.09093),
-    "vail": (32.04786, -110.71203),
-    "wellton": (32.67283, -114.14688),
-    "whetstone": (31.95731, -110.34202),
-    "white_mountain_lake": (34.34865, -109.99789),
-    "whiteriver": (33.83699, -109.96427),
-    "wickenburg": (33.96864, -112.72962),
-    "willcox": (32.25285, -109.83201),
-    "williams": (35.24946, -112.191),
-    "willow_valley": (34.91195, -114.60663),
-    "window_rock": (35.68057, -109.05259),
-    "youngtown": (33.59393, -112.30294),
-    "yuma": (32.72532, -114.6244),
-    "adelanto": (34.58277, -117.40922),
-    "agoura": (34.14306, -118.73787),
-    "agoura_hills": (34.13639, -118.77453),
-    "agua_dulce": (34.49638, -118.32563),
-    "aguanga": (33.44281, -116.86502),
-    "ahwahnee": (37.3655, -119.72627),
-    "alameda": (37.76521, -122.24164),
-    "alhambra": (34.09529, -118.12701),
-    "aliso_viejo": (33.56504, -117.72712),
-    "alondra_park": (33.88946, -118.33091),
-    "alpaugh": (35.88773, -119.48734),
-    "alta_sierra": (35.73126, -118.5539),
-    "altadena": (34.18973, -118.13118),
-    "alum_rock": (37.36605, -121.82718),
-    "american_canyon": (38.17492, -122.2608),
-    "amesti": (36.96356, -121.77912),
-    "anaheim": (33.83529, -117.9145),
-    "angels_camp": (38.06826, -120.53965),
-    "angwin": (38.57574, -122.44998),
-    "antelope": (38.70824, -121.32995),
-    "anza": (33.55503, -116.67363),
-    "aptos": (36.97717, -121.8994),
-    "arbuckle": (39.0174, -122.05775),
-    "armona": (36.31578, -119.70846),
-    "aromas": (36.88856, -121.643),
-    "arroyo_grande": (35.11859, -120.59073),
-    "artesia": (33.86585, -118.08312),
-    "arvin": (35.20913, -118.82843),
-    "atascadero": (35.48942, -120.67073),
-    "atherton": (37.46133, -122.19774),
-    "auberry": (37.08078, -119.48541),
-    "auburn_lake_trails": (38.91434, -120.95244),
-    "august": (37.97881, -121.26217),
-    "avenal": (36.00412, -120.12903),
-    "avila_beach": (35.17998, -120.73184),
-    "avocado_heights": (34.03612, -117.99118),
-    "azusa": (34.13362, -117.90756),
-    "bakersfield": (35.37329, -119.01871),
-    "baldwin_park": (34.08529, -117.9609),
-    "banning": (33.92557, -116.87641),
-    "barstow": (34.89859, -117.02282),
-    "barstow_heights": (34.86971, -117.05615),
-    "bay_point": (38.02909, -121.96163),
-    "bear_valley_springs": (35.15913, -118.62842),
-    "bell": (33.97751, -118.18702),
-    "bell_gardens": (33.96529, -118.15146),
-    "bellflower": (33.88168, -118.11701),
-    "ben_lomond": (37.08911, -122.08635),
-    "benicia": (38.04937, -122.15858),
-    "bermuda_dunes": (33.7428, -116.28918),
-    "berry_creek": (39.64516, -121.4033),
-    "bethel_island": (38.01492, -121.64051),
-    "big_bear_city": (34.26112, -116.84503),
-    "big_bear_lake": (34.2439, -116.91142),
-    "big_pine": (37.16493, -118.28955),
-    "big_river": (34.14002, -114.36134),
-    "biggs": (39.41239, -121.71275),
-    "biola": (36.80217, -120.01627),
-    "blackhawk": (37.82076, -121.90774),
-    "blythe": (33.6103, -114.59635),
-    "bodega_bay": (38.33325, -123.04806),
-    "bodfish": (35.58801, -118.49203),
-    "bolinas": (37.90937, -122.68637),
-    "bonita": (32.65783, -117.03003),
-    "bonny_doon": (37.04162, -122.15052),
-    "bonsall": (33.28892, -117.22559),
-    "boron": (34.99942, -117.64978),
-    "boronda": (36.69885, -121.67495),
-    "borrego_springs": (33.25587, -116.37501),
-    "bostonia": (32.80755, -116.93642),
-    "boulder_creek": (37.12606, -122.12219),
-    "boyle_heights": (34.0339, -118.20535),
-    "boyes_hot_springs": (38.3138, -122.48193),
-    "bradbury": (34.14695, -117.9709),
-    "brawley": (32.97866, -115.53027),
-    "brea": (33.91668, -117.90006),
-    "brisbane": (37.68077, -122.39997),
-    "broadmoor": (37.6866, -122.48275),
-    "brooktrails": (39.44377, -123.38529),
-    "buellton": (34.6136, -120.19265),
-    "buena_park": (33.86751, -117.99812),
-    "burlingame": (37.5841, -122.36608),
-    "buttonwillow": (35.40052, -119.46956),
-    "bystrom": (37.62076, -120.98577),
-    "cabazon": (33.91752, -116.78724),
-    "calabasas": (34.15778, -118.63842),
-    "calexico": (32.67895, -115.49888),
-    "california_city": (35.1258, -117.9859),
-    "calipatria": (33.1256, -115.51415),
-    "calistoga": (38.5788, -122.57971),
-    "calimesa": (34.0039, -117.06198),
-    "callender": (35.05303, -120.59628),
-    "camarillo": (34.21639, -119.0376),
-    "cambrian_park": (37.25689, -121.93079),
-    "camino": (38.73824, -120.67493),
-    "camp_meeker": (38.42519, -122.95944),
-    "campo": (32.60645, -116.46891),
-    "canoga_park": (34.20112, -118.59814),
-    "capitola": (36.97523, -121.95329),
-    "carlsbad": (33.15809, -117.35059),
-    "carmel_valley_village": (36.50605, -121.76594),
-    "carmel_by_the_sea": (36.55524, -121.92329),
-    "carmichael": (38.61713, -121.32828),
-    "carpinteria": (34.39888, -119.51846),
-    "carson": (33.83141, -118.28202),
-    "caruthers": (36.54273, -119.8332),
-    "casa_conejo": (34.18362, -118.94343),
-    "castaic": (34.48888, -118.62287),
-    "castro_valley": (37.6941, -122.08635),
-    "cathedral_city": (33.77974, -116.46529),
-    "cayucos": (35.44275, -120.89213),
-    "cedar_ridge": (38.06576, -120.27686),
-    "ceres": (37.59493, -120.95771),
-    "century_city": (34.05557, -118.41786),
-    "cerritos": (33.85835, -118.06479),
-    "channel_islands_beach": (34.15806, -119.22316),
-    "charter_oak": (34.10306, -117.84589),
-    "cherryland": (37.67938, -122.1033),
-    "china_lake_acres": (35.64051, -117.76395),
-    "chinatown": (37.7966, -122.40858),
-    "chino": (34.01223, -117.68894),
-    "chino_hills": (33.9938, -117.75888),
-    "chowchilla": (37.123, -120.26018),
-    "chualar": (36.57052, -121.51855),
-    "chula_vista": (32.64005, -117.0842),
-    "citrus": (34.11501, -117.89173),
-    "citrus_heights": (38.70712, -121.28106),
-    "clear_lake_riviera": (38.95406, -122.72082),
-    "clearlake": (38.95823, -122.62637),
-    "clearlake_oaks": (39.02628, -122.67193),
-    "clovis": (36.82523, -119.70292),
-    "coachella": (33.6803, -116.17389),
-    "coalinga": (36.13968, -120.36015),
-    "coarsegold": (37.26217, -119.70098),
-    "cobb": (38.82213, -122.72305),
-    "colma": (37.67688, -122.45969),
-    "colton": (34.0739, -117.31365),
-    "colusa": (39.21433, -122.00942),
-    "compton": (33.89585, -118.22007),
-    "copperopolis": (37.98104, -120.64187),
-    "coronado": (32.68589, -117.18309),
-    "corralitos": (36.98856, -121.80634),
-    "corte_madera": (37.92548, -122.52748),
-    "costa_mesa": (33.64113, -117.91867),
-    "cotati": (38.32686, -122.70721),
-    "coto_de_caza": (33.60419, -117.58699),
-    "covelo": (39.79327, -123.24922),
-    "covina": (34.09001, -117.89034),
-    "crest": (32.80727, -116.86808),
-    "culver_city": (34.02112, -118.39647),
-    "cupertino": (37.323, -122.03218),
-    "daly_city": (37.70577, -122.46192),
-    "dana_point": (33.46697, -117.69811),
-    "day_valley": (37.03578, -121.86246),
-    "del_mar": (32.95949, -117.26531),
-    "del_monte_forest": (36.58635, -121.94746),
-    "del_aire": (33.91613, -118.36952),
-    "del_rey": (36.65912, -119.59374),
-    "del_rey_oaks": (36.59329, -121.83495),
-    "del_rio": (37.74354, -121.01188),
-    "denair": (37.52632, -120.79687),
-    "descanso": (32.85283, -116.61585),
-    "desert_hot_springs": (33.96173, -116.50353),
-    "desert_shores": (33.4042, -116.03972),
-    "desert_view_highlands": (34.59082, -118.15257),
-    "diablo": (37.83493, -121.95801),
-    "diamond_bar": (34.02862, -117.81034),
-    "diamond_springs": (38.69463, -120.81494),
-    "dinuba": (36.54328, -119.38707),
-    "discovery_bay": (37.90854, -121.60023),
-    "dogtown": (38.21381, -121.08855),
-    "dollar_point": (39.18796, -120.09991),
-    "dos_palos": (36.98606, -120.62657),
-    "downey": (33.94001, -118.13257),
-    "downieville": (39.55934, -120.82689),
-    "duarte": (34.13945, -117.97729),
-    "dunnigan": (38.88518, -121.96969),
-    "earlimart": (35.88412, -119.27233),
-    "east_rancho_dominguez": (33.89807, -118.19535),
-    "east_foothills": (37.38105, -121.81745),
-    "east_hemet": (33.74002, -116.93891),
-    "east_la_mirada": (33.92446, -117.98895),
-    "east_los_angeles": (34.0239, -118.17202),
-    "east_oakdale": (37.78798, -120.80382),
-    "east_palo_alto": (37.46883, -122.14108),
-    "east_pasadena": (34.13814, -118.07384),
-    "east_porterville": (36.05745, -118.97566),
-    "east_quincy": (39.93406, -120.89801),
-    "east_richmond_heights": (37.94492, -122.31358),
-    "east_san_gabriel": (34.09168, -118.09118),
-    "east_sonora": (37.9777, -120.3613),
-    "el_cajon": (32.79477, -116.96253),
-    "el_centro": (32.792, -115.56305),
-    "el_cerrito": (37.91576, -122.31164),
-    "el_cerrito_corona": (33.84057, -117.52283),
-    "el_dorado_hills": (38.68574, -121.08217),
-    "el_granada": (37.50272, -122.46942),
-    "el_monte": (34.06862, -118.02757),
-    "el_rio": (34.23578, -119.16383),
-    "el_segundo": (33.91918, -118.41647),
-    "el_sobrante": (37.97715, -122.29525),
-    "el_verano": (38.29769, -122.49165),
-    "elk_grove": (38.4088, -121.37162),
-    "elverta": (38.71379, -121.46273),
-    "emerald_lake_hills": (37.46466, -122.26802),
-    "emeryville": (37.83132, -122.28525),
-    "empire": (37.63826, -120.90215),
-    "encinitas": (33.03699, -117.29198),
-    "encino": (34.15917, -118.50119),
-    "escalon": (37.79781, -120.99792),
-    "escondido": (33.11921, -117.08642),
-    "esparto": (38.69213, -122.01719),
-    "eucalyptus_hills": (32.87977, -116.94669),
-    "fairbanks_ranch": (32.99393, -117.18726),
-    "fairmead": (37.07633, -120.19295),
-    "fallbrook": (33.37642, -117.25115),
-    "firebaugh": (36.85884, -120.45601),
-    "florin": (38.49602, -121.40884),
-    "foothill_farms": (38.67877, -121.35114),
-    "foothill_ranch": (33.68641, -117.66088),
-    "forest_meadows": (38.16851, -120.40659),
-    "forest_ranch": (39.88211, -121.67275),
-    "foresthill": (39.02018, -120.81799),
-    "fort_bragg": (39.44572, -123.80529),
-    "fort_irwin": (35.26275, -116.68475),
-    "foster_city": (37.55855, -122.27108),
-    "fountain_valley": (33.70918, -117.95367),
-    "frazier_park": (34.82276, -118.94482),
-    "french_camp": (37.88409, -121.27106),
-    "galt": (38.25464, -121.29995),
-    "garden_acres": (37.96381, -121.22939),
-    "garden_grove": (33.77391, -117.94145),
-    "gardena": (33.88835, -118.30896),
-    "garnet": (33.90196, -116.54557),
-    "gilroy": (37.00578, -121.56828),
-    "glen_avon": (34.01168, -117.48477),
-    "gold_river": (38.62629, -121.24662),
-    "golden_hills": (35.14247, -118.49036),
-    "goleta": (34.43583, -119.82764),
-    "grand_terrace": (34.0339, -117.31365),
-    "granite_bay": (38.76323, -121.16384),
-    "granite_hills": (32.80311, -116.90475),
-    "grass_valley": (39.21906, -121.06106),
-    "graton": (38.4363, -122.86972),
-    "green_acres": (33.73808, -117.07642),
-    "greenacres": (35.38329, -119.10983),
-    "grover_beach": (35.12164, -120.62128),
-    "guerneville": (38.50186, -122.99611),
-    "gustine": (37.25772, -120.99882),
-    "hacienda_heights": (33.99307, -117.96868),
-    "half_moon_bay": (37.46355, -122.42859),
-    "hamilton_city": (39.74266, -122.01359),
-    "hanford": (36.32745, -119.64568),
-    "harbison_canyon": (32.82033, -116.83002),
-    "hawaiian_gardens": (33.8314, -118.07284),
-    "healdsburg": (38.61047, -122.86916),
-    "heber": (32.73089, -115.52972),
-    "hemet": (33.74761, -116.97307),
-    "herald": (38.29575, -121.24439),
-    "hercules": (38.01714, -122.28858),
-    "hermosa_beach": (33.86224, -118.39952),
-    "hesperia": (34.42639, -117.30088),
-    "hidden_hills": (34.16028, -118.65231),
-    "hidden_meadows": (33.22531, -117.11253),
-    "hidden_valley_lake": (38.80796, -122.55832),
-    "highgrove": (34.01585, -117.33338),
-    "home_garden": (36.30328, -119.63624),
-    "home_gardens": (33.87807, -117.52088),
-    "homeland": (33.74308, -117.1092),
-    "hughson": (37.59688, -120.86604),
-    "huntington_beach": (33.6603, -117.99923),
-    "huntington_park": (33.98168, -118.22507),
-    "idyllwild": (33.74002, -116.71891),
-    "imperial_beach": (32.58394, -117.11308),
-    "indian_wells": (33.71791, -116.34311),
-    "indio": (33.7207, -116.21677),
-    "inglewood": (33.96168, -118.35313),
-    "interlaken": (36.95134, -121.73384),
-    "inyokern": (35.6469, -117.81257),
-    "ione": (38.35269, -120.93272),
-    "irwindale": (34.10695, -117.93534),
-    "isla_vista": (34.41333, -119.86097),
-    "jamul": (32.717, -116.87613),
-    "joshua_tree": (34.13473, -116.31307),
-    "julian": (33.07866, -116.60196),
-    "kelseyville": (38.97795, -122.83944),
-    "kennedy": (37.92992, -121.25272),
-    "kentfield": (37.95215, -122.5572),
-    "kerman": (36.72356, -120.05988),
-    "kernville": (35.75467, -118.42536),
-    "kettleman_city": (36.00829, -119.9618),
-    "keyes": (37.5566, -120.91549),
-    "kings_beach": (39.23768, -120.02658),
-    "kingsburg": (36.51384, -119.55402),
-    "knightsen": (37.96881, -121.66801),
-    "koreatown": (34.05779, -118.30091),
-    "la_cañada_flintridge": (34.19917, -118.18785),
-    "la_habra": (33.93196, -117.94617),
-    "la_habra_heights": (33.96085, -117.95062),
-    "la_jolla": (32.84727, -117.2742),
-    "la_mesa": (32.76783, -117.02308),
-    "la_mirada": (33.91724, -118.01201),
-    "la_palma": (33.8464, -118.04673),
-    "la_presa": (32.70811, -116.99725),
-    "la_puente": (34.02001, -117.94951),
-    "la_quinta": (33.66336, -116.31001),
-    "la_riviera": (38.56685, -121.3569),
-    "la_selva_beach": (36.93662, -121.86468),
-    "la_verne": (34.10084, -117.76784),
-    "ladera": (37.39994, -122.1983),
-    "ladera_heights": (33.99418, -118.37535),
-    "ladera_ranch": (33.57086, -117.63561),
-    "laguna": (38.42102, -121.42384),
-    "laguna_hills": (33.61252, -117.71283),
-    "laguna_niguel": (33.52253, -117.70755),
-    "laguna_woods": (33.6103, -117.72533),
-    "lake_elsinore": (33.66808, -117.32726),
-    "lake_los_angeles": (34.61249, -117.82812),
-    "lake_nacimiento": (35.7283, -120.87963),
-    "lake_san_marcos": (33.12615, -117.20837),
-    "lake_wildwood": (39.23295, -121.20051),
-    "lake_of_the_pines": (39.03962, -121.05661),
-    "lakeland_village": (33.63863, -117.34393),
-    "lakeport": (39.04295, -122.91583),
-    "lamont": (35.25968, -118.91427),
-    "larkspur": (37.93409, -122.53525),
-    "las_flores": (34.03723, -118.63592),
-    "laton": (36.43328, -119.6868),
-    "lawndale": (33.88724, -118.35257),
-    "laytonville": (39.68821, -123.48279),
-    "le_grand": (37.22855, -120.24823),
-    "lebec": (34.84164, -118.86482),
-    "lemon_grove": (32.74255, -117.03142),
-    "lemoore": (36.30078, -119.78291),
-    "lenwood": (34.87665, -117.10393),
-    "leona_valley": (34.61832, -118.28813),
-    "lexington_hills": (37.16467, -121.97301),
-    "linda": (39.12767, -121.5508),
-    "littlerock": (34.5211, -117.98368),
-    "lockeford": (38.16353, -121.14994),
-    "loma_linda": (34.04835, -117.26115),
-    "loma_rica": (39.31183, -121.41774),
-    "lomita": (33.79224, -118.31507),
-    "lompico": (37.1055, -122.05274),
-    "lompoc": (34.63915, -120.45794),
-    "lone_pine": (36.60626, -118.06462),
-    "loomis": (38.82129, -121.193),
-    "los_alamitos": (33.80307, -118.07256),
-    "los_alamos": (34.74443, -120.27821),
-    "los_altos": (37.38522, -122.11413),
-    "los_altos_hills": (37.37966, -122.13746),
-    "los_angeles": (34.05223, -118.24368),
-    "los_banos": (37.05828, -120.84992),
-    "los_gatos": (37.22661, -121.97468),
-    "los_olivos": (34.66776, -120.11487),
-    "los_osos": (35.31109, -120.8324),
-    "los_serranos": (33.97279, -117.70811),
-    "lost_hills": (35.61635, -119.69429),
-    "lower_lake": (38.91045, -122.61026),
-    "loyola": (37.35133, -122.10052),
-    "lucerne": (36.38078, -119.6643),
-    "lucerne_valley": (34.44389, -116.96781),
-    "madera": (36.96134, -120.06072),
-    "madera_acres": (37.01911, -120.06683),
-    "magalia": (39.81211, -121.57831),
-    "malibu": (34.02577, -118.7804),
-    "mammoth_lakes": (37.64855, -118.97208),
-    "manhattan_beach": (33.88474, -118.41091),
-    "manteca": (37.79743, -121.21605),
-    "marin_city": (37.86854, -122.50914),
-    "marina": (36.6844, -121.80217),
-    "marina_del_rey": (33.98029, -118.45174),
-    "mariposa": (37.48494, -119.96628),
-    "maxwell": (39.27628, -122.19137),
-    "mayflower_village": (34.11501, -118.00979),
-    "mead_valley": (33.83335, -117.29615),
-    "meadow_vista": (39.00101, -121.02189),
-    "mecca": (33.57219, -116.0782),
-    "meiners_oaks": (34.44694, -119.27928),
-    "menifee": (33.72835, -117.14642),
-    "menlo_park": (37.45383, -122.18219),
-    "mentone": (34.07001, -117.13448),
-    "merced": (37.30216, -120.48297),
-    "mesa_verde": (33.60586, -114.73107),
-    "midpines": (37.54438, -119.92045),
-    "midway_city": (33.74474, -117.98923),
-    "mill_valley": (37.90604, -122.54498),
-    "millbrae": (37.59855, -122.38719),
-    "milpitas": (37.42827, -121.90662),
-    "minkler": (36.72384, -119.45818),
-    "jurupa_valley": (33.99251, -117.51644),
-    "mira_mesa": (32.9156, -117.14392),
-    "mira_monte": (34.43361, -119.28511),
-    "mission_canyon": (34.45083, -119.71291),
-    "mission_district": (37.75993, -122.41914),
-    "mission_viejo": (33.60002, -117.672),
-    "modesto": (37.6391, -120.99688),
-    "mojave": (35.05247, -118.17396),
-    "mono_vista": (37.9977, -120.26991),
-    "montalvin": (37.99548, -122.33275),
-    "montara": (37.54216, -122.51609),
-    "monte_rio": (38.46547, -123.00889),
-    "monte_sereno": (37.23633, -121.99246),
-    "montecito": (34.43666, -119.63208),
-    "monterey_park": (34.06251, -118.12285),
-    "moorpark": (34.28556, -118.88204),
-    "morada": (38.03853, -121.24578),
-    "moraga": (37.83493, -122.12969),
-    "moreno_valley": (33.93752, -117.23059),
-    "morgan_hill": (37.1305, -121.65439),
-    "morongo_valley": (34.04695, -116.58085),
-    "morro_bay": (35.36581, -120.8499),
-    "moss_beach": (37.52744, -122.51331),
-    "mountain_house": (37.78326, -121.54273),
-    "mountain_ranch": (38.22825, -120.54076),
-    "mountain_view_acres": (34.49666, -117.34894),
-    "murphys": (38.13762, -120.46105),
-    "murrieta": (33.55391, -117.21392),
-    "murrieta_hot_springs": (33.56058, -117.15809),
-    "muscoy": (34.15418, -117.34421),
-    "napa": (38.29714, -122.28553),
-    "national_city": (32.67811, -117.0992),
-    "needles": (34.84806, -114.61413),
-    "nevada_city": (39.26173, -121.01779),
-    "newman": (37.31383, -121.02076),
-    "newport_beach": (33.61891, -117.92895),
-    "nice": (39.12323, -122.84833),
-    "niland": (33.24004, -115.51888),
-    "nipomo": (35.04275, -120.476),
-    "north_auburn": (38.93129, -121.08189),
-    "north_edwards": (35.01664, -117.83284),
-    "north_el_monte": (34.10279, -118.02423),
-    "north_fair_oaks": (37.47438, -122.19663),
-    "north_highlands": (38.68574, -121.37217),
-    "north_hollywood": (34.17223, -118.37897),
-    "north_richmond": (37.95881, -122.36747),
-    "novato": (38.10742, -122.5697),
-    "nuevo": (33.80141, -117.14587),
-    "oak_view": (34.4, -119.30011),
-    "oakley": (37.99742, -121.71245),
-    "oasis": (33.46586, -116.09889),
-    "occidental": (38.40741, -122.94833),
-    "oceano": (35.09886, -120.61239),
-    "oildale": (35.41968, -119.01955),
-    "ojai": (34.44805, -119.24289),
-    "olivehurst": (39.09545, -121.55219),
-    "opal_cliffs": (36.96078, -121.96413),
-    "orange_cove": (36.62439, -119.31373),
-    "orangevale": (38.67851, -121.22578),
-    "orcutt": (34.86526, -120.436),
-    "orinda": (37.87715, -122.17969),
-    "orosi": (36.54495, -119.28734),
-    "oroville": (39.51394, -121.55776),
-    "oxnard": (34.1975, -119.17705),
-    "pacheco": (37.98353, -122.07524),
-    "pacifica": (37.61383, -122.48692),
-    "pacific_grove": (36.61774, -121.91662),
-    "pajaro": (36.90412, -121.74856),
-    "palm_desert": (33.72255, -116.37697),
-    "palos_verdes_estates": (33.80105, -118.39245),
-    "paramount": (33.88946, -118.15979),
-    "parksdale": (36.94717, -120.02294),
-    "parkway": (38.49602, -121.45884),
-    "parkwood": (36.92689, -120.04461),
-    "parlier": (36.61162, -119.52707),
-    "pasatiempo": (37.00439, -122.0258),
-    "paso_robles": (35.62664, -120.691),
-    "pedley": (33.97529, -117.47588),
-    "penn_valley": (39.196, -121.19107),
-    "penngrove": (38.29964, -122.66665),
-    "perris": (33.78252, -117.22865),
-    "petaluma": (38.23242, -122.63665),
-    "phelan": (34.42611, -117.57228),
-    "pico_rivera": (33.98307, -118.09673),
-    "pine_mountain_club": (34.84637, -119.14955),
-    "pine_valley": (32.82144, -116.52918),
-    "pinole": (38.00437, -122.29886),
-    "piru": (34.41527, -118.79398),
-    "pismo_beach": (35.14275, -120.64128),
-    "pixley": (35.96856, -119.29178),
-    "piñon_hills": (34.43333, -117.64672),
-    "placentia": (33.87224, -117.87034),
-    "placerville": (38.72963, -120.79855),
-    "planada": (37.29077, -120.31852),
-    "plumas_lake": (39.02073, -121.55802),
-    "pollock_pines": (38.76158, -120.58611),
-    "port_hueneme": (34.14778, -119.19511),
-    "portola": (39.81046, -120.4691),
-    "portola_hills": (33.67919, -117.63116),
-    "porterville": (36.06523, -119.01677),
-    "portola_valley": (37.38411, -122.23524),
-    "poway": (32.96282, -117.03586),
-    "prunedale": (36.77579, -121.66967),
-    "quail_valley": (33.70697, -117.24504),
-    "quartz_hill": (34.64526, -118.21813),
-    "rainbow": (33.41031, -117.14781),
-    "ramona": (33.04171, -116.86808),
-    "rancho_calaveras": (38.12742, -120.85827),
-    "rancho_cordova": (38.58907, -121.30273),
-    "rancho_cucamonga": (34.1064, -117.59311),
-    "rancho_mirage": (33.73974, -116.41279),
-    "rancho_murieta": (38.50185, -121.09467),
-    "rancho_palos_verdes": (33.74446, -118.38702),
-    "rancho_penasquitos": (32.95949, -117.11531),
-    "rancho_san_diego": (32.74727, -116.9353),
-    "rancho_santa_fe": (33.02032, -117.20281),
-    "rancho_santa_margarita": (33.64086, -117.6031),
-    "redlands": (34.05557, -117.18254),
-    "redondo_beach": (33.84918, -118.38841),
-    "redwood_city": (37.48522, -122.23635),
-    "redwood_shores": (37.53188, -122.24802),
-    "redwood_valley": (39.26544, -123.20445),
-    "reedley": (36.59634, -119.4504),
-    "rialto": (34.1064, -117.37032),
-    "richgrove": (35.79662, -119.10788),
-    "ridgemark": (36.81246, -121.36577),
-    "rio_del_mar": (36.96828, -121.90023),
-    "rio_linda": (38.69101, -121.44857),
-    "riverbank": (37.73604, -120.93549),
-    "rocklin": (38.79073, -121.23578),
-    "rodeo": (38.03298, -122.26691),
-    "rohnert_park": (38.33964, -122.7011),
-    "rolling_hills": (33.75739, -118.35752),
-    "rolling_hills_estates": (33.78779, -118.35813),
-    "romoland": (33.74585, -117.17503),
-    "rosamond": (34.86414, -118.16341),
-    "rosemead": (34.08057, -118.07285),
-    "rowland_heights": (33.97612, -117.90534),
-    "rubidoux": (33.99613, -117.4056),
-    "running_springs": (34.20779, -117.1092),
-    "sacramento": (38.58157, -121.4944),
-    "saint_helena": (38.50519, -122.47026),
-    "salida": (37.70576, -121.08494),
-    "salinas": (36.67774, -121.6555),
-    "salton_city": (33.29865, -115.95611),
-    "san_andreas": (38.19603, -120.68049),
-    "san_anselmo": (37.97465, -122.56164),
-    "san_antonio_heights": (34.15556, -117.65644),
-    "san_bernardino": (34.10834, -117.28977),
-    "san_bruno": (37.63049, -122.41108),
-    "san_clemente": (33.42697, -117.61199),
-    "san_diego_country_estates": (33.00671, -116.78364),
-    "san_dimas": (34.10668, -117.80673),
-    "san_fernando": (34.28195, -118.43897),
-    "san_francisco": (37.77493, -122.41942),
-    "san_gabriel": (34.09611, -118.10583),
-    "san_jacinto": (33.78391, -116.95864),
-    "san_joaquin": (36.60662, -120.18904),
-    "san_joaquin_hills": (33.61169, -117.83672),
-    "san_jose": (37.33939, -121.89496),
-    "san_juan_bautista": (36.84551, -121.538),
-    "san_juan_capistrano": (33.50169, -117.66255),
-    "san_leandro": (37.72493, -122.15608),
-    "san_lorenzo": (37.68104, -122.12441),
-    "san_luis_obispo": (35.28275, -120.65962),
-    "san_marino": (34.1214, -118.10646),
-    "san_martin": (37.08495, -121.61022),
-    "san_mateo": (37.56299, -122.32553),
-    "san_miguel": (35.75247, -120.69628),
-    "san_pablo": (37.96215, -122.34553),
-    "san_pasqual": (33.09171, -116.95392),
-    "san_pedro": (33.73585, -118.29229),
-    "san_rafael": (37.97353, -122.53109),
-    "san_ramon": (37.77993, -121.97802),
-    "santa_ana": (33.74557, -117.86783),
-    "santa_barbara": (34.42083, -119.69819),
-    "santa_clara": (37.35411, -121.95524),
-    "santa_clarita": (34.39166, -118.54259),
-    "santa_cruz": (36.97412, -122.0308),
-    "santa_fe_springs": (33.94724, -118.08535),
-    "santa_margarita": (35.38997, -120.60906),
-    "santa_maria": (34.95303, -120.43572),
-    "santa_monica": (34.01945, -118.49119),
-    "santa_paula": (34.35417, -119.05927),
-    "santa_susana": (34.27167, -118.70898),
-    "santa_venetia": (37.99853, -122.52525),
-    "santa_ynez": (34.61443, -120.07987),
-    "santee": (32.83838, -116.97392),
-    "saranap": (37.88492, -122.07607),
-    "saratoga": (37.26383, -122.02301),
-    "saticoy": (34.28306, -119.14983),
-    "sausalito": (37.85909, -122.48525),
-    "scotts_valley": (37.05106, -122.01468),
-    "sea_ranch": (38.71519, -123.45445),
-    "seacliff": (36.97412, -121.91579),
-    "seal_beach": (33.74141, -118.10479),
-    "searles_valley": (35.76745, -117.40395),
-    "sebastopol": (38.40214, -122.82388),
-    "sedco_hills": (33.64169, -117.29087),
-    "seeley": (32.79311, -115.69111),
-    "seven_trees": (37.28605, -121.83856),
-    "shackelford": (37.61382, -120.99271),
-    "shadow_hills": (34.26195, -118.35175),
-    "shafter": (35.50051, -119.27178),
-    "shandon": (35.65525, -120.37543),
-    "sherman_oaks": (34.15112, -118.44925),
-    "shingle_springs": (38.66574, -120.92605),
-    "sierra_madre": (34.16167, -118.05285),
-    "signal_hill": (33.80446, -118.16785),
-    "simi_valley": (34.26945, -118.78148),
-    "sky_valley": (33.89001, -116.35251),
-    "soda_bay": (39.00101, -122.78916),
-    "solana_beach": (32.99115, -117.27115),
-    "soledad": (36.42469, -121.32632),
-    "solvang": (34.59582, -120.13765),
-    "sonoma": (38.29186, -122.45804),
-    "sonora": (37.98409, -120.38214),
-    "soquel": (36.98801, -121.95663),
-    "sorrento_valley": (32.89991, -117.19451),
-    "soulsbyville": (37.98465, -120.2638),
-    "south_dos_palos": (36.96439, -120.65324),
-    "south_el_monte": (34.05195, -118.04673),
-    "south_lake_tahoe": (38.93324, -119.98435),
-    "south_oroville": (39.49655, -121.55219),
-    "south_san_francisco": (37.65466, -122.40775),
-    "south_san_gabriel": (34.04915, -118.09462),
-    "south_san_jose_hills": (34.01279, -117.90478),
-    "south_whittier": (33.95015, -118.03917),
-    "south_yuba_city": (39.11656, -121.63913),
-    "squaw_valley": (36.74023, -119.24679),
-    "stallion_springs": (35.08886, -118.64259),
-    "strawberry": (37.89687, -122.50886),
-    "studio_city": (34.14862, -118.39647),
-    "suisun": (38.23825, -122.04024),
-    "summerland": (34.42138, -119.59652),
-    "sunland": (34.26695, -118.3023),
-    "sunnyslope": (34.01196, -117.43338),
-    "sutter": (39.15989, -121.75275),
-    "sutter_creek": (38.39297, -120.80244),
-    "taft_heights": (35.13469, -119.47262),
-    "tahoe_vista": (39.23991, -120.05102),
-    "tahoma": (39.06741, -120.12824),
-    "talmage": (39.13323, -123.16778),
-    "tamalpais_valley": (37.87965, -122.54581),
-    "tara_hills": (37.99353, -122.31636),
-    "tarpey_village": (36.79301, -119.70097),
-    "tehachapi": (35.13219, -118.44897),
-    "temecula": (33.49364, -117.14836),
-    "temelec": (38.26658, -122.49276),
-    "temple_city": (34.10723, -118.05785),
-    "terra_bella": (35.96245, -119.04427),
-    "thermal": (33.6403, -116.13945),
-    "thermalito": (39.51128, -121.58692),
-    "thousand_oaks": (34.17056, -118.83759),
-    "thousand_palms": (33.82002, -116.39029),
-    "tiburon": (37.87354, -122.45664),
-    "tierra_buena": (39.14878, -121.66691),
-    "topanga": (34.09362, -118.60147),
-    "toro_canyon": (34.42, -119.56707),
-    "torrance": (33.83585, -118.34063),
-    "trabuco_canyon": (33.66252, -117.59033),
-    "truckee": (39.32796, -120.18325),
-    "tujunga": (34.25223, -118.28841),
-    "tulare": (36.20773, -119.34734),
-    "tuolumne_city": (37.9627, -120.2413),
-    "turlock": (37.49466, -120.84659),
-    "tustin": (33.74585, -117.82617),
-    "north_tustin": (33.76446, -117.79394),
-    "twain_harte": (38.03965, -120.23269),
-    "twentynine_palms": (34.13556, -116.05417),
-    "ukiah": (39.15017, -123.20778),
-    "upper_lake": (39.16461, -122.91055),
-    "vacaville": (38.35658, -121.98774),
-    "val_verde": (34.445, -118.65759),
-    "valencia": (34.44361, -118.60953),
-    "valinda": (34.04529, -117.94367),
-    "valle_vista": (33.7478, -116.89336),
-    "vallejo": (38.10409, -122.25664),
-    "valley_springs": (38.19159, -120.8291),
-    "van_nuys": (34.18667, -118.44897),
-    "vandenberg_village": (34.70832, -120.46766),
-    "ventura": (34.27834, -119.29317),
-    "victorville": (34.53611, -117.29116),
-    "visalia": (36.33023, -119.29206),
-    "vista": (33.20004, -117.24254),
-    "vista_santa_rosa": (33.6278, -116.21806),
-    "waldon": (37.92631, -122.05552),
-    "walnut_creek": (37.90631, -122.06496),
-    "walnut_park": (33.96807, -118.22507),
-    "watsonville": (36.91023, -121.75689),
-    "weedpatch": (35.23802, -118.9151),
-    "west_athens": (33.92335, -118.30341),
-    "west_carson": (33.82168, -118.29257),
-    "west_rancho_dominguez": (33.8939, -118.27063),
-    "west_covina": (34.06862, -117.93895),
-    "west_menlo_park": (37.43355, -122.20302),
-    "west_puente_valley": (34.05168, -117.9684),
-    "west_sacramento": (38.58046, -121.53023),
-    "westlake_village": (34.14584, -118.80565),
-    "westmorland": (33.03727, -115.62138),
-    "wheatland": (39.00989, -121.42301),
-    "whittier": (33.97918, -118.03284),
-    "wildomar": (33.59891, -117.28004),
-    "willits": (39.40961, -123.35557),
-    "willows": (39.52433, -122.19359),
-    "winter_gardens": (32.83116, -116.93336),
-    "wofford_heights": (35.7069, -118.4562),
-    "woodacre": (38.0127, -122.64526),
-    "woodcrest": (33.88224, -117.35727),
-    "woodlake": (36.41356, -119.09872),
-    "woodland": (38.67852, -121.7733),
-    "woodland_hills": (34.16834, -118.60592),
-    "wrightwood": (34.36083, -117.63339),
-    "yorba_linda": (33.88863, -117.81311),
-    "yosemite_lakes": (37.19106, -119.77265),
-    "yountville": (38.40158, -122.36081),
-    "yuba_city": (39.14045, -121.61691),
-    "yucaipa": (34.03363, -117.04309),
-    "yucca_valley": (34.11417, -116.43224),
-    "acres_green": (39.55666, -104.89609),
-    "alamosa": (37.46945, -105.87002),
-    "applewood": (39.75778, -105.1625),
-    "arvada": (39.80276, -105.08748),
-    "aspen": (39.1911, -106.81754),
-    "basalt": (39.36887, -107.03282),
-    "battlement_mesa": (39.44137, -108.02507),
-    "bayfield": (37.22556, -107.59811),
-    "bennett": (39.75887, -104.42746),
-    "black_forest": (39.01305, -104.70081),
-    "broomfield": (39.92054, -105.08665),
-    "byers": (39.71137, -104.22774),
-    "cañon_city": (38.44098, -105.24245),
-    "carriage_club": (39.53249, -104.90109),
-    "castle_pines": (39.45804, -104.89609),
-    "castle_rock": (39.37221, -104.85609),
-    "cedaredge": (38.90165, -107.92645),
-    "centennial": (39.57916, -104.87692),
-    "cherry_hills_village": (39.64165, -104.95943),
-    "cheyenne_wells": (38.8214, -102.35324),
-    "cimarron_hills": (38.85861, -104.69886),
-    "coal_creek": (39.90638, -105.37749),
-    "colorado_springs": (38.83388, -104.82136),
-    "columbine": (39.58777, -105.06943),
-    "columbine_valley": (39.6011, -105.03221),
-    "commerce_city": (39.80832, -104.93387),
-    "conejos": (37.08835, -106.01974),
-    "creede": (37.84917, -106.92643),
-    "crested_butte": (38.86971, -106.98782),
-    "cripple_creek": (38.74666, -105.17831),
-    "del_norte": (37.67889, -106.35337),
-    "dove_creek": (37.7661, -108.90594),
-    "durango": (37.27528, -107.88007),
-    "eads": (38.48056, -102.78186),
-    "el_jebel": (39.39498, -107.09033),
-    "ellicott": (38.83833, -104.38691),
-    "fairplay": (39.22471, -106.00196),
-    "federal_heights": (39.85137, -104.99859),
-    "fort_carson": (38.73749, -104.78886),
-    "fountain": (38.68222, -104.70081),
-    "fruita": (39.15887, -108.72899),
-    "fruitvale": (39.08165, -108.49676),
-    "genesee": (39.68582, -105.27277),
-    "gleneagle": (39.04527, -104.82442),
-    "glenwood_springs": (39.55054, -107.32478),
-    "golden": (39.75554, -105.2211),
-    "grand_junction": (39.06387, -108.55065),
-    "greenwood_village": (39.61721, -104.95081),
-    "gunnison": (38.54582, -106.92532),
-    "gypsum": (39.64693, -106.95171),
-    "highlands_ranch": (39.55388, -104.96943),
-    "idaho_springs": (39.74249, -105.51361),
-    "ken_caryl": (39.57582, -105.11221),
-    "kittredge": (39.65471, -105.29971),
-    "la_junta": (37.98501, -103.54383),
-    "las_animas": (38.06667, -103.22271),
-    "leadville": (39.25082, -106.29252),
-    "limon": (39.26388, -103.69217),
-    "loma": (39.19581, -108.81316),
-    "mancos": (37.345, -108.28925),
-    "manitou_springs": (38.85971, -104.9172),
-    "minturn": (39.58637, -106.43086),
-    "monte_vista": (37.57917, -106.14808),
-    "monument": (39.09166, -104.87276),
-    "mountain_village": (37.93138, -107.85645),
-    "northglenn": (39.88554, -104.9872),
-    "orchard_mesa": (39.04304, -108.55232),
-    "orchard_city": (38.82832, -107.9709),
-    "ordway": (38.21806, -103.75606),
-    "ouray": (38.02277, -107.67145),
-    "pagosa_springs": (37.26945, -107.00976),
-    "palisade": (39.11026, -108.35092),
-    "palmer_lake": (39.12221, -104.9172),
-    "parachute": (39.45192, -108.05285),
-    "penrose": (38.425, -105.02276),
-    "perry_park": (39.25666, -104.99248),
-    "ponderosa_park": (39.40832, -104.65108),
-    "pueblo": (38.25445, -104.60914),
-    "pueblo_west": (38.35, -104.72275),
-    "rifle": (39.5347, -107.78312),
-    "rocky_ford": (38.05251, -103.72023),
-    "roxborough_park": (39.47388, -105.08526),
-    "saguache": (38.0875, -106.14197),
-    "sherrelwood": (39.83776, -105.00137),
-    "silt": (39.54859, -107.65617),
-    "silverthorne": (39.63214, -106.07428),
-    "snowmass_village": (39.21304, -106.93782),
-    "southglenn": (39.58721, -104.95276),
-    "stonegate": (39.53082, -104.80386),
-    "stratmoor": (38.77388, -104.7797),
-    "telluride": (37.93749, -107.81229),
-    "the_pinery": (39.45527, -104.73442),
-    "todd_creek": (39.97804, -104.87331),
-    "towaoc": (37.20444, -108.72954),
-    "trinidad": (37.16946, -104.50054),
-    "walsenburg": (37.62418, -104.78026),
-    "welby": (39.83665, -104.95915),
-    "westcliffe": (38.13472, -105.46584),
-    "wheat_ridge": (39.7661, -105.07721),
-    "woodmoor": (39.10138, -104.84748),
-    "dodge_city": (37.7528, -100.01708),
-    "gove": (38.95779, -100.48875),
-    "hugoton": (37.1753, -101.3496),
-    "lakin": (37.94058, -101.25489),
-    "leoti": (38.47974, -101.35877),
-    "liberal": (37.04308, -100.921),
-    "meade": (37.28558, -100.34015),
-    "satanta": (37.43725, -100.97211),
-    "sharon_springs": (38.89779, -101.75212),
-    "sublette": (37.48169, -100.84377),
-    "tribune": (38.46974, -101.75267),
-    "ulysses": (37.58141, -101.35517),
-    "agua_fria": (35.65448, -106.02224),
-    "alamogordo": (32.89953, -105.96027),
-    "albuquerque": (35.08449, -106.65114),
-    "angel_fire": (36.39309, -105.28501),
-    "arenas_valley": (32.79396, -108.18421),
-    "arroyo_seco": (36.51669, -105.56918),
-    "aztec": (36.82223, -107.99285),
-    "bayard": (32.76174, -108.1306),
-    "belen": (34.66284, -106.77642),
-    "berino": (32.07093, -106.62138),
-    "bernalillo": (35.30004, -106.55114),
-    "black_rock": (35.08837, -108.79119),
-    "boles_acres": (32.80703, -105.9861),
-    "bosque_farms": (34.85478, -106.7053),
-    "capitan": (33.54536, -105.5722),
-    "carnuel": (35.06394, -106.45725),
-    "carrizozo": (33.64174, -105.87721),
-    "chama": (36.90307, -106.57948),
-    "chaparral": (32.02376, -106.38566),
-    "chimayo": (36.00391, -105.94697),
-    "church_rock": (35.53391, -108.5998),
-    "corrales": (35.23782, -106.60669),
-    "crownpoint": (35.67808, -108.15118),
-    "deming": (32.2687, -107.75864),
-    "doña_ana": (32.38954, -106.8139),
-    "dulce": (36.93362, -106.99893),
-    "el_cerro": (34.727, -106.71086),
-    "el_rancho": (35.88919, -106.07975),
-    "el_valle_de_arroyo_seco": (35.9628, -106.02947),
-    "eldorado_at_santa_fe": (35.52642, -105.93474),
-    "elephant_butte": (33.14868, -107.18475),
-    "española": (35.99113, -106.08058),
-    "estancia": (34.75839, -106.05585),
-    "flora_vista": (36.79445, -108.08035),
-    "fort_sumner": (34.47173, -104.24553),
-    "gallup": (35.52808, -108.74258),
-    "grants": (35.1476, -107.85261),
-    "hagerman": (33.11511, -104.32691),
-    "hatch": (32.66536, -107.15307),
-    "hobbs": (32.70261, -103.13604),
-    "jal": (32.11318, -103.19351),
-    "jarales": (34.61312, -106.76364),
-    "jemez_pueblo": (35.61422, -106.72832),
-    "la_cienega": (35.56281, -106.13086),
-    "la_huerta": (32.4429, -104.22106),
-    "la_luz": (32.97787, -105.94193),
-    "la_mesilla": (35.94836, -106.07058),
-    "la_puebla": (35.98919, -105.99641),
-    "la_union": (31.95066, -106.66166),
-    "las_cruces": (32.31232, -106.77834),
-    "las_vegas": (35.59393, -105.2239),
-    "lee_acres": (35.14866, -106.64697),
-    "lordsburg": (32.35036, -108.70866),
-    "los_chavez": (34.72571, -106.75726),
-    "los_lunas": (34.80617, -106.73336),
-    "los_ranchos_de_albuquerque": (35.16199, -106.6428),
-    "loving": (32.28623, -104.09577),
-    "mcintosh": (34.86478, -106.05169),
-    "meadow_lake": (34.80144, -106.54363),
-    "mescalero": (33.15759, -105.77415),
-    "mesilla": (32.27009, -106.80084),
-    "moriarty": (34.99005, -106.04919),
-    "mosquero": (35.77698, -103.95664),
-    "nambe": (35.89336, -105.98252),
-    "navajo": (35.90001, -109.03398),
-    "north_valley": (35.17338, -106.62336),
-    "paradise_hills": (35.2006, -106.70114),
-    "pecos": (35.5742, -105.67502),
-    "peralta": (34.837, -106.69058),
-    "placitas": (35.30698, -106.42475),
-    "ponderosa_pine": (34.97699, -106.32419),
-    "portales": (34.18619, -103.3344),
-    "questa": (36.70391, -105.59501),
-    "radium_springs": (32.5012, -106.92807),
-    "ranchos_de_taos": (36.35864, -105.60946),
-    "raton": (36.90336, -104.43915),
-    "rio_rancho": (35.23338, -106.66447),
-    "ruidoso": (33.33175, -105.67304),
-    "ruidoso_downs": (33.32897, -105.60443),
-    "san_felipe_pueblo": (35.43392, -106.44669),
-    "san_ysidro": (32.35093, -106.81112),
-    "sandia_heights": (35.17699, -106.49141),
-    "sandia_knolls": (35.16393, -106.31141),
-    "santa_clara_pueblo": (35.96558, -106.08863),
-    "santa_teresa": (36.15335, -106.67948),
-    "santo_domingo_pueblo": (35.51476, -106.36586),
-    "shiprock": (36.78555, -108.68703),
-    "silver_city": (32.77007, -108.28033),
-    "socorro": (34.0584, -106.89142),
-    "south_valley": (35.01005, -106.67808),
-    "sunland_park": (31.7965, -106.57999),
-    "taos_pueblo": (36.43864, -105.54445),
-    "texico": (34.38869, -103.05134),
-    "thoreau": (35.40253, -108.2234),
-    "tierra_amarilla": (36.70029, -106.54976),
-    "tome": (34.74089, -106.72836),
-    "truth_or_consequences": (33.1284, -107.25281),
-    "tucumcari": (35.17191, -103.72686),
-    "tularosa": (33.07397, -106.0186),
-    "upper_fruitland": (36.71584, -108.31424),
-    "vado": (32.11176, -106.6625),
-    "waterflow": (36.75972, -108.48175),
-    "white_rock": (35.82753, -106.20391),
-    "white_sands": (32.38093, -106.47944),
-    "zuni_pueblo": (35.07253, -108.85064),
-    "boulder_city": (35.97859, -114.83249),
-    "bunkerville": (36.77303, -114.12802),
-    "caliente": (37.61496, -114.51194),
-    "cold_springs": (39.68019, -119.97659),
-    "fallon": (39.47353, -118.77737),
-    "fernley": (39.60797, -119.25183),
-    "gardnerville": (38.9413, -119.74962),
-    "gardnerville_ranchos": (38.88824, -119.74129),
-    "goldfield": (37.70854, -117.23563),
-    "incline_village": (39.2513, -119.97297),
-    "johnson_lane": (39.04796, -119.72212),
-    "kingsbury": (38.97713, -119.90685),
-    "laughlin": (35.16778, -114.57302),
-    "lemmon_valley": (39.63602, -119.84325),
-    "mcgill": (39.40494, -114.77863),
-    "moapa_town": (36.68219, -114.59416),
-    "moapa_valley": (36.58053, -114.47026),
-    "mogul": (39.5138, -119.92603),
-    "north_las_vegas": (36.19886, -115.1175),
-    "pahrump": (36.20829, -115.98391),
-    "pioche": (37.92969, -114.45221),
-    "sandy_valley": (35.81692, -115.63223),
-    "silver_springs": (39.41547, -119.22461),
-    "smith": (38.80047, -119.32738),
-    "spanish_springs": (39.64908, -119.70741),
-    "stagecoach": (39.3738, -119.37406),
-    "sunrise_manor": (36.21108, -115.07306),
-    "tonopah": (38.06716, -117.23008),
-    "verdi": (39.51824, -119.98881),
-    "virginia_city": (39.30963, -119.64962),
-    "yerington": (38.98575, -119.16293),
-    "boise_city": (36.72947, -102.51324),
-    "goodwell": (36.5953, -101.63655),
-    "guymon": (36.6828, -101.48155),
-    "hooker": (36.86003, -101.2135),
-    "abernathy": (33.8323, -101.84295),
-    "amarillo": (35.222, -101.8313),
-    "aspermont": (33.13343, -100.22733),
-    "big_spring": (32.2504, -101.47874),
-    "booker": (36.45336, -100.53737),
-    "borger": (35.66782, -101.39739),
-    "bovina": (34.51368, -102.883),
-    "brackettville": (29.31051, -100.41786),
-    "bushland": (35.192, -102.06464),
-    "canadian": (35.91282, -100.38208),
-    "canutillo": (31.91149, -106.60027),
-    "canyon": (34.98033, -101.9188),
-    "channing": (35.68365, -102.3302),
-    "childress": (34.42645, -100.204),
-    "cienegas_terrace": (29.36745, -100.94371),
-    "claude": (35.11172, -101.36322),
-    "clint": (31.59234, -106.22414),
-    "crosbyton": (33.66008, -101.23793),
-    "dalhart": (36.05948, -102.51325),
-    "denver_city": (32.96455, -102.8291),
-    "dickens": (33.62175, -100.83652),
-    "dimmitt": (34.5509, -102.31186),
-    "eagle_pass": (28.70914, -100.49952),
-    "earth": (34.23314, -102.41075),
-    "eidson_road": (28.6772, -100.48702),
-    "elm_creek": (28.77442, -100.49174),
-    "fabens": (31.50234, -106.15859),
-    "farwell": (34.38341, -103.038),
-    "floydada": (33.98452, -101.33766),
-    "fort_clark_springs": (29.30607, -100.42202),
-    "fort_davis": (30.58821, -103.89463),
-    "fort_hancock": (31.29846, -105.84525),
-    "fort_stockton": (30.89404, -102.87932),
-    "friona": (34.64173, -102.7241),
-    "fritch": (35.63977, -101.60323),
-    "gail": (32.77038, -101.44541),
-    "grape_creek": (31.57932, -100.5476),
-    "hale_center": (34.06424, -101.84379),
-    "hereford": (34.81521, -102.39932),
-    "homestead_meadows_north": (31.84963, -106.17285),
-    "homestead_meadows_south": (31.81097, -106.16427),
-    "horizon_city": (31.69261, -106.20748),
-    "idalou": (33.66647, -101.68294),
-    "iraan": (30.91405, -101.89791),
-    "jayton": (33.24815, -100.57373),
-    "kermit": (31.85763, -103.09267),
-    "lamesa": (32.7376, -101.95099),
-    "las_quintas_fronterizas": (28.69053, -100.46869),
-    "las_quintas_fronterizas_colonia": (28.69137, -100.46924),
-    "levelland": (33.58732, -102.37796),
-    "littlefield": (33.91731, -102.3249),
-    "lockney": (34.12452, -101.44155),
-    "lorenzo": (33.67064, -101.53516),
-    "lubbock": (33.57786, -101.85517),
-    "marfa": (30.30973, -104.02134),
-    "matador": (34.01202, -100.82208),
-    "mccamey": (31.13598, -102.2243),
-    "merkel": (32.47068, -100.01287),
-    "mertzon": (31.26183, -100.81733),
-    "monahans": (31.5943, -102.89265),
-    "muleshoe": (34.22647, -102.72383),
-    "olton": (34.18341, -102.13463),
-    "ozona": (30.71017, -101.20067),
-    "pampa": (35.53616, -100.95987),
-    "panhandle": (35.3456, -101.38044),
-    "perryton": (36.40003, -100.80265),
-    "post": (33.19122, -101.379),
-    "presidio": (29.56074, -104.37215),
-    "ransom_canyon": (33.53342, -101.67961),
-    "robert_lee": (31.89237, -100.48482),
-    "roby": (32.74483, -100.37761),
-    "rocksprings": (30.01576, -100.20536),
-    "rosita_north": (28.65644, -100.42218),
-    "rosita_south": (28.62375, -100.42837),
-    "rotan": (32.85205, -100.46566),
-    "san_angelo": (31.46377, -100.43704),
-    "san_elizario": (31.58511, -106.27276),
-    "sanderson": (30.14241, -102.39403),
-    "seagraves": (32.94427, -102.56491),
-    "seth_ward": (34.21174, -101.69017),
-    "shallowater": (33.68897, -101.99823),
-    "sierra_blanca": (31.17457, -105.35718),
-    "slaton": (33.43731, -101.64349),
-    "socorro_mission_number_1_colonia": (31.63622, -106.29054),
-    "spearman": (36.19837, -101.19238),
-    "sterling_city": (31.83625, -100.98483),
-    "stinnett": (35.82698, -101.44294),
-    "sundown": (33.45621, -102.48936),
-    "sunray": (36.0167, -101.82462),
-    "tahoka": (33.16676, -101.79377),
-    "tornillo": (31.4454, -106.08831),
-    "tulia": (34.53589, -101.75852),
-    "val_verde_park": (29.37495, -100.83176),
-    "van_horn": (31.04029, -104.83073),
-    "vega": (35.24283, -102.42826),
-    "west_odessa": (31.84235, -102.49876),
-    "westway": (31.95871, -106.57805),
-    "wheeler": (35.44533, -100.27096),
-    "wink": (31.75124, -103.15989),
-    "wolfforth": (33.50592, -102.00906),
-    "blanding": (37.62433, -109.47966),
-    "carbonville": (39.61996, -110.83433),
-    "castle_dale": (39.21219, -111.01961),
-    "cedar_city": (37.67748, -113.06189),
-    "east_carbon_city": (39.54774, -110.41488),
-    "enoch": (37.77331, -113.02439),
-    "ephraim": (39.35968, -111.58631),
-    "ferron": (39.09358, -111.13322),
-    "fountain_green": (39.62996, -111.6352),
-    "genola": (39.99634, -111.84327),
-    "helper": (39.68413, -110.85461),
-    "hildale": (37.0036, -112.96688),
-    "ivins": (37.16859, -113.67941),
-    "kanab": (37.04749, -112.52631),
-    "laverkin": (37.20109, -113.26967),
-    "loa": (38.40276, -111.64296),
-    "manti": (39.2683, -111.63686),
-    "moab": (38.57332, -109.54984),
-    "moroni": (39.52496, -111.59047),
-    "nephi": (39.71023, -111.83632),
-    "orangeville": (39.22719, -111.0535),
-    "panguitch": (37.82276, -112.43576),
-    "parowan": (37.8422, -112.828),
-    "price": (39.59941, -110.81071),
-    "santaquin": (39.97551, -111.78521),
-    "spring_glen": (39.65941, -110.85349),
-    "toquerville": (37.25332, -113.28467),
-    "west_sedona": (34.86724, -111.80543),
-    "west_bishop": (37.36104, -118.45511),
-    "paonia": (38.86832, -107.592),
-    "cimarron": (37.80669, -100.3482),
-    "pojoaque": (35.8928, -106.02308),
-    "beatty": (36.90856, -116.75923),
-    "anton": (33.8112, -102.16379),
-    "gruver": (36.26503, -101.40627),
-    "ralls": (33.67425, -101.38766),
-    "spur": (33.47648, -100.85569),
-    "centerfield": (39.12524, -111.81909),
-    "ajo": (32.37172, -112.86071),
-    "anthem": (33.86726, -112.14682),
-    "apache_junction": (33.41505, -111.54958),
-    "arivaca_junction": (31.72731, -111.0612),
-    "arizona_city": (32.75589, -111.67096),
-    "avra_valley": (32.43785, -111.31539),
-    "big_park": (34.7803, -111.76265),
-    "wray": (40.07582, -102.22325),
-    "rathdrum": (47.8124, -116.89659),
-    "beach": (46.91807, -104.00437),
-    "ketchikan": (55.3418, -131.64757),
-    "little_cottonwood_creek_valley": (40.60439, -111.82938),
-    "lea_hill": (47.32621, -122.18151),
-    "metlakatla": (55.12848, -131.57519),
-    "sitka": (57.05315, -135.33088),
-    "wrangell": (56.47083, -132.37667),
-    "arcata": (40.86652, -124.08284),
-    "bayview": (40.77263, -124.18395),
-    "blue_lake": (40.88291, -123.98395),
-    "burney": (40.88238, -121.66082),
-    "central_valley_(historical)": (40.68043, -122.37112),
-    "cutten": (40.76985, -124.14284),
-    "dunsmuir": (41.20821, -122.27195),
-    "fortuna": (40.59819, -124.15728),
-    "gerber": (40.05627, -122.15027),
-    "happy_camp": (41.79275, -123.3808),
-    "hayfork": (40.55431, -123.18308),
-    "humboldt_hill": (40.72596, -124.18978),
-    "hydesville": (40.54763, -124.09727),
-    "johnstonville": (40.38434, -120.58745),
-    "los_molinos": (40.02127, -122.10027),
-    "mccloud": (41.25571, -122.13945),
-    "mckinleyville": (40.94652, -124.10062),
-    "mount_shasta": (41.31024, -122.31225),
-    "myrtletown": (40.78874, -124.13034),
-    "palo_cedro": (40.56376, -122.23889),
-    "red_bluff": (40.17849, -122.23583),
-    "redding": (40.58654, -122.39168),
-    "redway": (40.12014, -123.82336),
-    "rio_dell": (40.4993, -124.10644),
-    "shasta": (40.59932, -122.49196),
-    "shasta_lake": (40.68043, -122.37084),
-    "shingletown": (40.49238, -121.88916),
-    "susanville": (40.41628, -120.65301),
-    "weed": (41.42265, -122.38613),
-    "willow_creek": (40.93958, -123.63144),
-    "yreka": (41.73542, -122.63447),
-    "aristocrat_ranchettes": (40.10915, -104.76247),
-    "ault": (40.58248, -104.73191),
-    "berthoud": (40.30832, -105.08109),
-    "boulder": (40.01499, -105.27055),
-    "brush": (40.25887, -103.62384),
-    "campion": (40.34943, -105.07776),
-    "craig": (40.51525, -107.54645),
-    "dacono": (40.08471, -104.93942),
-    "estes_park": (40.37721, -105.52167),
-    "firestone": (40.11248, -104.93664),
-    "fort_collins": (40.58526, -105.08442),
-    "fort_lupton": (40.08471, -104.81303),
-    "fort_morgan": (40.25026, -103.79995),
-    "gilcrest": (40.28193, -104.77775),
-    "hot_sulphur_springs": (40.07304, -106.1028),
-    "julesburg": (40.98833, -102.26435),
-    "keenesburg": (40.10832, -104.51996),
-    "kersey": (40.38748, -104.56163),
-    "kremmling": (40.05887, -106.38892),
-    "lochbuie": (40.00721, -104.71608),
-    "longmont": (40.16721, -105.10193),
-    "mead": (40.23332, -104.99859),
-    "milliken": (40.32943, -104.85525),
-    "niwot": (40.10387, -105.17082),
-    "rangely": (40.08748, -108.80483),
-    "severance": (40.52415, -104.85108),
-    "steamboat_springs": (40.48498, -106.83172),
-    "american_falls": (42.78602, -112.85444),
-    "ammon": (43.46964, -111.96664),
-    "arco": (43.63657, -113.30028),
-    "ashton": (44.07158, -111.44829),
-    "blackfoot": (43.19047, -112.34498),
-    "boise": (43.6135, -116.20345),
-    "bonners_ferry": (48.69133, -116.31631),
-    "buhl": (42.59907, -114.75949),
-    "burley": (42.53574, -113.79279),
-    "challis": (44.50464, -114.23173),
-    "chubbuck": (42.92075, -112.46609),
-    "coeur_d_alene": (47.67768, -116.78047),
-    "council": (44.72989, -116.4382),
-    "dalton_gardens": (47.72963, -116.77019),
-    "driggs": (43.72325, -111.11133),
-    "emmett": (43.8735, -116.4993),
-    "filer": (42.57019, -114.60782),
-    "fort_hall": (43.03325, -112.43831),
-    "glenns_ferry": (42.9549, -115.3009),
-    "gooding": (42.93879, -114.71311),
-    "grangeville": (45.92655, -116.12237),
-    "hailey": (43.51963, -114.31532),
-    "hansen": (42.53068, -114.30101),
-    "heyburn": (42.55852, -113.7639),
-    "homedale": (43.61766, -116.93376),
-    "idaho_city": (43.8285, -115.83455),
-    "idaho_falls": (43.46658, -112.03414),
-    "kamiah": (46.22712, -116.02931),
-    "kellogg": (47.53826, -116.11933),
-    "ketchum": (43.68074, -114.36366),
-    "kuna": (43.49183, -116.42012),
-    "lapwai": (46.40489, -116.80487),
-    "lewiston_orchards": (46.38044, -116.97543),
-    "malad_city": (42.19159, -112.2508),
-    "marsing": (43.54544, -116.8132),
-    "mccall": (44.91101, -116.09874),
-    "moreland": (43.22269, -112.44248),
-    "nampa": (43.54072, -116.56346),
-    "new_plymouth": (43.96989, -116.81904),
-    "nezperce": (46.23489, -116.2407),
-    "orofino": (46.47935, -116.25514),
-    "osburn": (47.50604, -115.99933),
-    "paul": (42.60796, -113.78335),
-    "payette": (44.07822, -116.93377),
-    "plummer": (47.33518, -116.88851),
-    "pocatello": (42.8713, -112.44553),
-    "ponderay": (48.30548, -116.5338),
-    "post_falls": (47.71796, -116.95159),
-    "priest_river": (48.18097, -116.91157),
-    "rexburg": (43.82602, -111.78969),
-    "rigby": (43.67241, -111.91497),
-    "rupert": (42.61908, -113.67723),
-    "saint_maries": (47.31435, -116.56267),
-    "salmon": (45.17575, -113.8959),
-    "sandpoint": (48.27659, -116.55325),
-    "shelley": (43.3813, -112.12331),
-    "shoshone": (42.93602, -114.40588),
-    "soda_springs": (42.65437, -111.60467),
-    "star": (43.69211, -116.49346),
-    "sugar_city": (43.87297, -111.7483),
-    "twin_falls": (42.56297, -114.46087),
-    "tyhee": (42.95158, -112.46637),
-    "ucon": (43.5963, -111.96386),
-    "weiser": (44.251, -116.96933),
-    "absarokee": (45.5205, -109.44294),
-    "anaconda": (46.12854, -112.94226),
-    "big_sky": (45.28465, -111.36829),
-    "big_timber": (45.83494, -109.95546),
-    "bigfork": (48.06329, -114.07261),
-    "bozeman": (45.67965, -111.03856),
-    "broadus": (45.44387, -105.41133),
-    "browning": (48.55692, -113.01342),
-    "chinook": (48.59, -109.23128),
-    "choteau": (47.81245, -112.18363),
-    "circle": (47.41667, -105.59222),
-    "clancy": (46.46521, -111.98638),
-    "colstrip": (45.88416, -106.62364),
-    "columbia_falls": (48.37246, -114.18152),
-    "crow_agency": (45.60164, -107.46119),
-    "cut_bank": (48.63304, -112.32616),
-    "deer_lodge": (46.39576, -112.73004),
-    "east_helena": (46.58966, -111.91555),
-    "east_missoula": (46.87076, -113.94455),
-    "ekalaka": (45.88889, -104.55273),
-    "fort_belknap_agency": (48.4825, -108.76544),
-    "fort_benton": (47.8183, -110.66744),
-    "glendive": (47.10529, -104.71246),
-    "harlowton": (46.43551, -109.83435),
-    "havre": (48.55, -109.68409),
-    "hysham": (46.29277, -107.23423),
-    "kalispell": (48.19579, -114.31291),
-    "lame_deer": (45.62305, -106.6667),
-    "libby": (48.38829, -115.556),
-    "lockwood": (45.81912, -108.41486),
-    "lolo": (46.75881, -114.08094),
-    "miles_city": (46.40834, -105.84056),
-    "missoula": (46.87215, -113.994),
-    "montana_city": (46.53771, -111.93277),
-    "north_browning": (48.57025, -113.00953),
-    "orchard_homes": (46.86326, -114.04844),
-    "pablo": (47.60021, -114.119),
-    "plentywood": (48.77475, -104.56246),
-    "polson": (47.69355, -114.16317),
-    "red_lodge": (45.18578, -109.24682),
-    "ronan": (47.52882, -114.1015),
-    "roundup": (46.44524, -108.5418),
-    "ryegate": (46.29718, -109.25879),
-    "scobey": (48.79252, -105.42083),
-    "seeley_lake": (47.17938, -113.48452),
-    "south_browning": (48.54608, -113.01425),
-    "thompson_falls": (47.59489, -115.33834),
-    "three_forks": (45.89243, -111.55219),
-    "west_glendive": (47.11085, -104.74968),
-    "west_yellowstone": (44.66215, -111.10411),
-    "whitefish": (48.41108, -114.33763),
-    "wibaux": (46.98501, -104.18827),
-    "winnett": (47.00276, -108.35207),
-    "wolf_point": (48.09057, -105.64056),
-    "amidon": (46.48223, -103.32185),
-    "belfield": (46.88529, -103.19962),
-    "bottineau": (48.82723, -100.4457),
-    "bowbells": (48.80308, -102.246),
-    "bowman": (46.18306, -103.39491),
-    "fort_yates": (46.08694, -100.63013),
-    "hettinger": (46.00139, -102.63682),
-    "kenmare": (48.67475, -102.08266),
-    "killdeer": (47.37196, -102.75408),
-    "mandan": (46.82666, -100.88958),
-    "mcclusky": (47.48583, -100.44318),
-    "medora": (46.9139, -103.52435),
-    "mohall": (48.76336, -101.51322),
-    "mott": (46.3725, -102.32711),
-    "new_town": (47.98085, -102.49018),
-    "parshall": (47.95335, -102.13489),
-    "surrey": (48.2364, -101.13349),
-    "tioga": (48.39724, -102.93824),
-    "towner": (48.34583, -100.40541),
-    "velva": (48.05612, -100.92932),
-    "watford_city": (47.80224, -103.28325),
-    "benkelman": (40.04916, -101.53294),
-    "chadron": (42.82942, -102.99991),
-    "chappell": (41.09277, -102.47074),
-    "gering": (41.8258, -103.6605),
-    "gothenburg": (40.92945, -100.16068),
-    "hayes_center": (40.51084, -101.0196),
-    "mccook": (40.20195, -100.62571),
-    "mullen": (42.04278, -101.04266),
-    "north_platte": (41.12389, -100.76542),
-    "ogallala": (41.12805, -101.71962),
-    "scottsbluff": (41.86663, -103.66717),
-    "stockville": (40.53279, -100.38348),
-    "sutherland": (41.15694, -101.12627),
-    "thedford": (41.97833, -100.57625),
-    "valentine": (42.87278, -100.55097),
-    "battle_mountain": (40.64213, -116.93427),
-    "carlin": (40.71381, -116.10397),
-    "elko": (40.83242, -115.76312),
-    "jackpot": (41.98324, -114.67476),
-    "lovelock": (40.17935, -118.47348),
-    "spring_creek": (40.72659, -115.5859),
-    "west_wendover": (40.7391, -114.07335),
-    "winnemucca": (40.97296, -117.73568),
-    "aloha": (45.49428, -122.86705),
-    "amity": (45.11567, -123.20733),
-    "athena": (45.8118, -118.49053),
-    "aumsville": (44.84095, -122.87092),
-    "baker_city": (44.77487, -117.83438),
-    "bandon": (43.119, -124.40845),
-    "banks": (45.61872, -123.11428),
-    "barview": (43.35428, -124.31317),
-    "bend": (44.05817, -121.31531),
-    "cannon_beach": (45.89177, -123.96153),
-    "canyon_city": (44.3896, -118.95023),
-    "canyonville": (42.92734, -123.28117),
-    "cascade_locks": (45.66984, -121.89064),
-    "cave_junction": (42.16289, -123.64812),
-    "cedar_hills": (45.50484, -122.79843),
-    "cedar_mill": (45.52484, -122.81093),
-    "central_point": (42.37596, -122.91643),
-    "chenoweth": (45.62762, -121.24341),
-    "clackamas": (45.40762, -122.57037),
-    "clatskanie": (46.10122, -123.20679),
-    "coburg": (44.13707, -123.06648),
-    "coos_bay": (43.3665, -124.21789),
-    "coquille": (43.17705, -124.18761),
-    "corvallis": (44.56457, -123.26204),
-    "creswell": (43.9179, -123.02453),
-    "culp_creek": (43.70346, -122.84757),
-    "depoe_bay": (44.80845, -124.06317),
-    "deschutes_river_woods": (43.99151, -121.35836),
-    "donald": (45.22234, -122.83926),
-    "drain": (43.65873, -123.3187),
-    "dunes_city": (43.88318, -124.11512),
-    "eagle_point": (42.47263, -122.80282),
-    "estacada": (45.28957, -122.3337),
-    "eugene": (44.05207, -123.08675),
-    "forest_grove": (45.51984, -123.11066),
-    "fossil": (44.99819, -120.21614),
-    "gearhart": (46.02427, -123.91125),
-    "gervais": (45.10818, -122.8976),
-    "glide": (43.30151, -123.10118),
-    "gold_hill": (42.43179, -123.0506),
-    "grand_ronde": (45.06011, -123.60928),
-    "grants_pass": (42.43933, -123.33067),
-    "gresham": (45.49818, -122.43148),
-    "happy_valley": (45.44679, -122.53037),
-    "harbor": (42.05317, -124.26759),
-    "heppner": (45.35318, -119.5578),
-    "hermiston": (45.84041, -119.28946),
-    "hines": (43.56404, -119.08105),
-    "hood_river": (45.7054, -121.52146),
-    "irrigon": (45.89569, -119.49141),
-    "island_city": (45.34097, -118.04466),
-    "jennings_lodge": (45.39123, -122.61259),
-    "john_day": (44.41599, -118.95301),
-    "joseph": (45.35432, -117.22961),
-    "keizer": (44.99012, -123.02621),
-    "klamath_falls": (42.22487, -121.78167),
-    "la_grande": (45.32458, -118.08772),
-    "la_pine": (43.6704, -121.50364),
-    "lake_oswego": (45.42067, -122.67065),
-    "lents": (45.47984, -122.56731),
-    "lincoln_beach": (44.85039, -124.04678),
-    "lincoln_city": (44.95816, -124.01789),
-    "madras": (44.63345, -121.12949),
-    "merlin": (42.51734, -123.41979),
-    "metzger": (45.44651, -122.75899),
-    "mill_city": (44.75401, -122.47814),
-    "milton_freewater": (45.93263, -118.38774),
-    "milwaukie": (45.44623, -122.63926),
-    "molalla": (45.14734, -122.57703),
-    "moro": (45.48401, -120.73117),
-    "mount_angel": (45.0679, -122.80009),
-    "mount_hood_village": (45.3554, -121.98064),
-    "mulino": (45.22151, -122.58203),
-    "myrtle_creek": (43.02012, -123.29312),
-    "myrtle_point": (43.06483, -124.13899),
-    "newberg": (45.30012, -122.97316),
-    "north_plains": (45.59706, -122.99344),
-    "north_portland": (45.61039, -122.70343),
-    "nyssa": (43.87683, -116.99488),
-    "oakridge": (43.74651, -122.46172),
-    "odell": (45.62706, -121.54313),
-    "oregon_city": (45.35734, -122.60676),
-    "pacific_city": (45.20233, -123.96289),
-    "philomath": (44.54012, -123.3676),
-    "pilot_rock": (45.48318, -118.82998),
-    "port_orford": (42.74566, -124.49733),
-    "prineville": (44.29985, -120.83447),
-    "rainier": (46.089, -122.93594),
-    "raleigh_hills": (45.48067, -122.76204),
-    "redmond": (44.27262, -121.17392),
-    "reedsport": (43.70234, -124.09678),
-    "riddle": (42.95095, -123.36423),
-    "rockcreek": (45.55012, -122.87705),
-    "rockaway_beach": (45.61344, -123.94291),
-    "rogue_river": (42.43595, -123.172),
-    "rose_lodge": (45.01039, -123.88039),
-    "roseburg": (43.2165, -123.34174),
-    "saint_helens": (45.864, -122.80649),
-    "scappoose": (45.75428, -122.8776),
-    "shady_cove": (42.61068, -122.81254),
-    "siletz": (44.72178, -123.92011),
-    "sisters": (44.29095, -121.54921),
-    "stayton": (44.80068, -122.79453),
-    "sublimity": (44.82957, -122.79453),
-    "sunriver": (43.88401, -121.43864),
-    "sutherlin": (43.39012, -123.31258),
-    "sweet_home": (44.39762, -122.7362),
-    "talent": (42.24568, -122.78865),
-    "tangent": (44.54123, -123.10815),
-    "terrebonne": (44.3529, -121.17781),
-    "the_dalles": (45.59456, -121.17868),
-    "tigard": (45.43123, -122.77149),
-    "tillamook": (45.4564, -123.84553),
-    "tri_city": (42.98456, -123.31173),
-    "troutdale": (45.53929, -122.38731),
-    "tualatin": (45.38401, -122.76399),
-    "vale": (43.98211, -117.23823),
-    "veneta": (44.04873, -123.35093),
-    "vernonia": (45.85872, -123.19289),
-    "waldport": (44.42679, -124.06873),
-    "west_linn": (45.36568, -122.61231),
-    "west_slope": (45.49873, -122.76454),
-    "willamina": (45.07873, -123.48594),
-    "wood_village": (45.53429, -122.4187),
-    "yamhill": (45.3415, -123.18733),
-    "yoncalla": (43.59845, -123.28342),
-    "belle_fourche": (44.67137, -103.85215),
-    "bison": (45.52026, -102.46127),
-    "box_elder": (44.11249, -103.06823),
-    "colonial_pine_hills": (44.00777, -103.31546),
-    "custer": (43.76665, -103.59881),
-    "deadwood": (44.37665, -103.72964),
-    "dupree": (45.04748, -101.60099),
-    "eagle_butte": (45.00248, -101.23349),
-    "fort_pierre": (44.35359, -100.37374),
-    "kadoka": (43.83388, -101.50987),
-    "lead": (44.35221, -103.7652),
-    "lemmon": (45.94083, -102.15932),
-    "mobridge": (45.53722, -100.42791),
-    "murdo": (43.88832, -100.71291),
-    "north_eagle_butte": (45.00415, -101.23376),
-    "north_spearfish": (44.50665, -103.89215),
-    "oglala": (43.18859, -102.73962),
-    "onida": (44.70804, -100.05984),
-    "philip": (44.03943, -101.66514),
-    "pierre": (44.36832, -100.35097),
-    "porcupine": (43.23971, -102.33099),
-    "rapid_valley": (44.06249, -103.14629),
-    "selby": (45.50638, -100.03207),
-    "spearfish": (44.49082, -103.85937),
-    "timber_lake": (45.42915, -101.07403),
-    "white_river": (43.56805, -100.74542),
-    "ballard": (40.2894, -109.9432),
-    "bluffdale": (40.48967, -111.93882),
-    "bountiful": (40.88939, -111.88077),
-    "brigham_city": (41.51021, -112.0155),
-    "canyon_rim": (40.70661, -111.82188),
-    "coalville": (40.91773, -111.39936),
-    "cottonwood_heights": (40.61967, -111.81021),
-    "daniel": (40.47079, -111.41463),
-    "draper": (40.52467, -111.86382),
-    "duchesne": (40.16329, -110.40293),
-    "east_millcreek": (40.69995, -111.81049),
-    "elk_ridge": (40.01134, -111.67687),
-    "erda": (40.61272, -112.30439),
-    "farr_west": (41.29717, -112.02772),
-    "francis": (40.61051, -111.28074),
-    "fruit_heights": (41.03217, -111.90216),
-    "heber_city": (40.5069, -111.41324),
-    "herriman": (40.51411, -112.03299),
-    "holladay": (40.66884, -111.82466),
-    "honeyville": (41.63854, -112.07939),
-    "hooper": (41.16383, -112.12244),
-    "hyrum": (41.6341, -111.85217),
-    "kamas": (40.64301, -111.28074),
-    "kaysville": (41.03522, -111.93855),
-    "kearns": (40.65995, -111.99633),
-    "layton": (41.06022, -111.97105),
-    "lehi": (40.39162, -111.85077),
-    "lindon": (40.34329, -111.72076),
-    "maeser": (40.47718, -109.58681),
-    "magna": (40.70911, -112.10161),
-    "marriott_slaterville": (41.25161, -112.0255),
-    "midvale": (40.61106, -111.89994),
-    "millcreek": (40.68689, -111.87549),
-    "mount_olympus": (40.6855, -111.78854),
-    "mountain_green": (41.143, -111.7916),
-    "nibley": (41.67438, -111.833),
-    "north_logan": (41.76937, -111.80467),
-    "north_ogden": (41.30716, -111.96022),
-    "north_salt_lake": (40.84856, -111.90688),
-    "oquirrh": (40.6305, -112.03383),
-    "orem": (40.2969, -111.69465),
-    "provo": (40.23384, -111.65853),
-    "river_heights": (41.7216, -111.82133),
-    "roy": (41.16161, -112.02633),
-    "salt_lake_city": (40.76078, -111.89105),
-    "sandy_hills": (40.58106, -111.85077),
-    "snyderville": (40.69439, -111.54381),
-    "south_jordan_heights": (40.56384, -111.94938),
-    "south_jordan": (40.56217, -111.92966),
-    "south_ogden": (41.19189, -111.97133),
-    "south_salt_lake": (40.71884, -111.88827),
-    "south_weber": (41.13244, -111.93022),
-    "south_willard": (41.36327, -112.03578),
-    "spanish_fork": (40.11496, -111.65492),
-    "stansbury_park": (40.63772, -112.29606),
-    "summit_park": (40.74578, -111.61159),
-    "tooele": (40.53078, -112.29828),
-    "tremonton": (41.71187, -112.16551),
-    "uintah": (41.14411, -111.92327),
-    "vernal": (40.45552, -109.52875),
-    "washington_terrace": (41.17272, -111.97661),
-    "wendover": (40.73715, -114.03751),
-    "west_bountiful": (40.89383, -111.90188),
-    "west_jordan": (40.60967, -111.9391),
-    "west_mountain": (40.06079, -111.78827),
-    "west_valley_city": (40.69161, -112.00105),
-    "wolf_creek": (41.33327, -111.82716),
-    "woods_cross": (40.87161, -111.89216),
-    "ahtanum": (46.55957, -120.62201),
-    "airway_heights": (47.64461, -117.59327),
-    "alderton": (47.16955, -122.22928),
-    "alderwood_manor": (47.82204, -122.28207),
-    "allyn": (47.38565, -122.82764),
-    "ames_lake": (47.63288, -121.96623),
-    "anacortes": (48.5126, -122.61267),
-    "artondale": (47.29954, -122.62069),
-    "asotin": (46.33933, -117.04821),
-    "basin_city": (46.59403, -119.15223),
-    "belfair": (47.45065, -122.82737),
-    "benton_city": (46.26319, -119.4878),
-    "birch_bay": (48.91789, -122.74462),
-    "bonney_lake": (47.17705, -122.18651),
-    "bothell": (47.76232, -122.2054),
-    "boulevard_park": (47.48927, -122.31512),
-    "bremerton": (47.56732, -122.63264),
-    "brier": (47.78454, -122.27429),
-    "browns_point": (47.30038, -122.44124),
-    "brush_prairie": (45.73289, -122.54649),
-    "buckley": (47.16316, -122.02678),
-    "burien": (47.47038, -122.34679),
-    "camano": (48.17399, -122.52821),
-    "camas": (45.58706, -122.39954),
-    "canterwood": (47.3751, -122.5893),
-    "carnation": (47.64788, -121.91401),
-    "cascade_valley": (47.13459, -119.32808),
-    "cashmere": (47.52235, -120.4698),
-    "cathcart": (47.84788, -122.09929),
-    "cathlamet": (46.20317, -123.38318),
-    "central_park": (46.97343, -123.69239),
-    "chehalis": (46.66205, -122.96402),
-    "chelan": (47.84097, -120.01646),
-    "chewelah": (48.27629, -117.71552),
-    "cle_elum": (47.1954, -120.93925),
-    "clearview": (47.83371, -122.12596),
-    "clyde_hill": (47.63177, -122.2179),
-    "college_place": (46.0493, -118.3883),
-    "colville": (48.54657, -117.90554),
-    "connell": (46.66347, -118.86111),
-    "cosmopolis": (46.95537, -123.77378),
-    "cottage_lake": (47.74427, -122.07735),
-    "coulee_dam": (47.96543, -118.97613),
-    "country_homes": (47.7485, -117.40439),
-    "coupeville": (48.21982, -122.68628),
-    "dallesport": (45.61734, -121.17952),
-    "darrington": (48.25539, -121.60151),
-    "desert_aire": (46.6793, -119.91727),
-    "dishman": (47.66007, -117.27596),
-    "dollar_corner": (45.78012, -122.6001),
-    "duvall": (47.74232, -121.98568),
-    "east_port_orchard": (47.52343, -122.6243),
-    "east_renton_highlands": (47.48482, -122.11234),
-    "east_wenatchee": (47.41568, -120.29313),
-    "east_wenatchee_bench": (47.42568, -120.28118),
-    "eastgate": (47.57266, -122.14578),
-    "edmonds": (47.81065, -122.37736),
-    "electric_city": (47.93237, -119.03808),
-    "elk_plain": (47.05316, -122.39762),
-    "ellensburg": (46.99651, -120.54785),
-    "elma": (47.00343, -123.40877),
-    "enetai": (47.58482, -122.59875),
-    "entiat": (47.67596, -120.20841),
-    "enumclaw": (47.20427, -121.9915),
-    "esperance": (47.78899, -122.35541),
-    "everson": (48.92012, -122.34266),
-    "fairwood": (47.44843, -122.15734),
-    "fall_city": (47.56732, -121.88873),
-    "felida": (45.70956, -122.70732),
-    "federal_way": (47.32232, -122.31262),
-    "fern_prairie": (45.63651, -122.3987),
-    "fife": (47.23927, -122.35707),
-    "fife_heights": (47.25899, -122.34568),
-    "fircrest": (47.23954, -122.51596),
-    "five_corners": (45.68456, -122.5751),
-    "fobes_hill": (47.94899, -122.11985),
-    "fords_prairie": (46.7351, -122.98902),
-    "forks": (47.95036, -124.38549),
-    "fox_island": (47.25149, -122.62902),
-    "frederickson": (47.09621, -122.35873),
-    "friday_harbor": (48.53427, -123.01712),
-    "gig_harbor": (47.32926, -122.58013),
-    "gleed": (46.65818, -120.6134),
-    "gold_bar": (47.85677, -121.69706),
-    "goldendale": (45.82068, -120.82173),
-    "grand_coulee": (47.94154, -119.00335),
-    "grand_mound": (46.78788, -123.01125),
-    "hansville": (47.9187, -122.55431),
-    "hazel_dell": (45.67151, -122.66288),
-    "hockinson": (45.73789, -122.48704),
-    "home": (47.27482, -122.76375),
-    "hoquiam": (46.98092, -123.88933),
-    "issaquah": (47.5301, -122.03262),
-    "kalama": (46.00845, -122.84455),
-    "kelso": (46.14678, -122.90844),
-    "kennewick": (46.21125, -119.13723),
-    "kettle_falls": (48.61074, -118.05582),
-    "key_center": (47.34065, -122.74541),
-    "kingsgate": (47.72704, -122.17957),
-    "kittitas": (46.98318, -120.41701),
-    "klahanie": (47.43121, -122.43652),
-    "lacey": (47.03426, -122.82319),
-    "lake_forest_park": (47.75676, -122.28096),
-    "lake_stevens": (48.0151, -122.06374),
-    "liberty_lake": (47.67591, -117.11821),
-    "lochsloy": (48.05149, -122.03208),
-    "lofall": (47.81204, -122.65821),
-    "longbranch": (47.20898, -122.7568),
-    "longview_heights": (46.18039, -122.95706),
-    "lynden": (48.9465, -122.45211),
-    "lynnwood": (47.82093, -122.31513),
-    "mabton": (46.21485, -119.99671),
-    "maltby": (47.8051, -122.11318),
-    "maple_valley": (47.39272, -122.04641),
-    "martha_lake": (47.85093, -122.2393),
-    "mattawa": (46.73791, -119.90282),
-    "mccleary": (47.05315, -123.26543),
-    "mcmillin": (47.13982, -122.23651),
-    "meadow_glade": (45.75845, -122.56038),
-    "meadowdale": (47.85287, -122.33347),
-    "medical_lake": (47.57294, -117.68216),
-    "mercer_island": (47.57065, -122.22207),
-    "mill_creek": (47.8601, -122.2043),
-    "mill_plain": (45.6429, -122.49398),
-    "millwood": (47.68128, -117.28271),
-    "minnehaha": (45.65901, -122.64871),
-    "mirrormont": (47.46232, -121.99567),
-    "montesano": (46.98121, -123.60266),
-    "moses_lake": (47.13014, -119.27808),
-    "mount_vista": (45.73428, -122.63288),
-    "mountlake_terrace": (47.78815, -122.30874),
-    "mukilteo": (47.94454, -122.30458),
-    "napavine": (46.57455, -122.90818),
-    "navy_yard_city": (47.55343, -122.66458),
-    "nooksack": (48.92762, -122.32155),
-    "normandy_park": (47.43621, -122.34068),
-    "north_creek": (47.81954, -122.17624),
-    "north_puyallup": (47.20677, -122.28234),
-    "north_yelm": (46.96315, -122.6029),
-    "ocean_park": (46.49177, -124.05208),
-    "ocean_shores": (46.9737, -124.15629),
-    "okanogan": (48.36126, -119.58339),
-    "olympia": (47.03787, -122.9007),
-    "omak": (48.41099, -119.52755),
-    "opportunity": (47.64995, -117.23991),
-    "orchards": (45.66651, -122.56093),
-    "orting": (47.09788, -122.20428),
-    "othello": (46.82597, -119.17529),
-    "pasco": (46.23958, -119.10057),
-    "point_roberts": (48.98538, -123.07797),
-    "port_angeles": (48.11815, -123.43074),
-    "port_ludlow": (47.92537, -122.68349),
-    "port_orchard": (47.54037, -122.63625),
-    "port_townsend": (48.11704, -122.76045),
-    "poulsbo": (47.73593, -122.64654),
-    "prairie_ridge": (47.1376, -122.14873),
-    "prosser": (46.2068, -119.76892),
-    "pullman": (46.73127, -117.17962),
-    "puyallup": (47.18538, -122.2929),
-    "ravensdale": (47.35232, -121.98373),
-    "renton": (47.48288, -122.21707),
-    "riverbend": (47.46649, -121.75039),
-    "ritzville": (47.12755, -118.37999),
-    "royal_city": (46.90097, -119.63059),
-    "salmon_creek": (45.71067, -122.64899),
-    "sammamish": (47.64177, -122.0804),
-    "seatac": (47.44846, -122.29217),
-    "seabeck": (47.63954, -122.82849),
-    "seattle": (47.60621, -122.33207),
-    "sedro_woolley": (48.50389, -122.23611),
-    "selah": (46.65402, -120.53007),
-    "sequim": (48.07963, -123.10234),
-    "shoreline": (47.75565, -122.34152),
-    "silverdale": (47.64454, -122.69487),
-    "sisco_heights": (48.11538, -122.09708),
-    "smokey_point": (48.15232, -122.18264),
-    "snohomish": (47.91288, -122.09818),
-    "snoqualmie": (47.52871, -121.82539),
-    "soap_lake": (47.38931, -119.49059),
-    "southworth": (47.51204, -122.5018),
-    "spanaway": (47.10399, -122.43457),
-    "spokane": (47.65966, -117.42908),
-    "spokane_valley": (47.67323, -117.23937),
-    "stanwood": (48.24121, -122.37071),
-    "steilacoom": (47.16982, -122.60263),
-    "sudden_valley": (48.72289, -122.34655),
-    "sultan": (47.8626, -121.81651),
-    "sumas": (49.00012, -122.26488),
-    "suquamish": (47.73121, -122.55236),
-    "tacoma": (47.25288, -122.44429),
-    "tanner": (47.47538, -121.74622),
-    "tenino": (46.85677, -122.85291),
-    "tieton": (46.70207, -120.75535),
-    "tonasket": (48.70515, -119.4395),
-    "toppenish": (46.37735, -120.30867),
-    "tracyton": (47.60898, -122.65514),
-    "trentwood": (47.69656, -117.21076),
-    "tukwila": (47.47399, -122.26096),
-    "tulalip": (48.06843, -122.29181),
-    "tulalip_bay": (48.03732, -122.31014),
-    "tumwater": (47.00732, -122.90931),
-    "union_gap": (46.55735, -120.47506),
-    "university_place": (47.23565, -122.5504),
-    "vancouver": (45.63873, -122.66149),
-    "vashon": (47.44732, -122.45985),
-    "veradale": (47.64995, -117.20738),
-    "venersborg": (45.77373, -122.42454),
-    "waitsburg": (46.27042, -118.15329),
-    "walla_walla": (46.06458, -118.34302),
-    "wapato": (46.44763, -120.42034),
-    "warden": (46.96764, -119.03973),
-    "warm_beach": (48.17065, -122.3646),
-    "washougal": (45.58262, -122.35342),
-    "wauna": (47.37899, -122.64263),
-    "wenatchee": (47.42346, -120.31035),
-    "west_lake_sammamish": (47.5776, -122.10123),
-    "west_lake_stevens": (47.99343, -122.1018),
-    "west_longview": (46.16789, -122.999),
-    "west_pasco": (46.24541, -119.18279),
-    "west_richland": (46.3043, -119.36141),
-    "west_valley": (46.59207, -120.60507),
-    "west_wenatchee": (47.44374, -120.35341),
-    "white_center": (47.51732, -122.35485),
-    "white_salmon": (45.72762, -121.48646),
-    "winlock": (46.49122, -122.9379),
-    "bainbridge_island": (47.62621, -122.52124),
-    "wollochet": (47.26871, -122.58402),
-    "woodinville": (47.75427, -122.16346),
-    "woods_creek": (47.87871, -121.89846),
-    "yacolt": (45.86595, -122.40621),
-    "yakima": (46.60207, -120.5059),
-    "yarrow_point": (47.64621, -122.21735),
-    "yelm": (46.94204, -122.60596),
-    "zillah": (46.40207, -120.262),
-    "bar_nunn": (42.91358, -106.34336),
-    "basin": (44.37996, -108.03899),
-    "casper": (42.86663, -106.31308),
-    "cody": (44.52634, -109.05653),
-    "ethete": (43.02496, -108.77262),
-    "fort_washakie": (43.00635, -108.88235),
-    "gillette": (44.29109, -105.50222),
-    "glenrock": (42.86136, -105.87223),
-    "green_river": (41.52858, -109.46625),
-    "greybull": (44.48912, -108.05621),
-    "guernsey": (42.26969, -104.74163),
-    "hoback": (43.28187, -110.78381),
-    "kemmerer": (41.79245, -110.53767),
-    "lander": (42.83301, -108.73067),
-    "laramie": (41.31137, -105.5911),
-    "lusk": (42.76247, -104.45217),
-    "marbleton": (42.55355, -110.10932),
-    "mills": (42.84052, -106.36586),
-    "moorcroft": (44.26331, -104.95025),
-    "moose_wilson_road": (43.52521, -110.84466),
-    "north_rock_springs": (41.64358, -109.26568),
-    "pine_bluffs": (41.18193, -104.06912),
-    "pinedale": (42.86661, -109.86099),
-    "rafter_j_ranch": (43.42604, -110.79909),
-    "ranchettes": (41.21859, -104.79025),
-    "rawlins": (41.79107, -107.23866),
-    "rock_springs": (41.58746, -109.2029),
-    "south_greeley": (41.09693, -104.80636),
-    "south_park": (43.42215, -110.79326),
-    "sundance": (44.40637, -104.37578),
-    "thermopolis": (43.64607, -108.21204),
-    "worland": (44.0169, -107.95537),
-    "vineyard": (40.29704, -111.7467),
-    "fruitdale": (42.42206, -123.30811),
-    "gold_beach": (42.40733, -124.42177),
-    "american_fork": (40.3769, -111.79576),
-    "palouse": (46.91017, -117.07573),
-    "haines": (59.23595, -135.44533),
-    "kahalu‘u": (21.45759, -157.84431),
-    "kahuku": (21.68048, -157.95237),
-    "kahului": (20.88953, -156.47432),
-    "kailua": (21.40241, -157.74054),
-    "kailua_kona": (19.64016, -155.99912),
-    "kalāheo": (21.92416, -159.52686),
-    "kalaoa": (19.72861, -155.98167),
-    "kaneohe": (21.39994, -157.79895),
-    "kapa‘a": (22.07521, -159.31895),
-    "kapaau": (20.23389, -155.80194),
-    "kaunakakai": (21.09363, -157.02613),
-    "kea‘au": (19.62265, -155.03744),
-    "kealakekua": (19.52083, -155.9225),
-    "kekaha": (21.96686, -159.71186),
-    "kēōkea": (20.70711, -156.35446),
-    "kīhei": (20.76462, -156.44578),
-    "kīlauea": (22.21208, -159.41342),
-    "koloa": (21.9069, -159.46994),
-    "kualapu‘u": (21.15306, -157.03677),
-    "kurtistown": (19.60361, -155.05722),
-    "lahaina": (20.87429, -156.67663),
-    "lā‘ie": (21.64547, -157.9225),
-    "lanai_city": (20.82757, -156.92399),
-    "lawai": (21.92159, -159.50376),
-    "leilani_estates": (19.46972, -154.91778),
-    "lihue": (21.98121, -159.3721),
-    "mā‘ili": (21.41629, -158.17531),
-    "mākaha": (21.46627, -158.21037),
-    "mākaha_valley": (21.47583, -158.19918),
-    "makakilo_city": (21.34694, -158.08583),
-    "makawao": (20.85694, -156.31306),
-    "maunawili": (21.37278, -157.77056),
-    "mililani_town": (21.45, -158.00111),
-    "mokulēia": (21.57967, -158.15313),
-    "nānākuli": (21.39362, -158.15429),
-    "nanawale_estates": (19.50611, -154.91194),
-    "‘ōma‘o": (21.92581, -159.48818),
-    "orchidlands_estates": (19.56084, -155.01527),
-    "pāhala": (19.20297, -155.4786),
-    "paia": (20.90333, -156.36944),
-    "pāpa‘ikou": (19.78718, -155.09326),
-    "pearl_city": (21.39734, -157.97516),
-    "pepeekeo": (19.83361, -155.10722),
-    "puhi": (21.96888, -159.40012),
-    "pukalani": (20.83667, -156.33667),
-    "punalu‘u": (21.57045, -157.87557),
-    "punaluu": (21.57389, -157.87861),
-    "pupukea": (21.65456, -158.06065),
-    "village_park": (21.39806, -158.03028),
-    "volcano": (19.44276, -155.23398),
-    "wahiawā": (21.50279, -158.02464),
-    "waialua": (21.57688, -158.13154),
-    "waianae": (21.43621, -158.1863),
-    "waikapū": (20.85806, -156.50694),
-    "waikoloa": (19.93942, -155.78931),
-    "wailea": (20.68973, -156.4419),
-    "wailua": (22.05271, -159.33781),
-    "wailuku": (20.89133, -156.50604),
-    "waimalu": (21.40472, -157.94333),
-    "waimanalo": (21.34614, -157.7238),
-    "waimānalo_beach": (21.33407, -157.70003),
-    "waimea": (21.95707, -159.66893),
-    "wainaku": (19.74472, -155.095),
-    "waipahu": (21.38667, -158.00917),
-    "waipio": (21.41823, -157.99906),
-    "waipi‘o_acres": (21.46485, -158.01331),
-    "whitmore_village": (21.51429, -158.02464),
-    "‘ele‘ele": (21.90738, -159.58322),
-    "‘ewa_beach": (21.31556, -158.00722),
-    "‘ewa_gentry": (21.33999, -158.03039),
-    "‘ewa_villages": (21.34127, -158.0397),
-    "fern_acres": (19.51222, -155.08028),
-    "hālawa": (21.37944, -157.92167),
-    "hālawa_heights": (21.37848, -157.91388),
-    "hale‘iwa": (21.59284, -158.10339),
-    "hana": (20.75806, -155.99028),
-    "hanamā‘ulu": (21.99773, -159.35918),
-    "hanapēpē": (21.90733, -159.5944),
-    "hanapēpē_heights": (21.91633, -159.58995),
-    "hau‘ula": (21.6076, -157.90868),
-    "hawaiian_beaches": (19.54306, -154.91583),
-    "hawaiian_acres": (19.53806, -155.05222),
-    "hawaiian_paradise_park": (19.59333, -154.97306),
-    "hawaiian_ocean_view": (19.06861, -155.765),
-    "hāwī": (20.24122, -155.83351),
-    "he‘eia": (21.43054, -157.81611),
-    "hilo": (19.72991, -155.09073),
-    "hōlualoa": (19.61979, -155.94831),
-    "honalo": (19.54639, -155.93194),
-    "honoka‘a": (20.07931, -155.46691),
-    "honolulu": (21.30694, -157.85833),
-    "‘aiea": (21.38222, -157.93361),
-    "‘āhuimanu": (21.44472, -157.83778),
-    "iroquois_point": (21.32776, -157.98301),
-    "ka‘a‘awa": (21.55445, -157.85103),
-    "kā‘anapali": (20.92881, -156.69422),
-    "kaanapali_landing": (20.9309, -156.68778),
-    "ainaloa": (19.52694, -154.99306),
-    "anahola": (22.14226, -159.31388),
-    "captain_cook": (19.49694, -155.92167),
-    "chevak": (61.52778, -165.58639),
-    "cohoe": (60.36861, -151.30639),
-    "college": (64.85694, -147.80278),
-    "diamond_ridge": (59.67611, -151.5575),
-    "dillingham": (59.03972, -158.4575),
-    "dutch_harbor": (53.8898, -166.5422),
-    "ester": (64.84722, -148.01444),
-    "fairbanks": (64.83778, -147.71639),
-    "fritz_creek": (59.73611, -151.29528),
-    "girdwood": (60.9425, -149.16639),
-    "healy": (63.85694, -148.96611),
-    "hooper_bay": (61.53111, -166.09667),
-    "kalifornsky": (60.41833, -151.29),
-    "kenai": (60.55444, -151.25833),
-    "king_cove": (55.06087, -162.31853),
-    "kodiak": (57.79, -152.40722),
-    "kotzebue": (66.89846, -162.59809),
-    "lazy_mountain": (61.62611, -148.94556),
-    "meadow_lakes": (61.62472, -149.60111),
-    "nikiski": (60.69028, -151.28889),
-    "nome": (64.50111, -165.40639),
-    "north_pole": (64.75111, -147.34944),
-    "prudhoe_bay": (70.25528, -148.33722),
-    "ridgeway": (60.53194, -151.08528),
-    "sand_point": (55.33655, -160.4988),
-    "soldotna": (60.48778, -151.05833),
-    "tanaina": (61.62694, -149.42806),
-    "tok": (63.33667, -142.98556),
-    "unalaska": (53.87361, -166.53667),
-    "valdez": (61.13083, -146.34833),
-    "wasilla": (61.5809, -149.4415),
-    "willow": (61.74722, -150.0375),
-    "akutan": (54.1335, -165.77686),
-    "anchor_point": (59.77667, -151.83139),
-    "badger": (64.8, -147.53333),
-    "barrow": (71.29058, -156.78872),
-    "johns_creek": (34.02893, -84.19858),
-    "grant_valkaria": (27.9398, -80.57104),
-    "helena_west_helena": (34.5291, -90.59),
-    "summerset": (44.18998, -103.34384),
-    "cutler_bay": (25.5783, -80.3377),
-    "morningside_heights": (40.81, -73.9625),
-    "east_harlem": (40.79472, -73.9425),
-    "alafaya": (28.5641, -81.2114),
-    "new_fairview": (33.09917, -97.44639),
-    "cobb_island": (38.25846, -76.84386),
-    "st_johnsbury": (44.42526, -72.01512),
-    "briarwood": (40.70935, -73.81529),
-    "stevenson_ranch": (34.39048, -118.57372),
-    "holly_lake_ranch": (32.71336, -95.19756),
-    "village_of_campton_hills": (41.9366, -88.3975),
-    "kapolei": (21.33555, -158.0582),
-    "elko_new_market": (44.56472, -93.32694),
-    "south_blooming_grove": (41.37337, -74.17843),
-    "dewey_humboldt": (34.53, -112.24222),
-    "city_of_milford_(balance)": (41.22374, -73.06164),
-    "peppermill_village": (38.89472, -76.88654),
-    "boulevard_gardens": (26.12326, -80.17997),
-    "roosevelt_gardens": (26.14087, -80.18027),
-    "butte_silver_bow_(balance)": (45.90194, -112.65708),
-    "city_of_sammamish": (47.60444, -122.03768),
-    "las_maravillas": (34.73815, -106.66854),
-    "peaceful_valley": (48.93815, -122.14733),
-    "rancho_tehama_reserve": (40.01569, -122.40072),
-    "rio_communities": (34.64959, -106.73403),
-    "silver_firs": (47.86602, -122.1551),
-    "verde_village": (34.7105, -112.01152),
-    "chattahoochee_hills": (33.55063, -84.76049),
-    "gramercy_park": (40.7375, -73.98611),
-    "desert_edge": (33.92417, -116.44139),
-    "fox_chase": (40.39557, -75.96216),
-    "saint_augustine_south": (29.84249, -81.31448),
-    "captains_cove": (37.98996, -75.42272),
-    "weston_lakes": (29.68324, -95.93571),
-    "north_castle": (41.14, -73.68389),
-    "saddle_brooke": (32.53472, -110.87361),
-    "kew_gardens_hills": (40.73002, -73.8234),
-    "conning_towers_nautilus_park": (41.38548, -72.06877),
-    "deep_river_center": (41.38221, -72.43862),
-    "essex_village": (41.35544, -72.39101),
-    "guilford_center": (41.28156, -72.67619),
-    "madison_center": (41.27925, -72.60048),
-    "new_hartford_center": (41.87996, -72.9753),
-    "northwest_harwinton": (41.77685, -73.07922),
-    "old_saybrook_center": (41.2915, -72.36528),
-    "oxoboxo_river": (41.44391, -72.12502),
-    "plainfield_village": (41.67686, -71.92489),
-    "simsbury_center": (41.88088, -72.81116),
-    "wallingford_center": (41.44987, -72.81892),
-    "westbrook_center": (41.27997, -72.44254),
-    "woodbury_center": (41.54453, -73.20476),
-    "acushnet_center": (41.68508, -70.90642),
-    "green_harbor_cedar_crest": (42.07495, -70.65843),
-    "harwich_center": (41.69235, -70.06938),
-    "tilton_northfield": (43.443, -71.59364),
-    "newport_east": (41.51579, -71.28752),
-    "wakefield_peacedale": (41.44606, -71.5004),
-    "mansfield_center": (42.02262, -71.21808),
-    "marion_center": (41.70424, -70.76286),
-    "mattapoisett_center": (41.66595, -70.8072),
-    "middleborough_center": (41.8946, -70.92618),
-    "millis_clicquot": (42.1648, -71.35442),
-    "monson_center": (42.09898, -72.30481),
-    "north_attleborough_center": (41.97263, -71.32474),
-    "northwest_harwich": (41.69029, -70.1025),
-    "norton_center": (41.97254, -71.18535),
-    "ocean_bluff_brant_rock": (42.10234, -70.65736),
-    "bethlehem_village": (41.6401, -73.20308),
-    "branford_center": (41.27738, -72.81511),
-    "central_waterford": (41.34504, -72.12948),
-    "cheshire_village": (41.5026, -72.89952),
-    "chester_center": (41.40132, -72.4527),
-    "fairview_ferndale": (40.78037, -76.57528),
-    "fort_belvoir": (38.7119, -77.14589),
-    "fort_drum": (44.05843, -75.76189),
-    "aberdeen_proving_ground": (39.46686, -76.13066),
-    "andrews_afb": (38.80531, -76.8746),
-    "ashton_sandy_spring": (39.14976, -77.00504),
-    "beaverdam_lake_salisbury_mills": (41.44162, -74.11629),
-    "bel_air_north": (39.55429, -76.37309),
-    "bel_air_south": (39.50506, -76.31977),
-    "brittany_farms_highlands": (40.26901, -75.21401),
-    "carmel_hamlet": (41.41485, -73.68524),
-    "carnot_moon": (40.51856, -80.21736),
-    "cecil_bishop": (40.31819, -80.19331),
-    "coeymans": (42.47491, -73.79562),
-    "conneaut_lakeshore": (41.62711, -80.31008),
-    "cortland_west": (42.59431, -76.22587),
-    "dover_base_housing": (39.11763, -75.48393),
-    "east_hampton_north": (40.97276, -72.18911),
-    "mcguire_afb": (40.03977, -74.58174),
-    "mercerville_hamilton_square": (40.23126, -74.67223),
-    "moorestown_lenola": (39.96591, -74.96441),
-    "mount_gay_shamrock": (37.83857, -82.0297),
-    "naval_academy": (38.98568, -76.48774),
-    "new_castle_northwest": (41.02208, -80.35682),
-    "north_ballston_spa": (43.01969, -73.85109),
-    "northeast_ithaca": (42.47032, -76.46228),
-    "northwest_harborcreek": (42.14944, -79.99463),
-    "northwest_ithaca": (42.47059, -76.54145),
-    "oxon_hill_glassmanor": (38.79615, -76.97499),
-    "paramount_long_meadow": (39.68042, -77.6929),
-    "plattsburgh_west": (44.68315, -73.50295),
-    "pymatuning_central": (41.58546, -80.4796),
-    "quantico_station": (38.52263, -77.31834),
-    "remsenburg_speonk": (40.82642, -72.69673),
-    "rising_sun_lebanon": (39.09977, -75.50488),
-    "rosendale_village": (41.85038, -74.07379),
-    "leisure_world": (39.1023, -77.06898),
-    "fountainhead_orchard_hills": (39.68636, -77.71901),
-    "gates_north_gates": (43.16547, -77.70066),
-    "glens_falls_north": (43.33506, -73.68251),
-    "greater_upper_marlboro": (38.83142, -76.74827),
-    "greenport_west": (41.10178, -72.37195),
-    "holiday_city_south": (39.95324, -74.23778),
-    "holiday_city_berkeley": (39.9638, -74.27803),
-    "homeacre_lyndora": (40.87206, -79.9206),
-    "horseheads_north": (42.19278, -76.80782),
-    "jamestown_west": (42.08851, -79.2811),
-    "jefferson_valley_yorktown": (41.31797, -73.80066),
-    "lanham_seabrook": (38.96835, -76.85108),
-    "lebanon_south": (40.32804, -76.40644),
-    "leisure_village_west_pine_lake_park": (40.00416, -74.26629),
-    "leith_hatfield": (39.87744, -79.73133),
-    "lutherville_timonium": (39.43997, -76.61099),
-    "lynnwood_pricedale": (40.13071, -79.85135),
-    "saugerties_south": (42.06139, -73.95067),
-    "setauket_east_setauket": (40.93064, -73.10179),
-    "shanor_northvue": (40.91045, -79.91562),
-    "south_park_township": (40.29864, -79.99405),
-    "st_charles": (38.60728, -76.92478),
-    "suitland_silver_hill": (38.84685, -76.92591),
-    "village_green_green_ridge": (39.86363, -75.42548),
-    "weissport_east": (40.83697, -75.68643),
-    "whitesboro_burleigh": (39.04305, -74.86538),
-    "whittingham": (40.32982, -74.44511),
-    "wickerham_manor_fisher": (40.17749, -79.90684),
-    "wilson_conococheague": (39.65351, -77.83157),
-    "woodside_east": (39.06756, -75.53748),
-    "fort_leonard_wood": (37.70573, -92.15717),
-    "fort_riley_north": (39.11081, -96.81392),
-    "grand_forks_air_force_base": (47.95493, -97.38664),
-    "granville_south": (40.05207, -82.54166),
-    "grissom_air_force_base": (40.65753, -86.14755),
-    "k_i_sawyer_air_force_base": (46.34651, -87.38632),
-    "legend_lake": (44.89095, -88.54406),
-    "level_park_oak_park": (42.36418, -85.2665),
-    "manitou_beach_devils_lake": (41.97565, -84.28616),
-    "minot_air_force_base": (48.42087, -101.33914),
-    "montrose_ghent": (41.1538, -81.64378),
-    "offutt_air_force_base": (41.12024, -95.92095),
-    "saginaw_township_north": (43.46004, -84.00674),
-    "scott_air_force_base": (38.5427, -89.85035),
-    "shorewood_tower_hills_harbert": (41.88169, -86.61409),
-    "barnes_lake_millers_lake": (43.17956, -83.3123),
-    "champion_heights": (41.28999, -80.84595),
-    "comstock_northwest": (42.32182, -85.51759),
-    "west_bloomfield_township": (42.56891, -83.38356),
-    "whiteman_air_force_base": (38.73018, -93.55895),
-    "wright_patterson_afb": (39.81113, -84.05731),
-    "dade_city_north": (28.38334, -82.19389),
-    "de_land_southwest": (29.0077, -81.31129),
-    "east_bronson": (29.45928, -82.5904),
-    "east_lake_orient_park": (27.98269, -82.37878),
-    "eglin_air_force_base": (30.45907, -86.55026),
-    "fort_campbell_north": (36.65429, -87.46056),
-    "fort_knox": (37.89113, -85.96363),
-    "fort_pierce_north": (27.47364, -80.3593),
-    "fort_pierce_south": (27.40962, -80.35483),
-    "fort_polk_north": (31.10302, -93.17913),
-    "fort_polk_south": (31.0511, -93.21578),
-    "fort_rucker": (31.34282, -85.71538),
-    "fort_stewart": (31.87217, -81.61001),
-    "greater_northdale": (28.10545, -82.52594),
-    "hutchinson_island_south": (27.29949, -80.22045),
-    "inverness_highlands_north": (28.8642, -82.37688),
-    "inverness_highlands_south": (28.80055, -82.3371),
-    "bellair_meadowbrook_terrace": (30.17881, -81.74341),
-    "candler_mcafee": (33.72672, -84.27246),
-    "cocoa_west": (28.35942, -80.77109),
-    "columbus_air_force_base": (33.63239, -88.45153),
-    "samsula_spruce_creek": (29.04932, -81.06192),
-    "sandalfoot_cove": (26.33863, -80.1869),
-    "selmont_west_selmont": (32.37843, -87.0074),
-    "slater_marietta": (35.03472, -82.49265),
-    "southeast_arcadia": (27.18629, -81.8521),
-    "tyndall_air_force_base": (30.08535, -85.60731),
-    "underwood_petersville": (34.87695, -87.69717),
-    "vero_beach_south": (27.61638, -80.41308),
-    "watts_mills": (34.51641, -81.9858),
-    "west_end_cobb_town": (33.6525, -85.8742),
-    "zephyrhills_north": (28.25172, -82.16557),
-    "zephyrhills_south": (28.21492, -82.18873),
-    "zephyrhills_west": (28.23081, -82.20556),
-    "kendall_west": (25.7065, -80.4388),
-    "kings_bay_base": (30.79836, -81.56589),
-    "lake_mack_forest_hills": (29.00074, -81.42397),
-    "lake_murray_of_richland": (34.12048, -81.2645),
-    "meridian_station": (32.55049, -88.61849),
-    "monarch_mill": (34.7161, -81.585),
-    "nassau_village_ratliff": (30.51111, -81.80925),
-    "new_port_richey_east": (28.26027, -82.69261),
-    "north_weeki_wachee": (28.55014, -82.55888),
-    "palm_river_clair_mel": (27.92386, -82.37939),
-    "redstone_arsenal": (34.68387, -86.64764),
-    "robins_air_force_base": (32.60911, -83.58444),
-    "clarkston_heights_vineland": (46.38742, -117.083),
-    "air_force_academy": (38.99425, -104.86375),
-    "alamosa_east": (37.47735, -105.84217),
-    "antelope_valley_crestview": (44.22488, -105.47409),
-    "aptos_hills_larkin_valley": (36.96064, -121.83404),
-    "arden_arcade": (38.6025, -121.37854),
-    "ault_field": (48.33812, -122.67441),
-    "bangor_trident_base": (47.72274, -122.71446),
-    "beale_air_force_base": (39.10917, -121.35444),
-    "bertsch_oceanview": (41.7525, -124.15875),
-    "village_of_oak_creek_(big_park)": (34.7809, -111.76227),
-    "black_point_green_point": (38.11547, -122.51318),
-    "bonadelle_ranchos_madera_ranchos": (36.98467, -119.87463),
-    "bonner_west_riverside": (46.87669, -113.88678),
-    "bret_harte": (37.60207, -121.00519),
-    "bryn_mawr_skyway": (47.4943, -122.24092),
-    "camp_pendleton_north": (33.31465, -117.31603),
-    "camp_pendleton_south": (33.22844, -117.37929),
-    "cannon_air_force_base": (34.39689, -103.32444),
-    "casa_de_oro_mount_helix": (32.76397, -116.96877),
-    "cascade_chipita_park": (38.94354, -105.00237),
-    "central_heights_midland_city": (33.40372, -110.81541),
-    "challenge_brownsville": (39.46447, -121.26338),
-    "edwards_air_force_base": (34.91637, -117.93535),
-    "el_cerro_mission": (34.76227, -106.6445),
-    "erlands_point_kitsap_lake": (47.59719, -122.70225),
-    "fairchild_air_force_base": (47.61879, -117.64826),
-    "lucas_valley_marinwood": (38.04011, -122.5755),
-    "malmstrom_air_force_base": (47.50549, -111.18302),
-    "maple_heights_lake_desire": (47.44413, -122.09736),
-    "march_air_force_base": (33.89209, -117.2631),
-    "marietta_alderwood": (48.78965, -122.55369),
-    "mcchord_air_force_base": (47.13397, -122.49157),
-    "fetters_hot_springs_agua_caliente": (38.3214, -122.48682),
-    "florence_graham": (33.96772, -118.24438),
-    "fort_bliss": (31.81357, -106.41224),
-    "fort_hood": (31.13489, -97.77561),
-    "joint_base_lewis_mcchord": (47.10787, -122.57694),
-    "fox_farm_college": (41.11203, -104.78546),
-    "garden_home_whitford": (45.464, -122.75891),
-    "gold_canyon": (33.37145, -111.43691),
-    "gunbarrel": (40.06335, -105.17107),
-    "heber_overgaard": (34.41414, -110.56956),
-    "helena_valley_northeast": (46.69882, -111.95207),
-    "helena_valley_northwest": (46.72894, -112.06275),
-    "helena_valley_southeast": (46.61527, -111.92156),
-    "helena_valley_west_central": (46.66291, -112.06044),
-    "helena_west_side": (46.59672, -112.11304),
-    "highlands_baywood_park": (37.52272, -122.34506),
-    "hilmar_irwin": (37.40454, -120.85042),
-    "holloman_air_force_base": (32.84827, -106.09977),
-    "idyllwild_pine_cove": (33.74429, -116.72587),
-    "inglewood_finn_hill": (47.72049, -122.23167),
-    "la_crescenta_montrose": (34.23216, -118.23529),
-    "lackland_air_force_base": (29.38663, -98.61797),
-    "lagunitas_forest_knolls": (38.01793, -122.69124),
-    "lake_marcel_stillwater": (47.69263, -121.91513),
-    "lake_morton_berrydale": (47.33251, -122.10286),
-    "lakeland_north": (47.33343, -122.27695),
-    "lakeland_south": (47.27843, -122.28326),
-    "larkfield_wikiup": (38.51342, -122.75094),
-    "laughlin_air_force_base": (29.35663, -100.78353),
-    "leadville_north": (39.2576, -106.30138),
-    "lemoore_station": (36.26326, -119.90476),
-    "dixon_lane_meadow_creek": (37.38639, -118.41527),
-    "east_hill_meridian": (47.41052, -122.17369),
-    "sierra_vista_southeast": (31.45385, -110.21637),
-    "skyline_ganipa": (35.03279, -107.61396),
-    "smith_valley": (38.78421, -119.34425),
-    "south_wenatchee": (47.39012, -120.28958),
-    "moses_lake_north": (47.19433, -119.31719),
-    "nellis_air_force_base": (36.24607, -115.05721),
-    "new_kingman_butler": (35.26504, -114.03226),
-    "north_lakeport": (39.08831, -122.90538),
-    "oatfield": (45.41418, -122.60007),
-    "ohkay_owingeh": (36.05082, -106.06897),
-    "oroville_east": (39.51126, -121.47519),
-    "otis_orchards_east_farms": (47.70988, -117.07975),
-    "picnic_point_north_lynnwood": (47.86278, -122.29497),
-    "poplar_cotton_center": (36.05635, -119.14919),
-    "port_angeles_east": (48.10667, -123.37172),
-    "port_hadlock_irondale": (48.03273, -122.78529),
-    "roseburg_north": (43.26452, -123.30331),
-    "security_widefield": (38.74728, -104.71439),
-    "tsaile": (36.3033, -109.21566),
-    "union_hill_novelty_hill": (47.67887, -122.02833),
-    "valencia_west": (32.13238, -111.11414),
-    "vandenberg_air_force_base": (34.7483, -120.51817),
-    "view_park_windsor_hills": (33.99551, -118.34835),
-    "walla_walla_east": (46.05184, -118.30403),
-    "west_clarkston_highland": (46.40287, -117.06395),
-    "west_haven_sylvan": (45.51613, -122.76809),
-    "west_modesto": (37.61754, -121.03914),
-    "west_pleasant_view": (39.73256, -105.17852),
-    "west_side_highway": (46.18399, -122.91715),
-    "west_whittier_los_nietos": (33.976, -118.06909),
-    "westhaven_moonstone": (41.04489, -124.10239),
-    "yosemite_valley": (37.74075, -119.57788),
-    "summerlin_south": (36.11708, -115.33001),
-    "sunnyside_tahoe_city": (39.15023, -120.1612),
-    "taft_mosswood": (37.91385, -121.28316),
-    "tamalpais_homestead_valley": (37.87834, -122.53625),
-    "tanglewilde_thompson_place": (47.05116, -122.78081),
-    "haiku_pauwela": (20.92187, -156.30508),
-    "hickam_field": (21.33967, -157.96018),
-    "honaunau_napoopoo": (19.45627, -155.86466),
-    "kahaluu_keauhou": (19.57181, -155.96172),
-    "marine_corps_base_hawaii_mcbh": (21.44336, -157.74981),
-    "makakilo": (21.35237, -158.08655),
-    "napili_honokowai": (20.97533, -156.67826),
-    "schofield_barracks": (21.49837, -158.06515),
-    "royal_kunia": (21.39392, -158.0267),
-    "waihee_waiehu": (20.93022, -156.50458),
-    "wailua_homesteads": (22.07244, -159.37677),
-    "deltana": (63.87217, -145.21773),
-    "eielson_air_force_base": (64.66327, -147.05442),
-    "farm_loop": (61.63891, -149.14215),
-    "fishhook": (61.74402, -149.23613),
-    "knik_fairview": (61.51262, -149.60012),
-    "kodiak_station": (57.76587, -152.60004),
-    "lakes": (61.60713, -149.30861),
-    "salcha": (64.52399, -146.9021),
-    "sutton_alpine": (61.77789, -148.7645),
-    "y": (62.16129, -149.85075),
-    "national_harbor": (38.78264, -77.01506),
-    "san_tan_valley": (33.1911, -111.528),
-    "carlisle_rockledge": (34.11445, -86.12407),
-    "emerald_mountain": (32.44793, -86.09429),
-    "highland_lakes": (33.39838, -86.6513),
-    "farmers_loop": (64.90822, -147.69866),
-    "avenue_b_and_c": (32.71904, -114.66005),
-    "centennial_park": (36.95381, -112.98132),
-    "donovan_estates": (32.70935, -114.67822),
-    "golden_shores": (34.78188, -114.47775),
-    "north_fork": (34.00167, -109.96355),
-    "scenic": (36.79359, -114.01275),
-    "six_shooter_canyon": (33.36678, -110.7746),
-    "acalanes_ridge": (37.90472, -122.07857),
-    "fruitridge_pocket": (38.53265, -121.45581),
-    "monument_hills": (38.66429, -121.87566),
-    "old_fig_garden": (36.79885, -119.80515),
-    "red_corral": (38.41165, -120.60552),
-    "sun_village": (34.55952, -117.95676),
-    "upper_bear_creek": (39.62385, -105.4178),
-    "connerton": (28.31441, -82.47539),
-    "flagler_estates": (29.64553, -81.457),
-    "heritage_pines": (28.42522, -82.62111),
-    "horizon_west": (28.43383, -81.6227),
-    "island_walk": (26.25099, -81.71101),
-    "key_vista": (28.1947, -82.77038),
-    "meadow_oaks": (28.34619, -82.60284),
-    "oakleaf_plantation": (30.17083, -81.83549),
-    "pasadena_hills": (28.28001, -82.22438),
-    "quail_ridge": (28.34905, -82.55532),
-    "verona_walk": (26.08412, -81.67985),
-    "viera_east": (28.26234, -80.71449),
-    "viera_west": (28.24504, -80.7338),
-    "east_honolulu": (21.28906, -157.71734),
-    "ocean_pointe": (21.31066, -158.03638),
-    "the_galena_territory": (42.39343, -90.32582),
-    "smithville_sanders": (39.05969, -86.51077),
-    "mcconnell_afb": (37.63007, -97.25869),
-    "marlboro_village": (38.83054, -76.76965),
-    "queenland": (38.80524, -76.79126),
-    "labarque_creek": (38.41701, -90.67989),
-    "old_jamestown": (38.83494, -90.28511),
-    "east_valley": (38.9434, -119.69923),
-    "topaz_ranch_estates": (38.73565, -119.50079),
-    "east_franklin": (40.4933, -74.4711),
-    "franklin_center": (40.53153, -74.54141),
-    "upper_pohatcong": (40.67747, -75.1558),
-    "vernon_center": (41.18879, -74.50405),
-    "keeler_farm": (32.31607, -107.76023),
-    "west_hammond": (36.68071, -108.04921),
-    "fort_covington_hamlet": (44.97178, -74.50757),
-    "merritt_park": (41.53848, -73.87238),
-    "northchase": (34.30782, -77.87749),
-    "eagleview": (40.05938, -75.68076),
-    "mowbray_mountain": (35.27536, -85.22246),
-    "tellico_village": (35.68321, -84.25518),
-    "las_palmas_ii": (26.20171, -97.7376),
-    "paloma_creek": (33.2253, -96.93742),
-    "paloma_creek_south": (33.21136, -96.93554),
-    "travis_ranch": (32.80356, -96.47347),
-    "silver_summit": (40.74144, -111.48775),
-    "boswell_s_corner": (38.50541, -77.37263),
-    "kings_park_west": (38.81443, -77.29582),
-    "loudoun_valley_estates": (38.98081, -77.5079),
-    "southern_gateway": (38.34507, -77.50352),
-    "bothell_east": (47.80631, -122.18427),
-    "bothell_west": (47.80527, -122.24064),
-    "bunk_foss": (47.96171, -122.09441),
-    "eastmont": (47.8974, -122.18154),
-    "larch_way": (47.8429, -122.25275),
-    "mill_creek_east": (47.83602, -122.18766),
-    "monroe_north": (47.88225, -121.98729),
-    "north_fort_lewis": (47.12131, -122.59452),
-    "prairie_heights": (47.14933, -122.1053),
-    "summit_view": (47.13632, -122.35202),
-    "wilderness_rim": (47.44697, -121.76857),
-    "matheny": (36.17066, -119.35158),
-    "patterson_tract": (36.37952, -119.2956),
-    "teviston": (35.92894, -119.27831),
-    "hidden_spring": (43.72216, -116.25093),
-    "circle_d_kc_estates": (30.161, -97.23473),
-    "rio_vista": (38.16389, -121.69583),
-    "shorewood_forest": (41.46315, -87.14472),
-    "cordry_sweetwater_lakes": (39.30464, -86.11837),
-    "dove_valley": (39.57771, -104.8294),
-    "doe_valley": (37.95665, -86.11653),
-    "enchanted_hills": (35.33676, -106.59296),
-    "oak_cliff_place": (29.92712, -95.62672),
-    "detroit_shoreway": (41.47772, -81.72991),
-    "clark_fulton": (41.46402, -81.70979),
-    "beech_mountain_lakes": (41.04158, -75.93545),
-    "the_hideout": (41.42736, -75.35255),
-    "wallenpaupack_lake_estates": (41.39898, -75.27402),
-    "penn_estates": (41.0375, -75.23956),
-    "sierra_view": (41.01207, -75.459),
-    "the_acreage": (26.79404, -80.26749),
-    "eastvale": (33.96358, -117.56418),
-    "beaver_dam_lake": (41.44743, -74.11463),
-    "contra_costa_centre": (37.92752, -122.05786),
-    "belmont_estates": (38.45271, -78.91979),
-    "siesta_acres": (28.75799, -100.49019),
-    "west_greenwich": (41.637, -71.66004),
-    "warren_township": (40.60822, -74.51803),
-    "castle_pines_north": (39.47174, -104.89482),
-    "fairfield_heights": (39.82861, -86.38224),
-    "chicago_loop": (41.88407, -87.6333),
-    "greater_grand_crossing": (41.76113, -87.61485),
-    "auburn_gresham": (41.74179, -87.65322),
-    "financial_district": (40.70789, -74.00857),
-    "sunset_park": (40.64548, -74.01241),
-    "south_kingstown": (41.44718, -71.52494),
-    "noe_valley": (37.75018, -122.43369),
-    "visitacion_valley": (37.71715, -122.40433),
-    "notre_dame": (41.70019, -86.23793),
-    "western_lake": (32.62338, -97.81155),
-    "star_valley_ranch": (42.97139, -110.95556),
-    "shaw_heights": (39.8525, -105.04306),
-    "northdale": (28.0939, -82.50561),
-    "lake_stickney": (47.87655, -122.26214),
-    "phoenix_lake": (38.00594, -120.30702),
-    "picnic_point": (47.88111, -122.3284),
-    "roma": (26.40526, -99.01581),
-    "tanglewilde": (47.0515, -122.78241),
-    "tiki_island": (29.29709, -94.91709),
-    "devens": (42.5447, -71.61318),
-    "lake_holiday": (41.61292, -88.67209),
-    "prestbury": (41.78329, -88.41764),
-    "lake_camelot": (40.63065, -89.7421),
-    "heritage_lake": (40.54745, -89.32581),
-    "watchtower": (41.63776, -74.26027),
-    "cherry_creek": (39.63455, -104.88286),
-    "holly_hills": (39.66757, -104.91797),
-    "lake_panorama": (41.71105, -94.39059),
-    "lake_lakengren": (39.68843, -84.69347),
-    "quail_creek": (28.7764, -97.08232),
-    "plum_creek": (37.12984, -80.5006),
-    "big_bass_lake": (41.25383, -75.47644),
-    "toftrees": (40.82604, -77.8811),
-    "lake_latonka": (41.29039, -80.18129),
-    "buckhorn": (38.45216, -120.52854),
-    "silver_lakes": (34.74558, -117.34098),
-    "spring_valley_lake": (34.49364, -117.26832),
-    "hide_a_way_lake": (30.56492, -89.6402),
-    "tunica_resorts": (34.83613, -90.34723),
-    "colony_park": (40.34683, -75.9824),
-    "greenfields": (40.3599, -75.95199),
-    "kula": (20.79094, -156.32695),
-    "ko_olina": (21.33993, -158.12562),
-    "firing_range": (33.43752, -82.69068),
-    "west_warrenton": (33.41217, -82.67517),
-    "hill_air_force_base": (41.11118, -111.97712),
-    "elmendorf_air_force_base": (61.25703, -149.63139),
-    "hot_springs_national_park": (34.5317, -93.06377),
-    "dixiana": (33.74021, -86.64938),
-    "shoal_creek": (33.43076, -86.61092),
-    "little_rock_air_force_base": (34.89149, -92.15955),
-    "cranberry_township": (40.68496, -80.10714),
-    "pantops": (38.03379, -78.45507),
-    "pryor_creek": (36.30862, -95.31777),
-    "echo_park": (34.07808, -118.26066),
-    "sugarcreek_police_dept": (40.50253, -81.64176),
-    "scotts_mill": (35.72666, -78.8839),
-    "maine": (45.02716, -89.69039),
-    "washington_street_courthouse_annex": (34.80264, -86.97298),
-    "allenstown": (43.15673, -71.40478),
-    "bay_harbor": (45.36413, -85.08208),
-    "st_johns": (30.0815, -81.54774),
-    "stonecrest": (33.70849, -84.13485),
-    "new_century_ks": (38.82253, -94.89971),
-}
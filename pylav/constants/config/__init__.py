@@ -44,13 +44,34 @@ if not ENV_FILE.exists():
     from pylav.constants.config.env_var import EXTERNAL_UNMANAGED_PORT as EXTERNAL_UNMANAGED_PORT
     from pylav.constants.config.env_var import EXTERNAL_UNMANAGED_SSL as EXTERNAL_UNMANAGED_SSL
     from pylav.constants.config.env_var import FALLBACK_POSTGREST_HOST as FALLBACK_POSTGREST_HOST
+    from pylav.constants.config.env_var import HEDGING_ENABLED as HEDGING_ENABLED
+    from pylav.constants.config.env_var import HEDGING_MAX_EXTRA_LOAD as HEDGING_MAX_EXTRA_LOAD
+    from pylav.constants.config.env_var import HEDGING_PERCENTILE as HEDGING_PERCENTILE
+    from pylav.constants.config.env_var import HTTP_DNS_CACHE_TTL as HTTP_DNS_CACHE_TTL
+    from pylav.constants.config.env_var import HTTP_KEEPALIVE_TIMEOUT as HTTP_KEEPALIVE_TIMEOUT
+    from pylav.constants.config.env_var import HTTP_POOL_LIMIT as HTTP_POOL_LIMIT
+    from pylav.constants.config.env_var import HTTP_POOL_LIMIT_PER_HOST as HTTP_POOL_LIMIT_PER_HOST
     from pylav.constants.config.env_var import JAVA_EXECUTABLE as JAVA_EXECUTABLE
+    from pylav.constants.config.env_var import LOCAL_TRACK_ARTWORK_CACHE_SIZE as LOCAL_TRACK_ARTWORK_CACHE_SIZE
+    from pylav.constants.config.env_var import LOCAL_TRACK_ARTWORK_DIR_MAX_SIZE as LOCAL_TRACK_ARTWORK_DIR_MAX_SIZE
+    from pylav.constants.config.env_var import LOCAL_TRACK_ARTWORK_SIZE as LOCAL_TRACK_ARTWORK_SIZE
+    from pylav.constants.config.env_var import LOCAL_TRACK_METADATA_CACHE_SIZE as LOCAL_TRACK_METADATA_CACHE_SIZE
     from pylav.constants.config.env_var import LOCAL_TRACKS_FOLDER as LOCAL_TRACKS_FOLDER
+    from pylav.constants.config.env_var import M3U_CONDITIONAL_CACHE_MAX_SIZE as M3U_CONDITIONAL_CACHE_MAX_SIZE
+    from pylav.constants.config.env_var import M3U_MAX_SIZE as M3U_MAX_SIZE
     from pylav.constants.config.env_var import MANAGED_NODE_APPLE_MUSIC_API_KEY as MANAGED_NODE_APPLE_MUSIC_API_KEY
     from pylav.constants.config.env_var import (
         MANAGED_NODE_APPLE_MUSIC_COUNTRY_CODE as MANAGED_NODE_APPLE_MUSIC_COUNTRY_CODE,
     )
     from pylav.constants.config.env_var import MANAGED_NODE_DEEZER_KEY as MANAGED_NODE_DEEZER_KEY
+    from pylav.constants.config.env_var import MANAGED_NODE_INSTANCES as MANAGED_NODE_INSTANCES
+    from pylav.constants.config.env_var import MANAGED_NODE_MAX_CPU_PERCENT as MANAGED_NODE_MAX_CPU_PERCENT
+    from pylav.constants.config.env_var import MANAGED_NODE_MAX_FD_RATIO as MANAGED_NODE_MAX_FD_RATIO
+    from pylav.constants.config.env_var import MANAGED_NODE_MAX_GC_PAUSE_MS as MANAGED_NODE_MAX_GC_PAUSE_MS
+    from pylav.constants.config.env_var import (
+        MANAGED_NODE_MAX_RSS_GROWTH_MB_PER_HOUR as MANAGED_NODE_MAX_RSS_GROWTH_MB_PER_HOUR,
+    )
+    from pylav.constants.config.env_var import MANAGED_NODE_MAX_RSS_MB as MANAGED_NODE_MAX_RSS_MB
     from pylav.constants.config.env_var import MANAGED_NODE_SPOTIFY_CLIENT_ID as MANAGED_NODE_SPOTIFY_CLIENT_ID
     from pylav.constants.config.env_var import MANAGED_NODE_SPOTIFY_CLIENT_SECRET as MANAGED_NODE_SPOTIFY_CLIENT_SECRET
     from pylav.constants.config.env_var import MANAGED_NODE_SPOTIFY_COUNTRY_CODE as MANAGED_NODE_SPOTIFY_COUNTRY_CODE
@@ -90,13 +111,34 @@ else:
     from pylav.constants.config.file import EXTERNAL_UNMANAGED_PORT as EXTERNAL_UNMANAGED_PORT
     from pylav.constants.config.file import EXTERNAL_UNMANAGED_SSL as EXTERNAL_UNMANAGED_SSL
     from pylav.constants.config.file import FALLBACK_POSTGREST_HOST as FALLBACK_POSTGREST_HOST
+    from pylav.constants.config.file import HEDGING_ENABLED as HEDGING_ENABLED
+    from pylav.constants.config.file import HEDGING_MAX_EXTRA_LOAD as HEDGING_MAX_EXTRA_LOAD
+    from pylav.constants.config.file import HEDGING_PERCENTILE as HEDGING_PERCENTILE
+    from pylav.constants.config.file import HTTP_DNS_CACHE_TTL as HTTP_DNS_CACHE_TTL
+    from pylav.constants.config.file import HTTP_KEEPALIVE_TIMEOUT as HTTP_KEEPALIVE_TIMEOUT
+    from pylav.constants.config.file import HTTP_POOL_LIMIT as HTTP_POOL_LIMIT
+    from pylav.constants.config.file import HTTP_POOL_LIMIT_PER_HOST as HTTP_POOL_LIMIT_PER_HOST
     from pylav.constants.config.file import JAVA_EXECUTABLE as JAVA_EXECUTABLE
+    from pylav.constants.config.file import LOCAL_TRACK_ARTWORK_CACHE_SIZE as LOCAL_TRACK_ARTWORK_CACHE_SIZE
+    from pylav.constants.config.file import LOCAL_TRACK_ARTWORK_DIR_MAX_SIZE as LOCAL_TRACK_ARTWORK_DIR_MAX_SIZE
+    from pylav.constants.config.file import LOCAL_TRACK_ARTWORK_SIZE as LOCAL_TRACK_ARTWORK_SIZE
+    from pylav.constants.config.file import LOCAL_TRACK_METADATA_CACHE_SIZE as LOCAL_TRACK_METADATA_CACHE_SIZE
     from pylav.constants.config.file import LOCAL_TRACKS_FOLDER as LOCAL_TRACKS_FOLDER
+    from pylav.constants.config.file import M3U_CONDITIONAL_CACHE_MAX_SIZE as M3U_CONDITIONAL_CACHE_MAX_SIZE
+    from pylav.constants.config.file import M3U_MAX_SIZE as M3U_MAX_SIZE
     from pylav.constants.config.file import MANAGED_NODE_APPLE_MUSIC_API_KEY as MANAGED_NODE_APPLE_MUSIC_API_KEY
     from pylav.constants.config.file import (
         MANAGED_NODE_APPLE_MUSIC_COUNTRY_CODE as MANAGED_NODE_APPLE_MUSIC_COUNTRY_CODE,
     )
     from pylav.constants.config.file import MANAGED_NODE_DEEZER_KEY as MANAGED_NODE_DEEZER_KEY
+    from pylav.constants.config.file import MANAGED_NODE_INSTANCES as MANAGED_NODE_INSTANCES
+    from pylav.constants.config.file import MANAGED_NODE_MAX_CPU_PERCENT as MANAGED_NODE_MAX_CPU_PERCENT
+    from pylav.constants.config.file import MANAGED_NODE_MAX_FD_RATIO as MANAGED_NODE_MAX_FD_RATIO
+    from pylav.constants.config.file import MANAGED_NODE_MAX_GC_PAUSE_MS as MANAGED_NODE_MAX_GC_PAUSE_MS
+    from pylav.constants.config.file import (
+        MANAGED_NODE_MAX_RSS_GROWTH_MB_PER_HOUR as MANAGED_NODE_MAX_RSS_GROWTH_MB_PER_HOUR,
+    )
+    from pylav.constants.config.file import MANAGED_NODE_MAX_RSS_MB as MANAGED_NODE_MAX_RSS_MB
     from pylav.constants.config.file import MANAGED_NODE_SPOTIFY_CLIENT_ID as MANAGED_NODE_SPOTIFY_CLIENT_ID
     from pylav.constants.config.file import MANAGED_NODE_SPOTIFY_CLIENT_SECRET as MANAGED_NODE_SPOTIFY_CLIENT_SECRET
     from pylav.constants.config.file import MANAGED_NODE_SPOTIFY_COUNTRY_CODE as MANAGED_NODE_SPOTIFY_COUNTRY_CODE
@@ -88,3 +88,22 @@ ENABLE_NODE_RESUMING = bool(int(os.getenv("PYLAV__ENABLE_NODE_RESUMING", "1")))
 DEFAULT_PLAYER_VOLUME = (
     max(int(envar_value), 1) if (envar_value := os.getenv("PYLAV__DEFAULT_PLAYER_VOLUME")) is not None else None
 )
+MANAGED_NODE_INSTANCES = max(int(os.getenv("PYLAV__MANAGED_NODE_INSTANCES", "1")), 1)
+HEDGING_ENABLED = bool(int(os.getenv("PYLAV__HEDGING_ENABLED", "0")))
+HEDGING_PERCENTILE = float(os.getenv("PYLAV__HEDGING_PERCENTILE", "95"))
+HEDGING_MAX_EXTRA_LOAD = float(os.getenv("PYLAV__HEDGING_MAX_EXTRA_LOAD", "0.1"))
+MANAGED_NODE_MAX_RSS_MB = float(os.getenv("PYLAV__MANAGED_NODE_MAX_RSS_MB", "0"))
+MANAGED_NODE_MAX_RSS_GROWTH_MB_PER_HOUR = float(os.getenv("PYLAV__MANAGED_NODE_MAX_RSS_GROWTH_MB_PER_HOUR", "0"))
+MANAGED_NODE_MAX_CPU_PERCENT = float(os.getenv("PYLAV__MANAGED_NODE_MAX_CPU_PERCENT", "0"))
+MANAGED_NODE_MAX_GC_PAUSE_MS = float(os.getenv("PYLAV__MANAGED_NODE_MAX_GC_PAUSE_MS", "0"))
+MANAGED_NODE_MAX_FD_RATIO = float(os.getenv("PYLAV__MANAGED_NODE_MAX_FD_RATIO", "0.95"))
+LOCAL_TRACK_METADATA_CACHE_SIZE = int(os.getenv("PYLAV__LOCAL_TRACK_METADATA_CACHE_SIZE", "1024"))
+LOCAL_TRACK_ARTWORK_CACHE_SIZE = int(os.getenv("PYLAV__LOCAL_TRACK_ARTWORK_CACHE_SIZE", "128"))
+LOCAL_TRACK_ARTWORK_SIZE = int(os.getenv("PYLAV__LOCAL_TRACK_ARTWORK_SIZE", "256"))
+LOCAL_TRACK_ARTWORK_DIR_MAX_SIZE = int(os.getenv("PYLAV__LOCAL_TRACK_ARTWORK_DIR_MAX_SIZE", "67108864"))
+HTTP_POOL_LIMIT = int(os.getenv("PYLAV__HTTP_POOL_LIMIT", "100"))
+HTTP_POOL_LIMIT_PER_HOST = int(os.getenv("PYLAV__HTTP_POOL_LIMIT_PER_HOST", "32"))
+HTTP_KEEPALIVE_TIMEOUT = float(os.getenv("PYLAV__HTTP_KEEPALIVE_TIMEOUT", "60"))
+HTTP_DNS_CACHE_TTL = int(os.getenv("PYLAV__HTTP_DNS_CACHE_TTL", "300"))
+M3U_MAX_SIZE = int(os.getenv("PYLAV__M3U_MAX_SIZE", "67108864"))
+M3U_CONDITIONAL_CACHE_MAX_SIZE = int(os.getenv("PYLAV__M3U_CONDITIONAL_CACHE_MAX_SIZE", "2097152"))
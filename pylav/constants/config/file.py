@@ -6,7 +6,6 @@ from copy import deepcopy
 from typing import Any, cast
 
 import yaml
-from deepdiff import DeepDiff  # type: ignore
 
 # noinspection PyProtectedMember
 from pylav._internals.functions import _get_path, fix
@@ -182,6 +181,82 @@ if (DEFAULT_PLAYER_VOLUME := data.get("PYLAV__DEFAULT_PLAYER_VOLUME")) is None:
     DEFAULT_PLAYER_VOLUME = int(os.getenv("PYLAV__DEFAULT_PLAYER_VOLUME", "25"))
     data_new["PYLAV__DEFAULT_PLAYER_VOLUME"] = DEFAULT_PLAYER_VOLUME
 
+if (MANAGED_NODE_INSTANCES := data.get("PYLAV__MANAGED_NODE_INSTANCES")) is None:
+    MANAGED_NODE_INSTANCES = max(int(os.getenv("PYLAV__MANAGED_NODE_INSTANCES", "1")), 1)
+    data_new["PYLAV__MANAGED_NODE_INSTANCES"] = MANAGED_NODE_INSTANCES
+
+if (HEDGING_ENABLED := data.get("PYLAV__HEDGING_ENABLED")) is None:
+    HEDGING_ENABLED = bool(int(os.getenv("PYLAV__HEDGING_ENABLED", "0")))
+    data_new["PYLAV__HEDGING_ENABLED"] = HEDGING_ENABLED
+
+if (HEDGING_PERCENTILE := data.get("PYLAV__HEDGING_PERCENTILE")) is None:
+    HEDGING_PERCENTILE = float(os.getenv("PYLAV__HEDGING_PERCENTILE", "95"))
+    data_new["PYLAV__HEDGING_PERCENTILE"] = HEDGING_PERCENTILE
+
+if (HEDGING_MAX_EXTRA_LOAD := data.get("PYLAV__HEDGING_MAX_EXTRA_LOAD")) is None:
+    HEDGING_MAX_EXTRA_LOAD = float(os.getenv("PYLAV__HEDGING_MAX_EXTRA_LOAD", "0.1"))
+    data_new["PYLAV__HEDGING_MAX_EXTRA_LOAD"] = HEDGING_MAX_EXTRA_LOAD
+
+if (MANAGED_NODE_MAX_RSS_MB := data.get("PYLAV__MANAGED_NODE_MAX_RSS_MB")) is None:
+    MANAGED_NODE_MAX_RSS_MB = float(os.getenv("PYLAV__MANAGED_NODE_MAX_RSS_MB", "0"))
+    data_new["PYLAV__MANAGED_NODE_MAX_RSS_MB"] = MANAGED_NODE_MAX_RSS_MB
+
+if (MANAGED_NODE_MAX_RSS_GROWTH_MB_PER_HOUR := data.get("PYLAV__MANAGED_NODE_MAX_RSS_GROWTH_MB_PER_HOUR")) is None:
+    MANAGED_NODE_MAX_RSS_GROWTH_MB_PER_HOUR = float(os.getenv("PYLAV__MANAGED_NODE_MAX_RSS_GROWTH_MB_PER_HOUR", "0"))
+    data_new["PYLAV__MANAGED_NODE_MAX_RSS_GROWTH_MB_PER_HOUR"] = MANAGED_NODE_MAX_RSS_GROWTH_MB_PER_HOUR
+
+if (MANAGED_NODE_MAX_CPU_PERCENT := data.get("PYLAV__MANAGED_NODE_MAX_CPU_PERCENT")) is None:
+    MANAGED_NODE_MAX_CPU_PERCENT = float(os.getenv("PYLAV__MANAGED_NODE_MAX_CPU_PERCENT", "0"))
+    data_new["PYLAV__MANAGED_NODE_MAX_CPU_PERCENT"] = MANAGED_NODE_MAX_CPU_PERCENT
+
+if (MANAGED_NODE_MAX_GC_PAUSE_MS := data.get("PYLAV__MANAGED_NODE_MAX_GC_PAUSE_MS")) is None:
+    MANAGED_NODE_MAX_GC_PAUSE_MS = float(os.getenv("PYLAV__MANAGED_NODE_MAX_GC_PAUSE_MS", "0"))
+    data_new["PYLAV__MANAGED_NODE_MAX_GC_PAUSE_MS"] = MANAGED_NODE_MAX_GC_PAUSE_MS
+
+if (MANAGED_NODE_MAX_FD_RATIO := data.get("PYLAV__MANAGED_NODE_MAX_FD_RATIO")) is None:
+    MANAGED_NODE_MAX_FD_RATIO = float(os.getenv("PYLAV__MANAGED_NODE_MAX_FD_RATIO", "0.95"))
+    data_new["PYLAV__MANAGED_NODE_MAX_FD_RATIO"] = MANAGED_NODE_MAX_FD_RATIO
+
+if (LOCAL_TRACK_METADATA_CACHE_SIZE := data.get("PYLAV__LOCAL_TRACK_METADATA_CACHE_SIZE")) is None:
+    LOCAL_TRACK_METADATA_CACHE_SIZE = int(os.getenv("PYLAV__LOCAL_TRACK_METADATA_CACHE_SIZE", "1024"))
+    data_new["PYLAV__LOCAL_TRACK_METADATA_CACHE_SIZE"] = LOCAL_TRACK_METADATA_CACHE_SIZE
+
+if (LOCAL_TRACK_ARTWORK_CACHE_SIZE := data.get("PYLAV__LOCAL_TRACK_ARTWORK_CACHE_SIZE")) is None:
+    LOCAL_TRACK_ARTWORK_CACHE_SIZE = int(os.getenv("PYLAV__LOCAL_TRACK_ARTWORK_CACHE_SIZE", "128"))
+    data_new["PYLAV__LOCAL_TRACK_ARTWORK_CACHE_SIZE"] = LOCAL_TRACK_ARTWORK_CACHE_SIZE
+
+if (LOCAL_TRACK_ARTWORK_SIZE := data.get("PYLAV__LOCAL_TRACK_ARTWORK_SIZE")) is None:
+    LOCAL_TRACK_ARTWORK_SIZE = int(os.getenv("PYLAV__LOCAL_TRACK_ARTWORK_SIZE", "256"))
+    data_new["PYLAV__LOCAL_TRACK_ARTWORK_SIZE"] = LOCAL_TRACK_ARTWORK_SIZE
+
+if (LOCAL_TRACK_ARTWORK_DIR_MAX_SIZE := data.get("PYLAV__LOCAL_TRACK_ARTWORK_DIR_MAX_SIZE")) is None:
+    LOCAL_TRACK_ARTWORK_DIR_MAX_SIZE = int(os.getenv("PYLAV__LOCAL_TRACK_ARTWORK_DIR_MAX_SIZE", "67108864"))
+    data_new["PYLAV__LOCAL_TRACK_ARTWORK_DIR_MAX_SIZE"] = LOCAL_TRACK_ARTWORK_DIR_MAX_SIZE
+
+if (HTTP_POOL_LIMIT := data.get("PYLAV__HTTP_POOL_LIMIT")) is None:
+    HTTP_POOL_LIMIT = int(os.getenv("PYLAV__HTTP_POOL_LIMIT", "100"))
+    data_new["PYLAV__HTTP_POOL_LIMIT"] = HTTP_POOL_LIMIT
+
+if (HTTP_POOL_LIMIT_PER_HOST := data.get("PYLAV__HTTP_POOL_LIMIT_PER_HOST")) is None:
+    HTTP_POOL_LIMIT_PER_HOST = int(os.getenv("PYLAV__HTTP_POOL_LIMIT_PER_HOST", "32"))
+    data_new["PYLAV__HTTP_POOL_LIMIT_PER_HOST"] = HTTP_POOL_LIMIT_PER_HOST
+
+if (HTTP_KEEPALIVE_TIMEOUT := data.get("PYLAV__HTTP_KEEPALIVE_TIMEOUT")) is None:
+    HTTP_KEEPALIVE_TIMEOUT = float(os.getenv("PYLAV__HTTP_KEEPALIVE_TIMEOUT", "60"))
+    data_new["PYLAV__HTTP_KEEPALIVE_TIMEOUT"] = HTTP_KEEPALIVE_TIMEOUT
+
+if (HTTP_DNS_CACHE_TTL := data.get("PYLAV__HTTP_DNS_CACHE_TTL")) is None:
+    HTTP_DNS_CACHE_TTL = int(os.getenv("PYLAV__HTTP_DNS_CACHE_TTL", "300"))
+    data_new["PYLAV__HTTP_DNS_CACHE_TTL"] = HTTP_DNS_CACHE_TTL
+
+if (M3U_MAX_SIZE := data.get("PYLAV__M3U_MAX_SIZE")) is None:
+    M3U_MAX_SIZE = int(os.getenv("PYLAV__M3U_MAX_SIZE", "67108864"))
+    data_new["PYLAV__M3U_MAX_SIZE"] = M3U_MAX_SIZE
+
+if (M3U_CONDITIONAL_CACHE_MAX_SIZE := data.get("PYLAV__M3U_CONDITIONAL_CACHE_MAX_SIZE")) is None:
+    M3U_CONDITIONAL_CACHE_MAX_SIZE = int(os.getenv("PYLAV__M3U_CONDITIONAL_CACHE_MAX_SIZE", "2097152"))
+    data_new["PYLAV__M3U_CONDITIONAL_CACHE_MAX_SIZE"] = M3U_CONDITIONAL_CACHE_MAX_SIZE
+
 data_new = _remove_keys(
     "PYLAV__CACHING_ENABLED",
     "PYLAV__PREFER_PARTIAL_TRACKS",
@@ -190,7 +265,8 @@ data_new = _remove_keys(
     data=data_new,
 )
 
-if DeepDiff(data, data_new, ignore_order=True, max_passes=2, cache_size=1000):
+# Only keys are added or removed above, so comparing the dicts is enough and deepdiff isn't imported at startup
+if data != data_new:
     with ENV_FILE.open(mode="w") as file:
         LOGGER.info("Updating %s with the following content: %r", ENV_FILE, data_new)
         yaml.safe_dump(data_new, file, default_flow_style=False, sort_keys=False, encoding="utf-8")
@@ -107,3 +107,71 @@ ENABLE_NODE_RESUMING = False
 DEFAULT_PLAYER_VOLUME = (
     max(int(envar_value), 1) if (envar_value := os.getenv("PYLAV__DEFAULT_PLAYER_VOLUME")) is not None else None
 )
+
+MANAGED_NODE_INSTANCES = (
+    max(int(envar_value), 1) if (envar_value := os.getenv("PYLAV__MANAGED_NODE_INSTANCES")) is not None else None
+)
+
+HEDGING_ENABLED = bool(int(envar_value)) if (envar_value := os.getenv("PYLAV__HEDGING_ENABLED")) is not None else None
+
+HEDGING_PERCENTILE = float(envar_value) if (envar_value := os.getenv("PYLAV__HEDGING_PERCENTILE")) is not None else None
+
+HEDGING_MAX_EXTRA_LOAD = (
+    float(envar_value) if (envar_value := os.getenv("PYLAV__HEDGING_MAX_EXTRA_LOAD")) is not None else None
+)
+
+MANAGED_NODE_MAX_RSS_MB = (
+    float(envar_value) if (envar_value := os.getenv("PYLAV__MANAGED_NODE_MAX_RSS_MB")) is not None else None
+)
+
+MANAGED_NODE_MAX_RSS_GROWTH_MB_PER_HOUR = (
+    float(envar_value)
+    if (envar_value := os.getenv("PYLAV__MANAGED_NODE_MAX_RSS_GROWTH_MB_PER_HOUR")) is not None
+    else None
+)
+
+MANAGED_NODE_MAX_CPU_PERCENT = (
+    float(envar_value) if (envar_value := os.getenv("PYLAV__MANAGED_NODE_MAX_CPU_PERCENT")) is not None else None
+)
+
+MANAGED_NODE_MAX_GC_PAUSE_MS = (
+    float(envar_value) if (envar_value := os.getenv("PYLAV__MANAGED_NODE_MAX_GC_PAUSE_MS")) is not None else None
+)
+
+MANAGED_NODE_MAX_FD_RATIO = (
+    float(envar_value) if (envar_value := os.getenv("PYLAV__MANAGED_NODE_MAX_FD_RATIO")) is not None else None
+)
+
+LOCAL_TRACK_METADATA_CACHE_SIZE = (
+    int(envar_value) if (envar_value := os.getenv("PYLAV__LOCAL_TRACK_METADATA_CACHE_SIZE")) is not None else None
+)
+
+LOCAL_TRACK_ARTWORK_CACHE_SIZE = (
+    int(envar_value) if (envar_value := os.getenv("PYLAV__LOCAL_TRACK_ARTWORK_CACHE_SIZE")) is not None else None
+)
+
+LOCAL_TRACK_ARTWORK_SIZE = (
+    int(envar_value) if (envar_value := os.getenv("PYLAV__LOCAL_TRACK_ARTWORK_SIZE")) is not None else None
+)
+
+LOCAL_TRACK_ARTWORK_DIR_MAX_SIZE = (
+    int(envar_value) if (envar_value := os.getenv("PYLAV__LOCAL_TRACK_ARTWORK_DIR_MAX_SIZE")) is not None else None
+)
+
+HTTP_POOL_LIMIT = int(envar_value) if (envar_value := os.getenv("PYLAV__HTTP_POOL_LIMIT")) is not None else None
+
+HTTP_POOL_LIMIT_PER_HOST = (
+    int(envar_value) if (envar_value := os.getenv("PYLAV__HTTP_POOL_LIMIT_PER_HOST")) is not None else None
+)
+
+HTTP_KEEPALIVE_TIMEOUT = (
+    float(envar_value) if (envar_value := os.getenv("PYLAV__HTTP_KEEPALIVE_TIMEOUT")) is not None else None
+)
+
+HTTP_DNS_CACHE_TTL = int(envar_value) if (envar_value := os.getenv("PYLAV__HTTP_DNS_CACHE_TTL")) is not None else None
+
+M3U_MAX_SIZE = int(envar_value) if (envar_value := os.getenv("PYLAV__M3U_MAX_SIZE")) is not None else None
+
+M3U_CONDITIONAL_CACHE_MAX_SIZE = (
+    int(envar_value) if (envar_value := os.getenv("PYLAV__M3U_CONDITIONAL_CACHE_MAX_SIZE")) is not None else None
+)
@@ -1,10 +1,27 @@
 from __future__ import annotations
 
-from pylav.constants.city_dump import US_CITY_DUMP
+import functools
+import struct
+import sys
+import zlib
+from array import array
+from collections.abc import ItemsView, Iterator, KeysView, Mapping, ValuesView
+from pathlib import Path
 
 __all__ = ("REGION_TO_COUNTRY_COORDINATE_MAPPING", "DEFAULT_REGIONS")
-REGION_TO_COUNTRY_COORDINATE_MAPPING: dict[str, tuple[float, float]] = {}
-REGION_TO_COUNTRY_COORDINATE_MAPPING |= US_CITY_DUMP
+
+CITY_COORDINATES_FILE = Path(__file__).parent / "data" / "us_cities.bin"
+
+# Layout of the (zlib compressed) city coordinates resource:
+#   header: magic, format version, entry count
+#   column: entry count little-endian int32 latitudes, scaled by _CITY_COORDINATES_SCALE
+#   column: entry count little-endian int32 longitudes, scaled by _CITY_COORDINATES_SCALE
+#   column: newline separated utf-8 city names
+_CITY_COORDINATES_HEADER = struct.Struct("<4sHI")
+_CITY_COORDINATES_MAGIC = b"PLGC"
+_CITY_COORDINATES_VERSION = 1
+_CITY_COORDINATES_SCALE = 100_000
+
 DEFAULT_REGIONS_MAPPING = {
     "hongkong": (22.2793278, 114.1628131),
     "singapore": (1.357107, 103.8194992),
@@ -28,5 +45,98 @@ DEFAULT_REGIONS_MAPPING = {
     "milan": (45.4642035, 9.189982),
     "unknown_pylav": (0, 0),
 }
-REGION_TO_COUNTRY_COORDINATE_MAPPING |= DEFAULT_REGIONS_MAPPING
 DEFAULT_REGIONS = list(DEFAULT_REGIONS_MAPPING.keys())
+
+
+def _column(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def dump_city_coordinates(mapping: Mapping[str, tuple[float, float]], path: Path = CITY_COORDINATES_FILE) -> None:
+    """Write a city name to coordinates mapping in the compact format read by :func:`load_city_coordinates`"""
+    names = list(mapping)
+    latitudes = array("i", (round(mapping[name][0] * _CITY_COORDINATES_SCALE) for name in names))
+    longitudes = array("i", (round(mapping[name][1] * _CITY_COORDINATES_SCALE) for name in names))
+    payload = b"".join(
+        (
+            _CITY_COORDINATES_HEADER.pack(_CITY_COORDINATES_MAGIC, _CITY_COORDINATES_VERSION, len(names)),
+            _column(latitudes),
+            _column(longitudes),
+            "\n".join(names).encode("utf-8"),
+        )
+    )
+    path.write_bytes(zlib.compress(payload, 9))
+
+
+@functools.cache
+def load_city_coordinates() -> dict[str, tuple[float, float]]:
+    """Load the bundled city coordinates, this is only done once per process"""
+    payload = zlib.decompress(CITY_COORDINATES_FILE.read_bytes())
+    magic, version, count = _CITY_COORDINATES_HEADER.unpack_from(payload)
+    if magic != _CITY_COORDINATES_MAGIC or version != _CITY_COORDINATES_VERSION:
+        raise ValueError(f"{CITY_COORDINATES_FILE} is not a supported city coordinates file")
+    offset = _CITY_COORDINATES_HEADER.size
+    columns = []
+    for __ in range(2):
+        column = array("i")
+        column.frombytes(payload[offset : offset + count * column.itemsize])
+        if sys.byteorder != "little":
+            column.byteswap()
+        columns.append(column)
+        offset += count * column.itemsize
+    names = payload[offset:].decode("utf-8").split("\n")
+    scale = _CITY_COORDINATES_SCALE
+    return {
+        name: (latitude / scale, longitude / scale) for name, latitude, longitude in zip(names, *columns, strict=True)
+    }
+
+
+class _RegionCoordinateMapping(Mapping[str, tuple[float, float]]):
+    """Read-only region to coordinate mapping.
+
+    Discord's own regions are always available, the city coordinates are only loaded the first
+    time a region which isn't one of the defaults is looked up.
+    """
+
+    __slots__ = ("_merged",)
+
+    def __init__(self) -> None:
+        self._merged: dict[str, tuple[float, float]] | None = None
+
+    def _all(self) -> dict[str, tuple[float, float]]:
+        if self._merged is None:
+            self._merged = load_city_coordinates() | DEFAULT_REGIONS_MAPPING
+        return self._merged
+
+    def __getitem__(self, key: str) -> tuple[float, float]:
+        try:
+            return DEFAULT_REGIONS_MAPPING[key]
+        except KeyError:
+            return self._all()[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in DEFAULT_REGIONS_MAPPING or key in self._all()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._all())
+
+    def __len__(self) -> int:
+        return len(self._all())
+
+    def keys(self) -> KeysView[str]:
+        return self._all().keys()
+
+    def values(self) -> ValuesView[tuple[float, float]]:
+        return self._all().values()
+
+    def items(self) -> ItemsView[str, tuple[float, float]]:
+        return self._all().items()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} loaded={self._merged is not None}>"
+
+
+REGION_TO_COUNTRY_COORDINATE_MAPPING: Mapping[str, tuple[float, float]] = _RegionCoordinateMapping()
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import aiohttp
+
+# Timeouts of the shared connection pool, its limits are configured in pylav.constants.config
+HTTP_DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=120, sock_connect=10)
+# Keyed by the first segment of the path of a Lavalink REST endpoint
+HTTP_SESSION_TIMEOUT = aiohttp.ClientTimeout(total=10, sock_connect=5)
+HTTP_LOAD_TIMEOUT = aiohttp.ClientTimeout(total=60, sock_connect=5)
+HTTP_DECODE_TIMEOUT = aiohttp.ClientTimeout(total=20, sock_connect=5)
+HTTP_INFO_TIMEOUT = aiohttp.ClientTimeout(total=15, sock_connect=5)
+HTTP_ENDPOINT_TIMEOUTS = {
+    # Player and session updates are small and latency sensitive
+    "sessions": HTTP_SESSION_TIMEOUT,
+    # Resolving queries may hit slow upstream sources
+    "loadtracks": HTTP_LOAD_TIMEOUT,
+    "loadsearch": HTTP_LOAD_TIMEOUT,
+    "decodetrack": HTTP_DECODE_TIMEOUT,
+    "decodetracks": HTTP_DECODE_TIMEOUT,
+    "info": HTTP_INFO_TIMEOUT,
+    "stats": HTTP_INFO_TIMEOUT,
+    "version": HTTP_INFO_TIMEOUT,
+    "routeplanner": HTTP_INFO_TIMEOUT,
+}
+
+# Remote M3U playlists are parsed while they download, their size limits are configured in pylav.constants.config.
+# This many of the small ones are kept to answer conditional requests
+M3U_CONDITIONAL_CACHE_ENTRIES = 64
+M3U_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=30)
@@ -33,3 +33,11 @@ EQ_BAND_MAPPING = {
 
 
 EPOCH_DT_TZ_AWARE = datetime.datetime(1970, 1, 1, tzinfo=datetime.UTC)
+
+# Shared metadata of local tracks and the thumbnails of their embedded artwork, the cache sizes are configured in
+# pylav.constants.config. Without Pillow artwork can't be downscaled, it is then only sent as is when it is no larger
+# than this many bytes
+LOCAL_TRACK_ARTWORK_MAX_ORIGINAL_SIZE = 2 * 1024 * 1024
+
+# The number of recent changes a player queue remembers, views older than that are rebuilt in full
+QUEUE_CHANGE_LOG_SIZE = 256
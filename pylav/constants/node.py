@@ -155,3 +155,72 @@ NODE_DEFAULT_SETTINGS = {
 }
 GOOD_RESPONSE_RANGE = range(200, 299)
 JAR_SERVER_RELEASES = "https://api.github.com/repos/lavalink-devs/Lavalink/releases"
+
+# Player migration on node failover
+MAX_CONCURRENT_MIGRATIONS_PER_NODE = 8
+MIGRATION_PROGRESS_LOG_INTERVAL = 50
+
+# Session reconciliation after a node resumes or players stall
+RECONCILIATION_CONCURRENCY = 10
+RECONCILIATION_POSITION_TOLERANCE = 5000
+RECONCILIATION_DELAY = 5
+
+# Adaptive REST concurrency per node
+REST_CONCURRENCY_INITIAL = 8
+REST_CONCURRENCY_MIN = 1
+REST_CONCURRENCY_MAX = 64
+REST_CRITICAL_HEADROOM = 4
+REST_LATENCY_TOLERANCE = 2.0
+REST_DECREASE_FACTOR = 0.5
+
+# Node health scoring from observed REST and WebSocket timings
+HEALTH_WINDOW_SECONDS = 300
+HEALTH_WINDOW_SIZE = 256
+HEALTH_EWMA_ALPHA = 0.2
+HEALTH_MIN_SAMPLES = 5
+HEALTH_LATENCY_WEIGHT = 100
+HEALTH_WEBSOCKET_DELAY_WEIGHT = 200
+HEALTH_ERROR_WEIGHT = 1000
+HEALTH_DRAIN_SCORE = 500
+HEALTH_RECOVER_SCORE = 250
+HEALTH_DRAIN_CHECKS = 3
+
+# Hedged loadtracks requests, enabling them and their budget are configured in pylav.constants.config
+HEDGING_MIN_DELAY = 0.25
+HEDGING_DEFAULT_DELAY = 2.0
+HEDGING_BURST = 10
+
+# Resource telemetry of managed Lavalink processes, the thresholds are configured in pylav.constants.config
+MANAGED_NODE_TELEMETRY_INTERVAL = 15
+MANAGED_NODE_TELEMETRY_WINDOW = 40
+MANAGED_NODE_TELEMETRY_SUSTAINED_SAMPLES = 4
+
+# Graceful draining, playing players move at their next track and are only forced off after the timeout
+NODE_DRAIN_TIMEOUT = 600
+NODE_DRAIN_INTERVAL = 5
+# While there is nowhere to move players to, the drain checks back less and less often, up to this many seconds
+NODE_DRAIN_MAX_INTERVAL = 60
+NODE_DRAIN_BATCH_SIZE = 10
+MANAGED_NODE_DRAIN_TIMEOUT = 60
+
+# How long player updates wait to be merged with other updates before they are sent
+PLAYER_UPDATE_COALESCE_WINDOW = 0.05
+
+# Shared ICY metadata readers for live streams
+STREAM_METADATA_FIRST_TITLE_TIMEOUT = 5.0
+STREAM_METADATA_IDLE_TIMEOUT = 60
+STREAM_METADATA_CHECK_INTERVAL = 30
+STREAM_METADATA_RETRY_AFTER = 300
+# Watchers keep a connection open for as long as they run, so they get a pool of their own
+STREAM_METADATA_MAX_CONNECTIONS = 32
+STREAM_METADATA_MAX_CONNECTIONS_PER_HOST = 4
+
+# Live now playing messages, progress only edits wait for the progress bar to move, at most the maximum interval
+NOW_PLAYING_MIN_INTERVAL = 5.0
+NOW_PLAYING_MAX_INTERVAL = 60.0
+# An edit slower than this waited for a Discord rate limit, so every message slows down
+NOW_PLAYING_SLOW_EDIT = 2.0
+NOW_PLAYING_MAX_BACKOFF = 8.0
+
+# Auto play draws from a shuffle bag, a track found in the recent history is skipped at most this many times in a row
+AUTOPLAY_MAX_DRAWS = 5
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import datetime
+
 API_TYPES = {
     "search": {
         "name": str,
@@ -31,3 +33,13 @@ API_TYPES = {
     "languages": {"language": str},
     "tags": {"tag": str},
 }
+
+RADIO_CATALOGUE_VERSION = 1
+RADIO_CATALOGUE_FULL_SYNC_INTERVAL = datetime.timedelta(days=7)
+RADIO_CATALOGUE_SYNC_INTERVAL_MINUTES = 60
+RADIO_CATALOGUE_CHANGES_PAGE_SIZE = 10_000
+# Change records only hold part of a station, changed stations are fetched again in batches of this size
+RADIO_CATALOGUE_STATIONS_BATCH_SIZE = 100
+RADIO_CATALOGUE_MAX_PREFIX_TERMS = 500
+RADIO_CATALOGUE_MAX_TRIGRAM_TERMS = 500
+RADIO_CATALOGUE_MAX_TRIGRAM_POSTINGS = 5_000
@@ -44,6 +44,7 @@ LAVALINK_COMMIT_LINE = re.compile(rb"Commit:\s+(?P<commit>.+?)\n")
 LAVALINK_VERSION_LINE = re.compile(rb"Version:\s+(?P<version>.+?)\n")
 LAVALINK__READY_LINE = re.compile(rb"Lavalink is ready to accept connections")
 LAVALINK_FAILED_TO_START = re.compile(rb"Web server failed to start\. (.*)")
+JVM_GC_PAUSE_LINE = re.compile(rb"\[gc\s*\]\s*GC\(\d+\) Pause.*?(?P<duration>\d+(?:\.\d+)?)ms\s*$")
 
 # noinspection SpellCheckingInspection
 SOURCE_INPUT_MATCH_CLYPIT = re.compile(r"(http://|https://(www.)?)?clyp\.it/(.*)", re.IGNORECASE)
@@ -30,7 +30,6 @@ from pylav import VERSION
 
 # noinspection PyProtectedMember
 from pylav._internals.functions import add_property
-from pylav.compat import json
 from pylav.constants import MAX_RECURSION_DEPTH
 from pylav.constants.config import (
     CONFIG_DIR,
@@ -56,6 +55,7 @@ from pylav.constants.config import (
     overrides,
 )
 from pylav.constants.playlists import BUNDLED_DEEZER_PLAYLIST_IDS, BUNDLED_PLAYLIST_IDS, BUNDLED_SPOTIFY_PLAYLIST_IDS
+from pylav.constants.radio import RADIO_CATALOGUE_SYNC_INTERVAL_MINUTES
 from pylav.core.bot_overrides import get_context, process_commands
 from pylav.core.context import PyLavContext
 from pylav.events.base import PyLavEvent
@@ -65,6 +65,7 @@ from pylav.exceptions.node import NoNodeAvailableException, NoNodeWithRequestFun
 from pylav.exceptions.request import HTTPException
 from pylav.extension.bundled_node import LAVALINK_DOWNLOAD_DIR
 from pylav.extension.bundled_node.manager import LocalNodeManager
+from pylav.extension.bundled_node.pool import LocalNodePool
 from pylav.extension.m3u import M3UParser
 from pylav.extension.radio import RadioBrowser
 from pylav.helpers.singleton import SingletonCallable, SingletonClass
@@ -73,11 +74,14 @@ from pylav.logging import getLogger
 from pylav.nodes.api.responses import rest_api
 from pylav.nodes.api.responses.route_planner import Status as RoutePlannerStatus
 from pylav.nodes.api.responses.track import Track as Track_namespace_conflict
+from pylav.nodes.hedging import HedgedLoader
 from pylav.nodes.manager import NodeManager
 from pylav.nodes.node import Node
 from pylav.players.manager import PlayerController
+from pylav.players.now_playing import NowPlayingService
 from pylav.players.player import Player
 from pylav.players.query.obj import Query
+from pylav.players.stream_metadata import StreamMetadataService
 from pylav.players.tracks.decoder import decode_track
 from pylav.players.tracks.obj import Track
 from pylav.storage.controllers.config import ConfigController
@@ -97,6 +101,7 @@ from pylav.storage.models.player.state import PlayerState
 from pylav.type_hints.bot import DISCORD_BOT_TYPE, DISCORD_COG_TYPE, DISCORD_CONTEXT_TYPE, DISCORD_INTERACTION_TYPE
 from pylav.utils.aiohttp_postgres_cache import PostgresCacheBackend
 from pylav.utils.localtracks import LocalTrackCache
+from pylav.utils.transport import HTTPTransport
 
 try:
     from redbot.core.i18n import Translator
@@ -143,6 +148,7 @@ class Client(metaclass=SingletonClass):
     """
 
     _local_node_manager: LocalNodeManager
+    _local_node_pool: LocalNodePool
     _asyncio_lock = asyncio.Lock()
     _config: Config
     __cogs_registered = set()
@@ -201,9 +207,13 @@ class Client(metaclass=SingletonClass):
                     expire_after=datetime.timedelta(days=1),
                     timeout=2.5,
                 )
-            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30), json_serialize=json.dumps)
-            self._cached_session = aiohttp_client_cache.CachedSession(
-                timeout=aiohttp.ClientTimeout(total=30), json_serialize=json.dumps, cache=self._aiohttp_client_cache
+            self._http_transport = HTTPTransport()
+            self._hedged_loader = HedgedLoader()
+            self._stream_metadata = StreamMetadataService(self)
+            self._now_playing = NowPlayingService(self)
+            self._session = self._http_transport.session(timeout=aiohttp.ClientTimeout(total=30))
+            self._cached_session = self._http_transport.cached_session(
+                cache=self._aiohttp_client_cache, timeout=aiohttp.ClientTimeout(total=30)
             )
             # Attach the Client to the necessary objects
             CachedModel.attach_client(self)
@@ -331,6 +341,11 @@ class Client(metaclass=SingletonClass):
         """Returns the radio browser instance"""
         return self._radio_manager
 
+    @property
+    def m3u_parser(self) -> M3UParser:
+        """Returns the M3U parser instance"""
+        return self._m3u8parser
+
     @property
     def dispatch_manager(self) -> DispatchManager:
         """Returns the dispatch manager"""
@@ -383,9 +398,14 @@ class Client(metaclass=SingletonClass):
 
     @property
     def managed_node_controller(self) -> LocalNodeManager:
-        """Returns the local node manager"""
+        """Returns the local node manager of the first managed node"""
         return self._local_node_manager
 
+    @property
+    def managed_node_pool(self) -> LocalNodePool:
+        """Returns the pool of all the managed nodes"""
+        return self._local_node_pool
+
     @property
     def node_manager(self) -> NodeManager:
         """Returns the node manager"""
@@ -416,6 +436,26 @@ class Client(metaclass=SingletonClass):
         """Returns the cached aiohttp session used by the PyLav client"""
         return self._cached_session
 
+    @property
+    def http_transport(self) -> HTTPTransport:
+        """Returns the connection pool shared by all of PyLav's HTTP sessions"""
+        return self._http_transport
+
+    @property
+    def hedged_loader(self) -> HedgedLoader:
+        """Returns the loader used to hedge slow track loads across nodes, set its `enabled` attribute to toggle it"""
+        return self._hedged_loader
+
+    @property
+    def stream_metadata(self) -> StreamMetadataService:
+        """Returns the service following the titles of live streams"""
+        return self._stream_metadata
+
+    @property
+    def now_playing(self) -> NowPlayingService:
+        """Returns the service keeping live now playing messages up to date"""
+        return self._now_playing
+
     @property
     def lib_version(self) -> Version:
         """Returns the version of the PyLav library"""
@@ -528,7 +568,8 @@ class Client(metaclass=SingletonClass):
 
     async def _run_post_init_jobs(self, java_path) -> None:
         self._user_id = str(self._bot.user.id)
-        self._local_node_manager = LocalNodeManager(self)
+        self._local_node_pool = LocalNodePool(self)
+        self._local_node_manager = self._local_node_pool.primary
         enable_managed_node = await self.managed_node_is_enabled()
         if IN_CONTAINER:
             LOGGER.warning("Running in container, disabling managed node")
@@ -543,6 +584,8 @@ class Client(metaclass=SingletonClass):
         await self._maybe_update_next_execution_external_playlists(time_now)
         await self._maybe_force_update_bundled_playlists()
         await self._add_scheduler_job_cache_cleanup()
+        await self._add_scheduler_job_http_cache_sweep()
+        await self._add_scheduler_job_radio_catalogue_sync()
         await self._add_scheduler_job_bundled_playlist()
         await self._add_scheduler_job_bundled_external_playlists()
         await self._add_scheduler_job_external_playlists()
@@ -552,7 +595,7 @@ class Client(metaclass=SingletonClass):
     async def _maybe_start_bundled_node(self, enable_managed_node: bool, java_path: str) -> None:
         # noinspection PyProtectedMember
         if enable_managed_node:
-            await self._local_node_manager.start(java_path=java_path)
+            await self._local_node_pool.start(java_path=java_path)
         else:
             self._local_node_manager.ready.set()
 
@@ -574,7 +617,7 @@ class Client(metaclass=SingletonClass):
     async def _maybe_wait_until_bundled_node(self, enable_managed_node):
         # noinspection PyProtectedMember
         if enable_managed_node:
-            await self._local_node_manager.wait_until_connected()
+            await self._local_node_pool.wait_until_connected()
 
     async def _wait_until_ready(self):
         if hasattr(self.bot, "wait_until_red_ready"):
@@ -707,6 +750,32 @@ class Client(metaclass=SingletonClass):
             id=f"{self.bot.user.id}-cache_delete_old",
         )
 
+    async def _add_scheduler_job_http_cache_sweep(self):
+        if not isinstance(self._aiohttp_client_cache, PostgresCacheBackend):
+            return
+        self._scheduler.add_job(
+            self._aiohttp_client_cache.sweep,
+            trigger="interval",
+            seconds=600,
+            max_instances=1,
+            replace_existing=True,
+            name="http_cache_sweep",
+            coalesce=True,
+            id=f"{self.bot.user.id}-http_cache_sweep",
+        )
+
+    async def _add_scheduler_job_radio_catalogue_sync(self):
+        self._scheduler.add_job(
+            self._radio_manager.sync_catalogue,
+            trigger="interval",
+            minutes=RADIO_CATALOGUE_SYNC_INTERVAL_MINUTES,
+            max_instances=1,
+            replace_existing=True,
+            name="radio_catalogue_sync",
+            coalesce=True,
+            id=f"{self.bot.user.id}-radio_catalogue_sync",
+        )
+
     async def _maybe_update_next_execution_external_playlists(self, time_now):
         if await self._config.fetch_next_execution_update_external_playlists() is None:
             await self._config.update_next_execution_update_external_playlists(
@@ -1038,7 +1107,7 @@ class Client(metaclass=SingletonClass):
         event: :class:`Event`
             The event to dispatch to the hooks.
         """
-        event_dispatcher = [self._dispatch_manager.dispatch]
+        event_dispatcher = [self._dispatch_manager.dispatch, self._now_playing.on_event]
 
         task_list = []
         for hook in itertools.chain(
@@ -1089,9 +1158,12 @@ class Client(metaclass=SingletonClass):
                         await self.player_manager.save_all_players()
                         await self.player_manager.shutdown()
                         await self._node_manager.close()
-                        await self._local_node_manager.shutdown()
+                        await self._local_node_pool.shutdown()
+                        await self._stream_metadata.close()
+                        await self._now_playing.close()
                         await self._session.close()
                         await self._cached_session.close()
+                        await self._http_transport.close()
 
                         if self._scheduler:
                             with contextlib.suppress(Exception):
@@ -1304,7 +1376,14 @@ class Client(metaclass=SingletonClass):
                 ),
                 query.requires_capability,
             )
-        return await node.get_track(query, first=first, bypass_cache=bypass_cache)
+        return await self._hedged_loader.get_track(
+            node,
+            self.node_manager.available_nodes,
+            query,
+            first=first,
+            bypass_cache=bypass_cache,
+            region=player.region if player else None,
+        )
 
     async def get_all_tracks_for_queries(
         self,
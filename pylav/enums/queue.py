@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from enum import IntEnum
+
+
+class ShuffleMode(IntEnum):
+    """
+    How the queue is shuffled
+    """
+
+    # Every order is equally likely
+    Random = 0
+    # Requesters take turns, the tracks of each requester are shuffled
+    RoundRobin = 1
+    # Only the tracks added last are moved, each to a random position
+    NewTracks = 2
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from enum import IntEnum
+
+
+class RequestPriority(IntEnum):
+    """
+    Priority of a REST request sent to a node, lower values are sent first
+    """
+
+    Critical = 0
+    Normal = 1
+    Bulk = 2
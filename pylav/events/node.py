@@ -8,6 +8,7 @@ from pylav.events.base import PyLavEvent
 
 if TYPE_CHECKING:
     from pylav.nodes.api.responses.websocket import Closed
+    from pylav.nodes.migration import MigrationReport
     from pylav.nodes.node import Node
     from pylav.players.player import Player
 
@@ -53,6 +54,69 @@ class NodeConnectedEvent(PyLavEvent):
         self.node = node
 
 
+class NodeDrainingEvent(PyLavEvent):
+    """This event is dispatched when a node starts or stops draining,
+    either because of its health score or because it was drained with :meth:`NodeManager.drain_node`.
+
+    A draining node stays connected and keeps its players, but new players are only sent to it
+    if no other node is available.
+
+    Event can be listened to by adding a listener with the name `pylav_node_draining_event`.
+
+    Attributes
+    ----------
+    node: :class:`Node`
+        The node whose state changed.
+    draining: :class:`bool`
+        Whether the node is now draining.
+    score: :class:`float`
+        The health score of the node.
+    """
+
+    __slots__ = ("node", "draining", "score")
+
+    def __init__(self, node: Node, draining: bool, score: float) -> None:
+        self.node = node
+        self.draining = draining
+        self.score = score
+
+
+class NodeDrainedEvent(PyLavEvent):
+    """This event is dispatched when a node drained with :meth:`NodeManager.drain_node` has no players left,
+    so it can be restarted or removed without interrupting playback.
+
+    Event can be listened to by adding a listener with the name `pylav_node_drained_event`.
+
+    Attributes
+    ----------
+    node: :class:`Node`
+        The node that was drained.
+    """
+
+    __slots__ = ("node",)
+
+    def __init__(self, node: Node) -> None:
+        self.node = node
+
+
+class PlayersMigratedEvent(PyLavEvent):
+    """This event is dispatched when PyLav finishes moving a batch of players to other nodes,
+    for example after a node disconnects.
+
+    Event can be listened to by adding a listener with the name `pylav_players_migrated_event`.
+
+    Attributes
+    ----------
+    report: :class:`MigrationReport`
+        The report of the migration, including how many players were moved and how long they were silent for.
+    """
+
+    __slots__ = ("report",)
+
+    def __init__(self, report: MigrationReport) -> None:
+        self.report = report
+
+
 class NodeChangedEvent(PyLavEvent):
     """This event is dispatched when a player changes to another node.
     Keep in mind this event can be dispatched multiple times if a node
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 
 import discord
 
+from pylav.enums.queue import ShuffleMode
 from pylav.events.base import PyLavEvent
 
 if TYPE_CHECKING:
@@ -86,6 +87,8 @@ class QueueShuffledEvent(PyLavEvent):
         The player whose queue was shuffled.
     requester: :class:`discord.Member`
         The user who requested the change.
+    mode: :class:`ShuffleMode`
+        How the queue was shuffled.
 
     Parameters
     ----------
@@ -93,13 +96,16 @@ class QueueShuffledEvent(PyLavEvent):
         The player whose queue was shuffled.
     requester: :class:`discord.Member`
         The user who requested the change.
+    mode: :class:`ShuffleMode`
+        How the queue was shuffled.
     """
 
-    __slots__ = ("player", "requester")
+    __slots__ = ("player", "requester", "mode")
 
-    def __init__(self, player: Player, requester: discord.Member) -> None:
+    def __init__(self, player: Player, requester: discord.Member, mode: ShuffleMode = ShuffleMode.Random) -> None:
         self.player = player
         self.requester = requester
+        self.mode = mode
 
 
 class QueueTracksRemovedEvent(PyLavEvent):
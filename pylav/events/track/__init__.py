@@ -227,3 +227,30 @@ class TrackSkippedEvent(PyLavEvent):
         self.track = track
         self.requester = requester
         self.position = position
+
+
+class TrackStreamTitleChangedEvent(PyLavEvent):
+    """This event is dispatched when the title announced by a live stream changes.
+
+    Event can be listened to by adding a listener with the name `pylav_track_stream_title_changed_event`.
+
+    Attributes
+    ----------
+    player: :class:`Player`
+        The player that is playing the stream.
+    track: :class:`Track`
+        The stream being played.
+    title: :class:`str`
+        The new title of the stream.
+    previous_title: Optional[:class:`str`]
+        The previous title of the stream, if one was known.
+
+    """
+
+    __slots__ = ("player", "track", "title", "previous_title")
+
+    def __init__(self, player: Player, track: Track, title: str, previous_title: str | None) -> None:
+        self.player = player
+        self.track = track
+        self.title = title
+        self.previous_title = previous_title
@@ -11,7 +11,6 @@ import shutil
 import tempfile
 from typing import TYPE_CHECKING, Any
 
-import aiohttp
 import aiopath
 import dateutil
 import dateutil.parser
@@ -24,10 +23,16 @@ from pylav._internals.functions import get_true_path
 from pylav.compat import json
 from pylav.constants.config import JAVA_EXECUTABLE
 from pylav.constants.misc import EPOCH_DT_TZ_AWARE
-from pylav.constants.node import JAR_SERVER_RELEASES
+from pylav.constants.node import (
+    JAR_SERVER_RELEASES,
+    MANAGED_NODE_DRAIN_TIMEOUT,
+    MANAGED_NODE_TELEMETRY_INTERVAL,
+    NODE_DRAIN_INTERVAL,
+)
 from pylav.constants.regex import (
     JAVA_VERSION_LINE_223,
     JAVA_VERSION_LINE_PRE223,
+    JVM_GC_PAUSE_LINE,
     LAVALINK__READY_LINE,
     LAVALINK_BRANCH_LINE,
     LAVALINK_BUILD_LINE,
@@ -57,6 +62,7 @@ from pylav.exceptions.node import (
     WebsocketNotConnectedException,
 )
 from pylav.extension.bundled_node import LAVALINK_APP_YML, LAVALINK_DOWNLOAD_DIR, LAVALINK_JAR_FILE, USING_FORCED
+from pylav.extension.bundled_node.telemetry import ProcessTelemetry
 from pylav.extension.bundled_node.utils import change_dict_naming_convention, get_jar_ram_actual
 from pylav.helpers.misc import ExponentialBackoffWithReset
 from pylav.logging import getLogger
@@ -77,13 +83,29 @@ except ImportError:
 
 if TYPE_CHECKING:
     from pylav.core.client import Client
+    from pylav.extension.bundled_node.pool import LocalNodePool
 
 
 LOGGER = getLogger("PyLav.ManagedNode")
 
 
 class LocalNodeManager:
-    """A manager for a local Lavalink node."""
+    """A manager for a local Lavalink node.
+
+    Parameters
+    ----------
+    client: :class:`Client`
+        The PyLav client.
+    timeout: :class:`int`
+        How long to wait for the node to be ready.
+    instance: :class:`int`
+        The index of the node in its :class:`LocalNodePool`, the first instance owns the Lavalink jar and
+        runs from the Lavalink folder, the others run from their own folder on the following ports.
+    command: :class:`list`[:class:`str`]
+        The command to run instead of Lavalink, for example a stub process that prints the Lavalink ready line.
+    pool: :class:`LocalNodePool`
+        The pool this node belongs to.
+    """
 
     __slots__ = (
         "ready",
@@ -117,9 +139,22 @@ class LocalNodeManager:
         "_version",
         "__buffer_task",
         "_disabled",
+        "_instance",
+        "_command",
+        "_pool",
+        "_telemetry",
+        "_telemetry_task",
     )
 
-    def __init__(self, client: Client, timeout: int | None = None) -> None:
+    def __init__(
+        self,
+        client: Client,
+        timeout: int | None = None,
+        *,
+        instance: int = 0,
+        command: list[str] | None = None,
+        pool: LocalNodePool | None = None,
+    ) -> None:
         self._java_available: bool | None = None
         self._java_version: tuple[int, int] | None = None
         self._up_to_date: bool | None = None
@@ -143,8 +178,12 @@ class LocalNodeManager:
         self.start_monitor_task = None
         self.timeout = timeout
         self._args = []
-        self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=120), json_serialize=json.dumps)
-        self._node_id: int = self._client.bot.user.id
+        self._session = self._client.http_transport.session()
+        self._instance = instance
+        self._command = command
+        self._pool = pool
+        # Additional instances use the IDs right after the bot's ID, which is the ID of the first instance
+        self._node_id: int = self._client.bot.user.id + instance
         self._node: Node | None = None
         self._current_config = {}
         self.abort_for_unmanaged: asyncio.Event = asyncio.Event()
@@ -153,6 +192,8 @@ class LocalNodeManager:
         self._java_path = None
         self.__buffer_task = None
         self._disabled = True
+        self._telemetry = ProcessTelemetry()
+        self._telemetry_task: asyncio.Task | None = None
 
     @property
     def disabled(self) -> bool:
@@ -164,6 +205,36 @@ class LocalNodeManager:
         """The node object."""
         return self._node
 
+    @property
+    def instance(self) -> int:
+        """The index of the node in its pool."""
+        return self._instance
+
+    @property
+    def node_id(self) -> int:
+        """The identifier of the node in the node manager."""
+        return self._node_id
+
+    @property
+    def pid(self) -> int | None:
+        """The PID of the Lavalink process, 0 if an unmanaged Lavalink process is being used instead."""
+        return self._node_pid
+
+    @property
+    def telemetry(self) -> ProcessTelemetry:
+        """The resource usage of the Lavalink process."""
+        return self._telemetry
+
+    @property
+    def working_directory(self) -> aiopath.AsyncPath:
+        """The folder Lavalink is started in."""
+        return LAVALINK_DOWNLOAD_DIR if self._instance == 0 else LAVALINK_DOWNLOAD_DIR / f"instance-{self._instance}"
+
+    @property
+    def config_file(self) -> aiopath.AsyncPath:
+        """The application.yml file used by Lavalink."""
+        return LAVALINK_APP_YML if self._instance == 0 else self.working_directory / "application.yml"
+
     @property
     def path(self) -> str | None:
         """The path to the Lavalink jar file."""
@@ -239,12 +310,22 @@ class LocalNodeManager:
                 _("You are attempting to run the managed Lavalink node on an unsupported machine architecture.")
             )
         await self.process_settings()
-        possible_lavalink_processes = await self.get_lavalink_process(lazy_match=True)
-        if possible_lavalink_processes:
-            await self.process_existing_lavalink_processes(possible_lavalink_processes)
-
-        await self.maybe_download_jar()
-        args, msg = await self._get_jar_args()
+        # Only the first instance may fall back to an unmanaged Lavalink process, the others are extra capacity
+        if self._instance == 0:
+            possible_lavalink_processes = await self.get_lavalink_process(lazy_match=True)
+            if self._pool is not None:
+                possible_lavalink_processes = [
+                    p for p in possible_lavalink_processes if p.get("pid") not in self._pool.pids
+                ]
+            if possible_lavalink_processes:
+                await self.process_existing_lavalink_processes(possible_lavalink_processes)
+
+        if self._command is not None:
+            args, msg = list(self._command), None
+        else:
+            if self._instance == 0:
+                await self.maybe_download_jar()
+            args, msg = await self._get_jar_args()
         if msg is not None:
             LOGGER.warning(msg)
         command_string = shlex.join(args)
@@ -254,12 +335,16 @@ class LocalNodeManager:
         try:
             self._proc = await asyncio.subprocess.create_subprocess_exec(  # pylint:disable=no-member
                 *args,
-                cwd=str(LAVALINK_DOWNLOAD_DIR),
+                cwd=str(self.working_directory),
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.DEVNULL,
             )
             self._node_pid = self._proc.pid
             LOGGER.info("Managed Lavalink node started. PID: %s", self._node_pid)
+            with contextlib.suppress(psutil.Error):
+                self._telemetry.attach(self._node_pid)
+                self._telemetry_task = asyncio.create_task(self._telemetry_loop())
+                self._telemetry_task.set_name(f"LavalinkManagedNode.telemetry.{self._instance}")
             try:
                 await asyncio.wait_for(self._wait_for_launcher(), timeout=self.timeout)
             except TimeoutError:
@@ -322,8 +407,14 @@ class LocalNodeManager:
         await self.maybe_update_spotify_country_code(data)
         await self.maybe_update_tts_country_code(data)
 
+        if self._instance != 0:
+            data["server"]["port"] += self._instance
+            # Share the plugins downloaded by the first instance rather than downloading them again
+            data["lavalink"]["pluginsDir"] = str(LAVALINK_DOWNLOAD_DIR / "plugins")
+            await self.working_directory.mkdir(parents=True, exist_ok=True)
+
         self._current_config = data
-        async with LAVALINK_APP_YML.open("w") as f:
+        async with self.config_file.open("w") as f:
             await f.write(yaml.safe_dump(data))
 
     @staticmethod
@@ -423,6 +514,8 @@ class LocalNodeManager:
         elif meta[0] is not None:
             invalid = "Managed Lavalink node RAM allocation ignored due to system limitations, please fix this"
 
+        # Log garbage collection pauses to stdout so they can be tracked by the telemetry
+        command_args.append("-Xlog:gc:stdout")
         command_args.extend(["-jar", str(LAVALINK_JAR_FILE)])
         self._args = command_args
         return command_args, invalid
@@ -484,8 +577,36 @@ class LocalNodeManager:
         )
 
     async def __consume_buffer(self) -> None:
-        async for __ in self._proc.stdout:
-            pass
+        async for line in self._proc.stdout:
+            if match := JVM_GC_PAUSE_LINE.search(line):
+                self._telemetry.record_gc_pause(float(match["duration"]))
+
+    async def _telemetry_loop(self) -> None:
+        while True:
+            await asyncio.sleep(MANAGED_NODE_TELEMETRY_INTERVAL)
+            if await self._telemetry.sample() is None:
+                continue
+            if not self.ready.is_set() or not (reasons := self._telemetry.breaches()):
+                continue
+            LOGGER.warning(
+                "Managed Lavalink node %s is degraded (%s), draining and restarting it",
+                self._instance,
+                ", ".join(reasons),
+            )
+            await self.drain_and_restart()
+            return
+
+    async def drain_and_restart(self, timeout: float = MANAGED_NODE_DRAIN_TIMEOUT) -> None:
+        """Move the players of the node to the other nodes, then restart it.
+
+        Playing players are given until the timeout to reach the end of their track,
+        any player left after that is moved when the node disconnects.
+        """
+        if (node := self._node) is not None:
+            await self._client.node_manager.drain_node(node, timeout=timeout)
+            with contextlib.suppress(asyncio.TimeoutError):
+                await node.wait_until_drained(timeout=timeout + NODE_DRAIN_INTERVAL)
+        await self.restart()
 
     async def _wait_for_launcher(self) -> None:
         LOGGER.info("Waiting for Managed Lavalink node to be ready")
@@ -534,6 +655,10 @@ class LocalNodeManager:
         if self.__buffer_task is not None:
             self.__buffer_task.cancel()
             self.__buffer_task = None
+        if self._telemetry_task is not None and self._telemetry_task is not asyncio.current_task():
+            self._telemetry_task.cancel()
+        self._telemetry_task = None
+        self._telemetry.reset()
         await self.maybe_kill_existing_process()
         await self.maybe_kill_alive_process()
         self._proc = None
@@ -799,7 +924,7 @@ class LocalNodeManager:
         await self._partial_shutdown()
         for process in iter(
             await self.get_lavalink_process(
-                "-Djdk.tls.client.protocols=TLSv1.2", "-Xms64M", "-jar", cwd=str(LAVALINK_DOWNLOAD_DIR)
+                "-Djdk.tls.client.protocols=TLSv1.2", "-Xms64M", "-jar", cwd=str(self.working_directory)
             )
         ):
             with contextlib.suppress(psutil.Error):
@@ -846,15 +971,20 @@ class LocalNodeManager:
         self._java_path = java_path
         if self.start_monitor_task is not None:
             await self.shutdown()
-            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=120), json_serialize=json.dumps)
+            self._session = self._client.http_transport.session()
         if self.__buffer_task is not None:
             self.__buffer_task.cancel()
             self.__buffer_task = None
         self._wait_for.clear()
 
-        await update_plugins(self._client)
+        if self._instance == 0:
+            await update_plugins(self._client)
         self.start_monitor_task = asyncio.create_task(self.start_monitor(java_path))
-        self.start_monitor_task.set_name("LavalinkManagedNode.health_monitor")
+        self.start_monitor_task.set_name(
+            "LavalinkManagedNode.health_monitor"
+            if self._instance == 0
+            else f"LavalinkManagedNode-{self._instance}.health_monitor"
+        )
 
     async def connect_node(self, reconnect: bool, wait_for: float = 0.0, external_fallback: bool = False) -> None:
         """Connect to the managed node."""
@@ -904,6 +1034,9 @@ class LocalNodeManager:
             if external_fallback
             else f"PyLavManagedNode: {self._node_pid}"
         )
+        unique_identifier = (
+            self._client.node_db_manager.bundled_node_config().id if self._instance == 0 else self._node_id
+        )
         data["yaml"]["sentry"]["tags"]["pylav_version"] = self._client.lib_version
         node = self._node = await self._client.add_node(
             host=self._current_config["server"]["address"],
@@ -914,7 +1047,7 @@ class LocalNodeManager:
             managed=True,
             ssl=False,
             search_only=False,
-            unique_identifier=self._client.node_db_manager.bundled_node_config().id,
+            unique_identifier=unique_identifier,
             temporary=True,
         )
         await node.config.update_name(name)
@@ -948,7 +1081,7 @@ class LocalNodeManager:
     async def restart(self, java_path: str = None) -> None:
         """Restart the managed node."""
         LOGGER.info("Restarting managed Lavalink node")
-        if node := self._client.get_my_node():
+        if node := self._client.node_manager.get_node_by_id(self._node_id):
             if self.start_monitor_task is not None:
                 self.start_monitor_task.cancel()
                 self.start_monitor_task = None
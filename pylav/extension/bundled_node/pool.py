@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING
+
+from pylav.constants.config import MANAGED_NODE_INSTANCES
+from pylav.constants.node import NODE_DRAIN_INTERVAL, NODE_DRAIN_TIMEOUT
+from pylav.extension.bundled_node.manager import LocalNodeManager
+from pylav.logging import getLogger
+
+if TYPE_CHECKING:
+    from pylav.core.client import Client
+    from pylav.nodes.node import Node
+
+
+LOGGER = getLogger("PyLav.ManagedNodePool")
+
+
+class LocalNodePool:
+    """A pool of managed Lavalink nodes running on this machine.
+
+    Each node is a separate Lavalink process with its own port, configuration and health monitor,
+    so players are spread across the processes and a crash only affects the players of a single process.
+    The first node is the same managed node PyLav has always run, the others are only started once it is ready,
+    so the Lavalink jar is only downloaded once.
+
+    Parameters
+    ----------
+    client: :class:`Client`
+        The PyLav client.
+    size: :class:`int`
+        The number of Lavalink processes to run.
+    timeout: :class:`int`
+        How long to wait for each node to be ready.
+    command: :class:`list`[:class:`str`]
+        The command to run instead of Lavalink, for example a stub process that prints the Lavalink ready line.
+    """
+
+    __slots__ = ("_client", "_managers", "_java_path", "_secondary_start_task", "_restart_lock")
+
+    def __init__(
+        self,
+        client: Client,
+        size: int = MANAGED_NODE_INSTANCES,
+        timeout: int | None = None,
+        command: list[str] | None = None,
+    ) -> None:
+        self._client = client
+        self._managers = [
+            LocalNodeManager(client, timeout, instance=instance, command=command, pool=self)
+            for instance in range(max(size, 1))
+        ]
+        self._java_path: str | None = None
+        self._secondary_start_task: asyncio.Task | None = None
+        self._restart_lock = asyncio.Lock()
+
+    @property
+    def primary(self) -> LocalNodeManager:
+        """The manager of the first node, which downloads and updates Lavalink."""
+        return self._managers[0]
+
+    @property
+    def managers(self) -> list[LocalNodeManager]:
+        """The managers of all the nodes in the pool."""
+        return list(self._managers)
+
+    @property
+    def size(self) -> int:
+        """The number of nodes in the pool."""
+        return len(self._managers)
+
+    @property
+    def pids(self) -> set[int]:
+        """The PIDs of the running Lavalink processes."""
+        return {manager.pid for manager in self._managers if manager.pid}
+
+    @property
+    def nodes(self) -> list[Node]:
+        """The nodes of the pool which are connected to the node manager."""
+        return [manager.node for manager in self._managers if manager.node is not None]
+
+    def get_manager(self, node_id: int) -> LocalNodeManager | None:
+        """Get the manager of the node with the given identifier, if it belongs to the pool."""
+        return next((manager for manager in self._managers if manager.node_id == node_id), None)
+
+    async def start(self, java_path: str) -> None:
+        """Start all the nodes in the pool."""
+        self._java_path = java_path
+        await self.primary.start(java_path=java_path)
+        if self.size > 1:
+            self._secondary_start_task = asyncio.create_task(self._start_secondaries(java_path))
+            self._secondary_start_task.set_name("LavalinkManagedNodePool.start")
+
+    async def _start_secondaries(self, java_path: str) -> None:
+        await self.primary.wait_until_ready()
+        if self.primary.pid == 0:
+            LOGGER.warning(
+                "Using an unmanaged Lavalink node, the other %s managed nodes won't be started", self.size - 1
+            )
+            return
+        LOGGER.info("Starting %s additional managed Lavalink nodes", self.size - 1)
+        await asyncio.gather(*(manager.start(java_path=java_path) for manager in self._managers[1:]))
+
+    async def wait_until_connected(self, timeout: float | None = None) -> None:
+        """Wait until all the nodes in the pool are connected."""
+        await self.primary.wait_until_connected(timeout=timeout)
+        if self._secondary_start_task is not None:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(asyncio.shield(self._secondary_start_task), timeout=timeout)
+        await asyncio.gather(
+            *(manager.wait_until_connected(timeout=timeout) for manager in self._managers[1:] if not manager.disabled)
+        )
+
+    async def shutdown(self) -> None:
+        """Shut down all the nodes in the pool."""
+        if self._secondary_start_task is not None:
+            self._secondary_start_task.cancel()
+            self._secondary_start_task = None
+        await asyncio.gather(*(manager.shutdown() for manager in reversed(self._managers)))
+
+    async def rolling_restart(self, java_path: str = None, drain_timeout: float = NODE_DRAIN_TIMEOUT) -> None:
+        """Restart the nodes one at a time.
+
+        Each node is drained first and is only restarted once the previous one is connected again,
+        so the players of the node being restarted move at the end of their track and always have somewhere to go.
+        """
+        async with self._restart_lock:
+            for manager in self._managers:
+                if manager.disabled:
+                    continue
+                LOGGER.info("Rolling restart of managed Lavalink node %s/%s", manager.instance + 1, self.size)
+                if (node := manager.node) is not None:
+                    await self._client.node_manager.drain_node(node, timeout=drain_timeout)
+                    with contextlib.suppress(asyncio.TimeoutError):
+                        await node.wait_until_drained(timeout=drain_timeout + NODE_DRAIN_INTERVAL)
+                await manager.restart(java_path=java_path or self._java_path)
+                await manager.wait_until_connected()
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import dataclasses
+import time
+from typing import Any
+
+import psutil
+
+try:
+    import resource
+except ImportError:
+    # Only available on Unix
+    resource = None
+
+from pylav.constants.config import (
+    MANAGED_NODE_MAX_CPU_PERCENT,
+    MANAGED_NODE_MAX_FD_RATIO,
+    MANAGED_NODE_MAX_GC_PAUSE_MS,
+    MANAGED_NODE_MAX_RSS_GROWTH_MB_PER_HOUR,
+    MANAGED_NODE_MAX_RSS_MB,
+)
+from pylav.constants.node import MANAGED_NODE_TELEMETRY_SUSTAINED_SAMPLES, MANAGED_NODE_TELEMETRY_WINDOW
+
+
+@dataclasses.dataclass(eq=False, slots=True, kw_only=True)
+class ProcessSample:
+    """A single measurement of the resources used by a process"""
+
+    timestamp: float
+    rss: int
+    cpu_percent: float
+    num_fds: int | None
+    num_threads: int
+
+
+@dataclasses.dataclass(eq=False, slots=True, kw_only=True)
+class TelemetryThresholds:
+    """The limits above which a managed Lavalink process is considered degraded, 0 disables a limit"""
+
+    max_rss_mb: float = MANAGED_NODE_MAX_RSS_MB
+    max_rss_growth_mb_per_hour: float = MANAGED_NODE_MAX_RSS_GROWTH_MB_PER_HOUR
+    max_cpu_percent: float = MANAGED_NODE_MAX_CPU_PERCENT
+    max_gc_pause_ms: float = MANAGED_NODE_MAX_GC_PAUSE_MS
+    max_fd_ratio: float = MANAGED_NODE_MAX_FD_RATIO
+    sustained_samples: int = MANAGED_NODE_TELEMETRY_SUSTAINED_SAMPLES
+
+
+def _fd_limit(process: psutil.Process) -> int | None:
+    # noinspection PyBroadException
+    try:
+        soft, __ = process.rlimit(psutil.RLIMIT_NOFILE)
+    except Exception:  # noqa
+        # rlimit of another process is only available on Linux, children inherit ours otherwise
+        if resource is None:
+            return None
+        soft, __ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    return soft if soft > 0 else None
+
+
+def _read_sample(process: psutil.Process) -> ProcessSample:
+    with process.oneshot():
+        try:
+            num_fds = process.num_fds()
+        except (AttributeError, psutil.AccessDenied):
+            # Not available on Windows
+            num_fds = None
+        return ProcessSample(
+            timestamp=time.monotonic(),
+            rss=process.memory_info().rss,
+            # Normalised so that 100% means every core is busy
+            cpu_percent=process.cpu_percent(interval=None) / (psutil.cpu_count() or 1),
+            num_fds=num_fds,
+            num_threads=process.num_threads(),
+        )
+
+
+class ProcessTelemetry:
+    """Rolling resource usage of a managed Lavalink process.
+
+    Samples are taken with psutil by :meth:`sample`, and JVM garbage collection pauses are fed in from the
+    process output by :meth:`record_gc_pause`, only the last :data:`MANAGED_NODE_TELEMETRY_WINDOW` of each are kept.
+    """
+
+    __slots__ = ("_process", "_samples", "_gc_pauses", "_fd_limit", "thresholds")
+
+    def __init__(
+        self, thresholds: TelemetryThresholds | None = None, window: int = MANAGED_NODE_TELEMETRY_WINDOW
+    ) -> None:
+        self._process: psutil.Process | None = None
+        self._samples: collections.deque[ProcessSample] = collections.deque(maxlen=window)
+        self._gc_pauses: collections.deque[tuple[float, float]] = collections.deque(maxlen=window * 10)
+        self._fd_limit: int | None = None
+        self.thresholds = thresholds or TelemetryThresholds()
+
+    @property
+    def pid(self) -> int | None:
+        """The PID of the process being sampled"""
+        return self._process.pid if self._process is not None else None
+
+    @property
+    def samples(self) -> list[ProcessSample]:
+        """The samples in the window, oldest first"""
+        return list(self._samples)
+
+    @property
+    def latest(self) -> ProcessSample | None:
+        """The most recent sample"""
+        return self._samples[-1] if self._samples else None
+
+    def attach(self, pid: int) -> None:
+        """Start sampling the process with the given PID, forgetting the samples of the previous process"""
+        self.reset()
+        self._process = psutil.Process(pid)
+        # The first call always returns 0, it only sets the baseline for the next one
+        self._process.cpu_percent(interval=None)
+        self._fd_limit = _fd_limit(self._process)
+
+    def reset(self) -> None:
+        """Stop sampling and forget all samples"""
+        self._process = None
+        self._fd_limit = None
+        self._samples.clear()
+        self._gc_pauses.clear()
+
+    async def sample(self) -> ProcessSample | None:
+        """Take a sample of the process, `None` if it isn't running"""
+        if self._process is None:
+            return None
+        try:
+            sample = await asyncio.to_thread(_read_sample, self._process)
+        except psutil.Error:
+            return None
+        self._samples.append(sample)
+        return sample
+
+    def record_gc_pause(self, duration_ms: float) -> None:
+        """Record a garbage collection pause reported by the JVM"""
+        self._gc_pauses.append((time.monotonic(), duration_ms))
+
+    @property
+    def rss_growth_mb_per_hour(self) -> float:
+        """The trend of the resident memory over the window, from a least squares fit"""
+        if len(self._samples) < 2:
+            return 0.0
+        start = self._samples[0].timestamp
+        xs = [(s.timestamp - start) / 3600 for s in self._samples]
+        ys = [s.rss / 1024**2 for s in self._samples]
+        mean_x = sum(xs) / len(xs)
+        mean_y = sum(ys) / len(ys)
+        variance = sum((x - mean_x) ** 2 for x in xs)
+        if not variance:
+            return 0.0
+        return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance
+
+    @property
+    def max_gc_pause_ms(self) -> float:
+        """The longest garbage collection pause since the oldest sample in the window"""
+        cutoff = self._samples[0].timestamp if self._samples else 0.0
+        return max((duration for timestamp, duration in self._gc_pauses if timestamp >= cutoff), default=0.0)
+
+    @property
+    def fd_ratio(self) -> float | None:
+        """The fraction of the file descriptor limit in use"""
+        if (latest := self.latest) is None or latest.num_fds is None or not self._fd_limit:
+            return None
+        return latest.num_fds / self._fd_limit
+
+    def _sustained(self, predicate) -> bool:
+        count = self.thresholds.sustained_samples
+        return len(self._samples) >= count and all(predicate(s) for s in list(self._samples)[-count:])
+
+    def breaches(self) -> list[str]:
+        """The thresholds the process is currently over, empty if it is healthy"""
+        thresholds = self.thresholds
+        reasons = []
+        if thresholds.max_rss_mb and self._sustained(lambda s: s.rss / 1024**2 > thresholds.max_rss_mb):
+            reasons.append(f"resident memory above {thresholds.max_rss_mb}MB")
+        if (
+            thresholds.max_rss_growth_mb_per_hour
+            and len(self._samples) == self._samples.maxlen
+            and self.rss_growth_mb_per_hour > thresholds.max_rss_growth_mb_per_hour
+        ):
+            reasons.append(f"resident memory growing by {self.rss_growth_mb_per_hour:.1f}MB per hour")
+        if thresholds.max_cpu_percent and self._sustained(lambda s: s.cpu_percent > thresholds.max_cpu_percent):
+            reasons.append(f"CPU usage above {thresholds.max_cpu_percent}%")
+        if thresholds.max_gc_pause_ms and self.max_gc_pause_ms > thresholds.max_gc_pause_ms:
+            reasons.append(f"garbage collection pause of {self.max_gc_pause_ms:.0f}ms")
+        if thresholds.max_fd_ratio and (ratio := self.fd_ratio) is not None and ratio > thresholds.max_fd_ratio:
+            reasons.append(f"{ratio:.0%} of the file descriptor limit in use")
+        return reasons
+
+    def to_dict(self) -> dict[str, Any]:
+        """A summary of the window"""
+        latest = self.latest
+        samples = list(self._samples)
+        return {
+            "pid": self.pid,
+            "samples": len(samples),
+            "rss": latest.rss if latest else None,
+            "rss_growth_mb_per_hour": self.rss_growth_mb_per_hour,
+            "cpu_percent": latest.cpu_percent if latest else None,
+            "cpu_percent_average": sum(s.cpu_percent for s in samples) / len(samples) if samples else None,
+            "num_fds": latest.num_fds if latest else None,
+            "fd_limit": self._fd_limit,
+            "num_threads": latest.num_threads if latest else None,
+            "max_gc_pause_ms": self.max_gc_pause_ms,
+        }
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import os
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING
 
+import aiopath
+
 from pylav.extension.m3u.base import load, loads
+from pylav.extension.m3u.http_client import StreamingHTTPClient
+from pylav.extension.m3u.models import Key, Media, MediaList, Playlist, Segment
+from pylav.extension.m3u.parser import LineParser, is_url
 
 if TYPE_CHECKING:
     from pylav.core.client import Client
@@ -11,15 +18,82 @@ if TYPE_CHECKING:
 class M3UParser:
     """A wrapper for the M3U parser."""
 
-    __slots__ = ("_client",)
+    __slots__ = ("_client", "_http_client")
 
     def __init__(self, client: Client) -> None:
         self._client = client
+        self._http_client = StreamingHTTPClient(client.session)
 
     @property
     def client(self) -> Client:
         """The PyLav client."""
         return self._client
 
+    @property
+    def http_client(self) -> StreamingHTTPClient:
+        """The client used to download remote playlists."""
+        return self._http_client
+
     load = load
     loads = loads
+
+    async def iter_load(
+        self,
+        uri: str,
+        timeout: float | None = None,
+        headers: dict[str, str] | None = None,
+        verify_ssl: bool = True,
+        strict: bool = False,
+        custom_tags_parser=None,
+    ) -> AsyncIterator[Segment | Playlist]:
+        """Parse a playlist while it is being read, yielding its segments and variant playlists as they are found.
+
+        Unlike :meth:`load` the playlist is never held in memory as a whole,
+        so the first entries of a huge playlist are available as soon as they are downloaded.
+
+        Parameters
+        ----------
+        uri: :class:`str`
+            The URL or path of the playlist.
+        timeout: :class:`float`
+            How long downloading the playlist may take, by default only the time between two reads is limited.
+        headers: :class:`dict`
+            Additional headers to send when downloading the playlist.
+        verify_ssl: :class:`bool`
+            Whether to verify the certificate of the server.
+        strict: :class:`bool`
+            Whether to raise a :class:`ParseError` for lines which can't be parsed.
+        custom_tags_parser: Callable
+            A parser for tags which aren't supported, see :func:`parse`.
+
+        Yields
+        ------
+        Union[:class:`Segment`, :class:`Playlist`]
+            The entries of the playlist, in the order they appear in.
+        """
+        parser = LineParser(strict=strict, custom_tags_parser=custom_tags_parser, keep=False)
+        if is_url(uri):
+            async with self._http_client.open(uri, timeout=timeout, headers=headers, verify_ssl=verify_ssl) as playlist:
+                async for entry in self._parse_lines(parser, playlist.base_uri, playlist.lines):
+                    yield entry
+        else:
+            async with aiopath.AsyncPath(uri).open("r", encoding="utf8") as file:
+                async for entry in self._parse_lines(parser, os.path.dirname(uri), file):
+                    yield entry
+
+    @staticmethod
+    async def _parse_lines(
+        parser: LineParser, base_uri: str, lines: AsyncIterator[str]
+    ) -> AsyncIterator[Segment | Playlist]:
+        if base_uri and not base_uri.endswith("/"):
+            base_uri += "/"
+        media: MediaList | None = None
+        async for line in lines:
+            for kind, data in parser.feed(line):
+                if kind == "segment":
+                    key = Key(base_uri=base_uri, **data["key"]) if data.get("key") else None
+                    yield Segment(base_uri=base_uri, keyobject=key, **data)
+                else:
+                    if media is None or len(media) != len(parser.data["media"]):
+                        media = MediaList([Media(base_uri=base_uri, **m) for m in parser.data["media"]])
+                    yield Playlist(base_uri=base_uri, media=media, **data)
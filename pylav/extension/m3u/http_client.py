@@ -1,10 +1,22 @@
 from __future__ import annotations
 
 import asyncio
+import collections
+import contextlib
+import dataclasses
 import ssl
 import urllib.request
+from collections.abc import AsyncIterator
+from typing import Any
 
+import aiohttp
+
+from pylav.constants.config import M3U_CONDITIONAL_CACHE_MAX_SIZE, M3U_MAX_SIZE
+from pylav.constants.http import M3U_CONDITIONAL_CACHE_ENTRIES, M3U_TIMEOUT
 from pylav.extension.m3u.parser import urljoin
+from pylav.logging import getLogger
+
+LOGGER = getLogger("PyLav.M3U")
 
 
 def parsed_url(url: str) -> str | bytes:
@@ -43,3 +55,135 @@ class HTTPSHandler:
             context.check_hostname = False
             context.verify_mode = ssl.CERT_NONE
         return urllib.request.HTTPSHandler(context=context)
+
+
+@dataclasses.dataclass(eq=False, slots=True, kw_only=True)
+class CachedPlaylist:
+    """A remote playlist kept to answer conditional requests"""
+
+    etag: str | None
+    last_modified: str | None
+    base_uri: str
+    charset: str
+    content: bytes
+
+
+@dataclasses.dataclass(eq=False, slots=True, kw_only=True)
+class RemotePlaylist:
+    """A remote playlist being downloaded"""
+
+    base_uri: str
+    lines: AsyncIterator[str]
+
+
+class StreamingHTTPClient:
+    """Downloads remote playlists with aiohttp and hands out their lines as they arrive.
+
+    Playlists larger than :data:`M3U_MAX_SIZE` bytes are cut off, and playlists up to
+    :data:`M3U_CONDITIONAL_CACHE_MAX_SIZE` bytes which come with an `ETag` or `Last-Modified` header are kept,
+    so they are only downloaded again once the server says they changed.
+
+    Parameters
+    ----------
+    session: :class:`aiohttp.ClientSession`
+        The session to download playlists with.
+    """
+
+    __slots__ = ("_session", "_max_size", "_cache", "_cache_max_size", "_cache_entries", "not_modified", "truncated")
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        max_size: int = M3U_MAX_SIZE,
+        cache_max_size: int = M3U_CONDITIONAL_CACHE_MAX_SIZE,
+        cache_entries: int = M3U_CONDITIONAL_CACHE_ENTRIES,
+    ) -> None:
+        self._session = session
+        self._max_size = max_size
+        self._cache: collections.OrderedDict[str, CachedPlaylist] = collections.OrderedDict()
+        self._cache_max_size = cache_max_size
+        self._cache_entries = cache_entries
+        self.not_modified = 0
+        self.truncated = 0
+
+    def stats(self) -> dict[str, Any]:
+        """How many playlists are kept and how often they didn't have to be downloaded again"""
+        return {"cached": len(self._cache), "not_modified": self.not_modified, "truncated": self.truncated}
+
+    @contextlib.asynccontextmanager
+    async def open(
+        self, uri: str, timeout: float | None = None, headers: dict[str, str] | None = None, verify_ssl: bool = True
+    ) -> AsyncIterator[RemotePlaylist]:
+        """Start downloading a playlist.
+
+        Parameters
+        ----------
+        uri: :class:`str`
+            The URL of the playlist.
+        timeout: :class:`float`
+            How long the whole download may take, by default only the time between two reads is limited.
+        headers: :class:`dict`
+            Additional headers to send.
+        verify_ssl: :class:`bool`
+            Whether to verify the certificate of the server.
+
+        Yields
+        ------
+        :class:`RemotePlaylist`
+            The playlist, its lines are read as they are iterated over.
+        """
+        request_headers = dict(headers or {})
+        if cached := self._cache.get(uri):
+            if cached.etag:
+                request_headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request_headers["If-Modified-Since"] = cached.last_modified
+        async with self._session.get(
+            uri,
+            headers=request_headers,
+            timeout=M3U_TIMEOUT if timeout is None else aiohttp.ClientTimeout(total=timeout),
+            ssl=verify_ssl,
+        ) as response:
+            if response.status == 304 and cached is not None:
+                self.not_modified += 1
+                self._cache.move_to_end(uri)
+                yield RemotePlaylist(base_uri=cached.base_uri, lines=self._replay(cached))
+                return
+            response.raise_for_status()
+            yield RemotePlaylist(base_uri=parsed_url(str(response.url)), lines=self._read(uri, response))
+
+    @staticmethod
+    async def _replay(cached: CachedPlaylist) -> AsyncIterator[str]:
+        for line in cached.content.decode(cached.charset, errors="replace").lstrip("\ufeff").splitlines():
+            yield line
+
+    async def _read(self, uri: str, response: aiohttp.ClientResponse) -> AsyncIterator[str]:
+        charset = response.charset or "utf-8"
+        etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+        buffer: list[bytes] | None = [] if etag or last_modified else None
+        size = 0
+        async for line in response.content:
+            if not size:
+                line = line.removeprefix(b"\xef\xbb\xbf")
+            size += len(line)
+            if size > self._max_size:
+                self.truncated += 1
+                LOGGER.warning("%s is larger than %s bytes, ignoring the rest of it", uri, self._max_size)
+                return
+            if buffer is not None:
+                if size > self._cache_max_size:
+                    buffer = None
+                else:
+                    buffer.append(line)
+            yield line.decode(charset, errors="replace")
+        if buffer is not None:
+            self._cache.pop(uri, None)
+            self._cache[uri] = CachedPlaylist(
+                etag=etag,
+                last_modified=last_modified,
+                base_uri=parsed_url(str(response.url)),
+                charset=charset,
+                content=b"".join(buffer),
+            )
+            while len(self._cache) > self._cache_entries:
+                self._cache.popitem(last=False)
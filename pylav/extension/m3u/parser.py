@@ -47,60 +47,104 @@ def parse(content: str, strict: bool = False, custom_tags_parser: bool = None) -
     """
     Given a M3U8 playlist content returns a dictionary with all data found
     """
-    data = {
-        "media_sequence": 0,
-        "is_variant": False,
-        "is_endlist": False,
-        "is_i_frames_only": False,
-        "is_independent_segments": False,
-        "playlist_type": None,
-        "playlists": [],
-        "segments": [],
-        "iframe_playlists": [],
-        "media": [],
-        "keys": [],
-        "rendition_reports": [],
-        "skip": {},
-        "part_inf": {},
-        "session_data": [],
-        "session_keys": [],
-    }
+    parser = LineParser(strict=strict, custom_tags_parser=custom_tags_parser)
+    for line in string_to_lines(content):
+        parser.feed(line)
+    return parser.close()
 
-    state = {
-        "expect_segment": False,
-        "expect_playlist": False,
-        "current_key": None,
-        "current_segment_map": None,
-    }
 
-    lineno = 0
-    for line in string_to_lines(content):
-        lineno += 1
-        line = line.strip()
+class LineParser:
+    """
+    Parses a M3U8 playlist one line at a time, so it can be parsed while it is being downloaded.
+
+    Segments and variant playlists are returned by :meth:`feed` as soon as their URI line is parsed,
+    unless `keep` is set they are then forgotten so that memory use doesn't grow with the playlist.
+    """
+
+    __slots__ = ("data", "state", "strict", "custom_tags_parser", "keep", "lineno", "_previous_line", "_taken")
+
+    def __init__(self, strict: bool = False, custom_tags_parser: Callable = None, keep: bool = True) -> None:
+        self.data = {
+            "media_sequence": 0,
+            "is_variant": False,
+            "is_endlist": False,
+            "is_i_frames_only": False,
+            "is_independent_segments": False,
+            "playlist_type": None,
+            "playlists": [],
+            "segments": [],
+            "iframe_playlists": [],
+            "media": [],
+            "keys": [],
+            "rendition_reports": [],
+            "skip": {},
+            "part_inf": {},
+            "session_data": [],
+            "session_keys": [],
+        }
+        self.state = {
+            "expect_segment": False,
+            "expect_playlist": False,
+            "current_key": None,
+            "current_segment_map": None,
+        }
+        self.strict = strict
+        self.custom_tags_parser = custom_tags_parser
+        self.keep = keep
+        self.lineno = 0
+        self._previous_line = ""
+        self._taken = (0, 0)
+
+    def feed(self, line: str) -> list[tuple[str, dict[str, Any]]]:
+        """
+        Parse the next line of the playlist, returns the `("segment", data)` and `("playlist", data)`
+        entries it completed
+        """
+        self.lineno += 1
+        raw_line, line = line, line.strip()
+        self._previous_line, previous_line = raw_line, self._previous_line
 
         # Call custom parser if needed
-        if line.startswith("#") and callable(custom_tags_parser):
-            go_to_next_line = custom_tags_parser(line, lineno, data, state)
+        if line.startswith("#") and callable(self.custom_tags_parser):
+            go_to_next_line = self.custom_tags_parser(line, self.lineno, self.data, self.state)
 
             # Do not try to parse other standard tags on this line if custom_tags_parser function returns 'True'
             if go_to_next_line:
-                continue
+                return self._take()
 
         if line.startswith(protocols.EXT_X_BYTE_RANGE):
-            _parse_byterange(line, state)
-            state["expect_segment"] = True
-            continue
-
-        _process_line(content, data, line, lineno, state, strict)
-
-    # there could be remaining partial segments
-    if "segment" in state:
-        data["segments"].append(state.pop("segment"))
-
-    return data
-
-
-def _process_line(content, data, line, lineno, state, strict):  # sourcery skip: low-code-quality
+            _parse_byterange(line, self.state)
+            self.state["expect_segment"] = True
+            return self._take()
+
+        _process_line(previous_line, self.data, line, self.lineno, self.state, self.strict)
+        return self._take()
+
+    def close(self) -> dict[str, Any]:
+        """
+        Finish parsing, returns all data found
+        """
+        # there could be remaining partial segments
+        if "segment" in self.state:
+            self.data["segments"].append(self.state.pop("segment"))
+        return self.data
+
+    def _take(self) -> list[tuple[str, dict[str, Any]]]:
+        segments, playlists = self.data["segments"], self.data["playlists"]
+        taken_segments, taken_playlists = self._taken
+        if len(segments) == taken_segments and len(playlists) == taken_playlists:
+            return []
+        entries = [("segment", segment) for segment in segments[taken_segments:]]
+        entries.extend(("playlist", playlist) for playlist in playlists[taken_playlists:])
+        if self.keep:
+            self._taken = (len(segments), len(playlists))
+        else:
+            segments.clear()
+            playlists.clear()
+        return entries
+
+
+def _process_line(previous_line, data, line, lineno, state, strict):  # sourcery skip: low-code-quality
     if line.startswith(protocols.EXT_X_BIT_RATE):
         _parse_bitrate(line, state)
 
@@ -128,7 +172,7 @@ def _process_line(content, data, line, lineno, state, strict):  # sourcery skip:
         state["cue_out"] = True
 
     elif line.startswith(protocols.EXT_X_CUE_OUT):
-        _parse_cueout(line, state, string_to_lines(content)[lineno - 2])
+        _parse_cueout(line, state, previous_line)
         state["cue_out_start"] = True
         state["cue_out"] = True
 
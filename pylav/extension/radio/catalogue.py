@@ -0,0 +1,455 @@
+from __future__ import annotations
+
+import asyncio
+import bisect
+import dataclasses
+import datetime
+import heapq
+import pathlib
+import re
+from collections import Counter
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from pylav.compat import json
+from pylav.constants.radio import (
+    RADIO_CATALOGUE_CHANGES_PAGE_SIZE,
+    RADIO_CATALOGUE_FULL_SYNC_INTERVAL,
+    RADIO_CATALOGUE_MAX_PREFIX_TERMS,
+    RADIO_CATALOGUE_MAX_TRIGRAM_POSTINGS,
+    RADIO_CATALOGUE_MAX_TRIGRAM_TERMS,
+    RADIO_CATALOGUE_STATIONS_BATCH_SIZE,
+    RADIO_CATALOGUE_VERSION,
+)
+from pylav.extension.radio.objects import Codec, Country, CountryCode, Language, State, Station, Tag
+from pylav.helpers.time import get_now_utc
+from pylav.logging import getLogger
+
+if TYPE_CHECKING:
+    from pylav.extension.radio.radios import RadioBrowser
+
+LOGGER = getLogger("PyLav.extension.RadioBrowser.Catalogue")
+
+_WHITESPACE = re.compile(r"\s+")
+_WORD_SPLIT = re.compile(r"[\s\-_/|:.,()\[\]]+")
+
+INDEXED_FIELDS = ("name", "tags", "country", "language")
+EXACT_FIELDS = ("countrycode", "state", "codec")
+LISTING_TYPES: dict[str, type[Tag | Language | State | Codec | CountryCode | Country]] = {
+    "tags": Tag,
+    "languages": Language,
+    "states": State,
+    "codecs": Codec,
+    "countrycodes": CountryCode,
+    "countries": Country,
+}
+
+
+def normalise(value: str | None) -> str:
+    """Normalise a string for indexing and lookups."""
+    return _WHITESPACE.sub(" ", value).strip().casefold() if value else ""
+
+
+def trigrams(value: str) -> set[str]:
+    """Get the set of trigrams for an already normalised string."""
+    padded = f"  {value} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _station_terms(field: str, station: Station) -> set[str]:
+    match field:
+        case "name":
+            name = normalise(station.name)
+            if not name:
+                return set()
+            return {name, *filter(None, _WORD_SPLIT.split(name))}
+        case "tags" | "language":
+            value = station.tags if field == "tags" else station.language
+            return {term for v in (value or "").split(",") if (term := normalise(v))}
+        case __:
+            return {term} if (term := normalise(getattr(station, field, None))) else set()
+
+
+def _to_json_value(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime.datetime) else value
+
+
+def station_to_dict(station: Station) -> dict[str, Any]:
+    """Convert a station to a JSON serializable dict."""
+    return {
+        field.name: _to_json_value(getattr(station, field.name))
+        for field in dataclasses.fields(station)
+        if field.name != "radio_api_client"
+    }
+
+
+class StationCatalogue:
+    """A locally persisted copy of the Radio Browser station list with prefix and trigram indexes.
+
+    The catalogue is synced incrementally from the Radio Browser API using the ``stations/changed`` endpoint,
+    and can be loaded from a dump on disk (or a fixture) so that lookups do not require network access.
+    """
+
+    __slots__ = (
+        "_path",
+        "_radio_api_client",
+        "_stations",
+        "_listings",
+        "_last_change_uuid",
+        "_last_full_sync",
+        "_terms",
+        "_prefixes",
+        "_trigrams",
+        "_exact",
+        "_lock",
+    )
+
+    def __init__(self, path: pathlib.Path | None = None, radio_api_client: RadioBrowser | None = None) -> None:
+        self._path = path
+        self._radio_api_client = radio_api_client
+        self._stations: dict[str, Station] = {}
+        self._listings: dict[str, list[Tag | Language | State | Codec | CountryCode | Country]] = {
+            key: [] for key in LISTING_TYPES
+        }
+        self._last_change_uuid: str | None = None
+        self._last_full_sync: datetime.datetime | None = None
+        self._terms: dict[str, dict[str, set[str]]] = {field: {} for field in INDEXED_FIELDS}
+        self._prefixes: dict[str, list[str]] = {field: [] for field in INDEXED_FIELDS}
+        self._trigrams: dict[str, dict[str, set[str]]] = {field: {} for field in INDEXED_FIELDS}
+        self._exact: dict[str, dict[str, set[str]]] = {field: {} for field in EXACT_FIELDS}
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._stations)
+
+    @property
+    def stations(self) -> dict[str, Station]:
+        """The stations in the catalogue keyed by their uuid."""
+        return self._stations
+
+    @property
+    def last_change_uuid(self) -> str | None:
+        """The change uuid of the most recent change applied to the catalogue."""
+        return self._last_change_uuid
+
+    @property
+    def last_full_sync(self) -> datetime.datetime | None:
+        """The time of the last full sync."""
+        return self._last_full_sync
+
+    def get_listing(self, listing: str) -> list[Tag | Language | State | Codec | CountryCode | Country]:
+        """Get one of the stored listings (tags, languages, states, codecs, countrycodes or countries)."""
+        return self._listings[listing]
+
+    @classmethod
+    def from_dump(
+        cls,
+        data: dict[str, Any],
+        path: pathlib.Path | None = None,
+        radio_api_client: RadioBrowser | None = None,
+    ) -> StationCatalogue:
+        """Build a catalogue from a dump created by :meth:`to_dump`."""
+        catalogue = cls(path=path, radio_api_client=radio_api_client)
+        catalogue._load_dump(data)
+        return catalogue
+
+    def to_dump(self) -> dict[str, Any]:
+        """Dump the catalogue into a JSON serializable dict."""
+        return {
+            "version": RADIO_CATALOGUE_VERSION,
+            "last_change_uuid": self._last_change_uuid,
+            "last_full_sync": self._last_full_sync.isoformat() if self._last_full_sync else None,
+            "stations": [station_to_dict(station) for station in self._stations.values()],
+            "listings": {
+                key: [dataclasses.asdict(entry) for entry in entries] for key, entries in self._listings.items()
+            },
+        }
+
+    def _load_dump(self, data: dict[str, Any]) -> None:
+        if data.get("version") != RADIO_CATALOGUE_VERSION:
+            LOGGER.debug("Ignoring radio catalogue dump with version %s", data.get("version"))
+            return
+        self._last_change_uuid = data.get("last_change_uuid")
+        last_full_sync = data.get("last_full_sync")
+        self._last_full_sync = datetime.datetime.fromisoformat(last_full_sync) if last_full_sync else None
+        self._replace_stations(
+            Station(radio_api_client=self._radio_api_client, **station) for station in data.get("stations", [])
+        )
+        listings = data.get("listings", {})
+        for key, listing_cls in LISTING_TYPES.items():
+            self._listings[key] = [listing_cls(**entry) for entry in listings.get(key, [])]
+
+    async def load(self) -> bool:
+        """Load the catalogue from disk.
+
+        Returns:
+            bool: Whether a catalogue was loaded.
+        """
+        if self._path is None:
+            return False
+
+        def _read() -> dict[str, Any] | None:
+            return json.loads(self._path.read_bytes()) if self._path.exists() else None
+
+        async with self._lock:
+            try:
+                data = await asyncio.to_thread(_read)
+            except Exception as exc:
+                LOGGER.warning("Unable to read the radio catalogue at %s", self._path)
+                LOGGER.debug("Unable to read the radio catalogue at %s", self._path, exc_info=exc)
+                return False
+            if not data:
+                return False
+            self._load_dump(data)
+        LOGGER.debug("Loaded %s stations from the radio catalogue", len(self._stations))
+        return bool(self._stations)
+
+    async def save(self) -> None:
+        """Persist the catalogue to disk."""
+        if self._path is None:
+            return
+        data = json.dumps(self.to_dump())
+
+        def _write() -> None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self._path.with_suffix(".tmp")
+            temp_path.write_text(data, encoding="utf-8")
+            temp_path.replace(self._path)
+
+        await asyncio.to_thread(_write)
+
+    async def sync(self, radio_api_client: RadioBrowser, force_full: bool = False) -> None:
+        """Sync the catalogue with the Radio Browser API.
+
+        A full sync is done if the catalogue is empty, if the last full sync is older than
+        :data:`RADIO_CATALOGUE_FULL_SYNC_INTERVAL` or if ``force_full`` is set,
+        otherwise only the changes since the last sync are fetched.
+        """
+        self._radio_api_client = radio_api_client
+        async with self._lock:
+            if (
+                force_full
+                or not self._stations
+                or self._last_change_uuid is None
+                or self._last_full_sync is None
+                or get_now_utc() - self._last_full_sync > RADIO_CATALOGUE_FULL_SYNC_INTERVAL
+            ):
+                await self._full_sync(radio_api_client)
+            else:
+                await self._incremental_sync(radio_api_client)
+        await self.save()
+
+    async def _full_sync(self, radio_api_client: RadioBrowser) -> None:
+        LOGGER.debug("Running a full sync of the radio catalogue")
+        stations = await radio_api_client.stations(hidebroken="true")
+        if not stations:
+            return
+        self._replace_stations(stations)
+        latest = max(
+            (station for station in stations if station.changeuuid),
+            key=lambda s: s.lastchangetime_iso8601 or datetime.datetime.min.replace(tzinfo=datetime.UTC),
+            default=None,
+        )
+        self._last_change_uuid = latest.changeuuid if latest else None
+        self._listings = {
+            "tags": await radio_api_client.tags(),
+            "languages": await radio_api_client.languages(),
+            "states": await radio_api_client.states(),
+            "codecs": await radio_api_client.codecs(),
+            "countrycodes": await radio_api_client.countrycodes(),
+            "countries": await radio_api_client.countries(),
+        }
+        self._last_full_sync = get_now_utc()
+        LOGGER.debug("Radio catalogue fully synced with %s stations", len(self._stations))
+
+    async def _incremental_sync(self, radio_api_client: RadioBrowser) -> None:
+        # Change records don't carry every field of a station (votes, clicks, check results, ...),
+        # so they are only used to find out which stations changed, which are then fetched in full
+        last_change_uuid = self._last_change_uuid
+        changed_uuids: dict[str, None] = {}
+        while True:
+            changed = await radio_api_client.stations_changed(
+                last_change_uuid=last_change_uuid, limit=RADIO_CATALOGUE_CHANGES_PAGE_SIZE
+            )
+            if not changed:
+                break
+            changed_uuids |= dict.fromkeys(station.stationuuid for station in changed if station.stationuuid)
+            last_change_uuid = changed[-1].changeuuid
+            if len(changed) < RADIO_CATALOGUE_CHANGES_PAGE_SIZE:
+                break
+        uuids = list(changed_uuids)
+        for start in range(0, len(uuids), RADIO_CATALOGUE_STATIONS_BATCH_SIZE):
+            batch = uuids[start : start + RADIO_CATALOGUE_STATIONS_BATCH_SIZE]
+            stations = {station.stationuuid: station for station in await radio_api_client.stations_by_uuids(batch)}
+            for stationuuid in batch:
+                # Stations which are no longer returned have been deleted or are broken
+                if (station := stations.get(stationuuid)) is None:
+                    self._remove_station(stationuuid)
+                else:
+                    self._add_station(station)
+        # Only moved forward once every change has been applied, so a failed sync is retried from the same point
+        self._last_change_uuid = last_change_uuid
+        if uuids:
+            self._rebuild_prefixes()
+        LOGGER.debug("Applied changes to %s stations of the radio catalogue", len(uuids))
+
+    def _replace_stations(self, stations: Iterable[Station]) -> None:
+        self._stations = {}
+        self._terms = {field: {} for field in INDEXED_FIELDS}
+        self._trigrams = {field: {} for field in INDEXED_FIELDS}
+        self._exact = {field: {} for field in EXACT_FIELDS}
+        for station in stations:
+            self._add_station(station)
+        self._rebuild_prefixes()
+
+    def _add_station(self, station: Station) -> None:
+        if not station.stationuuid:
+            return
+        if station.stationuuid in self._stations:
+            self._remove_station(station.stationuuid)
+        self._stations[station.stationuuid] = station
+        for field in INDEXED_FIELDS:
+            terms = self._terms[field]
+            for term in _station_terms(field, station):
+                if term not in terms:
+                    terms[term] = set()
+                    for gram in trigrams(term):
+                        self._trigrams[field].setdefault(gram, set()).add(term)
+                terms[term].add(station.stationuuid)
+        for field in EXACT_FIELDS:
+            if value := normalise(getattr(station, field, None)):
+                self._exact[field].setdefault(value, set()).add(station.stationuuid)
+
+    def _remove_station(self, stationuuid: str | None) -> None:
+        if (station := self._stations.pop(stationuuid, None)) is None:
+            return
+        for field in INDEXED_FIELDS:
+            terms = self._terms[field]
+            for term in _station_terms(field, station):
+                if (uuids := terms.get(term)) is None:
+                    continue
+                uuids.discard(stationuuid)
+                if uuids:
+                    continue
+                del terms[term]
+                for gram in trigrams(term):
+                    if (grams := self._trigrams[field].get(gram)) is not None:
+                        grams.discard(term)
+                        if not grams:
+                            del self._trigrams[field][gram]
+        for field in EXACT_FIELDS:
+            if (value := normalise(getattr(station, field, None))) and value in self._exact[field]:
+                self._exact[field][value].discard(stationuuid)
+                if not self._exact[field][value]:
+                    del self._exact[field][value]
+
+    def _rebuild_prefixes(self) -> None:
+        self._prefixes = {field: sorted(self._terms[field]) for field in INDEXED_FIELDS}
+
+    def _match_terms(self, field: str, query: str) -> dict[str, float]:
+        """Score the indexed terms of a field against the query.
+
+        Prefix matches are found with a binary search over the sorted terms,
+        other partial matches are found using the trigram index; both are capped so the cost of a lookup
+        does not depend on the size of the catalogue.
+        """
+        scores: dict[str, float] = {}
+        prefixes = self._prefixes[field]
+        index = bisect.bisect_left(prefixes, query)
+        for term in prefixes[index : index + RADIO_CATALOGUE_MAX_PREFIX_TERMS]:
+            if not term.startswith(query):
+                break
+            scores[term] = 100.0 if term == query else 90.0 + 10.0 * len(query) / len(term)
+
+        query_grams = trigrams(query)
+        postings = sorted(
+            (p for gram in query_grams if (p := self._trigrams[field].get(gram))),
+            key=len,
+        )
+        if not postings:
+            return scores
+        # Skip very common trigrams unless they are all we have to go on
+        postings = [p for p in postings if len(p) <= RADIO_CATALOGUE_MAX_TRIGRAM_POSTINGS] or postings[:1]
+        counter: Counter[str] = Counter()
+        for posting in postings:
+            counter.update(posting)
+        for term, shared in counter.most_common(RADIO_CATALOGUE_MAX_TRIGRAM_TERMS):
+            if term in scores:
+                continue
+            similarity = shared / (len(query_grams) + len(trigrams(term)) - shared)
+            if similarity >= 0.2:
+                scores[term] = 80.0 * similarity
+        return scores
+
+    def _match_field(self, field: str, value: str, exact: bool = False) -> dict[str, float]:
+        query = normalise(value)
+        if not query:
+            return {}
+        terms = self._terms[field]
+        if exact:
+            return {uuid: 101.0 for uuid in terms.get(query, ())}
+        results: dict[str, float] = {}
+        for term, score in self._match_terms(field, query).items():
+            for uuid in terms.get(term, ()):
+                if results.get(uuid, 0) < score:
+                    results[uuid] = score
+        return results
+
+    def _match_exact(self, field: str, value: str) -> dict[str, float]:
+        return {uuid: 0.0 for uuid in self._exact[field].get(normalise(value), ())}
+
+    def search(
+        self,
+        limit: int = 25,
+        *,
+        name: str | None = None,
+        name_exact: bool = False,
+        tag: str | None = None,
+        tag_exact: bool = False,
+        tag_list: str | list[str] | None = None,
+        country: str | None = None,
+        country_exact: bool = False,
+        countrycode: str | None = None,
+        state: str | None = None,
+        language: str | None = None,
+        language_exact: bool = False,
+        codec: str | None = None,
+        **kwargs: Any,
+    ) -> list[Station]:
+        """Search the catalogue.
+
+        Accepts the same filters as :meth:`RadioBrowser.search`, results are ranked by how well they match
+        the given filters and then by votes.
+        """
+        matches: list[dict[str, float]] = []
+        if name:
+            matches.append(self._match_field("name", name, exact=name_exact))
+        if tag:
+            matches.append(self._match_field("tags", tag, exact=tag_exact))
+        if tag_list:
+            if isinstance(tag_list, str):
+                tag_list = tag_list.split(",")
+            matches.extend(self._match_field("tags", t, exact=True) for t in tag_list if t)
+        if country:
+            matches.append(self._match_field("country", country, exact=country_exact))
+        if language:
+            matches.append(self._match_field("language", language, exact=language_exact))
+        if countrycode:
+            matches.append(self._match_exact("countrycode", countrycode))
+        if state:
+            matches.append(self._match_exact("state", state))
+        if codec:
+            matches.append(self._match_exact("codec", codec))
+
+        if not matches:
+            return heapq.nlargest(limit, self._stations.values(), key=lambda s: s.votes or 0)
+
+        matches.sort(key=len)
+        scores = matches[0]
+        for other in matches[1:]:
+            scores = {uuid: score + other[uuid] for uuid, score in scores.items() if uuid in other}
+            if not scores:
+                return []
+
+        best = heapq.nlargest(limit, scores.items(), key=lambda i: (i[1], self._stations[i[0]].votes or 0))
+        return [self._stations[uuid] for uuid, __ in best]
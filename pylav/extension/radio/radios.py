@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import contextlib
+import pathlib
 from typing import TYPE_CHECKING, Any
 
 import aiohttp
@@ -8,7 +9,9 @@ import aiohttp_client_cache
 from yarl import URL
 
 from pylav.compat import json
+from pylav.constants.config import CONFIG_DIR
 from pylav.extension.radio.base_url import pick_base_url
+from pylav.extension.radio.catalogue import StationCatalogue
 from pylav.extension.radio.objects import Codec, Country, CountryCode, Language, State, Station, Tag
 from pylav.extension.radio.utils import TransformerCache, type_check
 from pylav.logging import getLogger
@@ -20,6 +23,8 @@ if TYPE_CHECKING:
 
 LOGGER = getLogger("PyLav.extension.RadioBrowser")
 
+RADIO_CATALOGUE_PATH = pathlib.Path(CONFIG_DIR) / "radio" / "catalogue.json"
+
 
 class Request:
     """A wrapper for the aiohttp client."""
@@ -58,17 +63,24 @@ class RadioBrowser:
             headers=headers, cached_session=self._client.cached_session, session=self._client.session
         )
         self._disabled = False
+        self._catalogue = StationCatalogue(path=RADIO_CATALOGUE_PATH, radio_api_client=self)
 
     async def initialize(self) -> None:
         try:
+            has_catalogue = await self._catalogue.load()
             self._disabled = not await self.base_url
             if self._disabled:
-                LOGGER.error("Error while initializing the Radio Browser extension - disabling it")
-                return
+                if not has_catalogue:
+                    LOGGER.error("Error while initializing the Radio Browser extension - disabling it")
+                    return
+                LOGGER.warning("Unable to reach the Radio Browser API - using the local radio catalogue")
+                self._disabled = False
+            else:
+                await self._catalogue.sync(self)
+                await self.stations_by_clicks(limit=25)
+                await self.stations_by_votes(limit=25)
             LOGGER.debug("Priming radio cache")
             await TransformerCache.fill_cache(self._client)
-            await self.stations_by_clicks(limit=25)
-            await self.stations_by_votes(limit=25)
             TransformerCache.fill_choice_cache()
             LOGGER.debug("Radio cache primed")
         except Exception as e:
@@ -76,6 +88,24 @@ class RadioBrowser:
             LOGGER.debug(e, exc_info=e)
             self._disabled = True
 
+    async def sync_catalogue(self, force_full: bool = False) -> None:
+        """Sync the local radio catalogue with the Radio Browser API and refresh the autocomplete caches."""
+        if self._disabled or not await self.base_url:
+            return
+        try:
+            await self._catalogue.sync(self, force_full=force_full)
+        except Exception as e:
+            LOGGER.warning("Error while syncing the radio catalogue")
+            LOGGER.debug(e, exc_info=e)
+            return
+        await TransformerCache.fill_cache(self._client)
+        TransformerCache.fill_choice_cache()
+
+    @property
+    def catalogue(self) -> StationCatalogue:
+        """The local radio station catalogue."""
+        return self._catalogue
+
     @property
     async def base_url(self) -> URL:
         """The base URL for the Radio Browser API."""
@@ -243,6 +273,24 @@ class RadioBrowser:
         response = await self.request.get(url, hidebroken="true")
         return [Station(radio_api_client=self, **station) async for station in AsyncIter(response, steps=250)]
 
+    async def stations_by_uuids(self, stationuuids: list[str]) -> list[Station]:
+        """Radio stations by their stationuuid, broken stations are left out.
+
+        Args:
+            stationuuids (list): Globally unique identifiers of the stations.
+
+        Returns:
+            list: Stations.
+
+        See details:
+            https://de1.api.radio-browser.info/#List_of_radio_stations
+        """
+        url = await self.base_url / "json" / "stations" / "byuuid"
+        if self._disabled or not stationuuids:
+            return []
+        response = await self.request.get(url, skip_cache=True, uuids=",".join(stationuuids), hidebroken="true")
+        return [Station(radio_api_client=self, **station) async for station in AsyncIter(response, steps=250)]
+
     async def stations_by_name(
         self, name: str, exact: bool = False, **kwargs: str | int | bool | None
     ) -> list[Station]:
@@ -428,6 +476,30 @@ class RadioBrowser:
             async for station in AsyncIter(await self.request.get(url, **kwargs), steps=250)
         ]
 
+    async def stations_changed(self, last_change_uuid: str | None = None, limit: int | None = None) -> list[Station]:
+        """A list of station changes since the given change uuid.
+
+        Args:
+            last_change_uuid (str, optional): Only list changes that happened after this change.
+            limit (int, optional): Number of wanted changes.
+
+        Returns:
+            list: Stations.
+
+        See details:
+            https://nl1.api.radio-browser.info/#List_of_station_changes
+        """
+        url = await self.base_url / "json" / "stations" / "changed"
+        if self._disabled:
+            return []
+        kwargs = {}
+        if last_change_uuid:
+            kwargs["lastchangeuuid"] = last_change_uuid
+        if limit:
+            kwargs["limit"] = limit
+        response = await self.request.get(url, skip_cache=True, **kwargs)
+        return [Station(radio_api_client=self, **station) async for station in AsyncIter(response, steps=250)]
+
     async def stations_by_votes(self, limit: int, **kwargs: str | int | bool | None) -> list[Station]:
         """A list of the highest-voted stations.
 
@@ -11,7 +11,6 @@ from typing import TYPE_CHECKING, Any
 
 from cashews import Cache
 from discord.app_commands import Choice
-from rapidfuzz import fuzz
 
 from pylav.constants.radio import API_TYPES
 from pylav.helpers.format.strings import shorten_string
@@ -151,26 +150,22 @@ class TransformerCache:
 
     @classmethod
     async def fill_cache(cls, client: Client):
-        """Fill the cache with data from the RadioBrowser API."""
+        """Fill the cache with data from the local radio catalogue."""
         cls._client = client
+        catalogue = client.radio_browser.catalogue
         cls._cache_stations = {
-            s.stationuuid: s
-            for s in sorted(
-                await client.radio_browser.stations(hidebroken="true"), key=attrgetter("votes"), reverse=True
-            )
-        }
-        cls._cache_tags = {t.name: t for t in sorted(await client.radio_browser.tags(), key=attrgetter("name"))}
-        cls._cache_languages = {
-            l.name: l for l in sorted(await client.radio_browser.languages(), key=attrgetter("name"))
+            s.stationuuid: s for s in sorted(catalogue.stations.values(), key=lambda s: s.votes or 0, reverse=True)
         }
-        cls._cache_states = {s.name: s for s in sorted(await client.radio_browser.states(), key=attrgetter("name"))}
-        cls._cache_codecs = {c.name: c for c in sorted(await client.radio_browser.codecs(), key=attrgetter("name"))}
+        cls._cache_tags = {t.name: t for t in sorted(catalogue.get_listing("tags"), key=attrgetter("name"))}
+        cls._cache_languages = {l.name: l for l in sorted(catalogue.get_listing("languages"), key=attrgetter("name"))}
+        cls._cache_states = {s.name: s for s in sorted(catalogue.get_listing("states"), key=attrgetter("name"))}
+        cls._cache_codecs = {c.name: c for c in sorted(catalogue.get_listing("codecs"), key=attrgetter("name"))}
         cls._cache_country_codes = {
-            c.name: c for c in sorted(await client.radio_browser.countrycodes(), key=attrgetter("name"))
-        }
-        cls._cache_countries = {
-            c.name: c for c in sorted(await client.radio_browser.countries(), key=attrgetter("name"))
+            c.name: c for c in sorted(catalogue.get_listing("countrycodes"), key=attrgetter("name"))
         }
+        cls._cache_countries = {c.name: c for c in sorted(catalogue.get_listing("countries"), key=attrgetter("name"))}
+        cls._top_25_stations = []
+        await CACHE.clear()
 
     @classmethod
     def fill_choice_cache(cls):
@@ -344,11 +339,16 @@ class TransformerCache:
             if filter_data[key] is not None and key in key_set:
                 data = filter_data[key]
                 search_args[key] = ",".join(data) if key == "tag_list" else data
+        catalogue = cls._client.radio_browser.catalogue
+        if len(catalogue):
+            return catalogue.search(limit=limit, **search_args)
         station = await cls._client.radio_browser.search(
             limit=limit,
             **search_args,
         )
 
+        from rapidfuzz import fuzz
+
         def _sort(c: Station) -> float | list[float]:
             if "name" not in filter_data:
                 return [-ord(c) for c in c.name]
@@ -369,6 +369,8 @@ class TransformerCache:
         tag = filter_data.pop("tag", None)
         tag_list = filter_data.pop("tag_list", None)
 
+        from rapidfuzz import fuzz
+
         def _filter_tag(c: Tag) -> float:
             if (tag_exact and c.name == tag) or (tag_list and c.name in tag_list):
                 return 101
@@ -394,6 +396,8 @@ class TransformerCache:
         country = filter_data.pop("country", None)
         countrycode = filter_data.pop("code", filter_data.pop("countrycode", None))
 
+        from rapidfuzz import fuzz
+
         def _filter_country(c: Country) -> float:
             if country_exact and c.name == country:
                 return 101
@@ -441,6 +445,8 @@ class TransformerCache:
         country = filter_data.pop("country", None)
         country_exact = filter_data.pop("country_exact", False)
 
+        from rapidfuzz import fuzz
+
         def _filter_state(c: State) -> float:
             if state_exact and c.name == state:
                 return 101
@@ -475,6 +481,8 @@ class TransformerCache:
         language_exact = filter_data.pop("language_exact", False)
         language = filter_data.pop("language", None)
 
+        from rapidfuzz import fuzz
+
         def _filter_language(c: Language) -> float:
             if language_exact and c.name == language:
                 return 101
@@ -497,6 +505,8 @@ class TransformerCache:
         codec_exact = filter_data.pop("codec_exact", False)
         codec = filter_data.pop("codec", None)
 
+        from rapidfuzz import fuzz
+
         def _filter_codec(c: Codec) -> float:
             if codec_exact and c.name == codec:
                 return 101
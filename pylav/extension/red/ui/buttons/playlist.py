@@ -227,7 +227,6 @@ class PlaylistInfoButton(discord.ui.Button):
         from pylav.extension.red.ui.menus.generic import PaginatingMenu
         from pylav.extension.red.ui.sources.playlist import TrackMappingSource
 
-        tracks = await self.view.playlist.fetch_tracks()
         await PaginatingMenu(
             bot=self.cog.bot,
             cog=self.cog,
@@ -235,8 +234,8 @@ class PlaylistInfoButton(discord.ui.Button):
                 guild_id=interaction.guild.id,
                 cog=self.cog,
                 author=interaction.user,
-                entries=tracks,
                 playlist=self.playlist,
+                total=await self.playlist.size(),
             ),
             delete_after_timeout=True,
             starting_page=0,
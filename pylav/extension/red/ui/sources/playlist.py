@@ -93,18 +93,31 @@ class TrackMappingSource(menus.ListPageSource):
         cog: DISCORD_COG_TYPE,
         playlist: Playlist,
         author: discord.abc.User,
-        entries: list[str],
+        entries: list[str] | None = None,
         per_page: int = 10,
+        total: int | None = None,
     ):
-        super().__init__(entries=entries, per_page=per_page)
+        super().__init__(entries=entries or [], per_page=per_page)
         self.cog = cog
         self.author = author
         self.guild_id = guild_id
         self.playlist = playlist
+        self.fetch_from_playlist = entries is None
+        self.total_entries = (total or 0) if self.fetch_from_playlist else len(self.entries)
+        if self.fetch_from_playlist:
+            pages, left_over = divmod(self.total_entries, per_page)
+            if left_over:
+                pages += 1
+            self._max_pages = pages
 
     def is_paginating(self) -> bool:
         return True
 
+    async def get_page(self, page_number: int) -> list[str | JSON_DICT_TYPE]:
+        if not self.fetch_from_playlist:
+            return await super().get_page(page_number)
+        return await self.playlist.fetch_page(offset=page_number * self.per_page, limit=self.per_page)
+
     def get_starting_index_and_page_number(self, menu: PaginatingMenu) -> tuple[int, int]:
         page_num = menu.current_page
         start = page_num * self.per_page
@@ -144,7 +157,7 @@ class TrackMappingSource(menus.ListPageSource):
             messageable=menu.ctx,
         )
 
-        total_number_of_entries = len(self.entries)
+        total_number_of_entries = self.total_entries
         current_page = humanize_number(page_num + 1)
         total_number_of_pages = humanize_number(self.get_max_pages())
 
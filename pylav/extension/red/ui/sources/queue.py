@@ -1,9 +1,8 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from itertools import islice
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import discord
 from redbot.core.i18n import Translator
@@ -16,6 +15,7 @@ from pylav.type_hints.bot import DISCORD_COG_TYPE
 
 if TYPE_CHECKING:
     from pylav.extension.red.ui.menus.queue import QueueMenu, QueuePickerMenu
+    from pylav.players.utils import PlayerQueue
 
 LOGGER = getLogger("PyLav.ext.red.ui.sources.queue")
 
@@ -58,20 +58,54 @@ class QueueSource(menus.ListPageSource):
         self.per_page = 10
         self.guild_id = guild_id
         self.history = history
+        # Pages built for the queue at _pages_version, dropped once a change reaches them
+        self._pages: dict[int, Any] = {}
+        self._pages_queue: PlayerQueue | None = None
+        self._pages_version = 0
 
     @property
-    def entries(self) -> Iterable[Track]:
+    def queue(self) -> PlayerQueue | None:
         if player := self.cog.pylav.get_player(self.guild_id):
-            return player.history.raw_queue if self.history else player.queue.raw_queue
-        else:
-            return []
+            return player.history if self.history else player.queue
+        return None
+
+    @property
+    def entries(self) -> Iterable[Track]:
+        return [] if (queue := self.queue) is None else queue
 
     def is_paginating(self) -> bool:
         return True
 
-    async def get_page(self, page_number: int) -> list[Track]:
+    def _sync_pages(self, queue: PlayerQueue) -> None:
+        if queue is not self._pages_queue:
+            self._pages.clear()
+            self._pages_queue = queue
+        elif (first_changed := queue.first_changed_index(self._pages_version)) is not None:
+            first_page = first_changed // self.per_page
+            for page_number in [page_number for page_number in self._pages if page_number >= first_page]:
+                del self._pages[page_number]
+        self._pages_version = queue.version
+
+    async def _build_page(self, queue: PlayerQueue, page_number: int) -> Any:
         base = page_number * self.per_page
-        return list(islice(self.entries, base, base + self.per_page))
+        return queue.get_range(base, base + self.per_page)
+
+    async def _get_cached_page(self, page_number: int) -> Any | None:
+        if (queue := self.queue) is None:
+            self._pages.clear()
+            self._pages_queue = None
+            return None
+        self._sync_pages(queue)
+        if (page := self._pages.get(page_number)) is None:
+            version = queue.version
+            page = await self._build_page(queue, page_number)
+            # A page built while the queue changed may already be outdated
+            if queue.version == version:
+                self._pages[page_number] = page
+        return page
+
+    async def get_page(self, page_number: int) -> list[Track]:
+        return list(await self._get_cached_page(page_number) or [])
 
     def get_max_pages(self) -> int:
         player = self.cog.pylav.get_player(self.guild_id)
@@ -125,15 +159,25 @@ class QueuePickerSource(QueueSource):
         self.select_mapping: dict[str, Track] = {}
         self.cog = cog
 
+    async def _build_page(
+        self, queue: PlayerQueue, page_number: int
+    ) -> tuple[list[QueueTrackOption], dict[str, Track]]:
+        base = page_number * self.per_page
+        options, mapping = [], {}
+        for i, track in enumerate(queue.get_range(base, base + self.per_page), start=base):
+            options.append(await QueueTrackOption.from_track(track=track, index=i))
+            mapping[track.id] = track
+        return options, mapping
+
     async def get_page(self, page_number):
         if page_number > self.get_max_pages():
             page_number = 0
-        base = page_number * self.per_page
         self.select_options.clear()
         self.select_mapping.clear()
-        for i, track in enumerate(islice(self.entries, base, base + self.per_page), start=base):
-            self.select_options.append(await QueueTrackOption.from_track(track=track, index=i))
-            self.select_mapping[track.id] = track
+        if page := await self._get_cached_page(page_number):
+            options, mapping = page
+            self.select_options.extend(options)
+            self.select_mapping.update(mapping)
         return []
 
     async def format_page(
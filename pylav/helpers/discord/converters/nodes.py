@@ -6,7 +6,6 @@ from typing import TYPE_CHECKING, TypeVar
 
 from discord.app_commands import Choice, Transformer
 from discord.ext import commands
-from rapidfuzz import fuzz
 
 from pylav.exceptions.database import EntryNotFoundException
 from pylav.helpers.format.strings import shorten_string
@@ -67,6 +66,8 @@ else:
                     :25
                 ]
 
+            from rapidfuzz import fuzz
+
             def _filter(c):
                 return fuzz.partial_ratio(c.name, current)
 
@@ -6,7 +6,6 @@ from typing import TYPE_CHECKING, TypeVar
 import asyncstdlib
 from discord.app_commands import Choice, Transformer
 from discord.ext import commands
-from rapidfuzz import fuzz
 
 from pylav.exceptions.database import EntryNotFoundException
 from pylav.helpers.format.strings import shorten_string
@@ -68,6 +67,8 @@ else:
             except EntryNotFoundException:
                 return []
 
+            from rapidfuzz import fuzz
+
             async def _filter(c: PlaylistModel):
                 name = await c.fetch_name()
                 author = await c.fetch_author()
@@ -3,6 +3,8 @@ from __future__ import annotations
 import asyncio
 import functools
 import threading
+import weakref
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable
 from typing import Any
 
@@ -11,6 +13,9 @@ from pylav.type_hints.generics import ANY_GENERIC_TYPE, PARAM_SPEC_TYPE
 _LOCK_SINGLETON_CLASS = threading.Lock()
 _LOCK_SINGLETON_CALLABLE = threading.Lock()
 _LOCKS_SINGLETON_CACHE: dict[str, threading.Lock] = {}
+# Classes whose instances are only weakly referenced by the singleton registry,
+# mapped to the number of most recently used instances which are kept alive regardless.
+_WEAK_SINGLETON_CACHE_SIZES: dict[str, int] = {"Query": 10_000, "Playlist": 1_000}
 
 
 class SingletonClass(type):
@@ -82,10 +87,74 @@ class SingletonCallable:
         return wrapper
 
 
+class SingletonRegistry:
+    """Registry holding the singleton instances of a single class.
+
+    When ``max_size`` is set, instances are only weakly referenced and the ``max_size`` most recently used
+    instances are additionally kept alive, so instances that are still in use keep their identity while unused
+    ones can be garbage collected. Otherwise, every instance is kept alive for the lifetime of the process.
+    """
+
+    __slots__ = ("_instances", "_recent", "_max_size", "_hits", "_misses")
+
+    def __init__(self, max_size: int | None = None) -> None:
+        self._max_size = max_size
+        self._instances: dict[Any, Any] | weakref.WeakValueDictionary[Any, Any] = (
+            {} if max_size is None else weakref.WeakValueDictionary()
+        )
+        self._recent: OrderedDict[Any, Any] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._instances
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def get(self, key: Any) -> Any | None:
+        """Get the instance for the given key, marking it as recently used."""
+        instance = self._instances.get(key)
+        if instance is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._touch(key, instance)
+        return instance
+
+    def set(self, key: Any, instance: Any) -> None:
+        """Register the instance for the given key."""
+        self._instances[key] = instance
+        self._touch(key, instance)
+
+    def _touch(self, key: Any, instance: Any) -> None:
+        if self._max_size is None:
+            return
+        self._recent[key] = instance
+        self._recent.move_to_end(key)
+        while len(self._recent) > self._max_size:
+            self._recent.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all the instances from the registry."""
+        self._instances.clear()
+        self._recent.clear()
+
+    def stats(self) -> dict[str, int | None]:
+        """Get the size and hit statistics of the registry."""
+        return {
+            "size": len(self._instances),
+            "strong": len(self._instances) if self._max_size is None else len(self._recent),
+            "max_size": self._max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+
 class SingletonCachedByKey(type):
     """Singleton metaclass with key caching."""
 
-    _instances: Any = {}
+    _instances: dict[str, SingletonRegistry] = {}
 
     @classmethod
     def _get_key(cls, mro, **kwargs: Any) -> tuple[str, ...] | None:
@@ -99,23 +168,40 @@ class SingletonCachedByKey(type):
                     singleton_key += f".{kwargs.get('bot')}"
                 return singleton_key, key_name
 
+    @classmethod
+    def _get_registry(cls, key_name: str) -> SingletonRegistry:
+        if (registry := cls._instances.get(key_name)) is None:
+            registry = cls._instances[key_name] = SingletonRegistry(max_size=_WEAK_SINGLETON_CACHE_SIZES.get(key_name))
+        return registry
+
+    @classmethod
+    def cache_stats(cls) -> dict[str, dict[str, int | None]]:
+        """Get the size and hit statistics of the singleton registry of every class."""
+        return {key_name: registry.stats() for key_name, registry in cls._instances.items()}
+
+    @classmethod
+    def clear_cache(cls, key_name: str | None = None) -> None:
+        """Clear the singleton registry of the given class, or all of them if not specified."""
+        for name, registry in cls._instances.items():
+            if key_name is None or name == key_name:
+                registry.clear()
+
     def __call__(cls, *args: Any, **kwargs: Any) -> Any:
         # sourcery skip: instance-method-first-arg-name
         key = cls._get_key(cls.mro(), **kwargs)
-        if key not in cls._instances:
-            rps = cls._locked_call(*args, **kwargs)
-            if key is None:
-                return rps
-        return cls._instances[key]
-
-    def _locked_call(cls, *args: Any, **kwargs: Any) -> Any:
-        if super().__class__.__name__ not in _LOCKS_SINGLETON_CACHE:
-            _LOCKS_SINGLETON_CACHE[super().__class__.__name__] = threading.Lock()
-        with _LOCKS_SINGLETON_CACHE[super().__class__.__name__]:
-            key = cls._get_key(cls.mro(), **kwargs)
-            if key not in cls._instances:
-                singleton = super().__call__(*args, **kwargs)
-                if key is not None:
-                    cls._instances[key] = singleton
-                else:
-                    return singleton
+        if key is None:
+            return super().__call__(*args, **kwargs)
+        if (singleton := cls._get_registry(key[1]).get(key)) is not None:
+            return singleton
+        return cls._locked_call(key, *args, **kwargs)
+
+    def _locked_call(cls, key: tuple[str, ...], *args: Any, **kwargs: Any) -> Any:
+        if key[1] not in _LOCKS_SINGLETON_CACHE:
+            _LOCKS_SINGLETON_CACHE[key[1]] = threading.Lock()
+        with _LOCKS_SINGLETON_CACHE[key[1]]:
+            registry = cls._get_registry(key[1])
+            if (singleton := registry.get(key)) is not None:
+                return singleton
+            singleton = super().__call__(*args, **kwargs)
+            registry.set(key, singleton)
+            return singleton
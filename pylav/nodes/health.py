@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import collections
+import math
+import time
+from typing import Any
+
+from pylav.constants.node import (
+    HEALTH_DRAIN_CHECKS,
+    HEALTH_DRAIN_SCORE,
+    HEALTH_ERROR_WEIGHT,
+    HEALTH_EWMA_ALPHA,
+    HEALTH_LATENCY_WEIGHT,
+    HEALTH_MIN_SAMPLES,
+    HEALTH_RECOVER_SCORE,
+    HEALTH_WEBSOCKET_DELAY_WEIGHT,
+    HEALTH_WINDOW_SECONDS,
+    HEALTH_WINDOW_SIZE,
+)
+
+
+class LatencyWindow:
+    """Latency and error rate of recent requests.
+
+    Keeps an exponentially weighted moving average of the latency as well as the last few samples,
+    which are used for percentiles and for the error rate over the last :data:`HEALTH_WINDOW_SECONDS`.
+    """
+
+    __slots__ = ("_samples", "_ewma", "_window", "total", "errors")
+
+    def __init__(self, window: float = HEALTH_WINDOW_SECONDS, size: int = HEALTH_WINDOW_SIZE) -> None:
+        self._samples: collections.deque[tuple[float, float, bool]] = collections.deque(maxlen=size)
+        self._ewma: float | None = None
+        self._window = window
+        self.total = 0
+        self.errors = 0
+
+    def record(self, latency: float, ok: bool = True) -> None:
+        """Record a request.
+
+        Parameters
+        ----------
+        latency: :class:`float`
+            The number of seconds the request took.
+        ok: :class:`bool`
+            Whether the request succeeded.
+        """
+        self.total += 1
+        if not ok:
+            self.errors += 1
+        self._samples.append((time.monotonic(), latency, ok))
+        self._ewma = latency if self._ewma is None else self._ewma + HEALTH_EWMA_ALPHA * (latency - self._ewma)
+
+    def _recent(self) -> list[tuple[float, float, bool]]:
+        cutoff = time.monotonic() - self._window
+        while self._samples and self._samples[0][0] < cutoff:
+            self._samples.popleft()
+        return list(self._samples)
+
+    @property
+    def samples(self) -> int:
+        """The number of requests within the window"""
+        return len(self._recent())
+
+    @property
+    def ewma(self) -> float:
+        """The moving average of the latency in seconds, 0 if nothing has been recorded yet"""
+        return self._ewma or 0.0
+
+    @property
+    def error_rate(self) -> float:
+        """The fraction of requests within the window which failed"""
+        recent = self._recent()
+        return sum(1 for __, __, ok in recent if not ok) / len(recent) if recent else 0.0
+
+    def percentile(self, percentile: float) -> float:
+        """The given percentile of the latency of the requests within the window, in seconds"""
+        if not (recent := sorted(latency for __, latency, __ in self._recent())):
+            return 0.0
+        return recent[min(len(recent) - 1, max(0, math.ceil(percentile / 100 * len(recent)) - 1))]
+
+    @property
+    def penalty(self) -> float:
+        """The penalty of this window, 0 until enough requests have been recorded"""
+        if self.samples < HEALTH_MIN_SAMPLES:
+            return 0.0
+        return self.ewma * HEALTH_LATENCY_WEIGHT + self.error_rate * HEALTH_ERROR_WEIGHT
+
+    def to_dict(self) -> dict[str, Any]:
+        """The current state of the window"""
+        return {
+            "samples": self.samples,
+            "total": self.total,
+            "errors": self.errors,
+            "ewma": self.ewma,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "error_rate": self.error_rate,
+        }
+
+
+class NodeHealth:
+    """Health of a node as observed by PyLav.
+
+    The Lavalink stats only describe the load of the node itself, this tracks what PyLav actually sees:
+    the latency and error rate of each REST endpoint, the success rate of each source when loading tracks and
+    how late WebSocket messages arrive. These are combined into a :attr:`score` which is added to the node's penalty.
+
+    A node whose score stays above :data:`HEALTH_DRAIN_SCORE` for :data:`HEALTH_DRAIN_CHECKS` consecutive
+    checks is marked as draining, and is only picked for new players if no other node is available,
+    until its score stays below :data:`HEALTH_RECOVER_SCORE` for as many checks.
+    """
+
+    __slots__ = ("_endpoints", "_sources", "_websocket", "_websocket_offset", "_draining", "_streak")
+
+    def __init__(self) -> None:
+        self._endpoints: collections.defaultdict[str, LatencyWindow] = collections.defaultdict(LatencyWindow)
+        self._sources: collections.defaultdict[str, LatencyWindow] = collections.defaultdict(LatencyWindow)
+        self._websocket = LatencyWindow()
+        self._websocket_offset: float | None = None
+        self._draining = False
+        self._streak = 0
+
+    @property
+    def draining(self) -> bool:
+        """Whether the node has been degraded long enough that it shouldn't receive new players"""
+        return self._draining
+
+    def record_request(self, endpoint: str, latency: float, ok: bool) -> None:
+        """Record a REST request to the given endpoint"""
+        self._endpoints[endpoint].record(latency, ok)
+
+    def record_source(self, source: str, latency: float, ok: bool) -> None:
+        """Record a track load from the given source"""
+        self._sources[source.lower()].record(latency, ok)
+
+    def record_websocket_message(self, sent_at: int) -> None:
+        """Record a WebSocket message stamped by the node.
+
+        Parameters
+        ----------
+        sent_at: :class:`int`
+            The unix timestamp in milliseconds at which the node sent the message.
+        """
+        offset = time.time() - sent_at / 1000
+        # The smallest offset seen is the clock difference between PyLav and the node, anything above it is delay.
+        # It slowly creeps up so that a clock adjustment on either side doesn't skew the delay forever.
+        if self._websocket_offset is None or offset < self._websocket_offset:
+            self._websocket_offset = offset
+        else:
+            self._websocket_offset += (offset - self._websocket_offset) * 0.001
+        self._websocket.record(offset - self._websocket_offset)
+
+    def reset(self) -> None:
+        """Forget everything recorded so far, used when the node reconnects"""
+        self._endpoints.clear()
+        self._sources.clear()
+        self._websocket = LatencyWindow()
+        self._websocket_offset = None
+        self._draining = False
+        self._streak = 0
+
+    @property
+    def rest_penalty(self) -> float:
+        """The penalty from the REST requests, weighted by how many requests each endpoint received"""
+        windows = [(window.samples, window.penalty) for window in self._endpoints.values()]
+        total = sum(samples for samples, __ in windows)
+        return sum(samples * penalty for samples, penalty in windows) / total if total else 0.0
+
+    @property
+    def websocket_penalty(self) -> float:
+        """The penalty from WebSocket messages arriving late"""
+        if self._websocket.samples < HEALTH_MIN_SAMPLES:
+            return 0.0
+        return self._websocket.ewma * HEALTH_WEBSOCKET_DELAY_WEIGHT
+
+    def source_latency(self, source: str, percentile: float) -> float | None:
+        """The given percentile of the latency of track loads from the given source.
+
+        Returns `None` until enough track loads have been recorded for the source.
+        """
+        if (window := self._sources.get(source.lower())) is None or window.samples < HEALTH_MIN_SAMPLES:
+            return None
+        return window.percentile(percentile)
+
+    def source_penalty(self, source: str | None) -> float:
+        """The penalty for loading tracks from the given source"""
+        if not source or (window := self._sources.get(source.lower())) is None:
+            return 0.0
+        return window.penalty
+
+    @property
+    def score(self) -> float:
+        """The overall health score of the node, 0 being perfectly healthy"""
+        return self.rest_penalty + self.websocket_penalty
+
+    def check(self) -> bool | None:
+        """Update the draining state from the current score.
+
+        Returns
+        -------
+        Optional[:class:`bool`]
+            The new draining state if it changed, `None` otherwise.
+        """
+        score = self.score
+        if (score >= HEALTH_DRAIN_SCORE) if not self._draining else (score < HEALTH_RECOVER_SCORE):
+            self._streak += 1
+        else:
+            self._streak = 0
+        if self._streak < HEALTH_DRAIN_CHECKS:
+            return None
+        self._streak = 0
+        self._draining = not self._draining
+        return self._draining
+
+    def stats(self) -> dict[str, Any]:
+        """The current health of the node"""
+        return {
+            "score": self.score,
+            "draining": self._draining,
+            "endpoints": {endpoint: window.to_dict() for endpoint, window in self._endpoints.items()},
+            "sources": {source: window.to_dict() for source, window in self._sources.items()},
+            "websocket": self._websocket.to_dict(),
+        }
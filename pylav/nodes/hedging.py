@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+import asyncstdlib
+
+from pylav.constants.config import HEDGING_ENABLED, HEDGING_MAX_EXTRA_LOAD, HEDGING_PERCENTILE
+from pylav.constants.node import HEDGING_BURST, HEDGING_DEFAULT_DELAY, HEDGING_MIN_DELAY
+from pylav.exceptions.request import HTTPException
+from pylav.logging import getLogger
+from pylav.nodes.utils import sort_key_nodes
+
+if TYPE_CHECKING:
+    from pylav.nodes.api.responses import rest_api
+    from pylav.nodes.node import Node
+    from pylav.players.query.obj import Query
+
+LOGGER = getLogger("PyLav.HedgedLoader")
+
+
+def _is_valid(task: asyncio.Task) -> bool:
+    if task.cancelled() or task.exception() is not None:
+        return False
+    response = task.result()
+    return not isinstance(response, HTTPException) and response.loadType != "error"
+
+
+class HedgedLoader:
+    """Loads tracks from a node, and sends the same query to a second node if the first one is too slow.
+
+    A query is hedged once it has been running for longer than the :data:`HEDGING_PERCENTILE` percentile
+    of the recent load times of its source on the first node, the first valid response wins and the other
+    request is cancelled.
+    Every load earns a fraction of a hedge, so hedging never adds more than :data:`HEDGING_MAX_EXTRA_LOAD`
+    extra requests on top of the normal load, with short bursts of at most :data:`HEDGING_BURST` hedges.
+    """
+
+    __slots__ = (
+        "enabled",
+        "_percentile",
+        "_max_extra_load",
+        "_tokens",
+        "_burst",
+        "_loads",
+        "_hedged",
+        "_hedges_won",
+    )
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = HEDGING_ENABLED,
+        percentile: float = HEDGING_PERCENTILE,
+        max_extra_load: float = HEDGING_MAX_EXTRA_LOAD,
+        burst: int = HEDGING_BURST,
+    ) -> None:
+        self.enabled = enabled
+        self._percentile = percentile
+        self._max_extra_load = max_extra_load
+        self._burst = burst
+        self._tokens = float(burst)
+        self._loads = 0
+        self._hedged = 0
+        self._hedges_won = 0
+
+    def delay_for(self, node: Node, source: str) -> float:
+        """The number of seconds to wait for the given node before hedging a query for the given source"""
+        latency = node.health.source_latency(source, self._percentile)
+        return HEDGING_DEFAULT_DELAY if latency is None else max(HEDGING_MIN_DELAY, latency)
+
+    def stats(self) -> dict[str, Any]:
+        """How often queries have been hedged and how often the hedge won"""
+        return {
+            "enabled": self.enabled,
+            "loads": self._loads,
+            "hedged": self._hedged,
+            "hedges_won": self._hedges_won,
+            "budget": self._tokens,
+        }
+
+    @staticmethod
+    async def _pick_backup(primary: Node, nodes: list[Node], query: Query, region: str | None) -> Node | None:
+        candidates = [
+            n
+            for n in nodes
+            if n is not primary and n.available and not n.draining and n.has_source(query.requires_capability)
+        ]
+        return await asyncstdlib.min(
+            candidates, key=partial(sort_key_nodes, region=region, feature=query.requires_capability), default=None
+        )
+
+    def _take_hedge(self) -> bool:
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    async def get_track(
+        self,
+        node: Node,
+        nodes: list[Node],
+        query: Query,
+        *,
+        first: bool = False,
+        bypass_cache: bool = False,
+        region: str | None = None,
+    ) -> rest_api.LoadTrackResponses:
+        """|coro|
+        Load a query from the given node, hedging it to another node if the given node is too slow.
+
+        Parameters
+        ----------
+        node: :class:`Node`
+            The node to load the query from.
+        nodes: :class:`list`[:class:`Node`]
+            The nodes which can be used as a backup.
+        query: :class:`Query`
+            The query to load.
+        first: :class:`bool`
+            Whether to return the first result or all results.
+        bypass_cache: :class:`bool`
+            Whether to bypass the cache.
+        region: :class:`str`
+            The region of the player the query is for, used to pick the backup node.
+
+        Returns
+        -------
+        LavalinkLoadTrackObjects
+            The first valid response, or the response of the given node if neither was valid.
+        """
+        if not self.enabled:
+            return await node.get_track(query, first=first, bypass_cache=bypass_cache)
+        self._loads += 1
+        self._tokens = min(float(self._burst), self._tokens + self._max_extra_load)
+        started_at = time.monotonic()
+        primary = asyncio.create_task(node.get_track(query, first=first, bypass_cache=bypass_cache))
+        tasks = {primary}
+        try:
+            with contextlib.suppress(asyncio.TimeoutError):
+                return await asyncio.wait_for(
+                    asyncio.shield(primary), timeout=self.delay_for(node, query.requires_capability)
+                )
+            backup_node = await self._pick_backup(node, nodes, query, region)
+            if backup_node is None or not self._take_hedge():
+                return await primary
+            self._hedged += 1
+            LOGGER.trace("Hedging %s from %s to %s", query, node.name, backup_node.name)
+            # The cache was already checked by the first request
+            backup = asyncio.create_task(backup_node.get_track(query, first=first, bypass_cache=True))
+            tasks.add(backup)
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if winner := next((task for task in done if _is_valid(task)), None):
+                    if winner is backup:
+                        self._hedges_won += 1
+                        # The slow request never finishes, record its lower bound so the percentile stays honest
+                        node.health.record_source(query.requires_capability, time.monotonic() - started_at, True)
+                    return winner.result()
+            return await primary
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
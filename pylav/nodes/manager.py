@@ -9,14 +9,21 @@ from typing import TYPE_CHECKING
 import aiohttp
 import asyncstdlib
 
-from pylav.compat import json
 from pylav.constants.builtin_nodes import BUNDLED_NODES_IDS_HOST_MAPPING, PYLAV_BUNDLED_NODES_SETTINGS
 from pylav.constants.config import EXTERNAL_UNMANAGED_NAME, JAVA_EXECUTABLE
 from pylav.constants.coordinates import DEFAULT_REGIONS, REGION_TO_COUNTRY_COORDINATE_MAPPING
-from pylav.events.node import NodeConnectedEvent, NodeDisconnectedEvent
+from pylav.constants.node import NODE_DRAIN_BATCH_SIZE, NODE_DRAIN_INTERVAL, NODE_DRAIN_MAX_INTERVAL, NODE_DRAIN_TIMEOUT
+from pylav.events.node import (
+    NodeConnectedEvent,
+    NodeDisconnectedEvent,
+    NodeDrainedEvent,
+    NodeDrainingEvent,
+    PlayersMigratedEvent,
+)
 from pylav.exceptions.client import PyLavNotInitializedException
 from pylav.helpers.misc import ExponentialBackoffWithReset
 from pylav.logging import getLogger
+from pylav.nodes.migration import MigrationReport, PlayerMigrator
 from pylav.nodes.node import Node
 from pylav.nodes.utils import sort_key_nodes
 from pylav.players.player import Player
@@ -43,6 +50,8 @@ class NodeManager:
         "_nodes",
         "_adding_nodes",
         "_player_migrate_task",
+        "_migrator",
+        "_drain_tasks",
     )
 
     def __init__(
@@ -54,7 +63,7 @@ class NodeManager:
         external_ssl: bool = False,
     ):
         self._client = client
-        self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=120), json_serialize=json.dumps)
+        self._session = client.http_transport.session()
         self._player_queue = set()
         self._unmanaged_external_host = external_host
         self._unmanaged_external_password = external_password
@@ -63,6 +72,8 @@ class NodeManager:
         self._nodes = []
         self._adding_nodes = asyncio.Event()
         self._player_migrate_task = None
+        self._migrator = PlayerMigrator()
+        self._drain_tasks: dict[int, asyncio.Task] = {}
 
     def __iter__(self):
         yield from self._nodes
@@ -112,6 +123,11 @@ class NodeManager:
         """Clears the player queue"""
         self._player_queue.clear()
 
+    @property
+    def active_migrations(self) -> list[MigrationReport]:
+        """Returns the progress reports of the player migrations currently in progress"""
+        return self._migrator.active_migrations
+
     async def add_node(
         self,
         *,
@@ -239,6 +255,8 @@ class NodeManager:
         node: :class:`Node`
             The node to remove from the list.
         """
+        if (task := self._drain_tasks.pop(node.identifier, None)) is not None:
+            task.cancel()
         await node.close()
         self.nodes.remove(node)
         # noinspection PyProtectedMember
@@ -354,7 +372,13 @@ class NodeManager:
 
         if not nodes:
             nodes = await self._get_fall_back_nodes(already_attempted_regions, feature, nodes)
-        node = await asyncstdlib.min(nodes, key=partial(sort_key_nodes, region=region), default=None) if nodes else None
+        # Draining nodes are only used as a last resort
+        nodes = [n for n in nodes if not n.draining] or nodes
+        node = (
+            await asyncstdlib.min(nodes, key=partial(sort_key_nodes, region=region, feature=feature), default=None)
+            if nodes
+            else None
+        )
         if node is None and wait:
             await asyncio.sleep(delay)
             return await self.find_best_node(
@@ -430,19 +454,27 @@ class NodeManager:
         self.client.dispatch_event(NodeConnectedEvent(node))
 
     async def _player_change_node_task(self, node):
-        for player in iter(self.player_queue):
-            await player.change_node(node, forced=True)
-            # noinspection PyProtectedMember
-            node._logger.debug("Successfully moved %s", player.guild.id)
+        failed = []
+        if queued := self.player_queue:
+            report = await self._migrator.migrate(queued, [node])
+            failed.extend(report.failed_players)
+            self.client.dispatch_event(PlayersMigratedEvent(report))
         # noinspection PyProtectedMember
-        if self.client._connect_back:
-            # noinspection PyProtectedMember
-            for player in iter(node._original_players):
-                await player.change_node(node, forced=True)
+        if self.client._connect_back and (original_players := node._original_players):
+
+            def _reset_original_node(player: Player) -> None:
                 player._original_node = None
-        del self.player_queue
+
+            report = await self._migrator.migrate(original_players, [node], on_moved=_reset_original_node)
+            self.client.dispatch_event(PlayersMigratedEvent(report))
+        self.player_queue = failed
         self._player_migrate_task = None
 
+    def _migration_targets(self, exclude: Node) -> list[Node]:
+        """Returns the nodes players can be moved to when the given node goes down"""
+        nodes = [n for n in self.available_nodes if n.identifier != exclude.identifier and not n.search_only]
+        return [n for n in nodes if not n.draining] or nodes
+
     async def node_disconnect(self, node: Node, code: int, reason: str) -> None:
         """
         Called when a node is disconnected from Lavalink.
@@ -467,22 +499,110 @@ class NodeManager:
             node,
         )
         self.client.dispatch_event(NodeDisconnectedEvent(node, code, reason))
-        best_node = await self.find_best_node(region=node.region)
-        if not best_node or not best_node.available:
-            self.player_queue = self.player_queue + node.players
+        if not (players := node.players):
+            return
+        targets = self._migration_targets(node)
+        if not targets:
+            self.player_queue = self.player_queue + players
             LOGGER.error("Unable to move players, no available nodes! Waiting for a node to become available")
             return
 
-        for player in iter(node.players):
-            await player.change_node(best_node, forced=True)
+        def _set_original_node(player: Player) -> None:
+            player._original_node = node
+
+        # noinspection PyProtectedMember
+        report = await self._migrator.migrate(
+            players, targets, source=node, on_moved=_set_original_node if self.client._connect_back else None
+        )
+        if report.failed_players:
+            self.player_queue = self.player_queue + report.failed_players
+        self.client.dispatch_event(PlayersMigratedEvent(report))
+
+    async def drain_node(self, node: Node, timeout: float = NODE_DRAIN_TIMEOUT) -> None:
+        """Take a node out of rotation without interrupting playback.
+
+        The node stops receiving new players and searches straight away. Playing players move to another node
+        when their current track ends, idle and paused players are moved in batches of
+        :data:`NODE_DRAIN_BATCH_SIZE`, and any player still on the node after the timeout is moved regardless.
+        A :class:`NodeDrainedEvent` is dispatched once the node has no players left.
+
+        The node stays out of rotation until :meth:`undrain_node` is called.
+
+        Parameters
+        ----------
+        node: :class:`Node`
+            The node to drain.
+        timeout: :class:`float`
+            How long to wait for playing players to reach the end of their track before moving them anyway.
+        """
+        if node.drain_requested:
+            return
+        # noinspection PyProtectedMember
+        node._drain_requested = True
+        # noinspection PyProtectedMember
+        node._drained.clear()
+        LOGGER.info("Draining %s, no new players will be sent there", node.name)
+        self.client.dispatch_event(NodeDrainingEvent(node=node, draining=True, score=node.health.score))
+        self._drain_tasks[node.identifier] = task = asyncio.create_task(self._drain_node_task(node, timeout))
+        task.set_name(f"PyLavNodeManager.drain.{node.identifier}")
+
+    async def undrain_node(self, node: Node) -> None:
+        """Put a node drained with :meth:`drain_node` back into rotation.
+
+        Parameters
+        ----------
+        node: :class:`Node`
+            The node to put back into rotation.
+        """
+        if (task := self._drain_tasks.pop(node.identifier, None)) is not None:
+            task.cancel()
+        if not node.drain_requested:
+            return
+        # noinspection PyProtectedMember
+        node._drain_requested = False
+        # noinspection PyProtectedMember
+        node._drained.clear()
+        LOGGER.info("%s is back in rotation", node.name)
+        self.client.dispatch_event(NodeDrainingEvent(node=node, draining=node.draining, score=node.health.score))
+
+    async def _drain_node_task(self, node: Node, timeout: float) -> None:
+        deadline = asyncio.get_running_loop().time() + timeout
+        interval = NODE_DRAIN_INTERVAL
+        try:
+            while players := node.players:
+                # Playing players are moved by Player.play when their next track starts
+                if asyncio.get_running_loop().time() < deadline:
+                    players = [p for p in players if not p.is_playing]
+                if batch := players[:NODE_DRAIN_BATCH_SIZE]:
+                    if not (targets := self._migration_targets(node)):
+                        if interval == NODE_DRAIN_INTERVAL:
+                            LOGGER.warning(
+                                "Unable to drain %s, no other nodes are available, waiting for one to connect",
+                                node.name,
+                            )
+                        interval = min(interval * 2, NODE_DRAIN_MAX_INTERVAL)
+                    else:
+                        if interval != NODE_DRAIN_INTERVAL:
+                            LOGGER.info("Resuming the drain of %s", node.name)
+                            interval = NODE_DRAIN_INTERVAL
+                        report = await self._migrator.migrate(batch, targets, source=node)
+                        self.client.dispatch_event(PlayersMigratedEvent(report))
+                await asyncio.sleep(interval)
+            LOGGER.info("%s has been drained", node.name)
             # noinspection PyProtectedMember
-            if self.client._connect_back:
-                player._original_node = node
+            node._drained.set()
+            self.client.dispatch_event(NodeDrainedEvent(node))
+        finally:
+            if self._drain_tasks.get(node.identifier) is asyncio.current_task():
+                del self._drain_tasks[node.identifier]
 
     async def close(self) -> None:
         """Disconnects all nodes and closes the session."""
         if self._player_migrate_task is not None:
             self._player_migrate_task.cancel()
+        for task in self._drain_tasks.values():
+            task.cancel()
+        self._drain_tasks.clear()
         await self.session.close()
         for node in iter(self.nodes):
             await node.close()
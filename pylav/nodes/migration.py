@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import time
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING
+
+from pylav.constants.node import MAX_CONCURRENT_MIGRATIONS_PER_NODE, MIGRATION_PROGRESS_LOG_INTERVAL
+from pylav.logging import getLogger
+
+if TYPE_CHECKING:
+    from pylav.nodes.node import Node
+    from pylav.players.player import Player
+
+LOGGER = getLogger("PyLav.NodeMigration")
+
+
+@dataclasses.dataclass(eq=False, slots=True, kw_only=True)
+class MigrationReport:
+    """Progress of a batch of players being moved between nodes.
+
+    The report is updated in place while the migration runs, so it can be inspected at any time.
+    """
+
+    source: Node | None
+    total: int
+    playing: int
+    moved: int = 0
+    failed: int = 0
+    started_at: float = dataclasses.field(default_factory=time.monotonic)
+    finished_at: float | None = None
+    downtime: float = 0.0
+    max_downtime: float = 0.0
+    targets: dict[int, int] = dataclasses.field(default_factory=dict)
+    failed_players: list[Player] = dataclasses.field(default_factory=list)
+
+    @property
+    def pending(self) -> int:
+        """The number of players which haven't been moved yet"""
+        return self.total - self.moved - self.failed
+
+    @property
+    def finished(self) -> bool:
+        """Whether all players have been processed"""
+        return self.finished_at is not None
+
+    @property
+    def duration(self) -> float:
+        """The number of seconds the migration took, or has taken so far"""
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def average_downtime(self) -> float:
+        """The average number of seconds a playing player was silent for"""
+        return self.downtime / self.playing if self.playing else 0.0
+
+
+def migration_priority(player: Player) -> int:
+    """The order in which players are moved, players which are currently playing go first"""
+    if player.is_playing:
+        return 0
+    if player.is_active:
+        return 1
+    return 2 if player.is_connected else 3
+
+
+class PlayerMigrator:
+    """Moves players between nodes concurrently.
+
+    Players are spread across all the given nodes based on their penalty, taking into account the players
+    already assigned to each node during this migration, and each target node only receives a limited number of
+    players at once so that a failover doesn't flood a single node with requests.
+    """
+
+    __slots__ = ("_concurrency", "_semaphores", "_reports")
+
+    def __init__(self, concurrency: int = MAX_CONCURRENT_MIGRATIONS_PER_NODE) -> None:
+        self._concurrency = concurrency
+        self._semaphores: dict[int, asyncio.Semaphore] = {}
+        self._reports: list[MigrationReport] = []
+
+    @property
+    def active_migrations(self) -> list[MigrationReport]:
+        """The reports of the migrations currently in progress"""
+        return list(self._reports)
+
+    def _semaphore(self, node: Node) -> asyncio.Semaphore:
+        if node.identifier not in self._semaphores:
+            self._semaphores[node.identifier] = asyncio.Semaphore(self._concurrency)
+        return self._semaphores[node.identifier]
+
+    @staticmethod
+    async def assign(players: list[Player], nodes: list[Node]) -> list[tuple[Player, Node]]:
+        """Assign a target node to each player.
+
+        Parameters
+        ----------
+        players: :class:`list`[:class:`Player`]
+            The players to assign, in the order they should be moved.
+        nodes: :class:`list`[:class:`Node`]
+            The nodes the players can be moved to.
+
+        Returns
+        -------
+        :class:`list`[:class:`tuple`[:class:`Player`, :class:`Node`]]
+            The player and node pairs, in the same order as the given players.
+        """
+        penalties: dict[tuple[int, str | None], float] = {}
+        # An active player adds to a node's penalty as soon as it starts playing there,
+        # idle players are still spread but weigh much less.
+        load: dict[int, float] = {node.identifier: 0.0 for node in nodes}
+        assignments = []
+        for player in players:
+            best_node = None
+            best_cost = float("inf")
+            for node in nodes:
+                key = (node.identifier, player.region)
+                if key not in penalties:
+                    penalties[key] = await node.penalty_with_region(player.region)
+                cost = penalties[key] + load[node.identifier]
+                if best_node is None or cost < best_cost:
+                    best_node, best_cost = node, cost
+            load[best_node.identifier] += 1.0 if player.is_active else 0.1
+            assignments.append((player, best_node))
+        return assignments
+
+    async def migrate(
+        self,
+        players: Iterable[Player],
+        nodes: list[Node],
+        *,
+        source: Node | None = None,
+        on_moved: Callable[[Player], None] | None = None,
+    ) -> MigrationReport:
+        """Move the given players to the given nodes.
+
+        Parameters
+        ----------
+        players: :class:`Iterable`[:class:`Player`]
+            The players to move.
+        nodes: :class:`list`[:class:`Node`]
+            The nodes the players can be moved to.
+        source: :class:`Node`
+            The node the players are being moved away from, if any.
+        on_moved: :class:`Callable`[[:class:`Player`], None]
+            Called for each player once it has been moved.
+
+        Returns
+        -------
+        :class:`MigrationReport`
+            The report of the migration,
+            players which couldn't be moved are in :attr:`MigrationReport.failed_players`.
+        """
+        players = sorted(players, key=migration_priority)
+        report = MigrationReport(source=source, total=len(players), playing=sum(1 for p in players if p.is_playing))
+        if not players:
+            report.finished_at = time.monotonic()
+            return report
+
+        async def _move(player: Player, node: Node) -> None:
+            playing = player.is_playing
+            async with self._semaphore(node):
+                try:
+                    await player.change_node(node, forced=True)
+                except Exception as exc:
+                    report.failed += 1
+                    report.failed_players.append(player)
+                    LOGGER.warning("Failed to move player %s to %s: %s", player.guild.id, node.name, exc)
+                    LOGGER.debug("Failed to move player %s to %s", player.guild.id, node.name, exc_info=exc)
+                    return
+            report.moved += 1
+            report.targets[node.identifier] = report.targets.get(node.identifier, 0) + 1
+            if playing:
+                downtime = time.monotonic() - report.started_at
+                report.downtime += downtime
+                report.max_downtime = max(report.max_downtime, downtime)
+            # noinspection PyProtectedMember
+            node._logger.debug("Successfully moved %s", player.guild.id)
+            if on_moved is not None:
+                on_moved(player)
+            if (report.moved + report.failed) % MIGRATION_PROGRESS_LOG_INTERVAL == 0:
+                LOGGER.info(
+                    "Moved %s/%s players (%s failed) in %.2f seconds",
+                    report.moved,
+                    report.total,
+                    report.failed,
+                    report.duration,
+                )
+
+        # Tasks are created in priority order and semaphores are FIFO, so playing players are moved first
+        self._reports.append(report)
+        try:
+            await asyncio.gather(*(_move(player, node) for player, node in await self.assign(players, nodes)))
+        finally:
+            self._reports.remove(report)
+            report.finished_at = time.monotonic()
+        LOGGER.info(
+            "Moved %s/%s players%s in %.2f seconds (%s failed), playing players were silent for %.2f seconds "
+            "on average and %.2f seconds at most",
+            report.moved,
+            report.total,
+            f" away from {source.name}" if source is not None else "",
+            report.duration,
+            report.failed,
+            report.average_downtime,
+            report.max_downtime,
+        )
+        return report
@@ -6,6 +6,7 @@ import dataclasses
 import datetime
 import functools
 import logging
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Any, Literal
 from uuid import uuid4
 
@@ -24,8 +25,10 @@ from pylav.constants.coordinates import REGION_TO_COUNTRY_COORDINATE_MAPPING
 from pylav.constants.node import GOOD_RESPONSE_RANGE, MAX_SUPPORTED_API_MAJOR_VERSION
 from pylav.constants.node_features import SUPPORTED_FEATURES, SUPPORTED_SOURCES
 from pylav.constants.regex import SEMANTIC_VERSIONING
+from pylav.enums.requests import RequestPriority
 from pylav.events.api import LavalinkLoadSearchEvent, LavalinkLoadtracksEvent
 from pylav.events.base import PyLavEvent
+from pylav.events.node import NodeDrainingEvent
 from pylav.exceptions.request import HTTPException, UnauthorizedException
 from pylav.helpers.time import get_now_utc
 from pylav.logging import getLogger
@@ -35,6 +38,8 @@ from pylav.nodes.api.responses.errors import LavalinkError
 from pylav.nodes.api.responses.rest_api import PlaylistData
 from pylav.nodes.api.responses.route_planner import Status as RoutePlannerStart
 from pylav.nodes.api.responses.track import Track
+from pylav.nodes.health import NodeHealth
+from pylav.nodes.scheduler import RequestScheduler, RequestSlot
 from pylav.nodes.utils import EMPTY_RESPONSE, Stats
 from pylav.nodes.websocket import WebSocket
 from pylav.players.filters import (
@@ -73,6 +78,10 @@ class Node:
         "_query_cls",
         "_manager",
         "_session",
+        "_scheduler",
+        "_health",
+        "_drain_requested",
+        "_drained",
         "_temporary",
         "_host",
         "_port",
@@ -122,7 +131,8 @@ class Node:
         self._version: Version | None = None
         self._api_version: int | None = None
         self._manager = manager
-        self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=120), json_serialize=json.dumps)
+        # noinspection PyProtectedMember
+        self._session = self._manager._client.http_transport.session()
         self._temporary = temporary
         if not temporary:
             # noinspection PyProtectedMember
@@ -139,6 +149,10 @@ class Node:
         self._disabled_sources = set(disabled_sources or [])
 
         self._logger = getLogger(f"PyLav.Node-{self._name}")
+        self._scheduler = RequestScheduler(self._name)
+        self._health = NodeHealth()
+        self._drain_requested = False
+        self._drained = asyncio.Event()
 
         if self._manager.get_node_by_id(unique_identifier) is not None:
             raise ValueError(f"A Node with identifier:{unique_identifier} already exists")
@@ -191,12 +205,16 @@ class Node:
 
     async def _unhealthy(self) -> None:
         del self.down_votes
+        self._health.reset()
+        local_node_manager = (
+            self.node_manager.client.managed_node_pool.get_manager(self.identifier) if self.managed else None
+        )
         if self._ws is not None:
             await self.websocket.manual_closure(
-                managed_node=self.identifier == self.node_manager.client.bot.user.id and self.websocket is not None
+                managed_node=local_node_manager is not None and self.websocket is not None
             )
-        if self.identifier == self.node_manager.client.bot.user.id:
-            await self.node_manager.client.managed_node_controller.restart()
+        if local_node_manager is not None:
+            await local_node_manager.restart()
             with contextlib.suppress(Exception):
                 await self.close()
 
@@ -218,6 +236,15 @@ class Node:
                 self._logger.warning("Unhealthy - Triggering a state reset")
                 await self._unhealthy()
 
+            if (draining := self._health.check()) is not None:
+                if draining:
+                    self._logger.warning(
+                        "Degraded - Health score %.2f, no new players will be sent here", self._health.score
+                    )
+                else:
+                    self._logger.info("Recovered - Health score %.2f", self._health.score)
+                self.dispatch_event(NodeDrainingEvent(node=self, draining=draining, score=self._health.score))
+
             playing_players = len(self.playing_players)
             if playing_players == 0:
                 return
@@ -285,6 +312,35 @@ class Node:
         """The aiohttp session of the node"""
         return self._session
 
+    @property
+    def scheduler(self) -> RequestScheduler:
+        """The scheduler limiting the concurrent REST requests sent to the node"""
+        return self._scheduler
+
+    @property
+    def health(self) -> NodeHealth:
+        """The health of the node as observed from its REST and WebSocket timings"""
+        return self._health
+
+    @property
+    def draining(self) -> bool:
+        """Whether the node is being drained or has been degraded for a while, and should not receive new players"""
+        return self._drain_requested or self._health.draining
+
+    @property
+    def drain_requested(self) -> bool:
+        """Whether the node is being drained with :meth:`NodeManager.drain_node`"""
+        return self._drain_requested
+
+    @property
+    def drained(self) -> bool:
+        """Whether the node was drained with :meth:`NodeManager.drain_node` and has no players left"""
+        return self._drained.is_set()
+
+    async def wait_until_drained(self, timeout: float | None = None) -> None:
+        """Wait until the node was drained with :meth:`NodeManager.drain_node` and has no players left"""
+        await asyncio.wait_for(self._drained.wait(), timeout=timeout)
+
     @property
     def websocket(self) -> WebSocket:
         """The websocket of the node"""
@@ -469,7 +525,7 @@ class Node:
             f"<Node id={self.identifier} name={self.name} session_id={self.session_id} "
             f"region={self.region} ssl={self.ssl} "
             f"search_only={self.search_only} connected={self.websocket.connected if self._ws else False} "
-            f"votes={self.down_votes} "
+            f"votes={self.down_votes} draining={self.draining} "
             f"players={self.server_connected_players} playing={self.server_playing_players}>"
         )
 
@@ -1080,6 +1136,49 @@ class Node:
         """Returns the version endpoint of the target node."""
         return self.base_url / "version"
 
+    @contextlib.asynccontextmanager
+    async def _request(
+        self,
+        method: str,
+        url: URL,
+        *,
+        priority: RequestPriority,
+        session: aiohttp.ClientSession | None = None,
+        slot: RequestSlot | None = None,
+        timeout: aiohttp.ClientTimeout | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Sends a REST request to the node once the scheduler allows it, or in a slot the caller already holds.
+
+        Unless a timeout is given, the timeout of the endpoint is used.
+        """
+        endpoint = self._endpoint_name(url)
+        kwargs["timeout"] = timeout or self._manager.client.http_transport.timeout_for(endpoint)
+        async with contextlib.AsyncExitStack() as stack:
+            if slot is None:
+                slot = await stack.enter_async_context(self._scheduler.slot(priority, endpoint))
+            started_at = asyncio.get_running_loop().time()
+            try:
+                async with (session or self._session).request(method, url, **kwargs) as response:
+                    slot.record_response(response.status)
+                    self._health.record_request(
+                        endpoint, asyncio.get_running_loop().time() - started_at, not slot.throttled
+                    )
+                    yield response
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if slot.status is None:
+                    self._health.record_request(endpoint, asyncio.get_running_loop().time() - started_at, False)
+                raise
+
+    def _endpoint_name(self, url: URL) -> str:
+        """The name of the endpoint the URL points to, without the session and guild IDs"""
+        parts = [
+            part
+            for part in url.parts[1:]
+            if part and not part.isdigit() and part != self.session_id and part != f"v{self.api_version}"
+        ]
+        return "/".join(parts)
+
     # REST API - Direct calls
     async def fetch_session_players(self) -> list[rest_api.LavalinkPlayer] | HTTPException:
         """|coro|
@@ -1090,8 +1189,10 @@ class Node:
         list[rest_api.LavalinkPlayer]
             A list of all players associated with the target node.
         """
-        async with self._session.get(
+        async with self._request(
+            "GET",
             self.get_endpoint_session_players(),
+            priority=RequestPriority.Critical,
             headers={
                 "Authorization": self.password,
                 "Client-Name": f"PyLav/{self.node_manager.client.lib_version}",
@@ -1111,8 +1212,10 @@ class Node:
         """|coro|
         Gets the player associated with the target node and the given guild ID.
         """
-        async with self._session.get(
+        async with self._request(
+            "GET",
             self.get_endpoint_session_player_by_guild_id(guild_id=guild_id),
+            priority=RequestPriority.Critical,
             headers={
                 "Authorization": self.password,
                 "Client-Name": f"PyLav/{self.node_manager.client.lib_version}",
@@ -1134,8 +1237,10 @@ class Node:
         """|coro|
         Updates the player associated with the target node and the given guild ID.
         """
-        async with self._session.patch(
+        async with self._request(
+            "PATCH",
             self.get_endpoint_session_player_by_guild_id(guild_id=guild_id),
+            priority=RequestPriority.Critical,
             headers={
                 "Authorization": self.password,
                 "Client-Name": f"PyLav/{self.node_manager.client.lib_version}",
@@ -1156,8 +1261,10 @@ class Node:
         """|coro|
         Deletes the player associated with the target node and the given guild ID.
         """
-        async with self._session.delete(
+        async with self._request(
+            "DELETE",
             self.get_endpoint_session_player_by_guild_id(guild_id=guild_id),
+            priority=RequestPriority.Critical,
             headers={
                 "Authorization": self.password,
                 "Client-Name": f"PyLav/{self.node_manager.client.lib_version}",
@@ -1178,8 +1285,10 @@ class Node:
         """|coro|
         Gets the sponsorblock categories for the player associated with the target node and the given guild ID.
         """
-        async with self._session.get(
+        async with self._request(
+            "GET",
             self.get_endpoint_session_player_sponsorblock_categories(guild_id=guild_id),
+            priority=RequestPriority.Critical,
             headers={
                 "Authorization": self.password,
                 "Client-Name": f"PyLav/{self.node_manager.client.lib_version}",
@@ -1202,8 +1311,10 @@ class Node:
         """|coro|
         Sets the sponsorblock categories for the player associated with the target node and the given guild ID.
         """
-        async with self._session.put(
+        async with self._request(
+            "PUT",
             self.get_endpoint_session_player_sponsorblock_categories(guild_id=guild_id),
+            priority=RequestPriority.Critical,
             headers={
                 "Authorization": self.password,
                 "Client-Name": f"PyLav/{self.node_manager.client.lib_version}",
@@ -1225,8 +1336,10 @@ class Node:
         """|coro|
         Deletes the sponsorblock categories for the player associated with the target node and the given guild ID.
         """
-        async with self._session.delete(
+        async with self._request(
+            "DELETE",
             self.get_endpoint_session_player_sponsorblock_categories(guild_id=guild_id),
+            priority=RequestPriority.Critical,
             headers={
                 "Authorization": self.password,
                 "Client-Name": f"PyLav/{self.node_manager.client.lib_version}",
@@ -1247,8 +1360,10 @@ class Node:
         """|coro|
         Patches the session associated with the target node.
         """
-        async with self._session.patch(
+        async with self._request(
+            "PATCH",
             self.get_endpoint_session(),
+            priority=RequestPriority.Critical,
             headers={
                 "Authorization": self.password,
                 "Client-Name": f"PyLav/{self.node_manager.client.lib_version}",
@@ -1272,27 +1387,51 @@ class Node:
         if not self.available or not self.has_source(query.requires_capability):
             return dataclasses.replace(EMPTY_RESPONSE)
 
-        async with self._session.get(
-            self.get_endpoint_loadtracks(),
-            headers={
-                "Authorization": self.password,
-                "Client-Name": f"PyLav/{self.node_manager.client.lib_version}",
-                "App-Id": self.node_manager.client._user_id,
-            },
-            params={"identifier": query.query_identifier},
-        ) as res:
-            if res.status in GOOD_RESPONSE_RANGE:
-                result = await res.json(loads=json.loads)
-                self._logger.trace("Loaded track: %s response: %s", query, result)
-                response = self.parse_loadtrack_response(result)
-                asyncio.create_task(self.node_manager.client.query_cache_manager.add_query(query, response))
-                self._manager.client.dispatch_event(LavalinkLoadtracksEvent(node=self, response=response))
-                return response
-            failure = from_dict(data_class=LavalinkError, data=await res.json(loads=json.loads))
-            if res.status in [401, 403]:
-                raise UnauthorizedException(failure)
-            self._logger.trace("Failed to load track: %d %s", failure.status, failure.message)
-            return HTTPException(failure)
+        url = self.get_endpoint_loadtracks()
+        async with self._scheduler.slot(RequestPriority.Bulk, self._endpoint_name(url)) as slot:
+            # Only the time spent by the node counts against the source, not the time spent waiting for a slot
+            started_at = asyncio.get_running_loop().time()
+            try:
+                async with self._request(
+                    "GET",
+                    url,
+                    priority=RequestPriority.Bulk,
+                    slot=slot,
+                    headers={
+                        "Authorization": self.password,
+                        "Client-Name": f"PyLav/{self.node_manager.client.lib_version}",
+                        "App-Id": self.node_manager.client._user_id,
+                    },
+                    params={"identifier": query.query_identifier},
+                ) as res:
+                    response = await self._parse_loadtracks(query, res)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                self._health.record_source(
+                    query.requires_capability, asyncio.get_running_loop().time() - started_at, False
+                )
+                raise
+            self._health.record_source(
+                query.requires_capability,
+                asyncio.get_running_loop().time() - started_at,
+                not isinstance(response, HTTPException) and response.loadType != "error",
+            )
+        return response
+
+    async def _parse_loadtracks(
+        self, query: Query, res: aiohttp.ClientResponse
+    ) -> rest_api.LoadTrackResponses | HTTPException:
+        if res.status in GOOD_RESPONSE_RANGE:
+            result = await res.json(loads=json.loads)
+            self._logger.trace("Loaded track: %s response: %s", query, result)
+            response = self.parse_loadtrack_response(result)
+            asyncio.create_task(self.node_manager.client.query_cache_manager.add_query(query, response))
+            self._manager.client.dispatch_event(LavalinkLoadtracksEvent(node=self, response=response))
+            return response
+        failure = from_dict(data_class=LavalinkError, data=await res.json(loads=json.loads))
+        if res.status in [401, 403]:
+            raise UnauthorizedException(failure)
+        self._logger.trace("Failed to load track: %d %s", failure.status, failure.message)
+        return HTTPException(failure)
 
     async def fetch_loadsearch(
         self, query: Query
@@ -1300,8 +1439,10 @@ class Node:
         if not self.available or not self.has_source(query.requires_capability):
             return None
 
-        async with self._session.get(
+        async with self._request(
+            "GET",
             self.get_endpoint_loadseach(),
+            priority=RequestPriority.Bulk,
             headers={
                 "Authorization": self.password,
                 "Client-Name": f"PyLav/{self.node_manager.client.lib_version}",
@@ -1330,15 +1471,18 @@ class Node:
         """|coro|
         Fetches the decodetrack response from the target node.
         """
-        async with self._manager._client.cached_session.get(
+        async with self._request(
+            "GET",
             self.get_endpoint_decodetrack(),
+            priority=RequestPriority.Bulk,
+            session=self._manager._client.cached_session,
             headers={
                 "Authorization": self.password,
                 "Client-Name": f"PyLav/{self.node_manager.client.lib_version}",
                 "App-Id": self.node_manager.client._user_id,
             },
             params={"encodedTrack": encoded_track, "trace": "true" if self.trace else "false"},
-            timeout=timeout,
+            timeout=None if timeout is sentinel else timeout,
         ) as res:
             if res.status in GOOD_RESPONSE_RANGE:
                 return from_dict(data_class=Track, data=await res.json(loads=json.loads))
@@ -1356,8 +1500,11 @@ class Node:
         """|coro|
         Posts the decodetracks response from the target node.
         """
-        async with self._manager._client.cached_session.post(
+        async with self._request(
+            "POST",
             self.get_endpoint_decodetracks(),
+            priority=RequestPriority.Bulk,
+            session=self._manager._client.cached_session,
             headers={
                 "Authorization": self.password,
                 "Client-Name": f"PyLav/{self.node_manager.client.lib_version}",
@@ -1380,8 +1527,10 @@ class Node:
         """|coro|
         Fetches the info response from the target node.
         """
-        async with self._session.get(
+        async with self._request(
+            "GET",
             self.get_endpoint_info(),
+            priority=RequestPriority.Normal,
             headers={
                 "Authorization": self.password,
                 "Client-Name": f"PyLav/{self.node_manager.client.lib_version}",
@@ -1410,8 +1559,10 @@ class Node:
         """|coro|
         Fetches the stats response from the target node.
         """
-        async with self._session.get(
+        async with self._request(
+            "GET",
             self.get_endpoint_stats(),
+            priority=RequestPriority.Normal,
             headers={
                 "Authorization": self.password,
                 "Client-Name": f"PyLav/{self.node_manager.client.lib_version}",
@@ -1435,8 +1586,10 @@ class Node:
         """|coro|
         Fetches the version response from the target node.
         """
-        async with self._session.get(
+        async with self._request(
+            "GET",
             self.get_endpoint_version(),
+            priority=RequestPriority.Normal,
             headers={
                 "Authorization": self.password,
                 "Content-Type": "text/plain",
@@ -1463,8 +1616,10 @@ class Node:
         """|coro|
         Fetches the routeplanner status response from the target node.
         """
-        async with self._session.get(
+        async with self._request(
+            "GET",
             self.get_endpoint_routeplanner_status(),
+            priority=RequestPriority.Normal,
             headers={
                 "Authorization": self.password,
                 "Client-Name": f"PyLav/{self.node_manager.client.lib_version}",
@@ -1487,8 +1642,10 @@ class Node:
         """|coro|
         Frees the given address from the routeplanner.
         """
-        async with self._session.post(
+        async with self._request(
+            "POST",
             self.get_endpoint_routeplanner_free_address(),
+            priority=RequestPriority.Normal,
             headers={
                 "Authorization": self.password,
                 "Client-Name": f"PyLav/{self.node_manager.client.lib_version}",
@@ -1509,8 +1666,10 @@ class Node:
         """|coro|
         Frees all addresses from the routeplanner.
         """
-        async with self._session.post(
+        async with self._request(
+            "POST",
             self.get_endpoint_routeplanner_free_all(),
+            priority=RequestPriority.Normal,
             headers={
                 "Authorization": self.password,
                 "Client-Name": f"PyLav/{self.node_manager.client.lib_version}",
@@ -1546,8 +1705,10 @@ class Node:
         """|coro|
         Fetches the player for the given guild ID.
         """
-        async with self._session.get(
+        async with self._request(
+            "GET",
             self.get_endpoint_session_player_by_guild_id(guild_id=guild_id),
+            priority=RequestPriority.Critical,
             headers={
                 "Authorization": self.password,
                 "Client-Name": f"PyLav/{self.node_manager.client.lib_version}",
@@ -2009,3 +2170,5 @@ class Node:
         )
         player.add_voice_to_payload(payload)
         await self.patch_session_player(guild_id=player.guild.id, payload={"filters": payload})
+        # Sent around the player's update coalescer, which can't know what the node has anymore
+        player.updates.reset()
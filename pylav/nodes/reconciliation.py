@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import datetime
+import time
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from pylav.constants.node import RECONCILIATION_CONCURRENCY, RECONCILIATION_POSITION_TOLERANCE
+from pylav.exceptions.request import HTTPException
+from pylav.helpers.time import get_now_utc
+from pylav.logging import getLogger
+from pylav.type_hints.dict_typing import JSON_DICT_TYPE
+
+if TYPE_CHECKING:
+    from pylav.nodes.api.responses.rest_api import LavalinkPlayer
+    from pylav.nodes.node import Node
+    from pylav.players.player import Player
+
+LOGGER = getLogger("PyLav.NodeReconciliation")
+
+
+@dataclasses.dataclass(eq=False, slots=True, kw_only=True)
+class ReconciliationReport:
+    """The result of comparing a node's players with the local players."""
+
+    node: Node
+    checked: int = 0
+    fixed: dict[int, frozenset[str]] = dataclasses.field(default_factory=dict)
+    failed: int = 0
+    unknown: int = 0
+    started_at: float = dataclasses.field(default_factory=time.monotonic)
+    finished_at: float | None = None
+
+    @property
+    def duration(self) -> float:
+        """The number of seconds the reconciliation took, or has taken so far"""
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+
+def _filters_payload(player: Player) -> JSON_DICT_TYPE:
+    return player.node.get_filter_payload(
+        player=player,
+        equalizer=player.equalizer,
+        karaoke=player.karaoke,
+        timescale=player.timescale,
+        tremolo=player.tremolo,
+        vibrato=player.vibrato,
+        rotation=player.rotation,
+        distortion=player.distortion,
+        low_pass=player.low_pass,
+        channel_mix=player.channel_mix,
+        pluginFilters=dict(echo=player.echo),
+    )
+
+
+async def _local_position(player: Player) -> float:
+    position = await player.position()
+    return player.timescale.reverse_position(position) if player.timescale.changed else position
+
+
+def _active_filters(payload: JSON_DICT_TYPE) -> set[str]:
+    active = {key for key, value in payload.items() if key not in {"volume", "pluginFilters"} and value}
+    active.update(f"pluginFilters.{key}" for key, value in (payload.get("pluginFilters") or {}).items() if value)
+    return active
+
+
+def is_stalled(player: Player, remote: LavalinkPlayer) -> bool:
+    """Whether the node has lost the voice connection of a player which should be playing"""
+    return (
+        not remote.state.connected
+        and player.is_active
+        and player.connected_at < get_now_utc() - datetime.timedelta(minutes=5)
+    )
+
+
+async def diff_player(player: Player, remote: LavalinkPlayer | None) -> set[str]:
+    """Compare a local player with the node's view of it.
+
+    Parameters
+    ----------
+    player: :class:`Player`
+        The local player.
+    remote: :class:`LavalinkPlayer`
+        The player as returned by the node, `None` if the node doesn't know about the player.
+
+    Returns
+    -------
+    :class:`set`[:class:`str`]
+        The names of the fields which differ, any of ``track``, ``position``, ``paused``, ``volume``, ``filters``,
+        ``voice`` and ``connection``.
+    """
+    if remote is None:
+        return {"track", "paused", "volume", "filters", "voice"} if player.is_connected else set()
+    differences = set()
+    remote_encoded = remote.track.encoded if remote.track else None
+    local_encoded = player.current.encoded if player.current else None
+    if remote_encoded != local_encoded:
+        differences.add("track")
+    elif local_encoded is not None:
+        if abs(await _local_position(player) - (remote.state.position or 0)) > RECONCILIATION_POSITION_TOLERANCE:
+            differences.add("position")
+        if remote.paused != player.paused:
+            differences.add("paused")
+    if remote.volume != player.volume:
+        differences.add("volume")
+    local_filters = _filters_payload(player) if player.has_effects else {}
+    if _active_filters(local_filters) != _active_filters(remote.filters.to_dict()):
+        differences.add("filters")
+    if {"sessionId", "token", "endpoint"} == player._voice_state.keys() and (
+        remote.voice.sessionId != player._voice_state["sessionId"]
+        or remote.voice.token != player._voice_state["token"]
+        or remote.voice.endpoint != player._voice_state["endpoint"]
+    ):
+        differences.add("voice")
+    elif is_stalled(player, remote):
+        differences.add("connection")
+    return differences
+
+
+async def fix_player(player: Player, remote: LavalinkPlayer | None, differences: set[str]) -> None:
+    """Bring the node's view of a player back in line with the local player.
+
+    Position differences are resolved in favour of the node, as it is the one actually playing the track,
+    everything else is resolved in favour of the local player.
+    """
+    if "connection" in differences:
+        player._logger.debug("Reconnecting stalled player for %s", player.guild.id)
+        await player.reconnect()
+        return
+    if differences == {"position"}:
+        await player._update_state(remote.state)
+        return
+    payload: JSON_DICT_TYPE = {}
+    if "track" in differences:
+        if player.current:
+            payload |= {"encodedTrack": player.current.encoded, "position": int(await _local_position(player))}
+            differences.add("paused")
+        else:
+            payload["encodedTrack"] = None
+    elif "position" in differences:
+        await player._update_state(remote.state)
+    if "paused" in differences:
+        payload["paused"] = player.paused
+    if "volume" in differences:
+        payload["volume"] = player.volume
+    if "filters" in differences:
+        payload["filters"] = _filters_payload(player) if player.has_effects else {}
+    if "voice" in differences:
+        player.add_voice_to_payload(payload)
+    if payload:
+        # The node didn't have what was last acknowledged, so none of it can be trusted anymore
+        player.updates.reset()
+        await player.updates.send(payload)
+
+
+async def reconcile_players(
+    node: Node, guild_ids: Iterable[int] | None = None, *, concurrency: int = RECONCILIATION_CONCURRENCY
+) -> ReconciliationReport | None:
+    """Compare every player on the node with the local players and fix the ones which differ.
+
+    This fetches all of the node's players in a single request, then only sends requests for the
+    players which are out of sync, with at most ``concurrency`` requests in flight at once.
+
+    Parameters
+    ----------
+    node: :class:`Node`
+        The node to reconcile.
+    guild_ids: :class:`Iterable`[:class:`int`]
+        Only reconcile the players of these guilds, defaults to all players on the node.
+    concurrency: :class:`int`
+        The maximum number of players being fixed at once.
+
+    Returns
+    -------
+    Optional[:class:`ReconciliationReport`]
+        The report of the reconciliation, `None` if the node's players couldn't be fetched.
+    """
+    remote_players = await node.fetch_session_players()
+    if isinstance(remote_players, HTTPException):
+        LOGGER.debug("Unable to fetch the players of %s, skipping reconciliation", node.name)
+        return None
+    remote_by_guild = {int(remote.guildId): remote for remote in remote_players}
+    players = node.players
+    if guild_ids is not None:
+        guild_ids = set(guild_ids)
+        players = [p for p in players if p.guild.id in guild_ids]
+    report = ReconciliationReport(node=node, checked=len(players))
+    local_guilds = {p.guild.id for p in node.players}
+    report.unknown = sum(1 for guild_id in remote_by_guild if guild_id not in local_guilds)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _reconcile(player: Player) -> None:
+        remote = remote_by_guild.get(player.guild.id)
+        if not (differences := await diff_player(player, remote)):
+            if remote is not None:
+                await player._update_state(remote.state)
+            return
+        async with semaphore:
+            try:
+                await fix_player(player, remote, differences)
+            except Exception as exc:
+                report.failed += 1
+                LOGGER.warning("Failed to reconcile player %s on %s: %s", player.guild.id, node.name, exc)
+                LOGGER.debug("Failed to reconcile player %s on %s", player.guild.id, node.name, exc_info=exc)
+                return
+        report.fixed[player.guild.id] = frozenset(differences)
+
+    await asyncio.gather(*(_reconcile(player) for player in players))
+    report.finished_at = time.monotonic()
+    LOGGER.debug(
+        "Reconciled %s players on %s in %.2f seconds: %s fixed, %s failed, %s unknown to PyLav",
+        report.checked,
+        node.name,
+        report.duration,
+        len(report.fixed),
+        report.failed,
+        report.unknown,
+    )
+    return report
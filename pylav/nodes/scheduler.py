@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+import aiohttp
+
+from pylav.constants.node import (
+    REST_CONCURRENCY_INITIAL,
+    REST_CONCURRENCY_MAX,
+    REST_CONCURRENCY_MIN,
+    REST_CRITICAL_HEADROOM,
+    REST_DECREASE_FACTOR,
+    REST_LATENCY_TOLERANCE,
+)
+from pylav.enums.requests import RequestPriority
+from pylav.logging import getLogger
+
+LOGGER = getLogger("PyLav.RequestScheduler")
+
+# Endpoints whose latency is mostly spent by the node resolving tracks with an upstream source,
+# a slow source says nothing about how loaded the node itself is
+SOURCE_RESOLUTION_ENDPOINTS = frozenset({"loadtracks", "loadsearch"})
+
+
+class RequestSlot:
+    """A slot granted by a :class:`RequestScheduler`, used to report how the request went"""
+
+    __slots__ = ("priority", "endpoint", "started_at", "status", "latency")
+
+    def __init__(self, priority: RequestPriority, endpoint: str = "") -> None:
+        self.priority = priority
+        self.endpoint = endpoint
+        self.started_at = time.monotonic()
+        self.status: int | None = None
+        self.latency: float | None = None
+
+    def record_response(self, status: int) -> None:
+        """Record the status of the response, the latency is measured up to this point"""
+        self.status = status
+        self.latency = time.monotonic() - self.started_at
+
+    @property
+    def throttled(self) -> bool:
+        """Whether the node responded in a way that means it is overloaded"""
+        return self.status is not None and (self.status == 429 or self.status >= 500)
+
+
+class RequestScheduler:
+    """Limits the number of concurrent REST requests sent to a node.
+
+    The limit follows an additive increase, multiplicative decrease scheme: every request which completes
+    within the tolerated latency raises it slightly, while errors, throttling responses and latency spikes halve it.
+    Latency is compared with a baseline kept per endpoint, as a cached decode and a search differ by orders of
+    magnitude, and the latency of :data:`SOURCE_RESOLUTION_ENDPOINTS` never lowers the limit.
+    Requests over the limit wait in a queue ordered by :class:`RequestPriority`, and critical requests may go over
+    the limit by a small headroom so playback keeps working while bulk requests saturate the node.
+    """
+
+    __slots__ = (
+        "_name",
+        "_limit",
+        "_minimum",
+        "_maximum",
+        "_headroom",
+        "_active",
+        "_waiters",
+        "_sequence",
+        "_baselines",
+        "_latencies",
+        "_last_decrease",
+        "_requests",
+        "_errors",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        initial: int = REST_CONCURRENCY_INITIAL,
+        minimum: int = REST_CONCURRENCY_MIN,
+        maximum: int = REST_CONCURRENCY_MAX,
+        headroom: int = REST_CRITICAL_HEADROOM,
+    ) -> None:
+        self._name = name
+        self._limit = float(initial)
+        self._minimum = minimum
+        self._maximum = maximum
+        self._headroom = headroom
+        self._active = 0
+        self._waiters: list[tuple[RequestPriority, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._baselines: dict[str, float] = {}
+        self._latencies: dict[RequestPriority, float] = {}
+        self._last_decrease = 0.0
+        self._requests = 0
+        self._errors = 0
+
+    @property
+    def limit(self) -> int:
+        """The current number of concurrent requests allowed"""
+        return max(self._minimum, int(self._limit))
+
+    @property
+    def active(self) -> int:
+        """The number of requests currently in flight"""
+        return self._active
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of requests waiting for a slot"""
+        return sum(1 for __, __, future in self._waiters if not future.done())
+
+    def stats(self) -> dict[str, Any]:
+        """The current state of the scheduler"""
+        queued = {priority.name: 0 for priority in RequestPriority}
+        for priority, __, future in self._waiters:
+            if not future.done():
+                queued[priority.name] += 1
+        return {
+            "limit": self.limit,
+            "active": self._active,
+            "queued": queued,
+            "requests": self._requests,
+            "errors": self._errors,
+            "latency": {priority.name: latency for priority, latency in self._latencies.items()},
+        }
+
+    def _capacity(self, priority: RequestPriority) -> int:
+        return self.limit + (self._headroom if priority == RequestPriority.Critical else 0)
+
+    def _can_start(self, priority: RequestPriority) -> bool:
+        if self._active >= self._capacity(priority):
+            return False
+        # Never overtake a request of the same or a higher priority which is already waiting
+        while self._waiters and self._waiters[0][2].done():
+            heapq.heappop(self._waiters)
+        return not self._waiters or self._waiters[0][0] > priority
+
+    def _wake(self) -> None:
+        while self._waiters:
+            priority, __, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if self._active >= self._capacity(priority):
+                break
+            heapq.heappop(self._waiters)
+            self._active += 1
+            future.set_result(None)
+
+    def _release(self) -> None:
+        self._active -= 1
+        self._wake()
+
+    def _decrease(self, reason: str) -> None:
+        now = time.monotonic()
+        # Only back off once per round trip, all the requests in flight saw the same conditions
+        if now - self._last_decrease < min(max(self._latencies.values(), default=0.5), 5.0):
+            return
+        self._last_decrease = now
+        previous = self.limit
+        self._limit = max(float(self._minimum), self._limit * REST_DECREASE_FACTOR)
+        if self.limit != previous:
+            LOGGER.debug("Reduced %s concurrency from %s to %s: %s", self._name, previous, self.limit, reason)
+
+    def _record(self, slot: RequestSlot, failed: bool) -> None:
+        self._requests += 1
+        if failed or slot.throttled:
+            self._errors += 1
+            self._decrease(f"status {slot.status}" if slot.throttled else "request failed")
+            return
+        if slot.status is None:
+            # The request never got a response, e.g. it was cancelled, so there is nothing to learn from it
+            return
+        latency = slot.latency if slot.latency is not None else time.monotonic() - slot.started_at
+        previous = self._latencies.get(slot.priority)
+        self._latencies[slot.priority] = latency if previous is None else previous * 0.8 + latency * 0.2
+        # The baseline drops straight away but only creeps up, so it approximates the node's unloaded latency
+        baseline = self._baselines.get(slot.endpoint, latency)
+        baseline = self._baselines[slot.endpoint] = min(latency, baseline + (latency - baseline) * 0.01)
+        if (
+            slot.endpoint not in SOURCE_RESOLUTION_ENDPOINTS
+            and latency > baseline * REST_LATENCY_TOLERANCE
+            and latency > 0.05
+        ):
+            self._decrease(f"{slot.endpoint or 'request'} latency {latency:.3f}s")
+        else:
+            self._limit = min(float(self._maximum), self._limit + 1 / self._limit)
+
+    @contextlib.asynccontextmanager
+    async def slot(
+        self, priority: RequestPriority = RequestPriority.Normal, endpoint: str = ""
+    ) -> AsyncIterator[RequestSlot]:
+        """Wait for a request slot.
+
+        Parameters
+        ----------
+        priority: :class:`RequestPriority`
+            The priority of the request.
+        endpoint: :class:`str`
+            The endpoint the request is sent to, without IDs, its latency is compared with the baseline of the endpoint.
+        """
+        if self._can_start(priority):
+            self._active += 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+            try:
+                await future
+            except asyncio.CancelledError:
+                # The slot was granted just as the waiting task got cancelled
+                if not future.cancelled():
+                    self._release()
+                raise
+        slot = RequestSlot(priority, endpoint)
+        failed = False
+        try:
+            yield slot
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            failed = True
+            raise
+        finally:
+            self._record(slot, failed)
+            self._release()
@@ -6,12 +6,13 @@ from pylav.nodes.api.responses.rest_api import EmptyResponse
 from pylav.nodes.api.responses.websocket import Stats as StatsMessage
 
 if TYPE_CHECKING:
+    from pylav.extension.bundled_node.telemetry import ProcessTelemetry
     from pylav.nodes.node import Node
 
 
-async def sort_key_nodes(node: Node, region: str = None) -> float:
+async def sort_key_nodes(node: Node, region: str = None, feature: str = None) -> float:
     """The sort key for nodes."""
-    return await node.penalty_with_region(region)
+    return await node.penalty_with_region(region) + node.health.source_penalty(feature)
 
 
 class Penalty:
@@ -51,6 +52,12 @@ class Penalty:
             1.03 ** (500 * (self._stats.frames_deficit / 3000)) * 600 - 600 if self._stats.frames_deficit != -1 else 0
         )
 
+    # noinspection PyProtectedMember
+    @property
+    def health_penalty(self) -> float:
+        """The penalty of the latency and error rate PyLav observed for the node"""
+        return self._stats._node.health.score
+
     # noinspection PyProtectedMember
     @property
     def special_handling(self) -> float:
@@ -94,6 +101,7 @@ class Penalty:
             + self.null_frame_penalty
             + self.deficit_frame_penalty
             + self._stats._node.down_votes * 100
+            + self.health_penalty
             + self.special_handling
         )
 
@@ -105,6 +113,7 @@ class Penalty:
             f"null_frame={self.null_frame_penalty} "
             f"deficit_frame={self.deficit_frame_penalty} "
             f"votes={self._stats._node.down_votes * 100} "
+            f"health={self.health_penalty} "
             f"feature_weighting={self.special_handling} "
             f"total={self.total}>"
         )
@@ -212,6 +221,14 @@ class Stats:
         """The penalty for the node"""
         return self._penalty
 
+    @property
+    def process(self) -> ProcessTelemetry | None:
+        """The resource usage of the Lavalink process as seen from this machine, only available for managed nodes"""
+        if not self._node.managed:
+            return None
+        manager = self._node.node_manager.client.managed_node_pool.get_manager(self._node.identifier)
+        return manager.telemetry if manager is not None else None
+
     def __repr__(self) -> str:
         return (
             f"<Stats node_id={self._node.identifier} "
@@ -4,6 +4,7 @@ import asyncio
 import contextlib
 import datetime
 import typing
+from collections.abc import Iterable
 from typing import Any
 
 import aiohttp
@@ -12,6 +13,7 @@ from packaging.version import Version
 
 from pylav.compat import json
 from pylav.constants.builtin_nodes import PYLAV_NODES
+from pylav.constants.node import RECONCILIATION_DELAY
 from pylav.events.node import WebSocketClosedEvent
 from pylav.events.plugins import SegmentSkippedEvent, SegmentsLoadedEvent
 from pylav.events.track import TrackEndEvent, TrackExceptionEvent, TrackStartEvent, TrackStuckEvent
@@ -41,7 +43,6 @@ from pylav.events.track.track_start import (
     TrackStartYouTubeMusicEvent,
 )
 from pylav.exceptions.node import WebsocketNotConnectedException
-from pylav.exceptions.request import HTTPException
 from pylav.helpers.misc import ExponentialBackoffWithReset
 from pylav.helpers.time import get_now_utc
 from pylav.logging import getLogger
@@ -56,6 +57,7 @@ from pylav.nodes.api.responses.websocket import (
     TrackStart,
     TrackStuck,
 )
+from pylav.nodes.reconciliation import reconcile_players
 from pylav.nodes.utils import Stats as NodeStats
 from pylav.players.tracks.obj import Track
 from pylav.type_hints.dict_typing import JSON_DICT_TYPE
@@ -90,7 +92,8 @@ class WebSocket:
         "_resumed",
         "_api_version",
         "_connecting",
-        "_player_reconnect_tasks",
+        "_reconciliation_task",
+        "_pending_reconciliation",
         "_logger",
     )
 
@@ -109,7 +112,7 @@ class WebSocket:
         self._logger = getLogger(f"PyLav.WebSocket-{self.node.name}")
         self._client = self._node.node_manager.client
 
-        self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=120), json_serialize=json.dumps)
+        self._session = self._client.http_transport.session()
         self._ws = None
         self._host = host
         self._port = port
@@ -133,7 +136,8 @@ class WebSocket:
         self._connect_task.add_done_callback(self._done_callback)
         self._manual_shutdown = False
         self._connecting = False
-        self._player_reconnect_tasks: dict[int : asyncio.Task] = {}
+        self._reconciliation_task: asyncio.Task | None = None
+        self._pending_reconciliation: set[int] | None = set()
 
     def _done_callback(self, task: asyncio.Task) -> None:
         with contextlib.suppress(asyncio.CancelledError):
@@ -450,6 +454,7 @@ class WebSocket:
             The data given from Lavalink.
         """
 
+        self.node.health.record_websocket_message(data.state.time)
         if player := self.client.player_manager.get(int(data.guildId)):
             if (
                 (not data.state.connected)
@@ -457,37 +462,47 @@ class WebSocket:
                 and self.ready.is_set()
                 and player.connected_at < get_now_utc() - datetime.timedelta(minutes=5)
             ):
-                if player.guild.id in self._player_reconnect_tasks:
-                    self._player_reconnect_tasks[player.guild.id].cancel()
-                self._player_reconnect_tasks[player.guild.id] = asyncio.create_task(self.maybe_reconnect_player(player))
+                self.schedule_reconciliation([player.guild.id])
                 return
             await player._update_state(data.state)
         else:
             return
 
-    async def maybe_reconnect_player(self, player: Player) -> None:
+    def schedule_reconciliation(
+        self, guild_ids: Iterable[int] | None = None, delay: float = RECONCILIATION_DELAY
+    ) -> None:
         """
-        Attempts to reconnect the player if it is not connected.
+        Schedules a reconciliation of the node's players with the local players.
+
+        Requests made while a reconciliation is pending are batched together,
+        so the node's players are only fetched once.
 
         Parameters
         ----------
-        player: :class:`Player`
-            The player to reconnect.
+        guild_ids: :class:`Iterable`[:class:`int`]
+            The guilds to reconcile, defaults to all players on the node.
+        delay: :class:`float`
+            The number of seconds to wait for before reconciling.
         """
-        await asyncio.sleep(5)
-        session = await player.node.fetch_session_player(player.guild.id)
-        if isinstance(session, HTTPException):
-            return
-
-        if (
-            (not session.state.connected)
-            and player.is_active
-            and self.ready.is_set()
-            and player.connected_at < get_now_utc() - datetime.timedelta(minutes=5)
-        ):
-            self._logger.debug("Reconnecting stalled player for %s", player.guild.id)
-            await player.reconnect()
-            return
+        if guild_ids is None:
+            self._pending_reconciliation = None
+        elif self._pending_reconciliation is not None:
+            self._pending_reconciliation.update(guild_ids)
+        if self._reconciliation_task is None or self._reconciliation_task.done():
+            self._reconciliation_task = asyncio.create_task(self._run_reconciliation(delay))
+
+    async def _run_reconciliation(self, delay: float) -> None:
+        while True:
+            await asyncio.sleep(delay)
+            guild_ids, self._pending_reconciliation = self._pending_reconciliation, set()
+            if guild_ids is not None and not guild_ids:
+                return
+            if not self.ready.is_set() or self.client.is_shutting_down:
+                return
+            try:
+                await reconcile_players(self.node, guild_ids)
+            except Exception as exc:
+                self._logger.error("Failed to reconcile players", exc_info=exc)
 
     async def handle_ready(self, data: Ready) -> None:
         """
@@ -509,6 +524,9 @@ class WebSocket:
         )
         await self.node.config.update_session(self._session_id)
         await self.configure_resume_and_timeout()
+        # A resumed session kept playing so it can be checked straight away, a new session
+        # needs to wait for players to be moved back onto this node first
+        self.schedule_reconciliation(delay=0 if self._resumed else RECONCILIATION_DELAY)
 
     async def handle_event(
         self,
@@ -674,6 +692,8 @@ class WebSocket:
     async def close(self) -> None:
         """Closes the websocket connection."""
         self._connect_task.cancel()
+        if self._reconciliation_task is not None:
+            self._reconciliation_task.cancel()
         if self._ws and not self._ws.closed and not self._ws._closing:
             await self._ws.close(code=4014, message=b"Shutting down")
         await self._session.close()
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import hashlib
+import random
+from typing import TYPE_CHECKING
+
+from pylav.constants.node import AUTOPLAY_MAX_DRAWS
+from pylav.type_hints.dict_typing import JSON_DICT_TYPE
+
+if TYPE_CHECKING:
+    from pylav.storage.models.playlist import Playlist
+
+# The number of Feistel rounds, four are enough for the order to look random
+_ROUNDS = 4
+
+
+def _round_key(seed: int, round_: int, value: int) -> int:
+    digest = hashlib.blake2b(
+        value.to_bytes(8, "little"), digest_size=8, key=seed.to_bytes(8, "little"), salt=bytes([round_])
+    )
+    return int.from_bytes(digest.digest(), "little")
+
+
+def shuffled_position(index: int, size: int, seed: int) -> int:
+    """Get the entry at an index of a random permutation of `range(size)` without building the permutation.
+
+    The permutation is a Feistel network over the smallest even number of bits covering `size`,
+    values outside of the range are walked through the network again until they land in it.
+
+    Parameters
+    ----------
+    index: :class:`int`
+        The index in the permutation, from 0 to `size - 1`.
+    size: :class:`int`
+        The number of entries in the permutation.
+    seed: :class:`int`
+        The seed of the permutation, an unsigned 64-bit integer.
+
+    Returns
+    -------
+    :class:`int`
+        The entry at the index, every index of the same size and seed gives a different entry.
+    """
+    if size <= 1:
+        return 0
+    half_bits = max(1, ((size - 1).bit_length() + 1) // 2)
+    mask = (1 << half_bits) - 1
+    value = index
+    while True:
+        left, right = value >> half_bits, value & mask
+        for round_ in range(_ROUNDS):
+            left, right = right, left ^ (_round_key(seed, round_, right) & mask)
+        value = (left << half_bits) | right
+        if value < size:
+            return value
+
+
+class AutoPlayBag:
+    """Picks the tracks auto play plays from a playlist in a random order, none repeats until all of them were played.
+
+    The order is a seeded permutation of the positions in the playlist, so only the seed and how far into it the bag
+    is are kept, a track is picked with a single lookup no matter how large the playlist is,
+    and the bag survives a restart through :meth:`to_dict`.
+    A new bag is started once every track was played, or when the playlist or its size changes.
+    """
+
+    __slots__ = ("playlist_id", "size", "seed", "cursor")
+
+    def __init__(self, playlist_id: int | None = None, size: int = 0, seed: int = 0, cursor: int = 0) -> None:
+        self.playlist_id = playlist_id
+        self.size = size
+        self.seed = seed
+        self.cursor = cursor
+
+    @classmethod
+    def from_dict(cls, data: JSON_DICT_TYPE | None) -> AutoPlayBag:
+        """Build a bag from the output of :meth:`to_dict`"""
+        if not data:
+            return cls()
+        return cls(
+            playlist_id=data.get("playlist_id"),
+            size=data.get("size", 0),
+            seed=data.get("seed", 0),
+            cursor=data.get("cursor", 0),
+        )
+
+    def to_dict(self) -> JSON_DICT_TYPE:
+        """Returns a dict representation of this bag"""
+        return {"playlist_id": self.playlist_id, "size": self.size, "seed": self.seed, "cursor": self.cursor}
+
+    @property
+    def remaining(self) -> int:
+        """The number of tracks left in the bag"""
+        return max(self.size - self.cursor, 0)
+
+    def reset(self, playlist_id: int | None, size: int) -> None:
+        """Start a new bag with every track of the playlist in it"""
+        self.playlist_id = playlist_id
+        self.size = size
+        self.seed = random.getrandbits(64)
+        self.cursor = 0
+
+    def next_position(self, playlist_id: int, size: int) -> int:
+        """Take the position of the next track out of the bag of the given playlist"""
+        if playlist_id != self.playlist_id or size != self.size or self.cursor >= size:
+            self.reset(playlist_id, size)
+        position = shuffled_position(self.cursor, size, self.seed)
+        self.cursor += 1
+        return position
+
+    async def draw(self, playlist: Playlist, avoid: set[str] | None = None) -> JSON_DICT_TYPE | None:
+        """|coro|
+        Take the next track out of the bag of a playlist.
+
+        Parameters
+        ----------
+        playlist: :class:`Playlist`
+            The playlist to pick a track from.
+        avoid: :class:`set`
+            Encoded tracks to skip when possible, such as the ones played recently.
+            At most :data:`AUTOPLAY_MAX_DRAWS` tracks are skipped before one is played anyway.
+
+        Returns
+        -------
+        Optional[:class:`dict`]
+            The track, `None` if the playlist is empty.
+        """
+        if not (size := await playlist.size()):
+            return None
+        track = None
+        for __ in range(min(size, AUTOPLAY_MAX_DRAWS)):
+            candidate = await playlist.fetch_position(self.next_position(playlist.id, size))
+            if candidate is None:
+                continue
+            track = candidate
+            if not avoid or track["encoded"] not in avoid:
+                break
+        return track
@@ -3,8 +3,6 @@ from __future__ import annotations
 import collections
 from typing import Any, Final
 
-from deepdiff import DeepDiff  # type: ignore
-
 from pylav.players.filters.misc import FilterMixin
 
 _SUPPORTED_BANDS: Final = 15  # 1 Indexed
@@ -52,6 +50,8 @@ class Equalizer(FilterMixin):
     def __eq__(self, other: Any) -> bool:
         """Overrides the default implementation"""
         if isinstance(other, Equalizer):
+            from deepdiff import DeepDiff  # type: ignore
+
             return bool(
                 DeepDiff(
                     self._eq, other._eq, ignore_order=True, max_passes=1, cache_size=100, exclude_paths=["root['name']"]
@@ -3,8 +3,6 @@ from __future__ import annotations
 from abc import abstractmethod
 from typing import Any
 
-from deepdiff import DeepDiff  # type: ignore
-
 from pylav.logging import getLogger
 
 LOGGER = getLogger("PyLav.Filters")
@@ -20,6 +18,8 @@ class FilterMixin:
     def __eq__(self, other: Any) -> bool:
         """Overrides the default implementation"""
         if isinstance(other, self.__class__):
+            from deepdiff import DeepDiff  # type: ignore
+
             return bool(
                 DeepDiff(
                     self.to_dict(),
@@ -55,6 +55,8 @@ class FilterMixin:
 
         assert self._default is not None
 
+        from deepdiff import DeepDiff  # type: ignore
+
         changed = DeepDiff(
             self.to_dict(),
             self._default.to_dict(),
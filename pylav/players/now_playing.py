@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from typing import TYPE_CHECKING, Any
+
+import discord
+
+from pylav.constants.node import (
+    NOW_PLAYING_MAX_BACKOFF,
+    NOW_PLAYING_MAX_INTERVAL,
+    NOW_PLAYING_MIN_INTERVAL,
+    NOW_PLAYING_SLOW_EDIT,
+)
+from pylav.events.base import PyLavEvent
+from pylav.events.player import (
+    PlayerAutoDisconnectedAloneEvent,
+    PlayerAutoDisconnectedEmptyQueueEvent,
+    PlayerDisconnectedEvent,
+    PlayerUpdateEvent,
+)
+from pylav.logging import getLogger
+
+if TYPE_CHECKING:
+    from pylav.core.client import Client
+
+LOGGER = getLogger("PyLav.NowPlaying")
+
+# The number of sections of the progress bar drawn by Player.draw_time
+PROGRESS_BAR_SECTIONS = 12
+
+
+class NowPlayingPanel:
+    """A message kept up to date with what a player is playing"""
+
+    __slots__ = (
+        "guild_id",
+        "message",
+        "show_help",
+        "progress_interval",
+        "last_edit",
+        "due",
+        "rendered",
+        "track_id",
+        "_wake",
+        "_task",
+    )
+
+    def __init__(self, guild_id: int, message: discord.Message, show_help: bool = False) -> None:
+        self.guild_id = guild_id
+        self.message = message
+        self.show_help = show_help
+        self.progress_interval = NOW_PLAYING_MAX_INTERVAL
+        self.last_edit = 0.0
+        self.due: float | None = None
+        self.rendered: dict[str, Any] | None = None
+        self.track_id: str | None = None
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+
+class NowPlayingService:
+    """Keeps one live now playing message per guild up to date.
+
+    Changes are picked up from the events of the guild's player and coalesced into a single edit,
+    a change of state (a new track, pausing, seeking, the queue changing, ...) is shown within
+    :data:`NOW_PLAYING_MIN_INTERVAL` seconds, while progress alone is only shown once the progress bar moved,
+    at most every :data:`NOW_PLAYING_MAX_INTERVAL` seconds.
+    Edits which wouldn't change the message are skipped, and when Discord starts rate limiting the edits,
+    all messages are edited less often until the edits go through quickly again.
+
+    Parameters
+    ----------
+    client: :class:`Client`
+        The PyLav client.
+    """
+
+    __slots__ = ("_client", "_panels", "_backoff", "_paused_until", "edits", "skipped", "rate_limited")
+
+    def __init__(self, client: Client) -> None:
+        self._client = client
+        self._panels: dict[int, NowPlayingPanel] = {}
+        self._backoff = 1.0
+        self._paused_until = 0.0
+        self.edits = 0
+        self.skipped = 0
+        self.rate_limited = 0
+
+    @property
+    def client(self) -> Client:
+        """The PyLav client"""
+        return self._client
+
+    @property
+    def backoff(self) -> float:
+        """The factor every interval is currently multiplied by because of rate limits"""
+        return self._backoff
+
+    def get(self, guild_id: int) -> discord.Message | None:
+        """The live now playing message of a guild"""
+        return panel.message if (panel := self._panels.get(guild_id)) is not None else None
+
+    def register(self, message: discord.Message, show_help: bool = False) -> None:
+        """Keep the given message up to date with what the player of its guild is playing.
+
+        The message replaces the previous live message of the guild, which is left as it is.
+
+        Parameters
+        ----------
+        message: :class:`discord.Message`
+            The message to edit, it must have been sent by the bot in a guild.
+        show_help: :class:`bool`
+            Whether to show the help footer.
+        """
+        self.unregister(message.guild.id)
+        panel = self._panels[message.guild.id] = NowPlayingPanel(message.guild.id, message, show_help=show_help)
+        panel._task = asyncio.create_task(self._run(panel))
+        panel._task.set_name(f"PyLavNowPlaying.{message.guild.id}")
+        self._schedule(panel, urgent=True)
+
+    def unregister(self, guild_id: int) -> None:
+        """Stop updating the live now playing message of a guild"""
+        if (panel := self._panels.pop(guild_id, None)) is not None and panel._task is not None:
+            if panel._task is not asyncio.current_task():
+                panel._task.cancel()
+
+    def stats(self) -> dict[str, Any]:
+        """How many messages are live and how many edits were made or avoided"""
+        return {
+            "panels": len(self._panels),
+            "edits": self.edits,
+            "skipped": self.skipped,
+            "rate_limited": self.rate_limited,
+            "backoff": self._backoff,
+        }
+
+    async def on_event(self, event: PyLavEvent) -> None:
+        """Schedule an edit of the live message of the player the event is about"""
+        if not self._panels or (player := getattr(event, "player", None)) is None:
+            return
+        if (panel := self._panels.get(player.guild.id)) is None:
+            return
+        if isinstance(
+            event, (PlayerDisconnectedEvent, PlayerAutoDisconnectedEmptyQueueEvent, PlayerAutoDisconnectedAloneEvent)
+        ):
+            self.unregister(panel.guild_id)
+            return
+        self._schedule(panel, urgent=not isinstance(event, PlayerUpdateEvent))
+
+    def _schedule(self, panel: NowPlayingPanel, urgent: bool) -> None:
+        interval = NOW_PLAYING_MIN_INTERVAL if urgent else panel.progress_interval
+        due = panel.last_edit + interval * self._backoff
+        panel.due = due if panel.due is None else min(panel.due, due)
+        panel._wake.set()
+
+    async def _run(self, panel: NowPlayingPanel) -> None:
+        while self._panels.get(panel.guild_id) is panel:
+            await panel._wake.wait()
+            panel._wake.clear()
+            # An urgent change may move the edit forward while waiting
+            while panel.due is not None and (delay := max(panel.due, self._paused_until) - time.monotonic()) > 0:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(panel._wake.wait(), timeout=delay)
+                panel._wake.clear()
+            panel.due = None
+            # noinspection PyBroadException
+            try:
+                await self._edit(panel)
+            except Exception as exc:  # noqa
+                LOGGER.debug("Failed to update the now playing message of %s", panel.guild_id, exc_info=exc)
+
+    async def _edit(self, panel: NowPlayingPanel) -> None:
+        if (player := self._client.player_manager.get(panel.guild_id)) is None:
+            self.unregister(panel.guild_id)
+            return
+        kwargs = await player.get_currently_playing_message(
+            messageable=panel.message.channel, show_help=panel.show_help
+        )
+        current = player.current
+        if current is None or player.paused or await current.stream():
+            panel.progress_interval = NOW_PLAYING_MAX_INTERVAL
+        else:
+            section = await current.duration() / 1000 / PROGRESS_BAR_SECTIONS
+            panel.progress_interval = min(max(section, NOW_PLAYING_MIN_INTERVAL), NOW_PLAYING_MAX_INTERVAL)
+        rendered = kwargs["embed"].to_dict()
+        # The footer timestamp changes on every render without the content changing
+        rendered.pop("timestamp", None)
+        track_id = current.id if current else None
+        if rendered == panel.rendered and track_id == panel.track_id:
+            self.skipped += 1
+            return
+        edit_kwargs: dict[str, Any] = {"embed": kwargs["embed"]}
+        if track_id != panel.track_id:
+            # The artwork attachment only changes with the track
+            edit_kwargs["attachments"] = [kwargs["file"]] if "file" in kwargs else []
+        started_at = time.monotonic()
+        try:
+            await panel.message.edit(**edit_kwargs)
+        except (discord.NotFound, discord.Forbidden):
+            self.unregister(panel.guild_id)
+            return
+        except discord.HTTPException as exc:
+            if exc.status != 429:
+                raise
+            self.rate_limited += 1
+            self._slow_down()
+            self._schedule(panel, urgent=True)
+            return
+        finally:
+            panel.last_edit = time.monotonic()
+        self.edits += 1
+        panel.rendered, panel.track_id = rendered, track_id
+        if panel.last_edit - started_at > NOW_PLAYING_SLOW_EDIT:
+            # discord.py waited for the rate limit bucket to refill
+            self.rate_limited += 1
+            self._slow_down()
+        else:
+            self._backoff = max(1.0, self._backoff * 0.9)
+
+    def _slow_down(self) -> None:
+        self._backoff = min(self._backoff * 2, NOW_PLAYING_MAX_BACKOFF)
+        self._paused_until = time.monotonic() + NOW_PLAYING_MIN_INTERVAL * self._backoff
+        LOGGER.debug("Now playing messages are being rate limited, slowing down by %sx", self._backoff)
+
+    async def close(self) -> None:
+        """Stop updating every message"""
+        for guild_id in list(self._panels):
+            self.unregister(guild_id)
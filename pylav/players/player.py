@@ -5,10 +5,8 @@ import collections
 import contextlib
 import datetime
 import pathlib
-import random
 import time
 from collections.abc import Coroutine
-from itertools import islice
 from typing import TYPE_CHECKING, Any, Literal
 
 import asyncpg
@@ -22,6 +20,7 @@ from pylav.constants.config import DEFAULT_SEARCH_SOURCE, ENABLE_NODE_RESUMING
 from pylav.constants.coordinates import REGION_TO_COUNTRY_COORDINATE_MAPPING
 from pylav.constants.regex import VOICE_CHANNEL_ENDPOINT
 from pylav.enums.plugins.sponsorblock import SegmentCategory
+from pylav.enums.queue import ShuffleMode
 from pylav.events.node import NodeChangedEvent
 from pylav.events.player import (
     FiltersAppliedEvent,
@@ -65,7 +64,6 @@ from pylav.exceptions.node import (
 )
 from pylav.exceptions.request import HTTPException
 from pylav.exceptions.track import TrackNotFoundException
-from pylav.extension.radio import RadioBrowser
 from pylav.helpers.format.strings import format_time_dd_hh_mm_ss, format_time_string, shorten_string
 from pylav.helpers.time import get_now_utc
 from pylav.logging import getLogger
@@ -75,6 +73,7 @@ from pylav.nodes.api.responses.rest_api import LavalinkPlayer
 from pylav.nodes.api.responses.track import Track as APITrack
 from pylav.nodes.api.responses.websocket import TrackException
 from pylav.nodes.node import Node
+from pylav.players.autoplay import AutoPlayBag
 from pylav.players.filters import (
     ChannelMix,
     Distortion,
@@ -91,7 +90,8 @@ from pylav.players.filters import (
 from pylav.players.filters.misc import FilterMixin
 from pylav.players.query.obj import Query
 from pylav.players.tracks.obj import Track
-from pylav.players.utils import PlayerQueue, TrackHistoryQueue
+from pylav.players.updates import PlayerUpdateCoalescer
+from pylav.players.utils import HistoryEntry, PlayerQueue, TrackHistoryQueue
 from pylav.storage.models.player.config import PlayerConfig
 from pylav.storage.models.player.state import PlayerState
 from pylav.storage.models.playlist import Playlist
@@ -111,6 +111,7 @@ except ImportError:
 
 if TYPE_CHECKING:
     from pylav.core.client import Client
+    from pylav.extension.radio import RadioBrowser
     from pylav.players.manager import PlayerController
 
 
@@ -169,6 +170,8 @@ class Player(VoiceProtocol):
         "_last_track_stuck_check",
         "_last_track_stuck_position",
         "_paused_position",
+        "_updates",
+        "_autoplay_bag",
     )
     _config: PlayerConfig
     _global_config: PlayerConfig
@@ -215,7 +218,7 @@ class Player(VoiceProtocol):
         self.position_timestamp = 0
         self._ping = 0
         self.queue: PlayerQueue[Track] = PlayerQueue()
-        self.history: TrackHistoryQueue[Track] = TrackHistoryQueue(maxsize=100)
+        self.history: TrackHistoryQueue = TrackHistoryQueue(maxsize=100)
         self.current: Track | None = None
         self._post_init_completed = False
         self._autoplay_playlist: Playlist | None = None
@@ -245,6 +248,8 @@ class Player(VoiceProtocol):
         self._last_track_stuck_check = 0
         self._last_track_stuck_position = -1
         self._waiting_for_node = asyncio.Event()
+        self._updates = PlayerUpdateCoalescer(self)
+        self._autoplay_bag = AutoPlayBag()
 
     def __hash__(self):
         return hash((self.channel.guild.id, self.channel_id))
@@ -449,7 +454,7 @@ class Player(VoiceProtocol):
         if self.volume_filter:
             payload["volume"] = self.volume
         if payload:
-            await self.node.patch_session_player(guild_id=self.guild.id, payload=payload)
+            await self._updates.send(payload)
 
     async def update_current_duration(self) -> Track | None:
         if not self.current:
@@ -646,6 +651,11 @@ class Player(VoiceProtocol):
     def guild(self) -> discord.Guild:
         return self.channel.guild
 
+    @property
+    def updates(self) -> PlayerUpdateCoalescer:
+        """The coalescer of the player's REST updates, including how many requests it avoided"""
+        return self._updates
+
     @property
     def is_playing(self) -> bool:
         """Returns the player's track state"""
@@ -1057,7 +1067,7 @@ class Player(VoiceProtocol):
                 or existing_session.voice.token != self._voice_state["token"]
                 or existing_session.voice.endpoint != self._voice_state["endpoint"]
             ):
-                await self.node.patch_session_player(self.guild.id, payload={"voice": self._voice_state})
+                await self._updates.send({"voice": self._voice_state})
             self._waiting_for_node.set()
             self._hashed_voice_state = hash(tuple(self._voice_state.items()))
 
@@ -1072,7 +1082,7 @@ class Player(VoiceProtocol):
                 node=self.node, data=track, query=query, requester=requester, player_instance=self
             )
         else:
-            track._requester = requester
+            track._requester_id = requester
             track._player = self
         return track
 
@@ -1107,8 +1117,8 @@ class Player(VoiceProtocol):
             at = await self._query_to_track(requester, track, query)
             await self.queue.put([at], index=index)
             if index is None:
-                await self.maybe_shuffle_queue(requester=requester)
-            self.next_track = None if self.queue.empty() else self.queue.raw_queue.popleft()
+                await self.maybe_shuffle_queue(requester=requester, count=1)
+            self.next_track = self.queue.peek()
             self.node.dispatch_event(QueueTracksAddedEvent(self, self.guild.get_member(requester), [at]))
 
     async def bulk_add(
@@ -1137,8 +1147,8 @@ class Player(VoiceProtocol):
                 output.append(track)
             await self.queue.put(output, index=index)
             if index is None:
-                await self.maybe_shuffle_queue(requester=requester)
-            self.next_track = None if self.queue.empty() else self.queue.raw_queue.popleft()
+                await self.maybe_shuffle_queue(requester=requester, count=len(output))
+            self.next_track = self.queue.peek()
             self.node.dispatch_event(QueueTracksAddedEvent(self, self.guild.get_member(requester), output))
 
     async def previous(self, requester: discord.Member, bypass_cache: bool = False) -> None:
@@ -1146,7 +1156,7 @@ class Player(VoiceProtocol):
             if self.history.empty():
                 raise TrackNotFoundException(_("There are no tracks currently in the player history."))
             self.stopped = False
-            track = await self.history.get()
+            track = await (await self.history.get()).to_track(self)
             if self.current:
                 self.last_track = self.current
 
@@ -1158,7 +1168,7 @@ class Player(VoiceProtocol):
             payload = {"encodedTrack": track.encoded}
             if self.volume_filter:
                 payload["volume"] = self.volume
-            await self.node.patch_session_player(guild_id=self.guild.id, payload=payload, no_replace=False)
+            await self._updates.send(payload, no_replace=False)
 
             self.node.dispatch_event(TrackPreviousRequestedEvent(self, requester, track))
 
@@ -1188,11 +1198,11 @@ class Player(VoiceProtocol):
                 await self.change_to_best_node(feature=await track.requires_capability(), skip_position_fetch=True)
             self.current = track
             if self.next_track is None and not self.queue.empty():
-                self.next_track = self.queue.raw_queue.popleft()
+                self.next_track = self.queue.peek()
             payload = {"encodedTrack": track.encoded}
             if self.volume_filter:
                 payload["volume"] = self.volume
-            await self.node.patch_session_player(guild_id=self.guild.id, payload=payload, no_replace=no_replace)
+            await self._updates.send(payload, no_replace=no_replace)
             self.node.dispatch_event(QuickPlayEvent(self, requester, track))
 
     def next(self, requester: discord.Member = None, node: Node = None) -> Coroutine[Any, Any, None]:
@@ -1277,12 +1287,12 @@ class Player(VoiceProtocol):
             if not track.encoded:
                 return await self.play(None, None, requester or self.bot.user, node=node)
             self.current = track
-            self.next_track = None if self.queue.empty() else self.queue.raw_queue.popleft()
+            self.next_track = self.queue.peek()
             payload["encodedTrack"] = track.encoded
             if self.volume_filter:
                 payload["volume"] = self.volume
 
-            await self.node.patch_session_player(guild_id=self.guild.id, payload=payload, no_replace=no_replace)
+            await self._updates.send(payload, no_replace=no_replace)
             if auto_play:
                 self.node.dispatch_event(TrackAutoPlayEvent(player=self, track=track))
 
@@ -1340,10 +1350,12 @@ class Player(VoiceProtocol):
 
     async def _process_play_no_track(self, auto_play, track):
         if self.queue.empty():
-            if await self.autoplay_enabled() and (
-                available_tracks := await (await self.get_auto_playlist()).fetch_tracks()
+            if (
+                await self.autoplay_enabled()
+                and (playlist := await self.get_auto_playlist())
+                and (available_track := await self._autoplay_bag.draw(playlist, avoid=set(self.history.raw_b64s)))
             ):
-                auto_play, track = await self._process_autoplay_on_play(available_tracks)
+                auto_play, track = await self._process_autoplay_on_play(available_track)
             else:
                 await self.stop(
                     requester=self.guild.get_member(self.node.node_manager.client.bot.user.id)
@@ -1372,24 +1384,14 @@ class Player(VoiceProtocol):
         self.node.dispatch_event(event)
         await self._handle_event(event)
 
-    async def _process_autoplay_on_play(self, available_tracks):
-        available_tracks = {track["encoded"]: track for track in available_tracks}
-        if tracks_not_in_history := list(set(available_tracks) - set(self.history.raw_b64s)):
-            track = await Track.build_track(
-                node=self.node,
-                data=available_tracks[random.choice(list(tracks_not_in_history))],
-                query=None,
-                requester=self.client.user.id,
-                player_instance=self,
-            )
-        else:
-            track = await Track.build_track(
-                node=self.node,
-                data=available_tracks[random.choice(list(available_tracks))],
-                query=None,
-                requester=self.client.user.id,
-                player_instance=self,
-            )
+    async def _process_autoplay_on_play(self, available_track):
+        track = await Track.build_track(
+            node=self.node,
+            data=available_track,
+            query=None,
+            requester=self.client.user.id,
+            player_instance=self,
+        )
         auto_play = True
         self.next_track = None
         return auto_play, track
@@ -1410,7 +1412,7 @@ class Player(VoiceProtocol):
         }
         if self.volume_filter:
             payload["volume"] = self.volume
-        await self.node.patch_session_player(guild_id=self.guild.id, payload=payload, no_replace=False)
+        await self._updates.send(payload, no_replace=False)
         self.node.dispatch_event(PlayerResumedEvent(player=self, requester=requester or self.client.user.id))
 
     async def skip(self, requester: discord.Member) -> None:
@@ -1419,7 +1421,7 @@ class Player(VoiceProtocol):
         previous_position = await self.fetch_position()
         # Send a Stop OP to clear the buffer for avoid a small continuation on playback after skip fires
         payload = {"encodedTrack": None}
-        await self.node.patch_session_player(guild_id=self.guild.id, payload=payload)
+        await self._updates.send(payload)
         await self.next(requester=requester)
         if previous_track:
             self.node.dispatch_event(TrackSkippedEvent(self, requester, previous_track, previous_position))
@@ -1495,7 +1497,7 @@ class Player(VoiceProtocol):
             The member who requested the pause.
         """
         payload = {"paused": pause}
-        await self.node.patch_session_player(guild_id=self.guild.id, payload=payload)
+        await self._updates.update(payload)
         self.paused = pause
         self._was_alone_paused = False
         if self.paused:
@@ -1523,7 +1525,7 @@ class Player(VoiceProtocol):
         await self.config.update_volume(volume)
         self._volume = Volume(volume)
         payload = {"volume": volume}
-        await self.node.patch_session_player(guild_id=self.guild.id, payload=payload)
+        await self._updates.update(payload)
         self.node.dispatch_event(PlayerVolumeChangedEvent(self, requester, self.volume, volume))
 
     async def seek(self, position: float, requester: discord.Member, with_filter: bool = False) -> None:
@@ -1548,7 +1550,7 @@ class Player(VoiceProtocol):
                 TrackSeekEvent(self, requester, self.current, before=await self.fetch_position(), after=position)
             )
             payload = {"position": int(position)}
-            await self.node.patch_session_player(guild_id=self.guild.id, payload=payload)
+            await self._updates.update(payload)
             self._last_update = time.time() * 1000
             self._last_position = position
 
@@ -1565,11 +1567,11 @@ class Player(VoiceProtocol):
         if isinstance(event, TrackStuckEvent) or isinstance(event, TrackEndEvent) and event.reason == "finished":
             self.last_track = self.current
             await self.next()
-            self.next_track = None if self.queue.empty() else self.queue.raw_queue.popleft()
+            self.next_track = self.queue.peek()
         elif isinstance(event, TrackExceptionEvent):
             self.last_track = self.current
             await self.next()
-            self.next_track = None if self.queue.empty() else self.queue.raw_queue.popleft()
+            self.next_track = self.queue.peek()
 
     async def _update_state(self, state: State) -> None:
         """
@@ -1648,7 +1650,7 @@ class Player(VoiceProtocol):
         if old_node.identifier != node.identifier:
             node.dispatch_event(NodeChangedEvent(self, old_node, node))
             if payload:
-                await node.patch_session_player(guild_id=self.guild.id, payload=payload)
+                await self._updates.send(payload)
 
     async def connect(
         self,
@@ -1735,6 +1737,7 @@ class Player(VoiceProtocol):
                 await self.player_manager.remove(self.channel.guild.id)
             if not maybe_resuming:
                 await self.node.delete_session_player(self.guild.id)
+                self._updates.reset()
             with contextlib.suppress(JobLookupError):
                 self.player_manager.client.scheduler.remove_job(
                     job_id=f"{self.bot.user.id}-{self.guild.id}-auto_dc_task"
@@ -1756,7 +1759,7 @@ class Player(VoiceProtocol):
     async def stop(self, requester: discord.Member) -> None:
         """Stops the player"""
         payload = {"encodedTrack": None}
-        await self.node.patch_session_player(guild_id=self.guild.id, payload=payload)
+        await self._updates.send(payload)
         self.node.dispatch_event(PlayerStoppedEvent(self, requester))
         self.current = None
         self.queue.clear()
@@ -2277,7 +2280,7 @@ class Player(VoiceProtocol):
             ),
             "position": int(position),
         }
-        await self.node.patch_session_player(self.guild.id, payload=payload)
+        await self._updates.update(payload)
         kwargs.pop("reset_not_set", None)
         kwargs.pop("requester", None)
         self.node.dispatch_event(FiltersAppliedEvent(player=self, requester=requester, node=self.node, **kwargs))
@@ -2597,7 +2600,9 @@ class Player(VoiceProtocol):
         queue_list = ""
         start_index = page_index * per_page
         end_index = start_index + per_page
-        tracks = list(islice(queue.raw_queue, start_index, end_index))
+        tracks = queue.get_range(start_index, end_index)
+        if history:
+            tracks = [await entry.to_track(self) for entry in tracks]
         arrow = await self.draw_time()
         position = await self.fetch_position()
         pos = format_time_dd_hh_mm_ss(position)
@@ -2732,13 +2737,13 @@ class Player(VoiceProtocol):
         return queue_list
 
     async def queue_duration(self, history: bool = False) -> int:
-        queue = self.history if history else self.queue
+        if history:
+            return sum(entry.duration for entry in self.history.raw_queue if not entry.stream)
+        queue = self.queue
         dur = [await track.duration() for track in queue.raw_queue if not await track.stream()]
         queue_dur = sum(dur)
         if queue.empty():
             queue_dur = 0
-        if history:
-            return queue_dur
         try:
             remain = 0 if await self.current.stream() else (await self.current.duration() - await self.fetch_position())
         except AttributeError:
@@ -2754,7 +2759,7 @@ class Player(VoiceProtocol):
         if self.queue.empty():
             return 0
         tracks, count = await self.queue.remove(track, duplicates=duplicates)
-        self.next_track = None if self.queue.empty() else self.queue.raw_queue.popleft()
+        self.next_track = self.queue.peek()
         self.node.dispatch_event(QueueTracksRemovedEvent(player=self, requester=requester, tracks=tracks))
         return count
 
@@ -2768,7 +2773,7 @@ class Player(VoiceProtocol):
             return None
         track = await self.queue.get(queue_number)
         await self.queue.put([track], new_index)
-        self.next_track = None if self.queue.empty() else self.queue.raw_queue.popleft()
+        self.next_track = self.queue.peek()
         self.node.dispatch_event(
             QueueTrackPositionChangedEvent(
                 before=queue_number, after=new_index, track=track, player=self, requester=requester
@@ -2776,15 +2781,38 @@ class Player(VoiceProtocol):
         )
         return track
 
-    async def maybe_shuffle_queue(self, requester: int) -> None:
+    async def maybe_shuffle_queue(self, requester: int, count: int | None = None) -> None:
+        """Shuffle the tracks which were just added if auto shuffle is enabled.
+
+        Parameters
+        ----------
+        requester: :class:`int`
+            The ID of the user who added the tracks.
+        count: :class:`int`
+            The number of tracks added at the end of the queue, the whole queue is shuffled if not given.
+        """
         if (await self.player_manager.client.player_config_manager.get_auto_shuffle(self.guild.id)) is False:
             return
-        await self.shuffle_queue(requester)
+        mode = ShuffleMode.Random if count is None else ShuffleMode.NewTracks
+        await self.shuffle_queue(requester, mode=mode, count=count)
 
-    async def shuffle_queue(self, requester: int) -> None:
-        self.node.dispatch_event(QueueShuffledEvent(player=self, requester=self.guild.get_member(requester)))
-        await self.queue.shuffle()
-        self.next_track = None if self.queue.empty() else self.queue.raw_queue.popleft()
+    async def shuffle_queue(
+        self, requester: int, mode: ShuffleMode = ShuffleMode.Random, count: int | None = None
+    ) -> None:
+        """Shuffle the queue.
+
+        Parameters
+        ----------
+        requester: :class:`int`
+            The ID of the user who requested the shuffle.
+        mode: :class:`ShuffleMode`
+            How to shuffle the queue.
+        count: :class:`int`
+            The number of tracks at the end of the queue to move with :attr:`ShuffleMode.NewTracks`.
+        """
+        self.node.dispatch_event(QueueShuffledEvent(player=self, requester=self.guild.get_member(requester), mode=mode))
+        await self.queue.shuffle(mode=mode, count=count)
+        self.next_track = self.queue.peek()
 
     async def set_autoplay_playlist(self, playlist: int | Playlist) -> None:
         if isinstance(playlist, int):
@@ -2829,7 +2857,7 @@ class Player(VoiceProtocol):
             "position": position,
             "playing": self.is_active,
             "queue": [] if self.queue.empty() else [await t.to_dict() for t in self.queue.raw_queue],
-            "history": [] if self.history.empty() else [await t.to_dict() for t in self.history.raw_queue],
+            "history": [entry.to_dict() for entry in self.history.raw_queue],
             "effect_enabled": self._effect_enabled,
             "effects": {
                 "volume": self._volume.to_dict(),
@@ -2849,6 +2877,7 @@ class Player(VoiceProtocol):
                 "last_track": await self.last_track.to_dict() if self.last_track else None,
                 "next_track": await self.next_track.to_dict() if self.next_track else None,
                 "was_alone_paused": self._was_alone_paused,
+                "autoplay_bag": self._autoplay_bag.to_dict(),
             },
         }
 
@@ -2861,6 +2890,7 @@ class Player(VoiceProtocol):
         if self._restored is True:
             return
         self._was_alone_paused = player.extras.get("was_alone_paused", False)
+        self._autoplay_bag = AutoPlayBag.from_dict(player.extras.get("autoplay_bag"))
         current, last_track, next_track, restoring_session = await self._process_restore_current_tracks(player)
         self.last_track = last_track
         self.next_track = next_track
@@ -2872,7 +2902,6 @@ class Player(VoiceProtocol):
         self.queue.raw_queue = collections.deque(queue)
         self.queue.raw_b64s = [t.encoded for t in queue if t.encoded]
         self.history.raw_queue = collections.deque(history)
-        self.history.raw_b64s = [t.encoded for t in history]
         self._effect_enabled = player.effect_enabled
         await self._process_restore_filters(player)
         self.current = current
@@ -2903,6 +2932,8 @@ class Player(VoiceProtocol):
                 await self.set_autoplay_playlist(1)
 
     async def _process_restore_rest_call(self, restoring_session: bool) -> None:
+        # The player is being recreated on the node, so everything has to be sent again
+        self._updates.reset()
         payload = {}
         if self.paused:
             payload["paused"] = self.paused
@@ -2929,11 +2960,12 @@ class Player(VoiceProtocol):
         if self.volume_filter:
             payload["volume"] = self.volume
         if payload:
-            await self.node.patch_session_player(guild_id=self.guild.id, payload=payload)
+            await self._updates.send(payload)
 
     async def _process_restore_queues(self, player):
         queue = await self._generate_queue(player.queue)
-        history = await self._generate_queue(player.history)
+        # History entries are only decoded once they are shown or replayed
+        history = [HistoryEntry.from_dict(entry) for entry in (player.history or [])[: self.history.maxsize]]
         return history, queue
 
     async def _generate_queue(self, raw_queue):
@@ -49,7 +49,6 @@ from pylav.constants.regex import (
     SOURCE_INPUT_MATCH_YANDEX,
     SOURCE_INPUT_MATCH_YOUTUBE,
 )
-from pylav.extension.m3u import load as m3u_loads
 from pylav.players.query.local_files import LocalFile
 from pylav.utils.validators import is_url
 
@@ -647,34 +646,23 @@ class Query:
         if not self.is_m3u or not self.is_album:
             return
         try:
-            m3u8 = await m3u_loads(None, uri=f"{self._query}")
             if self._special_local:
                 assert isinstance(self._query, LocalFile)
                 file = self._query.path
             else:
                 file = aiopath.AsyncPath(self._query)
-            for track in iter(m3u8.files):
-                if is_url(track):
-                    yield await Query.from_string(track, dont_search=True)
+            # Entries are resolved as they are parsed, without waiting for the whole playlist to download
+            async for entry in self.client.m3u_parser.iter_load(f"{self._query}"):
+                if is_url(entry.uri):
+                    yield await Query.from_string(entry.uri, dont_search=True)
                 else:
-                    file_path: aiopath.AsyncPath = aiopath.AsyncPath(track)
+                    file_path: aiopath.AsyncPath = aiopath.AsyncPath(entry.uri)
                     if await file_path.exists():
                         yield await Query.from_string(file_path, dont_search=True)
                     else:
                         file_path_alt = file.parent / file_path.relative_to(file_path.anchor)
                         if await file_path_alt.exists():
                             yield await Query.from_string(file_path_alt, dont_search=True)
-            for playlist in iter(m3u8.playlists):
-                if is_url(playlist.uri):
-                    yield await Query.from_string(playlist.uri, dont_search=True)
-                else:
-                    playlist_path: aiopath.AsyncPath = aiopath.AsyncPath(playlist.uri)
-                    if await playlist_path.exists():
-                        yield await Query.from_string(playlist_path, dont_search=True)
-                    else:
-                        playlist_path_alt = file.parent / playlist_path.relative_to(playlist_path.anchor)
-                        if await playlist_path_alt.exists():
-                            yield await Query.from_string(playlist_path_alt, dont_search=True)
         except Exception:
             return
 
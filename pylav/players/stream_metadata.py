@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import struct
+import time
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+from pylav.constants.node import (
+    STREAM_METADATA_CHECK_INTERVAL,
+    STREAM_METADATA_FIRST_TITLE_TIMEOUT,
+    STREAM_METADATA_IDLE_TIMEOUT,
+    STREAM_METADATA_MAX_CONNECTIONS,
+    STREAM_METADATA_MAX_CONNECTIONS_PER_HOST,
+    STREAM_METADATA_RETRY_AFTER,
+)
+from pylav.constants.regex import STREAM_TITLE
+from pylav.events.track import TrackStreamTitleChangedEvent
+from pylav.helpers.misc import ExponentialBackoffWithReset
+from pylav.logging import getLogger
+
+if TYPE_CHECKING:
+    from pylav.core.client import Client
+    from pylav.players.player import Player
+
+LOGGER = getLogger("PyLav.StreamMetadata")
+
+
+async def read_stream_titles(content: aiohttp.StreamReader, metaint: int) -> AsyncIterator[str | None]:
+    """Read the ICY metadata interleaved with the audio of a stream.
+
+    Parameters
+    ----------
+    content: :class:`aiohttp.StreamReader`
+        The body of a response to a request made with the `Icy-MetaData: 1` header.
+    metaint: :class:`int`
+        The number of audio bytes between two metadata blocks, from the `icy-metaint` header.
+
+    Yields
+    ------
+    Optional[:class:`str`]
+        The `StreamTitle` of each metadata block, `None` for blocks without one.
+        Most servers send an empty block as long as the title doesn't change.
+    """
+    while True:
+        await content.readexactly(metaint)
+        metadata_length = struct.unpack("B", await content.readexactly(1))[0] * 16
+        if not metadata_length:
+            yield None
+            continue
+        metadata = await content.readexactly(metadata_length)
+        if (match := STREAM_TITLE.search(metadata.rstrip(b"\0"))) and (title := match.group(1)):
+            yield title.decode("utf-8", errors="replace")
+        else:
+            yield None
+
+
+class StreamTitleWatcher:
+    """Keeps a single connection to a live stream open to follow its title.
+
+    The watcher runs for as long as a player is playing the stream, or its title was asked for within
+    :data:`STREAM_METADATA_IDLE_TIMEOUT` seconds, and stops for good if the stream doesn't send ICY metadata.
+    """
+
+    __slots__ = ("_service", "url", "title", "updated_at", "supported", "last_used", "_first_title", "_task")
+
+    def __init__(self, service: StreamMetadataService, url: str) -> None:
+        self._service = service
+        self.url = url
+        self.title: str | None = None
+        self.updated_at: float | None = None
+        self.supported: bool | None = None
+        self.last_used = time.monotonic()
+        self._first_title = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the watcher is connected to the stream or trying to"""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start following the stream"""
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+            self._task.set_name(f"PyLavStreamTitleWatcher.{self.url}")
+
+    def stop(self) -> None:
+        """Stop following the stream"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def wait_for_title(self, timeout: float) -> str | None:
+        """Wait for the first title to be read, the title known so far if it takes longer than the timeout"""
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._first_title.wait(), timeout=timeout)
+        return self.title
+
+    async def _set_title(self, title: str) -> None:
+        previous, self.title, self.updated_at = self.title, title, time.time()
+        self._first_title.set()
+        if previous != title:
+            LOGGER.trace("%s is now playing %s", self.url, title)
+            for player in await self._service.players_on(self.url):
+                self._service.client.dispatch_event(
+                    TrackStreamTitleChangedEvent(player, player.current, title, previous)
+                )
+
+    async def _still_needed(self) -> bool:
+        return time.monotonic() - self.last_used < STREAM_METADATA_IDLE_TIMEOUT or bool(
+            await self._service.players_on(self.url)
+        )
+
+    async def _run(self) -> None:
+        backoff = ExponentialBackoffWithReset()
+        try:
+            while await self._still_needed():
+                try:
+                    async with self._service.session.get(self.url, headers={"Icy-MetaData": "1"}) as response:
+                        if "icy-metaint" not in response.headers:
+                            self.supported = False
+                            return
+                        self.supported = True
+                        checked_at = time.monotonic()
+                        async for title in read_stream_titles(response.content, int(response.headers["icy-metaint"])):
+                            backoff.reset()
+                            if title is not None:
+                                await self._set_title(title)
+                            if time.monotonic() - checked_at >= STREAM_METADATA_CHECK_INTERVAL:
+                                if not await self._still_needed():
+                                    return
+                                checked_at = time.monotonic()
+                except (aiohttp.ClientError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as exc:
+                    LOGGER.trace("Lost the connection to %s: %s", self.url, exc)
+                    await asyncio.sleep(backoff.delay())
+        finally:
+            # Nobody waits for a title that will never come
+            self._first_title.set()
+            self._service.discard(self)
+
+
+class StreamMetadataService:
+    """Follows the title of live streams with at most one connection per stream.
+
+    Rendering the name of a stream used to open a connection to the stream each time,
+    instead the title is read by a :class:`StreamTitleWatcher` shared by everything that shows the stream,
+    which stops once no player is playing the stream and the title hasn't been asked for in a while.
+    A :class:`TrackStreamTitleChangedEvent` is dispatched for every player on the stream when its title changes.
+    Watchers hold their connection for as long as they run, so they use a small connection pool of their own
+    rather than the pool shared with the nodes.
+
+    Parameters
+    ----------
+    client: :class:`Client`
+        The PyLav client.
+    """
+
+    __slots__ = ("_client", "_session", "_watchers", "_unsupported")
+
+    def __init__(self, client: Client) -> None:
+        self._client = client
+        # Streams never end, so only the time it takes for the next block to arrive is limited
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=STREAM_METADATA_MAX_CONNECTIONS, limit_per_host=STREAM_METADATA_MAX_CONNECTIONS_PER_HOST
+            ),
+            timeout=aiohttp.ClientTimeout(total=None, sock_read=30),
+        )
+        self._watchers: dict[str, StreamTitleWatcher] = {}
+        self._unsupported: dict[str, float] = {}
+
+    @property
+    def client(self) -> Client:
+        """The PyLav client"""
+        return self._client
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """The session used to connect to streams"""
+        return self._session
+
+    @property
+    def watchers(self) -> list[StreamTitleWatcher]:
+        """The streams currently being followed"""
+        return list(self._watchers.values())
+
+    async def players_on(self, url: str) -> list[Player]:
+        """The players currently playing the given stream"""
+        players = []
+        for player in self._client.player_manager.players.values():
+            if player.current and await player.current.stream() and await player.current.uri() == url:
+                players.append(player)
+        return players
+
+    async def get_title(self, url: str, timeout: float = STREAM_METADATA_FIRST_TITLE_TIMEOUT) -> str | None:
+        """|coro|
+        Get the current title of a live stream.
+
+        The first call for a stream waits until the title has been read, at most for the given timeout,
+        later calls return the latest title straight away.
+
+        Parameters
+        ----------
+        url: :class:`str`
+            The URL of the stream.
+        timeout: :class:`float`
+            How long to wait for the title if it isn't known yet.
+
+        Returns
+        -------
+        Optional[:class:`str`]
+            The title of the stream, `None` if it is unknown or the stream doesn't announce one.
+        """
+        if (unsupported_since := self._unsupported.get(url)) is not None:
+            if time.monotonic() - unsupported_since < STREAM_METADATA_RETRY_AFTER:
+                return None
+            del self._unsupported[url]
+        if (watcher := self._watchers.get(url)) is None:
+            watcher = self._watchers[url] = StreamTitleWatcher(self, url)
+            watcher.start()
+        watcher.last_used = time.monotonic()
+        return watcher.title if watcher.title is not None else await watcher.wait_for_title(timeout)
+
+    def get_cached_title(self, url: str) -> tuple[str | None, float | None]:
+        """The latest title of a stream and the unix timestamp at which it was read, without connecting to it"""
+        if (watcher := self._watchers.get(url)) is None:
+            return None, None
+        return watcher.title, watcher.updated_at
+
+    def discard(self, watcher: StreamTitleWatcher) -> None:
+        """Forget a watcher which stopped"""
+        if self._watchers.get(watcher.url) is watcher:
+            del self._watchers[watcher.url]
+        if watcher.supported is False:
+            self._unsupported[watcher.url] = time.monotonic()
+
+    def stats(self) -> dict[str, Any]:
+        """The streams being followed and their latest titles"""
+        return {
+            "watchers": {
+                url: {"title": watcher.title, "updated_at": watcher.updated_at, "supported": watcher.supported}
+                for url, watcher in self._watchers.items()
+            },
+            "unsupported": list(self._unsupported),
+        }
+
+    async def close(self) -> None:
+        """Stop following every stream"""
+        for watcher in list(self._watchers.values()):
+            watcher.stop()
+        self._watchers.clear()
+        await self._session.close()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import hashlib
+import weakref
+
+from pylav.nodes.api.responses.track import Track as APITrack
+
+# The identifier of a track which hasn't been resolved to an encoded track yet
+EMPTY_TRACK_IDENTIFIER = hashlib.md5().hexdigest()
+
+
+class TrackCore:
+    """The part of a track which only depends on its encoded form, shared by every :class:`Track` object of it.
+
+    Use :func:`get_track_core` rather than creating cores directly, so that the same track queued many times,
+    or on many guilds, is only stored, hashed and decoded once.
+
+    Parameters
+    ----------
+    encoded: :class:`str`
+        The base64-encoded track.
+    """
+
+    __slots__ = ("encoded", "unique_identifier", "hash", "data", "__weakref__")
+
+    def __init__(self, encoded: str) -> None:
+        self.encoded = encoded
+        self.unique_identifier = hashlib.md5(encoded.encode()).hexdigest()
+        self.hash = hash((self.unique_identifier,))
+        # The decoded track, set the first time any track using this core is decoded
+        self.data: APITrack | None = None
+
+    def __repr__(self) -> str:
+        return f"<TrackCore identifier={self.unique_identifier} decoded={self.data is not None}>"
+
+
+_TRACK_CORES: weakref.WeakValueDictionary[str, TrackCore] = weakref.WeakValueDictionary()
+
+
+def get_track_core(encoded: str, data: APITrack | None = None) -> TrackCore:
+    """Get the core of an encoded track, it is kept for as long as a track uses it.
+
+    Parameters
+    ----------
+    encoded: :class:`str`
+        The base64-encoded track.
+    data: Optional[:class:`APITrack`]
+        The decoded track, stored in the core if it wasn't decoded yet.
+
+    Returns
+    -------
+    :class:`TrackCore`
+        The core shared by every track with the same encoded form.
+    """
+    if (core := _TRACK_CORES.get(encoded)) is None:
+        core = _TRACK_CORES[encoded] = TrackCore(encoded)
+    if data is not None and core.data is None:
+        core.data = data
+    return core
+
+
+def track_core_count() -> int:
+    """The number of distinct encoded tracks currently in use"""
+    return len(_TRACK_CORES)
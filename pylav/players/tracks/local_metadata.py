@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import collections
+import contextlib
+import dataclasses
+import hashlib
+import io
+import pathlib
+import typing
+from typing import Any
+
+import aiopath
+
+from pylav.constants.config import (
+    CONFIG_DIR,
+    LOCAL_TRACK_ARTWORK_CACHE_SIZE,
+    LOCAL_TRACK_ARTWORK_DIR_MAX_SIZE,
+    LOCAL_TRACK_ARTWORK_SIZE,
+    LOCAL_TRACK_METADATA_CACHE_SIZE,
+)
+from pylav.constants.misc import LOCAL_TRACK_ARTWORK_MAX_ORIGINAL_SIZE
+from pylav.logging import getLogger
+
+if typing.TYPE_CHECKING:
+    import mutagen
+
+LOGGER = getLogger("PyLav.LocalTrackMetadata")
+
+LOCAL_TRACK_ARTWORK_DIR: aiopath.AsyncPath = CONFIG_DIR / "artwork"
+
+
+def extract_embedded_artwork(metadata: mutagen.FileType) -> bytes | None:
+    """Get the first picture embedded in a local track.
+
+    Parameters
+    ----------
+    metadata: :class:`mutagen.FileType`
+        The metadata of the track, as read by mutagen.
+
+    Returns
+    -------
+    Optional[:class:`bytes`]
+        The encoded image, `None` if the track has no embedded artwork.
+    """
+    if any("flac" in m for m in metadata.mime) and metadata.pictures:
+        return metadata.pictures[0].data or None
+    elif any("mp3" in m for m in metadata.mime):
+        for k in ("APIC:", "APIC:cover", "APIC"):
+            if (artwork := metadata.get(k, None)) and artwork.data:
+                return artwork.data
+    elif any("ogg" in m for m in metadata.mime) and "METADATA_BLOCK_PICTURE" in metadata:
+        from mutagen.flac import Picture
+
+        for b64_data in metadata.get("METADATA_BLOCK_PICTURE", []):
+            try:
+                # The tag holds a whole FLAC picture block, not just the image
+                if data := Picture(base64.b64decode(b64_data)).data:
+                    return data
+            except Exception:  # noqa
+                continue
+    elif any("mp4" in m for m in metadata.mime) and "covr" in metadata:
+        if covers := metadata.get("covr", None):
+            return bytes(covers[0]) or None
+    return None
+
+
+def make_thumbnail(data: bytes, size: int = LOCAL_TRACK_ARTWORK_SIZE) -> bytes | None:
+    """Downscale an image so that neither side is larger than the given size, and encode it as a PNG.
+
+    Pillow is optional, without it or if the image can't be decoded the original image is returned as is,
+    unless it is larger than :data:`LOCAL_TRACK_ARTWORK_MAX_ORIGINAL_SIZE` bytes, in which case `None` is returned
+    as it would be too large to upload with every message.
+    """
+    original = data if len(data) <= LOCAL_TRACK_ARTWORK_MAX_ORIGINAL_SIZE else None
+    try:
+        from PIL import Image
+    except ImportError:
+        return original
+    # noinspection PyBroadException
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            if image.format == "PNG" and max(image.size) <= size:
+                return data
+            if image.mode not in ("1", "L", "LA", "P", "RGB", "RGBA"):
+                image = image.convert("RGB")
+            image.thumbnail((size, size))
+            buffer = io.BytesIO()
+            image.save(buffer, format="PNG", optimize=True)
+            return buffer.getvalue()
+    except Exception as exc:  # noqa
+        LOGGER.trace("Unable to downscale embedded artwork: %s", exc)
+        return original
+
+
+def _write_thumbnail(path: pathlib.Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_suffix(".tmp")
+    temporary.write_bytes(data)
+    temporary.replace(path)
+
+
+def _prune_thumbnails(directory: pathlib.Path, max_size: int) -> int:
+    """Delete the least recently used thumbnails until the folder is no larger than the given size.
+
+    Returns the number of thumbnails deleted.
+    """
+    thumbnails = []
+    total = 0
+    for path in directory.glob("*.png"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        thumbnails.append((stat.st_mtime, stat.st_size, path))
+        total += stat.st_size
+    if total <= max_size:
+        return 0
+    thumbnails.sort()
+    deleted = 0
+    for __, size, path in thumbnails:
+        if total <= max_size:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+        deleted += 1
+    return deleted
+
+
+@dataclasses.dataclass(eq=False, slots=True, kw_only=True)
+class LocalTrackMetadata:
+    """The metadata of a local file at a given modification time and size"""
+
+    stamp: tuple[int, int]
+    metadata: mutagen.FileType | None
+    # False until the artwork was looked for, None if there is none, otherwise the digest of the original image
+    artwork: str | None | bool = False
+
+
+class LocalTrackMetadataCache:
+    """The metadata of local tracks and thumbnails of their embedded artwork, shared by every track of the process.
+
+    Files are only parsed by mutagen again once their modification time or size changes, the
+    :data:`LOCAL_TRACK_METADATA_CACHE_SIZE` most recently used files are kept in memory.
+    Embedded artwork is downscaled to :data:`LOCAL_TRACK_ARTWORK_SIZE` pixels and stored in
+    :data:`LOCAL_TRACK_ARTWORK_DIR` under the SHA-256 digest of the original image, so tracks sharing an album cover
+    share its thumbnail, and the most recently used thumbnails are kept in memory. Once the thumbnails on disk take
+    more than :data:`LOCAL_TRACK_ARTWORK_DIR_MAX_SIZE` bytes, the least recently used ones are deleted.
+    Without Pillow artwork is stored as is, and left out if it is larger than
+    :data:`LOCAL_TRACK_ARTWORK_MAX_ORIGINAL_SIZE` bytes.
+
+    Parameters
+    ----------
+    directory: :class:`aiopath.AsyncPath`
+        The folder the thumbnails are stored in.
+    max_size: :class:`int`
+        The number of files to keep the metadata of.
+    max_thumbnails: :class:`int`
+        The number of thumbnails to keep in memory.
+    thumbnail_size: :class:`int`
+        The largest width or height of a thumbnail, in pixels.
+    max_disk_size: :class:`int`
+        The number of bytes the thumbnails stored on disk may take.
+    """
+
+    __slots__ = (
+        "_directory",
+        "_max_size",
+        "_max_thumbnails",
+        "_thumbnail_size",
+        "_max_disk_size",
+        "_entries",
+        "_thumbnails",
+        "_loading",
+        "hits",
+        "misses",
+        "thumbnails_created",
+        "thumbnails_deleted",
+    )
+
+    def __init__(
+        self,
+        directory: aiopath.AsyncPath = LOCAL_TRACK_ARTWORK_DIR,
+        max_size: int = LOCAL_TRACK_METADATA_CACHE_SIZE,
+        max_thumbnails: int = LOCAL_TRACK_ARTWORK_CACHE_SIZE,
+        thumbnail_size: int = LOCAL_TRACK_ARTWORK_SIZE,
+        max_disk_size: int = LOCAL_TRACK_ARTWORK_DIR_MAX_SIZE,
+    ) -> None:
+        self._directory = directory
+        self._max_size = max_size
+        self._max_thumbnails = max_thumbnails
+        self._thumbnail_size = thumbnail_size
+        self._max_disk_size = max_disk_size
+        self._entries: collections.OrderedDict[str, LocalTrackMetadata] = collections.OrderedDict()
+        self._thumbnails: collections.OrderedDict[str, bytes] = collections.OrderedDict()
+        self._loading: dict[tuple[str, tuple[int, int]], asyncio.Task[LocalTrackMetadata]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.thumbnails_created = 0
+        self.thumbnails_deleted = 0
+
+    def stats(self) -> dict[str, Any]:
+        """How many files and thumbnails are cached and how often files had to be parsed"""
+        return {
+            "files": len(self._entries),
+            "thumbnails": len(self._thumbnails),
+            "hits": self.hits,
+            "misses": self.misses,
+            "thumbnails_created": self.thumbnails_created,
+            "thumbnails_deleted": self.thumbnails_deleted,
+        }
+
+    def clear(self) -> None:
+        """Forget everything kept in memory, the thumbnails on disk are kept"""
+        self._entries.clear()
+        self._thumbnails.clear()
+
+    async def get_metadata(self, path: str) -> mutagen.FileType | None:
+        """|coro|
+        Get the metadata of a local file, parsing it only if it changed since it was last parsed.
+
+        Parameters
+        ----------
+        path: :class:`str`
+            The path of the file.
+
+        Returns
+        -------
+        Optional[:class:`mutagen.FileType`]
+            The metadata of the file, `None` if it doesn't exist or mutagen can't read it.
+        """
+        entry = await self._get_entry(path)
+        return entry.metadata if entry is not None else None
+
+    async def get_artwork(self, path: str) -> bytes | None:
+        """|coro|
+        Get a thumbnail of the artwork embedded in a local file.
+
+        Parameters
+        ----------
+        path: :class:`str`
+            The path of the file.
+
+        Returns
+        -------
+        Optional[:class:`bytes`]
+            The thumbnail, `None` if the file has no embedded artwork.
+        """
+        if (entry := await self._get_entry(path)) is None or entry.metadata is None:
+            return None
+        if entry.artwork is False:
+            entry.artwork = self._artwork_digest(entry.metadata)
+        if entry.artwork is None:
+            return None
+        if (thumbnail := self._thumbnails.get(entry.artwork)) is not None:
+            self._thumbnails.move_to_end(entry.artwork)
+            return thumbnail
+        return await self._load_thumbnail(entry)
+
+    async def _get_entry(self, path: str) -> LocalTrackMetadata | None:
+        try:
+            stat = await aiopath.AsyncPath(path).stat()
+        except OSError:
+            self._entries.pop(path, None)
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if (entry := self._entries.get(path)) is not None and entry.stamp == stamp:
+            self._entries.move_to_end(path)
+            self.hits += 1
+            return entry
+        key = (path, stamp)
+        if (task := self._loading.get(key)) is None:
+            self.misses += 1
+            task = self._loading[key] = asyncio.create_task(self._parse(path, stamp))
+            task.add_done_callback(lambda __: self._loading.pop(key, None))
+        # Concurrent renders of the same file wait for a single parse, which outlives a cancelled caller
+        return await asyncio.shield(task)
+
+    async def _parse(self, path: str, stamp: tuple[int, int]) -> LocalTrackMetadata:
+        import mutagen
+
+        try:
+            metadata = await asyncio.to_thread(mutagen.File, path)
+        except Exception as exc:  # noqa
+            LOGGER.trace("Unable to read the metadata of %s: %s", path, exc)
+            metadata = None
+        entry = self._entries[path] = LocalTrackMetadata(stamp=stamp, metadata=metadata)
+        self._entries.move_to_end(path)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+        return entry
+
+    @staticmethod
+    def _artwork_digest(metadata: mutagen.FileType) -> str | None:
+        # noinspection PyBroadException
+        try:
+            data = extract_embedded_artwork(metadata)
+        except Exception:  # noqa
+            return None
+        return hashlib.sha256(data).hexdigest() if data else None
+
+    async def _load_thumbnail(self, entry: LocalTrackMetadata) -> bytes | None:
+        digest = entry.artwork
+        path = self._directory / f"{digest}-{self._thumbnail_size}.png"
+        try:
+            thumbnail = await path.read_bytes()
+        except OSError:
+            if not (data := extract_embedded_artwork(entry.metadata)) or not (
+                thumbnail := await asyncio.to_thread(make_thumbnail, data, self._thumbnail_size)
+            ):
+                # Don't look for artwork which is too large to send again until the file changes
+                entry.artwork = None
+                return None
+            self.thumbnails_created += 1
+            try:
+                await asyncio.to_thread(_write_thumbnail, pathlib.Path(path), thumbnail)
+                self.thumbnails_deleted += await asyncio.to_thread(
+                    _prune_thumbnails, pathlib.Path(self._directory), self._max_disk_size
+                )
+            except OSError as exc:
+                LOGGER.debug("Unable to store the thumbnail %s: %s", path, exc)
+        else:
+            # The modification time of a thumbnail is when it was last used, which is what pruning goes by
+            with contextlib.suppress(OSError):
+                await path.touch()
+        self._thumbnails[digest] = thumbnail
+        while len(self._thumbnails) > self._max_thumbnails:
+            self._thumbnails.popitem(last=False)
+        return thumbnail
+
+
+LOCAL_TRACK_METADATA_CACHE = LocalTrackMetadataCache()
@@ -1,30 +1,29 @@
 from __future__ import annotations
 
-import asyncio
-import base64
 import contextlib
-import hashlib
 import io
 import re
-import struct
 import typing
 import uuid
 from functools import total_ordering
 from typing import Any
 
 import discord
-import mutagen
 from dacite import from_dict
 
-from pylav.constants.regex import SQUARE_BRACKETS, STREAM_TITLE
+from pylav.constants.regex import SQUARE_BRACKETS
 from pylav.exceptions.track import TrackNotFoundException
 from pylav.nodes.api.responses import rest_api
 from pylav.nodes.api.responses.playlists import Info
 from pylav.nodes.api.responses.track import Track as APITrack
 from pylav.players.query.obj import Query
+from pylav.players.tracks.core import EMPTY_TRACK_IDENTIFIER, TrackCore, get_track_core
+from pylav.players.tracks.local_metadata import LOCAL_TRACK_METADATA_CACHE
 from pylav.type_hints.dict_typing import JSON_DICT_TYPE
 
 if typing.TYPE_CHECKING:
+    import mutagen
+
     from pylav.core.client import Client
     from pylav.nodes.node import Node
     from pylav.players.player import Player
@@ -40,21 +39,16 @@ class Track:
         "_node",
         "_query",
         "_extra",
-        "_unique_id",
-        "__clear_cache_task",
+        "_core",
         "_skip_segments",
         "_requester_id",
-        "_requester",
         "_updated_query",
         "_id",
-        "_extra",
-        "_encoded",
         "_raw_data",
-        "_processed",
         "_player",
-        "_duration",
         "_local_file_metadata",
         "_has_embedded_artwork",
+        "_display_names",
     )
     __CLIENT: Client | None = None
 
@@ -66,23 +60,25 @@ class Track:
         requester: discord.abc.User | int | None = None,
         **extra: Any,
     ) -> None:
-        """This class should not be instantiated directly. Use :meth:`Track.build_track` instead."""
-        self._encoded: str | None = None
-        self._requester = requester
+        """This class should not be instantiated directly. Use :meth:`Track.build_track` instead.
+
+        Everything derived from the encoded track is kept in a :class:`TrackCore` shared with every other
+        track object of the same encoded track, so only the state of this entry lives on the instance,
+        and the containers below are only allocated once something is stored in them.
+        """
+        self._core: TrackCore | None = None
         self._node = node
         self._query = query
         self._extra = extra
-        self._skip_segments = skip_segments or []
-        self._unique_id = hashlib.md5()
+        self._skip_segments = skip_segments or None
         self._updated_query = None
         self._id = str(uuid.uuid4())
-        self._raw_data: JSON_DICT_TYPE = {}
-        self._processed: APITrack | None = None
+        self._raw_data: JSON_DICT_TYPE | None = None
         self._player: Player | None = None
-        self._duration: int | float = float("inf")
         self._local_file_metadata: mutagen.FileType | None | bool = False
         self._has_embedded_artwork: bool | None = None
-        self._process_init()
+        self._display_names: dict[tuple[int | None, bool, bool, bool, bool], str] | None = None
+        self._process_init(requester)
 
     @property
     def player(self) -> Player | None:
@@ -124,7 +120,7 @@ class Track:
         return not x
 
     def __hash__(self):
-        return hash((self.unique_identifier,))
+        return self._core.hash if self._core is not None else hash((EMPTY_TRACK_IDENTIFIER,))
 
     def __getitem__(self, name: str) -> Any:
         return super().__getattribute__(name)
@@ -132,13 +128,13 @@ class Track:
     def __repr__(self) -> str:
         return f"<Track identifier={self._id} encoded={self.encoded}>"
 
-    def _process_init(self) -> None:
-        if self._requester is None:
+    def _process_init(self, requester: discord.abc.User | int | None) -> None:
+        if requester is None:
             self._requester_id = self.client.bot.user.id
-        elif isinstance(self._requester, int):
-            self._requester_id = self._requester
+        elif isinstance(requester, int):
+            self._requester_id = requester
         else:
-            self._requester_id = self._requester.id
+            self._requester_id = requester.id
 
         if self._query is not None:
             self.timestamp = self.timestamp or self._query.start_time
@@ -255,13 +251,9 @@ class Track:
         **extra: Any,
     ) -> Track:
         instance = cls(node, query, skip_segments, requester, **extra)
-        instance._encoded = data.encoded
-        instance._duration = data.info.length
+        instance._core = get_track_core(data.encoded, data)
         instance._extra = extra
-        instance._raw_data = extra.get("raw_data", {})
-        instance._unique_id = hashlib.md5()
-        instance._unique_id.update(instance._encoded.encode())
-        instance._processed = data
+        instance._raw_data = extra.get("raw_data") or None
         instance._player = player_instance
         return instance
 
@@ -300,27 +292,33 @@ class Track:
     ) -> Track:
         instance = cls(node, query, skip_segments, requester, **extra)
         instance._extra = extra
-        instance._raw_data = extra.get("raw_data", {})
+        instance._raw_data = extra.get("raw_data") or None
         instance._player = player_instance
         return instance
 
     def _copy_with_extras(self, node: Node, **extra: Any) -> Track:
         instance = self.__class__(node, self._query, None, None)
         instance._extra = {**self._extra, **extra}
-        instance._encoded = self._encoded
+        instance._core = self._core
         instance._raw_data = self._raw_data
-        instance._unique_id = self._unique_id
-        instance._processed = self._processed
         return instance
 
     @property
     def skip_segments(self) -> list[str]:
         """The segments to skip when playing the track."""
-        return self._skip_segments
+        return self._skip_segments or []
 
     @property
     def encoded(self) -> str | None:
-        return self._encoded
+        return self._core.encoded if self._core is not None else None
+
+    @property
+    def _processed(self) -> APITrack | None:
+        return self._core.data if self._core is not None else None
+
+    @property
+    def _duration(self) -> int | float:
+        return self._core.data.info.length if self._core is not None and self._core.data else float("inf")
 
     @property
     def timestamp(self) -> int:
@@ -356,7 +354,7 @@ class Track:
 
     @property
     def unique_identifier(self) -> str:
-        return self._unique_id.hexdigest()
+        return self._core.unique_identifier if self._core is not None else EMPTY_TRACK_IDENTIFIER
 
     async def identifier(self) -> str | None:
         return (await self.fetch_full_track_data()).info.identifier
@@ -408,36 +406,15 @@ class Track:
             self._local_file_metadata = None
         if self._local_file_metadata != False:
             return self._local_file_metadata
-        try:
-            self._local_file_metadata = await asyncio.to_thread(mutagen.File, await self.uri())
-        except Exception:
-            self._local_file_metadata = None
+        self._local_file_metadata = await LOCAL_TRACK_METADATA_CACHE.get_metadata(await self.uri())
         return self._local_file_metadata
 
     async def _mutagen_artwork_url(self, default: str | None) -> str | None:
         if not await self.is_local():
             return None
         with contextlib.suppress(Exception):
-            if metadata := await self._get_mutagen_metadata():
-                if any("flac" in m for m in metadata.mime) and metadata.pictures:
-                    self._has_embedded_artwork = bool(metadata.pictures)
-                elif any("mp3" in m for m in metadata.mime) and any(
-                    k in metadata for k in ("APIC:", "APIC:cover", "APIC")
-                ):
-                    for k in ("APIC:", "APIC:cover", "APIC"):
-                        if artwork := metadata.get(k, None):
-                            self._has_embedded_artwork = bool(artwork.data)
-                elif any("ogg" in m for m in metadata.mime) and "METADATA_BLOCK_PICTURE" in metadata:
-                    for b64_data in metadata.get("metadata_block_picture", []):
-                        try:
-                            data = base64.b64decode(b64_data)
-                            self._has_embedded_artwork = bool(data)
-                            break
-                        except (TypeError, ValueError):
-                            continue
-                elif any("mp4" in m for m in metadata.mime) and "covr" in metadata:
-                    if artwork := metadata.get("covr", None):
-                        self._has_embedded_artwork = bool(artwork.data)
+            # Only point at the attachment when get_embedded_artwork will have something to send
+            self._has_embedded_artwork = bool(await LOCAL_TRACK_METADATA_CACHE.get_artwork(await self.uri()))
         return default if not self._has_embedded_artwork else "attachment://thumbnail.png"
 
     async def get_embedded_artwork(self) -> discord.File | None:
@@ -446,24 +423,8 @@ class Track:
         if self._has_embedded_artwork is False:
             return None
         with contextlib.suppress(Exception):
-            if metadata := await self._get_mutagen_metadata():
-                if any("flac" in m for m in metadata.mime) and metadata.pictures:
-                    return discord.File(fp=io.BytesIO(metadata.pictures[0].data), filename="thumbnail.png")
-                elif any("mp3" in m for m in metadata.mime) and any(
-                    k in metadata for k in ("APIC:", "APIC:cover", "APIC")
-                ):
-                    for k in ("APIC:", "APIC:cover", "APIC"):
-                        if artwork := metadata.get(k, None):
-                            return discord.File(fp=io.BytesIO(artwork.data), filename="thumbnail.png")
-                elif any("ogg" in m for m in metadata.mime) and "METADATA_BLOCK_PICTURE" in metadata:
-                    for b64_data in metadata.get("METADATA_BLOCK_PICTURE", []):
-                        try:
-                            return discord.File(fp=io.BytesIO(base64.b64decode(b64_data)), filename="thumbnail.png")
-                        except (TypeError, ValueError):
-                            continue
-                elif any("mp4" in m for m in metadata.mime) and "covr" in metadata:
-                    if artwork := metadata.get("covr", None):
-                        return discord.File(fp=io.BytesIO(artwork.data), filename="thumbnail.png")
+            if thumbnail := await LOCAL_TRACK_METADATA_CACHE.get_artwork(await self.uri()):
+                return discord.File(fp=io.BytesIO(thumbnail), filename="thumbnail.png")
         return None
 
     async def _mutagen_title(self, default: str | None) -> str | None:
@@ -547,6 +508,7 @@ class Track:
                 )
             self._query = self._updated_query
             self.timestamp = self.timestamp or self._query.start_time
+            self._display_names = None
         if self.encoded and self._updated_query is None:
             assert self.encoded is not None
             self._updated_query = await Query.from_base64(self.encoded, lazy=True)
@@ -561,6 +523,7 @@ class Track:
                 )
             self._query = self._updated_query
             self.timestamp = self.timestamp or self._query.start_time
+            self._display_names = None
         return self._query
 
     async def is_clypit(self) -> bool:
@@ -663,8 +626,8 @@ class Track:
         if self._processed:
             return self._processed
         if self.encoded:
-            self._processed = await self.client.decode_track(self.encoded)
-            self._duration = self._processed.info.length
+            self._core.data = await self.client.decode_track(self.encoded)
+            self._display_names = None
         else:
             await self.search()
         return self._processed
@@ -681,12 +644,12 @@ class Track:
             "encoded": self.encoded,
             "query": await self.query_identifier(),
             "requester": self.requester.id if self.requester else self.requester_id,
-            "skip_segments": self._skip_segments,
+            "skip_segments": self.skip_segments,
             "extra": {
                 "timestamp": self.timestamp,
                 "last_known_position": self.last_known_position,
             },
-            "raw_data": self._raw_data,
+            "raw_data": self._raw_data or {},
             "full_track_data": (await self.fetch_full_track_data()).to_database(),
         }
 
@@ -715,12 +678,9 @@ class Track:
         if not response or not tracks:
             raise TrackNotFoundException(f"No tracks found for query {await self.query_identifier()}")
         track = tracks[0]
-        self._encoded = track.encoded
-        assert isinstance(self._encoded, str)
-        self._unique_id = hashlib.md5()
-        self._unique_id.update(self.encoded.encode())
-        self._processed = track
-        self._duration = track.info.length
+        assert isinstance(track.encoded, str)
+        self._core = get_track_core(track.encoded, track)
+        self._display_names = None
 
     async def search_all(self, player: Player, requester: int, bypass_cache: bool = False) -> list[Track]:
         _query = await Query.from_string(self._query)
@@ -754,23 +714,6 @@ class Track:
             for track in tracks
         ]
 
-    async def _icyparser(self, url: str) -> str | None:
-        try:
-            async with self._node.session.get(url, headers={"Icy-MetaData": "1"}) as resp:
-                metaint = int(resp.headers["icy-metaint"])
-                for __ in iter(range(5)):
-                    await resp.content.readexactly(metaint)
-                    metadata_length = struct.unpack("B", await resp.content.readexactly(1))[0] * 16
-                    metadata = await resp.content.readexactly(metadata_length)
-                    if not (m := STREAM_TITLE.search(metadata.rstrip(b"\0"))):
-                        return None
-                    if title := m.group(1):
-                        title = title.decode("utf-8", errors="replace")
-                        return title
-        except Exception:  # noqa
-            return None
-        return None
-
     async def get_track_display_name(
         self,
         max_length: int | None = None,
@@ -778,6 +721,23 @@ class Track:
         unformatted: bool = False,
         with_url: bool = False,
         escape: bool = True,
+    ) -> str:
+        # Rendering is only cached until the track's metadata changes, and never for live streams
+        # since their title comes from the stream itself
+        if await self.stream():
+            return await self._render_track_display_name(max_length, author, unformatted, with_url, escape)
+        key = (max_length, author, unformatted, with_url, escape)
+        if self._display_names is not None and (name := self._display_names.get(key)) is not None:
+            return name
+        name = await self._render_track_display_name(max_length, author, unformatted, with_url, escape)
+        # Rendering can resolve the query for the first time, which clears the cache, so it is only created after
+        if self._display_names is None:
+            self._display_names = {}
+        self._display_names[key] = name
+        return name
+
+    async def _render_track_display_name(
+        self, max_length: int | None, author: bool, unformatted: bool, with_url: bool, escape: bool
     ) -> str:
         if unformatted:
             return await self.get_track_display_name_unformatted(max_length=max_length, author=author, escape=escape)
@@ -847,7 +807,7 @@ class Track:
         title = await self.title()
 
         if await self.stream():
-            icy = await self._icyparser(await self.uri())
+            icy = await self.client.stream_metadata.get_title(await self.uri())
             track_name = icy or f"{title}{author_string}"
         elif (await self.author()).lower() not in title.lower():
             track_name = f"{title}{author_string}"
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING, Any
+
+from pylav.constants.node import PLAYER_UPDATE_COALESCE_WINDOW
+from pylav.exceptions.request import HTTPException
+from pylav.type_hints.dict_typing import JSON_DICT_TYPE
+
+if TYPE_CHECKING:
+    from pylav.nodes.api.responses import rest_api
+    from pylav.players.player import Player
+
+# Fields which describe a state rather than an action, so sending the value the node already has is a no-op
+DIFFED_FIELDS = ("volume", "paused", "filters")
+
+
+class PlayerUpdateCoalescer:
+    """Sends the REST updates of a player, merging bursts of changes and skipping the ones the node already has.
+
+    Updates sent with :meth:`update` wait for :data:`PLAYER_UPDATE_COALESCE_WINDOW` seconds and are merged with any
+    other update made in the meantime, the last value of each field wins.
+    Updates sent with :meth:`send` go out straight away and take any pending update with them.
+
+    The last value of each of :data:`DIFFED_FIELDS` acknowledged by the node is remembered for the node's session,
+    fields which haven't changed since are left out and an update with nothing left in it isn't sent at all.
+    """
+
+    __slots__ = (
+        "_player",
+        "_window",
+        "_pending",
+        "_waiters",
+        "_flush_task",
+        "_lock",
+        "_acknowledged",
+        "_session",
+        "requested",
+        "sent",
+        "coalesced",
+        "skipped",
+        "fields_skipped",
+    )
+
+    def __init__(self, player: Player, window: float = PLAYER_UPDATE_COALESCE_WINDOW) -> None:
+        self._player = player
+        self._window = window
+        self._pending: JSON_DICT_TYPE = {}
+        self._waiters: list[asyncio.Future] = []
+        self._flush_task: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+        self._acknowledged: JSON_DICT_TYPE = {}
+        self._session: tuple[int, str | None] | None = None
+        self.requested = 0
+        self.sent = 0
+        self.coalesced = 0
+        self.skipped = 0
+        self.fields_skipped = 0
+
+    @property
+    def avoided(self) -> int:
+        """The number of updates which didn't result in a request of their own"""
+        return self.requested - self.sent
+
+    def stats(self) -> dict[str, Any]:
+        """How many updates were requested and how many requests were avoided"""
+        return {
+            "requested": self.requested,
+            "sent": self.sent,
+            "avoided": self.avoided,
+            "coalesced": self.coalesced,
+            "skipped": self.skipped,
+            "fields_skipped": self.fields_skipped,
+        }
+
+    def reset(self) -> None:
+        """Forget what the node has acknowledged, so the next update sends every field it contains.
+
+        Used whenever the player on the node may have been recreated, e.g. after it was deleted or restored.
+        """
+        self._acknowledged.clear()
+        self._session = None
+
+    async def update(self, payload: JSON_DICT_TYPE) -> rest_api.LavalinkPlayer | HTTPException | None:
+        """|coro|
+        Queue an update, it is sent together with any other update made within the coalescing window.
+
+        Parameters
+        ----------
+        payload: :class:`dict`
+            The fields to update.
+
+        Returns
+        -------
+        Optional[Union[:class:`rest_api.LavalinkPlayer`, :class:`HTTPException`]]
+            The response of the request the update was sent with, `None` if nothing needed to be sent.
+        """
+        self.requested += 1
+        if self._pending:
+            self.coalesced += 1
+        self._pending |= payload
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+        return await future
+
+    async def send(
+        self, payload: JSON_DICT_TYPE, no_replace: bool = False
+    ) -> rest_api.LavalinkPlayer | HTTPException | None:
+        """|coro|
+        Send an update straight away, along with any update still waiting to be sent.
+
+        Parameters
+        ----------
+        payload: :class:`dict`
+            The fields to update.
+        no_replace: :class:`bool`
+            Whether the track in the payload should only be played if nothing is playing.
+
+        Returns
+        -------
+        Optional[Union[:class:`rest_api.LavalinkPlayer`, :class:`HTTPException`]]
+            The response of the request, `None` if nothing needed to be sent.
+        """
+        self.requested += 1
+        async with self._lock:
+            if self._pending:
+                self.coalesced += 1
+            pending, waiters = self._take()
+            if "encodedTrack" in payload:
+                # A pending seek was meant for the track being replaced
+                pending.pop("position", None)
+            return await self._send(pending | payload, no_replace, waiters)
+
+    def _take(self) -> tuple[JSON_DICT_TYPE, list[asyncio.Future]]:
+        pending, waiters = self._pending, self._waiters
+        self._pending, self._waiters = {}, []
+        return pending, waiters
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._window)
+        # Updates queued while this one is being sent need a flush of their own
+        self._flush_task = None
+        async with self._lock:
+            pending, waiters = self._take()
+            if waiters:
+                # Failures are handed to the waiting callers
+                with contextlib.suppress(Exception):
+                    await self._send(pending, False, waiters)
+
+    async def _send(
+        self, payload: JSON_DICT_TYPE, no_replace: bool, waiters: list[asyncio.Future]
+    ) -> rest_api.LavalinkPlayer | HTTPException | None:
+        node = self._player.node
+        session = (node.identifier, node.session_id)
+        if session != self._session:
+            # A different node or session has its own copy of the player, nothing was acknowledged there yet
+            self._acknowledged.clear()
+            self._session = session
+        for field in DIFFED_FIELDS:
+            if field in payload and field in self._acknowledged and self._acknowledged[field] == payload[field]:
+                del payload[field]
+                self.fields_skipped += 1
+        try:
+            if not payload:
+                self.skipped += 1
+                response = None
+            else:
+                self.sent += 1
+                response = await node.patch_session_player(
+                    guild_id=self._player.guild.id, no_replace=no_replace, payload=payload
+                )
+                if not isinstance(response, HTTPException):
+                    self._acknowledged |= {field: payload[field] for field in DIFFED_FIELDS if field in payload}
+        except asyncio.CancelledError:
+            for waiter in waiters:
+                waiter.cancel()
+            raise
+        except Exception as exc:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(exc)
+            raise
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(response)
+        return response
@@ -3,16 +3,39 @@ from __future__ import annotations
 import asyncio
 import collections
 import contextlib
+import dataclasses
+import itertools
 import random
 import threading
+import time
 from abc import ABC
 from asyncio import Event, QueueFull, get_event_loop
 from collections.abc import Iterator
 from types import GenericAlias
-from typing import NoReturn
-
+from typing import TYPE_CHECKING, NoReturn
+
+from pylav.constants.misc import QUEUE_CHANGE_LOG_SIZE
+from pylav.enums.queue import ShuffleMode
+from pylav.players.query.obj import Query
+from pylav.players.tracks.decoder import decode_track
+from pylav.players.tracks.obj import Track
+from pylav.type_hints.dict_typing import JSON_DICT_TYPE
 from pylav.type_hints.generics import ANY_GENERIC_TYPE
 
+if TYPE_CHECKING:
+    from pylav.players.player import Player
+
+
+@dataclasses.dataclass(eq=False, slots=True, kw_only=True, frozen=True)
+class QueueChange:
+    """A change made to a :class:`PlayerQueue`, the entries from `start` onwards may have moved or changed"""
+
+    version: int
+    # One of "add", "remove", "clear", "reorder" or "replace"
+    kind: str
+    start: int
+    count: int
+
 
 class PlayerQueue(asyncio.Queue[ANY_GENERIC_TYPE]):
     """A queue, useful for coordinating producer and consumer coroutines.
@@ -24,14 +47,29 @@ class PlayerQueue(asyncio.Queue[ANY_GENERIC_TYPE]):
     Unlike the standard library Queue, you can reliably know this Queue's size
     with qsize(), since your single-threaded asyncio application won't be
     interrupted between calling qsize() and doing an operation on the Queue.
+
+    Every change to the queue increases its :attr:`version` and is recorded as a :class:`QueueChange`,
+    so that views of the queue only need to rebuild what changed since they were built.
     """
 
-    __slots__ = ("_queue", "_maxsize", "_getters", "_putters", "_unfinished_tasks", "_finished", "_loop")
+    __slots__ = (
+        "_queue",
+        "_maxsize",
+        "_getters",
+        "_putters",
+        "_unfinished_tasks",
+        "_finished",
+        "_loop",
+        "_version",
+        "_changes",
+    )
 
     _queue: collections.deque[ANY_GENERIC_TYPE]
     raw_b64s: list[str]
 
     def __init__(self, maxsize: int = 0) -> None:
+        self._version = 0
+        self._changes: collections.deque[QueueChange] = collections.deque(maxlen=QUEUE_CHANGE_LOG_SIZE)
         self._lock = asyncio.Lock()
         self._threading_lock = threading.Lock()
         super().__init__(maxsize=maxsize)
@@ -59,15 +97,51 @@ class PlayerQueue(asyncio.Queue[ANY_GENERIC_TYPE]):
         if self._maxsize and len(value) > self._maxsize:
             raise ValueError(f"Queue value cannot be longer than maxsize: {self._maxsize}")
         self._queue = value
+        self._record("replace", 0, len(value))
 
     @raw_queue.deleter
     def raw_queue(self) -> None:
         self.clear()
 
+    @property
+    def version(self) -> int:
+        """A number which increases every time the queue changes"""
+        return self._version
+
+    def _record(self, kind: str, start: int, count: int) -> None:
+        self._version += 1
+        self._changes.append(QueueChange(version=self._version, kind=kind, start=start, count=count))
+
+    def changes_since(self, version: int) -> list[QueueChange] | None:
+        """The changes made after the given version, `None` if they are too old to be known"""
+        if version == self._version:
+            return []
+        if version > self._version or not self._changes or self._changes[0].version > version + 1:
+            return None
+        return [change for change in self._changes if change.version > version]
+
+    def first_changed_index(self, version: int) -> int | None:
+        """The first position whose entry may differ from the given version, `None` if nothing changed"""
+        if (changes := self.changes_since(version)) is None:
+            return 0
+        return min((change.start for change in changes), default=None)
+
+    def peek(self, index: int = 0) -> ANY_GENERIC_TYPE | None:
+        """Return the entry at the given position without removing it or copying the queue"""
+        try:
+            return self._queue[index]
+        except IndexError:
+            return None
+
+    def get_range(self, start: int, stop: int) -> list[ANY_GENERIC_TYPE]:
+        """Return the entries between the given positions without copying the rest of the queue"""
+        return list(itertools.islice(self._queue, start, stop))
+
     def popindex(self, index: int) -> ANY_GENERIC_TYPE:
         with self._threading_lock:
             value = self._queue[index]
             del self._queue[index]
+            self._record("remove", index if index >= 0 else len(self._queue) + 1 + index, 1)
             return value
 
     async def remove(self, value: ANY_GENERIC_TYPE, duplicates: bool = False) -> tuple[list[ANY_GENERIC_TYPE], int]:
@@ -80,13 +154,13 @@ class PlayerQueue(asyncio.Queue[ANY_GENERIC_TYPE]):
             count = 0
             removed = []
             try:
-                i = self._queue.index(value)
+                i = self.index(value)
                 removed.append(self.popindex(i))
                 count += 1
                 if duplicates:
                     with contextlib.suppress(ValueError):
                         while value in self:
-                            i = self._queue.index(value)
+                            i = self.index(value)
                             removed.append(self.popindex(i))
                             count += 1
                 return removed, count
@@ -96,6 +170,7 @@ class PlayerQueue(asyncio.Queue[ANY_GENERIC_TYPE]):
     def clear(self) -> None:
         """Remove all items from the queue"""
         with self._threading_lock:
+            self._record("clear", 0, len(self._queue))
             self._queue.clear()
             for i in self._getters:
                 i.cancel()
@@ -104,12 +179,60 @@ class PlayerQueue(asyncio.Queue[ANY_GENERIC_TYPE]):
                 i.cancel()
             self._putters.clear()
 
-    async def shuffle(self) -> None:
-        """Shuffle the queue"""
+    async def shuffle(self, mode: ShuffleMode = ShuffleMode.Random, count: int | None = None) -> None:
+        """Shuffle the queue
+
+        Parameters
+        ----------
+        mode: :class:`ShuffleMode`
+            How to shuffle the queue.
+        count: :class:`int`
+            The number of tracks at the end of the queue to move with :attr:`ShuffleMode.NewTracks`.
+        """
         async with self._lock:
             if self.empty():
                 return
-            await asyncio.to_thread(random.shuffle, self._queue)
+            with self._threading_lock:
+                if mode == ShuffleMode.NewTracks:
+                    if (start := self._shuffle_new(count or 0)) is not None:
+                        self._record("reorder", start, len(self._queue) - start)
+                    return
+                # Indexing a deque is O(n), so the tracks are shuffled as a list which is then swapped in
+                items = list(self._queue)
+                if mode == ShuffleMode.RoundRobin:
+                    items = self._round_robin(items)
+                else:
+                    random.shuffle(items)
+                self._queue = collections.deque(items, maxlen=self._queue.maxlen)
+                self._record("reorder", 0, len(items))
+
+    def _shuffle_new(self, count: int) -> int | None:
+        new = [self._queue.pop() for __ in range(min(count, len(self._queue)))]
+        if not new:
+            return None
+        # Giving the new tracks a random order and random positions among the old ones, which keep their order,
+        # shuffles them in a single pass over the queue instead of one O(n) deque insert per track
+        random.shuffle(new)
+        total = len(self._queue) + len(new)
+        positions = set(random.sample(range(total), len(new)))
+        old_items, new_items = iter(self._queue), iter(new)
+        items = [next(new_items) if index in positions else next(old_items) for index in range(total)]
+        self._queue = collections.deque(items, maxlen=self._queue.maxlen)
+        return min(positions)
+
+    @staticmethod
+    def _round_robin(items: list[ANY_GENERIC_TYPE]) -> list[ANY_GENERIC_TYPE]:
+        by_requester: dict[int | None, list[ANY_GENERIC_TYPE]] = collections.defaultdict(list)
+        for item in items:
+            by_requester[getattr(item, "requester_id", None)].append(item)
+        turns = list(by_requester.values())
+        random.shuffle(turns)
+        for tracks in turns:
+            random.shuffle(tracks)
+        output = []
+        for round_ in itertools.zip_longest(*turns):
+            output.extend(item for item in round_ if item is not None)
+        return output
 
     async def get_oldest(self) -> ANY_GENERIC_TYPE:
         """Remove and return an item from the queue.
@@ -170,12 +293,15 @@ class PlayerQueue(asyncio.Queue[ANY_GENERIC_TYPE]):
         else:
             with self._threading_lock:
                 r = self._queue.popleft()
+                self._record("remove", 0, 1)
         if r.encoded:
             self.raw_b64s.remove(r.encoded)
         return r
 
     def _put(self, items: list[ANY_GENERIC_TYPE], index: int = None) -> None:
         with self._threading_lock:
+            start = len(self._queue) if index is None or index < 0 else min(index, len(self._queue))
+            self._record("add", start, len(items))
             if index is not None:
                 for i in items:
                     if index < 0:
@@ -345,49 +471,210 @@ class PlayerQueue(asyncio.Queue[ANY_GENERIC_TYPE]):
             await self._finished.wait()
 
 
-class TrackHistoryQueue(PlayerQueue[ANY_GENERIC_TYPE], ABC):
+@dataclasses.dataclass(eq=False, slots=True, kw_only=True)
+class HistoryEntry:
+    """A track in the history of a player, only turned back into a :class:`Track` when it is shown or replayed"""
+
+    encoded: str
+    requester_id: int | None = None
+    # The unix timestamp at which the track was added to the history
+    played_at: float = 0.0
+    query: str | None = None
+    # The length of the track in milliseconds, not adjusted to the timescale of the player
+    duration: int = 0
+    stream: bool = False
+
+    @classmethod
+    async def from_track(cls, track: Track) -> HistoryEntry:
+        """|coro|
+        Keep the parts of a track needed to play it again.
+
+        Parameters
+        ----------
+        track: :class:`Track`
+            The track which was played.
+
+        Returns
+        -------
+        :class:`HistoryEntry`
+            The entry for the track.
+        """
+        info = (await track.fetch_full_track_data()).info
+        return cls(
+            encoded=track.encoded,
+            requester_id=track.requester_id,
+            played_at=time.time(),
+            query=await track.query_identifier(),
+            duration=info.length,
+            stream=info.isStream,
+        )
+
+    @classmethod
+    def from_dict(cls, data: JSON_DICT_TYPE) -> HistoryEntry:
+        """Build an entry from the output of :meth:`to_dict`, or of :meth:`Track.to_dict` for older saves"""
+        entry = cls(
+            encoded=data["encoded"],
+            requester_id=data.get("requester"),
+            played_at=data.get("played_at", 0.0),
+            query=data.get("query"),
+            duration=data.get("duration", 0),
+            stream=data.get("stream", False),
+        )
+        if "duration" not in data:
+            with contextlib.suppress(Exception):
+                info = decode_track(entry.encoded).info
+                entry.duration, entry.stream = info.length, info.isStream
+        return entry
+
+    def to_dict(self) -> JSON_DICT_TYPE:
+        """Returns a dict representation of this entry"""
+        return {
+            "encoded": self.encoded,
+            "query": self.query,
+            "requester": self.requester_id,
+            "played_at": self.played_at,
+            "duration": self.duration,
+            "stream": self.stream,
+        }
+
+    async def to_track(self, player: Player) -> Track:
+        """|coro|
+        Build the track this entry was made from.
+
+        Parameters
+        ----------
+        player: :class:`Player`
+            The player the track will be played or shown by.
+
+        Returns
+        -------
+        :class:`Track`
+            The track, with the same requester and starting from the beginning.
+        """
+        return await Track.build_track(
+            node=player.node,
+            data=self.encoded,
+            query=await Query.from_string(self.query, lazy=True) if self.query else None,
+            player_instance=player,
+            requester=self.requester_id,
+            lazy=True,
+        )
+
+
+class TrackHistoryQueue(PlayerQueue[HistoryEntry], ABC):
+    """The tracks played by a player, the most recent first.
+
+    Tracks are kept as :class:`HistoryEntry` objects in a list ordered from the oldest to the most recent one,
+    so any position can be read in constant time and adding or replaying a track only changes the end of the list.
+    :meth:`put` accepts :class:`Track` objects and converts them, use :meth:`HistoryEntry.to_track` to get them back.
+    """
+
     __slots__ = ("_queue", "_maxsize", "_getters", "_putters", "_unfinished_tasks", "_finished", "_loop")
 
+    _queue: list[HistoryEntry]
+
     def __int__(self, maxsize: int = 0) -> None:
         super().__init__(maxsize=maxsize)
 
     def _init(self, maxsize: int) -> None:
-        super()._init(maxsize)
+        self._queue = []
 
-    def _put(self, items: list[ANY_GENERIC_TYPE], index: int = None) -> None:
+    @property
+    def raw_b64s(self) -> list[str]:
+        """The encoded tracks in the history, the most recent first"""
+        return [entry.encoded for entry in reversed(self._queue)]
+
+    @property
+    def raw_queue(self) -> collections.deque[HistoryEntry]:
+        return collections.deque(reversed(self._queue))
+
+    @raw_queue.setter
+    def raw_queue(self, value: collections.deque[HistoryEntry]):
+        if not isinstance(value, collections.deque):
+            raise TypeError("Queue value must be a collections.deque[HistoryEntry]")
+        if self._maxsize and len(value) > self._maxsize:
+            raise ValueError(f"Queue value cannot be longer than maxsize: {self._maxsize}")
+        self._queue = list(reversed(value))
+        self._record("replace", 0, len(value))
+
+    @raw_queue.deleter
+    def raw_queue(self) -> None:
+        self.clear()
+
+    def _position(self, index: int) -> int:
+        # Position 0 is the most recent entry, which is the last one of the list
+        if not -len(self._queue) <= index < len(self._queue):
+            raise IndexError("History index out of range")
+        return len(self._queue) - 1 - index if index >= 0 else -1 - index
+
+    def peek(self, index: int = 0) -> HistoryEntry | None:
+        """Return the entry at the given position without removing it or copying the history"""
+        try:
+            return self._queue[self._position(index)]
+        except IndexError:
+            return None
+
+    def get_range(self, start: int, stop: int) -> list[HistoryEntry]:
+        """Return the entries between the given positions without copying the rest of the history"""
+        size = len(self._queue)
+        start, stop = max(start, 0), min(stop, size)
+        if start >= stop:
+            return []
+        return self._queue[size - stop : size - start][::-1]
+
+    def popindex(self, index: int) -> HistoryEntry:
         with self._threading_lock:
-            if len(items) + self.qsize() > self.maxsize:
-                diff = len(items) + self.qsize() - self.maxsize
-                for _ in range(diff):
-                    self._queue.pop()
-                    self.raw_b64s.pop()
-            if index is not None:
-                for i in items:
-                    i.timestamp = 0
-                    if index < 0:
-                        self._queue.append(i)
-                        self.raw_b64s.append(i.encoded)
-                    else:
-                        self._queue.insert(index, i)
-                        self.raw_b64s.insert(index, i.encoded)
-                        index += 1
+            value = self._queue.pop(self._position(index))
+            self._record("remove", index if index >= 0 else len(self._queue) + 1 + index, 1)
+            return value
+
+    def index(self, value: HistoryEntry) -> int:
+        """Return first index of value"""
+        for index, entry in enumerate(reversed(self._queue)):
+            if entry is value or entry == value:
+                return index
+        raise ValueError(f"{value!r} is not in the history")
+
+    async def shuffle(self, mode: ShuffleMode = ShuffleMode.Random, count: int | None = None) -> None:
+        """Shuffle the history, the history is always shuffled at random"""
+        async with self._lock:
+            with self._threading_lock:
+                random.shuffle(self._queue)
+                self._record("reorder", 0, len(self._queue))
+
+    def __getitem__(self, key: int | slice) -> HistoryEntry | list[HistoryEntry]:
+        if isinstance(key, slice):
+            return list(self.raw_queue)[key]
+        return self._queue[self._position(key)]
+
+    def _put(self, items: list[HistoryEntry], index: int = None) -> None:
+        with self._threading_lock:
+            if self.maxsize and (diff := len(items) + self.qsize() - self.maxsize) > 0:
+                # The history is bounded, so dropping the oldest entries only ever moves a few hundred references
+                del self._queue[:diff]
+                self._record("remove", len(self._queue), diff)
+            if index is not None and index < 0:
+                position, start = 0, len(self._queue)
             else:
-                self._queue.extendleft(items)
-                for i, t in enumerate(items):
-                    t.timestamp = 0
-                    self.raw_b64s.insert(i, t.encoded)
+                start = min(index or 0, len(self._queue))
+                position = len(self._queue) - start
+            self._queue[position:position] = reversed(items)
+            self._record("add", start, len(items))
 
-    def _get(self, index: int = None) -> ANY_GENERIC_TYPE:
+    def _get(self, index: int = None) -> HistoryEntry:
         if index is not None:
-            r = self.popindex(index)
-            self.raw_b64s.pop(index)
-        else:
-            with self._threading_lock:
-                r = self._queue.popleft()
-                self.raw_b64s.pop()
-        return r
+            return self.popindex(index)
+        with self._threading_lock:
+            entry = self._queue.pop()
+            self._record("remove", 0, 1)
+        return entry
 
-    def put_nowait(self, items: list[ANY_GENERIC_TYPE], index: int = None) -> None:
+    async def put(self, items: list[Track | HistoryEntry], index: int = None, discard: bool = False) -> None:
+        """Put tracks into the history, the first one becomes the most recent entry"""
+        entries = [item if isinstance(item, HistoryEntry) else await HistoryEntry.from_track(item) for item in items]
+        return await super().put(entries, index=index, discard=discard)
+
+    def put_nowait(self, items: list[HistoryEntry], index: int = None) -> None:
         """Put an item into the queue without blocking.
 
         If no free slot is immediately available, raise QueueFull.
@@ -397,7 +684,7 @@ class TrackHistoryQueue(PlayerQueue[ANY_GENERIC_TYPE], ABC):
         self._finished.clear()
         self._wakeup_next(self._getters)
 
-    def get_nowait(self, index: int = None) -> ANY_GENERIC_TYPE | None:
+    def get_nowait(self, index: int = None) -> HistoryEntry | None:
         """Remove and return an item from the queue.
 
         Return an item if one is immediately available, else raise QueueEmpty.
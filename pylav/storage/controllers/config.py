@@ -63,8 +63,20 @@ class ConfigController:
         await QueryRow.create_table(if_not_exists=True)
         await BotVersionRow.create_table(if_not_exists=True)
         await AioHttpCacheRow.create_table(if_not_exists=True)
+        await AioHttpCacheRow.raw(
+            f"CREATE INDEX IF NOT EXISTS aiohttp_client_cache_expires_at "
+            f"ON {AioHttpCacheRow._meta.tablename} (expires_at)"
+        )
+        await AioHttpCacheRow.raw(
+            f"CREATE INDEX IF NOT EXISTS aiohttp_client_cache_last_accessed "
+            f"ON {AioHttpCacheRow._meta.tablename} (last_accessed)"
+        )
         await TrackRow.create_table(if_not_exists=True)
         await TrackToPlaylists.create_table(if_not_exists=True)
+        await TrackToPlaylists.raw(
+            f"CREATE INDEX IF NOT EXISTS track_to_playlists_playlist_position "
+            f"ON {TrackToPlaylists._meta.tablename} (playlists, position, id)"
+        )
         await TrackToQueries.create_table(if_not_exists=True)
         await Sessions.create_table(if_not_exists=True)
         await Sessions.raw(
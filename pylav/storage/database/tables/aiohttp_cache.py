@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from piccolo.columns import Bytea, Text
+from piccolo.columns import Bytea, Integer, Text, Timestamptz
+from piccolo.columns.defaults.timestamptz import TimestamptzNow
 from piccolo.table import Table
 
 from pylav.storage.database.tables.misc import DATABASE_ENGINE
@@ -9,3 +10,6 @@ from pylav.storage.database.tables.misc import DATABASE_ENGINE
 class AioHttpCacheRow(Table, db=DATABASE_ENGINE, tablename="aiohttp_client_cache"):
     key = Text(primary_key=True, index=True)
     value = Bytea()
+    expires_at = Timestamptz(null=True, default=None, index=True)
+    last_accessed = Timestamptz(null=False, default=TimestamptzNow(), index=True)
+    size = Integer(null=False, default=0)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from piccolo.columns import ForeignKey
+from piccolo.columns import BigInt, ForeignKey
 from piccolo.table import Table
 
 from pylav.storage.database.tables.misc import DATABASE_ENGINE
@@ -17,3 +17,4 @@ class TrackToQueries(Table, db=DATABASE_ENGINE):
 class TrackToPlaylists(Table, db=DATABASE_ENGINE):
     playlists = ForeignKey(PlaylistRow)
     tracks = ForeignKey(TrackRow)
+    position = BigInt(null=False, default=0)
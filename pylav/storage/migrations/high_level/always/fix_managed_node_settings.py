@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from deepdiff import DeepDiff
-
 from pylav.constants.node import NODE_DEFAULT_SETTINGS
 from pylav.storage.migrations.logging import LOGGER
 
@@ -13,6 +11,8 @@ if TYPE_CHECKING:
 
 async def fix_managed_node_settings(client: Client) -> None:
     """Fix the managed node settings."""
+    from deepdiff import DeepDiff  # type: ignore
+
     LOGGER.info("Running migration - Fixing Managed Node Settings")
     # noinspection PyProtectedMember
     config = client._node_config_manager.bundled_node_config()
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from deepdiff import DeepDiff
 from yarl import URL
 
 from pylav.compat import json
@@ -15,6 +14,8 @@ if TYPE_CHECKING:
 
 async def update_plugins(client: Client) -> None:
     """Update the plugins in the database."""
+    from deepdiff import DeepDiff  # type: ignore
+
     try:
         LOGGER.info("Attempting to update plugins")
         # noinspection PyProtectedMember
@@ -15,6 +15,7 @@ from pylav.constants.versions import VERSION_1_0_0
 from pylav.nodes.api.responses.track import Track
 from pylav.players.tracks.decoder import decode_track
 from pylav.storage.database.tables.config import LibConfigRow
+from pylav.storage.database.tables.m2m import TrackToPlaylists
 from pylav.storage.database.tables.nodes import NodeRow
 from pylav.storage.database.tables.players import PlayerRow
 from pylav.storage.database.tables.playlists import PlaylistRow
@@ -156,7 +157,12 @@ async def migrate_playlists_v_1_0_0(playlists: list[asyncpg.Record]) -> None:
                 for track_object in entry_list:
                     new_tracks.append(await TrackRow.get_or_create(track_object))
         if new_tracks:
-            await playlist_row.add_m2m(*new_tracks, m2m=PlaylistRow.tracks)
+            await TrackToPlaylists.insert(
+                *(
+                    TrackToPlaylists(playlists=playlist_row.id, tracks=track_row.encoded, position=position)
+                    for position, track_row in enumerate(new_tracks)
+                )
+            )
 
 
 async def migrate_queries_v_1_0_0(queries: list[asyncpg.Record]) -> None:
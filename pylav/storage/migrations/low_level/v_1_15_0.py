@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from asyncpg import Connection
+
+from pylav.storage.migrations.logging import LOGGER
+
+
+async def low_level_v_1_15_0_migration(con: Connection) -> None:
+    """Run the low level migration for PyLav 1.15.0."""
+    await low_level_v_1_15_0_playlists(con)
+    await low_level_v_1_15_0_aiohttp_cache(con)
+
+
+async def low_level_v_1_15_0_playlists(con: Connection) -> None:
+    """Run the playlists migration for PyLav 1.15.0."""
+    await run_playlist_tracks_migration_v_1_15_0(con)
+
+
+async def low_level_v_1_15_0_aiohttp_cache(con: Connection) -> None:
+    """Run the HTTP response cache migration for PyLav 1.15.0."""
+    await run_aiohttp_cache_migration_v_1_15_0(con)
+
+
+async def run_playlist_tracks_migration_v_1_15_0(con: Connection) -> None:
+    """
+    Add the position column to the playlist tracks table and backfill it using the current insertion order.
+    """
+    has_column = """
+        SELECT EXISTS (SELECT 1
+        FROM information_schema.columns
+        WHERE table_name='version' AND column_name='version')
+        """
+    has_version_column = await con.fetchval(has_column)
+    if not has_version_column:
+        return
+
+    version = await con.fetchval("SELECT version from version;")
+    if version is None:
+        return
+
+    has_column = """
+            SELECT EXISTS (SELECT 1
+            FROM information_schema.columns
+            WHERE table_name='track_to_playlists' AND column_name='position')
+            """
+    has_column_response = await con.fetchval(has_column)
+    if not has_column_response:
+        LOGGER.info("----------- Migrating Playlist tracks to PyLav 1.15.0 ---------")
+        alter_table = """
+        ALTER TABLE IF EXISTS track_to_playlists
+        ADD COLUMN IF NOT EXISTS "position" bigint NOT NULL DEFAULT 0
+        """
+        await con.execute(alter_table)
+        backfill = """
+        UPDATE track_to_playlists AS t
+        SET "position" = o.rn
+        FROM (
+            SELECT id, row_number() OVER (PARTITION BY playlists ORDER BY id) - 1 AS rn
+            FROM track_to_playlists
+        ) AS o
+        WHERE t.id = o.id
+        """
+        await con.execute(backfill)
+
+
+async def run_aiohttp_cache_migration_v_1_15_0(con: Connection) -> None:
+    """
+    Add the expiry, last access and size columns to the HTTP response cache table.
+    """
+    has_column = """
+        SELECT EXISTS (SELECT 1
+        FROM information_schema.columns
+        WHERE table_name='version' AND column_name='version')
+        """
+    has_version_column = await con.fetchval(has_column)
+    if not has_version_column:
+        return
+
+    version = await con.fetchval("SELECT version from version;")
+    if version is None:
+        return
+
+    has_column = """
+            SELECT EXISTS (SELECT 1
+            FROM information_schema.columns
+            WHERE table_name='aiohttp_client_cache' AND column_name='expires_at')
+            """
+    has_column_response = await con.fetchval(has_column)
+    if not has_column_response:
+        LOGGER.info("----------- Migrating HTTP response cache to PyLav 1.15.0 ---------")
+        alter_table = """
+        ALTER TABLE IF EXISTS aiohttp_client_cache
+        ADD COLUMN IF NOT EXISTS "expires_at" timestamptz DEFAULT NULL,
+        ADD COLUMN IF NOT EXISTS "last_accessed" timestamptz NOT NULL DEFAULT now(),
+        ADD COLUMN IF NOT EXISTS "size" integer NOT NULL DEFAULT 0
+        """
+        await con.execute(alter_table)
+        backfill = """
+        UPDATE aiohttp_client_cache
+        SET "size" = octet_length("value"), "expires_at" = now() + interval '1 day'
+        """
+        await con.execute(backfill)
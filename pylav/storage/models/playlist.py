@@ -7,7 +7,7 @@ import pathlib
 import random
 import sys
 from collections import defaultdict
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Iterator
 from dataclasses import dataclass
 
 import aiohttp
@@ -15,9 +15,10 @@ import brotli  # type: ignore
 import discord
 import yaml
 from dacite import from_dict
+from piccolo.columns import Column
 
 from pylav.compat import json
-from pylav.constants.config import BROTLI_ENABLED, READ_CACHING_ENABLED
+from pylav.constants.config import BROTLI_ENABLED
 from pylav.constants.playlists import BUNDLED_PLAYLIST_IDS
 from pylav.constants.regex import SQUARE_BRACKETS
 from pylav.core.context import PyLavContext
@@ -27,6 +28,8 @@ from pylav.logging import getLogger
 from pylav.nodes.api.responses.track import Track
 from pylav.storage.database.cache.decodators import maybe_cached
 from pylav.storage.database.cache.model import CachedModel
+from pylav.storage.database.tables.m2m import TrackToPlaylists
+from pylav.storage.database.tables.misc import DATABASE_ENGINE, IS_POSTGRES
 from pylav.storage.database.tables.playlists import PlaylistRow
 from pylav.storage.database.tables.tracks import TrackRow
 from pylav.type_hints.bot import DISCORD_BOT_TYPE
@@ -78,7 +81,6 @@ class Playlist(CachedModel, metaclass=SingletonCachedByKey):
             await PlaylistRow.select(
                 PlaylistRow.id,
                 PlaylistRow.name,
-                PlaylistRow.tracks(TrackRow.encoded, TrackRow.info, TrackRow.pluginInfo, load_json=True),
                 PlaylistRow.scope,
                 PlaylistRow.author,
                 PlaylistRow.url,
@@ -87,6 +89,15 @@ class Playlist(CachedModel, metaclass=SingletonCachedByKey):
             .first()
             .output(load_json=True, nested=True)
         )
+        if data:
+            data = {
+                "id": data["id"],
+                "name": data["name"],
+                "tracks": await self.fetch_tracks(),
+                "scope": data["scope"],
+                "author": data["author"],
+                "url": data["url"],
+            }
         return data or {
             "id": self.id,
             "name": PlaylistRow.name.default,
@@ -220,25 +231,184 @@ class Playlist(CachedModel, metaclass=SingletonCachedByKey):
         await self.update_cache((self.fetch_url, url), (self.exists, True))
         await self.invalidate_cache(self.fetch_all)
 
+    @staticmethod
+    def _track_columns() -> tuple[Column, ...]:
+        return (
+            TrackToPlaylists.tracks.encoded.as_alias("encoded"),
+            TrackToPlaylists.tracks.info.as_alias("info"),
+            TrackToPlaylists.tracks.pluginInfo.as_alias("pluginInfo"),
+        )
+
+    async def _resolve_track_rows(self, tracks: list[str | JSON_DICT_TYPE | Track]) -> list[TrackRow]:
+        new_tracks = []
+        # TODO: Optimize this, after https://github.com/piccolo-orm/piccolo/discussions/683 is answered or fixed
+        _temp = defaultdict(list)
+        for x in tracks:
+            _temp[type(x)].append(x)
+        for entry_type, entry_list in _temp.items():
+            if entry_type == str:
+                for track_object in await self.client.decode_tracks(entry_list, raise_on_failure=False):
+                    new_tracks.append(await TrackRow.get_or_create(track_object))
+            elif entry_type == dict:
+                for track_object in entry_list:
+                    new_tracks.append(await TrackRow.get_or_create(from_dict(data_class=Track, data=track_object)))
+            else:
+                for track_object in entry_list:
+                    new_tracks.append(await TrackRow.get_or_create(track_object))
+        return new_tracks
+
+    async def _insert_track_rows(self, track_rows: list[TrackRow], start: int) -> None:
+        if not track_rows:
+            return
+        await TrackToPlaylists.insert(
+            *(
+                TrackToPlaylists(playlists=self.id, tracks=track_row.encoded, position=position)
+                for position, track_row in enumerate(track_rows, start=start)
+            )
+        )
+
+    async def _next_position(self) -> int:
+        response = (
+            await TrackToPlaylists.select(TrackToPlaylists.position)
+            .where(TrackToPlaylists.playlists == self.id)
+            .order_by(TrackToPlaylists.position, ascending=False)
+            .first()
+        )
+        return response["position"] + 1 if response else 0
+
+    async def _position_at(self, index: int) -> JSON_DICT_TYPE | None:
+        return (
+            await TrackToPlaylists.select(TrackToPlaylists.id, TrackToPlaylists.position)
+            .where(TrackToPlaylists.playlists == self.id)
+            .order_by(TrackToPlaylists.position, TrackToPlaylists.id)
+            .offset(index)
+            .first()
+        )
+
+    async def _compact_positions(self) -> None:
+        """Renumber the positions of the tracks in the playlist so that they match their index."""
+        await TrackToPlaylists.raw(
+            f"UPDATE {TrackToPlaylists._meta.tablename} AS t "
+            'SET "position" = o.rn '
+            'FROM (SELECT id, row_number() OVER (ORDER BY "position", id) - 1 AS rn '
+            f"FROM {TrackToPlaylists._meta.tablename} WHERE playlists = {{}}) AS o "
+            'WHERE t.id = o.id AND t."position" != o.rn',
+            self.id,
+        )
+
+    @contextlib.asynccontextmanager
+    async def _lock_tracks(self) -> AsyncIterator[None]:
+        """Run the enclosed queries in a single transaction which holds a lock on the playlist row.
+
+        Changes which read positions and then write them would otherwise interleave with each other.
+        """
+        async with DATABASE_ENGINE.transaction():
+            if IS_POSTGRES:
+                await PlaylistRow.raw(
+                    f"SELECT id FROM {PlaylistRow._meta.tablename} WHERE id = {{}} FOR UPDATE", self.id
+                )
+            yield
+
+    async def _invalidate_tracks_cache(self) -> None:
+        await self.invalidate_cache(self.fetch_tracks, self.fetch_all, self.size, self.fetch_first, self.exists)
+
     @maybe_cached
     async def fetch_tracks(self) -> list[str | JSON_DICT_TYPE]:
         """Fetch the tracks of the playlist.
 
+        This loads every track in the playlist, use :meth:`fetch_page`, :meth:`fetch_page_after`
+        or :meth:`aiter_tracks` for large playlists.
+
         Returns
         -------
         list[str]
             The tracks of the playlist.
         """
-        response = (
-            await PlaylistRow.select(
-                PlaylistRow.tracks(TrackRow.encoded, TrackRow.info, TrackRow.pluginInfo, load_json=True)
-            )
-            .where(PlaylistRow.id == self.id)
-            .first()
-            .output(load_json=True, nested=True)
+        return (
+            await TrackToPlaylists.select(*self._track_columns())
+            .where(TrackToPlaylists.playlists == self.id)
+            .order_by(TrackToPlaylists.position, TrackToPlaylists.id)
+            .output(load_json=True)
         )
-        data = response["tracks"] if response else []
-        return data
+
+    async def fetch_page(self, offset: int = 0, limit: int = 100) -> list[JSON_DICT_TYPE]:
+        """Fetch a page of tracks of the playlist.
+
+        Parameters
+        ----------
+        offset : int
+            The index of the first track to fetch.
+        limit : int
+            The maximum number of tracks to fetch.
+
+        Returns
+        -------
+        list[dict]
+            The tracks in the page.
+        """
+        return (
+            await TrackToPlaylists.select(*self._track_columns())
+            .where(TrackToPlaylists.playlists == self.id)
+            .order_by(TrackToPlaylists.position, TrackToPlaylists.id)
+            .offset(offset)
+            .limit(limit)
+            .output(load_json=True)
+        )
+
+    async def fetch_page_after(
+        self, cursor: tuple[int, int] | None = None, limit: int = 100
+    ) -> tuple[list[JSON_DICT_TYPE], tuple[int, int] | None]:
+        """Fetch a page of tracks of the playlist using a keyset cursor.
+
+        Unlike :meth:`fetch_page` the cost of fetching a page does not grow with how deep into the playlist it is.
+
+        Parameters
+        ----------
+        cursor : tuple[int, int] | None
+            The cursor returned by the previous call, or ``None`` to start from the beginning.
+        limit : int
+            The maximum number of tracks to fetch.
+
+        Returns
+        -------
+        tuple[list[dict], tuple[int, int] | None]
+            The tracks in the page and the cursor for the next page, the cursor is ``None`` once the end is reached.
+        """
+        query = TrackToPlaylists.select(TrackToPlaylists.id, TrackToPlaylists.position, *self._track_columns()).where(
+            TrackToPlaylists.playlists == self.id
+        )
+        if cursor is not None:
+            position, row_id = cursor
+            query = query.where(
+                (TrackToPlaylists.position > position)
+                | ((TrackToPlaylists.position == position) & (TrackToPlaylists.id > row_id))
+            )
+        rows = await query.order_by(TrackToPlaylists.position, TrackToPlaylists.id).limit(limit).output(load_json=True)
+        next_cursor = (rows[-1]["position"], rows[-1]["id"]) if len(rows) == limit else None
+        for row in rows:
+            del row["id"], row["position"]
+        return rows, next_cursor
+
+    async def aiter_tracks(self, batch_size: int = 500) -> AsyncIterator[JSON_DICT_TYPE]:
+        """Iterate over the tracks of the playlist in order, fetching them in batches.
+
+        Parameters
+        ----------
+        batch_size : int
+            The number of tracks to fetch per query.
+
+        Yields
+        ------
+        dict
+            The tracks of the playlist.
+        """
+        cursor = None
+        while True:
+            tracks, cursor = await self.fetch_page_after(cursor=cursor, limit=batch_size)
+            for track in tracks:
+                yield track
+            if cursor is None:
+                return
 
     async def update_tracks(self, tracks: list[str | JSON_DICT_TYPE | Track]) -> None:
         """Update the tracks of the playlist.
@@ -248,36 +418,15 @@ class Playlist(CachedModel, metaclass=SingletonCachedByKey):
         tracks : list[str]
             The new tracks of the playlist.
         """
-        playlist_row = await PlaylistRow.objects().get_or_create(PlaylistRow.id == self.id)
-        try:
-            old_tracks = await playlist_row.get_m2m(PlaylistRow.tracks)
-        except ValueError:
-            old_tracks = []
-        new_tracks = []
-        # TODO: Optimize this, after https://github.com/piccolo-orm/piccolo/discussions/683 is answered or fixed
-        _temp = defaultdict(list)
-        for x in tracks:
-            _temp[type(x)].append(x)
-        for entry_type, entry_list in _temp.items():
-            if entry_type == str:
-                for track_object in await self.client.decode_tracks(entry_list, raise_on_failure=False):
-                    new_tracks.append(await TrackRow.get_or_create(track_object))
-            elif entry_type == dict:
-                for track_object in entry_list:
-                    new_tracks.append(await TrackRow.get_or_create(from_dict(data_class=Track, data=track_object)))
-            else:
-                for track_object in entry_list:
-                    new_tracks.append(await TrackRow.get_or_create(track_object))
-
-        if old_tracks:
-            await playlist_row.remove_m2m(*old_tracks, m2m=PlaylistRow.tracks)
-        if new_tracks:
-            await playlist_row.add_m2m(*new_tracks, m2m=PlaylistRow.tracks)
+        await PlaylistRow.objects().get_or_create(PlaylistRow.id == self.id)
+        new_tracks = await self._resolve_track_rows(tracks)
+        await TrackToPlaylists.delete().where(TrackToPlaylists.playlists == self.id)
+        await self._insert_track_rows(new_tracks, start=0)
 
         await self.invalidate_cache(self.fetch_tracks, self.fetch_first)
         await self.update_cache(
             (self.exists, True),
-            (self.size, len(tracks)),
+            (self.size, len(new_tracks)),
         )
         await self.invalidate_cache(self.fetch_all)
 
@@ -290,8 +439,7 @@ class Playlist(CachedModel, metaclass=SingletonCachedByKey):
         int
             The number of tracks in the playlist.
         """
-        tracks = await self.fetch_tracks()
-        return len(tracks) if tracks else 0
+        return await TrackToPlaylists.count().where(TrackToPlaylists.playlists == self.id)
 
     async def add_track(self, tracks: list[str | Track | JSON_DICT_TYPE]) -> None:
         """Add a track to the playlist.
@@ -301,25 +449,66 @@ class Playlist(CachedModel, metaclass=SingletonCachedByKey):
         tracks : list[str | Track]
             The tracks to add.
         """
-        playlist_row = await PlaylistRow.objects().get_or_create(PlaylistRow.id == self.id)
-        new_tracks = []
-        # TODO: Optimize this, after https://github.com/piccolo-orm/piccolo/discussions/683 is answered or fixed
-        _temp = defaultdict(list)
-        for x in tracks:
-            _temp[type(x)].append(x)
-        for entry_type, entry_list in _temp.items():
-            if entry_type == str:
-                for track_object in await self.client.decode_tracks(entry_list, raise_on_failure=False):
-                    new_tracks.append(await TrackRow.get_or_create(track_object))
-            elif entry_type == dict:
-                for track_object in entry_list:
-                    new_tracks.append(await TrackRow.get_or_create(from_dict(data_class=Track, data=track_object)))
+        await PlaylistRow.objects().get_or_create(PlaylistRow.id == self.id)
+        new_tracks = await self._resolve_track_rows(tracks)
+        async with self._lock_tracks():
+            await self._insert_track_rows(new_tracks, start=await self._next_position())
+        await self._invalidate_tracks_cache()
+
+    async def insert_tracks(self, tracks: list[str | Track | JSON_DICT_TYPE], index: int) -> None:
+        """Insert tracks into the playlist at the given index.
+
+        Parameters
+        ----------
+        tracks : list[str | Track]
+            The tracks to insert.
+        index : int
+            The index to insert the tracks at, tracks are appended if it is past the end of the playlist.
+        """
+        await PlaylistRow.objects().get_or_create(PlaylistRow.id == self.id)
+        new_tracks = await self._resolve_track_rows(tracks)
+        if not new_tracks:
+            return
+        async with self._lock_tracks():
+            await self._compact_positions()
+            # The cached size may be stale while another change is waiting for the lock
+            start = min(max(index, 0), await TrackToPlaylists.count().where(TrackToPlaylists.playlists == self.id))
+            await TrackToPlaylists.update(
+                {TrackToPlaylists.position: TrackToPlaylists.position + len(new_tracks)}
+            ).where((TrackToPlaylists.playlists == self.id) & (TrackToPlaylists.position >= start))
+            await self._insert_track_rows(new_tracks, start=start)
+        await self._invalidate_tracks_cache()
+
+    async def move_track(self, from_index: int, to_index: int) -> None:
+        """Move a track in the playlist to a new index.
+
+        Parameters
+        ----------
+        from_index : int
+            The current index of the track.
+        to_index : int
+            The new index of the track.
+        """
+        async with self._lock_tracks():
+            await self._compact_positions()
+            size = await TrackToPlaylists.count().where(TrackToPlaylists.playlists == self.id)
+            if not (0 <= from_index < size) or from_index == (to_index := min(max(to_index, 0), size - 1)):
+                return
+            row = await self._position_at(from_index)
+            if from_index < to_index:
+                await TrackToPlaylists.update({TrackToPlaylists.position: TrackToPlaylists.position - 1}).where(
+                    (TrackToPlaylists.playlists == self.id)
+                    & (TrackToPlaylists.position > from_index)
+                    & (TrackToPlaylists.position <= to_index)
+                )
             else:
-                for track_object in entry_list:
-                    new_tracks.append(await TrackRow.get_or_create(track_object))
-        if new_tracks:
-            await playlist_row.add_m2m(*new_tracks, m2m=PlaylistRow.tracks)
-        await self.invalidate_cache(self.fetch_tracks, self.fetch_all, self.size, self.fetch_first, self.exists)
+                await TrackToPlaylists.update({TrackToPlaylists.position: TrackToPlaylists.position + 1}).where(
+                    (TrackToPlaylists.playlists == self.id)
+                    & (TrackToPlaylists.position >= to_index)
+                    & (TrackToPlaylists.position < from_index)
+                )
+            await TrackToPlaylists.update({TrackToPlaylists.position: to_index}).where(TrackToPlaylists.id == row["id"])
+        await self.invalidate_cache(self.fetch_tracks, self.fetch_all, self.fetch_first)
 
     async def bulk_remove_tracks(self, tracks: list[str]) -> None:
         """Remove disc jockey users from the player.
@@ -331,11 +520,11 @@ class Playlist(CachedModel, metaclass=SingletonCachedByKey):
         """
         if not tracks:
             return
-        playlist = await PlaylistRow.objects().where(PlaylistRow.id == self.id).first()
-        tracks = await TrackRow.objects().where(TrackRow.encoded.is_in(tracks))
-        if tracks:
-            await playlist.remove_m2m(*tracks, m2m=PlaylistRow.tracks)
-        await self.invalidate_cache(self.fetch_tracks, self.fetch_all, self.size, self.fetch_first, self.exists)
+        await TrackToPlaylists.delete().where(
+            (TrackToPlaylists.playlists == self.id) & (TrackToPlaylists.tracks.is_in(tracks))
+        )
+        await self._compact_positions()
+        await self._invalidate_tracks_cache()
 
     async def remove_track(self, track: str) -> None:
         """Remove a track from the playlist.
@@ -349,13 +538,7 @@ class Playlist(CachedModel, metaclass=SingletonCachedByKey):
 
     async def remove_all_tracks(self) -> None:
         """Remove all tracks from the playlist."""
-        playlist = await PlaylistRow.objects().where(PlaylistRow.id == self.id).first()
-        try:
-            tracks = await playlist.get_m2m(PlaylistRow.tracks)
-        except ValueError:
-            tracks = []
-        if tracks:
-            await playlist.remove_m2m(*tracks, m2m=PlaylistRow.tracks)
+        await TrackToPlaylists.delete().where(TrackToPlaylists.playlists == self.id)
         await self.update_cache((self.fetch_tracks, []), (self.size, 0), (self.exists, True), (self.fetch_first, None))
         await self.invalidate_cache(self.fetch_all)
 
@@ -526,29 +709,9 @@ class Playlist(CachedModel, metaclass=SingletonCachedByKey):
         # noinspection PyProtectedMember
         if not playlist_row._was_created:
             await PlaylistRow.update(defaults).where(PlaylistRow.id == self.id)
-        try:
-            old_tracks = await playlist_row.get_m2m(PlaylistRow.tracks)
-        except ValueError:
-            old_tracks = []
-        new_tracks = []
-        # TODO: Optimize this, after https://github.com/piccolo-orm/piccolo/discussions/683 is answered or fixed
-        _temp = defaultdict(list)
-        for x in tracks:
-            _temp[type(x)].append(x)
-        for entry_type, entry_list in _temp.items():
-            if entry_type == str:
-                for track_object in await self.client.decode_tracks(entry_list, raise_on_failure=False):
-                    new_tracks.append(await TrackRow.get_or_create(track_object))
-            elif entry_type == dict:
-                for track_object in entry_list:
-                    new_tracks.append(await TrackRow.get_or_create(from_dict(data_class=Track, data=track_object)))
-            else:
-                for track_object in entry_list:
-                    new_tracks.append(await TrackRow.get_or_create(track_object))
-        if old_tracks:
-            await playlist_row.remove_m2m(*old_tracks, m2m=PlaylistRow.tracks)
-        if new_tracks:
-            await playlist_row.add_m2m(*new_tracks, m2m=PlaylistRow.tracks)
+        new_tracks = await self._resolve_track_rows(tracks)
+        await TrackToPlaylists.delete().where(TrackToPlaylists.playlists == self.id)
+        await self._insert_track_rows(new_tracks, start=0)
         await self.invalidate_cache()
 
     @classmethod
@@ -594,20 +757,43 @@ class Playlist(CachedModel, metaclass=SingletonCachedByKey):
         Parameters
         ----------
         index: int
-            The index of the track
+            The index of the track, negative indexes count from the end of the playlist
 
         Returns
         -------
         str
             The track at the index
         """
-        if READ_CACHING_ENABLED:
-            tracks = await self.fetch_tracks()
-            return tracks[index] if index < len(tracks) else None
-        else:
-            tracks = await self.fetch_tracks()
-            if tracks and len(tracks) > index:
-                return tracks[index]
+        if index < 0 and (index := index + await self.size()) < 0:
+            return None
+        tracks = await self.fetch_page(offset=index, limit=1)
+        return tracks[0] if tracks else None
+
+    async def fetch_position(self, position: int) -> JSON_DICT_TYPE | None:
+        """Get the track stored at a position.
+
+        Positions match indexes unless tracks were removed without the playlist being renumbered,
+        looking a position up is a single index lookup while an index has to skip every track before it.
+
+        Parameters
+        ----------
+        position: int
+            The position of the track
+
+        Returns
+        -------
+        dict
+            The track at the position, or at the index if no track has that position
+        """
+        if position < 0:
+            return None
+        track = (
+            await TrackToPlaylists.select(*self._track_columns())
+            .where((TrackToPlaylists.playlists == self.id) & (TrackToPlaylists.position == position))
+            .first()
+            .output(load_json=True)
+        )
+        return track if track is not None else await self.fetch_index(position)
 
     @maybe_cached
     async def fetch_first(self) -> JSON_DICT_TYPE | None:
@@ -628,5 +814,6 @@ class Playlist(CachedModel, metaclass=SingletonCachedByKey):
         str
             A random track
         """
-
-        return await self.fetch_index(random.randint(0, await self.size()))
+        if not (size := await self.size()):
+            return None
+        return await self.fetch_position(random.randrange(size))
@@ -1,12 +1,26 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import datetime
 from collections.abc import AsyncIterable
 from typing import Any
 
+import asyncpg
 from aiohttp_client_cache import BaseCache, CacheBackend, ResponseOrKey
 
+from pylav.helpers.time import get_now_utc
+from pylav.logging import getLogger
 from pylav.storage.database.tables.aiohttp_cache import AioHttpCacheRow
 
+LOGGER = getLogger("PyLav.Database.AioHttpCache")
+
+DEFAULT_MAX_ROWS = 50_000
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+ITERATION_BATCH_SIZE = 500
+# Eviction only needs a rough recency, so a hit only writes its access time back once it is this stale
+LAST_ACCESSED_RESOLUTION = datetime.timedelta(minutes=5)
+
 
 def postgres_template() -> None:
     pass
@@ -16,21 +30,46 @@ class PostgresCacheBackend(CacheBackend):
     """Wrapper for higher-level cache operations.
     In most cases, the only thing you need to specify here is which storage class(es) to use"""
 
-    def __init__(self, **kwargs: Any) -> None:
+    def __init__(self, max_rows: int = DEFAULT_MAX_ROWS, max_bytes: int = DEFAULT_MAX_BYTES, **kwargs: Any) -> None:
         super().__init__(**kwargs)
-        self.redirects = PostgresStorage(**kwargs)
-        self.responses = PostgresStorage(**kwargs)
+        # Both storages share the same table, so the caps apply to the table as a whole
+        self.redirects = PostgresStorage(max_rows=max_rows, max_bytes=max_bytes, **kwargs)
+        self.responses = PostgresStorage(max_rows=max_rows, max_bytes=max_bytes, **kwargs)
+
+    async def sweep(self) -> None:
+        """Delete expired entries and evict the least recently used entries over the row and byte caps"""
+        await self.responses.sweep()
 
 
 class PostgresStorage(BaseCache):
     """interface for lower-level backend storage operations"""
 
-    def __init__(self, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        max_rows: int = DEFAULT_MAX_ROWS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        expire_after: datetime.timedelta | int | None = None,
+        **kwargs: Any,
+    ) -> None:
         super().__init__(**kwargs)
+        self._max_rows = max_rows
+        self._max_bytes = max_bytes
+        if isinstance(expire_after, (int, float)):
+            expire_after = datetime.timedelta(seconds=expire_after) if expire_after >= 0 else None
+        self._default_expire_after: datetime.timedelta | None = expire_after
+
+    def _get_expiry(self, item: ResponseOrKey) -> datetime.datetime | None:
+        if (expires := getattr(item, "expires", None)) is not None:
+            return expires if expires.tzinfo else expires.replace(tzinfo=datetime.UTC)
+        return get_now_utc() + self._default_expire_after if self._default_expire_after else None
+
+    @staticmethod
+    def _not_expired():
+        return AioHttpCacheRow.expires_at.is_null() | (AioHttpCacheRow.expires_at > get_now_utc())
 
     async def contains(self, key: str) -> bool:
         """Check if a key is stored in the cache"""
-        return await AioHttpCacheRow.exists().where(AioHttpCacheRow.key == key)
+        return await AioHttpCacheRow.exists().where((AioHttpCacheRow.key == key) & self._not_expired())
 
     async def clear(self) -> None:
         """Delete all items from the cache"""
@@ -40,20 +79,43 @@ class PostgresStorage(BaseCache):
         """Delete an item from the cache"""
         await AioHttpCacheRow.delete().where(AioHttpCacheRow.key == key)
 
+    async def _iterate(self, *columns) -> AsyncIterable[dict[str, Any]]:
+        """Iterate over the non-expired entries in key order, fetching them in batches"""
+        last_key = None
+        while True:
+            query = AioHttpCacheRow.select(AioHttpCacheRow.key, *columns).where(self._not_expired())
+            if last_key is not None:
+                query = query.where(AioHttpCacheRow.key > last_key)
+            entries = (
+                await query.order_by(AioHttpCacheRow.key)
+                .limit(ITERATION_BATCH_SIZE)
+                .output(load_json=True, nested=True)
+            )
+            for entry in entries:
+                yield entry
+            if len(entries) < ITERATION_BATCH_SIZE:
+                return
+            last_key = entries[-1]["key"]
+
     async def keys(self) -> AsyncIterable[str]:
         """Get all keys stored in the cache"""
-        for entry in await AioHttpCacheRow.select(AioHttpCacheRow.key).output(load_json=True, nested=True):
+        async for entry in self._iterate():
             yield entry["key"]
 
     async def read(self, key: str) -> ResponseOrKey:
         """Read an item from the cache"""
-        response = (
-            await AioHttpCacheRow.select(AioHttpCacheRow.value)
-            .where(AioHttpCacheRow.key == key)
+        entry = (
+            await AioHttpCacheRow.select(AioHttpCacheRow.value, AioHttpCacheRow.last_accessed)
+            .where((AioHttpCacheRow.key == key) & self._not_expired())
             .first()
-            .output(load_json=True, nested=True)
         )
-        return self.deserialize(response["value"]) if response else None
+        if entry is None:
+            return None
+        if (now := get_now_utc()) - entry["last_accessed"] > LAST_ACCESSED_RESOLUTION:
+            await AioHttpCacheRow.update({AioHttpCacheRow.last_accessed: now}).where(
+                (AioHttpCacheRow.key == key) & (AioHttpCacheRow.last_accessed < now - LAST_ACCESSED_RESOLUTION)
+            )
+        return self.deserialize(entry["value"])
 
     async def size(self) -> int:
         """Get the number of items in the cache"""
@@ -64,15 +126,48 @@ class PostgresStorage(BaseCache):
         return self._values()
 
     async def _values(self) -> AsyncIterable[ResponseOrKey]:
-        for entry in await AioHttpCacheRow.select(AioHttpCacheRow.value).output(load_json=True, nested=True):
+        async for entry in self._iterate(AioHttpCacheRow.value):
             yield self.deserialize(entry["value"])
 
     async def write(self, key: str, item: ResponseOrKey) -> None:
         """Write an item to the cache"""
-        await AioHttpCacheRow.insert(AioHttpCacheRow(key=key, value=self.serialize(item))).on_conflict(
-            action="DO NOTHING", target=AioHttpCacheRow.key
+        value = self.serialize(item)
+        await AioHttpCacheRow.insert(
+            AioHttpCacheRow(
+                key=key,
+                value=value,
+                expires_at=self._get_expiry(item),
+                last_accessed=get_now_utc(),
+                size=len(value) if value else 0,
+            )
+        ).on_conflict(
+            action="DO UPDATE",
+            target=AioHttpCacheRow.key,
+            values=[
+                AioHttpCacheRow.value,
+                AioHttpCacheRow.expires_at,
+                AioHttpCacheRow.last_accessed,
+                AioHttpCacheRow.size,
+            ],
         )
 
     async def bulk_delete(self, keys: set[str]) -> None:
         """Delete multiple items from the cache"""
         await AioHttpCacheRow.delete().where(AioHttpCacheRow.key.is_in(list(keys)))
+
+    async def sweep(self) -> None:
+        """Delete expired entries and evict the least recently used entries over the row and byte caps"""
+        with contextlib.suppress(asyncio.exceptions.CancelledError, asyncpg.exceptions.CannotConnectNowError):
+            LOGGER.trace("Sweeping the HTTP response cache")
+            await AioHttpCacheRow.delete().where(AioHttpCacheRow.expires_at <= get_now_utc())
+            table = AioHttpCacheRow._meta.tablename
+            await AioHttpCacheRow.raw(
+                f"DELETE FROM {table} WHERE key IN ("
+                f"SELECT key FROM ("
+                f"SELECT key, row_number() OVER (ORDER BY last_accessed DESC, key) AS row_count, "
+                f"sum(size) OVER (ORDER BY last_accessed DESC, key) AS total_size FROM {table}"
+                f") AS ranked WHERE ranked.row_count > {{}} OR ranked.total_size > {{}})",
+                self._max_rows,
+                self._max_bytes,
+            )
+            LOGGER.trace("Swept the HTTP response cache")
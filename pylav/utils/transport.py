@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import collections
+import dataclasses
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+import aiohttp_client_cache
+
+from pylav.compat import json
+from pylav.constants.config import HTTP_DNS_CACHE_TTL, HTTP_KEEPALIVE_TIMEOUT, HTTP_POOL_LIMIT, HTTP_POOL_LIMIT_PER_HOST
+from pylav.constants.http import HTTP_DEFAULT_TIMEOUT, HTTP_ENDPOINT_TIMEOUTS
+
+
+@dataclasses.dataclass(slots=True)
+class HostStats:
+    """Connection usage for a single host"""
+
+    requests: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+    errors: int = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """The fraction of requests which were sent over an already open connection"""
+        total = self.connections_created + self.connections_reused
+        return self.connections_reused / total if total else 0.0
+
+
+class HTTPTransport:
+    """A connection pool shared by all of PyLav's HTTP clients.
+
+    Sessions created by the transport all use the same connector, so connections to a host are kept alive and
+    reused regardless of which component opened them, and DNS lookups are cached across all of them.
+    Closing a session doesn't close the pool, only :meth:`close` does.
+    """
+
+    __slots__ = ("_connector", "_trace_config", "_stats", "_dns_cache_hits", "_dns_cache_misses")
+
+    def __init__(
+        self,
+        *,
+        limit: int = HTTP_POOL_LIMIT,
+        limit_per_host: int = HTTP_POOL_LIMIT_PER_HOST,
+        keepalive_timeout: float = HTTP_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: int = HTTP_DNS_CACHE_TTL,
+    ) -> None:
+        self._connector = aiohttp.TCPConnector(
+            limit=limit,
+            limit_per_host=limit_per_host,
+            keepalive_timeout=keepalive_timeout,
+            ttl_dns_cache=dns_cache_ttl,
+            use_dns_cache=True,
+        )
+        self._stats: collections.defaultdict[str, HostStats] = collections.defaultdict(HostStats)
+        self._dns_cache_hits = 0
+        self._dns_cache_misses = 0
+        self._trace_config = aiohttp.TraceConfig()
+        self._trace_config.on_request_start.append(self._on_request_start)
+        self._trace_config.on_request_exception.append(self._on_request_exception)
+        self._trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        self._trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        self._trace_config.on_dns_cache_hit.append(self._on_dns_cache_hit)
+        self._trace_config.on_dns_cache_miss.append(self._on_dns_cache_miss)
+
+    @property
+    def connector(self) -> aiohttp.TCPConnector:
+        """The connector shared by all sessions"""
+        return self._connector
+
+    @property
+    def closed(self) -> bool:
+        """Whether the connection pool has been closed"""
+        return self._connector.closed
+
+    @staticmethod
+    def timeout_for(endpoint: str) -> aiohttp.ClientTimeout:
+        """The timeout to use for a Lavalink REST endpoint, given as its path without the API version"""
+        return HTTP_ENDPOINT_TIMEOUTS.get(endpoint.partition("/")[0], HTTP_DEFAULT_TIMEOUT)
+
+    def _session_kwargs(self, timeout: aiohttp.ClientTimeout | None, **kwargs: Any) -> dict[str, Any]:
+        return {
+            "connector": self._connector,
+            "connector_owner": False,
+            "timeout": timeout or HTTP_DEFAULT_TIMEOUT,
+            "json_serialize": json.dumps,
+            "trace_configs": [self._trace_config],
+            **kwargs,
+        }
+
+    def session(self, timeout: aiohttp.ClientTimeout | None = None, **kwargs: Any) -> aiohttp.ClientSession:
+        """Create a session which uses the shared connection pool.
+
+        Parameters
+        ----------
+        timeout: :class:`aiohttp.ClientTimeout`
+            The default timeout for requests made with this session.
+        **kwargs: Any
+            Any other arguments to pass to :class:`aiohttp.ClientSession`.
+        """
+        return aiohttp.ClientSession(**self._session_kwargs(timeout, **kwargs))
+
+    def cached_session(
+        self, cache: aiohttp_client_cache.CacheBackend, timeout: aiohttp.ClientTimeout | None = None, **kwargs: Any
+    ) -> aiohttp_client_cache.CachedSession:
+        """Create a caching session which uses the shared connection pool.
+
+        Parameters
+        ----------
+        cache: :class:`aiohttp_client_cache.CacheBackend`
+            The cache backend to use.
+        timeout: :class:`aiohttp.ClientTimeout`
+            The default timeout for requests made with this session.
+        **kwargs: Any
+            Any other arguments to pass to :class:`aiohttp_client_cache.CachedSession`.
+        """
+        return aiohttp_client_cache.CachedSession(**self._session_kwargs(timeout, cache=cache, **kwargs))
+
+    def stats(self) -> dict[str, Any]:
+        """Connection reuse and DNS cache statistics for the pool"""
+        return {
+            "hosts": {host: dataclasses.replace(stats) for host, stats in self._stats.items()},
+            "dns_cache_hits": self._dns_cache_hits,
+            "dns_cache_misses": self._dns_cache_misses,
+            "limit": self._connector.limit,
+            "limit_per_host": self._connector.limit_per_host,
+        }
+
+    async def close(self) -> None:
+        """Close the connection pool, all sessions using it will stop working"""
+        if not self._connector.closed:
+            await self._connector.close()
+
+    async def _on_request_start(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params: aiohttp.TraceRequestStartParams
+    ) -> None:
+        context.host = params.url.host
+        self._stats[context.host].requests += 1
+
+    async def _on_request_exception(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params: aiohttp.TraceRequestExceptionParams
+    ) -> None:
+        self._stats[params.url.host].errors += 1
+
+    async def _on_connection_create_end(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params: aiohttp.TraceConnectionCreateEndParams
+    ) -> None:
+        if host := getattr(context, "host", None):
+            self._stats[host].connections_created += 1
+
+    async def _on_connection_reuseconn(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params: aiohttp.TraceConnectionReuseconnParams
+    ) -> None:
+        if host := getattr(context, "host", None):
+            self._stats[host].connections_reused += 1
+
+    async def _on_dns_cache_hit(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params: aiohttp.TraceDnsCacheHitParams
+    ) -> None:
+        self._dns_cache_hits += 1
+
+    async def _on_dns_cache_miss(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params: aiohttp.TraceDnsCacheMissParams
+    ) -> None:
+        self._dns_cache_misses += 1
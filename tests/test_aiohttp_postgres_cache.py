@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import datetime
+import types
+
+from pylav.helpers.time import get_now_utc
+from pylav.utils.aiohttp_postgres_cache import PostgresStorage
+
+
+def test_default_expiry_applies_to_responses_without_one():
+    storage = PostgresStorage(expire_after=60)
+    before = get_now_utc()
+    expiry = storage._get_expiry(types.SimpleNamespace(expires=None))
+    assert before + datetime.timedelta(seconds=60) <= expiry <= get_now_utc() + datetime.timedelta(seconds=60)
+
+
+def test_negative_or_missing_expiry_never_expires():
+    assert PostgresStorage(expire_after=-1)._get_expiry(types.SimpleNamespace(expires=None)) is None
+    assert PostgresStorage()._get_expiry("redirect-key") is None
+
+
+def test_response_expiry_is_stored_in_utc():
+    storage = PostgresStorage(expire_after=datetime.timedelta(hours=1))
+    naive = datetime.datetime(2026, 10, 18, 12, 0)
+    assert storage._get_expiry(types.SimpleNamespace(expires=naive)) == naive.replace(tzinfo=datetime.UTC)
+    aware = datetime.datetime(2026, 10, 18, 12, 0, tzinfo=datetime.timezone(datetime.timedelta(hours=2)))
+    assert storage._get_expiry(types.SimpleNamespace(expires=aware)) is aware
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from pylav.extension.bundled_node import pool as pool_module
+from pylav.extension.bundled_node.pool import LocalNodePool
+
+
+class FakeNode:
+    def __init__(self, identifier: int, events: list[str]) -> None:
+        self.identifier = identifier
+        self.events = events
+
+    async def wait_until_drained(self, timeout: float | None = None) -> None:
+        self.events.append(f"drained {self.identifier}")
+
+
+class FakeNodeManager:
+    """Stands in for the node manager of the client, draining is instant"""
+
+    def __init__(self, events: list[str]) -> None:
+        self.events = events
+
+    async def drain_node(self, node: FakeNode, timeout: float) -> None:
+        self.events.append(f"drain {node.identifier}")
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.events: list[str] = []
+        self.node_manager = FakeNodeManager(self.events)
+
+
+class FakeLocalNodeManager:
+    """Stands in for a managed Lavalink process, it takes a little while to start and connect"""
+
+    def __init__(self, client: FakeClient, timeout: int | None, *, instance: int, command, pool) -> None:
+        self.events = client.events
+        self.instance = instance
+        self.node_id = 1000 + instance
+        self.pid = 0
+        # Like the real manager, a node is disabled until it is started
+        self.disabled = True
+        self.node: FakeNode | None = None
+        self.unmanaged = False
+        self._ready = asyncio.Event()
+
+    async def start(self, java_path: str) -> None:
+        self.events.append(f"start {self.instance}")
+        self.disabled = False
+        await asyncio.sleep(0.01)
+        self.pid = 0 if self.unmanaged else 4000 + self.instance
+        self.node = FakeNode(self.node_id, self.events)
+        self.events.append(f"ready {self.instance}")
+        self._ready.set()
+
+    async def restart(self, java_path: str = None) -> None:
+        self.events.append(f"restart {self.instance}")
+        await self.start(java_path)
+
+    async def wait_until_ready(self, timeout: float | None = None) -> None:
+        await self._ready.wait()
+
+    async def wait_until_connected(self, timeout: float | None = None) -> None:
+        await self._ready.wait()
+        self.events.append(f"connected {self.instance}")
+
+    async def shutdown(self) -> None:
+        self.events.append(f"shutdown {self.instance}")
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(pool_module, "LocalNodeManager", FakeLocalNodeManager)
+    return FakeClient()
+
+
+def test_secondaries_start_once_the_primary_is_ready(client):
+    async def run():
+        pool = LocalNodePool(client, size=3)
+        await pool.start("java")
+        await pool.wait_until_connected()
+        return pool
+
+    pool = asyncio.run(run())
+    events = client.events
+    assert events[:2] == ["start 0", "ready 0"]
+    assert {"start 1", "start 2", "connected 1", "connected 2"} <= set(events)
+    assert pool.pids == {4000, 4001, 4002}
+    assert pool.get_manager(1002) is pool.managers[2]
+    assert pool.get_manager(1) is None
+
+
+def test_secondaries_are_not_started_next_to_an_unmanaged_node(client):
+    async def run():
+        pool = LocalNodePool(client, size=3)
+        pool.primary.unmanaged = True
+        await pool.start("java")
+        await pool.wait_until_connected(timeout=1)
+        return pool
+
+    pool = asyncio.run(run())
+    assert [event for event in client.events if event.startswith("start")] == ["start 0"]
+    assert pool.pids == set()
+
+
+def test_rolling_restart_restarts_one_drained_node_at_a_time(client):
+    async def run():
+        pool = LocalNodePool(client, size=3)
+        await pool.start("java")
+        await pool.wait_until_connected()
+        pool.managers[1].disabled = True
+        client.events.clear()
+        await pool.rolling_restart(drain_timeout=1)
+
+    asyncio.run(run())
+    assert client.events == [
+        "drain 1000",
+        "drained 1000",
+        "restart 0",
+        "start 0",
+        "ready 0",
+        "connected 0",
+        "drain 1002",
+        "drained 1002",
+        "restart 2",
+        "start 2",
+        "ready 2",
+        "connected 2",
+    ]
+
+
+def test_shutdown_stops_the_primary_last(client):
+    async def run():
+        pool = LocalNodePool(client, size=3)
+        await pool.shutdown()
+
+    asyncio.run(run())
+    assert client.events == ["shutdown 2", "shutdown 1", "shutdown 0"]
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+import subprocess
+import sys
+
+from pylav.extension.bundled_node.telemetry import ProcessSample, ProcessTelemetry, TelemetryThresholds
+
+MB = 1024**2
+
+
+def make_telemetry(**thresholds) -> ProcessTelemetry:
+    limits = dict(
+        max_rss_mb=0,
+        max_rss_growth_mb_per_hour=0,
+        max_cpu_percent=0,
+        max_gc_pause_ms=0,
+        max_fd_ratio=0,
+        sustained_samples=3,
+    )
+    return ProcessTelemetry(TelemetryThresholds(**(limits | thresholds)), window=6)
+
+
+def add_samples(telemetry: ProcessTelemetry, *rss_mb: float, cpu_percent: float = 10.0, every: float = 60.0) -> None:
+    for rss in rss_mb:
+        telemetry._samples.append(
+            ProcessSample(
+                timestamp=len(telemetry._samples) * every,
+                rss=int(rss * MB),
+                cpu_percent=cpu_percent,
+                num_fds=10,
+                num_threads=20,
+            )
+        )
+
+
+def test_samples_a_stub_process():
+    # Any long running process will do in place of Lavalink
+    process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        telemetry = ProcessTelemetry()
+        telemetry.attach(process.pid)
+        sample = asyncio.run(telemetry.sample())
+        assert telemetry.pid == process.pid
+        assert sample is telemetry.latest
+        assert sample.rss > 0 and sample.num_threads >= 1
+    finally:
+        process.kill()
+        process.wait()
+    # The process is gone, so there is nothing left to sample
+    assert asyncio.run(telemetry.sample()) is None
+
+
+def test_memory_breach_must_be_sustained():
+    telemetry = make_telemetry(max_rss_mb=500)
+    add_samples(telemetry, 400, 600, 600)
+    assert telemetry.breaches() == []
+    add_samples(telemetry, 600)
+    assert telemetry.breaches() == ["resident memory above 500MB"]
+
+
+def test_memory_growth_is_only_judged_on_a_full_window():
+    telemetry = make_telemetry(max_rss_growth_mb_per_hour=100)
+    add_samples(telemetry, 100, 110, 120, 130, 140)
+    assert telemetry.breaches() == []
+    add_samples(telemetry, 150)
+    assert round(telemetry.rss_growth_mb_per_hour) == 600
+    assert telemetry.breaches() == ["resident memory growing by 600.0MB per hour"]
+
+
+def test_cpu_and_gc_pause_breaches():
+    telemetry = make_telemetry(max_cpu_percent=90, max_gc_pause_ms=500)
+    add_samples(telemetry, 100, 100, 100, cpu_percent=95.0)
+    telemetry.record_gc_pause(800)
+    assert telemetry.breaches() == ["CPU usage above 90%", "garbage collection pause of 800ms"]
+
+
+def test_reset_forgets_samples():
+    telemetry = make_telemetry(max_rss_mb=50)
+    add_samples(telemetry, 100, 100, 100)
+    telemetry.reset()
+    assert telemetry.latest is None
+    assert telemetry.breaches() == []
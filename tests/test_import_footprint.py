@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Only needed once a feature using them is first used, never when the client is imported
+DEFERRED_MODULES = ("rapidfuzz", "deepdiff", "mutagen", "pylav.constants.city_dump")
+
+# Reads the current RSS, as a new process inherits the peak RSS of the process which started it
+PROBE = """
+import json, resource, sys, time
+
+def rss():
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * resource.getpagesize()
+
+before = rss()
+start = time.perf_counter()
+import pylav.core.client
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "seconds": elapsed,
+    "rss": rss() - before,
+    "loaded": sorted(name for name in %r if name in sys.modules),
+}))
+"""
+
+
+def test_client_import_defers_heavy_modules():
+    pytest.importorskip("discord")
+    pytest.importorskip("aiohttp")
+    pytest.importorskip("resource")
+    if not os.path.exists("/proc/self/statm"):
+        pytest.skip("Reading the memory use needs /proc")
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE % (DEFERRED_MODULES,)], capture_output=True, text=True, check=True
+    )
+    footprint = json.loads(result.stdout.splitlines()[-1])
+    # Reported so the import time and memory can be compared between runs, e.g. with pytest -s
+    print(f"import pylav.core.client: {footprint['seconds']:.2f}s, {footprint['rss'] / 1024 / 1024:.1f}MB RSS growth")
+    assert footprint["loaded"] == []
+
+
+def test_city_coordinates_are_decoded_on_first_use():
+    from pylav.constants import coordinates
+
+    mapping = coordinates._RegionCoordinateMapping()
+    # Discord regions resolve without touching the packed city data
+    assert mapping["sydney"] == coordinates.DEFAULT_REGIONS_MAPPING["sydney"]
+    assert "loaded=False" in repr(mapping)
+    assert len(mapping) > 11_000
+    assert "loaded=True" in repr(mapping)
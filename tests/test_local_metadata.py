@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+
+import aiopath
+import pytest
+
+from pylav.constants.config import LOCAL_TRACK_ARTWORK_SIZE
+from pylav.constants.misc import LOCAL_TRACK_ARTWORK_MAX_ORIGINAL_SIZE
+from pylav.players.tracks import local_metadata
+from pylav.players.tracks.local_metadata import (
+    LocalTrackMetadata,
+    LocalTrackMetadataCache,
+    _prune_thumbnails,
+    make_thumbnail,
+)
+
+
+def write_thumbnail(directory, name: str, size: int, last_used: int):
+    path = directory / f"{name}.png"
+    path.write_bytes(b"\0" * size)
+    os.utime(path, (last_used, last_used))
+    return path
+
+
+def test_prune_deletes_least_recently_used_thumbnails(tmp_path):
+    for index, name in enumerate("abcd"):
+        write_thumbnail(tmp_path, name, 100, last_used=1_000 + index)
+    (tmp_path / "keep.tmp").write_bytes(b"\0" * 1_000)
+
+    assert _prune_thumbnails(tmp_path, 250) == 2
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["c.png", "d.png", "keep.tmp"]
+
+
+def test_prune_keeps_a_folder_under_the_limit(tmp_path):
+    write_thumbnail(tmp_path, "a", 100, last_used=1_000)
+    assert _prune_thumbnails(tmp_path, 100) == 0
+    assert _prune_thumbnails(tmp_path / "missing", 100) == 0
+
+
+def test_small_artwork_is_kept_as_is_without_pillow(monkeypatch):
+    # A None entry in sys.modules makes the import fail as if Pillow wasn't installed
+    monkeypatch.setitem(sys.modules, "PIL", None)
+    artwork = b"\xff\xd8\xff\xe0" + b"\0" * 1_000
+    assert make_thumbnail(artwork) == artwork
+
+
+def test_large_artwork_is_skipped_without_pillow(monkeypatch):
+    monkeypatch.setitem(sys.modules, "PIL", None)
+    assert make_thumbnail(b"\0" * (LOCAL_TRACK_ARTWORK_MAX_ORIGINAL_SIZE + 1)) is None
+
+
+def test_undecodable_artwork_is_kept_as_is():
+    pytest.importorskip("PIL")
+    assert make_thumbnail(b"not an image") == b"not an image"
+
+
+@pytest.mark.parametrize("size, stored", [(1_000, True), (LOCAL_TRACK_ARTWORK_MAX_ORIGINAL_SIZE + 1, False)])
+def test_cache_without_pillow(monkeypatch, tmp_path, size, stored):
+    monkeypatch.setitem(sys.modules, "PIL", None)
+    artwork = b"\xff" * size
+    monkeypatch.setattr(local_metadata, "extract_embedded_artwork", lambda metadata: artwork)
+    cache = LocalTrackMetadataCache(directory=aiopath.AsyncPath(tmp_path))
+    entry = LocalTrackMetadata(stamp=(0, 0), metadata=object(), artwork="digest")
+
+    thumbnail = asyncio.run(cache._load_thumbnail(entry))
+
+    if stored:
+        assert thumbnail == artwork
+        assert (tmp_path / f"digest-{LOCAL_TRACK_ARTWORK_SIZE}.png").read_bytes() == artwork
+    else:
+        assert thumbnail is None
+        # The file isn't looked at again until it changes
+        assert entry.artwork is None
+        assert list(tmp_path.iterdir()) == []
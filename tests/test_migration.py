@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import types
+
+from pylav.nodes.migration import PlayerMigrator
+
+
+class FakeNode:
+    """A Lavalink node which only reports a fixed penalty"""
+
+    def __init__(self, identifier: int, penalty: float = 0.0) -> None:
+        self.identifier = identifier
+        self.name = f"node-{identifier}"
+        self.penalty = penalty
+        self.active = 0
+        self.max_active = 0
+        self._logger = logging.getLogger("PyLav.Test")
+
+    async def penalty_with_region(self, region: str | None) -> float:
+        return self.penalty
+
+
+class FakePlayer:
+    """A player whose move to another node takes a little while, like the REST calls of a real move"""
+
+    def __init__(self, guild_id: int, *, playing: bool = False, fail: bool = False) -> None:
+        self.guild = types.SimpleNamespace(id=guild_id)
+        self.region = None
+        self.is_playing = playing
+        self.is_active = playing
+        self.is_connected = True
+        self.fail = fail
+        self.node: FakeNode | None = None
+        self.moves: list[int] = []
+
+    async def change_node(self, node: FakeNode, forced: bool = False) -> None:
+        node.active += 1
+        node.max_active = max(node.max_active, node.active)
+        try:
+            await asyncio.sleep(0.01)
+            if self.fail:
+                raise RuntimeError("Node refused the player")
+            self.node = node
+            self.moves.append(node.identifier)
+        finally:
+            node.active -= 1
+
+
+def test_playing_players_are_moved_first():
+    order = []
+
+    async def run():
+        players = [FakePlayer(i, playing=i % 4 == 0) for i in range(20)]
+        await PlayerMigrator(concurrency=1).migrate(players, [FakeNode(1)], on_moved=lambda p: order.append(p))
+
+    asyncio.run(run())
+    assert [p.is_playing for p in order] == [True] * 5 + [False] * 15
+
+
+def test_concurrency_is_bounded_per_target_node():
+    nodes = [FakeNode(1), FakeNode(2)]
+
+    async def run():
+        return await PlayerMigrator(concurrency=3).migrate([FakePlayer(i, playing=True) for i in range(30)], nodes)
+
+    report = asyncio.run(run())
+    assert report.moved == 30
+    assert all(node.max_active == 3 for node in nodes)
+
+
+def test_players_are_spread_by_penalty():
+    nodes = [FakeNode(1, penalty=0.0), FakeNode(2, penalty=5.0)]
+
+    async def run():
+        return await PlayerMigrator().migrate([FakePlayer(i, playing=True) for i in range(20)], nodes)
+
+    report = asyncio.run(run())
+    assert report.targets == {1: 13, 2: 7}
+
+
+def test_failed_players_are_reported():
+    players = [FakePlayer(1, playing=True), FakePlayer(2, fail=True), FakePlayer(3)]
+
+    async def run():
+        return await PlayerMigrator().migrate(players, [FakeNode(1)])
+
+    report = asyncio.run(run())
+    assert (report.moved, report.failed, report.pending) == (2, 1, 0)
+    assert report.failed_players == [players[1]]
+    assert report.finished
+    assert report.playing == 1 and report.max_downtime > 0
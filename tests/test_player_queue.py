@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import dataclasses
+
+import pytest
+
+from pylav.enums.queue import ShuffleMode
+from pylav.players.utils import PlayerQueue
+
+
+@dataclasses.dataclass(frozen=True)
+class Item:
+    """Stands in for a track, only the requester matters when shuffling"""
+
+    number: int
+    requester_id: int | None = None
+
+
+def shuffled(items: list[Item], mode: ShuffleMode, count: int | None = None) -> tuple[list[Item], PlayerQueue]:
+    async def run():
+        queue = PlayerQueue()
+        queue.raw_queue = collections.deque(items)
+        await queue.shuffle(mode, count)
+        return list(queue.raw_queue), queue
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("mode", [ShuffleMode.Random, ShuffleMode.RoundRobin])
+def test_shuffle_is_a_permutation(mode):
+    items = [Item(number, requester_id=number % 3) for number in range(50)]
+    result, queue = shuffled(items, mode)
+    assert sorted(result, key=lambda item: item.number) == items
+    change = queue.changes_since(queue.version - 1)[0]
+    assert (change.kind, change.start, change.count) == ("reorder", 0, 50)
+
+
+@pytest.mark.parametrize("count", [1, 3, 10])
+def test_new_tracks_keep_old_tracks_in_order(count):
+    items = [Item(number) for number in range(10)]
+    for __ in range(50):
+        result, queue = shuffled(items, ShuffleMode.NewTracks, count)
+        new = set(items[-count:])
+        assert [item for item in result if item not in new] == items[:-count]
+        assert set(result) - set(items[:-count]) == new
+        first_moved = min(index for index, item in enumerate(result) if item in new)
+        change = queue.changes_since(queue.version - 1)[0]
+        assert (change.kind, change.start, change.count) == ("reorder", first_moved, 10 - first_moved)
+
+
+def test_new_tracks_past_the_queue_length_moves_everything():
+    items = [Item(number) for number in range(5)]
+    result, queue = shuffled(items, ShuffleMode.NewTracks, 50)
+    assert sorted(result, key=lambda item: item.number) == items
+
+
+@pytest.mark.parametrize("count", [None, 0])
+def test_new_tracks_without_a_count_changes_nothing(count):
+    items = [Item(number) for number in range(5)]
+    result, queue = shuffled(items, ShuffleMode.NewTracks, count)
+    assert result == items
+    assert queue.changes_since(queue.version - 1)[0].kind == "replace"
+
+
+def test_round_robin_alternates_requesters():
+    items = [Item(number, requester_id=requester) for number, requester in enumerate("aaaabbc")]
+    for __ in range(20):
+        result, queue = shuffled(items, ShuffleMode.RoundRobin)
+        requesters = [item.requester_id for item in result]
+        # Every requester gets a turn each round, until they run out of tracks
+        rounds = [requesters[0:3], requesters[3:5], requesters[5:6], requesters[6:7]]
+        assert [sorted(round_) for round_ in rounds] == [["a", "b", "c"], ["a", "b"], ["a"], ["a"]]
+        # And the requesters take their turns in the same order every round
+        order = rounds[0]
+        assert all(round_ == [requester for requester in order if requester in round_] for round_ in rounds)
+
+
+def test_shuffling_an_empty_queue_records_nothing():
+    async def run():
+        queue = PlayerQueue()
+        await queue.shuffle(ShuffleMode.Random)
+        return queue.version
+
+    assert asyncio.run(run()) == 0
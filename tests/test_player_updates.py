@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+import types
+
+import pytest
+
+from pylav.exceptions.request import HTTPException
+from pylav.players.updates import PlayerUpdateCoalescer
+
+
+class FakeNode:
+    """Records the payloads PATCHed to the player and answers with the next queued response"""
+
+    def __init__(self) -> None:
+        self.identifier = 1
+        self.session_id = "session"
+        self.requests: list[dict] = []
+        self.responses: list = []
+
+    async def patch_session_player(self, guild_id: int, no_replace: bool, payload: dict):
+        self.requests.append(dict(payload))
+        response = self.responses.pop(0) if self.responses else object()
+        if isinstance(response, Exception) and not isinstance(response, HTTPException):
+            raise response
+        return response
+
+
+@pytest.fixture
+def node() -> FakeNode:
+    return FakeNode()
+
+
+@pytest.fixture
+def coalescer(node: FakeNode) -> PlayerUpdateCoalescer:
+    player = types.SimpleNamespace(node=node, guild=types.SimpleNamespace(id=1))
+    return PlayerUpdateCoalescer(player, window=0.01)
+
+
+def test_updates_within_the_window_are_merged(node, coalescer):
+    async def run():
+        return await asyncio.gather(
+            coalescer.update({"volume": 50}),
+            coalescer.update({"paused": True}),
+            coalescer.update({"volume": 80}),
+        )
+
+    responses = asyncio.run(run())
+    assert node.requests == [{"volume": 80, "paused": True}]
+    assert responses[0] is responses[1] is responses[2] is not None
+    assert coalescer.stats() == {
+        "requested": 3,
+        "sent": 1,
+        "avoided": 2,
+        "coalesced": 2,
+        "skipped": 0,
+        "fields_skipped": 0,
+    }
+
+
+def test_send_takes_pending_updates_with_it(node, coalescer):
+    async def run():
+        pending = asyncio.create_task(coalescer.update({"volume": 50}))
+        await asyncio.sleep(0)
+        response = await coalescer.send({"paused": True})
+        return response, await pending
+
+    response, pending_response = asyncio.run(run())
+    assert node.requests == [{"volume": 50, "paused": True}]
+    assert pending_response is response
+
+
+def test_a_new_track_drops_the_pending_seek(node, coalescer):
+    async def run():
+        pending = asyncio.create_task(coalescer.update({"position": 5_000, "volume": 50}))
+        await asyncio.sleep(0)
+        await coalescer.send({"encodedTrack": "track"}, no_replace=True)
+        await pending
+
+    asyncio.run(run())
+    assert node.requests == [{"volume": 50, "encodedTrack": "track"}]
+
+
+def test_unchanged_state_is_not_sent_again(node, coalescer):
+    state = {"volume": 100, "paused": False, "filters": {"timescale": {"speed": 1.2}}}
+
+    async def run():
+        await coalescer.send(dict(state))
+        skipped = await coalescer.send(dict(state))
+        await coalescer.send({"volume": 100, "position": 10_000})
+        return skipped
+
+    assert asyncio.run(run()) is None
+    assert node.requests == [state, {"position": 10_000}]
+    assert coalescer.skipped == 1
+    assert coalescer.fields_skipped == 4
+
+
+def test_rejected_state_is_not_acknowledged(node, coalescer):
+    node.responses = [HTTPException(None)]
+
+    async def run():
+        await coalescer.send({"volume": 100})
+        await coalescer.send({"volume": 100})
+
+    asyncio.run(run())
+    assert node.requests == [{"volume": 100}, {"volume": 100}]
+
+
+@pytest.mark.parametrize("change", ["session_id", "identifier", "reset"])
+def test_acknowledged_state_is_forgotten_for_a_new_node_or_session(node, coalescer, change):
+    async def run():
+        await coalescer.send({"volume": 100})
+        if change == "reset":
+            coalescer.reset()
+        else:
+            setattr(node, change, 2)
+        await coalescer.send({"volume": 100})
+        await coalescer.send({"volume": 100})
+
+    asyncio.run(run())
+    assert node.requests == [{"volume": 100}, {"volume": 100}]
+
+
+def test_errors_are_passed_to_every_waiter(node, coalescer):
+    node.responses = [RuntimeError("node went away"), RuntimeError("still gone")]
+
+    async def run():
+        merged = await asyncio.gather(
+            coalescer.update({"volume": 50}), coalescer.update({"paused": True}), return_exceptions=True
+        )
+        pending = asyncio.create_task(coalescer.update({"volume": 80}))
+        await asyncio.sleep(0)
+        with pytest.raises(RuntimeError, match="still gone"):
+            await coalescer.send({"paused": False})
+        with pytest.raises(RuntimeError, match="still gone"):
+            await pending
+        return merged
+
+    merged = asyncio.run(run())
+    assert [str(error) for error in merged] == ["node went away", "node went away"]
+    assert len(node.requests) == 2
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+
+from pylav.constants.radio import RADIO_CATALOGUE_VERSION
+from pylav.extension.radio.catalogue import StationCatalogue
+from pylav.extension.radio.objects import Station
+
+STATIONS = [
+    {
+        "stationuuid": "a",
+        "changeuuid": "change-a",
+        "name": "Radio Paradise Main Mix",
+        "tags": "eclectic,rock,world",
+        "country": "The United States Of America",
+        "countrycode": "US",
+        "state": "California",
+        "language": "english",
+        "codec": "AAC",
+        "votes": 200,
+    },
+    {
+        "stationuuid": "b",
+        "changeuuid": "change-b",
+        "name": "Radio Swiss Jazz",
+        "tags": "jazz,smooth jazz",
+        "country": "Switzerland",
+        "countrycode": "CH",
+        "language": "german,english",
+        "codec": "MP3",
+        "votes": 150,
+    },
+    {
+        "stationuuid": "c",
+        "changeuuid": "change-c",
+        "name": "Jazz Radio Blues",
+        "tags": "blues,jazz",
+        "country": "France",
+        "countrycode": "FR",
+        "language": "french",
+        "codec": "MP3",
+        "votes": 50,
+    },
+]
+
+
+def make_dump(stations: list[dict] = STATIONS) -> dict:
+    return {
+        "version": RADIO_CATALOGUE_VERSION,
+        "last_change_uuid": "change-c",
+        "last_full_sync": "2026-10-01T00:00:00+00:00",
+        "stations": stations,
+        "listings": {"tags": [{"name": "jazz", "stationcount": 2}], "codecs": [{"name": "MP3", "stationcount": 2}]},
+    }
+
+
+def names(stations) -> list[str]:
+    return [station.name for station in stations]
+
+
+class FakeRadioBrowser:
+    """Serves station changes the way the Radio Browser API does, change records only hold part of a station"""
+
+    def __init__(self, changes: list[dict], stations: list[dict]) -> None:
+        self.changes = changes
+        self.stations = {station["stationuuid"]: station for station in stations}
+        self.requested: list[list[str]] = []
+
+    async def stations_changed(self, last_change_uuid: str | None = None, limit: int | None = None):
+        index = next((i + 1 for i, c in enumerate(self.changes) if c["changeuuid"] == last_change_uuid), 0)
+        return [Station(radio_api_client=self, **change) for change in self.changes[index : index + limit]]
+
+    async def stations_by_uuids(self, stationuuids: list[str]):
+        self.requested.append(stationuuids)
+        return [Station(radio_api_client=self, **self.stations[u]) for u in stationuuids if u in self.stations]
+
+
+def test_from_dump_round_trips():
+    catalogue = StationCatalogue.from_dump(make_dump())
+    assert len(catalogue) == 3
+    assert catalogue.last_change_uuid == "change-c"
+    assert catalogue.last_full_sync == datetime.datetime(2026, 10, 1, tzinfo=datetime.UTC)
+    assert names(catalogue.get_listing("tags")) == ["jazz"]
+    assert catalogue.get_listing("countries") == []
+
+    copy = StationCatalogue.from_dump(catalogue.to_dump())
+    assert copy.to_dump() == catalogue.to_dump()
+    assert names(copy.search(name="swiss")) == ["Radio Swiss Jazz"]
+
+
+def test_from_dump_ignores_other_versions():
+    catalogue = StationCatalogue.from_dump(make_dump() | {"version": RADIO_CATALOGUE_VERSION + 1})
+    assert len(catalogue) == 0
+    assert catalogue.last_change_uuid is None
+
+
+def test_lookup_by_name():
+    catalogue = StationCatalogue.from_dump(make_dump())
+    # Both names contain the word, so votes decide
+    assert names(catalogue.search(name="jazz")) == ["Radio Swiss Jazz", "Jazz Radio Blues"]
+    # A prefix of the whole name ranks above the votes of the station
+    assert names(catalogue.search(name="jazz ra")) == ["Jazz Radio Blues", "Radio Swiss Jazz"]
+    assert names(catalogue.search(name="swis")) == ["Radio Swiss Jazz"]
+    assert names(catalogue.search(name="Radio Swiss Jazz", name_exact=True)) == ["Radio Swiss Jazz"]
+    assert names(catalogue.search(name="Radio Swiss", name_exact=True)) == []
+    # Typos still match through the trigram index
+    assert names(catalogue.search(name="paradsie")) == ["Radio Paradise Main Mix"]
+
+
+def test_lookup_by_filters():
+    catalogue = StationCatalogue.from_dump(make_dump())
+    assert names(catalogue.search(tag="jazz", tag_exact=True)) == ["Radio Swiss Jazz", "Jazz Radio Blues"]
+    assert names(catalogue.search(tag="jazz", countrycode="fr")) == ["Jazz Radio Blues"]
+    assert names(catalogue.search(tag_list="blues,jazz")) == ["Jazz Radio Blues"]
+    assert names(catalogue.search(language="english", codec="aac")) == ["Radio Paradise Main Mix"]
+    assert names(catalogue.search(state="california")) == ["Radio Paradise Main Mix"]
+    assert catalogue.search(name="jazz", countrycode="US") == []
+    assert names(catalogue.search(limit=2)) == ["Radio Paradise Main Mix", "Radio Swiss Jazz"]
+
+
+def test_incremental_sync_fetches_changed_stations_in_full():
+    catalogue = StationCatalogue.from_dump(make_dump())
+    renamed = STATIONS[1] | {"changeuuid": "change-d", "name": "Radio Swiss Classic", "tags": "classical"}
+    client = FakeRadioBrowser(
+        changes=[
+            {"changeuuid": "change-c", "stationuuid": "c"},
+            {"changeuuid": "change-d", "stationuuid": "b", "name": "Radio Swiss Classic"},
+            {"changeuuid": "change-e", "stationuuid": "c", "name": "Jazz Radio Blues"},
+        ],
+        # Station c is broken now, so the API doesn't return it anymore
+        stations=[STATIONS[0], renamed],
+    )
+
+    asyncio.run(catalogue._incremental_sync(client))
+
+    assert client.requested == [["b", "c"]]
+    assert catalogue.last_change_uuid == "change-e"
+    assert sorted(catalogue.stations) == ["a", "b"]
+    station = catalogue.stations["b"]
+    assert (station.name, station.votes, station.countrycode) == ("Radio Swiss Classic", 150, "CH")
+    assert names(catalogue.search(name="classic")) == ["Radio Swiss Classic"]
+    assert catalogue.search(tag="jazz", tag_exact=True) == []
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import gc
+import tracemalloc
+
+import pytest
+
+from pylav.helpers import singleton
+from pylav.helpers.singleton import SingletonCachedByKey, SingletonRegistry
+
+
+class Instance:
+    """A stand-in for a model instance, which can be weakly referenced"""
+
+    def __init__(self, key: int) -> None:
+        self.key = key
+
+
+class CachedModel(metaclass=SingletonCachedByKey):
+    __module__ = "pylav.storage.models.testing"
+
+    def __init__(self, *, id: int) -> None:  # noqa
+        self.id = id
+
+
+@pytest.fixture
+def bounded_model(monkeypatch):
+    monkeypatch.setitem(singleton._WEAK_SINGLETON_CACHE_SIZES, "CachedModel", 5)
+    SingletonCachedByKey._instances.pop("CachedModel", None)
+    yield CachedModel
+    SingletonCachedByKey._instances.pop("CachedModel", None)
+
+
+def test_registry_keeps_identity_of_live_instances():
+    registry = SingletonRegistry(max_size=3)
+    live = [Instance(i) for i in range(10)]
+    for instance in live:
+        registry.set(instance.key, instance)
+    gc.collect()
+    # Every instance is still referenced, so all of them are found even though only 3 are kept alive by the LRU
+    assert all(registry.get(instance.key) is instance for instance in live)
+
+
+def test_registry_drops_unused_instances():
+    registry = SingletonRegistry(max_size=3)
+    for i in range(1000):
+        registry.set(i, Instance(i))
+    gc.collect()
+    assert len(registry) == 3
+    assert [registry.get(i) is not None for i in (996, 997, 998, 999)] == [False, True, True, True]
+    assert registry.stats() == {"size": 3, "strong": 3, "max_size": 3, "hits": 3, "misses": 1}
+
+
+def test_registry_keeps_recently_used_instances_alive():
+    registry = SingletonRegistry(max_size=2)
+    for i in range(3):
+        registry.set(i, Instance(i))
+    registry.get(1)
+    registry.set(3, Instance(3))
+    gc.collect()
+    assert sorted(key for key in range(4) if key in registry) == [1, 3]
+
+
+def test_unbounded_registry_keeps_every_instance():
+    registry = SingletonRegistry()
+    for i in range(100):
+        registry.set(i, Instance(i))
+    gc.collect()
+    assert len(registry) == 100
+    assert registry.stats()["strong"] == 100
+
+
+def test_metaclass_returns_the_same_instance_per_key(bounded_model):
+    first = bounded_model(id=1)
+    assert bounded_model(id=1) is first
+    assert bounded_model(id=2) is not first
+
+
+def test_metaclass_memory_is_bounded(bounded_model):
+    kept = bounded_model(id=-1)
+    for i in range(1000):
+        bounded_model(id=i)
+    gc.collect()
+    stats = SingletonCachedByKey.cache_stats()["CachedModel"]
+    # The 5 most recent instances plus the one still referenced here
+    assert stats["size"] == 6
+    assert stats["strong"] == 5
+    assert bounded_model(id=-1) is kept
+
+    SingletonCachedByKey.clear_cache("CachedModel")
+    assert SingletonCachedByKey.cache_stats()["CachedModel"]["size"] == 0
+    assert bounded_model(id=-1) is not kept
+
+
+def test_metaclass_memory_stays_flat_over_a_million_queries(bounded_model):
+    def query(start: int, stop: int) -> None:
+        for i in range(start, stop):
+            # A few hot rows looked up over and over between rows which are only looked up once
+            bounded_model(id=i % 10 if i % 2 else i)
+
+    query(0, 100_000)
+    gc.collect()
+    objects = len(gc.get_objects())
+    query(100_000, 980_000)
+    gc.collect()
+    # Tracing every allocation is too slow for the whole run, so only the last stretch is traced
+    tracemalloc.start()
+    try:
+        query(980_000, 1_000_000)
+        gc.collect()
+        retained, __ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(gc.get_objects()) - objects < 100
+    assert retained < 16 * 1024
+    stats = SingletonCachedByKey.cache_stats()["CachedModel"]
+    assert stats["strong"] == 5
+    assert stats["size"] <= 15
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from pylav.players.stream_metadata import read_stream_titles
+
+METAINT = 16
+
+
+class FakeICYStream:
+    """Serves a fixed body the way :class:`aiohttp.StreamReader` does"""
+
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+        self._offset = 0
+
+    async def readexactly(self, n: int) -> bytes:
+        chunk = self._body[self._offset : self._offset + n]
+        self._offset += len(chunk)
+        if len(chunk) < n:
+            raise asyncio.IncompleteReadError(chunk, n)
+        return chunk
+
+
+def metadata_block(metadata: bytes) -> bytes:
+    padded = metadata + b"\0" * (-len(metadata) % 16)
+    return bytes([len(padded) // 16]) + padded
+
+
+def icy_body(*blocks: bytes) -> bytes:
+    return b"".join(b"\xff" * METAINT + block for block in blocks)
+
+
+async def collect(body: bytes) -> list[str | None]:
+    titles = []
+    with pytest.raises(asyncio.IncompleteReadError):
+        async for title in read_stream_titles(FakeICYStream(body), METAINT):
+            titles.append(title)
+    return titles
+
+
+def test_titles_are_read_between_audio_chunks():
+    body = icy_body(
+        metadata_block(b"StreamTitle='Artist - Song';StreamUrl='';"),
+        b"\0",
+        metadata_block(b"StreamTitle='Next Song';"),
+    )
+    assert asyncio.run(collect(body)) == ["Artist - Song", None, "Next Song"]
+
+
+def test_metadata_without_a_title_yields_none():
+    body = icy_body(metadata_block(b"StreamUrl='https://example.com';"))
+    assert asyncio.run(collect(body)) == [None]
+
+
+def test_titles_are_decoded_as_utf8():
+    body = icy_body(metadata_block("StreamTitle='Sigur Rós - Hoppípolla';".encode()))
+    assert asyncio.run(collect(body)) == ["Sigur Rós - Hoppípolla"]
+
+
+def test_audio_bytes_resembling_metadata_are_skipped():
+    audio = b"StreamTitle='x';"
+    body = audio + metadata_block(b"StreamTitle='Real';")
+    assert asyncio.run(collect(body)) == ["Real"]
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import types
+
+import pytest
+
+from pylav.players.tracks.decoder import decode_track
+from pylav.players.tracks.encoder import encode_track
+from pylav.players.tracks.obj import Track
+
+PAGE_SIZE = 25
+
+
+class DecodingClient:
+    """Decodes tracks without a node and answers searches with a preset result"""
+
+    def __init__(self) -> None:
+        self.bot = types.SimpleNamespace(user=types.SimpleNamespace(id=1))
+        # What searching for a track resolves to
+        self.search_result = None
+
+    async def decode_track(self, track: str, raise_on_failure: bool = False, lazy: bool = False):
+        return decode_track(track)
+
+    async def _get_tracks(self, query, first: bool = False, bypass_cache: bool = False):
+        return types.SimpleNamespace(loadType="track", data=self.search_result)
+
+
+@pytest.fixture(autouse=True)
+def client(monkeypatch) -> DecodingClient:
+    client = DecodingClient()
+    monkeypatch.setattr(Track, "_Track__CLIENT", client)
+    return client
+
+
+async def build_page() -> list[Track]:
+    return [
+        await Track.build_track(
+            node=None,
+            data=encode_track(
+                title=f"Song {number} [Official Video] with a title long enough to be cut off",
+                author=f"Artist {number}",
+                length=200_000,
+                identifier=f"id{number:09d}",
+                isStream=False,
+                uri=f"https://www.youtube.com/watch?v=id{number:09d}",
+                sourceName="youtube",
+            ),
+            query=None,
+            player_instance=None,
+            requester=number,
+        )
+        for number in range(PAGE_SIZE)
+    ]
+
+
+async def render_page(tracks: list[Track]) -> str:
+    # The same way the queue and playlist menus render a page
+    page = ""
+    for index, track in enumerate(tracks, start=1):
+        page += f"`{index}.` {await track.get_track_display_name(max_length=50, with_url=True)}\n"
+    return page
+
+
+def test_page_render_benchmark():
+    async def run():
+        tracks = await build_page()
+        start = time.perf_counter()
+        first = await render_page(tracks)
+        first_time = time.perf_counter() - start
+        renders = 1_000
+        start = time.perf_counter()
+        for __ in range(renders):
+            page = await render_page(tracks)
+        cached_time = (time.perf_counter() - start) / renders
+        return first, first_time, page, cached_time
+
+    first, first_time, page, cached_time = asyncio.run(run())
+    # Reported so the figures can be compared between runs, e.g. with pytest -s
+    print(f"{PAGE_SIZE} line page: first render {first_time * 1000:.2f}ms, cached render {cached_time * 1000:.3f}ms")
+    assert page == first
+    assert len(first.splitlines()) == PAGE_SIZE
+    assert cached_time < first_time
+
+
+def test_cached_names_match_a_fresh_render():
+    async def run():
+        tracks = await build_page()
+        await render_page(tracks)
+        return [
+            (
+                await track.get_track_display_name(max_length=50, with_url=True),
+                await track._render_track_display_name(50, True, False, True, True),
+            )
+            for track in tracks
+        ]
+
+    for cached, fresh in asyncio.run(run()):
+        assert cached == fresh
+        assert "[Official Video]" not in cached
+        assert "\N{HORIZONTAL ELLIPSIS}](" in cached
+        assert cached.startswith("**[") and "](https://www.youtube.com/watch?v=" in cached
+
+
+def test_new_metadata_clears_the_cached_names(client):
+    client.search_result = decode_track(
+        encode_track(
+            title="Another Song",
+            author="Another Artist",
+            length=200_000,
+            identifier="other",
+            isStream=False,
+            uri="https://www.youtube.com/watch?v=other",
+            sourceName="youtube",
+        )
+    )
+
+    async def run():
+        track = (await build_page())[0]
+        before = await track.get_track_display_name(max_length=50, with_url=True)
+        await track.search()
+        return before, await track.get_track_display_name(max_length=50, with_url=True)
+
+    before, after = asyncio.run(run())
+    assert "Song 0" in before
+    assert "Another Song" in after
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+import gc
+import tracemalloc
+import types
+
+import pytest
+
+from pylav.players.tracks.core import track_core_count
+from pylav.players.tracks.decoder import decode_track
+from pylav.players.tracks.encoder import encode_track
+from pylav.players.tracks.obj import Track
+
+
+class DecodingClient:
+    """Decodes every track itself, so each queue entry gets its own decoded copy as if it came from a separate
+    request"""
+
+    def __init__(self) -> None:
+        self.bot = types.SimpleNamespace(user=types.SimpleNamespace(id=1))
+
+    async def decode_track(self, track: str, raise_on_failure: bool = False, lazy: bool = False):
+        return decode_track(track)
+
+
+@pytest.fixture(autouse=True)
+def client(monkeypatch) -> DecodingClient:
+    client = DecodingClient()
+    monkeypatch.setattr(Track, "_Track__CLIENT", client)
+    return client
+
+
+def encoded_tracks(count: int) -> list[str]:
+    return [
+        encode_track(
+            title=f"Song {number}",
+            author="Artist",
+            length=200_000,
+            identifier=f"id{number:09d}",
+            isStream=False,
+            uri=f"https://www.youtube.com/watch?v=id{number:09d}",
+            sourceName="youtube",
+        )
+        for number in range(count)
+    ]
+
+
+def queue_memory(entries: int, distinct: int) -> float:
+    """Builds a queue of ``entries`` tracks cycling through ``distinct`` tracks and returns the bytes it retains
+    per entry"""
+    encoded = encoded_tracks(distinct)
+
+    async def build() -> list[Track]:
+        return [
+            await Track.build_track(
+                node=None, data=encoded[number % distinct], query=None, player_instance=None, requester=number
+            )
+            for number in range(entries)
+        ]
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        queue = asyncio.run(build())
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    assert len(queue) == entries
+    # Every entry of the same track shares a single copy of its encoded and decoded forms
+    assert track_core_count() == distinct
+    # Reported so the figures can be compared between runs, e.g. with pytest -s
+    print(f"{entries} entries of {distinct} tracks: {retained / 1024 / 1024:.1f}MiB, {retained / entries:.0f}B/entry")
+    return retained / entries
+
+
+@pytest.mark.parametrize("entries, distinct", [(10_000, 100), (100_000, 10_000)])
+def test_queue_memory(entries, distinct):
+    # Every entry decodes its track again, about 800B an entry which must be dropped for the shared copy
+    assert queue_memory(entries, distinct) < 1024
+
+
+def test_repeated_tracks_cost_less_than_distinct_tracks():
+    assert queue_memory(10_000, 100) < queue_memory(10_000, 10_000) * 2 / 3